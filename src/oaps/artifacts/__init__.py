@@ -8,6 +8,7 @@ The artifact system provides:
 - Filesystem-based storage with configurable base paths
 - YAML frontmatter for text artifacts, sidecar files for binary assets
 - Python API for CRUD operations and index management
+- Reference graph for transitive dependency and supersession queries
 
 Example:
     >>> from pathlib import Path
@@ -48,6 +49,7 @@ Example:
     ...     print(f"Found {len(errors)} validation issues")
 """
 
+from oaps.artifacts._graph import ArtifactGraph
 from oaps.artifacts._index import ArtifactIndex
 from oaps.artifacts._metadata import (
     format_artifact_id,
@@ -57,10 +59,13 @@ from oaps.artifacts._metadata import (
     parse_filename,
     parse_frontmatter,
     parse_sidecar,
+    read_frontmatter_metadata,
     serialize_frontmatter,
     serialize_sidecar,
 )
+from oaps.artifacts._rebuild import IndexRebuildStats
 from oaps.artifacts._registry import ArtifactRegistry
+from oaps.artifacts._sqlite_index import SQLiteArtifactIndex
 from oaps.artifacts._store import ArtifactStore
 from oaps.artifacts._types import (
     BASE_TYPES,
@@ -71,8 +76,10 @@ from oaps.artifacts._types import (
     TypeField,
     ValidationError,
 )
+from oaps.artifacts._validation import write_validation_report
 from oaps.artifacts._validator import (
     VALID_STATUSES,
+    build_type_lookup,
     raise_if_validation_errors,
     validate_artifact,
     validate_artifact_type,
@@ -85,13 +92,17 @@ __all__ = [
     "RESERVED_PREFIXES",
     "VALID_STATUSES",
     "Artifact",
+    "ArtifactGraph",
     "ArtifactIndex",
     "ArtifactMetadata",
     "ArtifactRegistry",
     "ArtifactStore",
+    "IndexRebuildStats",
+    "SQLiteArtifactIndex",
     "TypeDefinition",
     "TypeField",
     "ValidationError",
+    "build_type_lookup",
     "format_artifact_id",
     "generate_filename",
     "generate_slug",
@@ -100,10 +111,12 @@ __all__ = [
     "parse_frontmatter",
     "parse_sidecar",
     "raise_if_validation_errors",
+    "read_frontmatter_metadata",
     "serialize_frontmatter",
     "serialize_sidecar",
     "validate_artifact",
     "validate_artifact_type",
     "validate_metadata",
     "validate_references",
+    "write_validation_report",
 ]
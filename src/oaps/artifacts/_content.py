@@ -0,0 +1,142 @@
+"""Streaming access to artifact file content.
+
+``ArtifactStore.get_artifact_content`` returns a whole ``str`` or ``bytes``,
+which copies a large binary artifact (an image, PDF, or dataset) into memory
+even when it is only served or hashed. The functions here read an artifact
+file without holding all of it at once:
+
+- ``iter_content`` yields chunks of a byte range
+- ``map_content`` exposes the file as a read-only, memory-mapped memoryview
+- ``hash_content`` digests the file incrementally
+
+Byte ranges are half-open, ``[start, end)``, like Python slices, and are
+clipped to the file size.
+
+Example:
+    >>> from oaps.artifacts._content import hash_content, iter_content
+    >>> digest = hash_content(path)
+    >>> header = b"".join(iter_content(path, end=16))
+"""
+
+import hashlib
+import mmap
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Bytes read per chunk when streaming or hashing content
+DEFAULT_CHUNK_SIZE: Final = 64 * 1024
+
+
+def resolve_range(size: int, start: int = 0, end: int | None = None) -> tuple[int, int]:
+    """Clip a byte range to a file size.
+
+    Args:
+        size: File size in bytes.
+        start: First byte of the range.
+        end: Byte after the last byte of the range, or None for the end of
+            the file.
+
+    Returns:
+        Tuple of (start, end) within ``[0, size]``, with start <= end.
+
+    Raises:
+        ValueError: If start is negative or end is before start.
+    """
+    if start < 0:
+        msg = f"start must not be negative, got {start}"
+        raise ValueError(msg)
+    if end is not None and end < start:
+        msg = f"end must not be before start, got {start}-{end}"
+        raise ValueError(msg)
+    stop = size if end is None else min(end, size)
+    return min(start, stop), stop
+
+
+def iter_content(
+    path: Path | str,
+    *,
+    start: int = 0,
+    end: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Read a byte range of a file in chunks.
+
+    The file is opened when iteration starts and closed when it finishes or
+    the iterator is closed.
+
+    Args:
+        path: File to read.
+        start: First byte to read.
+        end: Byte after the last byte to read, or None for the end of file.
+        chunk_size: Maximum bytes per chunk.
+
+    Yields:
+        Chunks of at most ``chunk_size`` bytes.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the range or chunk size is invalid.
+    """
+    if chunk_size <= 0:
+        msg = f"chunk_size must be positive, got {chunk_size}"
+        raise ValueError(msg)
+    with Path(path).open("rb") as f:
+        position, stop = resolve_range(f.seek(0, 2), start, end)
+        _ = f.seek(position)
+        while position < stop:
+            chunk = f.read(min(chunk_size, stop - position))
+            if not chunk:
+                return
+            position += len(chunk)
+            yield chunk
+
+
+@contextmanager
+def map_content(path: Path | str) -> Iterator[memoryview]:
+    """Memory-map a file for zero-copy reads.
+
+    Slicing the view reads only the pages it touches. The view must not be
+    used after the context exits.
+
+    Args:
+        path: File to map.
+
+    Yields:
+        A read-only view of the whole file; empty for an empty file, which
+        cannot be mapped.
+
+    Raises:
+        OSError: If the file cannot be opened or mapped.
+    """
+    with Path(path).open("rb") as f:
+        if f.seek(0, 2) == 0:
+            yield memoryview(b"")
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                view.release()
+
+
+def hash_content(path: Path | str, *, algorithm: str = "sha256") -> str:
+    """Compute a file's digest without reading it into memory at once.
+
+    Args:
+        path: File to hash.
+        algorithm: Any algorithm ``hashlib.new`` accepts.
+
+    Returns:
+        Hex digest of the file content.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the algorithm is not supported.
+    """
+    with Path(path).open("rb") as f:
+        return hashlib.file_digest(f, algorithm).hexdigest()
@@ -0,0 +1,295 @@
+"""Reference and supersession graph over artifact summaries.
+
+``ArtifactGraph`` holds the "references" links between artifacts as a
+rustworkx directed graph, with an edge from each artifact to every artifact
+it references, plus the "supersedes"/"superseded_by" links. Artifact indexes
+build it on first use and update it in place as summaries are put and
+removed, so transitive queries cost one graph traversal instead of a chain
+of index lookups.
+
+A referenced ID that is not in the index gets a node of its own, without a
+summary; these nodes are the dangling references, and turn into regular
+nodes when an artifact with that ID is added.
+
+Example:
+    >>> from oaps.artifacts import ArtifactIndex
+    >>> graph = ArtifactIndex(Path("artifacts.json")).reference_graph()
+    >>> graph.dependents("DC-0001")
+    ['AN-0002', 'RV-0001']
+    >>> graph.supersession_head("DC-0001")
+    'DC-0003'
+"""
+
+from typing import TYPE_CHECKING, Any
+
+import rustworkx as rx
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def _string_list(value: object) -> list[str]:
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, str)]  # pyright: ignore[reportUnknownVariableType]
+
+
+class ArtifactGraph:
+    """Graph of references and supersession between artifacts.
+
+    Attributes:
+        _graph: Reference graph; node payloads are artifact IDs.
+        _nodes: Dict mapping artifact IDs to node indices.
+        _known: IDs of artifacts in the index.
+        _supersedes: Dict mapping artifact IDs to the ID they supersede.
+        _superseded_by: Dict mapping artifact IDs to the ID superseding them.
+        _supersessors: Dict mapping artifact IDs to the IDs whose
+            "supersedes" names them.
+    """
+
+    __slots__ = (
+        "_graph",
+        "_known",
+        "_nodes",
+        "_superseded_by",
+        "_supersedes",
+        "_supersessors",
+    )
+
+    def __init__(self, summaries: Iterable[dict[str, Any]] = ()) -> None:  # pyright: ignore[reportExplicitAny]
+        """Build the graph from artifact summaries.
+
+        Args:
+            summaries: Artifact summary dicts with a string "id". Entries
+                without one are skipped.
+        """
+        self._graph: rx.PyDiGraph[str, None] = rx.PyDiGraph(multigraph=False)
+        self._nodes: dict[str, int] = {}
+        self._known: set[str] = set()
+        self._supersedes: dict[str, str] = {}
+        self._superseded_by: dict[str, str] = {}
+        self._supersessors: dict[str, set[str]] = {}
+        for summary in summaries:
+            if isinstance(summary.get("id"), str):
+                self.put(summary)
+
+    def _node(self, artifact_id: str) -> int:
+        node = self._nodes.get(artifact_id)
+        if node is None:
+            node = self._graph.add_node(artifact_id)
+            self._nodes[artifact_id] = node
+        return node
+
+    def _prune(self, artifact_id: str) -> None:
+        """Drop the node of an unknown ID once nothing references it."""
+        node = self._nodes.get(artifact_id)
+        if (
+            node is not None
+            and artifact_id not in self._known
+            and self._graph.in_degree(node) == 0
+        ):
+            self._graph.remove_node(node)
+            del self._nodes[artifact_id]
+
+    def _unlink(self, artifact_id: str) -> None:
+        """Remove an artifact's outgoing references and supersession links."""
+        node = self._nodes.get(artifact_id)
+        if node is not None:
+            targets = [
+                self._graph[target] for target in self._graph.successor_indices(node)
+            ]
+            for target in targets:
+                self._graph.remove_edge(node, self._nodes[target])
+            for target in targets:
+                if target != artifact_id:
+                    self._prune(target)
+        older = self._supersedes.pop(artifact_id, None)
+        if older is not None:
+            self._supersessors[older].discard(artifact_id)
+            if not self._supersessors[older]:
+                del self._supersessors[older]
+        _ = self._superseded_by.pop(artifact_id, None)
+
+    def put(self, summary: dict[str, Any]) -> None:  # pyright: ignore[reportExplicitAny]
+        """Add or replace an artifact's links.
+
+        Args:
+            summary: Artifact summary dict; "references", "supersedes", and
+                "superseded_by" are read from it.
+
+        Raises:
+            ValueError: If the summary has no string "id".
+        """
+        artifact_id = summary.get("id")
+        if not isinstance(artifact_id, str) or not artifact_id:
+            msg = "Artifact summary must have a string 'id'"
+            raise ValueError(msg)
+
+        self._unlink(artifact_id)
+        self._known.add(artifact_id)
+        node = self._node(artifact_id)
+        for ref in _string_list(summary.get("references")):
+            _ = self._graph.add_edge(node, self._node(ref), None)
+
+        supersedes = summary.get("supersedes")
+        if isinstance(supersedes, str) and supersedes:
+            self._supersedes[artifact_id] = supersedes
+            self._supersessors.setdefault(supersedes, set()).add(artifact_id)
+        superseded_by = summary.get("superseded_by")
+        if isinstance(superseded_by, str) and superseded_by:
+            self._superseded_by[artifact_id] = superseded_by
+
+    def remove(self, artifact_id: str) -> bool:
+        """Remove an artifact's links.
+
+        References to the artifact become dangling.
+
+        Args:
+            artifact_id: ID of the artifact to remove.
+
+        Returns:
+            True if the artifact was in the graph.
+        """
+        if artifact_id not in self._known:
+            return False
+        self._unlink(artifact_id)
+        self._known.discard(artifact_id)
+        self._prune(artifact_id)
+        return True
+
+    @property
+    def count(self) -> int:
+        """Number of artifacts in the graph."""
+        return len(self._known)
+
+    def contains(self, artifact_id: str) -> bool:
+        """Check if an artifact is in the graph.
+
+        Args:
+            artifact_id: Artifact ID to check.
+
+        Returns:
+            True if the artifact is in the index the graph was built from.
+        """
+        return artifact_id in self._known
+
+    def _ids(self, nodes: Iterable[int]) -> list[str]:
+        return sorted(self._graph[node] for node in nodes)
+
+    def dependents(self, artifact_id: str, *, transitive: bool = True) -> list[str]:
+        """Find artifacts that depend on an artifact through references.
+
+        Args:
+            artifact_id: ID of the referenced artifact.
+            transitive: Include artifacts that reference it indirectly.
+
+        Returns:
+            Sorted IDs of the referencing artifacts.
+
+        Example:
+            >>> graph.dependents("FR-0001", transitive=False)
+            ['RV-0001']
+        """
+        node = self._nodes.get(artifact_id)
+        if node is None:
+            return []
+        if transitive:
+            return self._ids(rx.ancestors(self._graph, node) - {node})
+        return self._ids(self._graph.predecessor_indices(node))
+
+    def dependencies(self, artifact_id: str, *, transitive: bool = True) -> list[str]:
+        """Find artifacts an artifact depends on through references.
+
+        Args:
+            artifact_id: ID of the referencing artifact.
+            transitive: Include artifacts it references indirectly.
+
+        Returns:
+            Sorted IDs of the referenced artifacts, including dangling
+            references.
+        """
+        node = self._nodes.get(artifact_id)
+        if node is None or artifact_id not in self._known:
+            return []
+        if transitive:
+            return self._ids(rx.descendants(self._graph, node) - {node})
+        return self._ids(self._graph.successor_indices(node))
+
+    def _newer(self, artifact_id: str) -> str | None:
+        """Get the ID of the artifact directly superseding another."""
+        newer = self._superseded_by.get(artifact_id)
+        if newer is not None:
+            return newer
+        supersessors = self._supersessors.get(artifact_id)
+        return min(supersessors) if supersessors else None
+
+    def supersession_chain(self, artifact_id: str) -> list[str]:
+        """Get the supersession chain an artifact belongs to.
+
+        Args:
+            artifact_id: ID of any artifact in the chain.
+
+        Returns:
+            IDs from the oldest artifact to the current one. An artifact that
+            neither supersedes nor was superseded forms a chain of one. A
+            cyclic chain stops before repeating an ID.
+        """
+        older: list[str] = []
+        seen = {artifact_id}
+        current = artifact_id
+        while (previous := self._supersedes.get(current)) is not None:
+            if previous in seen:
+                break
+            seen.add(previous)
+            older.append(previous)
+            current = previous
+
+        chain = [*reversed(older), artifact_id]
+        current = artifact_id
+        while (newer := self._newer(current)) is not None and newer not in seen:
+            seen.add(newer)
+            chain.append(newer)
+            current = newer
+        return chain
+
+    def supersession_head(self, artifact_id: str) -> str:
+        """Get the current artifact of a supersession chain.
+
+        Args:
+            artifact_id: ID of any artifact in the chain.
+
+        Returns:
+            ID of the newest artifact in the chain, which is the artifact
+            itself if it was never superseded.
+        """
+        return self.supersession_chain(artifact_id)[-1]
+
+    def dangling_references(self) -> dict[str, list[str]]:
+        """Find references to artifacts that are not in the index.
+
+        Returns:
+            Dict mapping each referencing artifact ID to the sorted IDs it
+            references that do not exist, sorted by referencing ID.
+        """
+        dangling: dict[str, list[str]] = {}
+        for target, node in self._nodes.items():
+            if target in self._known:
+                continue
+            for source in self._graph.predecessor_indices(node):
+                dangling.setdefault(self._graph[source], []).append(target)
+        return {source: sorted(dangling[source]) for source in sorted(dangling)}
+
+    def cycles(self) -> list[list[str]]:
+        """Find groups of artifacts that reference each other in a cycle.
+
+        Returns:
+            Each strongly connected group of two or more artifacts, and each
+            artifact that references itself, as sorted IDs. Groups are
+            sorted by their first ID.
+        """
+        groups = [
+            self._ids(component)
+            for component in rx.strongly_connected_components(self._graph)
+            if len(component) > 1 or self._graph.has_edge(component[0], component[0])
+        ]
+        return sorted(groups)
@@ -2,7 +2,15 @@
 
 This module provides the ArtifactIndex class for efficient queries over
 the artifacts.json index file. It supports lookup by ID, filtering by
-various criteria, and reference tracking.
+various criteria, and reference tracking. Transitive reference and
+supersession queries go through ``reference_graph``, which is built on first
+use and then kept in step with ``put`` and ``remove``.
+
+Changes are not written back to artifacts.json one by one. ``put`` and
+``remove`` update the in-memory index and append one line to an index journal
+(``artifacts.journal.jsonl`` next to the snapshot), which is replayed on load.
+Once the journal has as many entries as the last snapshot had artifacts, it
+is compacted into a new snapshot, so a sequence of n changes costs O(n) in total.
 
 Example:
     >>> from pathlib import Path
@@ -14,10 +22,14 @@ Example:
 """
 
 import contextlib
-import json
+import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+import orjson
+
+from oaps.artifacts._graph import ArtifactGraph
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -25,6 +37,144 @@ if TYPE_CHECKING:
 # Type alias for artifact summary dict stored in index
 type ArtifactSummary = dict[str, Any]
 
+# Summary fields that filter and get_by_type results can be sorted by
+type ArtifactSortKey = Literal["id", "created", "title", "status", "author"]
+
+# Journal entries always allowed before compaction; past this, the journal is
+# compacted once it has as many entries as the last snapshot had artifacts
+_COMPACT_MIN_ENTRIES = 256
+
+
+def get_index_journal_path(index_path: Path | str) -> Path:
+    """Get the journal path for an index snapshot.
+
+    Args:
+        index_path: Path to artifacts.json.
+
+    Returns:
+        Path to the journal file next to the snapshot.
+    """
+    path = Path(index_path)
+    return path.with_name(f"{path.stem}.journal.jsonl")
+
+
+def append_index_journal(index_path: Path | str, entry: dict[str, object]) -> None:
+    """Append one change to the journal of an index snapshot.
+
+    Args:
+        index_path: Path to artifacts.json.
+        entry: Journal entry, either ``{"op": "put", "artifact": ...}`` or
+            ``{"op": "remove", "id": ...}``.
+    """
+    with get_index_journal_path(index_path).open("ab") as f:
+        _ = f.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
+
+
+def created_timestamp(artifact: ArtifactSummary) -> float | None:
+    """Get an artifact's creation time as a POSIX timestamp.
+
+    Args:
+        artifact: Artifact summary dict.
+
+    Returns:
+        Timestamp of the "created" field, or None if missing or invalid.
+    """
+    created = artifact.get("created")
+    if not isinstance(created, str) or not created:
+        return None
+    try:
+        return datetime.fromisoformat(created).timestamp()
+    except ValueError:
+        return None
+
+
+def check_page(limit: int | None, offset: int) -> None:
+    """Validate pagination arguments.
+
+    Args:
+        limit: Maximum number of results, or None for no limit.
+        offset: Number of results to skip.
+
+    Raises:
+        ValueError: If limit or offset is negative.
+    """
+    if limit is not None and limit < 0:
+        msg = f"limit must not be negative, got {limit}"
+        raise ValueError(msg)
+    if offset < 0:
+        msg = f"offset must not be negative, got {offset}"
+        raise ValueError(msg)
+
+
+def _sort_value(
+    artifact: ArtifactSummary, sort_by: ArtifactSortKey
+) -> tuple[int, float | str]:
+    """Build a sort key that orders missing values before all others."""
+    if sort_by == "created":
+        timestamp = created_timestamp(artifact)
+        return (0, 0.0) if timestamp is None else (1, timestamp)
+    value = artifact.get(sort_by)
+    return (1, value) if isinstance(value, str) else (0, "")
+
+
+def _sort_and_page(
+    artifacts: list[ArtifactSummary],
+    *,
+    sort_by: ArtifactSortKey | None,
+    descending: bool,
+    limit: int | None,
+    offset: int,
+) -> list[ArtifactSummary]:
+    """Sort summaries and slice out one page.
+
+    Summaries without a value for the sort key sort first and ties keep
+    insertion order; descending reverses both, like SQL ``ORDER BY``.
+    """
+    check_page(limit, offset)
+    if sort_by is not None:
+        ordered = sorted(
+            enumerate(artifacts),
+            key=lambda item: (*_sort_value(item[1], sort_by), item[0]),
+            reverse=descending,
+        )
+        artifacts = [artifact for _, artifact in ordered]
+    elif descending:
+        artifacts = artifacts[::-1]
+    end = None if limit is None else offset + limit
+    return artifacts[offset:end]
+
+
+def write_index_snapshot(
+    index_path: Path | str,
+    artifacts: Sequence[ArtifactSummary],
+    *,
+    updated: datetime | None = None,
+) -> None:
+    """Atomically write an index snapshot and discard its journal.
+
+    Args:
+        index_path: Path to artifacts.json.
+        artifacts: Artifact summaries to write.
+        updated: Timestamp to record (defaults to now).
+    """
+    path = Path(index_path)
+    data = {
+        "updated": (updated or datetime.now(UTC)).isoformat(),
+        "artifacts": list(artifacts),
+    }
+    content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as f:
+        _ = f.write(content)
+    try:
+        _ = Path(f.name).replace(path)
+    except OSError:
+        Path(f.name).unlink(missing_ok=True)
+        raise
+    # The snapshot already contains every journaled change
+    get_index_journal_path(path).unlink(missing_ok=True)
+
 
 class ArtifactIndex:
     """Index for O(1) artifact lookup.
@@ -36,12 +186,26 @@ class ArtifactIndex:
     Attributes:
         _index_path: Path to the artifacts.json file.
         _by_id: Dict mapping artifact IDs to summary dicts.
-        _by_type: Dict mapping type prefixes to lists of summaries.
+        _by_type: Dict mapping type prefixes to summaries keyed by ID.
         _references: Dict mapping artifact IDs to lists of referencing IDs.
+        _graph: Reference graph, once built by ``reference_graph``.
         _updated: Timestamp when index was last loaded.
+        _journal_entries: Number of journal entries not yet compacted.
+        _persistent: Whether changes are written to the journal.
+        _snapshot_size: Number of artifacts in the last snapshot.
     """
 
-    __slots__ = ("_by_id", "_by_type", "_index_path", "_references", "_updated")
+    __slots__ = (
+        "_by_id",
+        "_by_type",
+        "_graph",
+        "_index_path",
+        "_journal_entries",
+        "_persistent",
+        "_references",
+        "_snapshot_size",
+        "_updated",
+    )
 
     def __init__(self, index_path: Path | str) -> None:
         """Load index from file.
@@ -55,11 +219,16 @@ class ArtifactIndex:
         """
         self._index_path = Path(index_path)
         self._by_id: dict[str, ArtifactSummary] = {}
-        self._by_type: dict[str, list[ArtifactSummary]] = {}
+        self._by_type: dict[str, dict[str, ArtifactSummary]] = {}
         self._references: dict[str, list[str]] = {}
+        self._graph: ArtifactGraph | None = None
         self._updated = datetime.now(UTC)
+        self._journal_entries = 0
+        self._persistent = True
 
         self._load()
+        self._snapshot_size = len(self._by_id)
+        self._replay_journal()
 
     def _load(self) -> None:
         """Load index data from file."""
@@ -67,9 +236,8 @@ class ArtifactIndex:
             return
 
         try:
-            content = self._index_path.read_text(encoding="utf-8")
-            data = json.loads(content)
-        except (OSError, json.JSONDecodeError):
+            data = orjson.loads(self._index_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
             return
 
         if not isinstance(data, dict):
@@ -88,6 +256,42 @@ class ArtifactIndex:
         for artifact in artifacts:
             self._index_artifact(artifact)
 
+    def _replay_journal(self) -> None:
+        """Apply journaled changes made since the snapshot was written.
+
+        Lines that cannot be parsed (e.g. a partial line left by a crash
+        mid-append) are skipped.
+        """
+        try:
+            lines = get_index_journal_path(self._index_path).read_bytes().splitlines()
+        except OSError:
+            return
+
+        for line in lines:
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            if not isinstance(entry, dict):
+                continue
+            match entry.get("op"):
+                case "put":
+                    artifact = entry.get("artifact")
+                    if not isinstance(artifact, dict):
+                        continue
+                    artifact_id = artifact.get("id")
+                    if isinstance(artifact_id, str):
+                        self._replace_artifact(
+                            artifact_id, cast("ArtifactSummary", artifact)
+                        )
+                case "remove":
+                    artifact_id = entry.get("id")
+                    if isinstance(artifact_id, str):
+                        _ = self._unindex_artifact(artifact_id)
+                case _:
+                    continue
+            self._journal_entries += 1
+
     def _index_artifact(self, artifact: object) -> None:
         """Index a single artifact entry.
 
@@ -110,8 +314,8 @@ class ArtifactIndex:
         prefix = artifact_id.split("-")[0] if "-" in artifact_id else ""
         if prefix:
             if prefix not in self._by_type:
-                self._by_type[prefix] = []
-            self._by_type[prefix].append(artifact)
+                self._by_type[prefix] = {}
+            self._by_type[prefix][artifact_id] = artifact
 
         # Index references
         refs = artifact.get("references", [])
@@ -122,6 +326,109 @@ class ArtifactIndex:
                         self._references[ref] = []
                     self._references[ref].append(artifact_id)
 
+    def _unlink_references(self, artifact_id: str, artifact: ArtifactSummary) -> None:
+        """Remove an artifact's outgoing references from _references."""
+        refs = artifact.get("references", [])
+        if not isinstance(refs, list):
+            return
+        for ref in refs:
+            referencing = self._references.get(ref) if isinstance(ref, str) else None
+            if referencing and artifact_id in referencing:
+                referencing.remove(artifact_id)
+
+    def _unindex_artifact(self, artifact_id: str) -> bool:
+        """Remove a single artifact from _by_id, _by_type, and _references.
+
+        Args:
+            artifact_id: ID of the artifact to remove.
+
+        Returns:
+            True if the artifact was indexed.
+        """
+        artifact = self._by_id.pop(artifact_id, None)
+        if artifact is None:
+            return False
+
+        prefix = artifact_id.split("-", maxsplit=1)[0] if "-" in artifact_id else ""
+        by_prefix = self._by_type.get(prefix)
+        if by_prefix is not None:
+            _ = by_prefix.pop(artifact_id, None)
+        self._unlink_references(artifact_id, artifact)
+        if self._graph is not None:
+            _ = self._graph.remove(artifact_id)
+        return True
+
+    def _replace_artifact(self, artifact_id: str, artifact: ArtifactSummary) -> None:
+        """Index an artifact, replacing any existing summary with the same ID.
+
+        An existing artifact keeps its position in insertion order.
+        """
+        previous = self._by_id.get(artifact_id)
+        if previous is not None:
+            self._unlink_references(artifact_id, previous)
+        self._index_artifact(artifact)
+        if self._graph is not None:
+            self._graph.put(artifact)
+
+    def put(self, artifact: ArtifactSummary) -> None:
+        """Add or replace an artifact summary.
+
+        Updates the in-memory index in place and appends the change to the
+        journal.
+
+        Args:
+            artifact: Artifact summary dict with a string "id".
+
+        Raises:
+            ValueError: If the summary has no string "id".
+        """
+        artifact_id = artifact.get("id")
+        if not isinstance(artifact_id, str) or not artifact_id:
+            msg = "Artifact summary must have a string 'id'"
+            raise ValueError(msg)
+
+        self._replace_artifact(artifact_id, artifact)
+        self._record({"op": "put", "artifact": artifact})
+
+    def remove(self, artifact_id: str) -> bool:
+        """Remove an artifact summary.
+
+        Args:
+            artifact_id: ID of the artifact to remove.
+
+        Returns:
+            True if the artifact was in the index.
+        """
+        if not self._unindex_artifact(artifact_id):
+            return False
+        self._record({"op": "remove", "id": artifact_id})
+        return True
+
+    def _record(self, entry: dict[str, object]) -> None:
+        """Append a change to the journal, compacting it when it grows long."""
+        self._updated = datetime.now(UTC)
+        if not self._persistent:
+            return
+
+        append_index_journal(self._index_path, entry)
+        self._journal_entries += 1
+
+        if self._journal_entries >= max(_COMPACT_MIN_ENTRIES, self._snapshot_size):
+            self.compact()
+
+    def compact(self) -> None:
+        """Write the current index as a new snapshot and clear the journal."""
+        write_index_snapshot(
+            self._index_path, list(self._by_id.values()), updated=self._updated
+        )
+        self._journal_entries = 0
+        self._snapshot_size = len(self._by_id)
+
+    @property
+    def journal_entries(self) -> int:
+        """Number of changes in the journal since the last snapshot."""
+        return self._journal_entries
+
     @property
     def updated(self) -> datetime:
         """When index was last updated."""
@@ -158,6 +465,10 @@ class ArtifactIndex:
         tag_filter: str | None = None,
         created_after: datetime | None = None,
         created_before: datetime | None = None,
+        sort_by: ArtifactSortKey | None = None,
+        descending: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[ArtifactSummary]:
         """Filter artifacts by criteria.
 
@@ -171,10 +482,17 @@ class ArtifactIndex:
             tag_filter: Filter by tag (artifact must have tag).
             created_after: Include only artifacts created after this datetime.
             created_before: Include only artifacts created before this datetime.
+            sort_by: Summary field to sort by; insertion order if None.
+            descending: Reverse the sort order.
+            limit: Maximum number of summaries to return.
+            offset: Number of matching summaries to skip.
 
         Returns:
             List of matching artifact summaries.
 
+        Raises:
+            ValueError: If limit or offset is negative.
+
         Example:
             >>> index = ArtifactIndex(Path("artifacts.json"))
             >>> reviews = index.filter(type_filter="RV", status_filter="complete")
@@ -221,22 +539,49 @@ class ArtifactIndex:
 
             results.append(artifact)
 
-        return results
+        return _sort_and_page(
+            results,
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit,
+            offset=offset,
+        )
 
-    def get_by_type(self, type_prefix: str) -> list[ArtifactSummary]:
+    def get_by_type(
+        self,
+        type_prefix: str,
+        *,
+        sort_by: ArtifactSortKey | None = None,
+        descending: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[ArtifactSummary]:
         """Get all artifacts of a type.
 
         Args:
             type_prefix: Two-letter prefix (e.g., "RV").
+            sort_by: Summary field to sort by; insertion order if None.
+            descending: Reverse the sort order.
+            limit: Maximum number of summaries to return.
+            offset: Number of summaries to skip.
 
         Returns:
             List of artifact summaries for that type.
 
+        Raises:
+            ValueError: If limit or offset is negative.
+
         Example:
             >>> index = ArtifactIndex(Path("artifacts.json"))
             >>> reviews = index.get_by_type("RV")
         """
-        return list(self._by_type.get(type_prefix, []))
+        return _sort_and_page(
+            list(self._by_type.get(type_prefix, {}).values()),
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit,
+            offset=offset,
+        )
 
     def get_next_number(self, type_prefix: str) -> int:
         """Get next available number for a type.
@@ -255,13 +600,12 @@ class ArtifactIndex:
             >>> index.get_next_number("RV")  # If RV-0003 is highest
             4
         """
-        artifacts = self._by_type.get(type_prefix, [])
+        artifacts = self._by_type.get(type_prefix)
         if not artifacts:
             return 1
 
         max_number = 0
-        for artifact in artifacts:
-            artifact_id = artifact.get("id", "")
+        for artifact_id in artifacts:
             if "-" in artifact_id:
                 try:
                     number = int(artifact_id.split("-")[1])
@@ -287,6 +631,24 @@ class ArtifactIndex:
         """
         return list(self._references.get(target_id, []))
 
+    def reference_graph(self) -> ArtifactGraph:
+        """Get the reference and supersession graph of the indexed artifacts.
+
+        The graph is built on the first call and updated in place by later
+        ``put`` and ``remove`` calls.
+
+        Returns:
+            Graph of the artifacts currently in the index.
+
+        Example:
+            >>> index = ArtifactIndex(Path("artifacts.json"))
+            >>> index.reference_graph().dependents("FR-0001")
+            ['AN-0002', 'RV-0001', 'RV-0003']
+        """
+        if self._graph is None:
+            self._graph = ArtifactGraph(self._by_id.values())
+        return self._graph
+
     def all_ids(self) -> list[str]:
         """Get all artifact IDs in the index.
 
@@ -327,7 +689,8 @@ class ArtifactIndex:
         """Create an index from a list of artifact summaries.
 
         This is useful for building an index in memory without reading
-        from a file.
+        from a file. Changes made with ``put`` and ``remove`` are not
+        journaled.
 
         Args:
             artifacts: List of artifact summary dicts.
@@ -346,7 +709,11 @@ class ArtifactIndex:
         instance._by_id = {}  # noqa: SLF001
         instance._by_type = {}  # noqa: SLF001
         instance._references = {}  # noqa: SLF001
+        instance._graph = None  # noqa: SLF001
         instance._updated = datetime.now(UTC)  # noqa: SLF001
+        instance._journal_entries = 0  # noqa: SLF001
+        instance._persistent = False  # noqa: SLF001
+        instance._snapshot_size = 0  # noqa: SLF001
 
         # Populate from artifacts using the helper method
         for artifact in artifacts:
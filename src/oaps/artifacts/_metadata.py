@@ -13,6 +13,7 @@ from typing import Any
 import yaml
 
 from oaps.artifacts._types import ArtifactMetadata
+from oaps.utils._frontmatter import load_yaml, read_frontmatter, split_frontmatter
 
 # =============================================================================
 # Constants
@@ -344,17 +345,14 @@ def parse_frontmatter(content: str) -> tuple[ArtifactMetadata, str]:
         msg = "Frontmatter must start with '---'"
         raise ValueError(msg)
 
-    # Find the closing ---
-    end_marker = content.find("---", 3)
-    if end_marker == -1:
+    parts = split_frontmatter(content)
+    if parts is None:
         msg = "Frontmatter closing '---' not found"
         raise ValueError(msg)
 
-    frontmatter_str = content[3:end_marker].strip()
-    body = content[end_marker + 3 :].lstrip("\n")
-
+    frontmatter_str, body = parts
     try:
-        yaml_data = yaml.safe_load(frontmatter_str)
+        yaml_data = load_yaml(frontmatter_str)
     except yaml.YAMLError as e:
         msg = f"Invalid YAML in frontmatter: {e}"
         raise ValueError(msg) from e
@@ -367,6 +365,40 @@ def parse_frontmatter(content: str) -> tuple[ArtifactMetadata, str]:
     return metadata, body
 
 
+def read_frontmatter_metadata(path: Path | str) -> ArtifactMetadata:
+    """Read metadata from a markdown artifact without reading its body.
+
+    Parsed headers are cached by file path, size, and modification time, so
+    repeated reads of an unchanged artifact do not parse its YAML again.
+
+    Args:
+        path: Path to the markdown artifact.
+
+    Returns:
+        Parsed metadata.
+
+    Raises:
+        ValueError: If frontmatter is missing or invalid.
+        TypeError: If frontmatter is not a YAML dictionary.
+        OSError: If the file cannot be read.
+    """
+    try:
+        found, yaml_data = read_frontmatter(path)
+    except yaml.YAMLError as e:
+        msg = f"Invalid YAML in frontmatter: {e}"
+        raise ValueError(msg) from e
+
+    if not found:
+        msg = f"Frontmatter not found in {path}"
+        raise ValueError(msg)
+
+    if not isinstance(yaml_data, dict):
+        msg = "Frontmatter must be a YAML dictionary"
+        raise TypeError(msg)
+
+    return _parse_yaml_to_metadata(yaml_data)
+
+
 def parse_sidecar(path: Path | str) -> ArtifactMetadata:
     """Parse sidecar metadata file.
 
@@ -388,7 +420,7 @@ def parse_sidecar(path: Path | str) -> ArtifactMetadata:
     content = path.read_text(encoding="utf-8")
 
     try:
-        yaml_data = yaml.safe_load(content)
+        yaml_data = load_yaml(content)
     except yaml.YAMLError as e:
         msg = f"Invalid YAML in sidecar file: {e}"
         raise ValueError(msg) from e
@@ -0,0 +1,427 @@
+"""Incremental artifact index rebuilds.
+
+``ArtifactStore.rebuild_index`` keeps a manifest in the cache directory next
+to artifacts.json (``.cache/artifacts.manifest.json``) with the size and
+modification time of each artifact's metadata source (the markdown file
+itself, or the sidecar of a binary artifact), the SHA-256 of its metadata (the
+frontmatter block, or the whole sidecar), and the summary parsed from it. A
+rebuild stats every file, re-hashes only files whose size or mtime changed,
+and re-parses only those whose hash changed too, so body-only edits are never
+re-parsed; removed files simply drop out. When many files need parsing, as in
+a cold rebuild, parsing is spread over a process pool.
+
+The manifest is a local cache: deleting it only makes the next rebuild cold.
+It is kept out of artifacts.json, and out of the tracked tree, so that
+commits do not change with file modification times.
+"""
+
+import contextlib
+import hashlib
+import os
+import stat
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Final, TypedDict, cast
+
+import orjson
+
+from oaps.artifacts._index import ArtifactSummary, get_index_journal_path
+from oaps.artifacts._metadata import parse_sidecar, read_frontmatter_metadata
+from oaps.artifacts._types import Artifact
+from oaps.utils._frontmatter import read_frontmatter_block
+from oaps.utils._paths import ensure_parent_dir, get_cache_dir
+
+_MANIFEST_VERSION: Final = 2
+
+# Files to parse before a process pool pays for its startup cost
+_PARALLEL_MIN_FILES: Final = 128
+
+# Files modified this close to a scan may change again within the same mtime
+# tick, so their stat fingerprint is not trusted on the next rebuild
+_RACY_WINDOW_NS: Final = 2_000_000_000
+
+
+class _FileRecord(TypedDict):
+    """Manifest entry for one artifact file."""
+
+    source: str
+    size: int
+    mtime_ns: int
+    racy: bool
+    sha256: str
+    summary: ArtifactSummary | None
+
+
+@dataclass(frozen=True, slots=True)
+class IndexRebuildStats:
+    """Outcome of an index rebuild.
+
+    Attributes:
+        files: Artifact files found, sidecars not counted.
+        indexed: Files that are valid artifacts and are in the index.
+        parsed: Files whose metadata was parsed.
+        unchanged: Files reused from the manifest without parsing.
+        removed: Files in the manifest that no longer exist.
+        written: Whether artifacts.json was rewritten.
+    """
+
+    files: int
+    indexed: int
+    parsed: int
+    unchanged: int
+    removed: int
+    written: bool
+
+
+def get_index_manifest_path(index_path: Path | str) -> Path:
+    """Get the rebuild manifest path for an index snapshot.
+
+    Args:
+        index_path: Path to artifacts.json.
+
+    Returns:
+        Path to the manifest file in the cache directory next to the snapshot.
+    """
+    path = Path(index_path)
+    return get_cache_dir(path.parent) / f"{path.stem}.manifest.json"
+
+
+def load_artifact_file(file_path: Path) -> Artifact | None:
+    """Load an artifact from its file and metadata.
+
+    Args:
+        file_path: Path to the artifact file.
+
+    Returns:
+        Artifact, or None if the file is neither markdown nor has a sidecar.
+
+    Raises:
+        ValueError: If the metadata is invalid.
+        OSError: If a file cannot be read.
+    """
+    # Check for sidecar metadata (binary artifact)
+    sidecar_path = file_path.with_suffix(file_path.suffix + ".metadata.yaml")
+
+    if sidecar_path.exists():
+        metadata = parse_sidecar(sidecar_path)
+        metadata_file_path: Path | None = sidecar_path
+    elif file_path.suffix == ".md":
+        # Text artifact (markdown with frontmatter)
+        metadata = read_frontmatter_metadata(file_path)
+        metadata_file_path = None
+    else:
+        return None
+
+    return Artifact(
+        id=metadata.id,
+        type=metadata.type,
+        title=metadata.title,
+        status=metadata.status,
+        created=metadata.created,
+        author=metadata.author,
+        file_path=file_path,
+        subtype=metadata.subtype,
+        updated=metadata.updated,
+        reviewers=metadata.reviewers,
+        references=metadata.references,
+        supersedes=metadata.supersedes,
+        superseded_by=metadata.superseded_by,
+        tags=metadata.tags,
+        summary=metadata.summary,
+        metadata_file_path=metadata_file_path,
+        type_fields=metadata.type_fields,
+    )
+
+
+def artifact_to_summary(artifact: Artifact, base_path: Path) -> ArtifactSummary:
+    """Convert an Artifact to an index summary dict.
+
+    Args:
+        artifact: Artifact to convert.
+        base_path: Store base directory that paths are made relative to.
+
+    Returns:
+        Summary dict as stored in artifacts.json.
+    """
+    summary: ArtifactSummary = {
+        "id": artifact.id,
+        "type": artifact.type,
+        "title": artifact.title,
+        "status": artifact.status,
+        "created": artifact.created.isoformat(),
+        "author": artifact.author,
+        "file_path": str(artifact.file_path.relative_to(base_path)),
+    }
+
+    if artifact.subtype:
+        summary["subtype"] = artifact.subtype
+    if artifact.updated:
+        summary["updated"] = artifact.updated.isoformat()
+    if artifact.reviewers:
+        summary["reviewers"] = list(artifact.reviewers)
+    if artifact.references:
+        summary["references"] = list(artifact.references)
+    if artifact.supersedes:
+        summary["supersedes"] = artifact.supersedes
+    if artifact.superseded_by:
+        summary["superseded_by"] = artifact.superseded_by
+    if artifact.tags:
+        summary["tags"] = list(artifact.tags)
+    if artifact.summary:
+        summary["summary"] = artifact.summary
+    if artifact.metadata_file_path:
+        summary["metadata_file_path"] = str(
+            artifact.metadata_file_path.relative_to(base_path)
+        )
+    if artifact.type_fields:
+        summary.update(artifact.type_fields)
+
+    return summary
+
+
+def _metadata_source(name: str, entries: dict[str, os.stat_result]) -> str | None:
+    """Get the name of the file an artifact's metadata is read from, if any."""
+    sidecar_name = name + ".metadata.yaml"
+    if sidecar_name in entries:
+        return sidecar_name
+    if name.endswith(".md"):
+        return name
+    return None
+
+
+def _hash_source(path: Path) -> str:
+    """Hash the part of a metadata source that summaries are built from.
+
+    Sidecars are hashed whole. For markdown only the frontmatter block is
+    hashed, so edits to a (possibly large) body never cause a re-parse.
+    """
+    if path.name.endswith(".metadata.yaml"):
+        with path.open("rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+    try:
+        block = read_frontmatter_block(path)
+    except UnicodeDecodeError:
+        block = None
+    header = b"\0" if block is None else block[0].encode()
+    return hashlib.sha256(header).hexdigest()
+
+
+def _scan_file(
+    file_path: Path, source_path: Path, base_path: Path, known_hash: str | None
+) -> tuple[str, ArtifactSummary | None, bool]:
+    """Hash an artifact's metadata source and parse it if the hash changed.
+
+    Runs in pool workers, so it only takes and returns picklable values.
+
+    Returns:
+        Tuple of the source hash, the parsed summary (None if the file is not
+        a valid artifact or was not parsed), and whether it was parsed.
+    """
+    try:
+        digest = _hash_source(source_path)
+    except OSError:
+        return "", None, True
+    if digest == known_hash:
+        return digest, None, False
+    try:
+        artifact = load_artifact_file(file_path)
+    except (ValueError, TypeError, OSError):
+        # Skip invalid files
+        return digest, None, True
+    summary = artifact_to_summary(artifact, base_path) if artifact else None
+    return digest, summary, True
+
+
+def _load_manifest(manifest_path: Path) -> dict[str, _FileRecord]:
+    """Load manifest records, treating a missing or stale manifest as empty."""
+    try:
+        data = orjson.loads(manifest_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _MANIFEST_VERSION:
+        return {}
+    files = data.get("files")
+    return cast("dict[str, _FileRecord]", files) if isinstance(files, dict) else {}
+
+
+def _write_json_atomic(path: Path, data: object) -> None:
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as f:
+        _ = f.write(orjson.dumps(data))
+    try:
+        _ = Path(f.name).replace(path)
+    except OSError:
+        Path(f.name).unlink(missing_ok=True)
+        raise
+
+
+def _list_artifact_files(artifacts_path: Path) -> dict[str, os.stat_result]:
+    """Stat every regular, non-hidden file in the artifacts directory."""
+    entries: dict[str, os.stat_result] = {}
+    with (
+        contextlib.suppress(FileNotFoundError, NotADirectoryError),
+        os.scandir(artifacts_path) as it,
+    ):
+        for entry in it:
+            if entry.name.startswith("."):
+                continue
+            with contextlib.suppress(OSError):
+                entry_stat = entry.stat()
+                if stat.S_ISREG(entry_stat.st_mode):
+                    entries[entry.name] = entry_stat
+    return entries
+
+
+def index_matches(index_path: Path, artifacts: list[ArtifactSummary]) -> bool:
+    """Check whether artifacts.json already holds exactly these summaries.
+
+    Args:
+        index_path: Path to artifacts.json.
+        artifacts: Summaries a rebuild would write.
+
+    Returns:
+        True if the snapshot lists the same summaries and has no journal.
+    """
+    if get_index_journal_path(index_path).exists():
+        return False
+    try:
+        data = orjson.loads(index_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return False
+    return isinstance(data, dict) and data.get("artifacts") == artifacts
+
+
+type _Pending = tuple[Path, Path, os.stat_result, str | None]
+
+
+def _find_changed(
+    artifacts_path: Path,
+    entries: dict[str, os.stat_result],
+    previous: dict[str, _FileRecord],
+) -> tuple[dict[str, _FileRecord], list[_Pending]]:
+    """Split artifact files into unchanged records and files to rescan.
+
+    Returns:
+        Tuple of manifest records reused as is, and files whose stat changed
+        (file, metadata source, source stat, previous source hash).
+    """
+    records: dict[str, _FileRecord] = {}
+    pending: list[_Pending] = []
+    for name in sorted(entries):
+        if name.endswith(".metadata.yaml"):
+            continue
+        source_name = _metadata_source(name, entries)
+        if source_name is None:
+            continue
+        source_stat = entries[source_name]
+        record = previous.get(name)
+        if record is None or record["source"] != source_name:
+            known_hash = None
+        elif (
+            not record["racy"]
+            and record["size"] == source_stat.st_size
+            and record["mtime_ns"] == source_stat.st_mtime_ns
+        ):
+            records[name] = record
+            continue
+        else:
+            known_hash = record["sha256"]
+        pending.append(
+            (
+                artifacts_path / name,
+                artifacts_path / source_name,
+                source_stat,
+                known_hash,
+            )
+        )
+    return records, pending
+
+
+def _scan_pending(
+    pending: list[_Pending], base_path: Path, workers: int | None
+) -> list[tuple[str, ArtifactSummary | None, bool]]:
+    """Run _scan_file over pending files, in a process pool if worthwhile."""
+    max_workers = workers or os.process_cpu_count() or 1
+    args = (
+        [p[0] for p in pending],
+        [p[1] for p in pending],
+        repeat(base_path),
+        [p[3] for p in pending],
+    )
+    if max_workers > 1 and len(pending) >= _PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            chunksize = max(1, len(pending) // (max_workers * 4))
+            return list(pool.map(_scan_file, *args, chunksize=chunksize))
+    return [
+        _scan_file(file_path, source_path, base_path, known_hash)
+        for file_path, source_path, _, known_hash in pending
+    ]
+
+
+def scan_artifacts(
+    artifacts_path: Path,
+    base_path: Path,
+    manifest_path: Path,
+    *,
+    workers: int | None = None,
+) -> tuple[list[ArtifactSummary], IndexRebuildStats]:
+    """Collect artifact summaries, parsing only files that changed.
+
+    Args:
+        artifacts_path: Directory holding artifact files.
+        base_path: Store base directory that summary paths are relative to.
+        manifest_path: Manifest file to read and update.
+        workers: Processes to parse with. None picks the number of available
+            CPUs once enough files need parsing; 1 always parses in-process.
+
+    Returns:
+        Tuple of the summaries in file name order and rebuild statistics with
+        ``written`` set to False.
+    """
+    scan_start_ns = time.time_ns()
+    previous = _load_manifest(manifest_path)
+    entries = _list_artifact_files(artifacts_path)
+    records, pending = _find_changed(artifacts_path, entries, previous)
+    results = _scan_pending(pending, base_path, workers)
+
+    parsed = 0
+    for (file_path, source_path, source_stat, _), (digest, summary, was_parsed) in zip(
+        pending, results, strict=True
+    ):
+        parsed += was_parsed
+        records[file_path.name] = {
+            "source": source_path.name,
+            "size": source_stat.st_size,
+            "mtime_ns": source_stat.st_mtime_ns,
+            "racy": source_stat.st_mtime_ns >= scan_start_ns - _RACY_WINDOW_NS,
+            "sha256": digest,
+            "summary": summary if was_parsed else previous[file_path.name]["summary"],
+        }
+
+    if records != previous and base_path.is_dir():
+        with contextlib.suppress(OSError):
+            _ = ensure_parent_dir(manifest_path)
+            _write_json_atomic(
+                manifest_path,
+                {"version": _MANIFEST_VERSION, "files": dict(sorted(records.items()))},
+            )
+
+    summaries = [
+        record["summary"]
+        for _, record in sorted(records.items())
+        if record["summary"] is not None
+    ]
+    stats = IndexRebuildStats(
+        files=len(records),
+        indexed=len(summaries),
+        parsed=parsed,
+        unchanged=len(records) - parsed,
+        removed=len(previous.keys() - records.keys()),
+        written=False,
+    )
+    return summaries, stats
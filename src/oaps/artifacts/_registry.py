@@ -15,6 +15,7 @@ Example:
     'review'
 """
 
+import hashlib
 import re
 import threading
 from typing import ClassVar
@@ -221,6 +222,18 @@ class ArtifactRegistry:
         """
         return sorted(self._types.values(), key=lambda t: t.prefix)
 
+    def fingerprint(self) -> str:
+        """Get a digest of all registered type definitions.
+
+        The digest changes whenever a type is registered, so results that
+        depend on the registry, such as cached validation results, can be
+        keyed on it.
+
+        Returns:
+            Hex SHA-256 digest of the type definitions.
+        """
+        return hashlib.sha256(repr(self.list_types()).encode()).hexdigest()
+
     def get_base_types(self) -> list[TypeDefinition]:
         """Get base types defined by the artifact system.
 
@@ -0,0 +1,97 @@
+"""Full-text search documents for artifacts.
+
+Text artifacts are indexed from their markdown file: frontmatter for the
+title, tags, status, and type, and the summary and markdown body for the
+text. Binary artifacts are indexed from their sidecar metadata file, with
+only the summary as the text.
+"""
+
+from typing import TYPE_CHECKING, Final
+
+import yaml
+
+from oaps.artifacts._metadata import parse_sidecar, read_frontmatter_metadata
+from oaps.search import SearchDocument
+from oaps.utils._frontmatter import read_body, read_frontmatter_block
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from oaps.artifacts._types import Artifact, ArtifactMetadata
+
+ARTIFACT_SEARCH_KIND: Final = "artifact"
+
+_SIDECAR_SUFFIX: Final = ".metadata.yaml"
+
+
+def artifact_search_source(artifact: Artifact) -> Path:
+    """Get the file an artifact's search document is extracted from.
+
+    Args:
+        artifact: The artifact.
+
+    Returns:
+        The sidecar metadata file of a binary artifact, otherwise the
+        artifact file.
+    """
+    return artifact.metadata_file_path or artifact.file_path
+
+
+def iter_artifact_search_sources(artifacts_path: Path) -> list[Path]:
+    """List the files artifact search documents are extracted from.
+
+    Args:
+        artifacts_path: The store's artifacts/ directory.
+
+    Returns:
+        Markdown artifacts and sidecar metadata files, sorted by name.
+    """
+    if not artifacts_path.is_dir():
+        return []
+    return sorted(
+        path
+        for path in artifacts_path.iterdir()
+        if not path.name.startswith(".")
+        and (path.suffix == ".md" or path.name.endswith(_SIDECAR_SUFFIX))
+    )
+
+
+def artifact_search_documents(path: Path, *, scope: str = "") -> list[SearchDocument]:
+    """Extract the search document of an artifact.
+
+    Args:
+        path: Markdown artifact or sidecar metadata file.
+        scope: Scope recorded for the document, e.g. the owning spec ID.
+
+    Returns:
+        A single document, or none if the file has no valid metadata.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    body = ""
+    try:
+        if path.name.endswith(_SIDECAR_SUFFIX):
+            metadata = parse_sidecar(path)
+        else:
+            metadata = read_frontmatter_metadata(path)
+            block = read_frontmatter_block(path)
+            if block is not None:
+                body = read_body(path, block[1])
+    except (ValueError, TypeError, yaml.YAMLError):
+        return []
+    return [_to_document(metadata, body, scope)]
+
+
+def _to_document(metadata: ArtifactMetadata, body: str, scope: str) -> SearchDocument:
+    text = "\n\n".join(part for part in (metadata.summary, body) if part)
+    return SearchDocument(
+        kind=ARTIFACT_SEARCH_KIND,
+        doc_id=str(metadata.id),
+        title=str(metadata.title),
+        body=text,
+        tags=tuple(str(tag) for tag in metadata.tags),
+        scope=scope,
+        status=str(metadata.status),
+        doc_type=str(metadata.type),
+    )
@@ -0,0 +1,689 @@
+"""SQLite-backed artifact index.
+
+This module provides SQLiteArtifactIndex, an alternative to ArtifactIndex
+with the same API. Summaries are kept in a SQLite database with indexes on
+type prefix, type, status, author, and creation time, plus join tables for
+tags and references, so ``filter``, ``get_by_type``, ``get_next_number``, and
+``get_references_to`` are indexed queries instead of scans over every
+summary.
+
+artifacts.json and its journal stay the source of truth: every change is
+journaled exactly like ArtifactIndex does, and the database
+(``.cache/artifacts.db`` next to the snapshot by default, so it is never
+committed) is a derived cache. It
+records the size and modification time of the snapshot and journal it
+reflects, and is rebuilt from them when they were changed by something else,
+e.g. ``git checkout`` or a plain ArtifactIndex. Deleting it is always safe.
+
+Example:
+    >>> from pathlib import Path
+    >>> from oaps.artifacts import SQLiteArtifactIndex
+    >>> index = SQLiteArtifactIndex(Path("artifacts.json"))
+    >>> index.filter(status_filter="draft", sort_by="created", limit=20)
+"""
+
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, cast
+
+import orjson
+
+from oaps.artifacts._graph import ArtifactGraph
+from oaps.artifacts._index import (
+    _COMPACT_MIN_ENTRIES,  # pyright: ignore[reportPrivateUsage]
+    ArtifactIndex,
+    ArtifactSortKey,
+    ArtifactSummary,
+    append_index_journal,
+    check_page,
+    created_timestamp,
+    get_index_journal_path,
+    write_index_snapshot,
+)
+from oaps.utils._paths import get_cache_dir
+from oaps.utils.database import ensure_cache_schema, open_cache
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterable, Iterator
+
+_SCHEMA_VERSION: Final = 1
+
+_SCHEMA_STATEMENTS: Final = (
+    """
+CREATE TABLE IF NOT EXISTS artifacts (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    prefix TEXT NOT NULL,
+    number INTEGER,
+    type TEXT,
+    status TEXT,
+    author TEXT,
+    title TEXT,
+    created_ts REAL,
+    summary BLOB NOT NULL
+)
+""",
+    (
+        "CREATE INDEX IF NOT EXISTS idx_artifacts_prefix_number "
+        "ON artifacts (prefix, number)"
+    ),
+    (
+        "CREATE INDEX IF NOT EXISTS idx_artifacts_prefix_created "
+        "ON artifacts (prefix, created_ts)"
+    ),
+    "CREATE INDEX IF NOT EXISTS idx_artifacts_type ON artifacts (type)",
+    "CREATE INDEX IF NOT EXISTS idx_artifacts_status ON artifacts (status)",
+    "CREATE INDEX IF NOT EXISTS idx_artifacts_author ON artifacts (author)",
+    "CREATE INDEX IF NOT EXISTS idx_artifacts_created ON artifacts (created_ts)",
+    """
+CREATE TABLE IF NOT EXISTS artifact_tags (
+    tag TEXT NOT NULL,
+    artifact_id TEXT NOT NULL,
+    PRIMARY KEY (tag, artifact_id)
+) WITHOUT ROWID
+""",
+    (
+        "CREATE INDEX IF NOT EXISTS idx_artifact_tags_artifact "
+        "ON artifact_tags (artifact_id)"
+    ),
+    """
+CREATE TABLE IF NOT EXISTS artifact_references (
+    target_id TEXT NOT NULL,
+    source_seq INTEGER NOT NULL,
+    source_id TEXT NOT NULL,
+    PRIMARY KEY (target_id, source_seq)
+) WITHOUT ROWID
+""",
+    (
+        "CREATE INDEX IF NOT EXISTS idx_artifact_references_source "
+        "ON artifact_references (source_id)"
+    ),
+    """
+CREATE TABLE IF NOT EXISTS index_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID
+""",
+)
+
+_SQL_UPSERT: Final = """
+INSERT INTO artifacts
+    (id, prefix, number, type, status, author, title, created_ts, summary)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    prefix = excluded.prefix,
+    number = excluded.number,
+    type = excluded.type,
+    status = excluded.status,
+    author = excluded.author,
+    title = excluded.title,
+    created_ts = excluded.created_ts,
+    summary = excluded.summary
+RETURNING seq
+"""
+
+_SQL_REFERENCES_TO: Final = """
+SELECT source_id FROM artifact_references WHERE target_id = ? ORDER BY source_seq
+"""
+
+# Sortable summary fields and the columns holding them
+_SORT_COLUMNS: Final[dict[str, str]] = {
+    "id": "id",
+    "created": "created_ts",
+    "title": "title",
+    "status": "status",
+    "author": "author",
+}
+
+
+def get_index_db_path(index_path: Path | str) -> Path:
+    """Get the default database path for an index snapshot.
+
+    Args:
+        index_path: Path to artifacts.json.
+
+    Returns:
+        Path to the database file in the cache directory next to the snapshot.
+    """
+    path = Path(index_path)
+    return get_cache_dir(path.parent) / f"{path.stem}.db"
+
+
+def _file_signature(path: Path) -> str:
+    """Identify a file version by its modification time and size."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return "-"
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _str_or_none(value: object) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+def _string_list(value: object) -> list[str]:
+    if not isinstance(value, list):
+        return []
+    return [item for item in cast("list[object]", value) if isinstance(item, str)]
+
+
+def _row_params(artifact_id: str, artifact: ArtifactSummary) -> tuple[object, ...]:
+    """Build the artifacts row for a summary, mirroring ArtifactIndex keys."""
+    prefix = artifact_id.split("-", maxsplit=1)[0] if "-" in artifact_id else ""
+    number: int | None = None
+    if "-" in artifact_id:
+        try:
+            number = int(artifact_id.split("-")[1])
+        except ValueError:
+            number = None
+    return (
+        artifact_id,
+        prefix,
+        number,
+        _str_or_none(artifact.get("type")),
+        _str_or_none(artifact.get("status")),
+        _str_or_none(artifact.get("author")),
+        _str_or_none(artifact.get("title")),
+        created_timestamp(artifact),
+        orjson.dumps(artifact),
+    )
+
+
+class SQLiteArtifactIndex:
+    """Artifact index backed by a SQLite database.
+
+    Provides the same API as ArtifactIndex. Every call opens its own
+    connection, so results always reflect changes made through any
+    SQLiteArtifactIndex sharing the same database.
+
+    The reference graph is cached in memory together with the signature of
+    the database state it reflects, and rebuilt when another index sharing
+    the database has changed it since.
+
+    Attributes:
+        _index_path: Path to the artifacts.json file.
+        _db_path: Path to the SQLite database.
+        _graph: Cached reference graph, if built.
+        _graph_signature: Source signature the cached graph reflects.
+    """
+
+    __slots__ = ("_db_path", "_graph", "_graph_signature", "_index_path")
+
+    def __init__(
+        self, index_path: Path | str, *, db_path: Path | str | None = None
+    ) -> None:
+        """Open the index, rebuilding the database if it is out of date.
+
+        Args:
+            index_path: Path to artifacts.json.
+            db_path: Path to the SQLite database (defaults to
+                .cache/artifacts.db next to artifacts.json).
+
+        Note:
+            If the index file doesn't exist or is invalid, an empty index
+            is created.
+        """
+        self._index_path = Path(index_path)
+        self._db_path = (
+            Path(db_path) if db_path is not None else get_index_db_path(index_path)
+        )
+        self._graph: ArtifactGraph | None = None
+        self._graph_signature: str | None = None
+        self._ensure_schema()
+        self._sync()
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for reads."""
+        with open_cache(self._db_path) as conn:
+            yield conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in a write transaction, rolling back on error."""
+        with open_cache(self._db_path, write=True) as conn:
+            yield conn
+
+    def _ensure_schema(self) -> None:
+        """Create the schema, discarding a cache written by another version."""
+        ensure_cache_schema(
+            self._db_path,
+            _SCHEMA_VERSION,
+            _SCHEMA_STATEMENTS,
+            drop=["artifacts", "artifact_tags", "artifact_references", "index_meta"],
+        )
+
+    def _source_signature(self) -> str:
+        """Identify the current snapshot and journal versions."""
+        return "/".join(
+            (
+                _file_signature(self._index_path),
+                _file_signature(get_index_journal_path(self._index_path)),
+            )
+        )
+
+    @staticmethod
+    def _get_meta(conn: sqlite3.Connection, key: str) -> str | None:
+        row = conn.execute(
+            "SELECT value FROM index_meta WHERE key = ?", (key,)
+        ).fetchone()
+        return cast("str", row[0]) if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, **values: object) -> None:
+        _ = conn.executemany(
+            "INSERT OR REPLACE INTO index_meta (key, value) VALUES (?, ?)",
+            [(key, str(value)) for key, value in values.items()],
+        )
+
+    def _sync(self) -> None:
+        """Rebuild the database if artifacts.json or its journal changed."""
+        # Taken before loading, so a write in between triggers another sync
+        signature = self._source_signature()
+        with self._read() as conn:
+            if self._get_meta(conn, "signature") == signature:
+                return
+
+        source = ArtifactIndex(self._index_path)
+        with self._write() as conn:
+            for table in ("artifacts", "artifact_tags", "artifact_references"):
+                _ = conn.execute(f"DELETE FROM {table}")  # noqa: S608
+            self._insert(conn, source.to_dict()["artifacts"])
+            self._set_meta(
+                conn,
+                signature=signature,
+                updated=source.updated.isoformat(),
+                journal_entries=source.journal_entries,
+                snapshot_size=source.count,
+            )
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, artifacts: Iterable[ArtifactSummary]) -> None:
+        """Upsert summaries and replace their tags and references."""
+        for artifact in artifacts:
+            artifact_id = cast("str", artifact["id"])
+            (seq,) = conn.execute(
+                _SQL_UPSERT, _row_params(artifact_id, artifact)
+            ).fetchone()
+            _ = conn.execute(
+                "DELETE FROM artifact_tags WHERE artifact_id = ?", (artifact_id,)
+            )
+            _ = conn.execute(
+                "DELETE FROM artifact_references WHERE source_id = ?", (artifact_id,)
+            )
+            _ = conn.executemany(
+                "INSERT OR IGNORE INTO artifact_tags (tag, artifact_id) VALUES (?, ?)",
+                [(tag, artifact_id) for tag in _string_list(artifact.get("tags"))],
+            )
+            _ = conn.executemany(
+                "INSERT OR IGNORE INTO artifact_references "
+                "(target_id, source_seq, source_id) VALUES (?, ?, ?)",
+                [
+                    (ref, seq, artifact_id)
+                    for ref in _string_list(artifact.get("references"))
+                ],
+            )
+
+    def _record(self, conn: sqlite3.Connection, entry: dict[str, object]) -> bool:
+        """Journal a change made in the current transaction.
+
+        Returns:
+            True if the journal has grown long enough to be compacted.
+        """
+        append_index_journal(self._index_path, entry)
+        journal_entries = int(self._get_meta(conn, "journal_entries") or 0) + 1
+        self._set_meta(
+            conn,
+            signature=self._source_signature(),
+            updated=datetime.now(UTC).isoformat(),
+            journal_entries=journal_entries,
+        )
+        snapshot_size = int(self._get_meta(conn, "snapshot_size") or 0)
+        return journal_entries >= max(_COMPACT_MIN_ENTRIES, snapshot_size)
+
+    def put(self, artifact: ArtifactSummary) -> None:
+        """Add or replace an artifact summary.
+
+        Updates the database and appends the change to the journal.
+
+        Args:
+            artifact: Artifact summary dict with a string "id".
+
+        Raises:
+            ValueError: If the summary has no string "id".
+        """
+        artifact_id = artifact.get("id")
+        if not isinstance(artifact_id, str) or not artifact_id:
+            msg = "Artifact summary must have a string 'id'"
+            raise ValueError(msg)
+
+        with self._write() as conn:
+            graph = self._current_graph(conn)
+            self._insert(conn, [artifact])
+            should_compact = self._record(conn, {"op": "put", "artifact": artifact})
+            signature = self._get_meta(conn, "signature")
+        if graph is not None:
+            graph.put(artifact)
+            self._graph_signature = signature
+        if should_compact:
+            self.compact()
+
+    def remove(self, artifact_id: str) -> bool:
+        """Remove an artifact summary.
+
+        Args:
+            artifact_id: ID of the artifact to remove.
+
+        Returns:
+            True if the artifact was in the index.
+        """
+        with self._write() as conn:
+            graph = self._current_graph(conn)
+            cursor = conn.execute("DELETE FROM artifacts WHERE id = ?", (artifact_id,))
+            if cursor.rowcount == 0:
+                return False
+            _ = conn.execute(
+                "DELETE FROM artifact_tags WHERE artifact_id = ?", (artifact_id,)
+            )
+            _ = conn.execute(
+                "DELETE FROM artifact_references WHERE source_id = ?", (artifact_id,)
+            )
+            should_compact = self._record(conn, {"op": "remove", "id": artifact_id})
+            signature = self._get_meta(conn, "signature")
+        if graph is not None:
+            _ = graph.remove(artifact_id)
+            self._graph_signature = signature
+        if should_compact:
+            self.compact()
+        return True
+
+    def compact(self) -> None:
+        """Write the current index as a new snapshot and clear the journal."""
+        with self._write() as conn:
+            graph = self._current_graph(conn)
+            rows = conn.execute("SELECT summary FROM artifacts ORDER BY seq")
+            write_index_snapshot(
+                self._index_path,
+                [orjson.loads(row[0]) for row in rows],
+                updated=self._updated(conn),
+            )
+            self._set_meta(
+                conn,
+                signature=self._source_signature(),
+                journal_entries=0,
+                snapshot_size=self._count(conn),
+            )
+            signature = self._get_meta(conn, "signature")
+        if graph is not None:
+            self._graph_signature = signature
+
+    @property
+    def db_path(self) -> Path:
+        """Path to the SQLite database."""
+        return self._db_path
+
+    @property
+    def journal_entries(self) -> int:
+        """Number of changes in the journal since the last snapshot."""
+        with self._read() as conn:
+            return int(self._get_meta(conn, "journal_entries") or 0)
+
+    def _updated(self, conn: sqlite3.Connection) -> datetime:
+        return datetime.fromisoformat(cast("str", self._get_meta(conn, "updated")))
+
+    @property
+    def updated(self) -> datetime:
+        """When index was last updated."""
+        with self._read() as conn:
+            return self._updated(conn)
+
+    @staticmethod
+    def _count(conn: sqlite3.Connection) -> int:
+        return cast("int", conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0])
+
+    @property
+    def count(self) -> int:
+        """Number of artifacts in index."""
+        with self._read() as conn:
+            return self._count(conn)
+
+    def get(self, artifact_id: str) -> ArtifactSummary | None:
+        """Get artifact summary by ID.
+
+        Args:
+            artifact_id: Artifact ID (e.g., "RV-0001").
+
+        Returns:
+            Artifact summary dict or None if not found.
+        """
+        with self._read() as conn:
+            row = conn.execute(
+                "SELECT summary FROM artifacts WHERE id = ?", (artifact_id,)
+            ).fetchone()
+        return cast("ArtifactSummary", orjson.loads(row[0])) if row else None
+
+    def _select(  # noqa: PLR0913
+        self,
+        where: list[str],
+        params: list[object],
+        *,
+        sort_by: ArtifactSortKey | None,
+        descending: bool,
+        limit: int | None,
+        offset: int,
+    ) -> list[ArtifactSummary]:
+        """Run a summary query with sorting and pagination.
+
+        Orders like ArtifactIndex: missing sort values first, ties by
+        insertion order, and both reversed when descending.
+        """
+        check_page(limit, offset)
+        direction = "DESC" if descending else "ASC"
+        order = f"seq {direction}"
+        if sort_by is not None:
+            order = f"{_SORT_COLUMNS[sort_by]} {direction}, {order}"
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        with self._read() as conn:
+            rows = conn.execute(
+                f"SELECT summary FROM artifacts {clause} "  # noqa: S608
+                f"ORDER BY {order} LIMIT ? OFFSET ?",
+                [*params, -1 if limit is None else limit, offset],
+            ).fetchall()
+        return [cast("ArtifactSummary", orjson.loads(row[0])) for row in rows]
+
+    def filter(  # noqa: PLR0913
+        self,
+        *,
+        type_filter: str | None = None,
+        status_filter: str | None = None,
+        author_filter: str | None = None,
+        tag_filter: str | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        sort_by: ArtifactSortKey | None = None,
+        descending: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[ArtifactSummary]:
+        """Filter artifacts by criteria.
+
+        All filters are combined with AND logic. Only artifacts matching
+        all specified criteria are returned.
+
+        Args:
+            type_filter: Filter by artifact type (prefix or name).
+            status_filter: Filter by status.
+            author_filter: Filter by author.
+            tag_filter: Filter by tag (artifact must have tag).
+            created_after: Include only artifacts created after this datetime.
+            created_before: Include only artifacts created before this datetime.
+            sort_by: Summary field to sort by; insertion order if None.
+            descending: Reverse the sort order.
+            limit: Maximum number of summaries to return.
+            offset: Number of matching summaries to skip.
+
+        Returns:
+            List of matching artifact summaries.
+
+        Raises:
+            ValueError: If limit or offset is negative.
+        """
+        where: list[str] = []
+        params: list[object] = []
+        if type_filter:
+            where.append("(prefix = ? OR type = ?)")
+            params.extend((type_filter, type_filter))
+        if status_filter:
+            where.append("status = ?")
+            params.append(status_filter)
+        if author_filter:
+            where.append("author = ?")
+            params.append(author_filter)
+        if tag_filter:
+            where.append("id IN (SELECT artifact_id FROM artifact_tags WHERE tag = ?)")
+            params.append(tag_filter)
+        if created_after:
+            where.append("created_ts >= ?")
+            params.append(created_after.timestamp())
+        if created_before:
+            where.append("created_ts <= ?")
+            params.append(created_before.timestamp())
+        return self._select(
+            where,
+            params,
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit,
+            offset=offset,
+        )
+
+    def get_by_type(
+        self,
+        type_prefix: str,
+        *,
+        sort_by: ArtifactSortKey | None = None,
+        descending: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[ArtifactSummary]:
+        """Get all artifacts of a type.
+
+        Args:
+            type_prefix: Two-letter prefix (e.g., "RV").
+            sort_by: Summary field to sort by; insertion order if None.
+            descending: Reverse the sort order.
+            limit: Maximum number of summaries to return.
+            offset: Number of summaries to skip.
+
+        Returns:
+            List of artifact summaries for that type.
+
+        Raises:
+            ValueError: If limit or offset is negative.
+        """
+        if not type_prefix:
+            return []
+        return self._select(
+            ["prefix = ?"],
+            [type_prefix],
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit,
+            offset=offset,
+        )
+
+    def get_next_number(self, type_prefix: str) -> int:
+        """Get next available number for a type.
+
+        Args:
+            type_prefix: Two-letter prefix.
+
+        Returns:
+            Next sequential number (1 if no artifacts of this type exist).
+        """
+        with self._read() as conn:
+            row = conn.execute(
+                "SELECT MAX(number) FROM artifacts WHERE prefix = ?", (type_prefix,)
+            ).fetchone()
+        return max(cast("int | None", row[0]) or 0, 0) + 1
+
+    def get_references_to(self, target_id: str) -> list[str]:
+        """Find artifacts that reference a target.
+
+        Args:
+            target_id: ID being referenced.
+
+        Returns:
+            List of artifact IDs that reference target.
+        """
+        with self._read() as conn:
+            rows = conn.execute(_SQL_REFERENCES_TO, (target_id,)).fetchall()
+        return [cast("str", row[0]) for row in rows]
+
+    def _current_graph(self, conn: sqlite3.Connection) -> ArtifactGraph | None:
+        """Get the cached graph if it reflects the database state."""
+        if self._graph is None:
+            return None
+        if self._get_meta(conn, "signature") != self._graph_signature:
+            return None
+        return self._graph
+
+    def reference_graph(self) -> ArtifactGraph:
+        """Get the reference and supersession graph of the indexed artifacts.
+
+        The graph is built on the first call and updated in place by later
+        ``put`` and ``remove`` calls on this index. Changes made through
+        another index sharing the database cause a rebuild.
+
+        Returns:
+            Graph of the artifacts currently in the index.
+        """
+        with self._read() as conn:
+            graph = self._current_graph(conn)
+            if graph is None:
+                rows = conn.execute("SELECT summary FROM artifacts ORDER BY seq")
+                graph = ArtifactGraph(orjson.loads(row[0]) for row in rows)
+                self._graph = graph
+                self._graph_signature = self._get_meta(conn, "signature")
+        return graph
+
+    def all_ids(self) -> list[str]:
+        """Get all artifact IDs in the index.
+
+        Returns:
+            List of all artifact IDs, sorted.
+        """
+        with self._read() as conn:
+            rows = conn.execute("SELECT id FROM artifacts ORDER BY id").fetchall()
+        return [cast("str", row[0]) for row in rows]
+
+    def contains(self, artifact_id: str) -> bool:
+        """Check if an artifact exists in the index.
+
+        Args:
+            artifact_id: Artifact ID to check.
+
+        Returns:
+            True if artifact exists in index.
+        """
+        with self._read() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM artifacts WHERE id = ?", (artifact_id,)
+            ).fetchone()
+        return row is not None
+
+    def to_dict(self) -> dict[str, Any]:  # pyright: ignore[reportExplicitAny]
+        """Convert index to serializable dict.
+
+        Returns:
+            Dict suitable for JSON serialization.
+        """
+        with self._read() as conn:
+            rows = conn.execute("SELECT summary FROM artifacts ORDER BY seq")
+            return {
+                "updated": self._updated(conn).isoformat(),
+                "artifacts": [orjson.loads(row[0]) for row in rows],
+            }
@@ -18,35 +18,85 @@ Example:
     ... )
 """
 
-import json
+import contextlib
 import shutil
+import sqlite3
 from dataclasses import replace
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Final, Literal
 
-from oaps.artifacts._index import ArtifactIndex
+from oaps.artifacts._content import (
+    DEFAULT_CHUNK_SIZE,
+    hash_content,
+    iter_content,
+    map_content,
+)
+from oaps.artifacts._index import ArtifactIndex, ArtifactSortKey, write_index_snapshot
 from oaps.artifacts._metadata import (
     format_artifact_id,
     generate_filename,
     generate_slug,
     parse_frontmatter,
     parse_sidecar,
+    read_frontmatter_metadata,
     serialize_frontmatter,
     serialize_sidecar,
 )
+from oaps.artifacts._rebuild import (
+    IndexRebuildStats,
+    artifact_to_summary,
+    get_index_manifest_path,
+    index_matches,
+    load_artifact_file,
+    scan_artifacts,
+)
 from oaps.artifacts._registry import ArtifactRegistry
+from oaps.artifacts._search import (
+    ARTIFACT_SEARCH_KIND,
+    artifact_search_documents,
+    artifact_search_source,
+    iter_artifact_search_sources,
+)
+from oaps.artifacts._sqlite_index import SQLiteArtifactIndex
 from oaps.artifacts._types import Artifact, ArtifactMetadata, ValidationError
+from oaps.artifacts._validation import ValidationJob, iter_check_results
 from oaps.artifacts._validator import (
     VALID_STATUSES,
+    VALIDATOR_VERSION,
     raise_if_validation_errors,
     validate_artifact,
+    validate_references,
 )
 from oaps.exceptions import (
     ArtifactNotFoundError,
     ArtifactValidationError,
     TypeNotRegisteredError,
 )
+from oaps.search import SEARCH_INDEX_NAME, SearchField, SearchHit, SearchIndex
+from oaps.utils._id_counters import ID_COUNTERS_NAME, IDCounters
+from oaps.utils._paths import get_cache_dir
+from oaps.utils._validation_cache import (
+    VALIDATION_CACHE_NAME,
+    ValidationCache,
+    cache_digest,
+    file_digest,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+    from contextlib import AbstractContextManager
+    from typing import BinaryIO
+
+    from oaps.artifacts._graph import ArtifactGraph
+    from oaps.artifacts._types import TypeDefinition
+
+# Index implementations an ArtifactStore can use
+type IndexBackend = Literal["json", "sqlite"]
+
+# Kind of the results an ArtifactStore records in its validation cache
+ARTIFACT_VALIDATION_KIND: Final = "artifact"
 
 
 class ArtifactStore:
@@ -61,17 +111,37 @@ class ArtifactStore:
         _base_path: Base directory for the artifact store.
         _registry: Type registry for artifact types.
         _auto_index: Whether to automatically rebuild index on changes.
+        _index_backend: Index implementation to use.
         _index: Cached artifact index.
+        _search_index: Full-text index kept current on changes, if any.
+        _search_scope: Scope recorded for this store's search documents.
+        _validation_cache: Cache of per-artifact validation results.
+        _id_counters: High-water marks of the artifact numbers per type.
     """
 
-    __slots__ = ("_auto_index", "_base_path", "_index", "_registry")
-
-    def __init__(
+    __slots__ = (
+        "_auto_index",
+        "_base_path",
+        "_id_counters",
+        "_index",
+        "_index_backend",
+        "_registry",
+        "_search_index",
+        "_search_scope",
+        "_validation_cache",
+    )
+
+    def __init__(  # noqa: PLR0913
         self,
         base_path: Path | str,
         *,
         registry: ArtifactRegistry | None = None,
         auto_index: bool = True,
+        index_backend: IndexBackend = "json",
+        search_index: SearchIndex | None = None,
+        search_scope: str = "",
+        validation_cache: ValidationCache | None = None,
+        id_counters: IDCounters | None = None,
     ) -> None:
         """Initialize artifact store.
 
@@ -79,11 +149,29 @@ class ArtifactStore:
             base_path: Base directory for the artifact store.
             registry: Type registry to use (defaults to global).
             auto_index: Automatically rebuild index on changes.
+            index_backend: "json" keeps the index in memory; "sqlite" caches
+                it in .cache/artifacts.db for indexed queries on large stores.
+            search_index: Full-text index to update on changes and to use
+                for ``search``, e.g. one shared by a whole spec tree. Defaults
+                to .cache/search.db in the base directory, created on first
+                search.
+            search_scope: Scope recorded for this store's search documents.
+            validation_cache: Cache of validation results for ``validate``,
+                e.g. one shared by a whole spec tree. Defaults to
+                .cache/validation.db in the base directory.
+            id_counters: Counters that number new artifacts, e.g. ones shared
+                by a whole spec tree. Defaults to .cache/counters.db in the base
+                directory.
         """
         self._base_path = Path(base_path)
         self._registry = registry
         self._auto_index = auto_index
-        self._index: ArtifactIndex | None = None
+        self._index_backend: IndexBackend = index_backend
+        self._index: ArtifactIndex | SQLiteArtifactIndex | None = None
+        self._search_index = search_index
+        self._search_scope = search_scope
+        self._validation_cache = validation_cache
+        self._id_counters = id_counters
 
     @property
     def base_path(self) -> Path:
@@ -120,15 +208,8 @@ class ArtifactStore:
         self,
         artifacts: list[dict[str, Any]],  # pyright: ignore[reportExplicitAny]
     ) -> None:
-        """Write index to file."""
-        data = {
-            "updated": datetime.now(UTC).isoformat(),
-            "artifacts": artifacts,
-        }
-        self.index_path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        """Write a full index snapshot to file, discarding the index journal."""
+        write_index_snapshot(self.index_path, artifacts)
         # Invalidate cached index
         self._index = None
 
@@ -137,40 +218,7 @@ class ArtifactStore:
         artifact: Artifact,
     ) -> dict[str, Any]:  # pyright: ignore[reportExplicitAny]
         """Convert Artifact to index summary dict."""
-        summary: dict[str, Any] = {  # pyright: ignore[reportExplicitAny]
-            "id": artifact.id,
-            "type": artifact.type,
-            "title": artifact.title,
-            "status": artifact.status,
-            "created": artifact.created.isoformat(),
-            "author": artifact.author,
-            "file_path": str(artifact.file_path.relative_to(self._base_path)),
-        }
-
-        if artifact.subtype:
-            summary["subtype"] = artifact.subtype
-        if artifact.updated:
-            summary["updated"] = artifact.updated.isoformat()
-        if artifact.reviewers:
-            summary["reviewers"] = list(artifact.reviewers)
-        if artifact.references:
-            summary["references"] = list(artifact.references)
-        if artifact.supersedes:
-            summary["supersedes"] = artifact.supersedes
-        if artifact.superseded_by:
-            summary["superseded_by"] = artifact.superseded_by
-        if artifact.tags:
-            summary["tags"] = list(artifact.tags)
-        if artifact.summary:
-            summary["summary"] = artifact.summary
-        if artifact.metadata_file_path:
-            summary["metadata_file_path"] = str(
-                artifact.metadata_file_path.relative_to(self._base_path)
-            )
-        if artifact.type_fields:
-            summary.update(artifact.type_fields)
-
-        return summary
+        return artifact_to_summary(artifact, self._base_path)
 
     def _summary_to_artifact(
         self,
@@ -233,12 +281,16 @@ class ArtifactStore:
 
     # --- Query operations ---
 
-    def list_artifacts(
+    def list_artifacts(  # noqa: PLR0913
         self,
         *,
         type_filter: str | None = None,
         status_filter: str | None = None,
         tag_filter: str | None = None,
+        sort_by: ArtifactSortKey | None = None,
+        descending: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[Artifact]:
         """List artifacts with optional filtering.
 
@@ -246,6 +298,10 @@ class ArtifactStore:
             type_filter: Filter by artifact type (prefix or name).
             status_filter: Filter by status.
             tag_filter: Filter by tag (artifact must have tag).
+            sort_by: Summary field to sort by; index order if None.
+            descending: Reverse the sort order.
+            limit: Maximum number of artifacts to return.
+            offset: Number of matching artifacts to skip.
 
         Returns:
             List of matching artifacts.
@@ -255,6 +311,10 @@ class ArtifactStore:
             type_filter=type_filter,
             status_filter=status_filter,
             tag_filter=tag_filter,
+            sort_by=sort_by,
+            descending=descending,
+            limit=limit,
+            offset=offset,
         )
         return [self._summary_to_artifact(s) for s in summaries]
 
@@ -308,6 +368,92 @@ class ArtifactStore:
             return artifact.file_path.read_bytes()
         return artifact.file_path.read_text(encoding="utf-8")
 
+    def open_artifact_content(self, artifact_id: str) -> BinaryIO:
+        """Open an artifact file for streaming reads.
+
+        Unlike ``get_artifact_content``, nothing is read up front. Text
+        artifacts are opened as stored, including their frontmatter.
+
+        Args:
+            artifact_id: Artifact ID.
+
+        Returns:
+            The artifact file, opened in binary mode; the caller closes it.
+
+        Raises:
+            ArtifactNotFoundError: If artifact not found.
+            OSError: If the file cannot be opened.
+        """
+        return self.get_artifact_or_raise(artifact_id).file_path.open("rb")
+
+    def iter_artifact_content(
+        self,
+        artifact_id: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Stream a byte range of an artifact file in chunks.
+
+        Args:
+            artifact_id: Artifact ID.
+            start: First byte to read.
+            end: Byte after the last byte to read, or None for the end.
+            chunk_size: Maximum bytes per chunk.
+
+        Returns:
+            Iterator over the chunks; the file is read as it is consumed.
+
+        Raises:
+            ArtifactNotFoundError: If artifact not found.
+
+        Example:
+            >>> header = b"".join(store.iter_artifact_content("IM-0001", end=8))
+        """
+        path = self.get_artifact_or_raise(artifact_id).file_path
+        return iter_content(path, start=start, end=end, chunk_size=chunk_size)
+
+    def map_artifact_content(
+        self, artifact_id: str
+    ) -> AbstractContextManager[memoryview]:
+        """Memory-map an artifact file for zero-copy reads.
+
+        Args:
+            artifact_id: Artifact ID.
+
+        Returns:
+            Context manager yielding a read-only view of the file.
+
+        Raises:
+            ArtifactNotFoundError: If artifact not found.
+
+        Example:
+            >>> with store.map_artifact_content("IM-0001") as view:
+            ...     signature = bytes(view[:8])
+        """
+        return map_content(self.get_artifact_or_raise(artifact_id).file_path)
+
+    def hash_artifact_content(
+        self, artifact_id: str, *, algorithm: str = "sha256"
+    ) -> str:
+        """Compute the digest of an artifact file incrementally.
+
+        Args:
+            artifact_id: Artifact ID.
+            algorithm: Any algorithm ``hashlib.new`` accepts.
+
+        Returns:
+            Hex digest of the file content.
+
+        Raises:
+            ArtifactNotFoundError: If artifact not found.
+            OSError: If the file cannot be read.
+            ValueError: If the algorithm is not supported.
+        """
+        path = self.get_artifact_or_raise(artifact_id).file_path
+        return hash_content(path, algorithm=algorithm)
+
     def artifact_exists(self, artifact_id: str) -> bool:
         """Check if artifact exists.
 
@@ -322,7 +468,7 @@ class ArtifactStore:
 
     # --- CRUD operations ---
 
-    def add_artifact(  # noqa: PLR0912, PLR0913
+    def add_artifact(  # noqa: PLR0913
         self,
         type_prefix: str,
         title: str,
@@ -367,9 +513,60 @@ class ArtifactStore:
             msg = f"Unknown artifact type: {type_prefix!r}"
             raise TypeNotRegisteredError(msg, prefix=type_prefix)
 
-        # Get next number for this type
+        # Reserve the next number for this type; it is released on failure
         index = self.get_index()
-        number = index.get_next_number(type_prefix)
+        with self.get_id_counters().reserve(
+            self._id_scope(),
+            type_prefix,
+            exists=lambda n: index.contains(format_artifact_id(type_prefix, n)),
+            scan=lambda: index.get_next_number(type_prefix) - 1,
+        ) as number:
+            artifact = self._create_artifact(
+                type_def,
+                number,
+                title,
+                author,
+                content,
+                subtype=subtype,
+                slug=slug,
+                references=references,
+                tags=tags,
+                summary=summary,
+                type_fields=type_fields,
+                file_path=file_path,
+            )
+            if self._auto_index:
+                self._add_to_index(artifact)
+        self._update_search(artifact)
+
+        return artifact
+
+    def _create_artifact(  # noqa: PLR0912, PLR0913
+        self,
+        type_def: TypeDefinition,
+        number: int,
+        title: str,
+        author: str,
+        content: str | bytes | None,
+        *,
+        subtype: str | None,
+        slug: str | None,
+        references: list[str] | None,
+        tags: list[str] | None,
+        summary: str | None,
+        type_fields: dict[str, Any] | None,  # pyright: ignore[reportExplicitAny]
+        file_path: Path | str | None,
+    ) -> Artifact:
+        """Validate and write the files of a new artifact with a reserved number.
+
+        Returns:
+            Created artifact, not yet indexed.
+
+        Raises:
+            ArtifactValidationError: If content or metadata is invalid.
+        """
+        registry = self._get_registry()
+        type_prefix = type_def.prefix
         artifact_id = format_artifact_id(type_prefix, number)
 
         # Generate slug if not provided
@@ -443,8 +640,7 @@ class ArtifactStore:
                 encoding="utf-8",
             )
 
-        # Create Artifact object
-        artifact = Artifact(
+        return Artifact(
             id=artifact_id,
             type=type_def.name,
             title=title,
@@ -460,18 +656,30 @@ class ArtifactStore:
             type_fields=type_fields or {},
         )
 
-        # Update index
-        if self._auto_index:
-            self._add_to_index(artifact)
+    def get_id_counters(self) -> IDCounters:
+        """Get the artifact number counters, creating the default ones if needed.
 
-        return artifact
+        Returns:
+            The counters new artifact numbers are allocated from.
+        """
+        if self._id_counters is None:
+            self._id_counters = IDCounters(
+                get_cache_dir(self._base_path) / ID_COUNTERS_NAME,
+                root=self._base_path,
+            )
+        return self._id_counters
+
+    def _id_scope(self) -> str:
+        """Counter scope of this store, its path relative to the counters' root."""
+        root = self.get_id_counters().root
+        try:
+            return self._base_path.relative_to(root).as_posix()
+        except ValueError:
+            return self._base_path.as_posix()
 
     def _add_to_index(self, artifact: Artifact) -> None:
         """Add artifact to index."""
-        index = self.get_index()
-        summaries = list(index.to_dict()["artifacts"])
-        summaries.append(self._artifact_to_summary(artifact))
-        self._write_index(summaries)
+        self.get_index().put(self._artifact_to_summary(artifact))
 
     def update_artifact(  # noqa: PLR0913
         self,
@@ -587,17 +795,15 @@ class ArtifactStore:
         # Update index
         if self._auto_index:
             self._update_in_index(updated_artifact)
+        self._update_search(updated_artifact)
 
         return updated_artifact
 
     def _update_in_index(self, artifact: Artifact) -> None:
         """Update artifact in index."""
         index = self.get_index()
-        summaries = [
-            s if s.get("id") != artifact.id else self._artifact_to_summary(artifact)
-            for s in index.to_dict()["artifacts"]
-        ]
-        self._write_index(summaries)
+        if index.contains(artifact.id):
+            index.put(self._artifact_to_summary(artifact))
 
     def delete_artifact(self, artifact_id: str, *, force: bool = False) -> None:
         """Delete an artifact.
@@ -632,14 +838,26 @@ class ArtifactStore:
         # Update index
         if self._auto_index:
             self._remove_from_index(artifact_id)
+        if self._search_index is not None:
+            with contextlib.suppress(sqlite3.Error):
+                self._search_index.remove(artifact_search_source(artifact))
 
     def _remove_from_index(self, artifact_id: str) -> None:
         """Remove artifact from index."""
-        index = self.get_index()
-        summaries = [
-            s for s in index.to_dict()["artifacts"] if s.get("id") != artifact_id
-        ]
-        self._write_index(summaries)
+        _ = self.get_index().remove(artifact_id)
+
+    def _update_search(self, artifact: Artifact) -> None:
+        """Re-index an artifact's text if a search index is in use.
+
+        Failures are ignored: the next ``search`` re-syncs changed files.
+        """
+        if self._search_index is None:
+            return
+        source = artifact_search_source(artifact)
+        with contextlib.suppress(OSError, sqlite3.Error):
+            self._search_index.update(
+                source, artifact_search_documents(source, scope=self._search_scope)
+            )
 
     # --- Lifecycle operations ---
 
@@ -738,8 +956,7 @@ class ArtifactStore:
         """Read metadata from artifact file."""
         if artifact.is_binary and artifact.metadata_file_path:
             return parse_sidecar(artifact.metadata_file_path)
-        metadata, _ = parse_frontmatter(artifact.file_path.read_text(encoding="utf-8"))
-        return metadata
+        return read_frontmatter_metadata(artifact.file_path)
 
     def _write_metadata(self, artifact: Artifact, metadata: ArtifactMetadata) -> None:
         """Write metadata to artifact file."""
@@ -755,6 +972,7 @@ class ArtifactStore:
                 serialize_frontmatter(metadata, body),
                 encoding="utf-8",
             )
+        self._update_search(artifact)
 
     def retract_artifact(
         self,
@@ -790,104 +1008,171 @@ class ArtifactStore:
 
     # --- Index operations ---
 
-    def rebuild_index(self) -> None:
+    def rebuild_index(self, *, workers: int | None = None) -> IndexRebuildStats:
         """Rebuild the artifacts.json index from filesystem.
 
-        Scans the artifacts/ directory for all artifact files and
-        rebuilds the index from their metadata.
-        """
-        artifacts: list[dict[str, Any]] = []  # pyright: ignore[reportExplicitAny]
-
-        if not self.artifacts_path.exists():
-            self._write_index(artifacts)
-            return
-
-        # Find all artifact files
-        for file_path in sorted(self.artifacts_path.iterdir()):
-            if file_path.name.startswith("."):
-                continue
+        Scans the artifacts/ directory and rebuilds the index from artifact
+        metadata. Only files changed since the last rebuild are parsed (see
+        ``oaps.artifacts._rebuild``), and artifacts.json is only rewritten
+        if its contents change.
 
-            # Skip sidecar metadata files
-            if file_path.name.endswith(".metadata.yaml"):
-                continue
+        Args:
+            workers: Processes to parse changed files with. None picks the
+                number of available CPUs for large rebuilds; 1 parses
+                in-process.
 
-            try:
-                artifact = self._load_artifact_from_file(file_path)
-                if artifact:
-                    artifacts.append(self._artifact_to_summary(artifact))
-            except (ValueError, OSError):
-                # Skip invalid files
-                continue
+        Returns:
+            Statistics about the files scanned and parsed.
+        """
+        artifacts, stats = scan_artifacts(
+            self.artifacts_path,
+            self._base_path,
+            get_index_manifest_path(self.index_path),
+            workers=workers,
+        )
+        if index_matches(self.index_path, artifacts):
+            return stats
 
         self._write_index(artifacts)
+        return replace(stats, written=True)
 
     def _load_artifact_from_file(self, file_path: Path) -> Artifact | None:
         """Load artifact from a file path."""
-        # Check for sidecar metadata (binary artifact)
-        sidecar_path = file_path.with_suffix(file_path.suffix + ".metadata.yaml")
-
-        if sidecar_path.exists():
-            # Binary artifact
-            metadata = parse_sidecar(sidecar_path)
-            return Artifact(
-                id=metadata.id,
-                type=metadata.type,
-                title=metadata.title,
-                status=metadata.status,
-                created=metadata.created,
-                author=metadata.author,
-                file_path=file_path,
-                subtype=metadata.subtype,
-                updated=metadata.updated,
-                reviewers=metadata.reviewers,
-                references=metadata.references,
-                supersedes=metadata.supersedes,
-                superseded_by=metadata.superseded_by,
-                tags=metadata.tags,
-                summary=metadata.summary,
-                metadata_file_path=sidecar_path,
-                type_fields=metadata.type_fields,
-            )
-
-        # Text artifact (markdown with frontmatter)
-        if file_path.suffix == ".md":
-            content = file_path.read_text(encoding="utf-8")
-            metadata, _ = parse_frontmatter(content)
-            return Artifact(
-                id=metadata.id,
-                type=metadata.type,
-                title=metadata.title,
-                status=metadata.status,
-                created=metadata.created,
-                author=metadata.author,
-                file_path=file_path,
-                subtype=metadata.subtype,
-                updated=metadata.updated,
-                reviewers=metadata.reviewers,
-                references=metadata.references,
-                supersedes=metadata.supersedes,
-                superseded_by=metadata.superseded_by,
-                tags=metadata.tags,
-                summary=metadata.summary,
-                metadata_file_path=None,
-                type_fields=metadata.type_fields,
-            )
+        return load_artifact_file(file_path)
 
-        return None
-
-    def get_index(self) -> ArtifactIndex:
+    def get_index(self) -> ArtifactIndex | SQLiteArtifactIndex:
         """Get the index object for direct queries.
 
         Returns:
-            ArtifactIndex for the store.
+            ArtifactIndex or SQLiteArtifactIndex for the store, depending on
+            the index backend.
         """
         if self._index is None:
-            self._index = ArtifactIndex(self.index_path)
+            if self._index_backend == "sqlite":
+                self._index = SQLiteArtifactIndex(self.index_path)
+            else:
+                self._index = ArtifactIndex(self.index_path)
         return self._index
 
+    def compact_index(self) -> None:
+        """Fold the index journal into the artifacts.json snapshot.
+
+        Changes are normally compacted automatically once the journal grows
+        as long as the index; call this to get a self-contained
+        artifacts.json, e.g. before committing it.
+        """
+        self.get_index().compact()
+
+    def get_reference_graph(self) -> ArtifactGraph:
+        """Get the reference and supersession graph of the store's artifacts.
+
+        The graph is cached by the index and kept current as artifacts are
+        added, updated, and deleted through this store.
+
+        Returns:
+            Graph of the indexed artifacts.
+
+        Example:
+            >>> graph = store.get_reference_graph()
+            >>> graph.dependents("FR-0001")
+            ['RV-0001', 'RV-0002']
+            >>> graph.dangling_references()
+            {'AN-0003': ['XX-9999']}
+        """
+        return self.get_index().reference_graph()
+
+    # --- Search ---
+
+    def get_search_index(self) -> SearchIndex:
+        """Get the full-text index, creating the default one if needed.
+
+        Returns:
+            The store's search index.
+        """
+        if self._search_index is None:
+            self._search_index = SearchIndex(
+                get_cache_dir(self._base_path) / SEARCH_INDEX_NAME,
+                root=self._base_path,
+            )
+        return self._search_index
+
+    def search(
+        self,
+        query: str,
+        *,
+        fields: list[SearchField] | None = None,
+        type_filter: str | None = None,
+        status_filter: str | None = None,
+        limit: int | None = 50,
+    ) -> list[SearchHit]:
+        """Search artifact titles, tags, summaries, and markdown bodies.
+
+        Artifacts changed outside of this store are re-indexed first.
+
+        Args:
+            query: Free-text query; every term must match as a word prefix.
+            fields: Fields to match ("title", "tags", "body"). Defaults to all.
+            type_filter: Filter by artifact type (prefix or name).
+            status_filter: Filter by status.
+            limit: Maximum number of hits, or None for all.
+
+        Returns:
+            Hits ordered from best to worst match.
+
+        Raises:
+            ValueError: If a field is invalid.
+        """
+        index = self.get_search_index()
+        _ = index.sync(
+            iter_artifact_search_sources(self.artifacts_path),
+            partial(artifact_search_documents, scope=self._search_scope),
+            within=self.artifacts_path,
+        )
+        if type_filter is not None:
+            type_def = self._get_registry().get_type(type_filter)
+            if type_def is not None:
+                type_filter = type_def.name
+        return index.search(
+            query,
+            fields=fields,
+            kinds=(ARTIFACT_SEARCH_KIND,),
+            scope=self._search_scope,
+            status=status_filter,
+            doc_type=type_filter,
+            limit=limit,
+        )
+
     # --- Validation ---
 
-    def validate(self, *, strict: bool = False) -> list[ValidationError]:
+    def get_validation_cache(self) -> ValidationCache:
+        """Get the validation result cache, creating the default one if needed.
+
+        Returns:
+            The store's validation cache. Its ``stats`` report how many
+            artifacts ``validate`` served from the cache.
+        """
+        if self._validation_cache is None:
+            self._validation_cache = ValidationCache(
+                get_cache_dir(self._base_path) / VALIDATION_CACHE_NAME,
+                root=self._base_path,
+            )
+        return self._validation_cache
+
+    def _validation_subject(self, path: Path) -> str:
+        """Key of a file in the validation cache, relative to its root."""
+        root = self.get_validation_cache().root
+        try:
+            return path.relative_to(root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def validate(
+        self,
+        *,
+        strict: bool = False,
+        use_cache: bool = True,
+        workers: int | None = None,
+    ) -> list[ValidationError]:
         """Validate store integrity.
 
         Checks all artifacts for metadata validity, type compliance,
@@ -895,35 +1180,97 @@ class ArtifactStore:
 
         Args:
             strict: Fail on warnings (e.g., number gaps).
+            use_cache: Reuse cached results of unchanged artifacts.
+            workers: Processes to check changed artifacts with; see
+                ``iter_validate``.
 
         Returns:
             List of validation errors/warnings.
         """
-        errors: list[ValidationError] = []
+        return list(
+            self.iter_validate(strict=strict, use_cache=use_cache, workers=workers)
+        )
+
+    def iter_validate(
+        self,
+        *,
+        strict: bool = False,
+        use_cache: bool = True,
+        workers: int | None = None,
+    ) -> Generator[ValidationError]:
+        """Validate store integrity, yielding errors as they are found.
+
+        Metadata and type checks are cached per artifact file, keyed by a
+        digest of the metadata file's content, the validator version, and
+        the type registry, so unchanged artifacts are not re-read. Changed
+        artifacts are checked in a process pool when there are many of them.
+        Reference checks always run against the current reference graph, so
+        adding or removing a referenced artifact is reflected immediately.
+        Closing the generator early still caches the results of the
+        artifacts checked so far.
+
+        Args:
+            strict: Fail on warnings (e.g., number gaps).
+            use_cache: Reuse cached results of unchanged artifacts. When
+                False, every artifact is validated and its cached results
+                are replaced.
+            workers: Processes to check changed artifacts with. None picks
+                the number of available CPUs once enough artifacts changed;
+                1 always checks in-process.
+
+        Yields:
+            Validation errors/warnings: those of unchanged artifacts first,
+            then those of changed artifacts as they are checked, then number
+            gaps in strict mode.
+        """
         registry = self._get_registry()
+        graph = self.get_reference_graph()
+        cache = self.get_validation_cache()
 
-        # Validate all artifacts
+        # Digest the file each artifact's metadata is read from
+        context = (VALIDATOR_VERSION, registry.fingerprint())
+        jobs: dict[str, ValidationJob] = {}
+        digests: dict[str, str] = {}
         for artifact in self.list_artifacts():
-            # Read full metadata
-            try:
-                metadata = self._read_metadata(artifact)
-            except (ValueError, OSError) as e:
-                errors.append(
-                    ValidationError(
-                        level="error",
-                        message=f"Failed to read metadata: {e}",
-                        artifact_id=artifact.id,
-                        field=None,
-                    )
-                )
-                continue
-
-            artifact_errors = validate_artifact(
-                metadata,
-                registry=registry,
-                store=self,
-            )
-            errors.extend(artifact_errors)
+            sidecar = artifact.metadata_file_path if artifact.is_binary else None
+            source = sidecar or artifact.file_path
+            subject = self._validation_subject(source)
+            jobs[subject] = (artifact.id, str(source), sidecar is not None)
+            with contextlib.suppress(OSError):
+                digests[subject] = cache_digest(*context, file_digest(source))
+
+        if use_cache:
+            cached = cache.lookup(ARTIFACT_VALIDATION_KIND, digests)
+            cache.record_misses(len(jobs) - len(digests))
+        else:
+            cached = {}
+            cache.record_misses(len(jobs))
+
+        for result in cached.values():
+            yield from (ValidationError(**error) for error in result["errors"])
+            yield from validate_references(result["references"], graph)
+
+        pending = [subject for subject in jobs if subject not in cached]
+        fresh: dict[str, tuple[str, Any]] = {}  # pyright: ignore[reportExplicitAny]
+        try:
+            for position, result in iter_check_results(
+                [jobs[subject] for subject in pending],
+                registry.list_types(),
+                workers=workers,
+            ):
+                subject = pending[position]
+                if subject in digests:
+                    fresh[subject] = (digests[subject], result)
+                yield from (ValidationError(**error) for error in result["errors"])
+                yield from validate_references(result["references"], graph)
+        finally:
+            # Keep what was checked, even if the caller stopped early
+            cache.store(ARTIFACT_VALIDATION_KIND, fresh)
+        _ = cache.retain(
+            ARTIFACT_VALIDATION_KIND,
+            jobs,
+            within=self._validation_subject(self.artifacts_path),
+        )
 
         # Check for number gaps in strict mode
         if strict:
@@ -937,21 +1284,17 @@ class ArtifactStore:
                 )
                 for i, num in enumerate(numbers, 1):
                     if num != i:
-                        errors.append(
-                            ValidationError(
-                                level="warning",
-                                message=(
-                                    f"Number gap in {type_prefix} artifacts: "
-                                    f"missing {type_prefix}-{i:04d}"
-                                ),
-                                artifact_id=None,
-                                field=None,
-                            )
+                        yield ValidationError(
+                            level="warning",
+                            message=(
+                                f"Number gap in {type_prefix} artifacts: "
+                                f"missing {type_prefix}-{i:04d}"
+                            ),
+                            artifact_id=None,
+                            field=None,
                         )
                         break
 
-        return errors
-
     def validate_artifact(self, artifact_id: str) -> list[ValidationError]:
         """Validate a specific artifact.
 
@@ -0,0 +1,176 @@
+# pyright: reportAny=false, reportExplicitAny=false
+"""Store-wide artifact validation.
+
+``ArtifactStore.validate`` checks the metadata of every artifact in a store.
+Reading and checking a metadata file does not depend on any other artifact,
+so the files left after the validation cache has been consulted are checked
+in chunks, spread over a process pool when there are enough of them. Each
+chunk resolves artifact types through one ``build_type_lookup`` table rather
+than querying the registry per artifact, and results are yielded as chunks
+finish so callers can report errors while the rest are still being checked.
+
+Reference checks need the whole store and stay with the caller.
+
+``write_validation_report`` saves validation errors as Parquet or JSON Lines,
+sorted so that reports of two commits can be diffed directly.
+
+Example:
+    >>> from oaps.artifacts._validation import write_validation_report
+    >>> errors = list(store.iter_validate())
+    >>> write_validation_report(errors, Path("validation.parquet"))
+"""
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+import orjson
+
+from oaps.artifacts._metadata import parse_sidecar, read_frontmatter_metadata
+from oaps.artifacts._types import ValidationError
+from oaps.artifacts._validator import build_type_lookup, validate_artifact
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from oaps.artifacts._types import TypeDefinition
+
+# Files to check before a process pool pays for its startup cost
+_PARALLEL_MIN_FILES: Final = 128
+
+# Chunks per worker, so that workers finishing early pick up more work
+_CHUNKS_PER_WORKER: Final = 4
+
+# Report columns, in output order
+_REPORT_COLUMNS: Final = ("artifact_id", "level", "field", "message")
+
+# One metadata file to check: (artifact ID, metadata source, is a sidecar)
+type ValidationJob = tuple[str, str, bool]
+
+
+def _check_file(job: ValidationJob, types: dict[str, TypeDefinition]) -> dict[str, Any]:
+    """Check one artifact's metadata file.
+
+    Returns:
+        JSON-serializable dict with the "errors" found and the
+        "references" to check against the other artifacts.
+    """
+    artifact_id, source, sidecar = job
+    try:
+        metadata = (
+            parse_sidecar(source) if sidecar else read_frontmatter_metadata(source)
+        )
+    except (ValueError, OSError) as e:
+        error = ValidationError(
+            level="error",
+            message=f"Failed to read metadata: {e}",
+            artifact_id=artifact_id,
+            field=None,
+        )
+        return {"errors": [asdict(error)], "references": []}
+    errors = validate_artifact(metadata, types=types)
+    return {
+        "errors": [asdict(error) for error in errors],
+        "references": list(metadata.references),
+    }
+
+
+def _check_chunk(
+    jobs: Sequence[ValidationJob], types: tuple[TypeDefinition, ...]
+) -> list[dict[str, Any]]:
+    """Check a chunk of metadata files against one type lookup.
+
+    Runs in pool workers, so it only takes and returns picklable values.
+    """
+    lookup = build_type_lookup(types)
+    return [_check_file(job, lookup) for job in jobs]
+
+
+def iter_check_results(
+    jobs: Sequence[ValidationJob],
+    types: Iterable[TypeDefinition],
+    *,
+    workers: int | None = None,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Check artifact metadata files, yielding results as they are found.
+
+    Args:
+        jobs: Files to check.
+        types: Type definitions to validate against.
+        workers: Processes to check with. None picks the number of available
+            CPUs once enough files need checking; 1 always checks in-process.
+
+    Yields:
+        Tuples of the job's position in ``jobs`` and its result, a dict with
+        the "errors" (as dicts) and the "references" of the artifact. Results
+        come in job order when checked in-process and in completion order
+        otherwise.
+    """
+    definitions = tuple(types)
+    max_workers = workers or os.process_cpu_count() or 1
+    if max_workers <= 1 or len(jobs) < _PARALLEL_MIN_FILES:
+        lookup = build_type_lookup(definitions)
+        for position, job in enumerate(jobs):
+            yield position, _check_file(job, lookup)
+        return
+
+    chunksize = max(1, len(jobs) // (max_workers * _CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures: dict[Future[list[dict[str, Any]]], int] = {}
+        for start in range(0, len(jobs), chunksize):
+            chunk = jobs[start : start + chunksize]
+            futures[pool.submit(_check_chunk, chunk, definitions)] = start
+        try:
+            for future in as_completed(futures):
+                start = futures[future]
+                for offset, result in enumerate(future.result()):
+                    yield start + offset, result
+        finally:
+            # Drop queued chunks if the caller stops iterating early
+            pool.shutdown(cancel_futures=True)
+
+
+def _report_rows(errors: Iterable[ValidationError]) -> list[dict[str, str | None]]:
+    """Convert errors to report rows in a stable order."""
+    rows = [
+        {
+            "artifact_id": error.artifact_id,
+            "level": error.level,
+            "field": error.field,
+            "message": error.message,
+        }
+        for error in errors
+    ]
+    rows.sort(key=lambda row: tuple(row[column] or "" for column in _REPORT_COLUMNS))
+    return rows
+
+
+def write_validation_report(errors: Iterable[ValidationError], path: Path | str) -> int:
+    """Write validation errors to a Parquet or JSON Lines report.
+
+    The format follows the file extension: ``.parquet`` writes Parquet,
+    anything else one JSON object per line. Rows are sorted by artifact ID,
+    level, field, and message, so identical results give identical files.
+
+    Args:
+        errors: Validation errors, e.g. from ``ArtifactStore.iter_validate``.
+        path: Report file to write. Parent directories are created.
+
+    Returns:
+        Number of rows written.
+    """
+    path = Path(path)
+    rows = _report_rows(errors)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == ".parquet":
+        import polars as pl  # noqa: PLC0415 - polars is slow to import
+
+        schema = pl.Schema([(column, pl.String) for column in _REPORT_COLUMNS])
+        pl.DataFrame(rows, schema=schema).write_parquet(path)
+    else:
+        with path.open("wb") as f:
+            for row in rows:
+                _ = f.write(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE))
+    return len(rows)
@@ -10,17 +10,22 @@ Example:
     ...     print(f"Found {len(errors)} validation errors")
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
+from oaps.artifacts._graph import ArtifactGraph
 from oaps.artifacts._metadata import parse_artifact_id
 from oaps.artifacts._registry import ArtifactRegistry
 from oaps.artifacts._types import ArtifactMetadata, ValidationError
 from oaps.exceptions import ArtifactValidationError
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Mapping, Sequence
 
     from oaps.artifacts._store import ArtifactStore
+    from oaps.artifacts._types import TypeDefinition
+
+# Bump when a check changes, so cached validation results are discarded
+VALIDATOR_VERSION: Final = 1
 
 # Valid artifact statuses
 VALID_STATUSES: frozenset[str] = frozenset(
@@ -141,9 +146,37 @@ def validate_metadata(metadata: ArtifactMetadata) -> list[ValidationError]:
     return errors
 
 
-def validate_artifact_type(
+def build_type_lookup(
+    types: Iterable[TypeDefinition],
+) -> dict[str, TypeDefinition]:
+    """Index type definitions by prefix and by name.
+
+    Validating many artifacts against one lookup resolves each type once
+    instead of once per artifact.
+
+    Args:
+        types: Type definitions, e.g. ``registry.list_types()``.
+
+    Returns:
+        Dict mapping each type's prefix and name to its definition.
+
+    Example:
+        >>> types = build_type_lookup(registry.list_types())
+        >>> types["RV"] is types["review"]
+        True
+    """
+    definitions = list(types)
+    # Prefixes are added last so they win, like registry.get_type does
+    lookup = {type_def.name: type_def for type_def in definitions}
+    lookup.update((type_def.prefix, type_def) for type_def in definitions)
+    return lookup
+
+
+def validate_artifact_type(  # noqa: PLR0912
     metadata: ArtifactMetadata,
     registry: ArtifactRegistry | None = None,
+    *,
+    types: Mapping[str, TypeDefinition] | None = None,
 ) -> list[ValidationError]:
     """Validate artifact against its type definition.
 
@@ -158,6 +191,8 @@ def validate_artifact_type(
     Args:
         metadata: Artifact metadata to validate.
         registry: Type registry (defaults to global).
+        types: Lookup from ``build_type_lookup`` to resolve the type with
+            instead of the registry, when validating many artifacts.
 
     Returns:
         List of validation errors. Empty list indicates valid type usage.
@@ -169,18 +204,21 @@ def validate_artifact_type(
     """
     errors: list[ValidationError] = []
 
-    # Get registry
-    if registry is None:
-        registry = ArtifactRegistry.get_instance()
+    if types is not None:
+        type_def = types.get(metadata.type) if metadata.type else None
+    else:
+        # Get registry
+        if registry is None:
+            registry = ArtifactRegistry.get_instance()
 
-    # Get type definition
-    type_def = registry.get_type(metadata.type) if metadata.type else None
+        # Get type definition
+        type_def = registry.get_type(metadata.type) if metadata.type else None
 
-    # Also try to get by name if prefix lookup failed
-    if type_def is None and metadata.type:
-        prefix = registry.type_name_to_prefix(metadata.type)
-        if prefix:
-            type_def = registry.get_type(prefix)
+        # Also try to get by name if prefix lookup failed
+        if type_def is None and metadata.type:
+            prefix = registry.type_name_to_prefix(metadata.type)
+            if prefix:
+                type_def = registry.get_type(prefix)
 
     if type_def is None:
         errors.append(
@@ -277,13 +315,14 @@ def validate_artifact_type(
 
 def validate_references(
     references: Sequence[str],
-    store: ArtifactStore,
+    store: ArtifactStore | ArtifactGraph,
 ) -> list[ValidationError]:
     """Validate that references resolve to existing artifacts.
 
     Args:
         references: List of reference IDs.
-        store: Artifact store for lookup.
+        store: Artifact store for lookup, or its reference graph to check
+            many artifacts without one index lookup per reference.
 
     Returns:
         List of validation errors for unresolved references.
@@ -293,6 +332,9 @@ def validate_references(
         >>> len(errors)  # XX-9999 doesn't exist
         1
     """
+    exists = (
+        store.contains if isinstance(store, ArtifactGraph) else store.artifact_exists
+    )
     return [
         ValidationError(
             level="warning",
@@ -301,7 +343,7 @@ def validate_references(
             field="references",
         )
         for ref in references
-        if not store.artifact_exists(ref)
+        if not exists(ref)
     ]
 
 
@@ -309,7 +351,8 @@ def validate_artifact(
     metadata: ArtifactMetadata,
     *,
     registry: ArtifactRegistry | None = None,
-    store: ArtifactStore | None = None,
+    store: ArtifactStore | ArtifactGraph | None = None,
+    types: Mapping[str, TypeDefinition] | None = None,
 ) -> list[ValidationError]:
     """Validate all aspects of an artifact.
 
@@ -319,7 +362,9 @@ def validate_artifact(
     Args:
         metadata: Artifact metadata to validate.
         registry: Type registry (defaults to global).
-        store: Artifact store for reference validation (optional).
+        store: Artifact store or reference graph for reference validation
+            (optional).
+        types: Lookup from ``build_type_lookup``, used instead of the registry.
 
     Returns:
         List of all validation errors.
@@ -334,7 +379,7 @@ def validate_artifact(
     errors.extend(validate_metadata(metadata))
 
     # Type validation
-    errors.extend(validate_artifact_type(metadata, registry))
+    errors.extend(validate_artifact_type(metadata, registry, types=types))
 
     # Reference validation (if store provided)
     if store and metadata.references:
@@ -13,6 +13,7 @@ from rich.console import Console
 
 from oaps.cli._commands._context import CLIContext
 from oaps.cli._commands._shared import ExitCode, exit_with_error
+from oaps.exceptions import IdeaValidationError
 
 # Re-export app
 from ._app import app
@@ -31,6 +32,7 @@ from ._storage import (
     get_ideas_dir,
     idea_filename,
     load_idea,
+    load_idea_frontmatter,
     load_index,
     rebuild_index,
     save_idea,
@@ -50,6 +52,7 @@ __all__ = [
     "get_ideas_dir",
     "idea_filename",
     "load_idea",
+    "load_idea_frontmatter",
     "load_index",
     "rebuild_index",
     "save_idea",
@@ -311,8 +314,33 @@ def _show(idea_id: str, /) -> None:
 
 
 @app.command(name="search")
-def _search(query: str, /) -> None:
-    """Search ideas by content"""
+def _search(
+    query: str,
+    /,
+    status: Annotated[
+        str | None, Parameter(name=["--status", "-s"], help="Filter by status")
+    ] = None,
+    type: Annotated[
+        str | None, Parameter(name=["--type", "-t"], help="Filter by type")
+    ] = None,
+    field: Annotated[
+        list[str] | None,
+        Parameter(
+            name=["--field", "-f"],
+            help="Field to search: title, body, tags, id, author (repeatable)",
+        ),
+    ] = None,
+    limit: Annotated[
+        int, Parameter(name=["--limit", "-n"], help="Maximum number to show")
+    ] = 20,
+) -> None:
+    """Search ideas by content
+
+    Every word of the query must match the start of a word in the idea's
+    title, tags, or body. Results are ranked by relevance.
+    """
+    from oaps.idea import IdeaManager
+
     console = Console()
     ideas_dir = get_ideas_dir()
 
@@ -320,21 +348,40 @@ def _search(query: str, /) -> None:
         console.print("[dim]No ideas found.[/dim]")
         return
 
-    query_lower = query.lower()
-    results: list[tuple[IdeaFrontmatter, str]] = []
+    status_filter: IdeaStatus | None = None
+    if status:
+        try:
+            status_filter = IdeaStatus(status)
+        except ValueError:
+            valid = ", ".join(s.value for s in IdeaStatus)
+            exit_with_error(
+                f"Invalid status '{status}'. Valid: {valid}",
+                ExitCode.VALIDATION_ERROR,
+                console=console,
+            )
 
-    for path in ideas_dir.glob("*.md"):
+    type_filter: IdeaType | None = None
+    if type:
         try:
-            fm, body = load_idea(path)
-            # Search in title, body, and tags
-            if (
-                query_lower in fm.title.lower()
-                or query_lower in body.lower()
-                or any(query_lower in tag.lower() for tag in fm.tags)
-            ):
-                results.append((fm, path.name))
-        except (ValueError, FileNotFoundError):
-            continue
+            type_filter = IdeaType(type)
+        except ValueError:
+            valid = ", ".join(t.value for t in IdeaType)
+            exit_with_error(
+                f"Invalid type '{type}'. Valid: {valid}",
+                ExitCode.VALIDATION_ERROR,
+                console=console,
+            )
+
+    try:
+        results = IdeaManager(ideas_dir).search(
+            query,
+            fields=field,
+            status=status_filter,
+            idea_type=type_filter,
+            limit=limit,
+        )
+    except IdeaValidationError as e:
+        exit_with_error(str(e), ExitCode.VALIDATION_ERROR, console=console)
 
     if not results:
         console.print(f"[dim]No ideas match '{query}'.[/dim]")
@@ -342,11 +389,12 @@ def _search(query: str, /) -> None:
 
     console.print(f"[bold]Found {len(results)} idea(s) matching '{query}':[/bold]\n")
 
-    for fm, _ in results:
-        console.print(f"  {STATUS_EMOJI[fm.status]} [bold]{fm.title}[/bold]")
-        console.print(f"    [dim]ID: {fm.id}[/dim]")
+    for summary in results:
+        console.print(f"  {STATUS_EMOJI[summary.status]} [bold]{summary.title}[/bold]")
+        console.print(f"    [dim]ID: {summary.id}[/dim]")
         console.print(
-            f"    [dim]{fm.type.value} | {_format_tags_display(fm.tags)}[/dim]"
+            f"    [dim]{summary.idea_type.value} | "
+            f"{_format_tags_display(summary.tags)}[/dim]"
         )
 
     console.print("\n[dim]To view an idea: oaps idea show <id>[/dim]")
@@ -634,7 +682,7 @@ def _resume(idea_id: Annotated[str | None, Parameter()] = None, /) -> None:
         )
 
     try:
-        fm, _ = load_idea(path)
+        fm = load_idea_frontmatter(path)
     except (ValueError, FileNotFoundError) as e:
         exit_with_error(str(e), ExitCode.LOAD_ERROR, console=console)
 
@@ -664,7 +712,7 @@ def _resume(idea_id: Annotated[str | None, Parameter()] = None, /) -> None:
             rel_path = find_idea_by_id(rel_id)
             if rel_path:
                 try:
-                    rel_fm, _ = load_idea(rel_path)
+                    rel_fm = load_idea_frontmatter(rel_path)
                     emoji = STATUS_EMOJI[rel_fm.status]
                     console.print(f"  {emoji} {rel_fm.title}")
                     console.print(f"      [dim]ID: {rel_id}[/dim]")
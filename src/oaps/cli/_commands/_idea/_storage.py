@@ -7,7 +7,11 @@ from typing import TYPE_CHECKING, Any
 
 import pendulum
 
-from oaps.spec._io import read_markdown_frontmatter, write_markdown_with_frontmatter
+from oaps.spec._io import (
+    read_markdown_frontmatter,
+    read_markdown_header,
+    write_markdown_with_frontmatter,
+)
 from oaps.utils._paths import get_oaps_dir
 
 from ._models import (
@@ -141,6 +145,27 @@ def load_idea(path: Path) -> tuple[IdeaFrontmatter, str]:
     return parse_idea_frontmatter(frontmatter), body
 
 
+def load_idea_frontmatter(path: Path) -> IdeaFrontmatter:
+    """Load an idea's frontmatter without reading its body.
+
+    Args:
+        path: Path to the idea markdown file.
+
+    Returns:
+        The parsed frontmatter.
+
+    Raises:
+        FileNotFoundError: If file doesn't exist.
+        ValueError: If frontmatter is invalid.
+    """
+    frontmatter = read_markdown_header(path)
+    if not frontmatter:
+        msg = f"No frontmatter found in {path}"
+        raise ValueError(msg)
+
+    return parse_idea_frontmatter(frontmatter)
+
+
 def frontmatter_to_dict(fm: IdeaFrontmatter) -> dict[str, Any]:
     """Convert IdeaFrontmatter to dict for serialization.
 
@@ -262,7 +287,7 @@ def rebuild_index() -> list[IdeaIndexEntry]:
     entries: list[IdeaIndexEntry] = []
     for path in sorted(ideas_dir.glob("*.md")):
         try:
-            fm, _ = load_idea(path)
+            fm = load_idea_frontmatter(path)
             entries.append(
                 IdeaIndexEntry(
                     id=fm.id,
@@ -307,7 +332,7 @@ def find_idea_by_id(idea_id: str) -> Path | None:
     # Fallback: search files by ID prefix
     for path in ideas_dir.glob("*.md"):
         try:
-            fm, _ = load_idea(path)
+            fm = load_idea_frontmatter(path)
             if fm.id == idea_id:
                 return path
         except (ValueError, FileNotFoundError):
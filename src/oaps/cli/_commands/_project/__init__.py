@@ -16,6 +16,7 @@ from oaps.cli._commands._shared import ExitCode, exit_with_error
 from oaps.exceptions import ProjectRepositoryNotInitializedError
 from oaps.repository import ProjectRepository
 
+from . import _transfer as _transfer
 from ._app import app
 
 if TYPE_CHECKING:
@@ -0,0 +1,111 @@
+# pyright: reportUnusedCallResult=false, reportUnusedFunction=false
+# ruff: noqa: A002, D415, FBT002, TC003
+"""Export and import subcommands for project state."""
+
+from pathlib import Path
+from typing import Annotated, Literal
+
+from cyclopts import Parameter
+
+from oaps.cli._commands._shared import ExitCode, exit_with_error
+
+from ._app import app
+
+# Mirrors TransferFormat in oaps.utils._state_transfer so the CLI does not
+# load pyarrow at startup
+type TransferFormat = Literal["jsonl", "parquet"]
+
+
+@app.command(name="export")
+def _export(
+    output: Path,
+    /,
+    format: Annotated[
+        TransferFormat | None,
+        Parameter(
+            name=["--format", "-f"],
+            help="File format (jsonl, parquet); inferred from extension by default",
+        ),
+    ] = None,
+) -> None:
+    """Export the project store to JSONL or Parquet
+
+    Rows are streamed from the state database in batches, so memory use does
+    not depend on the size of the store. Values, timestamps and authors are
+    preserved exactly.
+
+    Examples:
+        oaps project export state.jsonl
+        oaps project export state.parquet
+
+    Exit codes:
+        0: Export completed
+        3: State database not found
+        4: Output file could not be written
+    """
+    from oaps.utils import get_oaps_state_file
+    from oaps.utils._state_transfer import export_state
+
+    db_path = get_oaps_state_file()
+    if not db_path.exists():
+        exit_with_error(f"State database not found: {db_path}", ExitCode.NOT_FOUND)
+
+    try:
+        count = export_state(db_path, output, session_id=None, format=format)
+    except OSError as e:
+        exit_with_error(f"Failed to write {output}: {e}", ExitCode.IO_ERROR)
+    print(f"Exported {count} entries from project store to {output}")
+
+
+@app.command(name="import")
+def _import(
+    input: Path,
+    /,
+    format: Annotated[
+        TransferFormat | None,
+        Parameter(
+            name=["--format", "-f"],
+            help="File format (jsonl, parquet); inferred from extension by default",
+        ),
+    ] = None,
+    replace: Annotated[
+        bool, Parameter(help="Delete existing project entries before importing")
+    ] = False,
+) -> None:
+    """Import a JSONL or Parquet export into the project store
+
+    All rows are loaded in a single transaction: if the file is malformed,
+    nothing is written. Entries with the same key are overwritten, including
+    their timestamps and authors.
+
+    Examples:
+        oaps project import state.jsonl
+        oaps project import state.parquet --replace
+
+    Exit codes:
+        0: Import completed
+        2: Input file is malformed
+        3: Input file not found
+        4: Input file could not be read
+    """
+    from oaps.utils import get_oaps_state_file
+    from oaps.utils._state_transfer import import_state
+
+    if not input.is_file():
+        exit_with_error(f"File not found: {input}", ExitCode.NOT_FOUND)
+
+    db_path = get_oaps_state_file()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        count = import_state(
+            db_path,
+            input,
+            session_id=None,
+            format=format,
+            replace=replace,
+        )
+    except ValueError as e:
+        exit_with_error(f"Invalid export file: {e}", ExitCode.VALIDATION_ERROR)
+    except OSError as e:
+        exit_with_error(f"Failed to read {input}: {e}", ExitCode.IO_ERROR)
+    print(f"Imported {count} entries into project store")
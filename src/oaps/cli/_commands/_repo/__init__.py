@@ -12,8 +12,9 @@ if TYPE_CHECKING:
 from cyclopts import Parameter
 from rich.console import Console
 
+from oaps.config import load_storage_configuration
 from oaps.exceptions import OapsRepositoryNotInitializedError
-from oaps.repository import OapsRepository
+from oaps.repository import CheckpointScheduler, OapsRepository
 
 from ._app import app
 
@@ -106,6 +107,30 @@ def _commit(
         console.print(f"[dim]SHA: {result.sha}[/dim]")
 
 
+@app.command(name="flush")
+def _flush() -> None:
+    """Commit checkpoints queued by [storage] checkpoint_interval"""
+    console = Console()
+
+    with _get_repo() as repo:
+        interval = load_storage_configuration().checkpoint_interval
+        scheduler = CheckpointScheduler(repo, interval=interval)
+        pending = scheduler.pending()
+        results = scheduler.flush()
+
+        committed = [result for result in results if not result.no_changes]
+        if not committed:
+            console.print("[dim]Nothing to commit[/dim]")
+            return
+
+        console.print(
+            f"[green]Committed {len(pending)} queued checkpoint(s) "
+            f"in {len(committed)} commit(s)[/green]"
+        )
+        for result in committed:
+            console.print(f"[dim]SHA: {result.sha}[/dim]")
+
+
 @app.command(name="discard")
 def _discard(
     paths: Annotated[
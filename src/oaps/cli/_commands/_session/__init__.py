@@ -5,14 +5,15 @@
 from os import getenv
 from typing import TYPE_CHECKING, Annotated
 
-from cyclopts import App, Parameter
+from cyclopts import Parameter
+
+from . import _analyze as _analyze, _transfer as _transfer
+from ._app import app
 
 if TYPE_CHECKING:
     from oaps.utils import SQLiteStateStore, StateEntry, StateStoreValue
 
-app = App(
-    name="session", help="Manage session state (key-value store)", help_on_error=True
-)
+__all__ = ["app"]
 
 
 def _get_session_id_from_env() -> str | None:
@@ -0,0 +1,231 @@
+# pyright: reportUnusedCallResult=false, reportUnusedFunction=false
+# ruff: noqa: A002, D415, PLR0913, TC003
+"""Analyze subcommand for sessions - cross-session analytics with DuckDB."""
+
+import re
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated, Literal
+
+from cyclopts import Parameter
+
+from oaps.cli._commands._context import OutputFormat
+from oaps.cli._commands._shared import ExitCode, exit_with_error
+
+from ._app import app
+
+if TYPE_CHECKING:
+    from oaps.utils._state_analytics import QueryResult, StateAnalytics
+
+# Defined here rather than imported so the CLI does not load DuckDB at startup;
+# values mirror SessionMetric and TimeBucket in oaps.utils._state_analytics
+type AnalyzeReport = Literal["summary", "top", "tools", "timeline"]
+type SessionMetric = Literal[
+    "tools", "prompts", "subagents", "compactions", "permissions", "notifications"
+]
+type TimeBucket = Literal["hour", "day", "week", "month"]
+
+
+def _parse_time_filter(since: str | None) -> datetime | None:
+    """Parse a time filter string into a datetime.
+
+    Supports:
+    - Relative formats: "7d" (7 days), "2h" (2 hours), "30m" (30 minutes)
+    - Absolute formats: ISO 8601 dates like "2024-12-01" or "2024-12-01T10:30:00"
+
+    Args:
+        since: Time filter string, or None.
+
+    Returns:
+        datetime in UTC, or None if since is None.
+
+    Raises:
+        ValueError: If the format is invalid.
+    """
+    if since is None:
+        return None
+
+    relative_match = re.match(r"^(\d+)([dhm])$", since)
+    if relative_match:
+        amount = int(relative_match.group(1))
+        unit = relative_match.group(2)
+        now = datetime.now(UTC)
+        if unit == "d":
+            return now - timedelta(days=amount)
+        if unit == "h":
+            return now - timedelta(hours=amount)
+        return now - timedelta(minutes=amount)
+
+    try:
+        parsed = datetime.fromisoformat(since)
+    except ValueError:
+        msg = (
+            f"Invalid time format: {since!r}. "
+            "Use relative (7d, 2h, 30m) or absolute (2024-12-01) format."
+        )
+        raise ValueError(msg) from None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+def _format_cell(value: object) -> str:
+    """Format a query result cell for table output."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, float):
+        return f"{value:,.2f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return str(value)
+
+
+def _render_result(result: QueryResult, format: OutputFormat, title: str) -> None:
+    """Print a query result as a Rich table or JSON."""
+    if format == OutputFormat.JSON:
+        import orjson
+
+        print(
+            orjson.dumps(
+                result.to_dicts(), option=orjson.OPT_INDENT_2, default=str
+            ).decode("utf-8")
+        )
+        return
+
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+    if not result.rows:
+        console.print("[yellow]No matching session state.[/yellow]")
+        return
+
+    table = Table(title=title, show_header=True, header_style="bold")
+    for column in result.columns:
+        table.add_column(column)
+    for row in result.rows:
+        table.add_row(*(_format_cell(value) for value in row))
+    console.print(table)
+
+
+def _run_report(
+    analytics: StateAnalytics,
+    report: AnalyzeReport,
+    *,
+    by: SessionMetric,
+    bucket: TimeBucket,
+    limit: int,
+) -> tuple[QueryResult, str]:
+    """Run one of the canned reports and return it with a display title."""
+    if report == "top":
+        return analytics.top_sessions(by, limit=limit), f"Top sessions by {by}"
+    if report == "tools":
+        return analytics.tool_usage(limit=limit), "Tool usage across sessions"
+    if report == "timeline":
+        return analytics.timeline(bucket), f"Sessions per {bucket}"
+    return analytics.summary(), "Session summary"
+
+
+@app.command(name="analyze")
+def _analyze(
+    report: Annotated[
+        AnalyzeReport,
+        Parameter(help="Canned report: summary, top, tools, or timeline"),
+    ] = "summary",
+    /,
+    *,
+    sql: Annotated[
+        str | None,
+        Parameter(help="Ad-hoc DuckDB SQL over the 'state' and 'sessions' views"),
+    ] = None,
+    since: Annotated[
+        str | None,
+        Parameter(
+            name=["--since", "-s"],
+            help="Only include state updated since (e.g., 7d, 24h, 2024-12-01)",
+        ),
+    ] = None,
+    by: Annotated[
+        SessionMetric,
+        Parameter(help="Counter used to rank sessions for the 'top' report"),
+    ] = "tools",
+    bucket: Annotated[
+        TimeBucket,
+        Parameter(help="Time bucket width for the 'timeline' report"),
+    ] = "day",
+    limit: Annotated[int, Parameter(help="Maximum rows for ranked reports")] = 10,
+    snapshot: Annotated[
+        Path | None,
+        Parameter(help="Analyze a Parquet snapshot instead of the state database"),
+    ] = None,
+    write_snapshot: Annotated[
+        Path | None,
+        Parameter(help="Write a Parquet snapshot of session state and exit"),
+    ] = None,
+    format: Annotated[
+        OutputFormat,
+        Parameter(name=["--format", "-f"], help="Output format (text, json)"),
+    ] = OutputFormat.TEXT,
+) -> None:
+    """Analyze state across all sessions
+
+    Loads session-scoped rows of the unified state database into DuckDB and
+    runs vectorized aggregations over them. Two views are available to
+    --sql queries:
+
+    - state: session_id, key, value_type, num_value, text_value,
+      created_at, created_by, updated_at, updated_by
+    - sessions: one row per session with first_seen, last_seen, key_count,
+      tools, prompts, subagents, compactions, permissions, notifications
+
+    Examples:
+        oaps session analyze                          # Averages across sessions
+        oaps session analyze top --by subagents       # Most subagent spawns
+        oaps session analyze summary --since 7d       # This week only
+        oaps session analyze timeline --bucket week   # Sessions per week
+        oaps session analyze --sql "SELECT ..."       # Ad-hoc query
+        oaps session analyze --write-snapshot s.parquet
+
+    Exit codes:
+        0: Analysis completed successfully
+        2: Invalid filter or query
+        3: State database or snapshot not found
+    """
+    import duckdb
+
+    from oaps.utils import get_oaps_state_file
+    from oaps.utils._state_analytics import StateAnalytics, write_state_snapshot
+
+    try:
+        since_dt = _parse_time_filter(since)
+    except ValueError as e:
+        exit_with_error(str(e), ExitCode.VALIDATION_ERROR)
+
+    if snapshot is not None:
+        if not snapshot.exists():
+            exit_with_error(f"Snapshot not found: {snapshot}", ExitCode.NOT_FOUND)
+        analytics = StateAnalytics.from_parquet(snapshot)
+    else:
+        db_path = get_oaps_state_file()
+        if not db_path.exists():
+            exit_with_error(f"State database not found: {db_path}", ExitCode.NOT_FOUND)
+        if write_snapshot is not None:
+            count = write_state_snapshot(db_path, write_snapshot, since=since_dt)
+            print(f"Wrote {count} state entries to {write_snapshot}")
+            return
+        analytics = StateAnalytics.from_database(db_path, since=since_dt)
+
+    with analytics:
+        try:
+            if sql is not None:
+                result, title = analytics.query(sql), "Query result"
+            else:
+                result, title = _run_report(
+                    analytics, report, by=by, bucket=bucket, limit=limit
+                )
+        except duckdb.Error as e:
+            exit_with_error(f"Query failed: {e}", ExitCode.VALIDATION_ERROR)
+
+    _render_result(result, format, title)
@@ -0,0 +1,7 @@
+"""Cyclopts App definition for session commands."""
+
+from cyclopts import App
+
+app = App(
+    name="session", help="Manage session state (key-value store)", help_on_error=True
+)
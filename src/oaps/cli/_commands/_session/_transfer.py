@@ -0,0 +1,135 @@
+# pyright: reportUnusedCallResult=false, reportUnusedFunction=false
+# ruff: noqa: A002, D415, FBT002, TC003
+"""Export and import subcommands for session state."""
+
+from os import getenv
+from pathlib import Path
+from typing import Annotated, Literal
+
+from cyclopts import Parameter
+
+from oaps.cli._commands._shared import ExitCode, exit_with_error
+
+from ._app import app
+
+# Mirrors TransferFormat in oaps.utils._state_transfer so the CLI does not
+# load pyarrow at startup
+type TransferFormat = Literal["jsonl", "parquet"]
+
+
+def _resolve_session_id(session_id: str | None) -> str:
+    """Resolve the target session, exiting if none is available."""
+    effective_session_id = session_id or getenv("CLAUDE_SESSION_ID")
+    if not effective_session_id:
+        exit_with_error(
+            "No session ID provided and CLAUDE_SESSION_ID not set",
+            ExitCode.LOAD_ERROR,
+        )
+    return effective_session_id
+
+
+@app.command(name="export")
+def _export(
+    output: Path,
+    /,
+    session_id: Annotated[
+        str | None, Parameter(help="Session ID (defaults to CLAUDE_SESSION_ID env var)")
+    ] = None,
+    format: Annotated[
+        TransferFormat | None,
+        Parameter(
+            name=["--format", "-f"],
+            help="File format (jsonl, parquet); inferred from extension by default",
+        ),
+    ] = None,
+) -> None:
+    """Export a session store to JSONL or Parquet
+
+    Rows are streamed from the state database in batches, so memory use does
+    not depend on the size of the store. Values, timestamps and authors are
+    preserved exactly.
+
+    Examples:
+        oaps session export state.jsonl
+        oaps session export state.parquet --session-id abc123
+
+    Exit codes:
+        0: Export completed
+        1: No session ID available
+        3: State database not found
+        4: Output file could not be written
+    """
+    from oaps.utils import get_oaps_state_file
+    from oaps.utils._state_transfer import export_state
+
+    effective_session_id = _resolve_session_id(session_id)
+    db_path = get_oaps_state_file()
+    if not db_path.exists():
+        exit_with_error(f"State database not found: {db_path}", ExitCode.NOT_FOUND)
+
+    try:
+        count = export_state(
+            db_path, output, session_id=effective_session_id, format=format
+        )
+    except OSError as e:
+        exit_with_error(f"Failed to write {output}: {e}", ExitCode.IO_ERROR)
+    print(f"Exported {count} entries from session '{effective_session_id}' to {output}")
+
+
+@app.command(name="import")
+def _import(
+    input: Path,
+    /,
+    session_id: Annotated[
+        str | None, Parameter(help="Session ID (defaults to CLAUDE_SESSION_ID env var)")
+    ] = None,
+    format: Annotated[
+        TransferFormat | None,
+        Parameter(
+            name=["--format", "-f"],
+            help="File format (jsonl, parquet); inferred from extension by default",
+        ),
+    ] = None,
+    replace: Annotated[
+        bool, Parameter(help="Delete existing session entries before importing")
+    ] = False,
+) -> None:
+    """Import a JSONL or Parquet export into a session store
+
+    All rows are loaded in a single transaction: if the file is malformed,
+    nothing is written. Entries with the same key are overwritten, including
+    their timestamps and authors.
+
+    Examples:
+        oaps session import state.jsonl
+        oaps session import state.parquet --session-id abc123 --replace
+
+    Exit codes:
+        0: Import completed
+        1: No session ID available
+        2: Input file is malformed
+        3: Input file not found
+        4: Input file could not be read
+    """
+    from oaps.utils import get_oaps_state_file
+    from oaps.utils._state_transfer import import_state
+
+    effective_session_id = _resolve_session_id(session_id)
+    if not input.is_file():
+        exit_with_error(f"File not found: {input}", ExitCode.NOT_FOUND)
+
+    db_path = get_oaps_state_file()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        count = import_state(
+            db_path,
+            input,
+            session_id=effective_session_id,
+            format=format,
+            replace=replace,
+        )
+    except ValueError as e:
+        exit_with_error(f"Invalid export file: {e}", ExitCode.VALIDATION_ERROR)
+    except OSError as e:
+        exit_with_error(f"Failed to read {input}: {e}", ExitCode.IO_ERROR)
+    print(f"Imported {count} entries into session '{effective_session_id}'")
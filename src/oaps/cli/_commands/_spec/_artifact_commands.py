@@ -3,7 +3,7 @@
 """Artifact plumbing commands.
 
 This module provides commands for managing artifacts within specifications.
-Commands: add, update, rebuild, list, show, delete.
+Commands: add, update, rebuild, validate, list, show, delete.
 """
 
 from pathlib import Path
@@ -30,11 +30,13 @@ from ._helpers import (
     get_error_console,
     parse_qualified_id,
     rebuild_result_to_dict,
+    validation_issues_to_dict,
 )
 from ._output import (
     format_artifact_info,
     format_artifact_table,
     format_rebuild_result,
+    format_validation_table,
 )
 
 __all__ = [
@@ -44,6 +46,7 @@ __all__ = [
     "rebuild",
     "show",
     "update",
+    "validate",
 ]
 
 
@@ -229,6 +232,92 @@ def rebuild(
         exit_with_error(str(e), exit_code_for_exception(e))
 
 
+@artifact_app.command(name="validate")
+def validate(
+    spec_id: str,
+    /,
+    *,
+    strict: Annotated[
+        bool,
+        Parameter(name=["--strict"], help="Also report artifact number gaps"),
+    ] = False,
+    no_cache: Annotated[
+        bool,
+        Parameter(name=["--no-cache"], help="Re-validate unchanged artifacts"),
+    ] = False,
+    stats: Annotated[
+        bool,
+        Parameter(name=["--stats"], help="Report validation cache effectiveness"),
+    ] = False,
+    jobs: Annotated[
+        int | None,
+        Parameter(name=["--jobs", "-j"], help="Processes to validate with"),
+    ] = None,
+    report: Annotated[
+        Path | None,
+        Parameter(name=["--report"], help="Write errors to a .parquet or .jsonl file"),
+    ] = None,
+    format_: Annotated[
+        OutputFormat,
+        Parameter(name=["--format", "-f"], help="Output format"),
+    ] = OutputFormat.TABLE,
+) -> None:
+    """Validate the artifacts of a specification
+
+    Checks metadata, artifact types, and references. Results of artifacts
+    that did not change since the last run are reused from the validation
+    cache unless --no-cache is given. Changed artifacts are validated in
+    parallel when there are many of them.
+
+    Args:
+        spec_id: The specification ID.
+        strict: Also report gaps in artifact numbering.
+        no_cache: Validate every artifact and refresh its cached results.
+        stats: Report how many artifacts were served from the cache.
+        jobs: Number of processes; defaults to the available CPUs.
+        report: Also write the errors, sorted for diffing, to a Parquet
+            (.parquet) or JSON Lines file.
+        format_: Output format.
+    """
+    from ._helpers import output_result
+
+    try:
+        manager = get_artifact_manager()
+        issues = manager.validate_artifacts(
+            spec_id,
+            strict=strict,
+            use_cache=not no_cache,
+            workers=jobs,
+            report=report,
+        )
+    except SpecNotFoundError as e:
+        exit_with_error(str(e), exit_code_for_exception(e))
+
+    data = validation_issues_to_dict(issues)
+    cache_stats = manager.validation_cache.stats
+    if stats:
+        data["cache"] = {
+            "hits": cache_stats.hits,
+            "misses": cache_stats.misses,
+            "hit_rate": round(cache_stats.hit_rate, 4),
+        }
+
+    if format_ in (OutputFormat.TABLE, OutputFormat.TEXT):
+        output = format_validation_table(data.get("issues", []))
+        if stats:
+            output += (
+                f"\n\nCache: {cache_stats.hits} reused, {cache_stats.misses} "
+                f"validated ({cache_stats.hit_rate:.0%} hit rate)"
+            )
+    else:
+        output = output_result(data, format_)
+    print(output)
+
+    if data.get("error_count", 0) > 0:
+        raise SystemExit(ExitCode.VALIDATION_ERROR)
+    exit_with_success()
+
+
 @artifact_app.command(name="list")
 def list_artifacts(
     spec_id: str,
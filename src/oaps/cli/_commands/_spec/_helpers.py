@@ -18,8 +18,11 @@ if TYPE_CHECKING:
     from oaps.spec import (
         Artifact,
         ArtifactManager,
+        CoverageReport,
         HistoryEntry,
         HistoryManager,
+        ProgressReport,
+        QueryManager,
         RebuildResult,
         Requirement,
         SpecMetadata,
@@ -35,9 +38,11 @@ __all__ = [
     "ACTOR",
     "artifact_to_dict",
     "confirm_destructive",
+    "coverage_report_to_dict",
     "get_artifact_manager",
     "get_error_console",
     "get_history_manager",
+    "get_query_manager",
     "get_requirement_manager",
     "get_spec_manager",
     "get_test_manager",
@@ -47,6 +52,7 @@ __all__ = [
     "parse_qualified_id",
     "parse_time_filter",
     "print_spec_result",
+    "progress_report_to_dict",
     "rebuild_result_to_dict",
     "requirement_to_dict",
     "spec_to_dict",
@@ -706,3 +712,84 @@ def parse_time_filter(value: str | None) -> datetime | None:
         if parsed.tzinfo is None:
             parsed = parsed.replace(tzinfo=UTC)
         return parsed
+
+
+def get_query_manager() -> QueryManager:
+    """Get QueryManager configured from CLIContext.
+
+    Returns:
+        A configured QueryManager instance.
+    """
+    from oaps.spec import QueryManager
+
+    spec_manager = get_spec_manager()
+    requirement_manager = RequirementManager(spec_manager)
+    test_manager = TestManager(spec_manager, requirement_manager)
+    return QueryManager(spec_manager, requirement_manager, test_manager)
+
+
+def progress_report_to_dict(report: ProgressReport) -> SpecData:
+    """Convert ProgressReport model to output dictionary.
+
+    Args:
+        report: ProgressReport instance.
+
+    Returns:
+        Dictionary representation of the progress report.
+    """
+    return {
+        "spec_id": report.spec_id,
+        "total_requirements": report.total_requirements,
+        "implemented_requirements": report.implemented_requirements,
+        "verified_requirements": report.verified_requirements,
+        "overall_percentage": report.overall_percentage,
+        "by_type": [
+            {
+                "req_type": progress.req_type.value,
+                "total": progress.total,
+                "implemented": progress.implemented,
+                "verified": progress.verified,
+                "percentage": progress.percentage,
+            }
+            for progress in report.by_type
+        ],
+    }
+
+
+def coverage_report_to_dict(report: CoverageReport) -> SpecData:
+    """Convert CoverageReport model to output dictionary.
+
+    Args:
+        report: CoverageReport instance.
+
+    Returns:
+        Dictionary representation of the coverage report.
+    """
+    return {
+        "spec_id": report.spec_id,
+        "total_requirements": report.total_requirements,
+        "covered_requirements": report.covered_requirements,
+        "overall_coverage": report.overall_coverage,
+        "by_method": [
+            {
+                "method": coverage.method.value,
+                "total_tests": coverage.total_tests,
+                "passing_tests": coverage.passing_tests,
+                "requirements_covered": coverage.requirements_covered,
+            }
+            for coverage in report.by_method
+        ],
+        "by_type": [
+            {
+                "req_type": coverage.req_type.value,
+                "total_requirements": coverage.total_requirements,
+                "covered_requirements": coverage.covered_requirements,
+                "coverage_percentage": coverage.coverage_percentage,
+            }
+            for coverage in report.by_type
+        ],
+        "requirement_to_tests": {
+            req_id: list(test_ids)
+            for req_id, test_ids in report.requirement_to_tests.items()
+        },
+    }
@@ -2,6 +2,7 @@
 # ruff: noqa: PLR0912
 """Output formatters for spec commands."""
 
+from datetime import datetime
 from typing import Any
 
 from oaps.cli._commands._shared import format_json, format_table, format_yaml
@@ -13,13 +14,17 @@ __all__ = [
     "SpecData",
     "format_artifact_info",
     "format_artifact_table",
+    "format_coverage_report",
     "format_history_info",
     "format_history_table",
     "format_ids",
     "format_json",
+    "format_progress_report",
+    "format_query_table",
     "format_rebuild_result",
     "format_requirement_info",
     "format_requirement_table",
+    "format_search_table",
     "format_spec_info",
     "format_spec_table",
     "format_sync_result",
@@ -28,6 +33,7 @@ __all__ = [
     "format_test_table",
     "format_validation_table",
     "format_yaml",
+    "query_rows_to_dicts",
 ]
 
 
@@ -404,6 +410,87 @@ def format_artifact_table(artifacts: list[SpecData]) -> str:
     return format_table(headers, rows)
 
 
+def format_search_table(hits: list[SpecData]) -> str:
+    """Format search hits as table with Spec, Kind, ID, Title, Status columns.
+
+    Args:
+        hits: List of search hit dictionaries, best match first.
+
+    Returns:
+        Markdown table string representation.
+    """
+    headers = ["Spec", "Kind", "ID", "Title", "Status"]
+    rows = [
+        [
+            str(hit.get("spec_id", "")),
+            str(hit.get("kind", "")),
+            str(hit.get("id", "")),
+            str(hit.get("title", ""))[:50],
+            str(hit.get("status") or ""),
+        ]
+        for hit in hits
+    ]
+    return format_table(headers, rows)
+
+
+def _format_query_cell(value: object) -> str:
+    """Format a query result cell for table output."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(_format_query_cell(item) for item in value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _query_value(value: object) -> object:
+    """Convert a query result cell to a JSON- and YAML-safe value."""
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, list):
+        return [_query_value(item) for item in value]
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def query_rows_to_dicts(
+    columns: list[str], rows: list[tuple[object, ...]]
+) -> list[SpecData]:
+    """Convert spec query results to dictionaries for JSON or YAML output.
+
+    Args:
+        columns: Result column names.
+        rows: Result rows, in column order.
+
+    Returns:
+        One dictionary per row, keyed by column name.
+    """
+    return [
+        {
+            column: _query_value(value)
+            for column, value in zip(columns, row, strict=True)
+        }
+        for row in rows
+    ]
+
+
+def format_query_table(columns: list[str], rows: list[tuple[object, ...]]) -> str:
+    """Format spec query results as table with one column per result column.
+
+    Args:
+        columns: Result column names.
+        rows: Result rows, in column order.
+
+    Returns:
+        Markdown table string representation.
+    """
+    return format_table(
+        columns, [[_format_query_cell(value) for value in row] for row in rows]
+    )
+
+
 def format_artifact_info(artifact: SpecData) -> str:
     """Format single artifact as detailed info block.
 
@@ -579,3 +666,87 @@ def format_history_info(entry: SpecData) -> str:
         lines.append(f"Reason:     {entry.get('reason', '')}")
 
     return "\n".join(lines)
+
+
+def format_progress_report(report: SpecData) -> str:
+    """Format a progress report as summary block and table by type.
+
+    Args:
+        report: ProgressReport dictionary.
+
+    Returns:
+        Human-readable progress report.
+    """
+    implemented = report.get("implemented_requirements", 0)
+    percentage = report.get("overall_percentage", 0.0)
+    lines = [
+        f"Progress of {report.get('spec_id', '')}:",
+        f"  Requirements: {report.get('total_requirements', 0)}",
+        f"  Implemented:  {implemented} ({percentage:.1f}%)",
+        f"  Verified:     {report.get('verified_requirements', 0)}",
+    ]
+
+    by_type = report.get("by_type", [])
+    if by_type:
+        headers = ["Type", "Total", "Implemented", "Verified", "Progress"]
+        rows = [
+            [
+                str(row.get("req_type", "")),
+                str(row.get("total", 0)),
+                str(row.get("implemented", 0)),
+                str(row.get("verified", 0)),
+                f"{row.get('percentage', 0.0):.1f}%",
+            ]
+            for row in by_type
+        ]
+        lines.extend(["", format_table(headers, rows)])
+
+    return "\n".join(lines)
+
+
+def format_coverage_report(report: SpecData) -> str:
+    """Format a coverage report as summary block and tables by method and type.
+
+    Args:
+        report: CoverageReport dictionary.
+
+    Returns:
+        Human-readable coverage report.
+    """
+    covered = report.get("covered_requirements", 0)
+    percentage = report.get("overall_coverage", 0.0)
+    lines = [
+        f"Coverage of {report.get('spec_id', '')}:",
+        f"  Requirements: {report.get('total_requirements', 0)}",
+        f"  Covered:      {covered} ({percentage:.1f}%)",
+    ]
+
+    by_method = report.get("by_method", [])
+    if by_method:
+        headers = ["Method", "Tests", "Passing", "Requirements Covered"]
+        rows = [
+            [
+                str(row.get("method", "")),
+                str(row.get("total_tests", 0)),
+                str(row.get("passing_tests", 0)),
+                str(row.get("requirements_covered", 0)),
+            ]
+            for row in by_method
+        ]
+        lines.extend(["", format_table(headers, rows)])
+
+    by_type = report.get("by_type", [])
+    if by_type:
+        headers = ["Type", "Requirements", "Covered", "Coverage"]
+        rows = [
+            [
+                str(row.get("req_type", "")),
+                str(row.get("total_requirements", 0)),
+                str(row.get("covered_requirements", 0)),
+                f"{row.get('coverage_percentage', 0.0):.1f}%",
+            ]
+            for row in by_type
+        ]
+        lines.extend(["", format_table(headers, rows)])
+
+    return "\n".join(lines)
@@ -1,13 +1,14 @@
 # pyright: reportUnusedCallResult=false, reportUnusedFunction=false, reportAny=false
 # pyright: reportUnknownMemberType=false
-# ruff: noqa: D415, FBT002, PLR0913
+# ruff: noqa: D415, FBT002, PLR0913, TC003
 """Porcelain commands for specification management.
 
 This module provides user-facing commands for creating, updating, listing,
 and managing specifications.
 """
 
-from typing import Annotated
+from pathlib import Path
+from typing import Annotated, Literal
 
 from cyclopts import Parameter
 
@@ -26,23 +27,47 @@ from ._errors import exit_code_for_exception
 from ._helpers import (
     ACTOR,
     confirm_destructive,
+    coverage_report_to_dict,
     get_error_console,
+    get_query_manager,
     get_spec_manager,
     output_list_result,
     output_result,
     print_spec_result,
+    progress_report_to_dict,
     spec_to_dict,
     validation_issues_to_dict,
 )
-from ._output import format_spec_table, format_validation_table
+from ._output import (
+    format_coverage_report,
+    format_ids,
+    format_json,
+    format_progress_report,
+    format_query_table,
+    format_search_table,
+    format_spec_table,
+    format_validation_table,
+    format_yaml,
+    query_rows_to_dicts,
+)
+
+SearchKind = Literal["spec", "requirement", "test", "document", "artifact"]
+SearchFieldName = Literal["title", "tags", "body"]
+QueryKind = Literal["requirements", "tests"]
+ExportFormat = Literal["parquet"]
 
 __all__ = [
     "archive",
+    "coverage",
     "create",
     "delete",
+    "export",
     "info",
     "list_specs",
+    "progress",
+    "query",
     "rename",
+    "search",
     "update",
     "validate",
 ]
@@ -384,6 +409,118 @@ def info(
         exit_with_error(str(e), exit_code_for_exception(e))
 
 
+def _verify_counters(spec_id: str) -> bool:
+    """Check the stored progress and coverage counters against a full scan.
+
+    Wrong counters are repaired and reported on stderr.
+
+    Args:
+        spec_id: The specification ID.
+
+    Returns:
+        True if the stored counters were correct.
+    """
+    differences = get_spec_manager().verify_aggregates(spec_id)
+    if not differences:
+        return True
+    console = get_error_console()
+    console.print(
+        f"[yellow]Warning:[/yellow] Recomputed stale counters of {spec_id}: "
+        + ", ".join(differences)
+    )
+    return False
+
+
+@app.command(name="progress")
+def progress(
+    spec_id: str,
+    /,
+    recompute: Annotated[
+        bool,
+        Parameter(
+            name=["--recompute"],
+            help="Recompute the counters from all requirements and tests",
+        ),
+    ] = False,
+    format_: Annotated[
+        OutputFormat,
+        Parameter(name=["--format", "-f"], help="Output format"),
+    ] = OutputFormat.TABLE,
+) -> None:
+    """Show implementation progress of a specification
+
+    Reads the counters stored in the spec index. With --recompute, scans
+    all requirements and tests instead, repairs the stored counters, and
+    exits with a validation error if they were out of date.
+
+    Args:
+        spec_id: The specification ID.
+        recompute: Recompute and verify the stored counters.
+        format_: Output format.
+    """
+    try:
+        correct = _verify_counters(spec_id) if recompute else True
+        report = get_query_manager().progress(spec_id, recompute=recompute)
+    except SpecNotFoundError as e:
+        exit_with_error(str(e), exit_code_for_exception(e))
+
+    data = progress_report_to_dict(report)
+    if format_ == OutputFormat.TABLE:
+        output = format_progress_report(data)
+    else:
+        output = output_result(data, format_, id_field="spec_id")
+    print(output)
+
+    if not correct:
+        raise SystemExit(ExitCode.VALIDATION_ERROR)
+    exit_with_success()
+
+
+@app.command(name="coverage")
+def coverage(
+    spec_id: str,
+    /,
+    recompute: Annotated[
+        bool,
+        Parameter(
+            name=["--recompute"],
+            help="Recompute the counters from all requirements and tests",
+        ),
+    ] = False,
+    format_: Annotated[
+        OutputFormat,
+        Parameter(name=["--format", "-f"], help="Output format"),
+    ] = OutputFormat.TABLE,
+) -> None:
+    """Show test coverage of a specification
+
+    Reads the counters stored in the spec index. With --recompute, scans
+    all requirements and tests instead, repairs the stored counters, and
+    exits with a validation error if they were out of date.
+
+    Args:
+        spec_id: The specification ID.
+        recompute: Recompute and verify the stored counters.
+        format_: Output format.
+    """
+    try:
+        correct = _verify_counters(spec_id) if recompute else True
+        report = get_query_manager().coverage(spec_id, recompute=recompute)
+    except SpecNotFoundError as e:
+        exit_with_error(str(e), exit_code_for_exception(e))
+
+    data = coverage_report_to_dict(report)
+    if format_ == OutputFormat.TABLE:
+        output = format_coverage_report(data)
+    else:
+        output = output_result(data, format_, id_field="spec_id")
+    print(output)
+
+    if not correct:
+        raise SystemExit(ExitCode.VALIDATION_ERROR)
+    exit_with_success()
+
+
 @app.command(name="list")
 def list_specs(
     *,
@@ -462,3 +599,262 @@ def list_specs(
 
     print(output)
     exit_with_success()
+
+
+@app.command(name="search")
+def search(
+    query: str,
+    /,
+    *,
+    kind: Annotated[
+        list[SearchKind] | None,
+        Parameter(name=["--kind", "-k"], help="Document kinds to search"),
+    ] = None,
+    spec_id: Annotated[
+        str | None,
+        Parameter(name=["--spec"], help="Only search this specification"),
+    ] = None,
+    status: Annotated[
+        str | None,
+        Parameter(name=["--status", "-s"], help="Filter by status"),
+    ] = None,
+    field: Annotated[
+        list[SearchFieldName] | None,
+        Parameter(name=["--field"], help="Fields to match (default: all)"),
+    ] = None,
+    limit: Annotated[
+        int,
+        Parameter(name=["--limit", "-n"], help="Maximum number of results"),
+    ] = 20,
+    format_: Annotated[
+        OutputFormat,
+        Parameter(name=["--format", "-f"], help="Output format"),
+    ] = OutputFormat.TABLE,
+) -> None:
+    """Full-text search across specs, requirements, tests, and artifacts
+
+    Every word of the query must match the start of a word in a document's
+    title, tags, or text. Results are ranked by relevance.
+
+    Args:
+        query: Words to search for.
+        kind: Document kinds to search (spec, requirement, test, document,
+            artifact). Defaults to all.
+        spec_id: Only search documents of this specification.
+        status: Filter by status.
+        field: Fields to match (title, tags, body). Defaults to all.
+        limit: Maximum number of results.
+        format_: Output format.
+    """
+    manager = get_spec_manager()
+    try:
+        hits = manager.search(
+            query,
+            kinds=list(kind) if kind else None,
+            spec_id=spec_id,
+            status=status,
+            fields=list(field) if field else None,
+            limit=limit,
+        )
+    except ValueError as e:
+        exit_with_error(str(e), ExitCode.VALIDATION_ERROR)
+
+    results = [
+        {
+            "spec_id": hit.scope,
+            "kind": hit.kind,
+            "id": hit.doc_id,
+            "title": hit.title,
+            "status": hit.status,
+            "type": hit.doc_type,
+            "path": hit.source,
+            "score": round(-hit.score, 4),
+            "snippet": hit.snippet,
+        }
+        for hit in hits
+    ]
+
+    if format_ == OutputFormat.JSON:
+        output = format_json({"query": query, "results": results})
+    elif format_ == OutputFormat.YAML:
+        output = format_yaml({"query": query, "results": results})
+    elif format_ in (OutputFormat.PLAIN, OutputFormat.TEXT):
+        output = format_ids([hit.doc_id for hit in hits])
+    elif not results:
+        output = f"No results for '{query}'"
+    else:
+        output = format_search_table(results)
+
+    print(output)
+    exit_with_success()
+
+
+@app.command(name="query")
+def query(
+    kind: QueryKind = "requirements",
+    /,
+    *,
+    spec_id: Annotated[
+        list[str] | None,
+        Parameter(name=["--spec"], help="Only query these specifications"),
+    ] = None,
+    status: Annotated[
+        list[str] | None,
+        Parameter(name=["--status", "-s"], help="Filter by status"),
+    ] = None,
+    req_type: Annotated[
+        list[str] | None,
+        Parameter(name=["--type"], help="Filter requirements by type"),
+    ] = None,
+    method: Annotated[
+        list[str] | None,
+        Parameter(name=["--method"], help="Filter tests by method"),
+    ] = None,
+    tag: Annotated[
+        list[str] | None,
+        Parameter(name=["--tag"], help="Only items with all of these tags"),
+    ] = None,
+    untested: Annotated[
+        bool,
+        Parameter(name=["--untested"], help="Only requirements without tests"),
+    ] = False,
+    requirement: Annotated[
+        str | None,
+        Parameter(name=["--requirement"], help="Only tests of this requirement"),
+    ] = None,
+    sql: Annotated[
+        str | None,
+        Parameter(name=["--sql"], help="Run a DuckDB SQL query instead"),
+    ] = None,
+    no_mirror: Annotated[
+        bool,
+        Parameter(name=["--no-mirror"], help="Read the JSON files directly"),
+    ] = False,
+    limit: Annotated[
+        int | None,
+        Parameter(name=["--limit", "-n"], help="Maximum number of rows"),
+    ] = None,
+    format_: Annotated[
+        OutputFormat,
+        Parameter(name=["--format", "-f"], help="Output format"),
+    ] = OutputFormat.TABLE,
+) -> None:
+    """Query requirements or tests across all specifications
+
+    Loads the requirements and tests of every specification into DuckDB,
+    from a Parquet mirror in .cache/query/ that is refreshed when a spec file
+    changes. With --sql, runs the given query against the specs,
+    requirements, and tests views instead of the filters.
+
+    Args:
+        kind: What to query (requirements, tests).
+        spec_id: Only query these specifications.
+        status: Filter by status.
+        req_type: Filter requirements by type.
+        method: Filter tests by method.
+        tag: Only items with all of these tags.
+        untested: Only requirements that no test verifies.
+        requirement: Only tests of this requirement ID.
+        sql: DuckDB SQL query to run instead of the filters.
+        no_mirror: Read the JSON files directly instead of the Parquet mirror.
+        limit: Maximum number of rows.
+        format_: Output format.
+    """
+    import duckdb
+
+    from oaps.spec._query_engine import SpecQueryEngine
+
+    base_path = get_spec_manager().base_path
+    try:
+        engine = (
+            SpecQueryEngine.from_files(base_path)
+            if no_mirror
+            else SpecQueryEngine.from_mirror(base_path)
+        )
+        with engine:
+            if sql is not None:
+                result = engine.query(sql)
+            elif kind == "tests":
+                result = engine.find_tests(
+                    spec_ids=spec_id,
+                    statuses=status,
+                    methods=method,
+                    tags=tag,
+                    requirement=requirement,
+                    limit=limit,
+                )
+            else:
+                result = engine.find_requirements(
+                    spec_ids=spec_id,
+                    statuses=status,
+                    req_types=req_type,
+                    tags=tag,
+                    untested=untested,
+                    limit=limit,
+                )
+    except duckdb.Error as e:
+        exit_with_error(f"Query failed: {e}", ExitCode.VALIDATION_ERROR)
+
+    if format_ in (OutputFormat.JSON, OutputFormat.YAML):
+        data = {
+            "columns": result.columns,
+            "results": query_rows_to_dicts(result.columns, result.rows),
+        }
+        output = (
+            format_json(data) if format_ == OutputFormat.JSON else format_yaml(data)
+        )
+    elif format_ in (OutputFormat.PLAIN, OutputFormat.TEXT) and "id" in result.columns:
+        position = result.columns.index("id")
+        output = format_ids([str(row[position]) for row in result.rows])
+    elif not result.rows:
+        output = f"No matching {kind}"
+    else:
+        output = format_query_table(result.columns, result.rows)
+
+    print(output)
+    exit_with_success()
+
+
+@app.command(name="export")
+def export(
+    output: Path,
+    /,
+    *,
+    format_: Annotated[
+        ExportFormat,
+        Parameter(name=["--format", "-f"], help="File format (parquet)"),
+    ] = "parquet",
+    full: Annotated[
+        bool,
+        Parameter(name=["--full"], help="Rewrite every spec, not only changed ones"),
+    ] = False,
+) -> None:
+    """Export all specifications as Parquet tables
+
+    Writes the specs, requirements, tests, artifacts, relationships, and
+    history tables to OUTPUT, with one Parquet file per specification in
+    each table's directory. Specifications whose files did not change since
+    the last export into OUTPUT are skipped unless --full is given.
+
+    Query the tables with DuckDB or polars, e.g.:
+        SELECT status, count(*) FROM 'OUTPUT/tests/*.parquet' GROUP BY 1
+
+    Args:
+        output: Directory to write the tables to.
+        format_: File format.
+        full: Rewrite every specification.
+    """
+    from oaps.spec._export import export_specs
+
+    _ = format_  # Parquet is the only format
+    base_path = get_spec_manager().base_path
+    try:
+        result = export_specs(base_path, output, full=full)
+    except OSError as e:
+        exit_with_error(f"Failed to write {output}: {e}", ExitCode.IO_ERROR)
+
+    print(
+        f"Exported {len(result.exported)} specs to {output} "
+        f"({len(result.unchanged)} unchanged, {len(result.removed)} removed)"
+    )
+    exit_with_success()
@@ -1,11 +1,12 @@
 # pyright: reportUnusedCallResult=false, reportUnusedFunction=false, reportAny=false
-# ruff: noqa: D415, PLR0913, TC001
+# ruff: noqa: D415, PLR0913, TC003
 """Requirement plumbing commands.
 
 This module provides commands for managing requirements within specifications.
-Commands: add, update, link, list, show, delete.
+Commands: add, update, link, list, show, delete, import.
 """
 
+from pathlib import Path
 from typing import Annotated
 
 from cyclopts import Parameter
@@ -14,10 +15,12 @@ from oaps.cli._commands._context import OutputFormat
 from oaps.cli._commands._shared import ExitCode, exit_with_error, exit_with_success
 from oaps.exceptions import (
     RequirementNotFoundError,
+    SpecIOError,
     SpecNotFoundError,
+    SpecParseError,
     SpecValidationError,
 )
-from oaps.spec import RequirementStatus, RequirementType
+from oaps.spec import RequirementStatus, RequirementType, read_import_records
 
 from ._errors import exit_code_for_exception
 from ._helpers import (
@@ -25,10 +28,12 @@ from ._helpers import (
     confirm_destructive,
     get_error_console,
     get_requirement_manager,
+    output_result,
     parse_qualified_id,
     requirement_to_dict,
 )
 from ._output import (
+    format_ids,
     format_requirement_info,
     format_requirement_table,
 )
@@ -37,6 +42,7 @@ from ._req_app import req_app
 __all__ = [
     "add",
     "delete",
+    "import_requirements",
     "link",
     "list_requirements",
     "show",
@@ -394,6 +400,55 @@ def delete(
         exit_with_error(str(e), exit_code_for_exception(e))
 
 
+@req_app.command(name="import")
+def import_requirements(
+    spec_id: str,
+    path: Path,
+    /,
+    *,
+    format_: Annotated[
+        OutputFormat,
+        Parameter(name=["--format", "-f"], help="Output format"),
+    ] = OutputFormat.TABLE,
+) -> None:
+    """Import requirements from a JSON Lines or CSV file
+
+    Each record holds the fields of 'req add': req_type and title are
+    required; description, rationale, acceptance_criteria, depends_on, tags,
+    parent, and the other requirement fields are optional. CSV files need a
+    header row and separate list values with semicolons. All records are
+    checked first, then added in one batch with a single commit.
+
+    Args:
+        spec_id: The specification ID.
+        path: Path to a .jsonl or .csv file of requirement records.
+        format_: Output format.
+    """
+    try:
+        records = read_import_records(path)
+        manager = get_requirement_manager()
+        requirements = manager.import_requirements(spec_id, records, actor=ACTOR)
+    except (
+        SpecNotFoundError,
+        RequirementNotFoundError,
+        SpecValidationError,
+        SpecIOError,
+        SpecParseError,
+    ) as e:
+        exit_with_error(str(e), exit_code_for_exception(e))
+
+    req_dicts = [requirement_to_dict(r) for r in requirements]
+    if format_ == OutputFormat.TABLE:
+        output = format_requirement_table(req_dicts)
+    elif format_ in (OutputFormat.PLAIN, OutputFormat.TEXT):
+        output = format_ids([r.id for r in requirements])
+    else:
+        output = output_result({"requirements": req_dicts}, format_)
+
+    print(output)
+    exit_with_success()
+
+
 def _print_requirement_result(data: dict[str, object], format_: OutputFormat) -> None:
     """Print requirement result and exit with success.
 
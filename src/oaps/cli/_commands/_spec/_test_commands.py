@@ -4,7 +4,7 @@
 """Test plumbing commands.
 
 This module provides commands for managing tests within specifications.
-Commands: add, update, link, list, show, delete, sync.
+Commands: add, update, link, list, show, delete, sync, import.
 """
 
 import json
@@ -17,11 +17,19 @@ from oaps.cli._commands._context import OutputFormat
 from oaps.cli._commands._shared import ExitCode, exit_with_error, exit_with_success
 from oaps.exceptions import (
     RequirementNotFoundError,
+    SpecIOError,
     SpecNotFoundError,
+    SpecParseError,
     SpecValidationError,
     TestNotFoundError,
 )
-from oaps.spec import PytestResults, PytestTest, TestMethod, TestStatus
+from oaps.spec import (
+    PytestResults,
+    TestMethod,
+    TestStatus,
+    iter_report_results,
+    read_import_records,
+)
 
 from ._errors import exit_code_for_exception
 from ._helpers import (
@@ -29,11 +37,13 @@ from ._helpers import (
     confirm_destructive,
     get_error_console,
     get_test_manager,
+    output_result,
     parse_qualified_id,
     sync_result_to_dict,
     test_to_dict,
 )
 from ._output import (
+    format_ids,
     format_sync_result,
     format_test_info,
     format_test_table,
@@ -43,6 +53,7 @@ from ._test_app import test_app
 __all__ = [
     "add",
     "delete",
+    "import_tests",
     "link",
     "list_tests",
     "show",
@@ -473,6 +484,55 @@ def sync(
         exit_with_error(str(e), exit_code_for_exception(e))
 
 
+@test_app.command(name="import")
+def import_tests(
+    spec_id: str,
+    path: Path,
+    /,
+    *,
+    format_: Annotated[
+        OutputFormat,
+        Parameter(name=["--format", "-f"], help="Output format"),
+    ] = OutputFormat.TABLE,
+) -> None:
+    """Import tests from a JSON Lines or CSV file
+
+    Each record holds the fields of 'test add': method, title, and
+    tests_requirements are required; description, file, function, and tags
+    are optional. CSV files need a header row and separate list values with
+    semicolons. All records are checked first, then added in one batch with
+    a single commit.
+
+    Args:
+        spec_id: The specification ID.
+        path: Path to a .jsonl or .csv file of test records.
+        format_: Output format.
+    """
+    try:
+        records = read_import_records(path)
+        manager = get_test_manager()
+        tests = manager.import_tests(spec_id, records, actor=ACTOR)
+    except (
+        SpecNotFoundError,
+        RequirementNotFoundError,
+        SpecValidationError,
+        SpecIOError,
+        SpecParseError,
+    ) as e:
+        exit_with_error(str(e), exit_code_for_exception(e))
+
+    test_dicts = [test_to_dict(t) for t in tests]
+    if format_ == OutputFormat.TABLE:
+        output = format_test_table(test_dicts)
+    elif format_ in (OutputFormat.PLAIN, OutputFormat.TEXT):
+        output = format_ids([t.id for t in tests])
+    else:
+        output = output_result({"tests": test_dicts}, format_)
+
+    print(output)
+    exit_with_success()
+
+
 def _read_pytest_json(path: Path) -> dict[str, object]:
     """Read and parse pytest JSON report file.
 
@@ -499,40 +559,7 @@ def _transform_pytest_results(data: dict[str, object]) -> PytestResults:
     Returns:
         PytestResults model instance.
     """
-    tests_data = data.get("tests", [])
-    tests: list[PytestTest] = []
-
-    if isinstance(tests_data, list):
-        for test_entry in tests_data:
-            if not isinstance(test_entry, dict):
-                continue
-
-            node_id = test_entry.get("nodeid", "")
-            outcome = test_entry.get("outcome", "")
-            duration_val = test_entry.get("duration", 0.0)
-
-            # Extract error message from call.longrepr if present
-            message: str | None = None
-            call_data = test_entry.get("call")
-            if isinstance(call_data, dict):
-                longrepr = call_data.get("longrepr")
-                if isinstance(longrepr, str):
-                    message = longrepr
-
-            # Parse duration with type narrowing
-            test_duration: float = 0.0
-            if isinstance(duration_val, (int, float)):
-                test_duration = float(duration_val)
-
-            if isinstance(node_id, str) and isinstance(outcome, str):
-                tests.append(
-                    PytestTest(
-                        node_id=node_id,
-                        outcome=outcome,
-                        duration=test_duration,
-                        message=message,
-                    )
-                )
+    tests = tuple(iter_report_results(data))
 
     # Parse top-level duration and exit_code with type narrowing
     duration_raw = data.get("duration", 0.0)
@@ -546,7 +573,7 @@ def _transform_pytest_results(data: dict[str, object]) -> PytestResults:
         exit_code = exit_code_raw
 
     return PytestResults(
-        tests=tuple(tests),
+        tests=tests,
         duration=total_duration,
         exit_code=exit_code,
     )
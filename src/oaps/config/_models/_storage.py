@@ -13,6 +13,13 @@ class StorageConfiguration(BaseModel):
 
     Attributes:
         log_level: Log level for state store operation logging.
+        write_journal: Defer hook state writes that cannot get the database
+            lock to a journal instead of failing. Journaled writes are merged
+            by the next hook invocation.
+        checkpoint_interval: Minimum seconds between checkpoint commits of
+            one workflow. Checkpoints made sooner are queued and committed
+            together by the next due checkpoint or the Stop and SessionEnd
+            hooks. 0 commits every checkpoint immediately.
     """
 
     model_config: ClassVar[ConfigDict] = ConfigDict(frozen=True, extra="ignore")
@@ -21,3 +28,18 @@ class StorageConfiguration(BaseModel):
         default="info",
         description="Log level for state store operation logging.",
     )
+    write_journal: bool = Field(
+        default=False,
+        description=(
+            "Defer hook state writes that cannot get the database lock "
+            "to a journal merged by the next hook."
+        ),
+    )
+    checkpoint_interval: float = Field(
+        default=0.0,
+        ge=0.0,
+        description=(
+            "Minimum seconds between checkpoint commits of one workflow; "
+            "sooner checkpoints are coalesced into the next commit."
+        ),
+    )
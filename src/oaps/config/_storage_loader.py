@@ -39,29 +39,85 @@ def _extract_storage_log_level(
     return None
 
 
-def _load_storage_log_level_from_file(path: Path, current: str) -> str:
-    """Load log_level from a config file if it exists and contains a valid value.
+def _extract_storage_write_journal(
+    data: dict[str, Any],  # pyright: ignore[reportExplicitAny]
+) -> bool | None:
+    """Extract write_journal from TOML data dictionary.
+
+    Checks [storage] section for write_journal setting.
+
+    Args:
+        data: Parsed TOML dictionary.
+
+    Returns:
+        The write_journal flag if found, None otherwise.
+    """
+    if "storage" in data and isinstance(data["storage"], dict):
+        storage_section: dict[str, Any] = data["storage"]  # pyright: ignore[reportExplicitAny]
+        write_journal: Any = storage_section.get("write_journal")  # pyright: ignore[reportExplicitAny]
+        if isinstance(write_journal, bool):
+            return write_journal
+
+    return None
+
+
+def _extract_storage_checkpoint_interval(
+    data: dict[str, Any],  # pyright: ignore[reportExplicitAny]
+) -> float | None:
+    """Extract checkpoint_interval from TOML data dictionary.
+
+    Checks [storage] section for checkpoint_interval setting.
+
+    Args:
+        data: Parsed TOML dictionary.
+
+    Returns:
+        The checkpoint_interval in seconds if found and not negative, None
+        otherwise.
+    """
+    if "storage" in data and isinstance(data["storage"], dict):
+        storage_section: dict[str, Any] = data["storage"]  # pyright: ignore[reportExplicitAny]
+        interval: Any = storage_section.get("checkpoint_interval")  # pyright: ignore[reportExplicitAny]
+        if isinstance(interval, int | float) and not isinstance(interval, bool):
+            return float(interval) if interval >= 0 else None
+
+    return None
+
+
+def _load_storage_settings_from_file(
+    path: Path, *, log_level: str, write_journal: bool, checkpoint_interval: float
+) -> tuple[str, bool, float]:
+    """Load storage settings from a config file if it exists.
 
     Args:
         path: Path to the config file.
-        current: Current log_level value to return if file doesn't exist
-            or has no setting.
+        log_level: Current log_level value to keep if the file has no setting.
+        write_journal: Current write_journal value to keep if the file has
+            no setting.
+        checkpoint_interval: Current checkpoint_interval value to keep if the
+            file has no setting.
 
     Returns:
-        The log_level from the file, or current if not found.
+        Tuple of (log_level, write_journal, checkpoint_interval) after
+        applying the file.
     """
+    current = (log_level, write_journal, checkpoint_interval)
     if not path.is_file():
         return current
 
     try:
         data = read_toml_file(path)
-        extracted = _extract_storage_log_level(data)
-        if extracted is not None:
-            return extracted
     except ConfigLoadError:
-        pass
+        return current
 
-    return current
+    extracted_level = _extract_storage_log_level(data)
+    extracted_journal = _extract_storage_write_journal(data)
+    extracted_interval = _extract_storage_checkpoint_interval(data)
+    return (
+        extracted_level if extracted_level is not None else log_level,
+        extracted_journal if extracted_journal is not None else write_journal,
+        extracted_interval if extracted_interval is not None else checkpoint_interval,
+    )
 
 
 def load_storage_configuration(
@@ -72,7 +128,7 @@ def load_storage_configuration(
 
     Main entry point for storage configuration. Discovers and loads
     configuration from all sources in precedence order, returning
-    a StorageConfiguration with the highest-precedence log_level.
+    a StorageConfiguration with the highest-precedence settings.
 
     Args:
         project_root: Project root directory. If None, auto-detect
@@ -81,40 +137,44 @@ def load_storage_configuration(
             included for consistency with hooks loader).
 
     Returns:
-        StorageConfiguration with log_level.
-
-    Sources (lowest to highest precedence for log_level):
-        1. Default ("info")
-        2. User config (~/.config/oaps/config.toml [storage] log_level)
-        3. Project config (.oaps/oaps.toml [storage] log_level)
-        4. Local overrides (.oaps/oaps.local.toml [storage] log_level)
-        5. Worktree config (.git/oaps.toml [storage] log_level)
+        StorageConfiguration with log_level, write_journal, and
+        checkpoint_interval.
+
+    Sources (lowest to highest precedence for each [storage] setting):
+        1. Defaults (log_level "info", write_journal false,
+           checkpoint_interval 0)
+        2. User config (~/.config/oaps/config.toml)
+        3. Project config (.oaps/oaps.toml)
+        4. Local overrides (.oaps/oaps.local.toml)
+        5. Worktree config (.git/oaps.toml)
     """
     # Suppress unused logger warning - kept for API consistency
     _ = logger
 
-    # Determine log_level from config sources (highest precedence wins)
+    # Determine settings from config sources (highest precedence wins)
     log_level: str = "info"  # Default
+    write_journal = False  # Default
+    checkpoint_interval = 0.0  # Default
 
     resolved_root = project_root if project_root else find_project_root()
 
-    # Check user config
-    log_level = _load_storage_log_level_from_file(get_user_config_path(), log_level)
-
+    paths = [get_user_config_path()]
     if resolved_root:
         oaps_dir = resolved_root / ".oaps"
-
-        # Check project config, local overrides, and worktree in precedence order
-        log_level = _load_storage_log_level_from_file(oaps_dir / "oaps.toml", log_level)
-        log_level = _load_storage_log_level_from_file(
-            oaps_dir / "oaps.local.toml", log_level
-        )
-
+        paths.extend([oaps_dir / "oaps.toml", oaps_dir / "oaps.local.toml"])
         git_dir = get_git_dir(resolved_root)
         if git_dir:
-            log_level = _load_storage_log_level_from_file(
-                git_dir / "oaps.toml", log_level
+            paths.append(git_dir / "oaps.toml")
+
+    for path in paths:
+        log_level, write_journal, checkpoint_interval = (
+            _load_storage_settings_from_file(
+                path,
+                log_level=log_level,
+                write_journal=write_journal,
+                checkpoint_interval=checkpoint_interval,
             )
+        )
 
     # Validate log_level
     valid_levels = {"error", "warning", "info", "debug"}
@@ -124,4 +184,6 @@ def load_storage_configuration(
 
     return StorageConfiguration(
         log_level=log_level,  # pyright: ignore[reportArgumentType]
+        write_journal=write_journal,
+        checkpoint_interval=checkpoint_interval,
     )
@@ -118,6 +118,7 @@ def _run_hook_cli() -> None:
             hook_logger,
             session_logger,
             storage_logger,
+            write_journal=storage_config.write_journal,
         )
         hook_logger.info(
             "hook_completed",
@@ -244,6 +245,35 @@ def _run_builtin_logic(
     return hardcoded
 
 
+def _merge_pending_journal(
+    db_path: Path,
+    journal_dir: Path,
+    storage_logger: structlog.typing.FilteringBoundLogger,
+) -> None:
+    """Merge state writes deferred by earlier hooks, if the lock is free.
+
+    Never waits for the write lock: if another process holds it, the journal
+    is left for a later hook to merge.
+
+    Args:
+        db_path: Path to the state database.
+        journal_dir: Directory holding deferred write segments.
+        storage_logger: Logger for state store operations.
+    """
+    import sqlite3
+
+    from oaps.utils import merge_state_journal
+
+    if not journal_dir.is_dir():
+        return
+    try:
+        _ = merge_state_journal(
+            db_path, journal_dir=journal_dir, busy_timeout=0, logger=storage_logger
+        )
+    except sqlite3.OperationalError as e:
+        storage_logger.debug("state_journal_merge_skipped", error=str(e))
+
+
 def _execute_hook(  # noqa: PLR0913
     event: HookEventType,
     hook_input: HookInputT,
@@ -251,6 +281,8 @@ def _execute_hook(  # noqa: PLR0913
     hook_logger: structlog.typing.FilteringBoundLogger,
     session_logger: structlog.typing.FilteringBoundLogger,
     storage_logger: structlog.typing.FilteringBoundLogger,
+    *,
+    write_journal: bool = False,
 ) -> None:
     """Execute the hook logic for the given event.
 
@@ -261,6 +293,8 @@ def _execute_hook(  # noqa: PLR0913
         hook_logger: The structlog logger instance.
         session_logger: The structlog logger instance for the session.
         storage_logger: Logger for state store operations (respects [storage] config).
+        write_journal: Defer state writes that cannot get the database lock
+            to the state journal instead of failing.
 
     Raises:
         BlockHook: To block the action and feed message to Claude.
@@ -275,10 +309,13 @@ def _execute_hook(  # noqa: PLR0913
     from oaps.session import Session
     from oaps.utils import (
         SQLiteStateStore,
+        StateJournal,
         get_git_context,
         get_oaps_dir,
         get_oaps_state_file,
+        get_state_journal_dir,
     )
+    from oaps.utils.database import BusyRetryPolicy
 
     # Normalize types early - SessionStartInput uses UUID/Path, others use str
     claude_session_id = str(hook_input.session_id)
@@ -306,10 +343,16 @@ def _execute_hook(  # noqa: PLR0913
     # Initialize Session and update built-in state
     # Ensure the state directory exists
     oaps_state_file.parent.mkdir(parents=True, exist_ok=True)
+    journal_dir = get_state_journal_dir(oaps_state_file)
+    _merge_pending_journal(oaps_state_file, journal_dir, storage_logger)
     session = Session(
         id=claude_session_id,
         store=SQLiteStateStore(
-            oaps_state_file, session_id=claude_session_id, logger=storage_logger
+            oaps_state_file,
+            session_id=claude_session_id,
+            logger=storage_logger,
+            retry_policy=BusyRetryPolicy(),
+            journal=StateJournal(journal_dir) if write_journal else None,
         ),
     )
     update_hook_state(session, event, hook_input)
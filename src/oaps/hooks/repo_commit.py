@@ -8,19 +8,25 @@ All functions follow the hook action signature:
     def action_name(context: HookContext) -> dict[str, object] | None
 
 Return values include:
-- "status": str - "committed", "no_changes", "skipped", or "error"
+- "status": str - "committed", "queued", "no_changes", "skipped", or "error"
 - "sha": str | None - Commit SHA when committed
 - "warn_message": str - Warning message on error
 
 Checkpoint commits use the conventional format:
 - oaps(dev): <action> - for dev workflow phase transitions
 - oaps(idea): <action> - for idea workflow phase transitions
+
+With ``[storage] checkpoint_interval`` set, checkpoints made within the
+interval of the workflow's last commit are queued and coalesced into one
+commit (see CheckpointScheduler). The Stop and SessionEnd hooks flush the
+queue with ``flush_checkpoints``.
 """
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from oaps.hooks._context import HookContext
+    from oaps.repository import CheckpointScheduler, OapsRepository
     from oaps.session import Session
 
 
@@ -108,6 +114,44 @@ def checkpoint_idea_workflow(context: HookContext) -> dict[str, object]:
     return _create_checkpoint(context, "idea", action)
 
 
+# -----------------------------------------------------------------------------
+# Coalesced Checkpoints
+# -----------------------------------------------------------------------------
+
+
+def flush_checkpoints(context: HookContext) -> dict[str, object]:
+    """Commit all checkpoints queued by checkpoint coalescing.
+
+    Runs at Stop and SessionEnd so that queued actions are committed before
+    the session goes idle, even if no further checkpoint falls due.
+
+    Args:
+        context: Hook context.
+
+    Returns:
+        Status dict with:
+            - status: "committed" (with shas), "no_changes", "skipped", or "error"
+            - shas: Commit SHA hex strings when committed
+            - warn_message: Warning message on error
+    """
+    from oaps.exceptions import OapsRepositoryNotInitializedError  # noqa: PLC0415
+    from oaps.repository import OapsRepository  # noqa: PLC0415
+
+    try:
+        with OapsRepository() as repo:
+            results = _checkpoint_scheduler(repo).flush()
+    except OapsRepositoryNotInitializedError:
+        return {"status": "skipped", "reason": "repository_not_initialized"}
+    except Exception as e:  # noqa: BLE001
+        context.hook_logger.warning("Failed to flush checkpoint commits", error=str(e))
+        return {"status": "error", "warn_message": f"Checkpoint flush failed: {e}"}
+
+    shas = [result.sha for result in results if not result.no_changes]
+    if not shas:
+        return {"status": "no_changes"}
+    return {"status": "committed", "shas": shas}
+
+
 # -----------------------------------------------------------------------------
 # Helpers
 # -----------------------------------------------------------------------------
@@ -162,10 +206,26 @@ def _determine_dev_action(session: Session) -> str | None:
     return None
 
 
+def _checkpoint_scheduler(repo: OapsRepository) -> CheckpointScheduler:
+    """Create a checkpoint scheduler with the configured interval.
+
+    Args:
+        repo: The OAPS repository to commit to.
+
+    Returns:
+        CheckpointScheduler using ``[storage] checkpoint_interval``.
+    """
+    from oaps.config import load_storage_configuration  # noqa: PLC0415
+    from oaps.repository import CheckpointScheduler  # noqa: PLC0415
+
+    interval = load_storage_configuration().checkpoint_interval
+    return CheckpointScheduler(repo, interval=interval)
+
+
 def _create_checkpoint(
     context: HookContext, workflow: str, action: str
 ) -> dict[str, object]:
-    """Create a checkpoint commit in the OAPS repository.
+    """Create (or queue) a checkpoint commit in the OAPS repository.
 
     Args:
         context: Hook context with session access.
@@ -173,18 +233,22 @@ def _create_checkpoint(
         action: Action description for commit message.
 
     Returns:
-        Status dict with commit result or error information.
+        Status dict with commit result or error information. The status is
+        "queued" if the checkpoint was coalesced into a later commit.
     """
     from oaps.exceptions import OapsRepositoryNotInitializedError  # noqa: PLC0415
     from oaps.repository import OapsRepository  # noqa: PLC0415
 
     try:
         with OapsRepository() as repo:
-            result = repo.checkpoint(
+            scheduler = _checkpoint_scheduler(repo)
+            result = scheduler.checkpoint(
                 workflow, action, session_id=context.claude_session_id
             )
 
             if result.no_changes:
+                if scheduler.interval > 0 and scheduler.pending(workflow):
+                    return {"status": "queued"}
                 return {"status": "no_changes"}
 
             return {
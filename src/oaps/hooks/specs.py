@@ -23,14 +23,27 @@ Return values can include:
 import json
 import os
 import re
+import shlex
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import yaml
+from oaps.utils._paths import get_cache_dir
+from oaps.utils._validation_cache import (
+    VALIDATION_CACHE_NAME,
+    ValidationCache,
+    cache_digest,
+    file_digest,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from oaps.hooks._context import HookContext
+    from oaps.spec import PytestTest
 
 # Constants
 SPEC_DIR = ".oaps/docs/specs"
@@ -52,11 +65,35 @@ PYTEST_STATUS_MAP: dict[str, str] = {
     "ERROR": "failing",
 }
 
+# Report written by ``pytest --json-report`` without --json-report-file
+PYTEST_JSON_REPORT_DEFAULT = ".report.json"
+
+# Report written by ``--cov-report=json`` without a path
+COVERAGE_JSON_DEFAULT = "coverage.json"
+
 # Required fields for JSON schema validation
 INDEX_REQUIRED_FIELDS = frozenset({"id", "title", "status", "version"})
 REQUIREMENTS_ITEM_REQUIRED_FIELDS = frozenset({"id", "title"})
 TESTS_ITEM_REQUIRED_FIELDS = frozenset({"id", "title", "method"})
 
+# Files whose content the per-spec checks read, and files only checked to exist
+SPEC_CONTENT_FILES = ("index.json", "index.md", "requirements.json", "tests.json")
+SPEC_PRESENCE_FILES = ("history.jsonl",)
+
+# Bump when a per-spec check changes, so cached results are discarded
+SPEC_VALIDATOR_VERSION = 1
+SPEC_VALIDATION_KIND = "spec"
+
+# Set to "1" to validate every spec before commits, not only staged ones
+SPEC_VALIDATE_ALL_ENV = "OAPS_SPEC_VALIDATE_ALL"
+
+# Specs to validate before a process pool pays for its startup cost
+SPEC_PARALLEL_MIN = 32
+
+# Root index keys listing the specs that relate to a spec
+SPEC_INVERSE_KEYS = ("dependents", "extended_by", "superseded_by", "integrated_by")
+SPEC_RELATIONSHIP_KEYS = ("depends_on", "extends", "supersedes", "integrates")
+
 
 # -----------------------------------------------------------------------------
 # Validation hooks
@@ -66,15 +103,24 @@ TESTS_ITEM_REQUIRED_FIELDS = frozenset({"id", "title", "method"})
 def validate_specs_precommit(context: HookContext) -> dict[str, object]:
     """Validate spec structure before git commit.
 
-    Checks that all specs have required files, valid JSON structure with
-    required fields, and root index consistency.
+    Checks that specs have required files, valid JSON structure with
+    required fields, relationships to existing specs, and root index
+    consistency.
+
+    Only the specs the commit touches are validated: spec directories with
+    staged files, and the specs that relate to them according to the root
+    index, since a change to a spec can break their relationships. The root
+    index is checked when it or a spec's index.json is staged. Every spec is
+    validated when the staged files are unknown (no git context) or when
+    OAPS_SPEC_VALIDATE_ALL=1 is set.
 
     Args:
         context: Hook context.
 
     Returns:
-        Status dict with validation results.
+        Status dict with validation results and timing.
     """
+    started = time.perf_counter()
     project_root = _get_project_root(context)
     if project_root is None:
         return {"status": "skipped", "reason": "No project root"}
@@ -85,31 +131,72 @@ def validate_specs_precommit(context: HookContext) -> dict[str, object]:
 
     errors: list[str] = []
     warnings: list[str] = []
-    found_spec_ids: set[str] = set()
 
-    # Check each spec directory
-    for spec_path in specs_dir.iterdir():
-        if not spec_path.is_dir() or spec_path.name == "artifacts":
-            continue
+    spec_paths = {
+        spec_path.name: spec_path
+        for spec_path in specs_dir.iterdir()
+        if spec_path.is_dir()
+        and spec_path.name != "artifacts"
+        and not spec_path.name.startswith(".")
+    }
+    found_spec_ids = {name[:SPEC_ID_LENGTH] for name in spec_paths}
 
-        spec_id = spec_path.name
-        found_spec_ids.add(spec_id[:SPEC_ID_LENGTH])
+    staged = None
+    if os.environ.get(SPEC_VALIDATE_ALL_ENV) != "1":
+        staged = _staged_spec_files(context, specs_dir)
+    if staged is None:
+        selected, check_root = sorted(spec_paths), True
+    else:
+        selected, check_root = _affected_specs(specs_dir, staged, spec_paths)
+
+    # Reuse the results of spec directories whose files did not change
+    cache = ValidationCache(get_cache_dir(specs_dir) / VALIDATION_CACHE_NAME)
+    digests = {name: _spec_digest(spec_paths[name]) for name in selected}
+    try:
+        cached = cache.lookup(SPEC_VALIDATION_KIND, digests)
+    except (sqlite3.Error, OSError):
+        cached = {}
+    missing = [name for name in selected if name not in cached]
+    results = dict(
+        zip(
+            missing,
+            _validate_spec_dirs([spec_paths[name] for name in missing]),
+            strict=True,
+        )
+    )
+    fresh = {name: (digests[name], results[name]) for name in missing}
+    results.update(cached)
 
-        # Validate structure and JSON schemas
-        struct_errors, schema_errors = _validate_spec_structure(spec_path)
-        errors.extend(f"{spec_id}: {err}" for err in struct_errors)
-        warnings.extend(f"{spec_id}: {err}" for err in schema_errors)
+    # Check each spec directory
+    for spec_id in selected:
+        result = results[spec_id]
+        errors.extend(f"{spec_id}: {err}" for err in result["errors"])
+        warnings.extend(f"{spec_id}: {err}" for err in result["warnings"])
+        # Relationships depend on other specs, so they are never cached
+        warnings.extend(
+            f"{spec_id}: {warning}"
+            for warning in _check_spec_relationships(
+                spec_paths[spec_id], found_spec_ids
+            )
+        )
 
-        # Check bidirectional links
-        req_path = spec_path / "requirements.json"
-        test_path = spec_path / "tests.json"
-        if req_path.exists() and test_path.exists():
-            link_errors = _check_bidirectional_links(req_path, test_path)
-            warnings.extend(f"{spec_id}: {err}" for err in link_errors)
+    try:
+        cache.store(SPEC_VALIDATION_KIND, fresh)
+        _ = cache.retain(SPEC_VALIDATION_KIND, spec_paths)
+    except (sqlite3.Error, OSError):
+        pass  # Only a cache; the next commit validates again
+    cache_stats = {"hits": cache.stats.hits, "misses": cache.stats.misses}
 
     # Validate root index consistency
-    root_index_errors = _validate_root_index_consistency(specs_dir, found_spec_ids)
-    errors.extend(root_index_errors)
+    if check_root:
+        errors.extend(_validate_root_index_consistency(specs_dir, found_spec_ids))
+
+    timing = {
+        "scope": "all" if staged is None else "staged",
+        "specs": len(selected),
+        "validated": len(missing),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
 
     if errors:
         return {
@@ -118,6 +205,8 @@ def validate_specs_precommit(context: HookContext) -> dict[str, object]:
             "status": "failed",
             "errors": errors,
             "warnings": warnings,
+            "cache": cache_stats,
+            "timing": timing,
         }
 
     if warnings:
@@ -125,9 +214,214 @@ def validate_specs_precommit(context: HookContext) -> dict[str, object]:
             "status": "passed_with_warnings",
             "warnings": warnings,
             "warn_message": "Spec warnings:\n- " + "\n- ".join(warnings),
+            "cache": cache_stats,
+            "timing": timing,
         }
 
-    return {"status": "passed"}
+    return {"status": "passed", "cache": cache_stats, "timing": timing}
+
+
+def _staged_spec_files(context: HookContext, specs_dir: Path) -> list[str] | None:
+    """List the files under the specs directory that the commit includes.
+
+    Files modified but not staged are included when the commit command
+    stages them itself (``git commit -a``).
+
+    Args:
+        context: Hook context.
+        specs_dir: Path to the specs directory.
+
+    Returns:
+        Paths relative to the specs directory, or None if the staged files
+        are unknown.
+    """
+    git = context.git
+    if git is None:
+        return None
+    try:
+        prefix = specs_dir.resolve().relative_to(git.worktree_dir.resolve())
+    except ValueError:
+        return None
+
+    committed = set(git.staged_files)
+    tool_input = _get_tool_input(context)
+    command = tool_input.get("command") if tool_input else None
+    if isinstance(command, str) and _commit_stages_tracked(command):
+        committed |= git.modified_files
+
+    root = prefix.as_posix().rstrip("/") + "/" if prefix.parts else ""
+    return sorted(path[len(root) :] for path in committed if path.startswith(root))
+
+
+def _commit_stages_tracked(command: str) -> bool:
+    """Check whether a git commit command stages tracked files (-a/--all)."""
+    try:
+        args = shlex.split(command)
+    except ValueError:
+        args = command.split()
+    for arg in args[2:]:
+        if arg == "--all":
+            return True
+        if arg.startswith("--"):
+            continue
+        if arg.startswith("-"):
+            # Short options are clustered, and -m/-F/-C take a value
+            for flag in arg[1:]:
+                if flag == "a":
+                    return True
+                if flag in "mFCc":
+                    break
+    return False
+
+
+def _affected_specs(
+    specs_dir: Path, staged: list[str], spec_paths: dict[str, Path]
+) -> tuple[list[str], bool]:
+    """Find the specs a commit can affect.
+
+    Args:
+        specs_dir: Path to the specs directory.
+        staged: Staged paths relative to the specs directory.
+        spec_paths: Existing spec directories by name.
+
+    Returns:
+        Tuple of (spec directory names to validate, whether to check the
+        root index).
+    """
+    changed: set[str] = set()
+    check_root = False
+    for path in staged:
+        parts = path.split("/")
+        if len(parts) == 1:
+            check_root = check_root or parts[0] == "index.json"
+            continue
+        if parts[0] == "artifacts":
+            continue
+        changed.add(parts[0])
+        # Added, removed, or renamed specs change the root index
+        if parts[1:] == ["index.json"] or parts[0] not in spec_paths:
+            check_root = True
+
+    # Specs that depend on, extend, supersede, or integrate a changed spec
+    changed_ids = {name[:SPEC_ID_LENGTH] for name in changed}
+    related_ids: set[str] = set()
+    if changed_ids:
+        for entry in _root_index_entries(specs_dir):
+            if entry.get("id") in changed_ids:
+                for key in SPEC_INVERSE_KEYS:
+                    value = entry.get(key)
+                    if isinstance(value, str):
+                        related_ids.add(value)
+                    elif isinstance(value, list):
+                        related_ids.update(v for v in value if isinstance(v, str))
+
+    affected = {name for name in changed if name in spec_paths}
+    affected.update(name for name in spec_paths if name[:SPEC_ID_LENGTH] in related_ids)
+    return sorted(affected), check_root
+
+
+def _root_index_entries(specs_dir: Path) -> list[dict[str, object]]:
+    """Read the spec entries of the root index, or none if it is unreadable."""
+    try:
+        with (specs_dir / "index.json").open() as f:
+            root_data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return []
+    specs = root_data.get("specs") if isinstance(root_data, dict) else None
+    if not isinstance(specs, list):
+        return []
+    return [spec for spec in specs if isinstance(spec, dict)]
+
+
+def _validate_spec_dirs(spec_paths: list[Path]) -> list[dict[str, list[str]]]:
+    """Run the per-spec checks, spread over a process pool for many specs.
+
+    Args:
+        spec_paths: Spec directories to check.
+
+    Returns:
+        Results in the order of ``spec_paths``.
+    """
+    max_workers = os.process_cpu_count() or 1
+    if max_workers <= 1 or len(spec_paths) < SPEC_PARALLEL_MIN:
+        return [_validate_spec_dir(spec_path) for spec_path in spec_paths]
+    chunksize = max(1, len(spec_paths) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_validate_spec_dir, spec_paths, chunksize=chunksize))
+
+
+def _check_spec_relationships(spec_path: Path, spec_ids: set[str]) -> list[str]:
+    """Check that the specs a spec relates to exist.
+
+    Args:
+        spec_path: Path to the spec directory.
+        spec_ids: IDs of the existing specs.
+
+    Returns:
+        List of warning messages for relationships to missing specs.
+    """
+    try:
+        with (spec_path / "index.json").open() as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return []  # Reported by the structure checks
+    relationships = data.get("relationships") if isinstance(data, dict) else None
+    if not isinstance(relationships, dict):
+        return []
+
+    warnings: list[str] = []
+    for key in SPEC_RELATIONSHIP_KEYS:
+        value = relationships.get(key)
+        targets = [value] if isinstance(value, str) else value
+        if not isinstance(targets, list):
+            continue
+        warnings.extend(
+            f"{key} references non-existent spec: {target}"
+            for target in targets
+            if isinstance(target, str) and target not in spec_ids
+        )
+    return warnings
+
+
+def _spec_digest(spec_path: Path) -> str:
+    """Digest the files the per-spec checks depend on.
+
+    Args:
+        spec_path: Path to the spec directory.
+
+    Returns:
+        Digest that changes when any checked file is edited, added, or
+        removed, or when the checks change.
+    """
+    contents: list[str | None] = []
+    for filename in SPEC_CONTENT_FILES:
+        try:
+            contents.append(file_digest(spec_path / filename))
+        except OSError:
+            contents.append("unreadable")
+    presence = [(spec_path / filename).exists() for filename in SPEC_PRESENCE_FILES]
+    return cache_digest(SPEC_VALIDATOR_VERSION, *contents, *presence)
+
+
+def _validate_spec_dir(spec_path: Path) -> dict[str, list[str]]:
+    """Run the checks that depend only on one spec directory's files.
+
+    Args:
+        spec_path: Path to the spec directory.
+
+    Returns:
+        Dict with the blocking "errors" and informational "warnings".
+    """
+    # Validate structure and JSON schemas
+    errors, warnings = _validate_spec_structure(spec_path)
+
+    # Check bidirectional links
+    req_path = spec_path / "requirements.json"
+    test_path = spec_path / "tests.json"
+    if req_path.exists() and test_path.exists():
+        warnings.extend(_check_bidirectional_links(req_path, test_path))
+
+    return {"errors": errors, "warnings": warnings}
 
 
 def _validate_spec_structure(spec_path: Path) -> tuple[list[str], list[str]]:
@@ -651,7 +945,8 @@ def _collect_spec_metadata(specs_dir: Path) -> list[dict[str, str]]:
 def rebuild_artifacts_index(context: HookContext) -> dict[str, object]:
     """Rebuild artifacts.json after artifact file changes.
 
-    Scans artifact files and rebuilds the index from frontmatter.
+    Rebuilds the index through the artifact store, which only re-parses
+    artifacts whose content changed since the last rebuild.
 
     Args:
         context: Hook context with tool input.
@@ -663,25 +958,23 @@ def rebuild_artifacts_index(context: HookContext) -> dict[str, object]:
     if result is None:
         return {"status": "skipped"}
 
-    artifacts_dir, artifacts_index_path = result
+    _, artifacts_index_path = result
 
-    # Scan artifacts
-    artifacts = [
-        _parse_artifact_metadata(p) for p in artifacts_dir.iterdir() if p.is_file()
-    ]
-    artifacts = [a for a in artifacts if a is not None]
+    from oaps.artifacts import ArtifactStore  # noqa: PLC0415
 
-    # Write artifacts index
     try:
-        with artifacts_index_path.open("w") as f:
-            json.dump(artifacts, f, indent=2)
+        stats = ArtifactStore(artifacts_index_path.parent).rebuild_index()
     except OSError as e:
         return {
             "status": "error",
             "warn_message": f"Failed to rebuild artifacts index: {e}",
         }
     else:
-        return {"status": "rebuilt", "artifact_count": len(artifacts)}
+        return {
+            "status": "rebuilt",
+            "artifact_count": stats.indexed,
+            "parsed": stats.parsed,
+        }
 
 
 def _get_artifacts_dir_for_rebuild(
@@ -934,10 +1227,15 @@ def _get_action_type(filename: str) -> str:
 def sync_test_results(context: HookContext) -> dict[str, object]:
     """Update test status after pytest runs.
 
-    Parses pytest output for individual test results and updates tests.json
-    files with status and timestamp. Maps pytest statuses to spec statuses:
-    PASSED->passing, FAILED->failing, SKIPPED->skipped, XFAIL->failing,
-    XPASS->passing, ERROR->failing.
+    When the run wrote a JUnit XML (--junitxml) or pytest-json-report
+    (--json-report) file, the report is read as a stream and matched to
+    spec tests by file and function through ``TestManager.ingest``, which
+    writes each spec's tests.json and history once.
+
+    Otherwise, parses pytest output for individual test results and updates
+    tests.json files with status and timestamp. Maps pytest statuses to
+    spec statuses: PASSED->passing, FAILED->failing, SKIPPED->skipped,
+    XFAIL->failing, XPASS->passing, ERROR->failing.
 
     Args:
         context: Hook context with tool output.
@@ -949,6 +1247,13 @@ def sync_test_results(context: HookContext) -> dict[str, object]:
     if not tool_response:
         return {"status": "skipped", "reason": "No tool response"}
 
+    project_root = _get_project_root(context)
+    report_path = _test_report_path(context)
+    if project_root and report_path is not None:
+        ingested = _ingest_test_report(project_root, report_path)
+        if ingested is not None:
+            return ingested
+
     output = str(tool_response.get("result", ""))
 
     # Parse individual test results
@@ -961,11 +1266,17 @@ def sync_test_results(context: HookContext) -> dict[str, object]:
         status_counts[status] = status_counts.get(status, 0) + 1
 
     # Update tests.json files if we found results
-    project_root = _get_project_root(context)
     updated_specs: list[str] = []
     if project_root and test_results:
         updated_specs = _update_tests_json_with_results(project_root, test_results)
 
+    return _test_sync_result(status_counts, updated_specs)
+
+
+def _test_sync_result(
+    status_counts: dict[str, int], updated_specs: list[str]
+) -> dict[str, object]:
+    """Build the result of a test sync from counts by spec status."""
     passed = status_counts.get("passing", 0)
     failed = status_counts.get("failing", 0)
     skipped = status_counts.get("skipped", 0)
@@ -984,6 +1295,125 @@ def sync_test_results(context: HookContext) -> dict[str, object]:
     }
 
 
+def _test_report_path(context: HookContext) -> Path | None:
+    """Find the JUnit XML or pytest-json-report file a pytest run wrote.
+
+    Args:
+        context: Hook context with the tool input.
+
+    Returns:
+        Path to the report, or None if the command wrote none or it does
+        not exist.
+    """
+    args = _command_args(context)
+    path = _option_value(args, ("--junitxml", "--junit-xml"))
+    if path is None:
+        path = _option_value(args, ("--json-report-file",))
+    if path is None and "--json-report" in args:
+        path = PYTEST_JSON_REPORT_DEFAULT
+    return _existing_report(context, path)
+
+
+def _coverage_report_path(context: HookContext) -> Path | None:
+    """Find the coverage JSON file a ``--cov-report=json[:path]`` run wrote.
+
+    Args:
+        context: Hook context with the tool input.
+
+    Returns:
+        Path to the report, or None if the command wrote none or it does
+        not exist.
+    """
+    args = _command_args(context)
+    for i, arg in enumerate(args):
+        value = None
+        if arg.startswith("--cov-report="):
+            value = arg.removeprefix("--cov-report=")
+        elif arg == "--cov-report" and i + 1 < len(args):
+            value = args[i + 1]
+        if value == "json":
+            return _existing_report(context, COVERAGE_JSON_DEFAULT)
+        if value is not None and value.startswith("json:"):
+            return _existing_report(context, value.removeprefix("json:"))
+    return None
+
+
+def _command_args(context: HookContext) -> list[str]:
+    """Split the Bash command of the tool input into arguments."""
+    tool_input = _get_tool_input(context)
+    command = tool_input.get("command") if tool_input else None
+    if not isinstance(command, str):
+        return []
+    try:
+        return shlex.split(command)
+    except ValueError:
+        return command.split()
+
+
+def _option_value(args: list[str], names: tuple[str, ...]) -> str | None:
+    """Get the value of a long option given as ``--name=value`` or ``--name value``."""
+    for i, arg in enumerate(args):
+        for name in names:
+            if arg.startswith(f"{name}="):
+                return arg.removeprefix(f"{name}=")
+            if arg == name and i + 1 < len(args):
+                return args[i + 1]
+    return None
+
+
+def _existing_report(context: HookContext, path: str | None) -> Path | None:
+    """Resolve a report path against the command's working directory."""
+    if not path:
+        return None
+    cwd = getattr(context.hook_input, "cwd", None)
+    base = Path(cwd) if isinstance(cwd, str) else _get_project_root(context)
+    report = Path(path) if base is None else base / path
+    return report if report.is_file() else None
+
+
+def _ingest_test_report(
+    project_root: Path, report_path: Path
+) -> dict[str, object] | None:
+    """Sync spec tests with a JUnit XML or pytest-json-report file.
+
+    Args:
+        project_root: Project root path.
+        report_path: Path to the report.
+
+    Returns:
+        Status dict with sync results, or None if the report or the specs
+        could not be read.
+    """
+    from oaps.exceptions import SpecError  # noqa: PLC0415
+    from oaps.spec import (  # noqa: PLC0415
+        RequirementManager,
+        SpecManager,
+        TestManager,
+        read_test_results,
+    )
+
+    specs_dir = project_root / SPEC_DIR
+    if not specs_dir.exists():
+        return None
+
+    status_counts: dict[str, int] = {}
+
+    def counted(results: Iterable[PytestTest]) -> Iterator[PytestTest]:
+        for result in results:
+            status = PYTEST_STATUS_MAP.get(result.outcome.upper(), "failing")
+            status_counts[status] = status_counts.get(status, 0) + 1
+            yield result
+
+    try:
+        spec_manager = SpecManager(specs_dir)
+        tests = TestManager(spec_manager, RequirementManager(spec_manager))
+        synced = tests.ingest(counted(read_test_results(report_path)), _detect_actor())
+    except (SpecError, OSError):
+        return None
+
+    return _test_sync_result(status_counts, sorted(synced))
+
+
 def _parse_pytest_output(output: str) -> dict[str, dict[str, str]]:
     """Parse pytest output to extract individual test results.
 
@@ -1107,10 +1537,14 @@ def sync_coverage(context: HookContext) -> dict[str, object]:
     if not tool_response:
         return {"status": "skipped", "reason": "No tool response"}
 
-    output = str(tool_response.get("result", ""))
-
-    # Parse coverage output
-    coverage_data = _parse_coverage_output(output)
+    # Prefer the JSON report over the text report in the output
+    coverage_data: dict[str, dict[str, object]] = {}
+    report_path = _coverage_report_path(context)
+    if report_path is not None:
+        coverage_data = _read_coverage_report(report_path)
+    if not coverage_data:
+        output = str(tool_response.get("result", ""))
+        coverage_data = _parse_coverage_output(output)
     if not coverage_data:
         return {"status": "skipped", "reason": "No coverage data found"}
 
@@ -1138,6 +1572,17 @@ def sync_coverage(context: HookContext) -> dict[str, object]:
     }
 
 
+def _read_coverage_report(report_path: Path) -> dict[str, dict[str, object]]:
+    """Read a coverage JSON report, or nothing if it cannot be read."""
+    from oaps.exceptions import SpecError  # noqa: PLC0415
+    from oaps.spec import read_coverage_json  # noqa: PLC0415
+
+    try:
+        return read_coverage_json(report_path)
+    except SpecError:
+        return {}
+
+
 def _parse_coverage_output(output: str) -> dict[str, dict[str, object]]:
     """Parse coverage output to extract line and branch coverage.
 
@@ -1431,7 +1876,7 @@ def notify_review_ready(context: HookContext) -> dict[str, object]:
     }
 
 
-def _check_requirements_coverage(
+def _check_requirements_coverage(  # noqa: PLR0915
     project_root: Path | None, index_path: str
 ) -> dict[str, list[str]]:
     """Check that all requirements have tests.
@@ -1463,6 +1908,13 @@ def _check_requirements_coverage(
     if not req_path.exists():
         return result
 
+    # Use the tested/untested lists SpecManager keeps in the spec index
+    aggregates = _stored_aggregates(spec_dir / "index.json")
+    if aggregates is not None:
+        result["covered"] = aggregates["tested"]
+        result["uncovered"] = aggregates["untested"]
+        return result
+
     # Load requirements
     try:
         with req_path.open() as f:
@@ -1525,6 +1977,29 @@ def _check_requirements_coverage(
     return result
 
 
+def _stored_aggregates(index_path: Path) -> dict[str, list[str]] | None:
+    """Read the tested and untested requirement lists from a spec index.
+
+    Returns:
+        Dict with 'tested' and 'untested' lists, or None if the index has no
+        aggregates of version 1 (see oaps.spec._aggregates).
+    """
+    try:
+        with index_path.open() as f:
+            index_data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+
+    aggregates = index_data.get("aggregates") if isinstance(index_data, dict) else None
+    if not isinstance(aggregates, dict) or aggregates.get("version") != 1:
+        return None
+    tested = aggregates.get("tested")
+    untested = aggregates.get("untested")
+    if not isinstance(tested, list) or not isinstance(untested, list):
+        return None
+    return {"tested": tested, "untested": untested}
+
+
 # -----------------------------------------------------------------------------
 # Helpers
 # -----------------------------------------------------------------------------
@@ -1647,56 +2122,3 @@ def _check_bidirectional_links(req_path: Path, test_path: Path) -> list[str]:
         )
 
     return errors
-
-
-def _parse_artifact_metadata(artifact_path: Path) -> dict[str, str] | None:
-    """Parse metadata from artifact file."""
-    if artifact_path.suffix == ".md":
-        return _parse_markdown_frontmatter(artifact_path)
-
-    # Check for sidecar metadata
-    sidecar_path = artifact_path.with_suffix(artifact_path.suffix + ".metadata.yaml")
-    if sidecar_path.exists():
-        return _parse_sidecar_metadata(artifact_path, sidecar_path)
-
-    # Return basic info
-    return {
-        "filename": artifact_path.name,
-        "type": "file",
-    }
-
-
-def _parse_markdown_frontmatter(artifact_path: Path) -> dict[str, str] | None:
-    """Parse YAML frontmatter from markdown file."""
-    try:
-        content = artifact_path.read_text()
-        if content.startswith("---"):
-            end = content.find("---", 3)
-            if end > 0:
-                frontmatter = yaml.safe_load(content[3:end])
-                if isinstance(frontmatter, dict):
-                    return {
-                        "filename": artifact_path.name,
-                        "type": frontmatter.get("type", "document"),
-                        "title": frontmatter.get("title", artifact_path.stem),
-                        "created": frontmatter.get("created", ""),
-                    }
-    except (OSError, yaml.YAMLError):
-        pass
-    return None
-
-
-def _parse_sidecar_metadata(
-    artifact_path: Path, sidecar_path: Path
-) -> dict[str, str] | None:
-    """Parse metadata from sidecar YAML file."""
-    try:
-        metadata = yaml.safe_load(sidecar_path.read_text())
-        if isinstance(metadata, dict):
-            return {
-                "filename": artifact_path.name,
-                **{k: str(v) for k, v in metadata.items()},
-            }
-    except (OSError, yaml.YAMLError):
-        pass
-    return None
@@ -7,6 +7,8 @@ This module provides the IdeaManager class for managing ideas in
 full-text search across idea content.
 """
 
+import contextlib
+import sqlite3
 from dataclasses import replace
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Final
@@ -18,26 +20,36 @@ from oaps.cli._commands._idea._storage import (
     generate_idea_id,
     idea_filename,
     load_idea as storage_load_idea,
+    load_idea_frontmatter,
     load_index as storage_load_index,
     rebuild_index as storage_rebuild_index,
     save_idea as storage_save_idea,
     save_index as storage_save_index,
 )
-from oaps.exceptions import IdeaNotFoundError, IdeaValidationError
+from oaps.exceptions import IdeaNotFoundError, IdeaValidationError, SpecError
 from oaps.idea._models import Idea, IdeaReference, IdeaStatus, IdeaSummary, IdeaType
+from oaps.search import (
+    SEARCH_FIELDS,
+    SEARCH_INDEX_NAME,
+    SearchDocument,
+    SearchField,
+    SearchIndex,
+)
 from oaps.spec._io import append_jsonl
-from oaps.utils._paths import get_oaps_dir
+from oaps.utils._paths import get_cache_dir, get_oaps_dir
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-    from oaps.repository import OapsRepository
+    from oaps.repository import CheckpointProtocol
 
 __all__ = ["IdeaManager"]
 
 # Index schema version
 _INDEX_VERSION: Final = 1
 
+_SEARCH_KIND: Final = "idea"
+
 
 class IdeaManager:
     """Manager for CRUD operations on ideas.
@@ -50,25 +62,28 @@ class IdeaManager:
         _ideas_dir: Directory containing idea files.
         _oaps_repo: Optional repository for committing changes.
         _index_cache: Cached index data.
+        _search_index: Full-text index of idea titles, tags, and bodies.
     """
 
-    __slots__: Final = ("_ideas_dir", "_index_cache", "_oaps_repo")
+    __slots__: Final = ("_ideas_dir", "_index_cache", "_oaps_repo", "_search_index")
 
     _ideas_dir: Path
-    _oaps_repo: OapsRepository | None
+    _oaps_repo: CheckpointProtocol | None
     _index_cache: list[IdeaIndexEntry] | None
+    _search_index: SearchIndex
 
     def __init__(
         self,
         ideas_dir: Path | None = None,
-        oaps_repo: OapsRepository | None = None,
+        oaps_repo: CheckpointProtocol | None = None,
     ) -> None:
         """Initialize the idea manager.
 
         Args:
             ideas_dir: Directory for idea files. If None, uses the default
                 `.oaps/docs/ideas/` location.
-            oaps_repo: Repository for committing changes. If None, mutations
+            oaps_repo: Repository for committing changes, or a
+                CheckpointScheduler to coalesce commits. If None, mutations
                 work but changes are not committed. For testing, pass None
                 to skip commits entirely.
         """
@@ -77,6 +92,9 @@ class IdeaManager:
         self._ideas_dir = ideas_dir
         self._oaps_repo = oaps_repo
         self._index_cache = None
+        self._search_index = SearchIndex(
+            get_cache_dir(ideas_dir) / SEARCH_INDEX_NAME, root=ideas_dir
+        )
 
     # -------------------------------------------------------------------------
     # Path Properties
@@ -97,6 +115,11 @@ class IdeaManager:
         """Path to the history.jsonl file."""
         return self._ideas_dir / "history.jsonl"
 
+    @property
+    def search_index(self) -> SearchIndex:
+        """Full-text index of idea titles, tags, and bodies (.cache/search.db)."""
+        return self._search_index
+
     # -------------------------------------------------------------------------
     # Internal Methods - Caching
     # -------------------------------------------------------------------------
@@ -267,8 +290,77 @@ class IdeaManager:
 
         fm = self._idea_to_frontmatter(idea)
         storage_save_idea(path, fm, idea.body)
+
+        # Failures are ignored: the next search re-syncs changed files
+        with contextlib.suppress(OSError, sqlite3.Error):
+            self._search_index.update(path, [self._idea_to_search_document(idea)])
         return path
 
+    # -------------------------------------------------------------------------
+    # Internal Methods - Search Index
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _idea_to_search_document(idea: Idea) -> SearchDocument:
+        """Build the search document of an idea.
+
+        Args:
+            idea: The idea to index.
+
+        Returns:
+            SearchDocument for the idea's title, tags, and body.
+        """
+        return SearchDocument(
+            kind=_SEARCH_KIND,
+            doc_id=idea.id,
+            title=idea.title,
+            body=idea.body,
+            tags=idea.tags,
+            status=idea.status.value,
+            doc_type=idea.idea_type.value,
+        )
+
+    def _extract_search_documents(self, path: Path) -> list[SearchDocument]:
+        """Extract the search document of an idea file.
+
+        Args:
+            path: Idea markdown file.
+
+        Returns:
+            A single document, or none if the file is not a valid idea.
+        """
+        try:
+            fm, body = storage_load_idea(path)
+            idea = self._frontmatter_to_idea(fm, body, path.name)
+        except (ValueError, SpecError):
+            return []
+        return [self._idea_to_search_document(idea)]
+
+    def _load_index_entry(self, path: Path) -> IdeaIndexEntry | None:
+        """Build the index entry of an idea file from its frontmatter.
+
+        Args:
+            path: Idea markdown file.
+
+        Returns:
+            The index entry, or None if the file is not a valid idea.
+        """
+        try:
+            fm = load_idea_frontmatter(path)
+        except (ValueError, OSError, SpecError):
+            return None
+        return IdeaIndexEntry(
+            id=fm.id,
+            title=fm.title,
+            status=fm.status.value,
+            type=fm.type.value,
+            tags=fm.tags,
+            file_path=path.name,
+            created=fm.created,
+            updated=fm.updated,
+            author=fm.author,
+        )
+
     def _parse_datetime(self, value: str) -> datetime:
         """Parse a datetime string to datetime object.
 
@@ -478,63 +570,86 @@ class IdeaManager:
         query: str,
         *,
         fields: list[str] | None = None,
+        status: IdeaStatus | None = None,
+        idea_type: IdeaType | None = None,
+        limit: int | None = None,
     ) -> list[IdeaSummary]:
         """Search ideas by text query.
 
-        Performs case-insensitive substring search across specified fields.
-        By default, searches title, body, and tags.
+        Title, body, and tags are matched through the full-text index, which
+        is brought up to date with idea files changed outside of this manager
+        first. Every query term must match the start of a word, and results
+        are ranked with title matches above tag matches above body matches.
+        The "id" and "author" fields are matched as case-insensitive
+        substrings and ranked after full-text matches.
 
         Args:
             query: The search query string.
             fields: Fields to search. Defaults to ["title", "body", "tags"].
                 Valid fields: "title", "body", "tags", "id", "author".
+            status: Only return ideas with this status.
+            idea_type: Only return ideas of this type.
+            limit: Maximum number of results, or None for all.
 
         Returns:
-            List of matching idea summaries.
+            List of matching idea summaries, best matches first.
+
+        Raises:
+            IdeaValidationError: If a field is not a valid search field.
         """
         if fields is None:
             fields = ["title", "body", "tags"]
+        invalid = sorted(set(fields) - {*SEARCH_FIELDS, "id", "author"})
+        if invalid:
+            msg = f"Invalid search fields: {', '.join(invalid)}"
+            raise IdeaValidationError(msg, field="fields")
+
+        entries = {entry.id: entry for entry in self._load_index()}
+        results: dict[str, IdeaSummary] = {}
+
+        text_fields: list[SearchField] = [
+            field for field in SEARCH_FIELDS if field in fields
+        ]
+        if text_fields:
+            _ = self.sync_search_index()
+            hits = self._search_index.search(
+                query,
+                fields=text_fields,
+                kinds=(_SEARCH_KIND,),
+                status=status.value if status is not None else None,
+                doc_type=idea_type.value if idea_type is not None else None,
+                limit=None,
+            )
+            for hit in hits:
+                entry = entries.get(hit.doc_id)
+                if entry is None:
+                    # Idea files are the source of truth; index.json may lag
+                    entry = self._load_index_entry(self._ideas_dir / hit.source)
+                if entry is not None:
+                    results.setdefault(entry.id, self._index_entry_to_summary(entry))
 
         query_lower = query.lower()
-        results: list[IdeaSummary] = []
-
-        entries = self._load_index()
-
-        for entry in entries:
-            matched = False
-
-            # Check index fields first (avoid loading full idea if possible)
-            if "title" in fields and query_lower in entry.title.lower():
-                matched = True
-
-            if (
-                not matched
-                and "tags" in fields
-                and any(query_lower in tag.lower() for tag in entry.tags)
+        for entry in entries.values():
+            if status is not None and entry.status != status.value:
+                continue
+            if idea_type is not None and entry.type != idea_type.value:
+                continue
+            if ("id" in fields and query_lower in entry.id.lower()) or (
+                "author" in fields and query_lower in (entry.author or "").lower()
             ):
-                matched = True
-
-            if not matched and "id" in fields and query_lower in entry.id.lower():
-                matched = True
-
-            if not matched and "author" in fields:
-                author = entry.author or ""
-                if query_lower in author.lower():
-                    matched = True
+                results.setdefault(entry.id, self._index_entry_to_summary(entry))
 
-            # If body search needed and not already matched, load full idea
-            if not matched and "body" in fields:
-                try:
-                    full_idea = self._load_idea(entry.id)
-                    if query_lower in full_idea.body.lower():
-                        matched = True
-                except IdeaNotFoundError:
-                    continue
+        summaries = list(results.values())
+        return summaries if limit is None else summaries[:limit]
 
-            if matched:
-                results.append(self._index_entry_to_summary(entry))
+    def sync_search_index(self) -> int:
+        """Re-index idea files changed outside of this manager.
 
-        return results
+        Returns:
+            Number of idea files re-indexed or removed.
+        """
+        paths = sorted(self._ideas_dir.glob("*.md")) if self._ideas_dir.exists() else []
+        return self._search_index.sync(paths, self._extract_search_documents)
 
     # -------------------------------------------------------------------------
     # Mutation Methods
@@ -943,4 +1058,6 @@ class IdeaManager:
 
         entries = storage_rebuild_index()
         self._invalidate_caches()
+        with contextlib.suppress(OSError, sqlite3.Error):
+            _ = self.sync_search_index()
         return len(entries)
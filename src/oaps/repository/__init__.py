@@ -8,6 +8,8 @@ Classes:
     ProjectRepository: Scoped operations for project repository (excludes .oaps/).
     BaseRepository: Abstract base class with shared git functionality.
     RepositoryProtocol: Runtime-checkable protocol for dependency injection.
+    CheckpointProtocol: Runtime-checkable protocol for checkpoint commits.
+    CheckpointScheduler: Coalesces checkpoint commits per workflow.
 
 Models:
     OapsRepoStatus: Status snapshot for OAPS repository.
@@ -19,6 +21,7 @@ Models:
     FileDiffStats: Diff statistics for a single file.
     DiffStats: Aggregate diff statistics.
     BlameLine: Information about a single blamed line.
+    PendingCheckpoint: A checkpoint queued for a coalesced commit.
 
 Example:
     >>> from oaps.repository import OapsRepository, ProjectRepository
@@ -30,6 +33,11 @@ Example:
 """
 
 from oaps.repository._base import BaseRepository
+from oaps.repository._checkpoints import (
+    CHECKPOINT_QUEUE_NAME,
+    CheckpointScheduler,
+    PendingCheckpoint,
+)
 from oaps.repository._fake import FakeRepository
 from oaps.repository._models import (
     BlameLine,
@@ -43,12 +51,15 @@ from oaps.repository._models import (
     RepoStatus,
 )
 from oaps.repository._project import ProjectRepository
-from oaps.repository._protocol import RepositoryProtocol
+from oaps.repository._protocol import CheckpointProtocol, RepositoryProtocol
 from oaps.repository._repository import OapsRepository
 
 __all__ = [
+    "CHECKPOINT_QUEUE_NAME",
     "BaseRepository",
     "BlameLine",
+    "CheckpointProtocol",
+    "CheckpointScheduler",
     "CommitInfo",
     "CommitResult",
     "DiffStats",
@@ -57,6 +68,7 @@ __all__ = [
     "FileDiffStats",
     "OapsRepoStatus",
     "OapsRepository",
+    "PendingCheckpoint",
     "ProjectRepoStatus",
     "ProjectRepository",
     "RepoStatus",
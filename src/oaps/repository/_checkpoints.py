@@ -0,0 +1,356 @@
+"""Coalesced checkpoint commits for OAPS workflows.
+
+Every spec and idea mutation calls ``OapsRepository.checkpoint``, which
+stages all pending files and creates a commit. A burst of small mutations
+in one session therefore produces a long chain of tiny commits, each paying
+for a status scan and a tree build. CheckpointScheduler coalesces them:
+
+- The first checkpoint of a workflow is committed immediately.
+- Checkpoints made within ``interval`` seconds of the workflow's last commit
+  are queued instead of committed.
+- The next checkpoint after the interval, or an explicit ``flush`` (run by
+  the Stop and SessionEnd hooks), commits once for all queued actions.
+
+The queue is a small SQLite database in the OAPS repository's git control
+directory, so it is shared by every process working on the repository and
+is never staged itself. Committing happens inside a write transaction, which
+also serializes checkpoint commits across processes.
+
+A coalesced commit uses the first action as its subject, with the number of
+further actions appended, and lists every action in the commit body:
+
+    oaps(spec): add requirement 0001:FR-0001 (+2 more)
+
+    - add requirement 0001:FR-0001
+    - add requirement 0001:FR-0002
+    - add test 0001:UT-0001
+
+Committing stages every pending file, including the changes behind other
+workflows' queued actions. Those actions are therefore folded into the
+commit too, listed with their workflow (``- idea: update IDEA-1``), and
+cleared from the queue.
+
+Example:
+    >>> with OapsRepository() as repo:
+    ...     scheduler = CheckpointScheduler(repo, interval=30)
+    ...     manager = SpecManager(specs_dir, oaps_repo=scheduler)
+    ...     ...
+    ...     scheduler.flush()
+"""
+
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, cast
+
+from oaps.repository._models import CommitResult
+from oaps.utils.database import connect
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from oaps.repository._repository import OapsRepository
+
+__all__ = ["CHECKPOINT_QUEUE_NAME", "CheckpointScheduler", "PendingCheckpoint"]
+
+# Queue database file name, placed in the OAPS repository's git directory
+CHECKPOINT_QUEUE_NAME: Final = "oaps-checkpoints.db"
+
+# Seconds to wait for another process's checkpoint before raising
+_BUSY_TIMEOUT: Final = 30.0
+
+_SCHEMA: Final = """
+CREATE TABLE IF NOT EXISTS pending_checkpoints (
+    id INTEGER PRIMARY KEY,
+    workflow TEXT NOT NULL,
+    action TEXT NOT NULL,
+    session_id TEXT,
+    queued_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pending_checkpoints_workflow
+    ON pending_checkpoints (workflow, id);
+CREATE TABLE IF NOT EXISTS last_checkpoints (
+    workflow TEXT PRIMARY KEY,
+    committed_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+_SQL_RECORD_COMMIT: Final = """
+INSERT INTO last_checkpoints (workflow, committed_at) VALUES (?, ?)
+ON CONFLICT (workflow) DO UPDATE SET committed_at = excluded.committed_at
+"""
+
+# Result returned for a checkpoint that was queued instead of committed
+_DEFERRED: Final = CommitResult(sha=None, files=frozenset(), no_changes=True)
+
+
+@dataclass(frozen=True, slots=True)
+class PendingCheckpoint:
+    """A checkpoint queued for the next coalesced commit.
+
+    Attributes:
+        workflow: The workflow name used as the commit scope.
+        action: Description of the action being checkpointed.
+        session_id: Session identifier for the commit trailer, if any.
+        queued_at: Unix time the checkpoint was queued.
+    """
+
+    workflow: str
+    action: str
+    session_id: str | None
+    queued_at: float
+
+
+def _coalesced_message(actions: list[str]) -> tuple[str, tuple[str, ...]]:
+    """Build the subject action and body lines of a coalesced commit.
+
+    Args:
+        actions: Queued actions in order. Repeated actions are listed once.
+
+    Returns:
+        Tuple of (subject action, body lines). There are no body lines if
+        all actions are the same.
+    """
+    distinct = list(dict.fromkeys(actions))
+    if len(distinct) == 1:
+        return distinct[0], ()
+    return f"{distinct[0]} (+{len(distinct) - 1} more)", tuple(distinct)
+
+
+class CheckpointScheduler:
+    """Coalesces checkpoint commits per workflow.
+
+    Has the same ``checkpoint`` signature as OapsRepository, so it can be
+    passed to the spec and idea managers in place of the repository. Every
+    call opens its own connection to the queue, so a scheduler can be shared
+    between threads and the queue between processes.
+
+    Attributes:
+        _repo: Repository the checkpoints are committed to.
+        _interval: Minimum seconds between commits of one workflow.
+        _db_path: Path to the queue database.
+        _clock: Source of the current Unix time.
+        _ready: Whether the schema has been created by this instance.
+    """
+
+    __slots__: Final = ("_clock", "_db_path", "_interval", "_ready", "_repo")
+
+    _repo: OapsRepository
+    _interval: float
+    _db_path: Path
+    _clock: Callable[[], float]
+    _ready: bool
+
+    def __init__(
+        self,
+        repo: OapsRepository,
+        *,
+        interval: float = 0.0,
+        db_path: Path | str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the scheduler. The queue is created on first use.
+
+        Args:
+            repo: Repository the checkpoints are committed to.
+            interval: Minimum seconds between commits of one workflow. With
+                0, every checkpoint is committed immediately, together with
+                any actions still queued.
+            db_path: Path to the queue database. Defaults to
+                ``CHECKPOINT_QUEUE_NAME`` in the repository's git directory.
+            clock: Source of the current Unix time.
+        """
+        self._repo = repo
+        self._interval = max(interval, 0.0)
+        self._db_path = (
+            Path(db_path)
+            if db_path is not None
+            else repo.git_dir / CHECKPOINT_QUEUE_NAME
+        )
+        self._clock = clock
+        self._ready = False
+
+    @property
+    def interval(self) -> float:
+        """Minimum seconds between commits of one workflow."""
+        return self._interval
+
+    @property
+    def db_path(self) -> Path:
+        """Path to the queue database."""
+        return self._db_path
+
+    # --- Connections ---
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in a write transaction, rolling back on error."""
+        if not self._ready:
+            self._ensure_schema()
+        with closing(
+            sqlite3.connect(self._db_path, autocommit=True, timeout=_BUSY_TIMEOUT)
+        ) as conn:
+            _ = conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                _ = conn.execute("ROLLBACK")
+                raise
+            _ = conn.execute("COMMIT")
+
+    def _ensure_schema(self) -> None:
+        """Create the queue database and its tables."""
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        with connect(str(self._db_path), autocommit=True) as conn:
+            _ = conn.executescript(_SCHEMA)
+        self._ready = True
+
+    # --- Checkpoints ---
+
+    def checkpoint(
+        self, workflow: str, action: str, *, session_id: str | None = None
+    ) -> CommitResult:
+        """Queue a checkpoint and commit the workflow's queue if it is due.
+
+        Args:
+            workflow: The workflow name used as the commit scope.
+            action: Description of the action being checkpointed.
+            session_id: Optional session identifier for the commit trailer.
+
+        Returns:
+            CommitResult of the coalesced commit. ``no_changes`` is True if
+            the checkpoint was queued for a later commit.
+
+        Raises:
+            OapsRepositoryConflictError: If another process committed changes
+                between staging and committing. The actions stay queued.
+        """
+        if self._interval == 0 and not self._db_path.exists():
+            # Nothing can be queued, so skip creating the queue
+            return self._repo.checkpoint(workflow, action, session_id=session_id)
+
+        now = self._clock()
+        with self._write() as conn:
+            _ = conn.execute(
+                "INSERT INTO pending_checkpoints "
+                "(workflow, action, session_id, queued_at) VALUES (?, ?, ?, ?)",
+                (workflow, action, session_id, now),
+            )
+        with self._write() as conn:
+            row = conn.execute(
+                "SELECT committed_at FROM last_checkpoints WHERE workflow = ?",
+                (workflow,),
+            ).fetchone()
+            if row is not None and now - cast("float", row[0]) < self._interval:
+                return _DEFERRED
+            return self._commit_queued(conn, workflow, now)
+
+    def flush(self, workflow: str | None = None) -> list[CommitResult]:
+        """Commit all queued checkpoints, regardless of the interval.
+
+        Args:
+            workflow: Only flush this workflow. If None, flush all workflows.
+
+        Returns:
+            One CommitResult per workflow that had queued checkpoints.
+        """
+        if not self._db_path.exists():
+            return []
+        now = self._clock()
+        with self._write() as conn:
+            if workflow is None:
+                rows = conn.execute(
+                    "SELECT DISTINCT workflow FROM pending_checkpoints "
+                    "ORDER BY workflow"
+                ).fetchall()
+                workflows = [cast("str", r[0]) for r in rows]
+            else:
+                workflows = [workflow]
+            return [
+                result
+                for name in workflows
+                if (result := self._commit_queued(conn, name, now)) is not _DEFERRED
+            ]
+
+    def pending(self, workflow: str | None = None) -> list[PendingCheckpoint]:
+        """List queued checkpoints in the order they were made.
+
+        Args:
+            workflow: Only list this workflow. If None, list all workflows.
+
+        Returns:
+            The queued checkpoints.
+        """
+        if not self._db_path.exists():
+            return []
+        sql = "SELECT workflow, action, session_id, queued_at FROM pending_checkpoints"
+        params: tuple[str, ...] = ()
+        if workflow is not None:
+            sql += " WHERE workflow = ?"
+            params = (workflow,)
+        with self._write() as conn:
+            rows = conn.execute(f"{sql} ORDER BY id", params).fetchall()
+        return [
+            PendingCheckpoint(
+                workflow=cast("str", r[0]),
+                action=cast("str", r[1]),
+                session_id=cast("str | None", r[2]),
+                queued_at=cast("float", r[3]),
+            )
+            for r in rows
+        ]
+
+    def _commit_queued(
+        self, conn: sqlite3.Connection, workflow: str, now: float
+    ) -> CommitResult:
+        """Commit the queued actions of a workflow and clear them.
+
+        The commit includes every pending file, so the actions queued by
+        other workflows are listed after the workflow's own and cleared too.
+        Runs inside the caller's write transaction. If the commit fails, the
+        transaction is rolled back and the actions stay queued.
+
+        Args:
+            conn: Connection in a write transaction.
+            workflow: The workflow to commit.
+            now: Current Unix time, recorded as the workflow's last commit.
+
+        Returns:
+            CommitResult of the commit, or the deferred result if the
+            workflow had nothing queued.
+        """
+        # The workflow's own actions first, then the others' in queue order
+        rows = conn.execute(
+            "SELECT id, workflow, action, session_id FROM pending_checkpoints "
+            "ORDER BY workflow != ?, id",
+            (workflow,),
+        ).fetchall()
+        if not rows or rows[0][1] != workflow:
+            return _DEFERRED
+
+        actions = [
+            cast("str", r[2]) if r[1] == workflow else f"{r[1]}: {r[2]}" for r in rows
+        ]
+        latest = max(
+            (r for r in rows if r[3] is not None),
+            key=lambda r: cast("int", r[0]),
+            default=None,
+        )
+        action, details = _coalesced_message(actions)
+        result = self._repo.checkpoint(
+            workflow,
+            action,
+            session_id=cast("str", latest[3]) if latest is not None else None,
+            details=details,
+        )
+        _ = conn.execute(
+            "DELETE FROM pending_checkpoints WHERE id <= ?",
+            (max(cast("int", r[0]) for r in rows),),
+        )
+        _ = conn.executemany(
+            _SQL_RECORD_COMMIT,
+            [(name, now) for name in dict.fromkeys(cast("str", r[1]) for r in rows)],
+        )
+        return result
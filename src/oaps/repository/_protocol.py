@@ -3,7 +3,7 @@
 
 This module defines a runtime-checkable Protocol that both OapsRepository
 and ProjectRepository satisfy, enabling type-safe dependency injection
-and testing with fakes.
+and testing with fakes, and a protocol for checkpoint commits.
 """
 
 from pathlib import Path
@@ -146,3 +146,29 @@ class RepositoryProtocol(Protocol):
             Returns an empty list if the repository has no commits.
         """
         ...
+
+
+@runtime_checkable
+class CheckpointProtocol(Protocol):
+    """Protocol for creating workflow checkpoint commits.
+
+    OapsRepository commits each checkpoint immediately; CheckpointScheduler
+    coalesces checkpoints made in quick succession. The spec and idea
+    managers accept either.
+    """
+
+    def checkpoint(
+        self, workflow: str, action: str, *, session_id: str | None = None
+    ) -> CommitResult:
+        """Create (or schedule) a checkpoint commit for workflow state.
+
+        Args:
+            workflow: The workflow name used as the commit scope.
+            action: Description of the action being checkpointed.
+            session_id: Optional session identifier for the commit trailer.
+
+        Returns:
+            CommitResult of the commit. ``no_changes`` is True if nothing
+            was committed by this call.
+        """
+        ...
@@ -1,4 +1,3 @@
-# ruff: noqa: TC003  # Path needed at runtime for method bodies
 """OAPS repository management.
 
 This module provides the OapsRepository class for managing the .oaps/ git repository.
@@ -8,7 +7,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Final, override
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
 
 from oaps.exceptions import OapsRepositoryNotInitializedError
 from oaps.repository._base import BaseRepository
@@ -122,23 +121,31 @@ class OapsRepository(BaseRepository[OapsRepoStatus]):
         """
         return f"OAPS-Session: {session_id}"
 
-    def _build_commit_message(self, subject: str, *, session_id: str | None) -> bytes:
+    def _build_commit_message(
+        self, subject: str, *, session_id: str | None, details: Sequence[str] = ()
+    ) -> bytes:
         """Compose commit message with trailers.
 
         The message format includes:
         - Subject line
         - Blank line
+        - Body with one "- <detail>" line per detail (if details provided)
         - Co-authored-by trailer
         - Session trailer (if session_id provided)
 
         Args:
             subject: The commit subject line.
             session_id: Optional session identifier for trailer.
+            details: Optional lines listed in the commit body.
 
         Returns:
             Complete commit message as bytes.
         """
-        lines = [subject, "", self._format_oaps_coauthor()]
+        lines = [subject, ""]
+        if details:
+            lines.extend(f"- {detail}" for detail in details)
+            lines.append("")
+        lines.append(self._format_oaps_coauthor())
         if session_id is not None:
             lines.append(self._format_session_trailer(session_id))
         return "\n".join(lines).encode()
@@ -155,12 +162,28 @@ class OapsRepository(BaseRepository[OapsRepoStatus]):
         """
         return f"oaps({workflow}): {action}"
 
+    # =========================================================================
+    # OAPS-Specific Public Properties
+    # =========================================================================
+
+    @property
+    def git_dir(self) -> Path:
+        """The git control directory of the OAPS repository.
+
+        Files kept here (such as the checkpoint queue) are never staged.
+        """
+        return Path(self._repo.controldir())
+
     # =========================================================================
     # OAPS-Specific Public Commit Methods
     # =========================================================================
 
     def commit_pending(
-        self, message: str, *, session_id: str | None = None
+        self,
+        message: str,
+        *,
+        session_id: str | None = None,
+        details: Sequence[str] = (),
     ) -> CommitResult:
         """Commit all pending changes in the repository.
 
@@ -172,6 +195,7 @@ class OapsRepository(BaseRepository[OapsRepoStatus]):
             message: Commit message subject line.
             session_id: Optional session identifier included as a trailer
                 in the format "OAPS-Session: <session_id>".
+            details: Optional lines listed in the commit body.
 
         Returns:
             CommitResult containing:
@@ -199,7 +223,9 @@ class OapsRepository(BaseRepository[OapsRepoStatus]):
             return CommitResult(sha=None, files=frozenset(), no_changes=True)
 
         # Build commit message and perform commit
-        commit_message = self._build_commit_message(message, session_id=session_id)
+        commit_message = self._build_commit_message(
+            message, session_id=session_id, details=details
+        )
         return self._perform_commit(commit_message, staged_files)
 
     def commit_files(
@@ -251,7 +277,12 @@ class OapsRepository(BaseRepository[OapsRepoStatus]):
         return self._perform_commit(commit_message, staged_files)
 
     def checkpoint(
-        self, workflow: str, action: str, *, session_id: str | None = None
+        self,
+        workflow: str,
+        action: str,
+        *,
+        session_id: str | None = None,
+        details: Sequence[str] = (),
     ) -> CommitResult:
         """Create a checkpoint commit for workflow state.
 
@@ -266,6 +297,8 @@ class OapsRepository(BaseRepository[OapsRepoStatus]):
                 subject line after the colon (e.g., "create SPEC-0001").
             session_id: Optional session identifier included as a trailer
                 in the format "OAPS-Session: <session_id>".
+            details: Optional lines listed in the commit body, e.g. the
+                individual actions of a coalesced checkpoint.
 
         Returns:
             CommitResult containing:
@@ -289,4 +322,4 @@ class OapsRepository(BaseRepository[OapsRepoStatus]):
             ...     print(f"Checkpoint created: {result.sha[:8]}")
         """
         subject = self._format_checkpoint_subject(workflow, action)
-        return self.commit_pending(subject, session_id=session_id)
+        return self.commit_pending(subject, session_id=session_id, details=details)
@@ -0,0 +1,28 @@
+"""Full-text search for OAPS documents.
+
+This package provides SearchIndex, a SQLite FTS5 index of documents
+extracted from ideas, specifications, and artifacts, and the document and hit
+types it stores and returns.
+"""
+
+from oaps.search._index import (
+    SEARCH_FIELDS,
+    SEARCH_INDEX_NAME,
+    DocumentExtractor,
+    SearchDocument,
+    SearchField,
+    SearchHit,
+    SearchIndex,
+    build_match_query,
+)
+
+__all__ = [
+    "SEARCH_FIELDS",
+    "SEARCH_INDEX_NAME",
+    "DocumentExtractor",
+    "SearchDocument",
+    "SearchField",
+    "SearchHit",
+    "SearchIndex",
+    "build_match_query",
+]
@@ -0,0 +1,513 @@
+"""SQLite FTS5 full-text index over project documents.
+
+A SearchIndex keeps one SQLite database of searchable documents extracted
+from source files: an idea markdown file yields one document, a spec's
+requirements.json one per requirement. The database is a derived cache. Each
+source file is recorded with the size and modification time it was indexed
+at, so ``sync`` only re-extracts files that changed and drops files that were
+deleted, and deleting the database is always safe.
+
+Stores keep the index in the git-ignored cache directory of their data
+directory (``.cache/search.db``), so it is never committed and queries may
+freely bring it up to date.
+
+Stores keep the index current by calling ``update`` and ``remove`` from their
+mutation paths. Edits made outside of them (an editor, ``git checkout``) are
+picked up by the next ``sync``.
+
+Queries are matched against the title, tags, and body columns and ranked with
+BM25, weighting title matches above tag matches above body matches. Every
+query term is a prefix term, so ``auth`` matches ``authentication``, and all
+terms must match.
+
+Example:
+    >>> from pathlib import Path
+    >>> from oaps.search import SearchDocument, SearchIndex
+    >>> index = SearchIndex(Path("search.db"))
+    >>> index.update(Path("ideas/x.md"), [SearchDocument("idea", "x", "Cache")])
+    >>> [hit.doc_id for hit in index.search("cach")]
+    ['x']
+"""
+
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Literal, cast
+
+from oaps.utils.database import ensure_cache_schema, open_cache
+
+if TYPE_CHECKING:
+    import os
+    import sqlite3
+
+type SearchField = Literal["title", "tags", "body"]
+
+type DocumentExtractor = Callable[[Path], Iterable["SearchDocument"]]
+
+SEARCH_FIELDS: Final[tuple[SearchField, ...]] = ("title", "tags", "body")
+
+# File name of a store's search index inside its cache directory
+SEARCH_INDEX_NAME: Final = "search.db"
+
+_SCHEMA_VERSION: Final = 1
+
+# Files modified this recently may be rewritten within the same timestamp
+# tick, so their fingerprint is not trusted by the next sync
+_RACY_WINDOW_NS: Final = 2_000_000_000
+_UNTRUSTED_MTIME: Final = -1
+
+# BM25 column weights for title, tags, and body
+_RANK_WEIGHTS: Final = "10.0, 5.0, 1.0"
+
+_SNIPPET_TOKENS: Final = 16
+
+_TABLES: Final = ("search_sources", "search_documents", "search_text")
+
+_SCHEMA_STATEMENTS: Final = (
+    """
+CREATE TABLE IF NOT EXISTS search_sources (
+    source TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+) WITHOUT ROWID
+""",
+    """
+CREATE TABLE IF NOT EXISTS search_documents (
+    rowid INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    status TEXT,
+    type TEXT
+)
+""",
+    (
+        "CREATE INDEX IF NOT EXISTS idx_search_documents_source "
+        "ON search_documents (source)"
+    ),
+    (
+        "CREATE INDEX IF NOT EXISTS idx_search_documents_kind "
+        "ON search_documents (kind, scope)"
+    ),
+    """
+CREATE VIRTUAL TABLE IF NOT EXISTS search_text USING fts5(
+    title, tags, body,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+""",
+)
+
+_SQL_INSERT_DOCUMENT: Final = """
+INSERT INTO search_documents (source, kind, scope, doc_id, status, type)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_TEXT: Final = (
+    "INSERT INTO search_text (rowid, title, tags, body) VALUES (?, ?, ?, ?)"
+)
+
+_SQL_UPSERT_SOURCE: Final = """
+INSERT INTO search_sources (source, size, mtime_ns) VALUES (?, ?, ?)
+ON CONFLICT (source) DO UPDATE SET size = excluded.size, mtime_ns = excluded.mtime_ns
+"""
+
+_SQL_SEARCH: Final = f"""
+SELECT d.kind, d.doc_id, d.scope, t.title, d.status, d.type, d.source,
+       bm25(search_text, {_RANK_WEIGHTS}) AS score,
+       snippet(search_text, -1, ?, ?, '...', {_SNIPPET_TOKENS})
+FROM search_text AS t
+JOIN search_documents AS d ON d.rowid = t.rowid
+WHERE search_text MATCH ?
+"""  # noqa: S608 - constants only
+
+
+@dataclass(frozen=True, slots=True)
+class SearchDocument:
+    """A searchable document extracted from a source file.
+
+    Attributes:
+        kind: Document kind (e.g., "idea", "requirement", "artifact").
+        doc_id: Document identifier, unique within its kind and scope.
+        title: Document title.
+        body: Full text of the document.
+        tags: Tags, searched as their own column.
+        scope: Owning container, e.g. the spec ID of a requirement.
+        status: Status value for filtering.
+        doc_type: Type value for filtering.
+    """
+
+    kind: str
+    doc_id: str
+    title: str
+    body: str = ""
+    tags: tuple[str, ...] = ()
+    scope: str = ""
+    status: str | None = None
+    doc_type: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    """A ranked search result.
+
+    Attributes:
+        kind: Document kind.
+        doc_id: Document identifier.
+        scope: Owning container of the document.
+        title: Document title.
+        status: Document status.
+        doc_type: Document type.
+        source: Source file, relative to the index root.
+        score: BM25 score; lower is a better match.
+        snippet: Excerpt around the best match with matched terms
+            highlighted.
+    """
+
+    kind: str
+    doc_id: str
+    scope: str
+    title: str
+    status: str | None
+    doc_type: str | None
+    source: str
+    score: float
+    snippet: str
+
+
+def build_match_query(
+    query: str, fields: Iterable[SearchField] | None = None
+) -> str | None:
+    """Translate a user query into an FTS5 MATCH expression.
+
+    Each whitespace-separated term is quoted, so FTS5 operators and
+    punctuation in the query are searched for literally, and made a prefix
+    term. Terms without any letters or digits are dropped.
+
+    Args:
+        query: Free-text query.
+        fields: Columns to match against. Defaults to all of them.
+
+    Returns:
+        MATCH expression requiring every term, or None if the query has no
+        searchable terms.
+
+    Raises:
+        ValueError: If a field is not a search field.
+    """
+    terms = [
+        '"' + term.replace('"', '""') + '"*'
+        for term in (raw.rstrip("*") for raw in query.split())
+        if any(char.isalnum() for char in term)
+    ]
+    if not terms:
+        return None
+    expression = " AND ".join(terms)
+
+    if fields is None:
+        return expression
+    columns = list(dict.fromkeys(fields))
+    invalid = [field for field in columns if field not in SEARCH_FIELDS]
+    if invalid or not columns:
+        msg = (
+            f"Invalid search fields: {', '.join(invalid) or '(none)'}. "
+            f"Valid fields: {', '.join(SEARCH_FIELDS)}"
+        )
+        raise ValueError(msg)
+    if len(columns) == len(SEARCH_FIELDS):
+        return expression
+    return f"{{{' '.join(columns)}}} : ({expression})"
+
+
+def _fingerprint(st: os.stat_result) -> tuple[int, int]:
+    """Size and mtime recorded for a source, distrusting racy mtimes."""
+    if st.st_mtime_ns >= time.time_ns() - _RACY_WINDOW_NS:
+        return st.st_size, _UNTRUSTED_MTIME
+    return st.st_size, st.st_mtime_ns
+
+
+class SearchIndex:
+    """Full-text index of documents extracted from files under one root.
+
+    Every call opens its own connection, so an index can be shared between
+    processes and always reflects the latest committed changes.
+
+    Attributes:
+        _db_path: Path to the SQLite database.
+        _root: Directory that source paths are recorded relative to.
+        _ready: Whether the schema has been checked by this instance.
+    """
+
+    __slots__ = ("_db_path", "_ready", "_root")
+
+    def __init__(self, db_path: Path | str, *, root: Path | str | None = None) -> None:
+        """Initialize the index. The database is created on first use.
+
+        Args:
+            db_path: Path to the SQLite database.
+            root: Directory that source paths are stored relative to
+                (defaults to the database's directory).
+        """
+        self._db_path = Path(db_path)
+        self._root = Path(root) if root is not None else self._db_path.parent
+        self._ready = False
+
+    @property
+    def db_path(self) -> Path:
+        """Path to the SQLite database."""
+        return self._db_path
+
+    @property
+    def root(self) -> Path:
+        """Directory that source paths are stored relative to."""
+        return self._root
+
+    # --- Connections ---
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for reads, creating the schema if needed."""
+        self._ensure_schema()
+        with open_cache(self._db_path) as conn:
+            yield conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in a write transaction, rolling back on error."""
+        self._ensure_schema()
+        with open_cache(self._db_path, write=True) as conn:
+            yield conn
+
+    def _ensure_schema(self) -> None:
+        """Create the schema, discarding an index written by another version."""
+        if not self._ready:
+            ensure_cache_schema(
+                self._db_path, _SCHEMA_VERSION, _SCHEMA_STATEMENTS, drop=_TABLES
+            )
+            self._ready = True
+
+    # --- Writes ---
+
+    def _source_key(self, path: Path) -> str:
+        """Record a source path relative to the root when it is under it."""
+        try:
+            return path.relative_to(self._root).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    @staticmethod
+    def _delete_source(conn: sqlite3.Connection, source: str) -> None:
+        _ = conn.execute(
+            "DELETE FROM search_text WHERE rowid IN "
+            "(SELECT rowid FROM search_documents WHERE source = ?)",
+            (source,),
+        )
+        _ = conn.execute("DELETE FROM search_documents WHERE source = ?", (source,))
+        _ = conn.execute("DELETE FROM search_sources WHERE source = ?", (source,))
+
+    @staticmethod
+    def _insert_source(
+        conn: sqlite3.Connection,
+        source: str,
+        fingerprint: tuple[int, int],
+        documents: Iterable[SearchDocument],
+    ) -> None:
+        for doc in documents:
+            cursor = conn.execute(
+                _SQL_INSERT_DOCUMENT,
+                (source, doc.kind, doc.scope, doc.doc_id, doc.status, doc.doc_type),
+            )
+            _ = conn.execute(
+                _SQL_INSERT_TEXT,
+                (cursor.lastrowid, doc.title, " ".join(doc.tags), doc.body),
+            )
+        _ = conn.execute(_SQL_UPSERT_SOURCE, (source, *fingerprint))
+
+    def update(self, path: Path, documents: Iterable[SearchDocument]) -> None:
+        """Replace the documents indexed for a source file.
+
+        Args:
+            path: Source file the documents were extracted from. It must exist;
+                its size and modification time are recorded for ``sync``.
+            documents: Documents extracted from the file.
+
+        Raises:
+            OSError: If the file cannot be stat'ed.
+        """
+        fingerprint = _fingerprint(path.stat())
+        source = self._source_key(path)
+        with self._write() as conn:
+            self._delete_source(conn, source)
+            self._insert_source(conn, source, fingerprint, documents)
+
+    def remove(self, path: Path) -> None:
+        """Remove the documents indexed for a source file.
+
+        Args:
+            path: Source file that was deleted.
+        """
+        with self._write() as conn:
+            self._delete_source(conn, self._source_key(path))
+
+    def remove_tree(self, directory: Path) -> None:
+        """Remove the documents of every source file under a directory.
+
+        Args:
+            directory: Directory that was deleted.
+        """
+        with self._write() as conn:
+            sources = conn.execute(
+                "SELECT source FROM search_sources WHERE source >= ? AND source < ?",
+                self._prefix_range(directory),
+            ).fetchall()
+            for (source,) in sources:
+                self._delete_source(conn, cast("str", source))
+
+    def _prefix_range(self, directory: Path) -> tuple[str, str]:
+        """Source key bounds of the files under a directory."""
+        prefix = self._source_key(directory).rstrip("/") + "/"
+        # "0" sorts right after "/", so this is a range scan over the prefix
+        return prefix, prefix[:-1] + "0"
+
+    def sync(
+        self,
+        paths: Iterable[Path],
+        extract: DocumentExtractor,
+        *,
+        within: Path | None = None,
+    ) -> int:
+        """Bring the index in line with a set of source files.
+
+        Files whose size or modification time differ from the recorded ones
+        are re-extracted, files that are no longer listed are removed, and
+        all changes are written in one transaction.
+
+        Args:
+            paths: Every source file that should be indexed.
+            extract: Returns the documents of a source file. It should return
+                no documents for malformed files; files that cannot be read
+                are skipped.
+            within: Only remove unlisted files under this directory, for
+                indexes shared by several kinds of sources.
+
+        Returns:
+            Number of source files that were re-extracted or removed.
+        """
+        sql = "SELECT source, size, mtime_ns FROM search_sources"
+        params: tuple[str, ...] = ()
+        if within is not None:
+            sql += " WHERE source >= ? AND source < ?"
+            params = self._prefix_range(within)
+        with self._read() as conn:
+            recorded = {
+                cast("str", source): (cast("int", size), cast("int", mtime_ns))
+                for source, size, mtime_ns in conn.execute(sql, params)
+            }
+
+        changed: list[tuple[str, tuple[int, int], list[SearchDocument]]] = []
+        for path in paths:
+            source = self._source_key(path)
+            previous = recorded.pop(source, None)
+            try:
+                st = path.stat()
+                if previous == (st.st_size, st.st_mtime_ns):
+                    continue
+                documents = list(extract(path))
+            except OSError:
+                continue
+            changed.append((source, _fingerprint(st), documents))
+
+        if not changed and not recorded:
+            return 0
+        with self._write() as conn:
+            for source in recorded:
+                self._delete_source(conn, source)
+            for source, fingerprint, documents in changed:
+                self._delete_source(conn, source)
+                self._insert_source(conn, source, fingerprint, documents)
+        return len(changed) + len(recorded)
+
+    def clear(self) -> None:
+        """Remove every document from the index."""
+        with self._write() as conn:
+            for table in _TABLES:
+                _ = conn.execute(f"DELETE FROM {table}")  # noqa: S608
+
+    # --- Queries ---
+
+    def count(self, *, kind: str | None = None) -> int:
+        """Count indexed documents.
+
+        Args:
+            kind: Only count documents of this kind.
+
+        Returns:
+            Number of documents.
+        """
+        sql = "SELECT COUNT(*) FROM search_documents"
+        params: tuple[str, ...] = ()
+        if kind is not None:
+            sql += " WHERE kind = ?"
+            params = (kind,)
+        with self._read() as conn:
+            (count,) = conn.execute(sql, params).fetchone()
+        return cast("int", count)
+
+    def search(  # noqa: PLR0913
+        self,
+        query: str,
+        *,
+        fields: Iterable[SearchField] | None = None,
+        kinds: Iterable[str] | None = None,
+        scope: str | None = None,
+        status: str | None = None,
+        doc_type: str | None = None,
+        limit: int | None = 50,
+        highlight: tuple[str, str] = ("**", "**"),
+    ) -> list[SearchHit]:
+        """Search the index.
+
+        Args:
+            query: Free-text query; every term must match as a word prefix.
+            fields: Columns to match against. Defaults to title, tags, and
+                body.
+            kinds: Only return documents of these kinds.
+            scope: Only return documents in this scope.
+            status: Only return documents with this status.
+            doc_type: Only return documents of this type.
+            limit: Maximum number of hits, or None for all.
+            highlight: Markers placed around matched terms in snippets.
+
+        Returns:
+            Hits ordered from best to worst match. Empty if the query has no
+            searchable terms.
+
+        Raises:
+            ValueError: If a field is not a search field or limit is negative.
+        """
+        if limit is not None and limit < 0:
+            msg = f"limit must be non-negative, got {limit}"
+            raise ValueError(msg)
+        match = build_match_query(query, fields)
+        if match is None:
+            return []
+
+        sql = _SQL_SEARCH
+        params: list[object] = [*highlight, match]
+        if kinds is not None:
+            kind_list = list(kinds)
+            sql += f" AND d.kind IN ({', '.join('?' * len(kind_list))})"
+            params.extend(kind_list)
+        for column, value in (("scope", scope), ("status", status), ("type", doc_type)):
+            if value is not None:
+                sql += f" AND d.{column} = ?"
+                params.append(value)
+        sql += " ORDER BY score, d.rowid LIMIT ?"
+        params.append(-1 if limit is None else limit)
+
+        with self._read() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [SearchHit(*row) for row in rows]
@@ -0,0 +1,44 @@
+from pathlib import Path
+from typing import Annotated, cast
+
+from fastapi import Depends, HTTPException, Request, status
+
+from oaps.utils._async_state_store import AsyncStateDatabase
+
+
+def get_state_db(request: Request) -> AsyncStateDatabase:
+    """Get the state database opened by the app lifespan.
+
+    Raises:
+        HTTPException: 503 if no state database is available.
+    """
+    state_db = cast(
+        "AsyncStateDatabase | None", getattr(request.app.state, "state_db", None)
+    )
+    if state_db is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="State database not available",
+        )
+    return state_db
+
+
+StateDB = Annotated[AsyncStateDatabase, Depends(get_state_db)]
+
+
+def get_docs_dir(request: Request) -> Path:
+    """Get the docs directory found by the app lifespan.
+
+    Raises:
+        HTTPException: 503 if the server is not running in an OAPS project.
+    """
+    docs_dir = cast("Path | None", getattr(request.app.state, "docs_dir", None))
+    if docs_dir is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Docs directory not available",
+        )
+    return docs_dir
+
+
+DocsDir = Annotated[Path, Depends(get_docs_dir)]
@@ -1,9 +1,15 @@
 from fastapi import APIRouter
 
+from ._artifacts import router as artifacts_router
 from ._health import router as health_router
 from ._root import router as root_router
+from ._search import router as search_router
+from ._state import router as state_router
 
 router = APIRouter(prefix="/api")
 
+router.include_router(artifacts_router)
 router.include_router(health_router)
 router.include_router(root_router)
+router.include_router(search_router)
+router.include_router(state_router)
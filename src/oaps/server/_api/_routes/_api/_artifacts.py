@@ -0,0 +1,91 @@
+import mimetypes
+import re
+from typing import Annotated, Final
+
+from fastapi import APIRouter, Header, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+
+from oaps.exceptions import SpecArtifactNotFoundError, SpecNotFoundError
+from oaps.server._api._deps import DocsDir  # noqa: TC001 - resolved by FastAPI
+from oaps.spec import ArtifactManager, SpecManager
+
+router = APIRouter(prefix="/specs", tags=["artifacts"])
+
+# A single range of the "bytes" unit; other forms are ignored (RFC 9110 14.2)
+_RANGE_PATTERN: Final = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Parse a Range header into a half-open byte range.
+
+    Returns:
+        Tuple of (start, end), or None to serve the whole file because the
+        header is malformed or asks for several ranges.
+
+    Raises:
+        HTTPException: 416 if the range selects no bytes of the file.
+    """
+    match = _RANGE_PATTERN.fullmatch(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        end = min(int(last) + 1, size) if last else size
+    elif last:
+        # Suffix range: the last N bytes
+        start, end = max(size - int(last), 0), size
+    else:
+        return None
+    if start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE,
+            detail=f"Range not satisfiable: {header}",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
+
+
+# Artifact files are read from disk, so the handler is a plain function that
+# FastAPI runs in its threadpool; the body is streamed chunk by chunk
+
+
+@router.get("/{spec_id}/artifacts/{artifact_id}/content")
+def download_artifact(
+    docs_dir: DocsDir,
+    spec_id: str,
+    artifact_id: str,
+    range_header: Annotated[str | None, Header(alias="range")] = None,
+) -> Response:
+    manager = ArtifactManager(SpecManager(docs_dir / "specs"))
+    try:
+        path = manager.get_artifact_file_path(spec_id, artifact_id)
+        stat = path.stat()
+    except (SpecNotFoundError, SpecArtifactNotFoundError, FileNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    size = stat.st_size
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": f'W/"{size:x}-{stat.st_mtime_ns:x}"',
+        "Content-Disposition": f'inline; filename="{path.name}"',
+    }
+    byte_range = _parse_range(range_header, size) if range_header else None
+    if byte_range is None:
+        start, end = 0, size
+        status_code = status.HTTP_200_OK
+    else:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+    headers["Content-Length"] = str(end - start)
+
+    media_type, _ = mimetypes.guess_type(path.name)
+    return StreamingResponse(
+        manager.iter_artifact_content(spec_id, artifact_id, start=start, end=end),
+        status_code=status_code,
+        media_type=media_type or "application/octet-stream",
+        headers=headers,
+    )
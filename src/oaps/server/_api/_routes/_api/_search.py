@@ -0,0 +1,68 @@
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, HTTPException, Query, status
+
+from oaps.idea import IdeaManager, IdeaStatus, IdeaType
+from oaps.server._api._deps import DocsDir  # noqa: TC001 - resolved by FastAPI
+from oaps.server._schemas import SearchHitResponse, SearchResponse
+from oaps.spec import SpecManager
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+SearchFieldName = Literal["title", "tags", "body"]
+SpecSearchKind = Literal["spec", "requirement", "test", "document", "artifact"]
+
+# Search touches SQLite and the filesystem, so the handlers are plain
+# functions that FastAPI runs in its threadpool
+
+
+@router.get("/ideas")
+def search_ideas(  # noqa: PLR0913, PLR0917
+    docs_dir: DocsDir,
+    q: Annotated[str, Query(min_length=1)],
+    field: Annotated[list[SearchFieldName] | None, Query()] = None,
+    idea_status: Annotated[IdeaStatus | None, Query(alias="status")] = None,
+    idea_type: Annotated[IdeaType | None, Query(alias="type")] = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+) -> SearchResponse:
+    manager = IdeaManager(docs_dir / "ideas")
+    _ = manager.sync_search_index()
+    hits = manager.search_index.search(
+        q,
+        fields=field,
+        status=idea_status.value if idea_status is not None else None,
+        doc_type=idea_type.value if idea_type is not None else None,
+        limit=limit,
+    )
+    return SearchResponse(
+        query=q, results=[SearchHitResponse.from_hit(hit) for hit in hits]
+    )
+
+
+@router.get("/specs")
+def search_specs(  # noqa: PLR0913, PLR0917
+    docs_dir: DocsDir,
+    q: Annotated[str, Query(min_length=1)],
+    kind: Annotated[list[SpecSearchKind] | None, Query()] = None,
+    spec: Annotated[str | None, Query()] = None,
+    doc_status: Annotated[str | None, Query(alias="status")] = None,
+    field: Annotated[list[SearchFieldName] | None, Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+) -> SearchResponse:
+    manager = SpecManager(docs_dir / "specs")
+    try:
+        hits = manager.search(
+            q,
+            kinds=list(kind) if kind else None,
+            spec_id=spec,
+            status=doc_status,
+            fields=field,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        ) from e
+    return SearchResponse(
+        query=q, results=[SearchHitResponse.from_hit(hit) for hit in hits]
+    )
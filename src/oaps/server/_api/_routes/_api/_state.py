@@ -0,0 +1,66 @@
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, HTTPException, status
+
+from oaps.server._api._deps import StateDB  # noqa: TC001 - resolved by FastAPI
+from oaps.server._schemas import (
+    SessionSummaryResponse,
+    StateEntryResponse,
+    StateStoreResponse,
+)
+
+if TYPE_CHECKING:
+    from oaps.utils._async_state_store import AsyncStateStore
+
+router = APIRouter(prefix="/state", tags=["state"])
+
+
+async def _get_store(store: AsyncStateStore) -> StateStoreResponse:
+    entries = await store.entries()
+    return StateStoreResponse(
+        session_id=store.session_id,
+        entries=[StateEntryResponse.from_entry(entry) for entry in entries],
+    )
+
+
+async def _get_entry(store: AsyncStateStore, key: str) -> StateEntryResponse:
+    entry = await store.get_entry(key)
+    if entry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Key not found: {key}"
+        )
+    return StateEntryResponse.from_entry(entry)
+
+
+@router.get("/project")
+async def get_project_state(state_db: StateDB) -> StateStoreResponse:
+    return await _get_store(state_db.store())
+
+
+@router.get("/project/{key:path}")
+async def get_project_state_entry(state_db: StateDB, key: str) -> StateEntryResponse:
+    return await _get_entry(state_db.store(), key)
+
+
+@router.get("/sessions")
+async def list_state_sessions(state_db: StateDB) -> list[SessionSummaryResponse]:
+    summaries = await state_db.list_sessions()
+    return [SessionSummaryResponse.from_summary(summary) for summary in summaries]
+
+
+@router.get("/sessions/{session_id}")
+async def get_session_state(state_db: StateDB, session_id: str) -> StateStoreResponse:
+    store = state_db.store(session_id)
+    if await store.count() == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Session not found: {session_id}",
+        )
+    return await _get_store(store)
+
+
+@router.get("/sessions/{session_id}/{key:path}")
+async def get_session_state_entry(
+    state_db: StateDB, session_id: str, key: str
+) -> StateEntryResponse:
+    return await _get_entry(state_db.store(session_id), key)
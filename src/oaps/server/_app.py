@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, cast
 
 import httpx
+from dulwich.errors import NotGitRepository
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import StreamingResponse
 from tenacity import (
@@ -13,11 +14,15 @@ from tenacity import (
     wait_exponential,
 )
 
+from oaps.utils import get_oaps_dir, get_oaps_state_file
+from oaps.utils._async_state_store import AsyncStateDatabase
+
 from ._api import api_router
 from ._pages import router as pages_router
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
+    from pathlib import Path
 
 
 def _get_docs_port() -> int | None:
@@ -35,9 +40,37 @@ def _get_docs_port() -> int | None:
         return None
 
 
+def _get_state_db() -> AsyncStateDatabase | None:
+    """Get the state database for the current project.
+
+    Returns:
+        An unopened database, or None outside an OAPS project.
+    """
+    try:
+        db_path = get_oaps_state_file()
+    except NotGitRepository:
+        return None
+    if not db_path.parent.is_dir():
+        return None
+    return AsyncStateDatabase(db_path)
+
+
+def _get_docs_dir() -> Path | None:
+    """Get the docs directory holding ideas and specifications.
+
+    Returns:
+        The .oaps/docs directory, or None outside an OAPS project.
+    """
+    try:
+        docs_dir = get_oaps_dir() / "docs"
+    except NotGitRepository:
+        return None
+    return docs_dir if docs_dir.is_dir() else None
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
-    """Manage app lifespan, including httpx client for docs proxy.
+    """Manage app lifespan, including httpx client, state database, and docs.
 
     Args:
         app: The FastAPI application.
@@ -52,7 +85,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         )
     else:
         app.state.docs_client = None
+    state_db = _get_state_db()
+    if state_db is not None:
+        await state_db.open()
+    app.state.state_db = state_db
+    app.state.docs_dir = _get_docs_dir()
     yield
+    if state_db is not None:
+        await state_db.aclose()
     docs_client: httpx.AsyncClient | None = getattr(app.state, "docs_client", None)
     if docs_client is not None:
         await docs_client.aclose()
@@ -1,4 +1,14 @@
 from ._health import HealthResponse
 from ._root import RootResponse
+from ._search import SearchHitResponse, SearchResponse
+from ._state import SessionSummaryResponse, StateEntryResponse, StateStoreResponse
 
-__all__ = ["HealthResponse", "RootResponse"]
+__all__ = [
+    "HealthResponse",
+    "RootResponse",
+    "SearchHitResponse",
+    "SearchResponse",
+    "SessionSummaryResponse",
+    "StateEntryResponse",
+    "StateStoreResponse",
+]
@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING, Self
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from oaps.search import SearchHit
+
+
+class SearchHitResponse(BaseModel):
+    kind: str
+    id: str
+    scope: str
+    title: str
+    status: str | None
+    type: str | None
+    path: str
+    score: float
+    snippet: str
+
+    @classmethod
+    def from_hit(cls, hit: SearchHit) -> Self:
+        # BM25 scores are negative, lower is better; report higher-is-better
+        return cls(
+            kind=hit.kind,
+            id=hit.doc_id,
+            scope=hit.scope,
+            title=hit.title,
+            status=hit.status,
+            type=hit.doc_type,
+            path=hit.source,
+            score=-hit.score,
+            snippet=hit.snippet,
+        )
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: list[SearchHitResponse]
@@ -0,0 +1,63 @@
+import base64
+from typing import TYPE_CHECKING, Literal, Self
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from oaps.utils._async_state_store import SessionSummary
+    from oaps.utils._state_store import StateEntry
+
+
+class StateEntryResponse(BaseModel):
+    key: str
+    value: str | int | float | None
+    value_type: Literal["null", "integer", "real", "text", "blob"]
+    created_at: str
+    created_by: str | None
+    updated_at: str
+    updated_by: str | None
+
+    @classmethod
+    def from_entry(cls, entry: StateEntry) -> Self:
+        # JSON has no bytes type: blobs are sent base64-encoded
+        value = entry.value
+        match value:
+            case None:
+                value_type = "null"
+            case bytes():
+                value_type = "blob"
+                value = base64.b64encode(value).decode("ascii")
+            case int():
+                value_type = "integer"
+            case float():
+                value_type = "real"
+            case str():
+                value_type = "text"
+        return cls(
+            key=entry.key,
+            value=value,
+            value_type=value_type,
+            created_at=entry.created_at,
+            created_by=entry.created_by,
+            updated_at=entry.updated_at,
+            updated_by=entry.updated_by,
+        )
+
+
+class StateStoreResponse(BaseModel):
+    session_id: str | None
+    entries: list[StateEntryResponse]
+
+
+class SessionSummaryResponse(BaseModel):
+    session_id: str
+    key_count: int
+    last_updated: str
+
+    @classmethod
+    def from_summary(cls, summary: SessionSummary) -> Self:
+        return cls(
+            session_id=summary.session_id,
+            key_count=summary.key_count,
+            last_updated=summary.last_updated,
+        )
@@ -6,6 +6,7 @@ structures.
 """
 
 from oaps.spec._artifact_manager import ArtifactManager
+from oaps.spec._batch import SpecBatch
 from oaps.spec._history_manager import HistoryManager
 from oaps.spec._ids import (
     CrossReference,
@@ -17,17 +18,27 @@ from oaps.spec._ids import (
     next_sub_requirement_id,
     next_test_id,
     parse_cross_reference,
+    reserve_requirement_id,
+    reserve_spec_id,
+    reserve_test_id,
     validate_artifact_id,
     validate_cross_reference,
     validate_requirement_id,
     validate_spec_id,
     validate_test_id,
 )
+from oaps.spec._import import (
+    import_requirement_arguments,
+    import_test_arguments,
+    read_import_records,
+)
 from oaps.spec._io import (
     append_jsonl,
+    append_jsonl_entries,
     read_json,
     read_jsonl,
     read_markdown_frontmatter,
+    read_markdown_header,
     write_json_atomic,
     write_markdown_with_frontmatter,
 )
@@ -38,6 +49,7 @@ from oaps.spec._models import (
     ArtifactType,
     Counts,
     CoverageReport,
+    CriticalPath,
     DependencyGraph,
     DependencyNode,
     Document,
@@ -76,6 +88,13 @@ from oaps.spec._models import (
 )
 from oaps.spec._query_manager import QueryManager
 from oaps.spec._requirement_manager import RequirementManager
+from oaps.spec._results import (
+    iter_junit_results,
+    iter_report_results,
+    read_coverage_json,
+    read_test_results,
+)
+from oaps.spec._spec_graph import SpecGraph
 from oaps.spec._spec_manager import SpecManager, SpecValidationIssue
 from oaps.spec._test_manager import TestManager
 
@@ -87,6 +106,7 @@ __all__ = [
     "ArtifactsContainer",
     "Counts",
     "CoverageReport",
+    "CriticalPath",
     "CrossReference",
     "DependencyGraph",
     "DependencyNode",
@@ -114,6 +134,8 @@ __all__ = [
     "RequirementType",
     "RequirementsContainer",
     "RootIndex",
+    "SpecBatch",
+    "SpecGraph",
     "SpecManager",
     "SpecMetadata",
     "SpecNode",
@@ -132,15 +154,27 @@ __all__ = [
     "TypeProgress",
     "ValidationResult",
     "append_jsonl",
+    "append_jsonl_entries",
+    "import_requirement_arguments",
+    "import_test_arguments",
+    "iter_junit_results",
+    "iter_report_results",
     "next_artifact_id",
     "next_requirement_id",
     "next_spec_id",
     "next_sub_requirement_id",
     "next_test_id",
     "parse_cross_reference",
+    "read_coverage_json",
+    "read_import_records",
     "read_json",
     "read_jsonl",
     "read_markdown_frontmatter",
+    "read_markdown_header",
+    "read_test_results",
+    "reserve_requirement_id",
+    "reserve_spec_id",
+    "reserve_test_id",
     "validate_artifact_id",
     "validate_cross_reference",
     "validate_requirement_id",
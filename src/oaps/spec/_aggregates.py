@@ -0,0 +1,267 @@
+# pyright: reportAny=false, reportExplicitAny=false
+"""Progress and coverage counters of a specification.
+
+``QueryManager.progress`` and ``coverage`` used to load and scan every
+requirement and test of a spec on each call. The counters they report are
+now kept in the spec's index.json under ``aggregates``, recomputed by
+SpecManager whenever requirements.json or tests.json is written, so the
+reports are read from one small file:
+
+    "aggregates": {
+      "version": 1,
+      "requirements": {
+        "total": 3, "implemented": 1, "verified": 0, "covered": 1,
+        "by_status": {"proposed": 2, "implemented": 1},
+        "by_type": [{"req_type": "functional", "total": 3, ...}]
+      },
+      "tests": {
+        "total": 2, "orphaned": 0, "missing_file": 1,
+        "by_status": {"passing": 1, "pending": 1},
+        "by_method": [{"method": "unit", "total": 2, "passing": 1, ...}]
+      },
+      "requirement_to_tests": {"FR-0001": ["UT-0001"]},
+      "tested": ["FR-0001", "FR-0002"],
+      "untested": ["FR-0003"]
+    }
+
+A requirement is covered if a passing test verifies it, and tested if any
+test does. The counters are computed from the stored JSON records. The
+breakdowns are lists rather than objects, since the index is written with
+sorted keys, so they keep types and methods in the order they first appear
+in the records, as the scanning reports do.
+"""
+
+from collections import Counter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, cast
+
+from oaps.spec._models import (
+    CoverageReport,
+    MethodCoverage,
+    ProgressReport,
+    RequirementStatus,
+    RequirementType,
+    TestMethod,
+    TestResult,
+    TypeCoverage,
+    TypeProgress,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+__all__ = [
+    "AGGREGATES_VERSION",
+    "compute_aggregates",
+    "coverage_from_aggregates",
+    "diff_aggregates",
+    "progress_from_aggregates",
+]
+
+# Version of the aggregates layout; counters of other versions are ignored
+AGGREGATES_VERSION: Final = 1
+
+_IMPLEMENTED_STATUSES: Final = frozenset(
+    {RequirementStatus.IMPLEMENTED.value, RequirementStatus.VERIFIED.value}
+)
+
+
+def _percentage(part: int, total: int) -> float:
+    return (part / total * 100.0) if total > 0 else 0.0
+
+
+def compute_aggregates(
+    requirements: Sequence[Mapping[str, Any]], tests: Sequence[Mapping[str, Any]]
+) -> dict[str, Any]:
+    """Compute the counters of a spec from its stored records.
+
+    Args:
+        requirements: Requirement records from requirements.json.
+        tests: Test records from tests.json.
+
+    Returns:
+        The aggregates, ready to store in the spec index.
+    """
+    req_ids = {req["id"] for req in requirements}
+    passing_tests_by_req: dict[str, list[str]] = {}
+    tested: set[str] = set()
+    for test in tests:
+        linked = test.get("tests_requirements", [])
+        tested.update(linked)
+        if test.get("last_result") == TestResult.PASS.value:
+            for req_id in linked:
+                passing_tests_by_req.setdefault(req_id, []).append(test["id"])
+
+    by_type: dict[str, dict[str, Any]] = {}
+    for req in requirements:
+        counts = by_type.setdefault(
+            req["req_type"],
+            {
+                "req_type": req["req_type"],
+                "total": 0,
+                "implemented": 0,
+                "verified": 0,
+                "covered": 0,
+            },
+        )
+        counts["total"] += 1
+        counts["implemented"] += req["status"] in _IMPLEMENTED_STATUSES
+        counts["verified"] += req["status"] == RequirementStatus.VERIFIED.value
+        counts["covered"] += req["id"] in passing_tests_by_req
+
+    by_method: dict[str, dict[str, Any]] = {}
+    covered_by_method: dict[str, set[str]] = {}
+    for test in tests:
+        counts = by_method.setdefault(
+            test["method"], {"method": test["method"], "total": 0, "passing": 0}
+        )
+        counts["total"] += 1
+        if test.get("last_result") == TestResult.PASS.value:
+            counts["passing"] += 1
+            covered_by_method.setdefault(test["method"], set()).update(
+                req_id
+                for req_id in test.get("tests_requirements", [])
+                if req_id in req_ids
+            )
+    for method, counts in by_method.items():
+        counts["requirements_covered"] = len(covered_by_method.get(method, ()))
+
+    return {
+        "version": AGGREGATES_VERSION,
+        "requirements": {
+            "total": len(requirements),
+            "implemented": sum(c["implemented"] for c in by_type.values()),
+            "verified": sum(c["verified"] for c in by_type.values()),
+            "covered": sum(c["covered"] for c in by_type.values()),
+            "by_status": dict(Counter(req["status"] for req in requirements)),
+            "by_type": list(by_type.values()),
+        },
+        "tests": {
+            "total": len(tests),
+            "orphaned": sum(
+                not any(
+                    req_id in req_ids for req_id in test.get("tests_requirements", [])
+                )
+                for test in tests
+            ),
+            "missing_file": sum(
+                not test.get("file") or not test.get("function") for test in tests
+            ),
+            "by_status": dict(Counter(test["status"] for test in tests)),
+            "by_method": list(by_method.values()),
+        },
+        "requirement_to_tests": {
+            req["id"]: passing_tests_by_req[req["id"]]
+            for req in requirements
+            if req["id"] in passing_tests_by_req
+        },
+        "tested": sorted(req_ids & tested),
+        "untested": sorted(req_ids - tested),
+    }
+
+
+def diff_aggregates(
+    stored: Mapping[str, Any] | None, computed: Mapping[str, Any]
+) -> list[str]:
+    """List the counters that differ between two aggregates.
+
+    Args:
+        stored: The stored aggregates, or None if there are none.
+        computed: Freshly computed aggregates.
+
+    Returns:
+        Dotted paths of the differing counters, such as
+        ``requirements.by_status``. Empty if the aggregates match.
+    """
+    if stored is None:
+        return ["aggregates"]
+    differences: list[str] = []
+    for key, value in computed.items():
+        stored_value = stored.get(key)
+        if key in {"requirements", "tests"} and isinstance(stored_value, dict):
+            stored_counters = cast("dict[str, Any]", stored_value)
+            differences.extend(
+                f"{key}.{name}"
+                for name, counter in value.items()
+                if stored_counters.get(name) != counter
+            )
+        elif stored_value != value:
+            differences.append(key)
+    return differences
+
+
+def progress_from_aggregates(
+    spec_id: str, aggregates: Mapping[str, Any]
+) -> ProgressReport:
+    """Build a progress report from stored counters.
+
+    Args:
+        spec_id: The specification ID.
+        aggregates: The spec's aggregates.
+
+    Returns:
+        ProgressReport with implementation metrics.
+    """
+    reqs = aggregates["requirements"]
+    return ProgressReport(
+        spec_id=spec_id,
+        total_requirements=reqs["total"],
+        implemented_requirements=reqs["implemented"],
+        verified_requirements=reqs["verified"],
+        overall_percentage=_percentage(reqs["implemented"], reqs["total"]),
+        by_type=tuple(
+            TypeProgress(
+                req_type=RequirementType(counts["req_type"]),
+                total=counts["total"],
+                implemented=counts["implemented"],
+                verified=counts["verified"],
+                percentage=_percentage(counts["implemented"], counts["total"]),
+            )
+            for counts in reqs["by_type"]
+        ),
+    )
+
+
+def coverage_from_aggregates(
+    spec_id: str, aggregates: Mapping[str, Any]
+) -> CoverageReport:
+    """Build a coverage report from stored counters.
+
+    Args:
+        spec_id: The specification ID.
+        aggregates: The spec's aggregates.
+
+    Returns:
+        CoverageReport with coverage metrics.
+    """
+    reqs = aggregates["requirements"]
+    return CoverageReport(
+        spec_id=spec_id,
+        total_requirements=reqs["total"],
+        covered_requirements=reqs["covered"],
+        overall_coverage=_percentage(reqs["covered"], reqs["total"]),
+        by_method=tuple(
+            MethodCoverage(
+                method=TestMethod(counts["method"]),
+                total_tests=counts["total"],
+                passing_tests=counts["passing"],
+                requirements_covered=counts["requirements_covered"],
+            )
+            for counts in aggregates["tests"]["by_method"]
+        ),
+        by_type=tuple(
+            TypeCoverage(
+                req_type=RequirementType(counts["req_type"]),
+                total_requirements=counts["total"],
+                covered_requirements=counts["covered"],
+                coverage_percentage=_percentage(counts["covered"], counts["total"]),
+            )
+            for counts in reqs["by_type"]
+        ),
+        requirement_to_tests=MappingProxyType(
+            {
+                req_id: tuple(test_ids)
+                for req_id, test_ids in aggregates["requirement_to_tests"].items()
+            }
+        ),
+    )
@@ -16,22 +16,30 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Final
 
+from oaps.artifacts._content import DEFAULT_CHUNK_SIZE, hash_content, iter_content
+from oaps.artifacts._validation import write_validation_report
 from oaps.exceptions import (
     SpecArtifactNotFoundError,
     SpecNotFoundError,
     SpecValidationError,
 )
-from oaps.spec._io import append_jsonl
+from oaps.spec._history_log import append_history
 from oaps.spec._models import (
     Artifact,
     ArtifactStatus,
     ArtifactType,
     RebuildResult,
 )
+from oaps.spec._spec_manager import SpecValidationIssue
+from oaps.utils._frontmatter import split_frontmatter
+from oaps.utils._paths import get_cache_dir
+from oaps.utils._validation_cache import VALIDATION_CACHE_NAME, ValidationCache
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from oaps.artifacts import ArtifactStore
-    from oaps.repository import OapsRepository
+    from oaps.repository import CheckpointProtocol
     from oaps.spec._artifact_adapter import SpecArtifactAdapter
     from oaps.spec._spec_manager import SpecManager
 
@@ -122,6 +130,7 @@ class ArtifactManager:
         _spec_manager: The specification manager for accessing spec data.
         _stores_cache: Cache of ArtifactStore instances per spec.
         _adapter: Adapter for model conversion.
+        _validation_cache: Validation results shared by all specs' stores.
     """
 
     __slots__: Final = (
@@ -129,18 +138,20 @@ class ArtifactManager:
         "_oaps_repo",
         "_spec_manager",
         "_stores_cache",
+        "_validation_cache",
     )
 
     _adapter: SpecArtifactAdapter
-    _oaps_repo: OapsRepository | None
+    _oaps_repo: CheckpointProtocol | None
     _spec_manager: SpecManager
     _stores_cache: dict[str, ArtifactStore]
+    _validation_cache: ValidationCache | None
 
     def __init__(
         self,
         spec_manager: SpecManager,
         *,
-        oaps_repo: OapsRepository | None = None,
+        oaps_repo: CheckpointProtocol | None = None,
     ) -> None:
         """Initialize the artifact manager.
 
@@ -161,6 +172,7 @@ class ArtifactManager:
         )
         self._stores_cache = {}
         self._adapter = SpecArtifactAdapter()
+        self._validation_cache = None
 
     # -------------------------------------------------------------------------
     # Path Helpers
@@ -196,6 +208,20 @@ class ArtifactManager:
     # Store Management
     # -------------------------------------------------------------------------
 
+    @property
+    def validation_cache(self) -> ValidationCache:
+        """Artifact validation results of all specs (.cache/validation.db).
+
+        Its ``stats`` report how many artifacts ``validate_artifacts`` served
+        from the cache.
+        """
+        if self._validation_cache is None:
+            base_path = self._spec_manager.base_path
+            self._validation_cache = ValidationCache(
+                get_cache_dir(base_path) / VALIDATION_CACHE_NAME, root=base_path
+            )
+        return self._validation_cache
+
     def _get_or_create_store(self, spec_id: str) -> ArtifactStore:
         """Get or create an ArtifactStore for the given spec.
 
@@ -221,7 +247,14 @@ class ArtifactManager:
         from oaps.artifacts import ArtifactStore  # noqa: PLC0415
 
         # Create store with auto_index disabled - we manage index ourselves
-        store = ArtifactStore(spec_dir, auto_index=True)
+        store = ArtifactStore(
+            spec_dir,
+            auto_index=True,
+            search_index=self._spec_manager.search_index,
+            search_scope=spec_id,
+            validation_cache=self.validation_cache,
+            id_counters=self._spec_manager.id_counters,
+        )
         store.initialize()
 
         self._stores_cache[spec_id] = store
@@ -253,6 +286,10 @@ class ArtifactManager:
         Returns:
             True if commit was made, False if no repository or no changes.
         """
+        batch = self._spec_manager.active_batch
+        if batch is not None:
+            batch.record_action(action, self._oaps_repo)
+            return False
         if self._oaps_repo is None:
             return False
 
@@ -294,7 +331,11 @@ class ArtifactManager:
         if to_value is not None:
             entry["to_value"] = to_value
 
-        append_jsonl(self._history_path(spec_id), entry)
+        batch = self._spec_manager.active_batch
+        if batch is not None:
+            batch.record_history(self._history_path(spec_id), entry)
+            return
+        append_history(self._history_path(spec_id), [entry])
 
     # -------------------------------------------------------------------------
     # Query Methods
@@ -449,15 +490,84 @@ class ArtifactManager:
         if isinstance(raw_content, bytes):
             raw_content = raw_content.decode("utf-8")
 
-        # Extract body by splitting on frontmatter delimiters
-        # Frontmatter format: ---\n<yaml>\n---\n<body>
-        _frontmatter_parts_count = 3  # empty, frontmatter yaml, body
-        if raw_content.startswith("---"):
-            parts = raw_content.split("---", 2)
-            if len(parts) >= _frontmatter_parts_count:
-                # parts[0] is empty, parts[1] is frontmatter, parts[2] is body
-                return parts[2].lstrip("\n")
-        return raw_content
+        parts = split_frontmatter(raw_content)
+        return parts[1] if parts is not None else raw_content
+
+    def get_artifact_file_path(self, spec_id: str, artifact_id: str) -> Path:
+        """Get the absolute path of an artifact's content file.
+
+        Args:
+            spec_id: The specification ID.
+            artifact_id: The artifact ID.
+
+        Returns:
+            Path to the artifact file (not its sidecar metadata file).
+
+        Raises:
+            SpecNotFoundError: If the specification doesn't exist.
+            SpecArtifactNotFoundError: If the artifact doesn't exist.
+        """
+        store = self._get_or_create_store(spec_id)
+        generic_artifact = store.get_artifact(artifact_id)
+
+        if generic_artifact is None:
+            msg = f"Artifact not found: {artifact_id}"
+            raise SpecArtifactNotFoundError(
+                msg, artifact_id=artifact_id, spec_id=spec_id
+            )
+
+        return generic_artifact.file_path
+
+    def iter_artifact_content(
+        self,
+        spec_id: str,
+        artifact_id: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Stream a byte range of an artifact file, text or binary.
+
+        Text artifacts are streamed as stored, including their frontmatter.
+
+        Args:
+            spec_id: The specification ID.
+            artifact_id: The artifact ID.
+            start: First byte to read.
+            end: Byte after the last byte to read, or None for the end.
+            chunk_size: Maximum bytes per chunk.
+
+        Returns:
+            Iterator over the chunks; the file is read as it is consumed.
+
+        Raises:
+            SpecNotFoundError: If the specification doesn't exist.
+            SpecArtifactNotFoundError: If the artifact doesn't exist.
+        """
+        path = self.get_artifact_file_path(spec_id, artifact_id)
+        return iter_content(path, start=start, end=end, chunk_size=chunk_size)
+
+    def hash_artifact_content(
+        self, spec_id: str, artifact_id: str, *, algorithm: str = "sha256"
+    ) -> str:
+        """Compute the digest of an artifact file incrementally.
+
+        Args:
+            spec_id: The specification ID.
+            artifact_id: The artifact ID.
+            algorithm: Any algorithm ``hashlib.new`` accepts.
+
+        Returns:
+            Hex digest of the file content.
+
+        Raises:
+            SpecNotFoundError: If the specification doesn't exist.
+            SpecArtifactNotFoundError: If the artifact doesn't exist.
+            ValueError: If the algorithm is not supported.
+        """
+        path = self.get_artifact_file_path(spec_id, artifact_id)
+        return hash_content(path, algorithm=algorithm)
 
     # -------------------------------------------------------------------------
     # Mutation Methods
@@ -916,7 +1026,7 @@ class ArtifactManager:
 
         if not artifacts_dir.exists():
             # No artifacts directory - store.rebuild_index handles this
-            store.rebuild_index()
+            _ = store.rebuild_index()
             return RebuildResult(scanned=0, indexed=0, skipped=0, errors=())
 
         # Count files before rebuild (excluding sidecar files)
@@ -927,7 +1037,7 @@ class ArtifactManager:
         )
 
         # Delegate to store
-        store.rebuild_index()
+        _ = store.rebuild_index()
 
         # Invalidate cache to pick up new index
         self._invalidate_cache(spec_id)
@@ -956,3 +1066,49 @@ class ArtifactManager:
             skipped=skipped,
             errors=(),  # Store doesn't report individual errors
         )
+
+    def validate_artifacts(
+        self,
+        spec_id: str,
+        *,
+        strict: bool = False,
+        use_cache: bool = True,
+        workers: int | None = None,
+        report: Path | None = None,
+    ) -> list[SpecValidationIssue]:
+        """Validate the artifacts of a specification.
+
+        Checks metadata, artifact types, and that references resolve.
+        Results of artifacts whose metadata did not change since the last
+        run are reused from the validation cache; changed artifacts are
+        checked in a process pool when there are many of them.
+
+        Args:
+            spec_id: The specification ID.
+            strict: Also report gaps in artifact numbering.
+            use_cache: Reuse cached results of unchanged artifacts.
+            workers: Processes to check changed artifacts with. None picks
+                the number of available CPUs; 1 checks in-process.
+            report: Also write the errors to this Parquet (``.parquet``) or
+                JSON Lines file, sorted for diffing between runs.
+
+        Returns:
+            List of validation issues.
+
+        Raises:
+            SpecNotFoundError: If the specification doesn't exist.
+        """
+        store = self._get_or_create_store(spec_id)
+        errors = store.validate(strict=strict, use_cache=use_cache, workers=workers)
+        if report is not None:
+            _ = write_validation_report(errors, report)
+        return [
+            SpecValidationIssue(
+                spec_id=spec_id,
+                field=error.field or "artifact",
+                message=error.message,
+                severity=error.level,
+                related_id=error.artifact_id,
+            )
+            for error in errors
+        ]
@@ -0,0 +1,206 @@
+# pyright: reportExplicitAny=false
+"""Batched mutations of specification requirements, tests, and artifacts.
+
+Every RequirementManager and TestManager mutation rewrites the whole
+requirements.json or tests.json, appends one history line, and creates one
+git checkpoint, so importing hundreds of requirements means hundreds of full
+rewrites and commits. Inside ``SpecManager.batch``, the managers stage their
+changes in a SpecBatch instead:
+
+- Containers are kept in memory, and reads see the staged containers.
+- History entries are collected per history file.
+- Checkpoint actions are collected instead of committed.
+
+When the block exits, each changed file is written once, each history file
+gets one append, and one checkpoint commit is created. If the block raises,
+the staged changes are discarded. Artifact files are written as they are
+added, since each artifact is its own file; only their history entries and
+checkpoint are batched.
+
+Example:
+    >>> with spec_manager.batch("0001") as batch:
+    ...     for row in rows:
+    ...         requirement_manager.add_requirement("0001", ..., actor="import")
+    >>> batch.actions
+    ('add requirement 0001:FR-0001', 'add requirement 0001:FR-0002', ...)
+"""
+
+from typing import TYPE_CHECKING, Any, Final
+
+from oaps.spec._history_log import append_history
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from oaps.repository import CheckpointProtocol
+    from oaps.spec._models import RequirementsContainer, TestsContainer
+
+__all__ = ["SpecBatch"]
+
+
+class SpecBatch:
+    """Changes staged by the managers during a ``SpecManager.batch`` block.
+
+    Attributes:
+        _spec_id: Specification the batch was opened for.
+        _action: Checkpoint action for a batch of several changes.
+        _session_id: Session identifier for the checkpoint trailer.
+        _requirements: Staged requirements containers by spec ID.
+        _tests: Staged tests containers by spec ID.
+        _writes: Writers of the staged files, by kind and spec ID.
+        _history: History entries to append, by history file.
+        _actions: Checkpoint actions of the staged changes.
+        _repos: Repositories to create the checkpoint in.
+    """
+
+    __slots__: Final = (
+        "_action",
+        "_actions",
+        "_history",
+        "_repos",
+        "_requirements",
+        "_session_id",
+        "_spec_id",
+        "_tests",
+        "_writes",
+    )
+
+    _spec_id: str
+    _action: str | None
+    _session_id: str | None
+    _requirements: dict[str, RequirementsContainer]
+    _tests: dict[str, TestsContainer]
+    _writes: dict[tuple[str, str], Callable[[], None]]
+    _history: dict[Path, list[dict[str, Any]]]
+    _actions: list[str]
+    _repos: list[CheckpointProtocol]
+
+    def __init__(
+        self,
+        spec_id: str,
+        *,
+        action: str | None = None,
+        session_id: str | None = None,
+    ) -> None:
+        """Initialize an empty batch.
+
+        Args:
+            spec_id: Specification the batch is opened for.
+            action: Checkpoint action if the batch holds several changes.
+                Defaults to "batch <spec_id>: <count> changes".
+            session_id: Optional session identifier for the checkpoint trailer.
+        """
+        self._spec_id = spec_id
+        self._action = action
+        self._session_id = session_id
+        self._requirements = {}
+        self._tests = {}
+        self._writes = {}
+        self._history = {}
+        self._actions = []
+        self._repos = []
+
+    @property
+    def spec_id(self) -> str:
+        """Specification the batch was opened for."""
+        return self._spec_id
+
+    @property
+    def session_id(self) -> str | None:
+        """Session identifier for the checkpoint trailer."""
+        return self._session_id
+
+    @property
+    def actions(self) -> tuple[str, ...]:
+        """Checkpoint actions of the staged changes, in order."""
+        return tuple(self._actions)
+
+    @property
+    def pending_writes(self) -> int:
+        """Number of files to write when the batch is applied."""
+        return len(self._writes)
+
+    # --- Staging ---
+
+    def staged_requirements(self, spec_id: str) -> RequirementsContainer | None:
+        """Get the staged requirements of a spec, if any were changed."""
+        return self._requirements.get(spec_id)
+
+    def staged_tests(self, spec_id: str) -> TestsContainer | None:
+        """Get the staged tests of a spec, if any were changed."""
+        return self._tests.get(spec_id)
+
+    def stage_requirements(
+        self, container: RequirementsContainer, write: Callable[[], None]
+    ) -> None:
+        """Stage the requirements of a spec.
+
+        Args:
+            container: The changed requirements container.
+            write: Writes the container to disk when the batch is applied.
+        """
+        self._requirements[container.spec_id] = container
+        self._writes["requirements", container.spec_id] = write
+
+    def stage_tests(self, container: TestsContainer, write: Callable[[], None]) -> None:
+        """Stage the tests of a spec.
+
+        Args:
+            container: The changed tests container.
+            write: Writes the container to disk when the batch is applied.
+        """
+        self._tests[container.spec_id] = container
+        self._writes["tests", container.spec_id] = write
+
+    def record_history(self, path: Path, entry: dict[str, Any]) -> None:
+        """Stage a history entry.
+
+        Args:
+            path: History file to append the entry to.
+            entry: The history entry.
+        """
+        self._history.setdefault(path, []).append(entry)
+
+    def record_action(self, action: str, repo: CheckpointProtocol | None) -> None:
+        """Stage a checkpoint action.
+
+        Args:
+            action: Action the change would have been committed with.
+            repo: Repository the change would have been committed to.
+        """
+        self._actions.append(action)
+        if repo is not None and all(repo is not other for other in self._repos):
+            self._repos.append(repo)
+
+    # --- Applying ---
+
+    def write(self) -> None:
+        """Write the staged files and history entries."""
+        for write in self._writes.values():
+            write()
+        for path, entries in self._history.items():
+            append_history(path, entries)
+
+    def commit(self) -> bool:
+        """Create one checkpoint commit for the staged actions.
+
+        Returns:
+            True if a commit was made, False if there was no repository or
+            no changes.
+        """
+        if not self._actions:
+            return False
+        if len(self._actions) == 1:
+            action = self._actions[0]
+        else:
+            action = (
+                self._action or f"batch {self._spec_id}: {len(self._actions)} changes"
+            )
+        committed = False
+        for repo in self._repos:
+            result = repo.checkpoint(
+                workflow="spec", action=action, session_id=self._session_id
+            )
+            committed = committed or not result.no_changes
+        return committed
@@ -0,0 +1,441 @@
+# pyright: reportAny=false, reportMissingTypeStubs=false
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+# pyright: reportUnknownArgumentType=false, reportUnknownParameterType=false
+"""Columnar export of every specification to Parquet.
+
+The spec commands show one specification at a time as JSON, YAML or a
+table. ``export_specs`` writes the whole corpus as normalized Parquet
+tables instead, for reporting across specifications with DuckDB, polars,
+or any other Arrow reader:
+
+- ``specs``: one row per specification.
+- ``requirements``, ``tests``, ``artifacts``: one row per item, with its
+  ``spec_id``.
+- ``relationships``: one row per forward relationship (depends_on,
+  extends, supersedes, integrates) from ``spec_id`` to ``target_id``.
+- ``history``: one row per history event, with its ``spec_id``. Events
+  of the specs directory's own log (created, archived, deleted, ...) are
+  in ``history/_specs.parquet``.
+
+Each table is a directory with one file per specification
+(``requirements/0001.parquet``), so a glob over a directory reads a whole
+table. Specifications are exported one at a time, and history is written
+in record batches, so memory use does not grow with the size of the
+corpus. ``manifest.json`` records the sizes and modification times of
+each specification's files; later exports only rewrite the files of
+specifications that changed and delete those of removed specifications.
+
+Example:
+    >>> export_specs(Path(".oaps/docs/specs"), Path("export"))
+    >>> duckdb.sql("SELECT status, count(*) FROM 'export/tests/*.parquet' GROUP BY 1")
+    >>> pl.scan_parquet("export/requirements/*.parquet").collect()
+"""
+
+import hashlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from oaps.spec._artifact_manager import ArtifactManager
+from oaps.spec._history_log import HistoryLog
+from oaps.spec._requirement_manager import RequirementManager
+from oaps.spec._spec_manager import SpecManager
+from oaps.spec._test_manager import TestManager
+from oaps.utils._paths import CACHE_DIR_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from oaps.spec._models import SpecMetadata
+
+__all__ = ["EXPORT_TABLES", "SpecExportResult", "export_specs"]
+
+_EXPORT_VERSION: Final = 1
+
+_MANIFEST: Final = "manifest.json"
+
+# Name of the history file, and manifest key, of the specs directory's log
+_ROOT_HISTORY: Final = "_specs"
+
+# History rows per Arrow record batch
+_BATCH_SIZE: Final = 5_000
+
+_TIMESTAMP: Final = pa.timestamp("us", tz="UTC")
+
+_STRINGS: Final = pa.list_(pa.string())
+
+# Columns after spec_id are attributes of the exported models
+_SCHEMAS: Final = {
+    "specs": pa.schema(
+        [
+            ("spec_id", pa.string()),
+            ("slug", pa.string()),
+            ("title", pa.string()),
+            ("spec_type", pa.string()),
+            ("status", pa.string()),
+            ("created", _TIMESTAMP),
+            ("updated", _TIMESTAMP),
+            ("version", pa.string()),
+            ("authors", _STRINGS),
+            ("reviewers", _STRINGS),
+            ("tags", _STRINGS),
+            ("summary", pa.string()),
+        ]
+    ),
+    "requirements": pa.schema(
+        [
+            ("spec_id", pa.string()),
+            ("id", pa.string()),
+            ("title", pa.string()),
+            ("req_type", pa.string()),
+            ("status", pa.string()),
+            ("created", _TIMESTAMP),
+            ("updated", _TIMESTAMP),
+            ("author", pa.string()),
+            ("description", pa.string()),
+            ("rationale", pa.string()),
+            ("acceptance_criteria", _STRINGS),
+            ("verified_by", _STRINGS),
+            ("depends_on", _STRINGS),
+            ("tags", _STRINGS),
+            ("source_section", pa.string()),
+            ("parent", pa.string()),
+            ("subtype", pa.string()),
+            ("scale", pa.string()),
+            ("meter", pa.string()),
+            ("baseline", pa.float64()),
+            ("goal", pa.float64()),
+            ("stretch", pa.float64()),
+            ("fail", pa.float64()),
+        ]
+    ),
+    "tests": pa.schema(
+        [
+            ("spec_id", pa.string()),
+            ("id", pa.string()),
+            ("title", pa.string()),
+            ("method", pa.string()),
+            ("status", pa.string()),
+            ("created", _TIMESTAMP),
+            ("updated", _TIMESTAMP),
+            ("author", pa.string()),
+            ("tests_requirements", _STRINGS),
+            ("description", pa.string()),
+            ("file", pa.string()),
+            ("function", pa.string()),
+            ("last_run", _TIMESTAMP),
+            ("last_result", pa.string()),
+            ("tags", _STRINGS),
+            ("last_value", pa.float64()),
+            ("threshold", pa.float64()),
+            ("perf_baseline", pa.float64()),
+            ("steps", _STRINGS),
+            ("expected_result", pa.string()),
+            ("actual_result", pa.string()),
+            ("tested_by", pa.string()),
+            ("tested_on", _TIMESTAMP),
+        ]
+    ),
+    "artifacts": pa.schema(
+        [
+            ("spec_id", pa.string()),
+            ("id", pa.string()),
+            ("artifact_type", pa.string()),
+            ("title", pa.string()),
+            ("status", pa.string()),
+            ("created", _TIMESTAMP),
+            ("updated", _TIMESTAMP),
+            ("author", pa.string()),
+            ("file_path", pa.string()),
+            ("description", pa.string()),
+            ("subtype", pa.string()),
+            ("references", _STRINGS),
+            ("tags", _STRINGS),
+            ("supersedes", pa.string()),
+            ("superseded_by", pa.string()),
+            ("summary", pa.string()),
+            # JSON object of the type-specific fields
+            ("type_fields", pa.string()),
+            ("metadata_file_path", pa.string()),
+        ]
+    ),
+    "relationships": pa.schema(
+        [
+            ("spec_id", pa.string()),
+            ("relationship", pa.string()),
+            ("target_id", pa.string()),
+        ]
+    ),
+    # Raw history entries; values other than strings are stored as JSON
+    "history": pa.schema(
+        [
+            ("spec_id", pa.string()),
+            ("timestamp", _TIMESTAMP),
+            ("event", pa.string()),
+            ("actor", pa.string()),
+            ("command", pa.string()),
+            ("id", pa.string()),
+            ("target", pa.string()),
+            ("from_value", pa.string()),
+            ("to_value", pa.string()),
+            ("result", pa.string()),
+            ("reason", pa.string()),
+        ]
+    ),
+}
+
+EXPORT_TABLES: Final = tuple(_SCHEMAS)
+
+
+@dataclass(frozen=True, slots=True)
+class SpecExportResult:
+    """Result of exporting specifications to Parquet.
+
+    Attributes:
+        exported: IDs of the specifications whose files were written.
+        unchanged: IDs of the specifications skipped because none of their
+            files changed since the last export.
+        removed: IDs of the specifications whose files were deleted because
+            they no longer exist.
+    """
+
+    exported: tuple[str, ...]
+    unchanged: tuple[str, ...]
+    removed: tuple[str, ...]
+
+
+def _column_value(value: object) -> object:
+    """Convert a model attribute to an Arrow-compatible value."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, tuple):
+        return list(value)
+    if isinstance(value, Mapping):
+        return orjson.dumps(dict(value), option=orjson.OPT_SORT_KEYS).decode()
+    return value
+
+
+def _model_table(spec_id: str, table: str, items: Iterable[object]) -> pa.Table:
+    """Build a table of model instances, one row per instance."""
+    schema = _SCHEMAS[table]
+    names = schema.names[1:]
+    rows = [
+        {"spec_id": spec_id}
+        | {name: _column_value(getattr(item, name)) for name in names}
+        for item in items
+    ]
+    return pa.Table.from_pylist(rows, schema=schema)
+
+
+def _relationships_table(metadata: SpecMetadata) -> pa.Table:
+    """Build the table of a specification's forward relationships."""
+    relationships = metadata.relationships
+    targets = {
+        "depends_on": relationships.depends_on,
+        "extends": (relationships.extends,) if relationships.extends else (),
+        "supersedes": (relationships.supersedes,) if relationships.supersedes else (),
+        "integrates": relationships.integrates,
+    }
+    rows = [
+        {"spec_id": metadata.id, "relationship": name, "target_id": target}
+        for name, values in targets.items()
+        for target in values
+    ]
+    return pa.Table.from_pylist(rows, schema=_SCHEMAS["relationships"])
+
+
+def _history_batches(log: HistoryLog, spec_id: str | None) -> Iterator[pa.RecordBatch]:
+    """Stream a history log as record batches, newest first.
+
+    Args:
+        log: The history log.
+        spec_id: Specification of every entry, or None to take it from the
+            ``id`` of each entry, as in the specs directory's own log.
+    """
+    schema = _SCHEMAS["history"]
+    names = schema.names[2:]
+    rows: list[dict[str, object]] = []
+    for entry in log.newest_first():
+        row: dict[str, object] = {
+            "spec_id": entry.get("id") if spec_id is None else spec_id,
+            "timestamp": datetime.fromisoformat(entry["timestamp"]),
+        }
+        for name in names:
+            value = entry.get(name)
+            row[name] = (
+                value
+                if value is None or isinstance(value, str)
+                else orjson.dumps(value).decode()
+            )
+        rows.append(row)
+        if len(rows) == _BATCH_SIZE:
+            yield pa.RecordBatch.from_pylist(rows, schema=schema)
+            rows = []
+    if rows:
+        yield pa.RecordBatch.from_pylist(rows, schema=schema)
+
+
+def _spec_signature(spec_dir: Path) -> str:
+    """Digest the paths, sizes, and modification times of a spec's files.
+
+    Files in cache directories (e.g. an artifact store's rebuild manifest)
+    are derived from the others and skipped.
+    """
+    hasher = hashlib.sha256(f"{_EXPORT_VERSION}\n".encode())
+    for path in sorted(spec_dir.rglob("*")):
+        relative = path.relative_to(spec_dir)
+        if CACHE_DIR_NAME in relative.parts or not path.is_file():
+            continue
+        stat = path.stat()
+        entry = f"{relative.as_posix()}\0{stat.st_size}"
+        hasher.update(f"{entry}\0{stat.st_mtime_ns}\n".encode())
+    return hasher.hexdigest()
+
+
+def _temporary(path: Path) -> Path:
+    """Get the path a file is written to before it replaces ``path``."""
+    return path.with_name(f".{path.name}.tmp")
+
+
+def _write_table(path: Path, table: pa.Table) -> None:
+    """Write a table to a Parquet file, replacing it atomically."""
+    temporary = _temporary(path)
+    pq.write_table(table, temporary)
+    _ = temporary.replace(path)
+
+
+def _write_history(path: Path, log: HistoryLog, spec_id: str | None) -> None:
+    """Write a history log to a Parquet file batch by batch."""
+    temporary = _temporary(path)
+    with pq.ParquetWriter(temporary, _SCHEMAS["history"]) as writer:
+        for batch in _history_batches(log, spec_id):
+            writer.write_batch(batch)
+    _ = temporary.replace(path)
+
+
+def _export_spec(
+    spec_manager: SpecManager, metadata: SpecMetadata, output: Path
+) -> None:
+    """Write the files of every table for one specification."""
+    spec_id = metadata.id
+    spec_dir = spec_manager.base_path / f"{spec_id}-{metadata.slug}"
+    # Managers per spec, so their caches hold one spec at a time
+    requirements = RequirementManager(spec_manager)
+    tests = TestManager(spec_manager, requirements)
+    artifacts = ArtifactManager(spec_manager)
+
+    tables = {
+        "specs": _model_table(spec_id, "specs", [metadata]),
+        "requirements": _model_table(
+            spec_id, "requirements", requirements.list_requirements(spec_id)
+        ),
+        "tests": _model_table(spec_id, "tests", tests.list_tests(spec_id)),
+        "artifacts": _model_table(
+            spec_id, "artifacts", artifacts.list_artifacts(spec_id)
+        ),
+        "relationships": _relationships_table(metadata),
+    }
+    for table, data in tables.items():
+        _write_table(output / table / f"{spec_id}.parquet", data)
+
+    _write_history(
+        output / "history" / f"{spec_id}.parquet",
+        HistoryLog(spec_dir / "history.jsonl"),
+        spec_id,
+    )
+
+
+def _read_manifest(path: Path) -> dict[str, str]:
+    """Read the signatures of the last export, or none if unreadable."""
+    try:
+        data = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _EXPORT_VERSION:
+        return {}
+    specs = data.get("specs")
+    return dict(specs) if isinstance(specs, dict) else {}
+
+
+def export_specs(
+    base_path: Path | str, output_dir: Path | str, *, full: bool = False
+) -> SpecExportResult:
+    """Export every specification to a directory of Parquet tables.
+
+    Args:
+        base_path: Specifications directory.
+        output_dir: Directory to write the tables to. Created if missing.
+        full: Rewrite the files of every specification, not only of those
+            that changed since the last export.
+
+    Returns:
+        The specifications exported, skipped, and removed.
+
+    Raises:
+        SpecIOError: If a specification file cannot be read.
+        SpecParseError: If a specification file cannot be parsed.
+    """
+    base_path = Path(base_path)
+    output = Path(output_dir)
+    manifest_path = output / _MANIFEST
+    previous = {} if full else _read_manifest(manifest_path)
+    for table in EXPORT_TABLES:
+        (output / table).mkdir(parents=True, exist_ok=True)
+
+    spec_manager = SpecManager(base_path)
+    signatures: dict[str, str] = {}
+    exported: list[str] = []
+    unchanged: list[str] = []
+    for summary in spec_manager.list_specs(include_archived=True):
+        spec_id = summary.id
+        spec_dir = base_path / f"{spec_id}-{summary.slug}"
+        signature = _spec_signature(spec_dir)
+        if previous.get(spec_id) == signature and all(
+            (output / table / f"{spec_id}.parquet").exists() for table in EXPORT_TABLES
+        ):
+            signatures[spec_id] = signature
+            unchanged.append(spec_id)
+            continue
+        _export_spec(spec_manager, spec_manager.get_spec(spec_id), output)
+        # Reading artifacts creates a missing artifacts index
+        signatures[spec_id] = _spec_signature(spec_dir)
+        exported.append(spec_id)
+
+    # The specs directory's own log is appended to on every spec change
+    root_log = HistoryLog(spec_manager.history_path)
+    root_path = output / "history" / f"{_ROOT_HISTORY}.parquet"
+    try:
+        stat = root_log.path.stat()
+        signature = f"{stat.st_size}\0{stat.st_mtime_ns}"
+    except FileNotFoundError:
+        signature = ""
+    if previous.get(_ROOT_HISTORY) != signature or not root_path.exists():
+        _write_history(root_path, root_log, None)
+    signatures[_ROOT_HISTORY] = signature
+
+    removed = sorted(
+        {path.stem for path in (output / "specs").glob("*.parquet")} - set(signatures)
+    )
+    for spec_id in removed:
+        for table in EXPORT_TABLES:
+            (output / table / f"{spec_id}.parquet").unlink(missing_ok=True)
+
+    # Written last, so specs exported by an interrupted run are redone
+    _ = manifest_path.write_bytes(
+        orjson.dumps(
+            {"version": _EXPORT_VERSION, "specs": signatures},
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+        )
+    )
+    return SpecExportResult(
+        exported=tuple(exported),
+        unchanged=tuple(unchanged),
+        removed=tuple(removed),
+    )
@@ -0,0 +1,394 @@
+# pyright: reportAny=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+# pyright: reportExplicitAny=false
+"""Segmented, seekable storage of per-spec history logs.
+
+A spec's history used to be a single history.jsonl that every query read
+and parsed in full before sorting and applying the limit. HistoryLog keeps
+the log readable from the end instead:
+
+- Entries are read newest-first by scanning history.jsonl backward in
+  blocks, so a caller that stops after ``limit`` entries, or at the first
+  entry older than ``since``, never reads the rest of the file.
+- When history.jsonl reaches ``segment_bytes``, it is sealed into a
+  numbered segment (history.000001.jsonl, ...) and a new history.jsonl is
+  started, so the active file stays small.
+- history.index.json records, for each sealed segment, its first and last
+  timestamp and a sparse list of (timestamp, byte offset) pairs. Queries
+  with ``until`` skip segments that are entirely newer and seek into the
+  segment that contains ``until``; in history.jsonl they bisect on byte
+  offsets, since entries are appended in time order.
+
+Writers that append to history.jsonl directly stay compatible: a missing
+or outdated index entry is rebuilt from the segment on the next read.
+Sealing links the file to its segment name before unlinking it, so lines
+appended by another process while it is sealed end up in the segment.
+
+Example:
+    >>> log = HistoryLog(spec_dir / "history.jsonl")
+    >>> log.append([{"timestamp": "...", "event": "spec_created", ...}])
+    >>> latest = list(itertools.islice(log.newest_first(), 50))
+"""
+
+import os
+import re
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, BinaryIO, Final
+
+import orjson
+
+from oaps.exceptions import SpecIOError, SpecParseError
+from oaps.spec._io import append_jsonl_entries, read_json, write_json_atomic
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+__all__ = [
+    "HISTORY_INDEX_NAME",
+    "HISTORY_SEGMENT_BYTES",
+    "HistoryLog",
+    "append_history",
+]
+
+# Sidecar index of the sealed segments, next to history.jsonl
+HISTORY_INDEX_NAME: Final = "history.index.json"
+
+# Size at which history.jsonl is sealed into a segment
+HISTORY_SEGMENT_BYTES: Final = 4 * 1024 * 1024
+
+# Bytes read per step when scanning backward or bisecting
+_BLOCK_SIZE: Final = 64 * 1024
+
+# Minimum bytes between the offsets recorded for a segment
+_INDEX_SPACING: Final = 64 * 1024
+
+_INDEX_VERSION: Final = 1
+
+_SEGMENT_PATTERN: Final = re.compile(r"^history\.(\d{6})\.jsonl$")
+
+
+def _entry_time(raw: dict[str, Any], path: Path) -> datetime:
+    """Get the timestamp of a history entry.
+
+    Raises:
+        SpecParseError: If the entry has no timestamp.
+        ValueError: If the timestamp is not timezone-aware.
+    """
+    value = raw.get("timestamp")
+    if not isinstance(value, str):
+        msg = f"History entry without timestamp: {raw}"
+        raise SpecParseError(msg, path=path, content_type="jsonl")
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        msg = f"Timestamp must include timezone information: {timestamp}"
+        raise ValueError(msg)
+    return timestamp
+
+
+def _parse_line(line: bytes, path: Path) -> dict[str, Any]:
+    """Parse one JSONL line into an entry.
+
+    Raises:
+        SpecParseError: If the line is not a JSON object.
+    """
+    try:
+        data = orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        msg = f"Invalid JSON in history: {e}"
+        raise SpecParseError(msg, path=path, content_type="jsonl", cause=e) from e
+    if not isinstance(data, dict):
+        msg = f"Expected JSON object in history, got {type(data).__name__}"
+        raise SpecParseError(msg, path=path, content_type="jsonl")
+    return data
+
+
+def _reverse_lines(file: BinaryIO, end: int) -> Iterator[bytes]:
+    """Yield the non-blank lines before ``end``, last line first.
+
+    Args:
+        file: File opened in binary mode.
+        end: Offset of a line start, or the file size.
+    """
+    position = end
+    tail = b""
+    while position > 0:
+        start = max(0, position - _BLOCK_SIZE)
+        _ = file.seek(start)
+        block = file.read(position - start) + tail
+        position = start
+        lines = block.split(b"\n")
+        # The first piece may be the end of a line that starts further back
+        tail = lines.pop(0)
+        for line in reversed(lines):
+            if line.strip():
+                yield line
+    if tail.strip():
+        yield tail
+
+
+class HistoryLog:
+    """History log of one spec, split into sealed segments.
+
+    Attributes:
+        _path: Path to the active history.jsonl.
+        _segment_bytes: Size at which the active file is sealed.
+    """
+
+    __slots__: Final = ("_path", "_segment_bytes")
+
+    _path: Path
+    _segment_bytes: int
+
+    def __init__(
+        self, path: Path, *, segment_bytes: int = HISTORY_SEGMENT_BYTES
+    ) -> None:
+        """Initialize the log. Nothing is read until it is queried.
+
+        Args:
+            path: Path to the active history.jsonl.
+            segment_bytes: Size at which the active file is sealed into a
+                segment.
+        """
+        self._path = path
+        self._segment_bytes = segment_bytes
+
+    @property
+    def path(self) -> Path:
+        """Path to the active history.jsonl."""
+        return self._path
+
+    @property
+    def index_path(self) -> Path:
+        """Path to the segment index."""
+        return self._path.with_name(HISTORY_INDEX_NAME)
+
+    def segments(self) -> list[Path]:
+        """Sealed segments, oldest first."""
+        directory = self._path.parent
+        if not directory.is_dir():
+            return []
+        return sorted(
+            path for path in directory.iterdir() if _SEGMENT_PATTERN.match(path.name)
+        )
+
+    # --- Writing ---
+
+    def append(self, entries: Iterable[dict[str, Any]]) -> None:
+        """Append entries, sealing the active file first if it is full.
+
+        Args:
+            entries: History entries, in time order.
+
+        Raises:
+            SpecIOError: If the append operation fails.
+        """
+        try:
+            size = self._path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size >= self._segment_bytes:
+            self._seal()
+        append_jsonl_entries(self._path, entries)
+
+    def _seal(self) -> None:
+        """Move the active file to the next segment and index it."""
+        segments = self.segments()
+        number = 1
+        if segments:
+            try:
+                if self._path.samefile(segments[-1]):
+                    # Another process is sealing the file
+                    return
+            except FileNotFoundError:
+                return
+            match = _SEGMENT_PATTERN.match(segments[-1].name)
+            number = int(match.group(1)) + 1 if match else 1
+        segment = self._path.with_name(f"history.{number:06d}.jsonl")
+        try:
+            os.link(self._path, segment)
+        except FileExistsError:
+            # Another process sealed the file first
+            return
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            msg = f"Failed to seal history segment: {e}"
+            raise SpecIOError(msg, path=segment, operation="write", cause=e) from e
+        self._path.unlink(missing_ok=True)
+        _ = self._load_index()
+
+    # --- Index ---
+
+    def _index_segment(self, segment: Path) -> dict[str, Any]:
+        """Build the index entry of a sealed segment by reading it once."""
+        offsets: list[list[Any]] = []
+        first: str | None = None
+        last: str | None = None
+        next_offset = 0
+        position = 0
+        with segment.open("rb") as f:
+            for line in f:
+                start = position
+                position += len(line)
+                if not line.strip():
+                    continue
+                timestamp = _entry_time(_parse_line(line, segment), segment)
+                last = timestamp.isoformat()
+                if first is None:
+                    first = last
+                if start >= next_offset:
+                    offsets.append([last, start])
+                    next_offset = start + _INDEX_SPACING
+        return {
+            "name": segment.name,
+            "size": position,
+            "first": first,
+            "last": last,
+            "offsets": offsets,
+        }
+
+    def _load_index(self) -> list[dict[str, Any]]:
+        """Load the segment index, indexing segments it doesn't cover.
+
+        Returns:
+            Index entries of the sealed segments, oldest first.
+        """
+        stored: dict[str, dict[str, Any]] = {}
+        if self.index_path.exists():
+            data = read_json(self.index_path)
+            if data.get("version") == _INDEX_VERSION:
+                stored = {entry["name"]: entry for entry in data.get("segments", [])}
+
+        entries: list[dict[str, Any]] = []
+        changed = False
+        for segment in self.segments():
+            entry = stored.pop(segment.name, None)
+            if entry is None or entry["size"] != segment.stat().st_size:
+                entry = self._index_segment(segment)
+                changed = True
+            entries.append(entry)
+        if changed or stored:
+            write_json_atomic(
+                self.index_path, {"version": _INDEX_VERSION, "segments": entries}
+            )
+        return entries
+
+    # --- Reading ---
+
+    def _bisect(self, file: BinaryIO, size: int, until: datetime) -> int:
+        """Find a line start after every entry at or before ``until``.
+
+        Narrows the range by reading the line after the midpoint until it
+        is one block long; the bound may include a block of newer entries.
+        """
+        low, high = 0, size
+        while high - low > _BLOCK_SIZE:
+            middle = (low + high) // 2
+            _ = file.seek(middle)
+            _ = file.readline()
+            start = file.tell()
+            line = file.readline()
+            if start >= high or not line:
+                break
+            if not line.strip():
+                low = start + len(line)
+            elif _entry_time(_parse_line(line, self._path), self._path) > until:
+                high = start
+            else:
+                low = start + len(line)
+        return high
+
+    def _read_backward(
+        self, path: Path, end: int | None, until: datetime | None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the entries of one file newest-first, skipping newer ones.
+
+        Args:
+            path: The file to read.
+            end: Offset to read back from, or None to bisect for ``until``
+                or start at the end of the file.
+            until: Skip entries after this timestamp.
+        """
+        try:
+            f = path.open("rb")
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            msg = f"Failed to read file: {e}"
+            raise SpecIOError(msg, path=path, operation="read", cause=e) from e
+        with f:
+            if end is None:
+                size = os.fstat(f.fileno()).st_size
+                end = size if until is None else self._bisect(f, size, until)
+            for line in _reverse_lines(f, end):
+                raw = _parse_line(line, path)
+                if until is not None and _entry_time(raw, path) > until:
+                    continue
+                yield raw
+
+    def newest_first(
+        self, *, until: datetime | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over the entries, newest first.
+
+        Entries are yielded in reverse order of appending, which is time
+        order for entries recorded by the managers. Stop iterating once
+        enough entries were read; the rest of the log is not read.
+
+        Args:
+            until: Only yield entries at or before this timestamp.
+
+        Yields:
+            Raw history entries.
+
+        Raises:
+            SpecIOError: If a history file cannot be read.
+            SpecParseError: If a line is not a JSON object.
+        """
+        yield from self._read_backward(self._path, None, until)
+        if not self.segments():
+            return
+        for entry in reversed(self._load_index()):
+            segment = self._path.with_name(entry["name"])
+            end: int = entry["size"]
+            if until is not None:
+                if (
+                    entry["first"] is None
+                    or datetime.fromisoformat(entry["first"]) > until
+                ):
+                    continue
+                # Read back from the first indexed offset past until
+                end = next(
+                    (
+                        offset
+                        for timestamp, offset in entry["offsets"]
+                        if datetime.fromisoformat(timestamp) > until
+                    ),
+                    end,
+                )
+            yield from self._read_backward(segment, end, until)
+
+    def entries(self) -> list[dict[str, Any]]:
+        """All entries, oldest first."""
+        entries = list(self.newest_first())
+        entries.reverse()
+        return entries
+
+
+def append_history(
+    path: Path,
+    entries: Iterable[dict[str, Any]],
+    *,
+    segment_bytes: int = HISTORY_SEGMENT_BYTES,
+) -> None:
+    """Append entries to a spec's history log, sealing it if it is full.
+
+    Args:
+        path: Path to the active history.jsonl.
+        entries: History entries, in time order.
+        segment_bytes: Size at which the active file is sealed.
+
+    Raises:
+        SpecIOError: If the append operation fails.
+    """
+    HistoryLog(path, segment_bytes=segment_bytes).append(entries)
@@ -3,13 +3,15 @@
 """History manager for per-spec history log operations.
 
 This module provides the HistoryManager class for querying and recording
-events to per-spec history.jsonl files within specification directories.
+events to per-spec history logs within specification directories. Queries
+read the log newest-first through HistoryLog and stop as soon as ``limit``
+entries matched or an entry is older than ``since``.
 """
 
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Final
 
-from oaps.spec._io import append_jsonl, read_jsonl
+from oaps.spec._history_log import HistoryLog
 from oaps.spec._models import HistoryEntry, TestResult
 
 if TYPE_CHECKING:
@@ -166,24 +168,23 @@ class HistoryManager:
             msg = f"limit must be >= 1, got {limit}"
             raise ValueError(msg)
 
-        # Get history path (validates spec exists)
-        history_path = self._history_path(spec_id)
+        # Get history log (validates spec exists)
+        log = HistoryLog(self._history_path(spec_id))
 
-        # Read history file (returns empty list if missing)
-        raw_entries = read_jsonl(history_path)
-
-        # Parse and filter entries
+        # Read newest-first, stopping at the limit or the first older entry
         entries: list[HistoryEntry] = []
-        for raw in raw_entries:
+        for raw in log.newest_first(until=until):
             entry = self._parse_entry(raw)
+            if since is not None and entry.timestamp < since:
+                break
             if self._matches_filters(entry, since, until, event_filter, actor_filter):
                 entries.append(entry)
+                if len(entries) == limit:
+                    break
 
         # Sort newest-first (by timestamp descending)
         entries.sort(key=lambda e: e.timestamp, reverse=True)
-
-        # Apply limit
-        return entries[:limit]
+        return entries
 
     def record_event(
         self,
@@ -240,8 +241,8 @@ class HistoryManager:
             if value is not None:
                 entry_dict[key] = value
 
-        # Append to history file
-        append_jsonl(history_path, entry_dict)
+        # Append to history log
+        HistoryLog(history_path).append([entry_dict])
 
         # Parse result if present
         result_value = details.get("result")
@@ -5,12 +5,20 @@ specifications, requirements, tests, artifacts, and cross-references.
 """
 
 import re
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from oaps.config import SpecConfiguration, SpecNumberingConfiguration
     from oaps.spec._models import RequirementType, TestMethod
+    from oaps.utils._id_counters import IDCounters
+
+# Counter scope and prefix of specification IDs
+SPEC_ID_SCOPE: Final = ""
+SPEC_ID_PREFIX: Final = "spec"
 
 # =============================================================================
 # Dataclasses
@@ -326,6 +334,45 @@ def _max_id_value(digits: int) -> int:
 # =============================================================================
 
 
+def highest_spec_number(
+    existing_ids: Iterable[str], config: SpecNumberingConfiguration
+) -> int:
+    """Find the highest number among specification IDs.
+
+    Args:
+        existing_ids: Existing spec IDs; malformed IDs are ignored.
+        config: The numbering configuration.
+
+    Returns:
+        The highest number, or 0 if there are no valid IDs.
+    """
+    pattern = re.compile(rf"^(\d{{{config.digits}}})$")
+    return max(
+        (int(match.group(1)) for match in map(pattern.match, existing_ids) if match),
+        default=0,
+    )
+
+
+def highest_prefixed_number(
+    prefix: str, existing: Iterable[str], config: SpecNumberingConfiguration
+) -> int:
+    """Find the highest number among IDs with a prefix.
+
+    Args:
+        prefix: The two-letter prefix.
+        existing: Existing IDs of any prefix; sub-requirement IDs are ignored.
+        config: The numbering configuration.
+
+    Returns:
+        The highest number, or 0 if no ID has the prefix.
+    """
+    pattern = re.compile(rf"^{re.escape(prefix)}-(\d{{{config.digits}}})$")
+    return max(
+        (int(match.group(1)) for match in map(pattern.match, existing) if match),
+        default=0,
+    )
+
+
 def next_spec_id(existing_ids: set[str], config: SpecNumberingConfiguration) -> str:
     """Generate the next available specification ID.
 
@@ -342,19 +389,7 @@ def next_spec_id(existing_ids: set[str], config: SpecNumberingConfiguration) ->
     digits: int = config.digits
     max_value = _max_id_value(digits)
 
-    if not existing_ids:
-        return _format_number(1, config.digits)
-
-    # Parse existing IDs and find the maximum
-    max_num = 0
-    pattern = re.compile(rf"^(\d{{{config.digits}}})$")
-    for id_str in existing_ids:
-        match = pattern.match(id_str)
-        if match:
-            num = int(match.group(1))
-            max_num = max(max_num, num)
-
-    next_num = max_num + 1
+    next_num = highest_spec_number(existing_ids, config) + 1
     if next_num > max_value:
         msg = f"Maximum spec ID reached: {_format_number(max_value, config.digits)}"
         raise ValueError(msg)
@@ -511,16 +546,8 @@ def _next_prefixed_id(
     """
     digits: int = config.digits
     max_value = _max_id_value(digits)
-    pattern = re.compile(rf"^{re.escape(prefix)}-(\d{{{digits}}})$")
-
-    max_num = 0
-    for id_str in existing:
-        match = pattern.match(id_str)
-        if match:
-            num = int(match.group(1))
-            max_num = max(max_num, num)
 
-    next_num = max_num + 1
+    next_num = highest_prefixed_number(prefix, existing, config) + 1
     if next_num > max_value:
         max_id = f"{prefix}-{_format_number(max_value, digits)}"
         msg = f"Maximum ID reached for prefix {prefix}: {max_id}"
@@ -529,6 +556,133 @@ def _next_prefixed_id(
     return f"{prefix}-{_format_number(next_num, digits)}"
 
 
+# =============================================================================
+# Reservation Functions
+# =============================================================================
+
+
+@contextmanager
+def reserve_spec_id(
+    counters: IDCounters,
+    existing_ids: set[str],
+    config: SpecNumberingConfiguration,
+) -> Iterator[str]:
+    """Reserve the next specification ID for a spec created in the block.
+
+    The number comes from a persistent high-water mark, so it is not derived
+    from ``existing_ids`` unless the counter must be seeded or reconciled,
+    and concurrent processes never get the same ID. It is released if the
+    block raises.
+
+    Args:
+        counters: Persistent ID counters of the specification tree.
+        existing_ids: Set of existing spec IDs.
+        config: The numbering configuration.
+
+    Yields:
+        The reserved spec ID.
+
+    Raises:
+        ValueError: If the maximum ID has been reached.
+    """
+    digits: int = config.digits
+    with counters.reserve(
+        SPEC_ID_SCOPE,
+        SPEC_ID_PREFIX,
+        exists=lambda number: _format_number(number, digits) in existing_ids,
+        scan=lambda: highest_spec_number(existing_ids, config),
+    ) as number:
+        max_value = _max_id_value(digits)
+        if number > max_value:
+            msg = f"Maximum spec ID reached: {_format_number(max_value, digits)}"
+            raise ValueError(msg)
+        yield _format_number(number, digits)
+
+
+@contextmanager
+def reserve_requirement_id(
+    counters: IDCounters,
+    spec_id: str,
+    req_type: RequirementType,
+    existing: set[str],
+    config: SpecConfiguration,
+) -> Iterator[str]:
+    """Reserve the next requirement ID for a requirement created in the block.
+
+    Args:
+        counters: Persistent ID counters of the specification tree.
+        spec_id: The specification ID; numbers are unique within it.
+        req_type: The requirement type.
+        existing: Set of existing requirement IDs of the spec.
+        config: The specification configuration.
+
+    Yields:
+        The reserved requirement ID in PREFIX-NNNN format.
+
+    Raises:
+        ValueError: If the maximum ID has been reached.
+    """
+    prefix = _get_requirement_prefix(req_type, config)
+    with _reserve_prefixed_id(
+        counters, spec_id, prefix, existing, config.numbering
+    ) as req_id:
+        yield req_id
+
+
+@contextmanager
+def reserve_test_id(
+    counters: IDCounters,
+    spec_id: str,
+    method: TestMethod,
+    existing: set[str],
+    config: SpecConfiguration,
+) -> Iterator[str]:
+    """Reserve the next test ID for a test created in the block.
+
+    Args:
+        counters: Persistent ID counters of the specification tree.
+        spec_id: The specification ID; numbers are unique within it.
+        method: The test method.
+        existing: Set of existing test IDs of the spec.
+        config: The specification configuration.
+
+    Yields:
+        The reserved test ID in PREFIX-NNNN format.
+
+    Raises:
+        ValueError: If the maximum ID has been reached.
+    """
+    prefix = _get_test_prefix(method, config)
+    with _reserve_prefixed_id(
+        counters, spec_id, prefix, existing, config.numbering
+    ) as test_id:
+        yield test_id
+
+
+@contextmanager
+def _reserve_prefixed_id(
+    counters: IDCounters,
+    scope: str,
+    prefix: str,
+    existing: set[str],
+    config: SpecNumberingConfiguration,
+) -> Iterator[str]:
+    """Reserve the next ID for a prefix within a scope."""
+    digits: int = config.digits
+    with counters.reserve(
+        scope,
+        prefix,
+        exists=lambda number: f"{prefix}-{_format_number(number, digits)}" in existing,
+        scan=lambda: highest_prefixed_number(prefix, existing, config),
+    ) as number:
+        max_value = _max_id_value(digits)
+        if number > max_value:
+            max_id = f"{prefix}-{_format_number(max_value, digits)}"
+            msg = f"Maximum ID reached for prefix {prefix}: {max_id}"
+            raise ValueError(msg)
+        yield f"{prefix}-{_format_number(number, digits)}"
+
+
 # =============================================================================
 # Validation Functions
 # =============================================================================
@@ -789,12 +943,17 @@ __all__ = [
     "CrossReference",
     "ParsedID",
     "ValidationResult",
+    "highest_prefixed_number",
+    "highest_spec_number",
     "next_artifact_id",
     "next_requirement_id",
     "next_spec_id",
     "next_sub_requirement_id",
     "next_test_id",
     "parse_cross_reference",
+    "reserve_requirement_id",
+    "reserve_spec_id",
+    "reserve_test_id",
     "validate_artifact_id",
     "validate_cross_reference",
     "validate_requirement_id",
@@ -0,0 +1,252 @@
+# pyright: reportAny=false, reportExplicitAny=false
+"""Import records for bulk creation of requirements and tests.
+
+``oaps spec req import`` and ``oaps spec test import`` read one record per
+requirement or test from a JSON Lines or CSV file. This module reads the
+records and converts each one to the keyword arguments of
+``RequirementManager.add_requirement`` or ``TestManager.add_test``, so that
+every record is checked before anything is created.
+
+Records use the argument names as keys. In CSV files, list fields such as
+``tags`` hold values separated by semicolons, and empty cells are treated as
+missing.
+
+Example:
+    >>> records = read_import_records(Path("requirements.csv"))
+    >>> import_requirement_arguments(records[0], spec_id="0001", number=1)
+    {'req_type': <RequirementType.FUNCTIONAL: 'functional'>, 'title': ...}
+"""
+
+import csv
+from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, cast
+
+from oaps.exceptions import SpecIOError, SpecValidationError
+from oaps.spec._io import read_jsonl
+from oaps.spec._models import RequirementType, TestMethod
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+__all__ = [
+    "import_requirement_arguments",
+    "import_test_arguments",
+    "read_import_records",
+]
+
+# Separator of list values in CSV cells
+_LIST_SEPARATOR: Final = ";"
+
+_REQUIREMENT_TEXT_FIELDS: Final = (
+    "title",
+    "description",
+    "rationale",
+    "source_section",
+    "parent",
+    "subtype",
+    "scale",
+    "meter",
+)
+
+_REQUIREMENT_LIST_FIELDS: Final = ("acceptance_criteria", "depends_on", "tags")
+
+_REQUIREMENT_FLOAT_FIELDS: Final = ("baseline", "goal", "stretch", "fail")
+
+_TEST_TEXT_FIELDS: Final = ("title", "description", "file", "function")
+
+_TEST_LIST_FIELDS: Final = ("tests_requirements", "tags")
+
+
+def read_import_records(path: Path | str) -> list[dict[str, Any]]:
+    """Read import records from a JSON Lines or CSV file.
+
+    Files ending in ``.csv`` are read as CSV with a header row; anything else
+    as one JSON object per line.
+
+    Args:
+        path: Path to the records file.
+
+    Returns:
+        The records, in file order.
+
+    Raises:
+        SpecIOError: If the file cannot be read.
+        SpecParseError: If a JSON line is invalid or not an object.
+    """
+    path = Path(path)
+    if not path.is_file():
+        msg = f"Import file not found: {path}"
+        raise SpecIOError(msg, path=path, operation="read")
+    if path.suffix.lower() != ".csv":
+        return read_jsonl(path)
+
+    try:
+        with path.open(newline="", encoding="utf-8") as f:
+            return [
+                {key: value for key, value in row.items() if key and value}
+                for row in csv.DictReader(f)
+            ]
+    except (OSError, csv.Error, UnicodeDecodeError) as e:
+        msg = f"Failed to read CSV file: {e}"
+        raise SpecIOError(msg, path=path, operation="read", cause=e) from e
+
+
+def _invalid(
+    message: str, *, spec_id: str, number: int, field: str, value: object = None
+) -> SpecValidationError:
+    """Build the error for an invalid record field."""
+    return SpecValidationError(
+        f"Record {number}: {message}", spec_id=spec_id, field=field, value=value
+    )
+
+
+def _to_list(value: object, *, spec_id: str, number: int, field: str) -> list[str]:
+    """Convert a list field, splitting CSV cells on semicolons."""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(_LIST_SEPARATOR) if item.strip()]
+    if isinstance(value, list):
+        items = cast("list[object]", value)
+        if all(isinstance(item, str) for item in items):
+            return [str(item) for item in items]
+    msg = f"'{field}' must be a list of strings"
+    raise _invalid(msg, spec_id=spec_id, number=number, field=field, value=value)
+
+
+def _to_float(value: object, *, spec_id: str, number: int, field: str) -> float:
+    """Convert a number field, parsing CSV cells."""
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    msg = f"'{field}' must be a number"
+    raise _invalid(msg, spec_id=spec_id, number=number, field=field, value=value)
+
+
+def _to_enum[E: StrEnum](
+    enum_type: type[E], value: object, *, spec_id: str, number: int, field: str
+) -> E:
+    """Convert an enum field from its value."""
+    try:
+        return enum_type(value)
+    except ValueError:
+        choices = ", ".join(member.value for member in enum_type)
+        msg = f"'{field}' must be one of: {choices}"
+        raise _invalid(
+            msg, spec_id=spec_id, number=number, field=field, value=value
+        ) from None
+
+
+def _import_arguments(  # noqa: PLR0913
+    record: Mapping[str, Any],
+    *,
+    spec_id: str,
+    number: int,
+    required: tuple[str, ...],
+    text: tuple[str, ...],
+    lists: tuple[str, ...] = (),
+    floats: tuple[str, ...] = (),
+) -> dict[str, Any]:
+    """Check a record's fields and convert them to keyword arguments."""
+    fields = {key: value for key, value in record.items() if value is not None}
+    for name in required:
+        if name not in fields or fields[name] in ("", []):
+            msg = f"missing required field '{name}'"
+            raise _invalid(msg, spec_id=spec_id, number=number, field=name)
+
+    arguments: dict[str, Any] = {}
+    for name, value in fields.items():
+        if name in text:
+            if not isinstance(value, str):
+                msg = f"'{name}' must be a string"
+                raise _invalid(
+                    msg, spec_id=spec_id, number=number, field=name, value=value
+                )
+            arguments[name] = value
+        elif name in lists:
+            arguments[name] = _to_list(
+                value, spec_id=spec_id, number=number, field=name
+            )
+        elif name in floats:
+            arguments[name] = _to_float(
+                value, spec_id=spec_id, number=number, field=name
+            )
+        elif name not in required:
+            msg = f"unknown field '{name}'"
+            raise _invalid(msg, spec_id=spec_id, number=number, field=name, value=value)
+    return arguments
+
+
+def import_requirement_arguments(
+    record: Mapping[str, Any], *, spec_id: str, number: int
+) -> dict[str, Any]:
+    """Convert a record to ``RequirementManager.add_requirement`` arguments.
+
+    ``req_type`` and ``title`` are required. The description defaults to the
+    title, as in ``oaps spec req add``.
+
+    Args:
+        record: The import record.
+        spec_id: Specification the requirement is imported into.
+        number: 1-based position of the record, for error messages.
+
+    Returns:
+        Keyword arguments for ``add_requirement``, without ``spec_id`` and
+        ``actor``.
+
+    Raises:
+        SpecValidationError: If a field is missing, unknown, or invalid.
+    """
+    arguments = _import_arguments(
+        record,
+        spec_id=spec_id,
+        number=number,
+        required=("req_type", "title"),
+        text=_REQUIREMENT_TEXT_FIELDS,
+        lists=_REQUIREMENT_LIST_FIELDS,
+        floats=_REQUIREMENT_FLOAT_FIELDS,
+    )
+    arguments["req_type"] = _to_enum(
+        RequirementType,
+        record["req_type"],
+        spec_id=spec_id,
+        number=number,
+        field="req_type",
+    )
+    arguments.setdefault("description", arguments["title"])
+    return arguments
+
+
+def import_test_arguments(
+    record: Mapping[str, Any], *, spec_id: str, number: int
+) -> dict[str, Any]:
+    """Convert a record to ``TestManager.add_test`` arguments.
+
+    ``method``, ``title``, and ``tests_requirements`` are required.
+
+    Args:
+        record: The import record.
+        spec_id: Specification the test is imported into.
+        number: 1-based position of the record, for error messages.
+
+    Returns:
+        Keyword arguments for ``add_test``, without ``spec_id`` and ``actor``.
+
+    Raises:
+        SpecValidationError: If a field is missing, unknown, or invalid.
+    """
+    arguments = _import_arguments(
+        record,
+        spec_id=spec_id,
+        number=number,
+        required=("method", "title", "tests_requirements"),
+        text=_TEST_TEXT_FIELDS,
+        lists=_TEST_LIST_FIELDS,
+    )
+    arguments["method"] = _to_enum(
+        TestMethod, record["method"], spec_id=spec_id, number=number, field="method"
+    )
+    return arguments
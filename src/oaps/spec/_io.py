@@ -8,18 +8,29 @@ operations use atomic patterns to prevent data corruption.
 
 import tempfile
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import orjson
 import yaml
 
 from oaps.exceptions import SpecIOError, SpecParseError
+from oaps.utils._frontmatter import (
+    load_yaml,
+    read_body,
+    read_frontmatter,
+    read_frontmatter_block,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 __all__ = [
     "append_jsonl",
+    "append_jsonl_entries",
     "read_json",
     "read_jsonl",
     "read_markdown_frontmatter",
+    "read_markdown_header",
     "write_json_atomic",
     "write_markdown_with_frontmatter",
 ]
@@ -197,6 +208,25 @@ def append_jsonl(
         path: Path to the JSONL file.
         entry: Dictionary to append as a JSON line.
 
+    Raises:
+        SpecIOError: If the append operation fails.
+    """
+    append_jsonl_entries(path, [entry])
+
+
+def append_jsonl_entries(
+    path: Path,
+    entries: Iterable[dict[str, Any]],  # pyright: ignore[reportExplicitAny]
+) -> None:
+    """Append JSON objects to a JSONL file with a single write.
+
+    Creates parent directories if needed. Nothing is written if any entry
+    fails to serialize.
+
+    Args:
+        path: Path to the JSONL file.
+        entries: Dictionaries to append, one JSON line each.
+
     Raises:
         SpecIOError: If the append operation fails.
     """
@@ -205,7 +235,9 @@ def append_jsonl(
 
     try:
         # Compact JSON (no indentation) for JSONL format
-        content = orjson.dumps(entry)
+        content = b"".join(
+            orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE) for entry in entries
+        )
     except TypeError as e:
         msg = f"Failed to serialize JSON: {e}"
         raise SpecIOError(msg, path=path, operation="append", cause=e) from e
@@ -213,12 +245,28 @@ def append_jsonl(
     try:
         with path.open("ab") as f:
             _ = f.write(content)
-            _ = f.write(b"\n")
     except OSError as e:
         msg = f"Failed to append to file: {e}"
         raise SpecIOError(msg, path=path, operation="append", cause=e) from e
 
 
+def _frontmatter_mapping(
+    frontmatter_data: Any,  # pyright: ignore[reportExplicitAny]
+    path: Path,
+) -> dict[str, Any]:  # pyright: ignore[reportExplicitAny]
+    """Validate parsed frontmatter, mapping an empty block to {}."""
+    # Handle empty frontmatter (---\n---)
+    if frontmatter_data is None:
+        return {}
+
+    if not isinstance(frontmatter_data, dict):
+        actual_type = type(frontmatter_data).__name__
+        msg = f"Expected YAML mapping in frontmatter, got {actual_type}"
+        raise SpecParseError(msg, path=path, content_type="frontmatter")
+
+    return frontmatter_data
+
+
 def read_markdown_frontmatter(
     path: Path,
 ) -> tuple[dict[str, Any], str]:  # pyright: ignore[reportExplicitAny]
@@ -239,39 +287,54 @@ def read_markdown_frontmatter(
         SpecParseError: If the frontmatter contains malformed YAML.
     """
     try:
-        content = path.read_text(encoding="utf-8")
+        block = read_frontmatter_block(path)
+        if block is None:
+            return {}, path.read_text(encoding="utf-8")
+        frontmatter_str, body_offset = block
+        body = read_body(path, body_offset)
     except OSError as e:
         msg = f"Failed to read file: {e}"
         raise SpecIOError(msg, path=path, operation="read", cause=e) from e
 
-    # Check for frontmatter delimiter at start (requires newline after ---)
-    if not content.startswith("---\n"):
-        return {}, content
+    try:
+        frontmatter_data = load_yaml(frontmatter_str)
+    except yaml.YAMLError as e:
+        msg = f"Invalid YAML in frontmatter: {e}"
+        raise SpecParseError(msg, path=path, content_type="frontmatter", cause=e) from e
+
+    return _frontmatter_mapping(frontmatter_data, path), body
+
+
+def read_markdown_header(
+    path: Path,
+) -> dict[str, Any]:  # pyright: ignore[reportExplicitAny]
+    """Read only the YAML frontmatter of a Markdown file.
 
-    # Find the closing delimiter (must be on its own line)
-    end_marker = content.find("\n---", 3)
-    if end_marker == -1:
-        return {}, content
+    Stops reading at the closing delimiter and reuses cached headers of
+    unchanged files, so it is the cheap choice when the body is not needed.
 
-    frontmatter_str = content[4:end_marker].strip()  # Skip "---\n"
-    body = content[end_marker + 4 :].lstrip("\n")  # Skip "\n---"
+    Args:
+        path: Path to the Markdown file.
 
+    Returns:
+        The frontmatter dict, or {} if no frontmatter block is found.
+
+    Raises:
+        SpecIOError: If the file cannot be read.
+        SpecParseError: If the frontmatter contains malformed YAML.
+    """
     try:
-        frontmatter_data = yaml.safe_load(frontmatter_str)
+        found, frontmatter_data = read_frontmatter(path)
+    except OSError as e:
+        msg = f"Failed to read file: {e}"
+        raise SpecIOError(msg, path=path, operation="read", cause=e) from e
     except yaml.YAMLError as e:
         msg = f"Invalid YAML in frontmatter: {e}"
         raise SpecParseError(msg, path=path, content_type="frontmatter", cause=e) from e
 
-    # Handle empty frontmatter (---\n---)
-    if frontmatter_data is None:
-        return {}, body
-
-    if not isinstance(frontmatter_data, dict):
-        actual_type = type(frontmatter_data).__name__
-        msg = f"Expected YAML mapping in frontmatter, got {actual_type}"
-        raise SpecParseError(msg, path=path, content_type="frontmatter")
-
-    return frontmatter_data, body
+    if not found:
+        return {}
+    return _frontmatter_mapping(frontmatter_data, path)
 
 
 def write_markdown_with_frontmatter(
@@ -903,6 +903,19 @@ class DependencyGraph:
     cycle_path: tuple[str, ...]
 
 
+@dataclass(frozen=True, slots=True)
+class CriticalPath:
+    """Dependency chain with the most requirements.
+
+    Attributes:
+        spec_ids: Specs along the chain, each depending on the next.
+        requirement_count: Total number of requirements of the specs.
+    """
+
+    spec_ids: tuple[str, ...]
+    requirement_count: int
+
+
 # =============================================================================
 # Relationship Graph Models
 # =============================================================================
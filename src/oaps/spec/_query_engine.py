@@ -0,0 +1,462 @@
+# pyright: reportAny=false, reportMissingTypeStubs=false
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+# pyright: reportUnknownArgumentType=false, reportUnknownParameterType=false
+"""DuckDB queries across every specification's requirements and tests.
+
+RequirementManager and TestManager load one spec's requirements.json or
+tests.json into dataclasses and filter in Python, so a question spanning
+all specs ("approved security requirements without tests") means loading
+every container one by one. SpecQueryEngine loads the containers of all
+specs into DuckDB instead, where such a question is one vectorized query.
+
+Data comes from one of two sources:
+
+- ``from_files`` reads every ``*/requirements.json`` and ``*/tests.json``
+  under the specs directory directly.
+- ``from_mirror`` reads a Parquet mirror of those files in the git-ignored
+  ``.cache/query/`` directory, rewriting it first when any source file
+  changed since it was written. Repeated queries then skip JSON parsing.
+
+Three views are available to queries:
+
+- ``specs``: one row per spec in the root index.
+- ``requirements``: one row per requirement, with its ``spec_id``.
+- ``tests``: one row per test, with its ``spec_id``.
+
+Example:
+    >>> from oaps.spec._query_engine import SpecQueryEngine
+    >>> with SpecQueryEngine.from_mirror(Path(".oaps/docs/specs")) as engine:
+    ...     engine.find_requirements(
+    ...         statuses=["approved"], req_types=["security"], untested=True
+    ...     ).to_dicts()
+"""
+
+import hashlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Self
+
+import duckdb
+import orjson
+
+from oaps.utils._paths import ensure_parent_dir, get_cache_dir
+from oaps.utils._state_analytics import QueryResult
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__ = [
+    "SPEC_QUERY_MIRROR_NAME",
+    "SpecQueryEngine",
+    "refresh_query_mirror",
+]
+
+# Mirror directory, placed in the cache directory of the specs directory
+SPEC_QUERY_MIRROR_NAME: Final = "query"
+
+_MIRROR_VERSION: Final = 1
+
+_MIRROR_MANIFEST: Final = "manifest.json"
+
+# Raw column types of each source file; fields absent from a file are NULL
+_SPECS_COLUMNS: Final = {
+    "specs": (
+        "STRUCT(id VARCHAR, slug VARCHAR, title VARCHAR, spec_type VARCHAR, "
+        "status VARCHAR, created VARCHAR, updated VARCHAR, "
+        "depends_on VARCHAR[], tags VARCHAR[])[]"
+    ),
+}
+
+_REQUIREMENTS_COLUMNS: Final = {
+    "spec_id": "VARCHAR",
+    "requirements": (
+        "STRUCT(id VARCHAR, title VARCHAR, req_type VARCHAR, status VARCHAR, "
+        "created VARCHAR, updated VARCHAR, author VARCHAR, description VARCHAR, "
+        "rationale VARCHAR, acceptance_criteria VARCHAR[], verified_by VARCHAR[], "
+        "depends_on VARCHAR[], tags VARCHAR[], source_section VARCHAR, "
+        "parent VARCHAR, subtype VARCHAR, scale VARCHAR, meter VARCHAR, "
+        "baseline DOUBLE, goal DOUBLE, stretch DOUBLE, fail DOUBLE)[]"
+    ),
+}
+
+_TESTS_COLUMNS: Final = {
+    "spec_id": "VARCHAR",
+    "tests": (
+        "STRUCT(id VARCHAR, title VARCHAR, method VARCHAR, status VARCHAR, "
+        "created VARCHAR, updated VARCHAR, author VARCHAR, "
+        "tests_requirements VARCHAR[], description VARCHAR, file VARCHAR, "
+        "function VARCHAR, last_run VARCHAR, last_result VARCHAR, "
+        "tags VARCHAR[], last_value DOUBLE, threshold DOUBLE, "
+        "perf_baseline DOUBLE, steps VARCHAR[], expected_result VARCHAR, "
+        "actual_result VARCHAR, tested_by VARCHAR, tested_on VARCHAR)[]"
+    ),
+}
+
+# (raw table, source file glob, list column, column types)
+_SOURCES: Final = (
+    ("specs_raw", "index.json", "specs", _SPECS_COLUMNS),
+    ("requirements_raw", "*/requirements.json", "requirements", _REQUIREMENTS_COLUMNS),
+    ("tests_raw", "*/tests.json", "tests", _TESTS_COLUMNS),
+)
+
+_DUCKDB_VIEWS: Final = """
+CREATE VIEW specs AS
+SELECT
+    id,
+    slug,
+    title,
+    spec_type,
+    status,
+    CAST(created AS TIMESTAMPTZ) AS created,
+    CAST(updated AS TIMESTAMPTZ) AS updated,
+    COALESCE(depends_on, []) AS depends_on,
+    COALESCE(tags, []) AS tags
+FROM specs_raw;
+
+CREATE VIEW requirements AS
+SELECT
+    spec_id,
+    id,
+    title,
+    req_type,
+    status,
+    CAST(created AS TIMESTAMPTZ) AS created,
+    CAST(updated AS TIMESTAMPTZ) AS updated,
+    author,
+    description,
+    rationale,
+    COALESCE(acceptance_criteria, []) AS acceptance_criteria,
+    COALESCE(verified_by, []) AS verified_by,
+    COALESCE(depends_on, []) AS depends_on,
+    COALESCE(tags, []) AS tags,
+    source_section,
+    parent,
+    subtype,
+    scale,
+    meter,
+    baseline,
+    goal,
+    stretch,
+    fail
+FROM requirements_raw;
+
+CREATE VIEW tests AS
+SELECT
+    spec_id,
+    id,
+    title,
+    method,
+    status,
+    CAST(created AS TIMESTAMPTZ) AS created,
+    CAST(updated AS TIMESTAMPTZ) AS updated,
+    author,
+    COALESCE(tests_requirements, []) AS tests_requirements,
+    description,
+    file,
+    function,
+    CAST(last_run AS TIMESTAMPTZ) AS last_run,
+    last_result,
+    COALESCE(tags, []) AS tags,
+    last_value,
+    threshold,
+    perf_baseline,
+    COALESCE(steps, []) AS steps,
+    expected_result,
+    actual_result,
+    tested_by,
+    CAST(tested_on AS TIMESTAMPTZ) AS tested_on
+FROM tests_raw;
+"""
+
+_SQL_FIND_REQUIREMENTS: Final = """
+SELECT spec_id, id, req_type, status, title, tags, verified_by
+FROM requirements r
+"""
+
+_SQL_FIND_TESTS: Final = """
+SELECT spec_id, id, method, status, last_result, title, tests_requirements
+FROM tests t
+"""
+
+# Neither the requirement nor any test of its spec links the two
+_SQL_UNTESTED: Final = """len(r.verified_by) = 0 AND NOT EXISTS (
+    SELECT 1 FROM tests t
+    WHERE t.spec_id = r.spec_id AND list_contains(t.tests_requirements, r.id)
+)"""
+
+
+def _source_files(base_path: Path) -> dict[str, list[Path]]:
+    """Find the source files of each raw table, in a stable order."""
+    return {table: sorted(base_path.glob(pattern)) for table, pattern, _, _ in _SOURCES}
+
+
+def _sources_signature(files: dict[str, list[Path]], base_path: Path) -> str:
+    """Digest the paths, sizes, and modification times of the source files."""
+    hasher = hashlib.sha256()
+    for table, paths in files.items():
+        for path in paths:
+            stat = path.stat()
+            entry = f"{table}\0{path.relative_to(base_path).as_posix()}\0"
+            hasher.update(f"{entry}{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return hasher.hexdigest()
+
+
+def _load_sources(
+    conn: duckdb.DuckDBPyConnection, files: dict[str, list[Path]]
+) -> None:
+    """Create the raw tables from the JSON source files."""
+    # S608 is safe: table and column names come from the fixed _SOURCES
+    for table, _, list_column, columns in _SOURCES:
+        paths = [str(path) for path in files[table]]
+        spec_id = "spec_id, " if "spec_id" in columns else ""
+        if paths:
+            params: list[object] = [paths, columns]
+            items = (
+                f"SELECT {spec_id}unnest({list_column}) AS item "  # noqa: S608
+                "FROM read_json(?, columns = ?, format = 'auto')"
+            )
+        else:
+            # read_json fails without files; create the table empty instead
+            params = []
+            struct_type = columns[list_column].removesuffix("[]")
+            key = "NULL::VARCHAR AS spec_id, " if spec_id else ""
+            items = f"SELECT {key}NULL::{struct_type} AS item WHERE false"
+        _ = conn.execute(
+            f"CREATE TABLE {table} AS SELECT {spec_id}item.* FROM ({items})",  # noqa: S608
+            params,
+        )
+
+
+def _mirror_dir(base_path: Path, mirror_dir: Path | str | None) -> Path:
+    """Get the mirror directory, defaulting to the specs cache directory."""
+    if mirror_dir:
+        return Path(mirror_dir)
+    return get_cache_dir(base_path) / SPEC_QUERY_MIRROR_NAME
+
+
+def refresh_query_mirror(
+    base_path: Path | str, mirror_dir: Path | str | None = None
+) -> bool:
+    """Rewrite the Parquet mirror of the spec files if any of them changed.
+
+    Args:
+        base_path: Specifications directory.
+        mirror_dir: Directory of the mirror. Defaults to ``.cache/query`` in
+            the specifications directory.
+
+    Returns:
+        True if the mirror was rewritten, False if it was current.
+    """
+    base_path = Path(base_path)
+    mirror = _mirror_dir(base_path, mirror_dir)
+    files = _source_files(base_path)
+    signature = _sources_signature(files, base_path)
+    manifest_path = mirror / _MIRROR_MANIFEST
+    try:
+        manifest = orjson.loads(manifest_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        manifest = {}
+    if manifest == {"version": _MIRROR_VERSION, "signature": signature} and all(
+        (mirror / f"{table}.parquet").exists() for table, *_ in _SOURCES
+    ):
+        return False
+
+    _ = ensure_parent_dir(mirror)
+    mirror.mkdir(exist_ok=True)
+    manifest_path.unlink(missing_ok=True)
+    with duckdb.connect(":memory:") as conn:
+        _load_sources(conn, files)
+        for table, *_ in _SOURCES:
+            target = mirror / f"{table}.parquet"
+            _ = conn.execute(f"COPY {table} TO ? (FORMAT parquet)", [str(target)])
+    # Written last, so an interrupted refresh is redone next time
+    _ = manifest_path.write_bytes(
+        orjson.dumps({"version": _MIRROR_VERSION, "signature": signature})
+    )
+    return True
+
+
+class SpecQueryEngine:
+    """DuckDB queries over the requirements and tests of all specifications.
+
+    Use as a context manager so the DuckDB connection is closed on exit.
+
+    Examples:
+        >>> with SpecQueryEngine.from_files(Path(".oaps/docs/specs")) as engine:
+        ...     engine.query("SELECT status, count(*) FROM tests GROUP BY 1")
+    """
+
+    _conn: duckdb.DuckDBPyConnection
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Wrap a DuckDB connection that already holds the raw tables.
+
+        Prefer the ``from_files`` and ``from_mirror`` constructors.
+
+        Args:
+            conn: DuckDB connection with ``specs_raw``, ``requirements_raw``,
+                and ``tests_raw`` loaded.
+        """
+        self._conn = conn
+        _ = self._conn.execute("SET TimeZone = 'UTC'")
+        _ = self._conn.execute(_DUCKDB_VIEWS)
+
+    @classmethod
+    def from_files(cls, base_path: Path | str) -> SpecQueryEngine:
+        """Load the JSON files of every specification.
+
+        Args:
+            base_path: Specifications directory.
+
+        Returns:
+            A SpecQueryEngine over the loaded data.
+        """
+        conn = duckdb.connect(":memory:")
+        _load_sources(conn, _source_files(Path(base_path)))
+        return cls(conn)
+
+    @classmethod
+    def from_mirror(
+        cls, base_path: Path | str, *, mirror_dir: Path | str | None = None
+    ) -> SpecQueryEngine:
+        """Load the Parquet mirror, refreshing it first if it is stale.
+
+        Args:
+            base_path: Specifications directory.
+            mirror_dir: Directory of the mirror. Defaults to ``.cache/query``
+                in the specifications directory.
+
+        Returns:
+            A SpecQueryEngine over the loaded data.
+        """
+        base_path = Path(base_path)
+        mirror = _mirror_dir(base_path, mirror_dir)
+        _ = refresh_query_mirror(base_path, mirror)
+        conn = duckdb.connect(":memory:")
+        for table, *_ in _SOURCES:
+            _ = conn.execute(
+                f"CREATE TABLE {table} AS SELECT * FROM read_parquet(?)",  # noqa: S608
+                [str(mirror / f"{table}.parquet")],
+            )
+        return cls(conn)
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        """Close the DuckDB connection."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the DuckDB connection."""
+        self._conn.close()
+
+    def query(self, sql: str, params: Sequence[object] | None = None) -> QueryResult:
+        """Run an ad-hoc SQL query against the specs, requirements, and tests views.
+
+        Args:
+            sql: DuckDB SQL query.
+            params: Optional positional query parameters.
+
+        Returns:
+            The query result.
+
+        Raises:
+            duckdb.Error: If the query is invalid.
+        """
+        relation = self._conn.execute(sql, list(params or []))
+        description = relation.description or []
+        columns = [str(column[0]) for column in description]
+        rows: list[tuple[object, ...]] = relation.fetchall()
+        return QueryResult(columns=columns, rows=rows)
+
+    def _find(
+        self,
+        select: str,
+        conditions: list[tuple[str, object]],
+        limit: int | None,
+    ) -> QueryResult:
+        """Run a find query with AND-ed conditions and their parameters."""
+        sql = select
+        if conditions:
+            sql += "WHERE " + "\nAND ".join(clause for clause, _ in conditions)
+        sql += "\nORDER BY spec_id, id"
+        params = [param for _, param in conditions if param is not None]
+        if limit is not None:
+            sql += "\nLIMIT ?"
+            params.append(limit)
+        return self.query(sql, params)
+
+    def find_requirements(  # noqa: PLR0913
+        self,
+        *,
+        spec_ids: Sequence[str] | None = None,
+        statuses: Sequence[str] | None = None,
+        req_types: Sequence[str] | None = None,
+        tags: Sequence[str] | None = None,
+        untested: bool = False,
+        limit: int | None = None,
+    ) -> QueryResult:
+        """Find requirements across specifications.
+
+        Args:
+            spec_ids: Only requirements of these specs.
+            statuses: Only requirements with one of these statuses.
+            req_types: Only requirements of one of these types.
+            tags: Only requirements with all of these tags.
+            untested: Only requirements that no test verifies.
+            limit: Maximum number of rows.
+
+        Returns:
+            Matching requirements ordered by spec and ID, with the columns
+            spec_id, id, req_type, status, title, tags, and verified_by.
+        """
+        conditions: list[tuple[str, object]] = []
+        if spec_ids:
+            conditions.append(("list_contains(?, r.spec_id)", list(spec_ids)))
+        if statuses:
+            conditions.append(("list_contains(?, r.status)", list(statuses)))
+        if req_types:
+            conditions.append(("list_contains(?, r.req_type)", list(req_types)))
+        if tags:
+            conditions.append(("list_has_all(r.tags, ?)", list(tags)))
+        if untested:
+            conditions.append((_SQL_UNTESTED, None))
+        return self._find(_SQL_FIND_REQUIREMENTS, conditions, limit)
+
+    def find_tests(  # noqa: PLR0913
+        self,
+        *,
+        spec_ids: Sequence[str] | None = None,
+        statuses: Sequence[str] | None = None,
+        methods: Sequence[str] | None = None,
+        tags: Sequence[str] | None = None,
+        requirement: str | None = None,
+        limit: int | None = None,
+    ) -> QueryResult:
+        """Find tests across specifications.
+
+        Args:
+            spec_ids: Only tests of these specs.
+            statuses: Only tests with one of these statuses.
+            methods: Only tests using one of these methods.
+            tags: Only tests with all of these tags.
+            requirement: Only tests of this requirement ID.
+            limit: Maximum number of rows.
+
+        Returns:
+            Matching tests ordered by spec and ID, with the columns spec_id,
+            id, method, status, last_result, title, and tests_requirements.
+        """
+        conditions: list[tuple[str, object]] = []
+        if spec_ids:
+            conditions.append(("list_contains(?, t.spec_id)", list(spec_ids)))
+        if statuses:
+            conditions.append(("list_contains(?, t.status)", list(statuses)))
+        if methods:
+            conditions.append(("list_contains(?, t.method)", list(methods)))
+        if tags:
+            conditions.append(("list_has_all(t.tags, ?)", list(tags)))
+        if requirement:
+            conditions.append(("list_contains(t.tests_requirements, ?)", requirement))
+        return self._find(_SQL_FIND_TESTS, conditions, limit)
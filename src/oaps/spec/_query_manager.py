@@ -8,13 +8,13 @@ coverage, orphans, and relationship graphs across specifications.
 
 from collections import defaultdict
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Final
-
-import rustworkx as rx
+from typing import TYPE_CHECKING, Any, Final
 
 from oaps.exceptions import SpecNotFoundError
+from oaps.spec._aggregates import coverage_from_aggregates, progress_from_aggregates
 from oaps.spec._models import (
     CoverageReport,
+    CriticalPath,
     DependencyGraph,
     DependencyNode,
     MethodCoverage,
@@ -27,7 +27,6 @@ from oaps.spec._models import (
     RequirementStatus,
     RequirementType,
     SpecNode,
-    SpecStatus,
     SpecSummary,
     Test,
     TestMethod,
@@ -35,8 +34,11 @@ from oaps.spec._models import (
     TypeCoverage,
     TypeProgress,
 )
+from oaps.spec._spec_graph import SpecGraph
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from oaps.spec._artifact_manager import ArtifactManager
     from oaps.spec._requirement_manager import RequirementManager
     from oaps.spec._spec_manager import SpecManager
@@ -44,6 +46,18 @@ if TYPE_CHECKING:
 
 __all__ = ["QueryManager"]
 
+# Cache keys of the depends_on graph and the graph of every relationship;
+# other keys are sorted tuples of relationship types
+_DEPENDENCIES_KEY: Final = "dependencies"
+_RELATIONSHIPS_KEY: Final = "relationships"
+
+# Relationships along which a change to a spec affects the specs holding them
+_IMPACT_TYPES: Final = (
+    RelationshipType.DEPENDS_ON,
+    RelationshipType.EXTENDS,
+    RelationshipType.INTEGRATES,
+)
+
 
 class QueryManager:
     """Manager for read-only query operations on specifications.
@@ -51,12 +65,27 @@ class QueryManager:
     The QueryManager provides methods for analyzing specification progress,
     test coverage, orphaned tests/artifacts, and dependency/relationship graphs.
     All operations are read-only and return frozen, immutable dataclasses.
+
+    Graph queries share rustworkx graphs that are built on first use and
+    rebuilt after the spec manager's revision changes.
+
+    Attributes:
+        _spec_manager: The specification manager for spec metadata.
+        _requirement_manager: The requirement manager for requirement data.
+        _test_manager: The test manager for test data.
+        _artifact_manager: Optional artifact manager for orphan detection.
+        _graphs: Cached graphs by cache key.
+        _graph_revision: Spec manager revision the cached graphs belong to.
+        _spec_summaries: Cached spec summaries the graphs were built from.
     """
 
     __slots__: Final = (
         "_artifact_manager",
+        "_graph_revision",
+        "_graphs",
         "_requirement_manager",
         "_spec_manager",
+        "_spec_summaries",
         "_test_manager",
     )
 
@@ -64,6 +93,9 @@ class QueryManager:
     _requirement_manager: RequirementManager
     _test_manager: TestManager
     _artifact_manager: ArtifactManager | None
+    _graphs: dict[object, SpecGraph]
+    _graph_revision: object
+    _spec_summaries: tuple[SpecSummary, ...] | None
 
     def __init__(
         self,
@@ -84,6 +116,9 @@ class QueryManager:
         self._requirement_manager = requirement_manager
         self._test_manager = test_manager
         self._artifact_manager = artifact_manager
+        self._graphs = {}
+        self._graph_revision = None
+        self._spec_summaries = None
 
     # -------------------------------------------------------------------------
     # Progress Helper Methods
@@ -177,311 +212,114 @@ class QueryManager:
         return type_coverage
 
     # -------------------------------------------------------------------------
-    # Dependency Graph Helper Methods
+    # Graph Helper Methods
     # -------------------------------------------------------------------------
 
-    def _build_dependency_graph_structure(
-        self,
-        specs: list[SpecSummary],
-    ) -> tuple[
-        rx.PyDiGraph[str, None], dict[str, int], dict[str, tuple[str, SpecStatus]]
-    ]:
-        """Build the dependency graph structure from specs."""
-        graph: rx.PyDiGraph[str, None] = rx.PyDiGraph(check_cycle=False)
-        node_indices: dict[str, int] = {}
-        spec_data: dict[str, tuple[str, SpecStatus]] = {}
-
-        # Add nodes
-        for spec in specs:
-            idx = graph.add_node(spec.id)
-            node_indices[spec.id] = idx
-            spec_data[spec.id] = (spec.title, spec.status)
-
-        # Add edges (A depends on B means edge A -> B)
-        for spec in specs:
-            for dep_id in spec.depends_on:
-                if dep_id in node_indices:
-                    _ = graph.add_edge(
-                        node_indices[spec.id], node_indices[dep_id], None
-                    )
-
-        return graph, node_indices, spec_data
-
-    def _filter_to_subgraph(
-        self,
-        graph: rx.PyDiGraph[str, None],
-        node_indices: dict[str, int],
-        spec_id: str,
-    ) -> set[str]:
-        """Filter to subgraph reachable from spec_id."""
-        spec_idx = node_indices[spec_id]
-        ancestors = rx.ancestors(graph, spec_idx)
-        descendants = rx.descendants(graph, spec_idx)
-        included_indices = {spec_idx} | ancestors | descendants
-        return {graph[idx] for idx in included_indices if idx in graph.node_indices()}
-
-    def _detect_cycles(
-        self,
-        graph: rx.PyDiGraph[str, None],
-    ) -> tuple[bool, tuple[str, ...]]:
-        """Detect cycles in the graph and return cycle path if found."""
-        cycle_edges = rx.digraph_find_cycle(graph)
-        has_cycles = len(cycle_edges) > 0
-
-        cycle_path: tuple[str, ...] = ()
-        if has_cycles and cycle_edges:
-            # cycle_edges is a list of (source, target) index tuples
-            # Build path from source nodes, then close with target of last edge
-            cycle_ids = [graph[source_idx] for source_idx, _ in cycle_edges]
-            _, last_target = cycle_edges[-1]
-            cycle_ids.append(graph[last_target])
-            cycle_path = tuple(cycle_ids)
-
-        return has_cycles, cycle_path
-
-    def _compute_roots_and_leaves(
-        self,
-        graph: rx.PyDiGraph[str, None],
-        node_indices: dict[str, int],
-        included_spec_ids: set[str],
-    ) -> tuple[list[str], list[str]]:
-        """Compute roots and leaves from the filtered set."""
-        roots: list[str] = []
-        leaves: list[str] = []
-        for spec_node_id in included_spec_ids:
-            if spec_node_id in node_indices:
-                idx = node_indices[spec_node_id]
-                if graph.in_degree(idx) == 0:
-                    roots.append(spec_node_id)
-                if graph.out_degree(idx) == 0:
-                    leaves.append(spec_node_id)
-        return roots, leaves
-
-    def _compute_topological_order(
-        self,
-        graph: rx.PyDiGraph[str, None],
-        included_spec_ids: set[str],
-        *,
-        has_cycles: bool,
-    ) -> tuple[str, ...]:
-        """Compute topological order if no cycles."""
-        if has_cycles:
-            return ()
-        try:
-            topo_indices = rx.topological_sort(graph)
-            return tuple(
-                graph[idx] for idx in topo_indices if graph[idx] in included_spec_ids
+    def _graph_cache(self) -> dict[object, SpecGraph]:
+        """Get the cached graphs, dropping them if specs changed since."""
+        revision = self._spec_manager.revision
+        if self._graph_revision is None or self._graph_revision != revision:
+            self._graphs = {}
+            self._graph_revision = revision
+            self._spec_summaries = None
+        return self._graphs
+
+    def _specs(self) -> tuple[SpecSummary, ...]:
+        """Get all spec summaries, including archived specs."""
+        _ = self._graph_cache()
+        if self._spec_summaries is None:
+            self._spec_summaries = tuple(
+                self._spec_manager.list_specs(include_archived=True)
             )
-        except rx.DAGHasCycle:
-            return ()
-
-    def _compute_depths(
-        self,
-        graph: rx.PyDiGraph[str, None],
-        node_indices: dict[str, int],
-        roots: list[str],
-    ) -> dict[str, int]:
-        """Compute depths using BFS from roots."""
-        from collections import deque  # noqa: PLC0415
-
-        depths: dict[str, int] = {}
-        for root_id in roots:
-            if root_id not in depths:
-                depths[root_id] = 0
-            # BFS to compute depths using deque for O(1) popleft
-            queue: deque[str] = deque([root_id])
-            while queue:
-                current = queue.popleft()
-                current_depth = depths[current]
-                if current in node_indices:
-                    idx = node_indices[current]
-                    for successor_idx in graph.predecessor_indices(idx):
-                        successor_id = graph[successor_idx]
-                        new_depth = current_depth + 1
-                        if (
-                            successor_id not in depths
-                            or depths[successor_id] < new_depth
-                        ):
-                            depths[successor_id] = new_depth
-                            queue.append(successor_id)
-        return depths
-
-    def _build_dependency_nodes(
-        self,
-        included_spec_ids: set[str],
-        spec_data: dict[str, tuple[str, SpecStatus]],
-        depths: dict[str, int],
-    ) -> list[DependencyNode]:
-        """Build DependencyNode list from included specs."""
-        return [
-            DependencyNode(
-                spec_id=spec_node_id,
-                title=title,
-                status=status,
-                depth=depths.get(spec_node_id, 0),
+        return self._spec_summaries
+
+    def _dependency_spec_graph(self) -> SpecGraph:
+        """Get the graph of depends_on relationships."""
+        specs = self._specs()
+        graphs = self._graph_cache()
+        graph = graphs.get(_DEPENDENCIES_KEY)
+        if graph is None:
+            graph = SpecGraph(
+                (spec.id for spec in specs),
+                (
+                    (spec.id, dep_id, RelationshipType.DEPENDS_ON)
+                    for spec in specs
+                    for dep_id in spec.depends_on
+                ),
             )
-            for spec_node_id in included_spec_ids
-            if spec_node_id in spec_data
-            for title, status in [spec_data[spec_node_id]]
-        ]
-
-    def _build_dependency_edges(
-        self,
-        graph: rx.PyDiGraph[str, None],
-        node_indices: dict[str, int],
-        included_spec_ids: set[str],
-    ) -> list[tuple[str, str]]:
-        """Build edge tuples from included specs."""
-        edges: list[tuple[str, str]] = []
-        for spec_node_id in included_spec_ids:
-            if spec_node_id in node_indices:
-                idx = node_indices[spec_node_id]
-                for target_idx in graph.successor_indices(idx):
-                    target_id = graph[target_idx]
-                    if target_id in included_spec_ids:
-                        edges.append((spec_node_id, target_id))
-        return edges
-
-    # -------------------------------------------------------------------------
-    # Relationship Graph Helper Methods
-    # -------------------------------------------------------------------------
-
-    def _should_include_type(
-        self,
-        rel_type: RelationshipType,
-        relationship_types: tuple[RelationshipType, ...] | None,
-    ) -> bool:
-        """Check if a relationship type should be included."""
-        return relationship_types is None or rel_type in relationship_types
+            graphs[_DEPENDENCIES_KEY] = graph
+        return graph
+
+    def _relationship_spec_graph(
+        self, relationship_types: tuple[RelationshipType, ...] | None
+    ) -> SpecGraph:
+        """Get the graph of the given relationship types (None for all)."""
+        specs = self._specs()
+        graphs = self._graph_cache()
+        key = tuple(sorted(relationship_types)) if relationship_types else None
+        graph = graphs.get(key)
+        if graph is None:
+            all_edges = graphs.get(_RELATIONSHIPS_KEY)
+            if all_edges is None:
+                all_edges = SpecGraph(
+                    (spec.id for spec in specs),
+                    self._collect_relationship_edges(specs),
+                )
+                graphs[_RELATIONSHIPS_KEY] = all_edges
+            graph = SpecGraph(
+                (spec.id for spec in specs),
+                (edge for edge in all_edges.edges() if key is None or edge[2] in key),
+            )
+            graphs[key] = graph
+        return graph
 
     def _collect_relationship_edges(
-        self,
-        spec_summaries: list[SpecSummary],
-        valid_spec_ids: set[str],
-        relationship_types: tuple[RelationshipType, ...] | None,
-    ) -> list[RelationshipEdge]:
-        """Collect all relationship edges from specs."""
-        edges: list[RelationshipEdge] = []
+        self, spec_summaries: Iterable[SpecSummary]
+    ) -> list[tuple[str, str, RelationshipType]]:
+        """Collect all relationship edges from the per-spec indexes."""
+        edges: list[tuple[str, str, RelationshipType]] = []
 
         for spec_summary in spec_summaries:
             try:
-                spec_meta = self._spec_manager.get_spec(spec_summary.id)
+                rel = self._spec_manager.get_spec(spec_summary.id).relationships
             except SpecNotFoundError:
                 continue
 
-            rel = spec_meta.relationships
-
-            # depends_on edges
-            if self._should_include_type(
-                RelationshipType.DEPENDS_ON, relationship_types
-            ):
-                edges.extend(
-                    RelationshipEdge(
-                        from_spec_id=spec_summary.id,
-                        to_spec_id=dep_id,
-                        relationship_type=RelationshipType.DEPENDS_ON,
-                    )
-                    for dep_id in rel.depends_on
-                    if dep_id in valid_spec_ids
-                )
-
-            # extends edge
-            if (
-                self._should_include_type(RelationshipType.EXTENDS, relationship_types)
-                and rel.extends
-                and rel.extends in valid_spec_ids
-            ):
-                edges.append(
-                    RelationshipEdge(
-                        from_spec_id=spec_summary.id,
-                        to_spec_id=rel.extends,
-                        relationship_type=RelationshipType.EXTENDS,
-                    )
-                )
-
-            # supersedes edge
-            if (
-                self._should_include_type(
-                    RelationshipType.SUPERSEDES, relationship_types
-                )
-                and rel.supersedes
-                and rel.supersedes in valid_spec_ids
-            ):
+            edges.extend(
+                (spec_summary.id, dep_id, RelationshipType.DEPENDS_ON)
+                for dep_id in rel.depends_on
+            )
+            if rel.extends:
+                edges.append((spec_summary.id, rel.extends, RelationshipType.EXTENDS))
+            if rel.supersedes:
                 edges.append(
-                    RelationshipEdge(
-                        from_spec_id=spec_summary.id,
-                        to_spec_id=rel.supersedes,
-                        relationship_type=RelationshipType.SUPERSEDES,
-                    )
-                )
-
-            # integrates edges
-            if self._should_include_type(
-                RelationshipType.INTEGRATES, relationship_types
-            ):
-                edges.extend(
-                    RelationshipEdge(
-                        from_spec_id=spec_summary.id,
-                        to_spec_id=int_id,
-                        relationship_type=RelationshipType.INTEGRATES,
-                    )
-                    for int_id in rel.integrates
-                    if int_id in valid_spec_ids
+                    (spec_summary.id, rel.supersedes, RelationshipType.SUPERSEDES)
                 )
+            edges.extend(
+                (spec_summary.id, int_id, RelationshipType.INTEGRATES)
+                for int_id in rel.integrates
+            )
 
         return edges
 
-    def _filter_relationship_graph(
-        self,
-        spec_id: str,
-        spec_summaries: list[SpecSummary],
-        nodes: list[SpecNode],
-        edges: list[RelationshipEdge],
-    ) -> tuple[list[SpecNode], list[RelationshipEdge], dict[str, SpecNode]]:
-        """Filter relationship graph to subgraph reachable from spec_id."""
-        graph: rx.PyDiGraph[str, RelationshipType] = rx.PyDiGraph()
-        idx_map: dict[str, int] = {}
-
-        for spec_summary in spec_summaries:
-            idx = graph.add_node(spec_summary.id)
-            idx_map[spec_summary.id] = idx
-
-        for edge in edges:
-            if edge.from_spec_id in idx_map and edge.to_spec_id in idx_map:
-                _ = graph.add_edge(
-                    idx_map[edge.from_spec_id],
-                    idx_map[edge.to_spec_id],
-                    edge.relationship_type,
-                )
-
-        if spec_id not in idx_map:
-            return nodes, edges, {n.spec_id: n for n in nodes}
-
-        spec_idx = idx_map[spec_id]
-        ancestors = rx.ancestors(graph, spec_idx)
-        descendants = rx.descendants(graph, spec_idx)
-        included_indices = {spec_idx} | ancestors | descendants
-        included_spec_ids = {graph[idx] for idx in included_indices}
-
-        filtered_nodes = [n for n in nodes if n.spec_id in included_spec_ids]
-        filtered_edges = [
-            e
-            for e in edges
-            if e.from_spec_id in included_spec_ids and e.to_spec_id in included_spec_ids
-        ]
-        node_index_dict = {n.spec_id: n for n in filtered_nodes}
-
-        return filtered_nodes, filtered_edges, node_index_dict
+    def _stored_aggregates(self, spec_id: str) -> dict[str, Any] | None:
+        """Get the counters stored in a spec index, if there are any."""
+        aggregates = self._spec_manager.get_aggregates(spec_id)
+        return aggregates if isinstance(aggregates, dict) else None
 
     # -------------------------------------------------------------------------
     # Public Methods
     # -------------------------------------------------------------------------
 
-    def progress(self, spec_id: str) -> ProgressReport:
+    def progress(self, spec_id: str, *, recompute: bool = False) -> ProgressReport:
         """Get implementation progress for a specification.
 
+        Reads the counters stored in the spec index when there are any.
+
         Args:
             spec_id: The specification ID.
+            recompute: Scan all requirements instead of reading the stored
+                counters.
 
         Returns:
             ProgressReport with implementation metrics.
@@ -489,6 +327,9 @@ class QueryManager:
         Raises:
             SpecNotFoundError: If the specification doesn't exist.
         """
+        if not recompute and (aggregates := self._stored_aggregates(spec_id)):
+            return progress_from_aggregates(spec_id, aggregates)
+
         # Get requirements (raises SpecNotFoundError if spec doesn't exist)
         requirements = self._requirement_manager.list_requirements(spec_id)
 
@@ -523,11 +364,15 @@ class QueryManager:
             by_type=tuple(type_progress),
         )
 
-    def coverage(self, spec_id: str) -> CoverageReport:
+    def coverage(self, spec_id: str, *, recompute: bool = False) -> CoverageReport:
         """Get test coverage report for a specification.
 
+        Reads the counters stored in the spec index when there are any.
+
         Args:
             spec_id: The specification ID.
+            recompute: Scan all requirements and tests instead of reading the
+                stored counters.
 
         Returns:
             CoverageReport with coverage metrics.
@@ -535,6 +380,9 @@ class QueryManager:
         Raises:
             SpecNotFoundError: If the specification doesn't exist.
         """
+        if not recompute and (aggregates := self._stored_aggregates(spec_id)):
+            return coverage_from_aggregates(spec_id, aggregates)
+
         # Get requirements and tests (raises SpecNotFoundError if spec doesn't exist)
         requirements = self._requirement_manager.list_requirements(spec_id)
         tests = self._test_manager.list_tests(spec_id)
@@ -670,6 +518,7 @@ class QueryManager:
 
         Returns:
             DependencyGraph with nodes, edges, roots, leaves, and cycle info.
+            Node depths are the longest dependency chain from a root.
 
         Raises:
             SpecNotFoundError: If spec_id is provided but doesn't exist.
@@ -678,43 +527,41 @@ class QueryManager:
         if spec_id is not None:
             _ = self._spec_manager.get_spec(spec_id)
 
-        # Get all specs and build graph structure
-        specs = self._spec_manager.list_specs(include_archived=True)
-        graph, node_indices, spec_data = self._build_dependency_graph_structure(specs)
+        specs = self._specs()
+        graph = self._dependency_spec_graph()
 
         # Filter to subgraph if spec_id provided
-        if spec_id is not None and spec_id in node_indices:
-            included_spec_ids = self._filter_to_subgraph(graph, node_indices, spec_id)
+        if spec_id is not None and spec_id in graph:
+            included = set(graph.connected(spec_id))
         else:
-            included_spec_ids = set(node_indices.keys())
-
-        # Cycle detection
-        has_cycles, cycle_path = self._detect_cycles(graph)
-
-        # Roots and leaves
-        roots, leaves = self._compute_roots_and_leaves(
-            graph, node_indices, included_spec_ids
-        )
-
-        # Topological sort
-        topological_order = self._compute_topological_order(
-            graph, included_spec_ids, has_cycles=has_cycles
-        )
-
-        # Compute depths
-        depths = self._compute_depths(graph, node_indices, roots)
+            included = set(graph.spec_ids())
 
-        # Build nodes and edges
-        nodes = self._build_dependency_nodes(included_spec_ids, spec_data, depths)
-        edges = self._build_dependency_edges(graph, node_indices, included_spec_ids)
+        # Cycles are reported for the whole graph, as before filtering
+        cycle_path = graph.find_cycle()
+        depths = graph.depths()
 
         return DependencyGraph(
-            nodes=tuple(nodes),
-            edges=tuple(edges),
-            roots=tuple(roots),
-            leaves=tuple(leaves),
-            topological_order=topological_order,
-            has_cycles=has_cycles,
+            nodes=tuple(
+                DependencyNode(
+                    spec_id=spec.id,
+                    title=spec.title,
+                    status=spec.status,
+                    depth=depths.get(spec.id, 0),
+                )
+                for spec in specs
+                if spec.id in included
+            ),
+            edges=tuple(
+                (source, target)
+                for source, target, _ in graph.edges()
+                if source in included and target in included
+            ),
+            roots=tuple(node for node in graph.roots() if node in included),
+            leaves=tuple(node for node in graph.leaves() if node in included),
+            topological_order=tuple(
+                node for node in graph.topological_order() if node in included
+            ),
+            has_cycles=bool(cycle_path),
             cycle_path=cycle_path,
         )
 
@@ -740,35 +587,115 @@ class QueryManager:
         if spec_id is not None:
             _ = self._spec_manager.get_spec(spec_id)
 
-        # Get all specs
-        spec_summaries = self._spec_manager.list_specs(include_archived=True)
-        valid_spec_ids = {spec.id for spec in spec_summaries}
+        specs = self._specs()
+        graph = self._relationship_spec_graph(relationship_types)
+
+        # Filter to subgraph if spec_id provided
+        if spec_id is not None and spec_id in graph:
+            included = set(graph.connected(spec_id))
+        else:
+            included = set(graph.spec_ids())
 
-        # Build nodes
         nodes = [
             SpecNode(
-                spec_id=spec_summary.id,
-                title=spec_summary.title,
-                spec_type=spec_summary.spec_type,
-                status=spec_summary.status,
+                spec_id=spec.id,
+                title=spec.title,
+                spec_type=spec.spec_type,
+                status=spec.status,
             )
-            for spec_summary in spec_summaries
+            for spec in specs
+            if spec.id in included
         ]
-        node_index_dict = {n.spec_id: n for n in nodes}
-
-        # Collect edges
-        edges = self._collect_relationship_edges(
-            spec_summaries, valid_spec_ids, relationship_types
-        )
-
-        # Filter to subgraph if spec_id provided
-        if spec_id is not None:
-            nodes, edges, node_index_dict = self._filter_relationship_graph(
-                spec_id, spec_summaries, nodes, edges
+        edges = [
+            RelationshipEdge(
+                from_spec_id=source, to_spec_id=target, relationship_type=rel_type
             )
+            for source, target, rel_type in graph.edges()
+            if source in included and target in included
+        ]
 
         return RelationshipGraph(
             nodes=tuple(nodes),
             edges=tuple(edges),
-            node_index=MappingProxyType(node_index_dict),
+            node_index=MappingProxyType({n.spec_id: n for n in nodes}),
         )
+
+    def dependency_path(self, from_spec_id: str, to_spec_id: str) -> tuple[str, ...]:
+        """Find the shortest chain of dependencies between two specifications.
+
+        Args:
+            from_spec_id: The spec whose dependencies are followed.
+            to_spec_id: The spec to reach.
+
+        Returns:
+            Spec IDs along the chain, each depending on the next, or an empty
+            tuple if from_spec_id doesn't depend on to_spec_id.
+
+        Raises:
+            SpecNotFoundError: If either specification doesn't exist.
+        """
+        _ = self._spec_manager.get_spec(from_spec_id)
+        _ = self._spec_manager.get_spec(to_spec_id)
+
+        graph = self._dependency_spec_graph()
+        if from_spec_id not in graph or to_spec_id not in graph:
+            return ()
+        return graph.shortest_path(from_spec_id, to_spec_id)
+
+    def dependency_cycles(self) -> tuple[tuple[str, ...], ...]:
+        """Find groups of specifications that depend on each other.
+
+        Returns:
+            The strongly connected components of the dependency graph with
+            more than one spec. Empty if there are no dependency cycles.
+        """
+        return self._dependency_spec_graph().strongly_connected_components()
+
+    def critical_path(self) -> CriticalPath:
+        """Find the dependency chain with the most requirements.
+
+        Implementing a spec requires implementing the specs it depends on,
+        so this is the longest chain of work by requirement count.
+
+        Returns:
+            CriticalPath with the chain and its requirement count. The chain
+            is empty if the dependency graph has cycles.
+        """
+        graph = self._dependency_spec_graph()
+        weights: dict[str, int] = {}
+        for spec_id in graph.spec_ids():
+            try:
+                weights[spec_id] = len(
+                    self._requirement_manager.list_requirements(spec_id)
+                )
+            except SpecNotFoundError:
+                continue
+
+        spec_ids, requirement_count = graph.longest_path(weights)
+        return CriticalPath(spec_ids=spec_ids, requirement_count=requirement_count)
+
+    def impact(
+        self,
+        spec_id: str,
+        relationship_types: tuple[RelationshipType, ...] | None = None,
+    ) -> tuple[str, ...]:
+        """Find the specifications affected by a change to a specification.
+
+        Args:
+            spec_id: The changed specification ID.
+            relationship_types: Relationships that propagate a change, from
+                the spec holding them to their target. Defaults to depends_on,
+                extends, and integrates.
+
+        Returns:
+            IDs of the specs that relate to spec_id, directly or transitively.
+
+        Raises:
+            SpecNotFoundError: If the specification doesn't exist.
+        """
+        _ = self._spec_manager.get_spec(spec_id)
+
+        graph = self._relationship_spec_graph(relationship_types or _IMPACT_TYPES)
+        if spec_id not in graph:
+            return ()
+        return graph.dependents(spec_id)
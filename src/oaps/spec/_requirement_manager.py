@@ -7,7 +7,9 @@ within specifications. It handles requirement creation, updates, deletion,
 and maintains bidirectional links with tests.
 """
 
+from contextlib import AbstractContextManager, nullcontext
 from datetime import UTC, datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any, Final
 
 from oaps.exceptions import (
@@ -15,8 +17,10 @@ from oaps.exceptions import (
     SpecNotFoundError,
     SpecValidationError,
 )
-from oaps.spec._ids import next_requirement_id, next_sub_requirement_id
-from oaps.spec._io import append_jsonl, read_json, write_json_atomic
+from oaps.spec._history_log import append_history
+from oaps.spec._ids import next_sub_requirement_id, reserve_requirement_id
+from oaps.spec._import import import_requirement_arguments
+from oaps.spec._io import read_json, write_json_atomic
 from oaps.spec._models import (
     Requirement,
     RequirementsContainer,
@@ -30,10 +34,11 @@ from oaps.spec._models import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
     from pathlib import Path
 
     from oaps.config import SpecConfiguration
-    from oaps.repository import OapsRepository
+    from oaps.repository import CheckpointProtocol
     from oaps.spec._spec_manager import SpecManager
 
 __all__ = ["RequirementManager"]
@@ -65,7 +70,7 @@ class RequirementManager:
     )
 
     _config: SpecConfiguration | None
-    _oaps_repo: OapsRepository | None
+    _oaps_repo: CheckpointProtocol | None
     _requirements_cache: dict[str, RequirementsContainer]
     _spec_manager: SpecManager
     _tests_cache: dict[str, TestsContainer]
@@ -74,7 +79,7 @@ class RequirementManager:
         self,
         spec_manager: SpecManager,
         *,
-        oaps_repo: OapsRepository | None = None,
+        oaps_repo: CheckpointProtocol | None = None,
     ) -> None:
         """Initialize the requirement manager.
 
@@ -183,6 +188,10 @@ class RequirementManager:
         Returns:
             True if commit was made, False if no repository or no changes.
         """
+        batch = self._spec_manager.active_batch
+        if batch is not None:
+            batch.record_action(action, self._oaps_repo)
+            return False
         if self._oaps_repo is None:
             return False
 
@@ -205,6 +214,12 @@ class RequirementManager:
         Raises:
             SpecNotFoundError: If the specification doesn't exist.
         """
+        batch = self._spec_manager.active_batch
+        if (
+            batch is not None
+            and (staged := batch.staged_requirements(spec_id)) is not None
+        ):
+            return staged
         if spec_id in self._requirements_cache:
             return self._requirements_cache[spec_id]
 
@@ -247,6 +262,9 @@ class RequirementManager:
         Raises:
             SpecNotFoundError: If the specification doesn't exist.
         """
+        batch = self._spec_manager.active_batch
+        if batch is not None and (staged := batch.staged_tests(spec_id)) is not None:
+            return staged
         if spec_id in self._tests_cache:
             return self._tests_cache[spec_id]
 
@@ -281,10 +299,27 @@ class RequirementManager:
     ) -> None:
         """Write requirements to disk atomically.
 
+        While a batch is open, the requirements are staged in the batch and
+        written when it is applied.
+
         Args:
             spec_id: The specification ID.
             requirements: The requirements to write.
         """
+        batch = self._spec_manager.active_batch
+        if batch is not None:
+            container = RequirementsContainer(
+                version=_CONTAINER_VERSION,
+                spec_id=spec_id,
+                updated=datetime.now(UTC),
+                requirements=requirements,
+            )
+            batch.stage_requirements(
+                container, partial(self._write_requirements, spec_id, requirements)
+            )
+            _ = self._requirements_cache.pop(spec_id, None)
+            return
+
         path = self._requirements_path(spec_id)
         now = datetime.now(UTC)
         data: dict[str, Any] = {
@@ -295,14 +330,33 @@ class RequirementManager:
         }
         write_json_atomic(path, data)
         _ = self._requirements_cache.pop(spec_id, None)
+        self._spec_manager.update_search_index(path)
+        _ = self._spec_manager.refresh_aggregates(
+            spec_id, requirements=data["requirements"]
+        )
 
     def _write_tests(self, spec_id: str, tests: tuple[Test, ...]) -> None:
         """Write tests to disk atomically.
 
+        While a batch is open, the tests are staged in the batch and written
+        when it is applied.
+
         Args:
             spec_id: The specification ID.
             tests: The tests to write.
         """
+        batch = self._spec_manager.active_batch
+        if batch is not None:
+            container = TestsContainer(
+                version=_CONTAINER_VERSION,
+                spec_id=spec_id,
+                updated=datetime.now(UTC),
+                tests=tests,
+            )
+            batch.stage_tests(container, partial(self._write_tests, spec_id, tests))
+            _ = self._tests_cache.pop(spec_id, None)
+            return
+
         path = self._tests_path(spec_id)
         now = datetime.now(UTC)
         data: dict[str, Any] = {
@@ -313,6 +367,8 @@ class RequirementManager:
         }
         write_json_atomic(path, data)
         _ = self._tests_cache.pop(spec_id, None)
+        self._spec_manager.update_search_index(path)
+        _ = self._spec_manager.refresh_aggregates(spec_id, tests=data["tests"])
 
     def _record_history(  # noqa: PLR0913
         self,
@@ -345,7 +401,11 @@ class RequirementManager:
         if to_value is not None:
             entry["to_value"] = to_value
 
-        append_jsonl(self._history_path(spec_id), entry)
+        batch = self._spec_manager.active_batch
+        if batch is not None:
+            batch.record_history(self._history_path(spec_id), entry)
+            return
+        append_history(self._history_path(spec_id), [entry])
 
     def _dict_to_requirement(self, data: dict[str, Any]) -> Requirement:
         """Convert a dictionary to a Requirement.
@@ -735,44 +795,50 @@ class RequirementManager:
                     msg, spec_id=spec_id, field="parent", value=parent
                 )
 
-        # Generate ID
+        # Reserve an ID; a top-level number is released if the write fails
         config = self._get_config()
+        reservation: AbstractContextManager[str]
         if parent is not None:
-            req_id = next_sub_requirement_id(parent, existing_ids, config.numbering)
+            reservation = nullcontext(
+                next_sub_requirement_id(parent, existing_ids, config.numbering)
+            )
         else:
-            req_id = next_requirement_id(spec_id, req_type, existing_ids, config)
+            reservation = reserve_requirement_id(
+                self._spec_manager.id_counters, spec_id, req_type, existing_ids, config
+            )
 
-        # Create requirement
-        now = datetime.now(UTC)
-        acceptance = tuple(acceptance_criteria) if acceptance_criteria else ()
-        requirement = Requirement(
-            id=req_id,
-            title=title,
-            req_type=req_type,
-            status=RequirementStatus.PROPOSED,
-            created=now,
-            updated=now,
-            author=actor,
-            description=description,
-            rationale=rationale,
-            acceptance_criteria=acceptance,
-            verified_by=(),
-            depends_on=tuple(depends_on) if depends_on else (),
-            tags=tuple(tags) if tags else (),
-            source_section=source_section,
-            parent=parent,
-            subtype=subtype,
-            scale=scale,
-            meter=meter,
-            baseline=baseline,
-            goal=goal,
-            stretch=stretch,
-            fail=fail,
-        )
+        with reservation as req_id:
+            # Create requirement
+            now = datetime.now(UTC)
+            acceptance = tuple(acceptance_criteria) if acceptance_criteria else ()
+            requirement = Requirement(
+                id=req_id,
+                title=title,
+                req_type=req_type,
+                status=RequirementStatus.PROPOSED,
+                created=now,
+                updated=now,
+                author=actor,
+                description=description,
+                rationale=rationale,
+                acceptance_criteria=acceptance,
+                verified_by=(),
+                depends_on=tuple(depends_on) if depends_on else (),
+                tags=tuple(tags) if tags else (),
+                source_section=source_section,
+                parent=parent,
+                subtype=subtype,
+                scale=scale,
+                meter=meter,
+                baseline=baseline,
+                goal=goal,
+                stretch=stretch,
+                fail=fail,
+            )
 
-        # Write updated requirements
-        new_requirements = (*container.requirements, requirement)
-        self._write_requirements(spec_id, new_requirements)
+            # Write updated requirements
+            new_requirements = (*container.requirements, requirement)
+            self._write_requirements(spec_id, new_requirements)
 
         # Record history
         self._record_history(
@@ -1137,3 +1203,50 @@ class RequirementManager:
         _ = self._commit(f"link requirement {spec_id}:{req_id}", session_id=session_id)
 
         return updated
+
+    def import_requirements(
+        self,
+        spec_id: str,
+        records: Iterable[Mapping[str, Any]],
+        *,
+        actor: str,
+        session_id: str | None = None,
+    ) -> list[Requirement]:
+        """Create requirements from import records in one batch.
+
+        Every record is checked before any requirement is created. The
+        requirements are then added in a single ``SpecManager.batch``, so
+        requirements.json is written once and one checkpoint is committed.
+        A record may name a requirement created by an earlier record as its
+        parent.
+
+        Args:
+            spec_id: The specification ID.
+            records: Records with the arguments of ``add_requirement``, e.g.
+                from ``read_import_records``.
+            actor: The actor performing the action (for history).
+            session_id: Optional session ID for commit trailer.
+
+        Returns:
+            The created requirements, in record order.
+
+        Raises:
+            SpecNotFoundError: If the specification doesn't exist.
+            RequirementNotFoundError: If a parent requirement doesn't exist.
+            SpecValidationError: If a record is invalid. Nothing is created.
+        """
+        arguments = [
+            import_requirement_arguments(record, spec_id=spec_id, number=number)
+            for number, record in enumerate(records, start=1)
+        ]
+        with self._spec_manager.batch(
+            spec_id,
+            action=f"import {len(arguments)} requirements {spec_id}",
+            session_id=session_id,
+        ):
+            return [
+                self.add_requirement(
+                    spec_id, **kwargs, actor=actor, session_id=session_id
+                )
+                for kwargs in arguments
+            ]
@@ -0,0 +1,247 @@
+# pyright: reportAny=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+# pyright: reportUnknownMemberType=false, reportExplicitAny=false
+"""Test result and coverage reports written by pytest and coverage.py.
+
+Test results used to reach the specs only through regular expressions over
+the pytest output captured by hooks. This module reads the report files
+that the runs write instead:
+
+- JUnit XML (``pytest --junitxml=...``) is parsed incrementally with
+  ``iterparse``; each ``<testcase>`` is yielded and cleared as soon as it is
+  complete, so memory does not grow with the size of the suite.
+- pytest-json-report files (``pytest --json-report``) hold one JSON
+  document, which is loaded with orjson and converted test by test.
+- Coverage JSON files (``coverage json``, ``--cov-report=json``) are
+  converted to per-file line and branch percentages.
+
+Results are ``PytestTest`` instances, so they can be passed to
+``TestManager.ingest`` or ``TestManager.sync``.
+
+Example:
+    >>> for test in read_test_results(Path("junit.xml")):
+    ...     print(test.node_id, test.outcome)
+    tests/test_auth.py::TestLogin::test_valid passed
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+from xml.etree.ElementTree import ParseError, iterparse
+
+import orjson
+
+from oaps.exceptions import SpecIOError, SpecParseError
+from oaps.spec._models import PytestTest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from xml.etree.ElementTree import Element
+
+__all__ = [
+    "iter_junit_results",
+    "iter_report_results",
+    "read_coverage_json",
+    "read_test_results",
+]
+
+# JUnit child elements that mark a test case as not passed, by outcome
+_JUNIT_OUTCOMES: Final = (
+    ("failure", "failed"),
+    ("error", "error"),
+    ("skipped", "skipped"),
+)
+
+
+def _junit_node_id(testcase: Element) -> str:
+    """Rebuild the pytest node ID of a JUnit test case.
+
+    pytest writes the dotted module path and class names as ``classname``.
+    Segments up to the first capitalized one are taken as the module path,
+    unless the test case has a ``file`` attribute (xunit1).
+    """
+    name = testcase.get("name", "")
+    parts = [part for part in testcase.get("classname", "").split(".") if part]
+    file_path = testcase.get("file")
+    if file_path:
+        module_length = len(Path(file_path).with_suffix("").parts)
+    else:
+        module_length = next(
+            (i for i, part in enumerate(parts) if part[:1].isupper()), len(parts)
+        )
+        file_path = "/".join(parts[:module_length]) + ".py"
+    return "::".join([file_path, *parts[module_length:], name])
+
+
+def _junit_test(testcase: Element) -> PytestTest:
+    """Convert a complete JUnit test case to a result."""
+    outcome, message = "passed", None
+    for tag, junit_outcome in _JUNIT_OUTCOMES:
+        child = testcase.find(tag)
+        if child is not None:
+            outcome = junit_outcome
+            message = child.get("message") or child.text or None
+            break
+    try:
+        duration = float(testcase.get("time", "0") or 0)
+    except ValueError:
+        duration = 0.0
+    return PytestTest(
+        node_id=_junit_node_id(testcase),
+        outcome=outcome,
+        duration=duration,
+        message=message,
+    )
+
+
+def iter_junit_results(path: Path | str) -> Iterator[PytestTest]:
+    """Parse a JUnit XML report incrementally.
+
+    Args:
+        path: Path to the report.
+
+    Yields:
+        One result per ``<testcase>``, in file order.
+
+    Raises:
+        SpecIOError: If the file cannot be read.
+        SpecParseError: If the file is not well-formed XML.
+    """
+    path = Path(path)
+    try:
+        for _, element in iterparse(path, events=("end",)):  # noqa: S314
+            if element.tag == "testcase":
+                yield _junit_test(element)
+                element.clear()
+    except ParseError as e:
+        msg = f"Invalid JUnit XML: {e}"
+        raise SpecParseError(msg, path=path, content_type="xml", cause=e) from e
+    except OSError as e:
+        msg = f"Failed to read file: {e}"
+        raise SpecIOError(msg, path=path, operation="read", cause=e) from e
+
+
+def iter_report_results(data: dict[str, Any]) -> Iterator[PytestTest]:
+    """Convert the tests of a pytest-json-report document to results.
+
+    Args:
+        data: Parsed report.
+
+    Yields:
+        One result per test entry with a node ID and outcome.
+    """
+    tests = data.get("tests", [])
+    if not isinstance(tests, list):
+        return
+    for entry in tests:
+        if not isinstance(entry, dict):
+            continue
+        node_id = entry.get("nodeid", "")
+        outcome = entry.get("outcome", "")
+        if not isinstance(node_id, str) or not isinstance(outcome, str):
+            continue
+
+        # Extract error message from call.longrepr if present
+        message: str | None = None
+        call = entry.get("call")
+        if isinstance(call, dict) and isinstance(call.get("longrepr"), str):
+            message = call["longrepr"]
+
+        duration = entry.get("duration", 0.0)
+        yield PytestTest(
+            node_id=node_id,
+            outcome=outcome,
+            duration=float(duration) if isinstance(duration, (int, float)) else 0.0,
+            message=message,
+        )
+
+
+def _read_json_object(path: Path) -> dict[str, Any]:
+    """Read a JSON file that must hold an object.
+
+    Raises:
+        SpecIOError: If the file cannot be read.
+        SpecParseError: If the file is not a JSON object.
+    """
+    try:
+        data = orjson.loads(path.read_bytes())
+    except orjson.JSONDecodeError as e:
+        msg = f"Invalid JSON: {e}"
+        raise SpecParseError(msg, path=path, content_type="json", cause=e) from e
+    except OSError as e:
+        msg = f"Failed to read file: {e}"
+        raise SpecIOError(msg, path=path, operation="read", cause=e) from e
+    if not isinstance(data, dict):
+        msg = f"Expected JSON object, got {type(data).__name__}"
+        raise SpecParseError(msg, path=path, content_type="json")
+    return data
+
+
+def read_test_results(path: Path | str) -> Iterator[PytestTest]:
+    """Read the results of a JUnit XML or pytest-json-report file.
+
+    Files ending in ``.xml`` are parsed as JUnit XML; anything else as a
+    pytest-json-report document.
+
+    Args:
+        path: Path to the report.
+
+    Returns:
+        Iterator over the results, in file order.
+
+    Raises:
+        SpecIOError: If the file cannot be read.
+        SpecParseError: If the file cannot be parsed.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".xml":
+        return iter_junit_results(path)
+    return iter_report_results(_read_json_object(path))
+
+
+def read_coverage_json(path: Path | str) -> dict[str, dict[str, object]]:
+    """Read per-file coverage from a coverage.py JSON report.
+
+    Args:
+        path: Path to the report.
+
+    Returns:
+        Dict mapping file paths to "line" and, with branch coverage,
+        "branch" percentages, plus a "total" entry.
+
+    Raises:
+        SpecIOError: If the file cannot be read.
+        SpecParseError: If the file is not a JSON object.
+    """
+    data = _read_json_object(Path(path))
+    coverage: dict[str, dict[str, object]] = {}
+    files = data.get("files", {})
+    if isinstance(files, dict):
+        for file_path, file_data in files.items():
+            if isinstance(file_data, dict):
+                coverage[file_path] = _coverage_summary(file_data.get("summary"))
+    coverage["total"] = _coverage_summary(data.get("totals"))
+    return coverage
+
+
+def _coverage_summary(summary: object) -> dict[str, object]:
+    """Convert a coverage.py summary to line and branch percentages."""
+    if not isinstance(summary, dict):
+        return {}
+    statements = summary.get("num_statements", 0)
+    missing = summary.get("missing_lines", 0)
+    result: dict[str, object] = {
+        "line": _percent(statements - missing, statements),
+        "statements": statements,
+        "missing": missing,
+    }
+    branches = summary.get("num_branches")
+    if branches:
+        branch_missing = summary.get("missing_branches", 0)
+        result["branch"] = _percent(branches - branch_missing, branches)
+        result["branches"] = branches
+        result["branch_missing"] = branch_missing
+    return result
+
+
+def _percent(covered: int, total: int) -> int:
+    """Round a coverage percentage like coverage.py's text report."""
+    return round(100 * covered / total) if total else 100
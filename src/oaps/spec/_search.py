@@ -0,0 +1,208 @@
+# pyright: reportAny=false, reportExplicitAny=false
+"""Full-text search documents for a specification tree.
+
+All specifications under one base directory share a single search index,
+``.cache/search.db`` in the base directory. Each spec directory contributes:
+
+- ``index.json``: one "spec" document (title, tags, summary)
+- ``requirements.json``: one "requirement" document per requirement
+- ``tests.json``: one "test" document per test
+- ``*.md`` files: one "document" per markdown file (e.g. spec.md)
+- ``artifacts/``: one "artifact" document per artifact
+
+Every document's scope is the ID of the spec it belongs to.
+"""
+
+import re
+from typing import TYPE_CHECKING, Any, Final
+
+from oaps.exceptions import SpecError
+from oaps.search import SearchDocument
+from oaps.spec._io import read_json
+from oaps.utils._frontmatter import split_frontmatter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SPEC_SEARCH_KINDS: Final = ("spec", "requirement", "test", "document", "artifact")
+
+_SPEC_DIR_PATTERN: Final = re.compile(r"^([A-Za-z0-9]+)-")
+
+_JSON_SOURCES: Final = ("index.json", "requirements.json", "tests.json")
+
+
+def _spec_scope(spec_dir: Path) -> str | None:
+    """Get the spec ID of a spec directory named ``{spec_id}-{slug}``."""
+    match = _SPEC_DIR_PATTERN.match(spec_dir.name)
+    return match.group(1) if match else None
+
+
+def iter_spec_search_sources(base_path: Path) -> list[Path]:
+    """List every file search documents are extracted from.
+
+    Args:
+        base_path: Specifications base directory.
+
+    Returns:
+        Source files of all spec directories, sorted.
+    """
+    from oaps.artifacts._search import (  # noqa: PLC0415 - avoids import cycle
+        iter_artifact_search_sources,
+    )
+
+    if not base_path.is_dir():
+        return []
+    sources: list[Path] = []
+    for spec_dir in sorted(base_path.iterdir()):
+        if not spec_dir.is_dir() or _spec_scope(spec_dir) is None:
+            continue
+        sources.extend(
+            path for name in _JSON_SOURCES if (path := spec_dir / name).is_file()
+        )
+        sources.extend(
+            path
+            for path in sorted(spec_dir.glob("*.md"))
+            if not path.name.startswith(".")
+        )
+        sources.extend(iter_artifact_search_sources(spec_dir / "artifacts"))
+    return sources
+
+
+def _text(*parts: Any) -> str:
+    """Join the non-empty string parts of a document's text."""
+    lines: list[str] = []
+    for part in parts:
+        if isinstance(part, str) and part:
+            lines.append(part)
+        elif isinstance(part, list):
+            lines.extend(str(item) for item in part if item)
+    return "\n\n".join(lines)
+
+
+def _tags(data: dict[str, Any]) -> tuple[str, ...]:
+    tags = data.get("tags")
+    return tuple(str(tag) for tag in tags) if isinstance(tags, list) else ()
+
+
+def _str_or_none(value: Any) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+def _entry_documents(
+    entries: Any, kind: str, scope: str, type_key: str, text_keys: tuple[str, ...]
+) -> list[SearchDocument]:
+    """Build documents from the entries of a requirements or tests file."""
+    if not isinstance(entries, list):
+        return []
+    documents: list[SearchDocument] = []
+    for entry in entries:
+        if not isinstance(entry, dict) or not isinstance(entry.get("id"), str):
+            continue
+        documents.append(
+            SearchDocument(
+                kind=kind,
+                doc_id=entry["id"],
+                title=str(entry.get("title", "")),
+                body=_text(*(entry.get(key) for key in text_keys)),
+                tags=_tags(entry),
+                scope=scope,
+                status=_str_or_none(entry.get("status")),
+                doc_type=_str_or_none(entry.get(type_key)),
+            )
+        )
+    return documents
+
+
+def _json_documents(path: Path, scope: str) -> list[SearchDocument]:
+    try:
+        data = read_json(path)
+    except SpecError:
+        return []
+    if not isinstance(data, dict):
+        return []
+
+    match path.name:
+        case "index.json":
+            return [
+                SearchDocument(
+                    kind="spec",
+                    doc_id=str(data.get("id", scope)),
+                    title=str(data.get("title", "")),
+                    body=_text(data.get("summary")),
+                    tags=_tags(data),
+                    scope=scope,
+                    status=_str_or_none(data.get("status")),
+                    doc_type=_str_or_none(data.get("spec_type")),
+                )
+            ]
+        case "requirements.json":
+            return _entry_documents(
+                data.get("requirements"),
+                "requirement",
+                scope,
+                "req_type",
+                ("description", "rationale", "acceptance_criteria"),
+            )
+        case _:
+            return _entry_documents(
+                data.get("tests"),
+                "test",
+                scope,
+                "method",
+                ("description", "steps", "expected_result"),
+            )
+
+
+def _markdown_document(path: Path, scope: str) -> list[SearchDocument]:
+    try:
+        content = path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        return []
+    split = split_frontmatter(content)
+    body = split[1] if split is not None else content
+    title = path.stem
+    for line in body.splitlines():
+        if line.startswith("# "):
+            title = line[2:].strip()
+            break
+    return [
+        SearchDocument(
+            kind="document",
+            doc_id=f"{scope}/{path.name}",
+            title=title,
+            body=body,
+            scope=scope,
+        )
+    ]
+
+
+def extract_spec_search_documents(path: Path) -> list[SearchDocument]:
+    """Extract the search documents of a file in a specification tree.
+
+    Args:
+        path: A file listed by ``iter_spec_search_sources``.
+
+    Returns:
+        Documents of the file; none if it is malformed or not a known source.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    from oaps.artifacts._search import (  # noqa: PLC0415 - avoids import cycle
+        artifact_search_documents,
+    )
+
+    if path.parent.name == "artifacts":
+        scope = _spec_scope(path.parent.parent)
+        if scope is None:
+            return []
+        return artifact_search_documents(path, scope=scope)
+
+    scope = _spec_scope(path.parent)
+    if scope is None:
+        return []
+    if path.name in _JSON_SOURCES:
+        return _json_documents(path, scope)
+    if path.suffix == ".md":
+        return _markdown_document(path, scope)
+    return []
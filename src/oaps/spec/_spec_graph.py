@@ -0,0 +1,266 @@
+"""Dependency and relationship graph over specifications.
+
+``SpecGraph`` holds specifications as a rustworkx directed graph, with an
+edge from each spec to every spec it depends on, extends, supersedes, or
+integrates. Edge payloads are the relationship types. QueryManager builds
+one graph per set of relationship types on first use and keeps it until a
+spec is created, updated, or deleted, so repeated graph queries skip
+rebuilding it from the indexes.
+
+Cycles, topological order, and depths come from rustworkx; depths are
+computed on the condensation of the graph, so they are defined even when
+specs depend on each other in a cycle.
+
+Example:
+    >>> graph = SpecGraph(
+    ...     ["0001", "0002", "0003"],
+    ...     [
+    ...         ("0002", "0001", RelationshipType.DEPENDS_ON),
+    ...         ("0003", "0002", RelationshipType.DEPENDS_ON),
+    ...     ],
+    ... )
+    >>> graph.shortest_path("0003", "0001")
+    ('0003', '0002', '0001')
+    >>> graph.dependents("0001")
+    ('0002', '0003')
+"""
+
+from typing import TYPE_CHECKING, Final, cast
+
+import rustworkx as rx
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from oaps.spec._models import RelationshipType
+
+__all__ = ["SpecGraph"]
+
+
+class SpecGraph:
+    """Graph of relationships between specifications.
+
+    Attributes:
+        _graph: Relationship graph; node payloads are spec IDs and edge
+            payloads relationship types.
+        _nodes: Dict mapping spec IDs to node indices.
+    """
+
+    __slots__: Final = ("_graph", "_nodes")
+
+    _graph: rx.PyDiGraph[str, RelationshipType]
+    _nodes: dict[str, int]
+
+    def __init__(
+        self,
+        spec_ids: Iterable[str],
+        edges: Iterable[tuple[str, str, RelationshipType]] = (),
+    ) -> None:
+        """Build the graph.
+
+        Args:
+            spec_ids: IDs of the specifications, in listing order.
+            edges: Tuples of (from spec ID, to spec ID, relationship type).
+                Edges naming an unknown spec are skipped.
+        """
+        self._graph = rx.PyDiGraph(check_cycle=False)
+        self._nodes = {}
+        for spec_id in spec_ids:
+            self._nodes[spec_id] = self._graph.add_node(spec_id)
+        _ = self._graph.add_edges_from(
+            [
+                (self._nodes[source], self._nodes[target], rel_type)
+                for source, target, rel_type in edges
+                if source in self._nodes and target in self._nodes
+            ]
+        )
+
+    def __contains__(self, spec_id: object) -> bool:
+        """Check whether a spec is in the graph."""
+        return spec_id in self._nodes
+
+    @property
+    def count(self) -> int:
+        """Number of specs in the graph."""
+        return len(self._nodes)
+
+    def _ids(self, indices: Iterable[int]) -> tuple[str, ...]:
+        """Map node indices to spec IDs, in listing order."""
+        return tuple(self._graph[index] for index in sorted(indices))
+
+    # --- Structure ---
+
+    def spec_ids(self) -> tuple[str, ...]:
+        """All spec IDs, in listing order."""
+        return tuple(self._nodes)
+
+    def edges(self) -> tuple[tuple[str, str, RelationshipType], ...]:
+        """All edges as (from spec ID, to spec ID, relationship type)."""
+        return tuple(
+            (self._graph[source], self._graph[target], rel_type)
+            for source, target, rel_type in self._graph.weighted_edge_list()
+        )
+
+    def roots(self) -> tuple[str, ...]:
+        """Specs no other spec relates to."""
+        return tuple(
+            spec_id
+            for spec_id, index in self._nodes.items()
+            if self._graph.in_degree(index) == 0
+        )
+
+    def leaves(self) -> tuple[str, ...]:
+        """Specs that relate to no other spec."""
+        return tuple(
+            spec_id
+            for spec_id, index in self._nodes.items()
+            if self._graph.out_degree(index) == 0
+        )
+
+    def connected(self, spec_id: str) -> tuple[str, ...]:
+        """The spec and every spec reachable from or reaching it.
+
+        Args:
+            spec_id: The spec ID.
+
+        Returns:
+            Spec IDs in listing order.
+        """
+        index = self._nodes[spec_id]
+        return self._ids(
+            {index}
+            | rx.ancestors(self._graph, index)
+            | rx.descendants(self._graph, index)
+        )
+
+    def dependents(self, spec_id: str) -> tuple[str, ...]:
+        """Specs that relate to the spec, directly or transitively.
+
+        These are the specs affected by a change to it.
+
+        Args:
+            spec_id: The spec ID.
+
+        Returns:
+            Spec IDs in listing order, without the spec itself.
+        """
+        index = self._nodes[spec_id]
+        return self._ids(rx.ancestors(self._graph, index) - {index})
+
+    # --- Ordering ---
+
+    def find_cycle(self) -> tuple[str, ...]:
+        """Find a cycle in the graph.
+
+        Returns:
+            The spec IDs along the cycle, starting and ending with the same
+            spec, or an empty tuple if the graph has no cycles.
+        """
+        cycle_edges = rx.digraph_find_cycle(self._graph)
+        if not cycle_edges:
+            return ()
+        path = [self._graph[source] for source, _ in cycle_edges]
+        path.append(self._graph[cycle_edges[-1][1]])
+        return tuple(path)
+
+    def topological_order(self) -> tuple[str, ...]:
+        """Specs ordered so every spec comes before the specs it relates to.
+
+        Returns:
+            Spec IDs, or an empty tuple if the graph has cycles.
+        """
+        try:
+            return tuple(
+                self._graph[index] for index in rx.topological_sort(self._graph)
+            )
+        except rx.DAGHasCycle:
+            return ()
+
+    def depths(self) -> dict[str, int]:
+        """Length of the longest path from a root to each spec.
+
+        Specs in a cycle share the depth of the cycle.
+
+        Returns:
+            Dict mapping spec IDs to depths.
+        """
+        # Node payloads of the condensation are the spec IDs of a component
+        condensed = cast(
+            "rx.PyDiGraph[list[str], object]", rx.condensation(self._graph)
+        )
+        depths: dict[str, int] = {}
+        for depth, generation in enumerate(rx.topological_generations(condensed)):
+            for component in generation:
+                depths.update(dict.fromkeys(condensed[component], depth))
+        return depths
+
+    # --- Paths ---
+
+    def shortest_path(self, source: str, target: str) -> tuple[str, ...]:
+        """Shortest path of relationships from one spec to another.
+
+        Args:
+            source: The spec ID to start from.
+            target: The spec ID to reach.
+
+        Returns:
+            Spec IDs along the path, including both ends, or an empty tuple
+            if the target is not reachable.
+        """
+        if source == target:
+            return (source,)
+        target_index = self._nodes[target]
+        paths = rx.digraph_dijkstra_shortest_paths(
+            self._graph, self._nodes[source], target=target_index
+        )
+        if target_index not in paths:
+            return ()
+        return tuple(self._graph[index] for index in paths[target_index])
+
+    def strongly_connected_components(self) -> tuple[tuple[str, ...], ...]:
+        """Groups of specs that all reach each other.
+
+        Returns:
+            Components of more than one spec, each in listing order, ordered
+            by their first spec.
+        """
+        return tuple(
+            sorted(
+                (
+                    self._ids(component)
+                    for component in rx.strongly_connected_components(self._graph)
+                    if len(component) > 1
+                ),
+                key=lambda component: self._nodes[component[0]],
+            )
+        )
+
+    def longest_path(self, weights: Mapping[str, int]) -> tuple[tuple[str, ...], int]:
+        """Path with the largest total spec weight.
+
+        Args:
+            weights: Weight of each spec. Specs not listed weigh 0.
+
+        Returns:
+            Tuple of (spec IDs along the path, total weight). The path is
+            empty if the graph is empty or has cycles.
+        """
+        if not self._nodes:
+            return (), 0
+        # Route every path through a virtual source, so each edge can carry
+        # the weight of the spec it leads to
+        graph = cast("rx.PyDiGraph[str, RelationshipType | None]", self._graph.copy())
+        source = graph.add_node("")
+        _ = graph.add_edges_from_no_data(
+            [(source, index) for index in self._nodes.values()]
+        )
+
+        def weight(_source: int, target: int, _edge: object) -> float:
+            return float(weights.get(graph[target], 0))
+
+        try:
+            path: Sequence[int] = rx.dag_weighted_longest_path(graph, weight)
+        except rx.DAGHasCycle:
+            return (), 0
+        spec_ids = tuple(graph[index] for index in path if index != source)
+        return spec_ids, sum(weights.get(spec_id, 0) for spec_id in spec_ids)
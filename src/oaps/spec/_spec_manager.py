@@ -3,16 +3,21 @@
 """Specification manager for CRUD operations on specifications.
 
 This module provides the SpecManager class for managing specifications in
-`.oaps/docs/specs/`. It maintains dual indexes (root and per-spec) with
-computed inverse relationships.
+`.oaps/docs/specs/`. It maintains dual indexes (root and per-spec). Inverse
+relationships (dependents, extended_by, superseded_by, integrated_by) are
+stored on the root index entries and updated incrementally by each mutation,
+so reading a spec never scans the other specs.
 """
 
+import contextlib
 import re
 import shutil
+import sqlite3
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Final, Literal
+from typing import TYPE_CHECKING, Any, Final, Literal, cast
 
 from oaps.exceptions import (
     CircularDependencyError,
@@ -20,7 +25,14 @@ from oaps.exceptions import (
     SpecNotFoundError,
     SpecValidationError,
 )
-from oaps.spec._ids import next_spec_id, validate_spec_id
+from oaps.search import SEARCH_INDEX_NAME, SearchField, SearchHit, SearchIndex
+from oaps.spec._aggregates import (
+    AGGREGATES_VERSION,
+    compute_aggregates,
+    diff_aggregates,
+)
+from oaps.spec._batch import SpecBatch
+from oaps.spec._ids import reserve_spec_id, validate_spec_id
 from oaps.spec._io import append_jsonl, read_json, write_json_atomic
 from oaps.spec._models import (
     Counts,
@@ -30,18 +42,30 @@ from oaps.spec._models import (
     SpecSummary,
     SpecType,
 )
+from oaps.spec._search import (
+    SPEC_SEARCH_KINDS,
+    extract_spec_search_documents,
+    iter_spec_search_sources,
+)
+from oaps.utils._id_counters import ID_COUNTERS_NAME, IDCounters
+from oaps.utils._paths import get_cache_dir
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
     from oaps.config import SpecConfiguration
-    from oaps.repository import OapsRepository
+    from oaps.repository import CheckpointProtocol
 
 __all__ = ["SpecManager", "SpecValidationIssue"]
 
 # Slug validation pattern: lowercase letters, digits, hyphens between words
 _SLUG_PATTERN = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
 
-# Root index schema version
-_INDEX_VERSION = 1
+# Root index schema version (2 stores inverse relationships on each entry)
+_INDEX_VERSION = 2
+
+# Root index entry keys holding inverse relationships
+_INVERSE_KEYS: Final = ("dependents", "extended_by", "superseded_by", "integrated_by")
 
 # Minimum items required for integration specs
 _MIN_INTEGRATION_ITEMS = 2
@@ -54,7 +78,7 @@ _MIN_INTEGRATION_ITEMS = 2
 
 @dataclass(slots=True)
 class _RelationshipInverses:
-    """Computed inverse relationships for a specification.
+    """Inverse relationships of a specification, from its root index entry.
 
     Attributes:
         dependents: IDs of specs that depend on this spec.
@@ -88,6 +112,55 @@ class SpecValidationIssue:
     related_id: str | None = None
 
 
+def _inverse_edges(relationships: Relationships | None) -> list[tuple[str, str]]:
+    """List the inverse edges created by a spec's outgoing relationships.
+
+    Args:
+        relationships: The spec's relationships, or None for no spec.
+
+    Returns:
+        Tuples of (inverse key on the target's entry, target spec ID).
+    """
+    if relationships is None:
+        return []
+    edges = [("dependents", dep_id) for dep_id in relationships.depends_on]
+    if relationships.extends:
+        edges.append(("extended_by", relationships.extends))
+    if relationships.supersedes:
+        edges.append(("superseded_by", relationships.supersedes))
+    edges.extend(("integrated_by", int_id) for int_id in relationships.integrates)
+    return edges
+
+
+def _add_inverse(entry: dict[str, Any], key: str, spec_id: str) -> None:
+    """Add a spec to an inverse relationship of a root index entry."""
+    if key == "superseded_by":
+        entry[key] = spec_id
+    else:
+        entry[key] = sorted({*entry.get(key, []), spec_id})
+
+
+def _remove_inverse(entry: dict[str, Any], key: str, spec_id: str) -> None:
+    """Remove a spec from an inverse relationship of a root index entry."""
+    if key == "superseded_by":
+        if entry.get(key) == spec_id:
+            del entry[key]
+        return
+    remaining = [other for other in entry.get(key, []) if other != spec_id]
+    if remaining:
+        entry[key] = remaining
+    else:
+        _ = entry.pop(key, None)
+
+
+def _read_records(path: Path, key: str) -> list[dict[str, Any]]:
+    """Read the records of a requirements.json or tests.json file."""
+    if not path.exists():
+        return []
+    records = read_json(path).get(key, [])
+    return records if isinstance(records, list) else []
+
+
 # =============================================================================
 # SpecManager Class
 # =============================================================================
@@ -102,26 +175,38 @@ class SpecManager:
 
     Attributes:
         _base_path: Base directory for specifications.
+        _batch: Batch of staged changes, while one is open.
         _config: Specification configuration.
-        _relationship_graph: Cached inverse relationship graph.
+        _root_entries: Cached root index entries by spec ID.
         _root_index_cache: Cached root index data.
+        _search_index: Full-text index of the specification tree.
+        _id_counters: Persistent ID counters of the specification tree.
+        _revision: Number of times the cached data has been invalidated.
         _spec_cache: Cached per-spec index data.
     """
 
     __slots__: Final = (
         "_base_path",
+        "_batch",
         "_config",
+        "_id_counters",
         "_oaps_repo",
-        "_relationship_graph",
+        "_revision",
+        "_root_entries",
         "_root_index_cache",
+        "_search_index",
         "_spec_cache",
     )
 
     _base_path: Path
+    _batch: SpecBatch | None
     _config: SpecConfiguration | None
-    _oaps_repo: OapsRepository | None
-    _relationship_graph: dict[str, _RelationshipInverses] | None
+    _oaps_repo: CheckpointProtocol | None
+    _revision: int
+    _root_entries: dict[str, dict[str, Any]] | None
     _root_index_cache: dict[str, Any] | None
+    _search_index: SearchIndex
+    _id_counters: IDCounters
     _spec_cache: dict[str, dict[str, Any]]
 
     def __init__(
@@ -129,7 +214,7 @@ class SpecManager:
         base_path: Path | str,
         *,
         config: SpecConfiguration | None = None,
-        oaps_repo: OapsRepository | None = None,
+        oaps_repo: CheckpointProtocol | None = None,
     ) -> None:
         """Initialize the specification manager.
 
@@ -137,15 +222,24 @@ class SpecManager:
             base_path: Base directory for specifications (`.oaps/docs/specs/`).
             config: Specification configuration. If None, loaded lazily from
                 global context.
-            oaps_repo: Repository for committing changes. If None, mutations
+            oaps_repo: Repository for committing changes, or a
+                CheckpointScheduler to coalesce commits. If None, mutations
                 work but changes are not committed. For testing, pass None
                 to skip commits entirely.
         """
         self._base_path = Path(base_path)
+        self._batch = None
         self._config = config
         self._oaps_repo = oaps_repo
-        self._relationship_graph = None
+        self._revision = 0
+        self._root_entries = None
         self._root_index_cache = None
+        self._search_index = SearchIndex(
+            get_cache_dir(self._base_path) / SEARCH_INDEX_NAME, root=self._base_path
+        )
+        self._id_counters = IDCounters(
+            get_cache_dir(self._base_path) / ID_COUNTERS_NAME, root=self._base_path
+        )
         self._spec_cache = {}
 
     # -------------------------------------------------------------------------
@@ -167,6 +261,34 @@ class SpecManager:
         """Path to the history.jsonl file."""
         return self._base_path / "history.jsonl"
 
+    @property
+    def search_index(self) -> SearchIndex:
+        """Full-text index shared by all specifications in the base path."""
+        return self._search_index
+
+    @property
+    def id_counters(self) -> IDCounters:
+        """ID counters shared by all specifications in the base path.
+
+        Holds the high-water marks of spec IDs and of each spec's
+        requirement, test, and artifact IDs (.cache/counters.db).
+        """
+        return self._id_counters
+
+    @property
+    def revision(self) -> int:
+        """Counter that changes whenever specifications change.
+
+        Lets callers cache data derived from the specifications, such as
+        relationship graphs, and rebuild it only when the revision moves.
+        """
+        return self._revision
+
+    @property
+    def active_batch(self) -> SpecBatch | None:
+        """Batch that managers stage their changes in, while one is open."""
+        return self._batch
+
     # -------------------------------------------------------------------------
     # Internal Methods
     # -------------------------------------------------------------------------
@@ -191,14 +313,13 @@ class SpecManager:
             spec_id: If provided, only invalidate cache for this spec.
                 If None, invalidate all caches.
         """
+        self._root_index_cache = None
+        self._root_entries = None
+        self._revision += 1
         if spec_id is None:
-            self._root_index_cache = None
             self._spec_cache.clear()
-            self._relationship_graph = None
         else:
-            self._root_index_cache = None
             _ = self._spec_cache.pop(spec_id, None)
-            self._relationship_graph = None
 
     def _commit(self, action: str, *, session_id: str | None = None) -> bool:
         """Commit changes to the OAPS repository.
@@ -223,6 +344,10 @@ class SpecManager:
     def _load_root_index(self) -> dict[str, Any]:
         """Load the root index from disk.
 
+        A root index written before version 2 (or by the ``sync_root_index``
+        hook) has no inverse relationships; they are rebuilt once from the
+        per-spec indexes and saved with the next write.
+
         Returns:
             The root index data as a dictionary.
 
@@ -241,8 +366,28 @@ class SpecManager:
             }
             return self._root_index_cache
 
-        self._root_index_cache = read_json(self.index_path)
-        return self._root_index_cache
+        root_index = read_json(self.index_path)
+        if root_index.get("version", 0) < _INDEX_VERSION:
+            self._rebuild_inverses(root_index.get("specs", []))
+            root_index["version"] = _INDEX_VERSION
+        self._root_index_cache = root_index
+        return root_index
+
+    def _root_entry(self, spec_id: str) -> dict[str, Any] | None:
+        """Get the root index entry of a specification.
+
+        Args:
+            spec_id: The specification ID.
+
+        Returns:
+            The root index entry, or None if the spec doesn't exist.
+        """
+        root_index = self._load_root_index()
+        if self._root_entries is None:
+            self._root_entries = {
+                spec["id"]: spec for spec in root_index.get("specs", []) if "id" in spec
+            }
+        return self._root_entries.get(spec_id)
 
     def _load_spec_index(self, spec_id: str, slug: str) -> dict[str, Any]:
         """Load a per-spec index from disk.
@@ -298,6 +443,8 @@ class SpecManager:
         self._base_path.mkdir(parents=True, exist_ok=True)
         write_json_atomic(self.index_path, data)
         self._root_index_cache = None
+        self._root_entries = None
+        self._revision += 1
 
     def _write_spec_index(self, spec_id: str, slug: str, data: dict[str, Any]) -> None:
         """Write a per-spec index to disk.
@@ -310,8 +457,14 @@ class SpecManager:
         spec_dir = self._spec_dir_path(spec_id, slug)
         _ = spec_dir.mkdir(parents=True, exist_ok=True)
         index_path = spec_dir / "index.json"
+        if "aggregates" not in data and index_path.exists():
+            # Keep the counters maintained by the requirement and test writes
+            aggregates = read_json(index_path).get("aggregates")
+            if aggregates is not None:
+                data = {**data, "aggregates": aggregates}
         write_json_atomic(index_path, data)
         _ = self._spec_cache.pop(spec_id, None)
+        self.update_search_index(index_path)
 
     def _record_history(
         self,
@@ -343,119 +496,155 @@ class SpecManager:
 
         append_jsonl(self.history_path, entry)
 
-    def _get_relationship_graph(self) -> dict[str, _RelationshipInverses]:
-        """Build the inverse relationship graph.
+    def _rebuild_inverses(self, specs: list[dict[str, Any]]) -> None:
+        """Rebuild the inverse relationships of root index entries in place.
 
-        Returns:
-            Dictionary mapping spec IDs to their inverse relationships.
-        """
-        if self._relationship_graph is not None:
-            return self._relationship_graph
+        Loads every per-spec index; only used to upgrade a root index that
+        has no inverse relationships.
 
-        root_index = self._load_root_index()
-        specs = root_index.get("specs", [])
-
-        # Initialize inverse relationships for all specs
-        graph: dict[str, _RelationshipInverses] = {}
-        for spec in specs:
-            spec_id = spec.get("id", "")
-            if spec_id:
-                graph[spec_id] = _RelationshipInverses()
-
-        # Build inverse relationships
-        for spec in specs:
-            spec_id = spec.get("id", "")
-            if not spec_id:
-                continue
+        Args:
+            specs: Root index entries.
+        """
+        entries = {spec["id"]: spec for spec in specs if spec.get("id")}
+        for entry in entries.values():
+            for key in _INVERSE_KEYS:
+                _ = entry.pop(key, None)
 
-            # Load full spec data to get relationships
-            slug = spec.get("slug", "")
+        for spec_id, entry in entries.items():
             try:
-                spec_data = self._load_spec_index(spec_id, slug)
+                spec_data = self._load_spec_index(spec_id, entry.get("slug", ""))
             except SpecNotFoundError:
                 continue
+            for key, target_id in _inverse_edges(
+                self._relationships_from_dict(spec_data)
+            ):
+                if target_id in entries:
+                    _add_inverse(entries[target_id], key, spec_id)
 
-            relationships = spec_data.get("relationships", {})
+    def _update_inverses(
+        self,
+        specs: list[dict[str, Any]],
+        spec_id: str,
+        old: Relationships | None,
+        new: Relationships | None,
+    ) -> list[dict[str, Any]]:
+        """Move a spec's inverse edges from its old to its new relationships.
 
-            # depends_on -> dependents
-            for dep_id in relationships.get("depends_on", []):
-                if dep_id in graph:
-                    graph[dep_id].dependents.append(spec_id)
+        Only the entries of the old and new targets are touched; they are
+        copied, so the cached root index is not modified.
 
-            # extends -> extended_by
-            extends_id = relationships.get("extends")
-            if extends_id and extends_id in graph:
-                graph[extends_id].extended_by.append(spec_id)
+        Args:
+            specs: Root index entries to update.
+            spec_id: The spec whose relationships changed.
+            old: Relationships before the change, or None for a new spec.
+            new: Relationships after the change, or None for a deleted spec.
 
-            # supersedes -> superseded_by
-            supersedes_id = relationships.get("supersedes")
-            if supersedes_id and supersedes_id in graph:
-                graph[supersedes_id].superseded_by = spec_id
+        Returns:
+            The updated list of root index entries.
+        """
+        updated = list(specs)
+        positions = {spec.get("id"): i for i, spec in enumerate(updated)}
+        copied: set[int] = set()
+
+        def target_entry(target_id: str) -> dict[str, Any] | None:
+            i = positions.get(target_id)
+            if i is None:
+                return None
+            if i not in copied:
+                updated[i] = dict(updated[i])
+                copied.add(i)
+            return updated[i]
+
+        for key, target_id in _inverse_edges(old):
+            if (entry := target_entry(target_id)) is not None:
+                _remove_inverse(entry, key, spec_id)
+        for key, target_id in _inverse_edges(new):
+            if (entry := target_entry(target_id)) is not None:
+                _add_inverse(entry, key, spec_id)
+        return updated
 
-            # integrates -> integrated_by
-            for int_id in relationships.get("integrates", []):
-                if int_id in graph:
-                    graph[int_id].integrated_by.append(spec_id)
+    def _get_inverses(self, spec_id: str) -> _RelationshipInverses:
+        """Get the inverse relationships of a specification.
 
-        self._relationship_graph = graph
-        return graph
+        Args:
+            spec_id: The specification ID.
+
+        Returns:
+            The inverse relationships stored on the spec's root index entry.
+        """
+        entry = self._root_entry(spec_id)
+        if entry is None:
+            return _RelationshipInverses()
+        return _RelationshipInverses(
+            dependents=list(entry.get("dependents", [])),
+            extended_by=list(entry.get("extended_by", [])),
+            superseded_by=entry.get("superseded_by"),
+            integrated_by=list(entry.get("integrated_by", [])),
+        )
 
     def _check_circular_dependencies(self, spec_id: str, depends_on: list[str]) -> None:
-        """Check for circular dependencies using DFS.
+        """Check whether new dependencies of a spec would create a cycle.
+
+        A new cycle has to run from the spec through one of its added
+        dependencies and back to the spec through one of its dependents.
+        Only the subgraph reachable from the added dependencies is searched,
+        and nothing is searched for a spec without dependents, such as a
+        newly created one.
 
         Args:
-            spec_id: The specification being updated.
+            spec_id: The specification being created or updated.
             depends_on: The proposed dependency list.
 
         Raises:
             CircularDependencyError: If adding these dependencies would create
                 a cycle.
         """
-        if not depends_on:
+        entry = self._root_entry(spec_id)
+        current = set(entry.get("depends_on", [])) if entry is not None else set()
+        added = [dep_id for dep_id in depends_on if dep_id not in current]
+        if spec_id in added:
+            cycle = [spec_id, spec_id]
+        elif not added or entry is None or not entry.get("dependents"):
             return
+        else:
+            cycle = self._find_dependency_path(added, spec_id)
+            if cycle is None:
+                return
+            cycle = [spec_id, *cycle]
 
-        # Build adjacency list from current root index
-        root_index = self._load_root_index()
-        specs = root_index.get("specs", [])
+        msg = f"Circular dependency detected: {' -> '.join(cycle)}"
+        raise CircularDependencyError(msg, cycle=cycle, entity_type="spec")
 
-        adjacency: dict[str, list[str]] = {}
-        for spec in specs:
-            sid = spec.get("id", "")
-            if sid:
-                adjacency[sid] = list(spec.get("depends_on", []))
-
-        # Add proposed dependencies (temporarily)
-        adjacency[spec_id] = depends_on
-
-        # DFS to detect cycles
-        visited: set[str] = set()
-        rec_stack: set[str] = set()
-        path: list[str] = []
-
-        def dfs(node: str) -> list[str] | None:
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in adjacency.get(node, []):
-                if neighbor not in visited:
-                    result = dfs(neighbor)
-                    if result is not None:
-                        return result
-                elif neighbor in rec_stack:
-                    # Found a cycle
-                    cycle_start = path.index(neighbor)
-                    return [*path[cycle_start:], neighbor]
-
-            _ = path.pop()
-            rec_stack.remove(node)
-            return None
+    def _find_dependency_path(
+        self, sources: list[str], target: str
+    ) -> list[str] | None:
+        """Find a dependency path from any of the sources to the target.
+
+        Args:
+            sources: Spec IDs to start from.
+            target: Spec ID to reach by following depends_on edges.
 
-        # Start DFS from spec_id
-        cycle = dfs(spec_id)
-        if cycle is not None:
-            msg = f"Circular dependency detected: {' -> '.join(cycle)}"
-            raise CircularDependencyError(msg, cycle=cycle, entity_type="spec")
+        Returns:
+            The path from a source to the target, inclusive, or None if the
+            target is not reachable.
+        """
+        parents: dict[str, str | None] = dict.fromkeys(sources)
+        queue = deque(sources)
+        while queue:
+            node = queue.popleft()
+            if node == target:
+                path: list[str] = []
+                step: str | None = node
+                while step is not None:
+                    path.append(step)
+                    step = parents[step]
+                return path[::-1]
+            entry = self._root_entry(node)
+            for dep_id in entry.get("depends_on", []) if entry is not None else []:
+                if dep_id not in parents:
+                    parents[dep_id] = node
+                    queue.append(dep_id)
+        return None
 
     def _validate_slug(self, slug: str) -> None:
         """Validate a specification slug.
@@ -629,22 +818,9 @@ class SpecManager:
         if isinstance(updated, str):
             updated = datetime.fromisoformat(updated)
 
-        # Parse relationships
-        rel_data = data.get("relationships", {})
-        graph = self._get_relationship_graph()
-        inverses = graph.get(data["id"], _RelationshipInverses())
-
-        relationships = Relationships(
-            depends_on=tuple(rel_data.get("depends_on", [])),
-            extends=rel_data.get("extends"),
-            supersedes=rel_data.get("supersedes"),
-            integrates=tuple(rel_data.get("integrates", [])),
-            # Computed inverses
-            dependents=tuple(inverses.dependents),
-            extended_by=tuple(inverses.extended_by),
-            superseded_by=inverses.superseded_by,
-            integrated_by=tuple(inverses.integrated_by),
-        )
+        # Parse relationships, with the inverses stored in the root index
+        inverses = self._get_inverses(data["id"])
+        relationships = self._relationships_from_dict(data, inverses)
 
         # Parse counts
         counts_data = data.get("counts", {})
@@ -673,6 +849,31 @@ class SpecManager:
             counts=counts,
         )
 
+    def _relationships_from_dict(
+        self, data: dict[str, Any], inverses: _RelationshipInverses | None = None
+    ) -> Relationships:
+        """Convert the relationships of a per-spec index to Relationships.
+
+        Args:
+            data: Dictionary from per-spec index storage.
+            inverses: Inverse relationships to include, if any.
+
+        Returns:
+            Relationships instance.
+        """
+        rel_data = data.get("relationships", {})
+        inverses = inverses or _RelationshipInverses()
+        return Relationships(
+            depends_on=tuple(rel_data.get("depends_on", [])),
+            extends=rel_data.get("extends"),
+            supersedes=rel_data.get("supersedes"),
+            integrates=tuple(rel_data.get("integrates", [])),
+            dependents=tuple(inverses.dependents),
+            extended_by=tuple(inverses.extended_by),
+            superseded_by=inverses.superseded_by,
+            integrated_by=tuple(inverses.integrated_by),
+        )
+
     def _spec_metadata_to_dict(self, metadata: SpecMetadata) -> dict[str, Any]:
         """Convert a SpecMetadata to a dictionary for index storage.
 
@@ -792,14 +993,7 @@ class SpecManager:
             SpecNotFoundError: If the specification doesn't exist.
         """
         # First look up the slug from root index
-        root_index = self._load_root_index()
-        spec_entry: dict[str, Any] | None = None
-
-        for spec in root_index.get("specs", []):
-            if spec.get("id") == spec_id:
-                spec_entry = spec
-                break
-
+        spec_entry = self._root_entry(spec_id)
         if spec_entry is None:
             msg = f"Specification not found: {spec_id}"
             raise SpecNotFoundError(msg, spec_id=spec_id)
@@ -817,8 +1011,220 @@ class SpecManager:
         Returns:
             True if the specification exists.
         """
-        root_index = self._load_root_index()
-        return any(spec.get("id") == spec_id for spec in root_index.get("specs", []))
+        return self._root_entry(spec_id) is not None
+
+    def search(  # noqa: PLR0913
+        self,
+        query: str,
+        *,
+        kinds: list[str] | None = None,
+        spec_id: str | None = None,
+        status: str | None = None,
+        fields: list[SearchField] | None = None,
+        limit: int | None = 50,
+    ) -> list[SearchHit]:
+        """Search specifications, requirements, tests, documents, and artifacts.
+
+        Files changed outside of the spec managers are re-indexed first.
+        Every query term must match the start of a word, and results are
+        ranked with title matches above tag matches above body matches.
+
+        Args:
+            query: Free-text query.
+            kinds: Document kinds to return. Defaults to all of
+                "spec", "requirement", "test", "document", "artifact".
+            spec_id: Only return documents of this specification.
+            status: Only return documents with this status.
+            fields: Fields to match ("title", "tags", "body"). Defaults to all.
+            limit: Maximum number of hits, or None for all.
+
+        Returns:
+            Hits ordered from best to worst match. Each hit's scope is the ID
+            of the specification it belongs to.
+
+        Raises:
+            ValueError: If a kind or field is invalid.
+        """
+        if kinds is not None:
+            invalid = sorted(set(kinds) - set(SPEC_SEARCH_KINDS))
+            if invalid:
+                msg = (
+                    f"Invalid search kinds: {', '.join(invalid)}. "
+                    f"Valid kinds: {', '.join(SPEC_SEARCH_KINDS)}"
+                )
+                raise ValueError(msg)
+        _ = self.sync_search_index()
+        return self._search_index.search(
+            query,
+            fields=fields,
+            kinds=kinds,
+            scope=spec_id,
+            status=status,
+            limit=limit,
+        )
+
+    def sync_search_index(self) -> int:
+        """Re-index files of the specification tree that changed on disk.
+
+        Returns:
+            Number of files re-indexed or removed.
+        """
+        return self._search_index.sync(
+            iter_spec_search_sources(self._base_path), extract_spec_search_documents
+        )
+
+    def update_search_index(self, path: Path) -> None:
+        """Re-index one file of the specification tree after writing it.
+
+        Failures are ignored: the next ``search`` re-syncs changed files.
+
+        Args:
+            path: File under a spec directory, e.g. its requirements.json.
+        """
+        with contextlib.suppress(OSError, sqlite3.Error):
+            self._search_index.update(path, extract_spec_search_documents(path))
+
+    # -------------------------------------------------------------------------
+    # Aggregates
+    # -------------------------------------------------------------------------
+
+    def _existing_slug(self, spec_id: str) -> str:
+        """Get the slug of a spec from the root index.
+
+        Raises:
+            SpecNotFoundError: If the specification doesn't exist.
+        """
+        entry = self._root_entry(spec_id)
+        if entry is None:
+            msg = f"Specification not found: {spec_id}"
+            raise SpecNotFoundError(msg, spec_id=spec_id)
+        return entry["slug"]
+
+    def get_aggregates(self, spec_id: str) -> dict[str, Any] | None:
+        """Get the stored progress and coverage counters of a specification.
+
+        Args:
+            spec_id: The specification ID.
+
+        Returns:
+            The aggregates (see ``oaps.spec._aggregates``), or None if the
+            spec index has none of the current version.
+
+        Raises:
+            SpecNotFoundError: If the specification doesn't exist.
+        """
+        data = self._load_spec_index(spec_id, self._existing_slug(spec_id))
+        aggregates = data.get("aggregates")
+        if not isinstance(aggregates, dict):
+            return None
+        aggregates = cast("dict[str, Any]", aggregates)
+        if aggregates.get("version") != AGGREGATES_VERSION:
+            return None
+        return aggregates
+
+    def refresh_aggregates(
+        self,
+        spec_id: str,
+        *,
+        requirements: Sequence[dict[str, Any]] | None = None,
+        tests: Sequence[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """Recompute the counters of a specification and store them.
+
+        The requirement and test managers call this after writing
+        requirements.json or tests.json, passing the records they wrote;
+        records not passed are read from disk.
+
+        Args:
+            spec_id: The specification ID.
+            requirements: Requirement records, if already in memory.
+            tests: Test records, if already in memory.
+
+        Returns:
+            The stored aggregates.
+
+        Raises:
+            SpecNotFoundError: If the specification doesn't exist.
+        """
+        spec_dir = self._spec_dir_path(spec_id, self._existing_slug(spec_id))
+        if requirements is None:
+            requirements = _read_records(spec_dir / "requirements.json", "requirements")
+        if tests is None:
+            tests = _read_records(spec_dir / "tests.json", "tests")
+        aggregates = compute_aggregates(requirements, tests)
+
+        index_path = spec_dir / "index.json"
+        if index_path.exists():
+            data = dict(read_json(index_path))
+            data["aggregates"] = aggregates
+            write_json_atomic(index_path, data)
+            _ = self._spec_cache.pop(spec_id, None)
+        return aggregates
+
+    def verify_aggregates(self, spec_id: str) -> list[str]:
+        """Check the stored counters of a specification against a full scan.
+
+        Counters that differ are replaced with the scanned ones.
+
+        Args:
+            spec_id: The specification ID.
+
+        Returns:
+            Dotted paths of the counters that were wrong, or ``["aggregates"]``
+            if there were none stored. Empty if all counters were correct.
+
+        Raises:
+            SpecNotFoundError: If the specification doesn't exist.
+        """
+        stored = self.get_aggregates(spec_id)
+        return diff_aggregates(stored, self.refresh_aggregates(spec_id))
+
+    # -------------------------------------------------------------------------
+    # Batches
+    # -------------------------------------------------------------------------
+
+    @contextlib.contextmanager
+    def batch(
+        self,
+        spec_id: str,
+        *,
+        action: str | None = None,
+        session_id: str | None = None,
+    ) -> Iterator[SpecBatch]:
+        """Apply requirement, test, and artifact changes as one unit of work.
+
+        Requirement, test, and artifact managers sharing this SpecManager
+        stage their changes in the batch instead of writing them. When the
+        block exits, each changed requirements.json and tests.json is written
+        once, history entries are appended with one write per file, and one
+        checkpoint commit is created. If the block raises, staged changes are
+        discarded. Opening a batch while one is open joins the open batch.
+
+        Args:
+            spec_id: The specification the changes are made to.
+            action: Checkpoint action if the batch holds several changes.
+                Defaults to "batch <spec_id>: <count> changes".
+            session_id: Optional session ID for the commit trailer.
+
+        Yields:
+            The batch the changes are staged in.
+
+        Raises:
+            SpecNotFoundError: If the specification doesn't exist.
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        _ = self.get_spec(spec_id)
+        batch = SpecBatch(spec_id, action=action, session_id=session_id)
+        self._batch = batch
+        try:
+            yield batch
+        finally:
+            self._batch = None
+        batch.write()
+        _ = batch.commit()
 
     # -------------------------------------------------------------------------
     # Mutation Methods
@@ -890,66 +1296,70 @@ class SpecManager:
         # Generate next ID
         config = self._get_config()
         existing_ids = {spec.get("id") for spec in root_index.get("specs", [])}
-        spec_id = next_spec_id(existing_ids, config.numbering)
-
-        # Check for circular dependencies
-        self._check_circular_dependencies(spec_id, depends_on)
-
-        # Create metadata
-        now = datetime.now(UTC)
-        relationships = Relationships(
-            depends_on=tuple(depends_on),
-            extends=extends,
-            supersedes=None,
-            integrates=tuple(integrates),
-        )
-        metadata = SpecMetadata(
-            id=spec_id,
-            slug=slug,
-            title=title,
-            spec_type=spec_type,
-            status=SpecStatus.DRAFT,
-            created=now,
-            updated=now,
-            version=version,
-            authors=tuple(authors),
-            reviewers=(),
-            relationships=relationships,
-            tags=tuple(tags),
-            summary=summary,
-            documents=(),
-            external_refs=(),
-            counts=Counts(),
-        )
+        with reserve_spec_id(
+            self._id_counters, existing_ids, config.numbering
+        ) as spec_id:
+            # Check for circular dependencies
+            self._check_circular_dependencies(spec_id, depends_on)
+
+            # Create metadata
+            now = datetime.now(UTC)
+            relationships = Relationships(
+                depends_on=tuple(depends_on),
+                extends=extends,
+                supersedes=None,
+                integrates=tuple(integrates),
+            )
+            metadata = SpecMetadata(
+                id=spec_id,
+                slug=slug,
+                title=title,
+                spec_type=spec_type,
+                status=SpecStatus.DRAFT,
+                created=now,
+                updated=now,
+                version=version,
+                authors=tuple(authors),
+                reviewers=(),
+                relationships=relationships,
+                tags=tuple(tags),
+                summary=summary,
+                documents=(),
+                external_refs=(),
+                counts=Counts(),
+            )
 
-        # Write per-spec index first (atomic)
-        spec_data = self._spec_metadata_to_dict(metadata)
-        spec_dir = self._spec_dir_path(spec_id, slug)
-        self._write_spec_index(spec_id, slug, spec_data)
+            # Write per-spec index first (atomic)
+            spec_data = self._spec_metadata_to_dict(metadata)
+            spec_dir = self._spec_dir_path(spec_id, slug)
+            self._write_spec_index(spec_id, slug, spec_data)
 
-        # Update root index with error recovery
-        try:
-            summary_data = self._spec_summary_to_dict(
-                SpecSummary(
-                    id=spec_id,
-                    slug=slug,
-                    title=title,
-                    spec_type=spec_type,
-                    status=SpecStatus.DRAFT,
-                    created=now,
-                    updated=now,
-                    depends_on=tuple(depends_on),
-                    tags=tuple(tags),
+            # Update root index with error recovery
+            try:
+                summary_data = self._spec_summary_to_dict(
+                    SpecSummary(
+                        id=spec_id,
+                        slug=slug,
+                        title=title,
+                        spec_type=spec_type,
+                        status=SpecStatus.DRAFT,
+                        created=now,
+                        updated=now,
+                        depends_on=tuple(depends_on),
+                        tags=tuple(tags),
+                    )
                 )
-            )
-            specs_list = list(root_index.get("specs", []))
-            specs_list.append(summary_data)
-            self._write_root_index(specs_list)
-        except Exception:
-            # Cleanup: remove orphaned spec directory
-            if spec_dir.exists():
-                shutil.rmtree(spec_dir)
-            raise
+                specs_list = list(root_index.get("specs", []))
+                specs_list.append(summary_data)
+                specs_list = self._update_inverses(
+                    specs_list, spec_id, None, relationships
+                )
+                self._write_root_index(specs_list)
+            except Exception:
+                # Cleanup: remove orphaned spec directory
+                if spec_dir.exists():
+                    shutil.rmtree(spec_dir)
+                raise
 
         # Record history
         self._record_history("created", actor, spec_id, to_value=slug)
@@ -1076,7 +1486,7 @@ class SpecManager:
             specs_list = list(root_index.get("specs", []))
             for i, spec in enumerate(specs_list):
                 if spec.get("id") == spec_id:
-                    specs_list[i] = self._spec_summary_to_dict(
+                    summary_data = self._spec_summary_to_dict(
                         SpecSummary(
                             id=updated.id,
                             slug=updated.slug,
@@ -1089,7 +1499,15 @@ class SpecManager:
                             tags=updated.tags,
                         )
                     )
+                    # Keep the inverses, which other specs' changes maintain
+                    summary_data.update(
+                        (key, spec[key]) for key in _INVERSE_KEYS if key in spec
+                    )
+                    specs_list[i] = summary_data
                     break
+            specs_list = self._update_inverses(
+                specs_list, spec_id, existing.relationships, relationships
+            )
             self._write_root_index(specs_list)
         except Exception:
             # Rollback: restore original per-spec index
@@ -1138,8 +1556,7 @@ class SpecManager:
 
         # Check for dependents
         if not force:
-            graph = self._get_relationship_graph()
-            inverses = graph.get(spec_id, _RelationshipInverses())
+            inverses = self._get_inverses(spec_id)
             if inverses.dependents:
                 msg = (
                     f"Cannot delete spec {spec_id}: "
@@ -1170,12 +1587,17 @@ class SpecManager:
         specs_list = [
             spec for spec in root_index.get("specs", []) if spec.get("id") != spec_id
         ]
+        specs_list = self._update_inverses(
+            specs_list, spec_id, existing.relationships, None
+        )
         self._write_root_index(specs_list)
 
         # Then remove spec directory (safe to fail - spec already removed from index)
         spec_dir = self._spec_dir_path(spec_id, existing.slug)
         if spec_dir.exists():
             shutil.rmtree(spec_dir)
+        with contextlib.suppress(sqlite3.Error):
+            self._search_index.remove_tree(spec_dir)
 
         # Record history
         self._record_history("deleted", actor, spec_id, from_value=existing.slug)
@@ -1258,8 +1680,11 @@ class SpecManager:
             specs_list = list(root_index.get("specs", []))
             for i, spec in enumerate(specs_list):
                 if spec.get("id") == spec_id:
-                    specs_list[i]["slug"] = new_slug
-                    specs_list[i]["updated"] = now.isoformat()
+                    specs_list[i] = {
+                        **spec,
+                        "slug": new_slug,
+                        "updated": now.isoformat(),
+                    }
                     break
             self._write_root_index(specs_list)
         except Exception:
@@ -1272,6 +1697,8 @@ class SpecManager:
         old_dir = self._spec_dir_path(spec_id, old_slug)
         if old_dir.exists():
             shutil.rmtree(old_dir)
+        with contextlib.suppress(sqlite3.Error):
+            self._search_index.remove_tree(old_dir)
 
         # Record history
         self._record_history(
@@ -8,6 +8,7 @@ requirements, and synchronization with pytest results.
 """
 
 from datetime import UTC, datetime
+from functools import partial
 from typing import TYPE_CHECKING, Any, Final
 
 from oaps.exceptions import (
@@ -16,8 +17,10 @@ from oaps.exceptions import (
     SpecValidationError,
     TestNotFoundError,
 )
-from oaps.spec._ids import next_test_id
-from oaps.spec._io import append_jsonl, read_json, write_json_atomic
+from oaps.spec._history_log import append_history
+from oaps.spec._ids import reserve_test_id
+from oaps.spec._import import import_test_arguments
+from oaps.spec._io import read_json, write_json_atomic
 from oaps.spec._models import (
     PytestResults,
     Requirement,
@@ -30,10 +33,12 @@ from oaps.spec._models import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
     from pathlib import Path
 
     from oaps.config import SpecConfiguration
-    from oaps.repository import OapsRepository
+    from oaps.repository import CheckpointProtocol
+    from oaps.spec._models import PytestTest
     from oaps.spec._requirement_manager import RequirementManager
     from oaps.spec._spec_manager import SpecManager
 
@@ -66,7 +71,7 @@ class TestManager:
     )
 
     _config: SpecConfiguration | None
-    _oaps_repo: OapsRepository | None
+    _oaps_repo: CheckpointProtocol | None
     _requirement_manager: RequirementManager
     _spec_manager: SpecManager
     _tests_cache: dict[str, TestsContainer]
@@ -76,7 +81,7 @@ class TestManager:
         spec_manager: SpecManager,
         requirement_manager: RequirementManager,
         *,
-        oaps_repo: OapsRepository | None = None,
+        oaps_repo: CheckpointProtocol | None = None,
     ) -> None:
         """Initialize the test manager.
 
@@ -173,6 +178,10 @@ class TestManager:
         Returns:
             True if commit was made, False if no repository or no changes.
         """
+        batch = self._spec_manager.active_batch
+        if batch is not None:
+            batch.record_action(action, self._oaps_repo)
+            return False
         if self._oaps_repo is None:
             return False
 
@@ -195,6 +204,9 @@ class TestManager:
         Raises:
             SpecNotFoundError: If the specification doesn't exist.
         """
+        batch = self._spec_manager.active_batch
+        if batch is not None and (staged := batch.staged_tests(spec_id)) is not None:
+            return staged
         if spec_id in self._tests_cache:
             return self._tests_cache[spec_id]
 
@@ -227,10 +239,25 @@ class TestManager:
     def _write_tests(self, spec_id: str, tests: tuple[Test, ...]) -> None:
         """Write tests to disk atomically.
 
+        While a batch is open, the tests are staged in the batch and written
+        when it is applied.
+
         Args:
             spec_id: The specification ID.
             tests: The tests to write.
         """
+        batch = self._spec_manager.active_batch
+        if batch is not None:
+            container = TestsContainer(
+                version=_CONTAINER_VERSION,
+                spec_id=spec_id,
+                updated=datetime.now(UTC),
+                tests=tests,
+            )
+            batch.stage_tests(container, partial(self._write_tests, spec_id, tests))
+            _ = self._tests_cache.pop(spec_id, None)
+            return
+
         path = self._tests_path(spec_id)
         now = datetime.now(UTC)
         data: dict[str, Any] = {
@@ -241,6 +268,8 @@ class TestManager:
         }
         write_json_atomic(path, data)
         _ = self._tests_cache.pop(spec_id, None)
+        self._spec_manager.update_search_index(path)
+        _ = self._spec_manager.refresh_aggregates(spec_id, tests=data["tests"])
 
     def _record_history(  # noqa: PLR0913
         self,
@@ -273,7 +302,11 @@ class TestManager:
         if to_value is not None:
             entry["to_value"] = to_value
 
-        append_jsonl(self._history_path(spec_id), entry)
+        batch = self._spec_manager.active_batch
+        if batch is not None:
+            batch.record_history(self._history_path(spec_id), entry)
+            return
+        append_history(self._history_path(spec_id), [entry])
 
     def _dict_to_test(self, data: dict[str, Any]) -> Test:
         """Convert a dictionary to a Test.
@@ -670,54 +703,55 @@ class TestManager:
         container = self._load_tests(spec_id)
         existing_ids = {test.id for test in container.tests}
 
-        # Generate ID
+        # Reserve an ID; it is released if the test cannot be written
         config = self._get_config()
-        test_id = next_test_id(spec_id, method, existing_ids, config)
-
-        # Create test
-        now = datetime.now(UTC)
-        test = Test(
-            id=test_id,
-            title=title,
-            method=method,
-            status=TestStatus.PENDING,
-            created=now,
-            updated=now,
-            author=actor,
-            tests_requirements=tuple(tests_requirements),
-            description=description,
-            file=file,
-            function=function,
-            last_run=None,
-            last_result=None,
-            tags=tuple(tags) if tags else (),
-            last_value=None,
-            threshold=None,
-            perf_baseline=None,
-            steps=(),
-            expected_result=None,
-            actual_result=None,
-            tested_by=None,
-            tested_on=None,
-        )
+        with reserve_test_id(
+            self._spec_manager.id_counters, spec_id, method, existing_ids, config
+        ) as test_id:
+            # Create test
+            now = datetime.now(UTC)
+            test = Test(
+                id=test_id,
+                title=title,
+                method=method,
+                status=TestStatus.PENDING,
+                created=now,
+                updated=now,
+                author=actor,
+                tests_requirements=tuple(tests_requirements),
+                description=description,
+                file=file,
+                function=function,
+                last_run=None,
+                last_result=None,
+                tags=tuple(tags) if tags else (),
+                last_value=None,
+                threshold=None,
+                perf_baseline=None,
+                steps=(),
+                expected_result=None,
+                actual_result=None,
+                tested_by=None,
+                tested_on=None,
+            )
 
-        # Save original requirements state for rollback
-        original_requirements: dict[str, tuple[str, ...]] = {}
-        for req_id in tests_requirements:
-            req = self._requirement_manager.get_requirement(spec_id, req_id)
-            original_requirements[req_id] = req.verified_by
+            # Save original requirements state for rollback
+            original_requirements: dict[str, tuple[str, ...]] = {}
+            for req_id in tests_requirements:
+                req = self._requirement_manager.get_requirement(spec_id, req_id)
+                original_requirements[req_id] = req.verified_by
 
-        # Write test
-        new_tests = (*container.tests, test)
-        self._write_tests(spec_id, new_tests)
+            # Write test
+            new_tests = (*container.tests, test)
+            self._write_tests(spec_id, new_tests)
 
-        # Update requirements' verified_by with rollback on failure
-        try:
-            self._add_test_to_requirements(spec_id, test_id, tests_requirements)
-        except Exception:
-            # Rollback: remove the test we just added
-            self._write_tests(spec_id, container.tests)
-            raise
+            # Update requirements' verified_by with rollback on failure
+            try:
+                self._add_test_to_requirements(spec_id, test_id, tests_requirements)
+            except Exception:
+                # Rollback: remove the test we just added
+                self._write_tests(spec_id, container.tests)
+                raise
 
         # Record history
         self._record_history(spec_id, "test_created", actor, test_id, to_value=title)
@@ -727,6 +761,49 @@ class TestManager:
 
         return test
 
+    def import_tests(
+        self,
+        spec_id: str,
+        records: Iterable[Mapping[str, Any]],
+        *,
+        actor: str,
+        session_id: str | None = None,
+    ) -> list[Test]:
+        """Create tests from import records in one batch.
+
+        Every record is checked before any test is created. The tests are
+        then added in a single ``SpecManager.batch``, so tests.json and
+        requirements.json are written once and one checkpoint is committed.
+
+        Args:
+            spec_id: The specification ID.
+            records: Records with the arguments of ``add_test``, e.g. from
+                ``read_import_records``.
+            actor: The actor performing the action (for history).
+            session_id: Optional session ID for commit trailer.
+
+        Returns:
+            The created tests, in record order.
+
+        Raises:
+            SpecNotFoundError: If the specification doesn't exist.
+            RequirementNotFoundError: If a tested requirement doesn't exist.
+            SpecValidationError: If a record is invalid. Nothing is created.
+        """
+        arguments = [
+            import_test_arguments(record, spec_id=spec_id, number=number)
+            for number, record in enumerate(records, start=1)
+        ]
+        with self._spec_manager.batch(
+            spec_id,
+            action=f"import {len(arguments)} tests {spec_id}",
+            session_id=session_id,
+        ):
+            return [
+                self.add_test(spec_id, **kwargs, actor=actor, session_id=session_id)
+                for kwargs in arguments
+            ]
+
     def update_test(  # noqa: PLR0913
         self,
         spec_id: str,
@@ -1207,6 +1284,82 @@ class TestManager:
         Raises:
             SpecNotFoundError: If the specification doesn't exist.
         """
+        # Stage the runs so tests.json and history are written once
+        with self._spec_manager.batch(spec_id, session_id=session_id):
+            return self._sync_impl(
+                spec_id, pytest_results, actor, session_id=session_id
+            )
+
+    def ingest(
+        self,
+        results: Iterable[PytestTest],
+        actor: str,
+        *,
+        session_id: str | None = None,
+    ) -> dict[str, SyncResult]:
+        """Synchronize the tests of every spec with a stream of pytest results.
+
+        The (file, function) of every spec test is indexed once, so each
+        result is matched with one lookup of its parsed node ID, and only
+        matched results are kept. Each spec with matches is then synced in
+        one batch, writing its tests.json and history once.
+
+        Args:
+            results: Pytest results, e.g., from ``read_test_results``.
+            actor: The actor performing the action (for history).
+            session_id: Optional session ID for commit trailer.
+
+        Returns:
+            Dict mapping the IDs of specs with matching results to their
+            sync results.
+        """
+        index: dict[tuple[str, str], set[str]] = {}
+        for summary in self._spec_manager.list_specs(include_archived=True):
+            for test in self._load_tests(summary.id).tests:
+                if test.file and test.function:
+                    index.setdefault((test.file, test.function), set()).add(summary.id)
+
+        matched: dict[str, list[PytestTest]] = {}
+        for result in results:
+            file_path, function = self._parse_pytest_node_id(result.node_id)
+            if file_path is None or function is None:
+                continue
+            for spec_id in index.get((file_path, function), ()):
+                matched.setdefault(spec_id, []).append(result)
+
+        return {
+            spec_id: self.sync(
+                spec_id,
+                PytestResults(
+                    tests=tuple(tests),
+                    duration=sum(test.duration for test in tests),
+                    exit_code=0,
+                ),
+                actor,
+                session_id=session_id,
+            )
+            for spec_id, tests in sorted(matched.items())
+        }
+
+    def _sync_impl(
+        self,
+        spec_id: str,
+        pytest_results: PytestResults,
+        actor: str,
+        *,
+        session_id: str | None = None,
+    ) -> SyncResult:
+        """Synchronize spec tests with pytest results (internal).
+
+        Args:
+            spec_id: The specification ID.
+            pytest_results: Parsed pytest results.
+            actor: The actor performing the action (for history).
+            session_id: Optional session ID for commit trailer.
+
+        Returns:
+            SyncResult with counts of updated, orphaned, and skipped tests.
+        """
         # Load tests
         container = self._load_tests(spec_id)
 
@@ -41,6 +41,9 @@ from ._ignore import (
 )
 from ._logging import create_cli_logger, create_hooks_logger, create_session_logger
 from ._paths import (
+    CACHE_DIR_NAME,
+    ensure_parent_dir,
+    get_cache_dir,
     get_claude_config_dir,
     get_oaps_cli_log_file,
     get_oaps_dir,
@@ -58,6 +61,7 @@ from ._paths import (
     get_worktree_root,
 )
 from ._project import is_oaps_project
+from ._state_journal import StateJournal, get_state_journal_dir
 from ._state_store import (
     MockStateStore,
     SQLiteStateStore,
@@ -68,9 +72,11 @@ from ._state_store import (
     create_project_store,
     create_session_store,
     create_state_store,
+    merge_state_journal,
 )
 
 __all__ = [
+    "CACHE_DIR_NAME",
     "DEFAULT_IGNORE_PATTERNS",
     "AuthorInfo",
     "GitContext",
@@ -82,6 +88,7 @@ __all__ = [
     "ScriptConfig",
     "ScriptResult",
     "StateEntry",
+    "StateJournal",
     "StateStore",
     "StateStoreKey",
     "StateStoreValue",
@@ -98,7 +105,9 @@ __all__ = [
     "create_session_store",
     "create_state_store",
     "detect_tooling",
+    "ensure_parent_dir",
     "get_author_info",
+    "get_cache_dir",
     "get_claude_config_dir",
     "get_claude_plugin_dir",
     "get_claude_plugin_skills_dir",
@@ -117,6 +126,7 @@ __all__ = [
     "get_plans_dir",
     "get_project_skill_dir",
     "get_project_skills_dir",
+    "get_state_journal_dir",
     "get_worktree",
     "get_worktree_for_path",
     "get_worktree_root",
@@ -126,6 +136,7 @@ __all__ = [
     "list_worktrees",
     "load_gitignore_patterns",
     "lock_worktree",
+    "merge_state_journal",
     "move_worktree",
     "parse_entrypoint",
     "prune_worktrees",
@@ -0,0 +1,566 @@
+"""Async adapter for the SQLite state store.
+
+``SQLiteStateStore`` is synchronous and opens a new connection per call, which
+blocks the event loop when used from the API server. This module provides an
+async equivalent for anyio-based code:
+
+- ``AsyncStateDatabase`` owns the connections for one state database: a
+  dedicated writer thread with a single long-lived connection, and a small
+  pool of read-only connections used through ``anyio.to_thread``.
+- ``AsyncStateStore`` is a view of one scope (a session or the project) with
+  the ``StateStore`` operations as coroutines.
+
+Writes from all scopes are queued to the writer thread, which drains the queue
+and commits everything queued at that moment in one transaction. Each write
+runs in its own savepoint, so one failing write does not affect the others in
+its batch. A coroutine awaiting a write resumes once its batch has committed.
+"""
+
+import queue
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Self, cast
+
+import anyio
+import anyio.from_thread
+import anyio.lowlevel
+import anyio.to_thread
+import pendulum
+
+from oaps.utils._state_store import (
+    _PROJECT_SCOPE_SENTINEL,
+    _SQL_ATOMIC_INCREMENT,
+    _SQL_COUNT,
+    _SQL_DELETE_ALL,
+    _SQL_DELETE_BY_KEY,
+    _SQL_EXISTS,
+    _SQL_SELECT_ALL,
+    _SQL_SELECT_BY_KEY,
+    _SQL_UPSERT,
+    SQLiteStateStore,
+    StateEntry,
+    StateStoreKey,
+    StateStoreValue,
+    _upsert_params,
+)
+from oaps.utils.database import BusyRetryPolicy, retry_on_busy
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+    from anyio.lowlevel import EventLoopToken
+    from structlog.typing import FilteringBoundLogger
+
+# Default number of pooled read-only connections
+_DEFAULT_READERS: Final = 4
+
+# Maximum number of queued writes committed in one transaction
+_DEFAULT_MAX_BATCH: Final = 256
+
+_SQL_SESSIONS: Final = """
+SELECT session_id, COUNT(*) AS key_count, MAX(updated_at) AS last_updated
+FROM state_store
+WHERE session_id != ''
+GROUP BY session_id
+ORDER BY last_updated DESC
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class SessionSummary:
+    """Summary of one session's state.
+
+    Attributes:
+        session_id: The session ID.
+        key_count: Number of keys stored for the session.
+        last_updated: Most recent ``updated_at`` across the session's keys.
+    """
+
+    session_id: str
+    key_count: int
+    last_updated: str
+
+
+@dataclass(slots=True)
+class _WriteRequest:
+    """A write queued for the writer thread."""
+
+    operation: Callable[[sqlite3.Connection], object]
+    token: EventLoopToken
+    done: anyio.Event = field(default_factory=anyio.Event)
+    result: object = None
+    error: BaseException | None = None
+
+
+_STOP: Final = object()
+
+
+def _set_events(events: list[anyio.Event]) -> None:
+    """Wake coroutines waiting on completed writes (runs in the event loop)."""
+    for event in events:
+        event.set()
+
+
+class AsyncStateDatabase:
+    """Connections to one state database for use from async code.
+
+    Use as an async context manager, or call ``open`` and ``aclose``.
+
+    Examples:
+        >>> async with AsyncStateDatabase(".oaps/state.db") as db:
+        ...     store = db.store("session-id")
+        ...     await store.atomic_increment("oaps.prompts.count")
+    """
+
+    _db_path: str
+    _readers: int
+    _max_batch: int
+    _retry_policy: BusyRetryPolicy
+    _logger: FilteringBoundLogger | None
+    _limiter: anyio.CapacityLimiter | None
+    _pool: queue.SimpleQueue[sqlite3.Connection]
+    _pool_lock: threading.Lock
+    _connections: list[sqlite3.Connection]
+    _writes: queue.SimpleQueue[_WriteRequest | object]
+    _writer: threading.Thread | None
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        readers: int = _DEFAULT_READERS,
+        max_batch: int = _DEFAULT_MAX_BATCH,
+        retry_policy: BusyRetryPolicy | None = None,
+        logger: FilteringBoundLogger | None = None,
+    ) -> None:
+        """Initialize without opening any connections.
+
+        Args:
+            db_path: Path to the state database.
+            readers: Maximum number of concurrent reads (and pooled connections).
+            max_batch: Maximum number of writes committed in one transaction.
+            retry_policy: Retry policy for batches that hit lock contention
+                from other processes. Defaults to ``BusyRetryPolicy()``.
+            logger: Optional logger for debug-level batch logging.
+        """
+        self._db_path = str(db_path)
+        self._readers = readers
+        self._max_batch = max_batch
+        self._retry_policy = retry_policy or BusyRetryPolicy()
+        self._logger = logger
+        self._limiter = None
+        self._pool = queue.SimpleQueue()
+        self._pool_lock = threading.Lock()
+        self._connections = []
+        self._writes = queue.SimpleQueue()
+        self._writer = None
+
+    @property
+    def db_path(self) -> Path:
+        """Get the database path."""
+        return Path(self._db_path)
+
+    async def open(self) -> None:
+        """Create the schema if needed and start the writer thread."""
+        if self._writer is not None:
+            return
+        # Creates the database file and schema
+        _ = await anyio.to_thread.run_sync(SQLiteStateStore, self._db_path)
+        self._limiter = anyio.CapacityLimiter(self._readers)
+        self._writer = threading.Thread(
+            target=self._run_writer, name="oaps-state-writer", daemon=True
+        )
+        self._writer.start()
+
+    async def aclose(self) -> None:
+        """Flush queued writes, stop the writer thread and close connections."""
+        writer = self._writer
+        if writer is None:
+            return
+        self._writer = None
+        self._writes.put(_STOP)
+        await anyio.to_thread.run_sync(writer.join)
+        with self._pool_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._pool = queue.SimpleQueue()
+
+    async def __aenter__(self) -> Self:
+        """Open the database."""
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the database."""
+        await self.aclose()
+
+    def store(self, session_id: str | None = None) -> AsyncStateStore:
+        """Get an async store scoped to a session or the project.
+
+        Args:
+            session_id: The session ID, or None for the project store.
+
+        Returns:
+            A store sharing this database's connections.
+        """
+        return AsyncStateStore(self, session_id)
+
+    async def list_sessions(self) -> list[SessionSummary]:
+        """List sessions with stored state, most recently updated first.
+
+        Returns:
+            One summary per session.
+        """
+
+        def query(conn: sqlite3.Connection) -> list[SessionSummary]:
+            return [
+                SessionSummary(
+                    session_id=cast("str", row[0]),
+                    key_count=cast("int", row[1]),
+                    last_updated=cast("str", row[2]),
+                )
+                for row in conn.execute(_SQL_SESSIONS).fetchall()
+            ]
+
+        return await self.read(query)
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    async def read[T](self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """Run a read-only operation on a pooled connection in a worker thread.
+
+        Args:
+            operation: Callable issuing queries on the connection.
+
+        Returns:
+            The operation's return value.
+
+        Raises:
+            RuntimeError: If the database is not open.
+        """
+        if self._limiter is None or self._writer is None:
+            msg = "AsyncStateDatabase is not open"
+            raise RuntimeError(msg)
+        return await anyio.to_thread.run_sync(
+            self._run_read, operation, limiter=self._limiter
+        )
+
+    def _run_read[T](self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """Borrow a reader connection, run the operation, and return it."""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
+        try:
+            return operation(conn)
+        finally:
+            self._pool.put(conn)
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection usable from any worker thread."""
+        uri = f"{Path(self._db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(
+            uri, uri=True, isolation_level=None, check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        with self._pool_lock:
+            self._connections.append(conn)
+        return conn
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    async def write[T](self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """Queue a write for the writer thread and wait for its batch to commit.
+
+        Args:
+            operation: Callable issuing write statements on the connection.
+                It may run more than once if its batch is retried.
+
+        Returns:
+            The operation's return value.
+
+        Raises:
+            RuntimeError: If the database is not open.
+            Exception: Any exception raised by the operation.
+        """
+        if self._writer is None:
+            msg = "AsyncStateDatabase is not open"
+            raise RuntimeError(msg)
+        request = _WriteRequest(
+            operation=operation, token=anyio.lowlevel.current_token()
+        )
+        self._writes.put(request)
+        await request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return cast("T", request.result)
+
+    def _run_writer(self) -> None:
+        """Writer thread: commit queued writes in batches until stopped."""
+        conn = sqlite3.connect(self._db_path, isolation_level=None)
+        _ = conn.execute("PRAGMA journal_mode=WAL")
+        _ = conn.execute(f"PRAGMA busy_timeout={self._retry_policy.busy_timeout}")
+        try:
+            stopping = False
+            while not stopping:
+                batch: list[_WriteRequest] = []
+                item = self._writes.get()
+                while True:
+                    if item is _STOP:
+                        stopping = True
+                    else:
+                        batch.append(cast("_WriteRequest", item))
+                    if stopping or len(batch) >= self._max_batch:
+                        break
+                    try:
+                        item = self._writes.get_nowait()
+                    except queue.Empty:
+                        break
+                if batch:
+                    self._commit_batch(conn, batch)
+        finally:
+            conn.close()
+
+    def _commit_batch(
+        self, conn: sqlite3.Connection, batch: list[_WriteRequest]
+    ) -> None:
+        """Apply a batch of writes in one transaction and wake their waiters."""
+
+        def apply() -> None:
+            _ = conn.execute("BEGIN IMMEDIATE")
+            try:
+                for request in batch:
+                    request.result, request.error = None, None
+                    _ = conn.execute("SAVEPOINT write")
+                    try:
+                        request.result = request.operation(conn)
+                    except Exception as e:  # noqa: BLE001 - delivered to the caller
+                        request.error = e
+                        _ = conn.execute("ROLLBACK TO write")
+                    _ = conn.execute("RELEASE write")
+                _ = conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    _ = conn.execute("ROLLBACK")
+                raise
+
+        try:
+            retry_on_busy(apply, self._retry_policy)
+        except sqlite3.Error as e:
+            for request in batch:
+                request.result, request.error = None, e
+
+        if self._logger:
+            self._logger.debug("async_store_batch_committed", writes=len(batch))
+
+        by_loop: dict[EventLoopToken, list[anyio.Event]] = {}
+        for request in batch:
+            by_loop.setdefault(request.token, []).append(request.done)
+        for token, events in by_loop.items():
+            try:
+                anyio.from_thread.run_sync(_set_events, events, token=token)
+            except RuntimeError:
+                # The waiting event loop has already shut down
+                continue
+
+
+class AsyncStateStore:
+    """Async state store scoped to a session or the project.
+
+    Provides the ``StateStore`` operations as coroutines. Obtain instances from
+    ``AsyncStateDatabase.store``; all stores of a database share its writer
+    thread and reader pool.
+    """
+
+    _db: AsyncStateDatabase
+    _session_id: str | None
+    _effective_session_id: str
+
+    def __init__(self, db: AsyncStateDatabase, session_id: str | None = None) -> None:
+        """Initialize a scoped store.
+
+        Args:
+            db: The open database to use.
+            session_id: The session ID for scoping (None for project scope).
+        """
+        self._db = db
+        self._session_id = session_id
+        self._effective_session_id = (
+            session_id if session_id is not None else _PROJECT_SCOPE_SENTINEL
+        )
+
+    @property
+    def session_id(self) -> str | None:
+        """Get the session ID for this store."""
+        return self._session_id
+
+    async def get(self, key: StateStoreKey) -> StateStoreValue:
+        """Get the value for a key.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            The stored value.
+
+        Raises:
+            KeyError: If the key does not exist.
+        """
+        entry = await self.get_entry(key)
+        if entry is None:
+            raise KeyError(key)
+        return entry.value
+
+    async def get_entry(self, key: StateStoreKey) -> StateEntry | None:
+        """Get the full entry for a key, including metadata.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            The full entry with metadata, or None if not found.
+        """
+        params = (self._effective_session_id, key)
+
+        def query(conn: sqlite3.Connection) -> StateEntry | None:
+            row = cast(
+                "sqlite3.Row | None",
+                conn.execute(_SQL_SELECT_BY_KEY, params).fetchone(),
+            )
+            return StateEntry.model_validate(dict(row)) if row is not None else None
+
+        return await self._db.read(query)
+
+    async def entries(self) -> list[StateEntry]:
+        """Get all entries in the store, ordered by key.
+
+        Returns:
+            The entries with metadata.
+        """
+        params = (self._effective_session_id,)
+
+        def query(conn: sqlite3.Connection) -> list[StateEntry]:
+            rows = cast(
+                "list[sqlite3.Row]", conn.execute(_SQL_SELECT_ALL, params).fetchall()
+            )
+            return [StateEntry.model_validate(dict(row)) for row in rows]
+
+        return await self._db.read(query)
+
+    async def keys(self) -> list[StateStoreKey]:
+        """Get all keys in the store, ordered by key.
+
+        Returns:
+            The keys.
+        """
+        return [entry.key for entry in await self.entries()]
+
+    async def count(self) -> int:
+        """Return the number of entries in the store."""
+        params = (self._effective_session_id,)
+
+        def query(conn: sqlite3.Connection) -> int:
+            row = cast("sqlite3.Row", conn.execute(_SQL_COUNT, params).fetchone())
+            return int(row[0])  # pyright: ignore[reportAny]
+
+        return await self._db.read(query)
+
+    async def contains(self, key: StateStoreKey) -> bool:
+        """Check if a key exists in the store.
+
+        Args:
+            key: The key to check.
+
+        Returns:
+            True if the key exists, False otherwise.
+        """
+        params = (self._effective_session_id, key)
+        return await self._db.read(
+            lambda conn: conn.execute(_SQL_EXISTS, params).fetchone() is not None
+        )
+
+    async def set(
+        self,
+        key: StateStoreKey,
+        value: StateStoreValue,
+        *,
+        author: str | None = None,
+    ) -> None:
+        """Set a value in the store.
+
+        Args:
+            key: The key to set.
+            value: The value to store.
+            author: Who is making this change.
+        """
+        now_str = pendulum.now("UTC").to_iso8601_string()
+        params = _upsert_params(self._effective_session_id, key, value, now_str, author)
+        await self._db.write(lambda conn: conn.execute(_SQL_UPSERT, params).fetchall())
+
+    async def delete(self, key: StateStoreKey) -> bool:
+        """Delete a key from the store.
+
+        Args:
+            key: The key to delete.
+
+        Returns:
+            True if the key was deleted, False if it didn't exist.
+        """
+        params = (self._effective_session_id, key)
+        return await self._db.write(
+            lambda conn: conn.execute(_SQL_DELETE_BY_KEY, params).rowcount > 0
+        )
+
+    async def clear(self) -> None:
+        """Remove all entries from the store."""
+        params = (self._effective_session_id,)
+        await self._db.write(lambda conn: conn.execute(_SQL_DELETE_ALL, params))
+
+    async def atomic_increment(
+        self,
+        key: StateStoreKey,
+        amount: int = 1,
+        *,
+        author: str | None = None,
+    ) -> int:
+        """Atomically increment a counter, initializing to 0 if not exists.
+
+        Args:
+            key: The key to increment.
+            amount: Amount to add (can be negative for decrement).
+            author: Who is making this change.
+
+        Returns:
+            The new value after incrementing.
+        """
+        now_str = pendulum.now("UTC").to_iso8601_string()
+        params = (
+            self._effective_session_id,
+            key,
+            amount,
+            now_str,
+            author,
+            now_str,
+            author,
+        )
+
+        def increment(conn: sqlite3.Connection) -> int:
+            row = cast(
+                "sqlite3.Row", conn.execute(_SQL_ATOMIC_INCREMENT, params).fetchone()
+            )
+            return int(row[0])  # pyright: ignore[reportAny]
+
+        return await self._db.write(increment)
@@ -0,0 +1,178 @@
+# pyright: reportAny=false, reportExplicitAny=false
+"""Header-only YAML frontmatter reading.
+
+Artifacts, ideas, and spec documents are markdown files that start with a
+YAML block between two ``---`` lines. The functions here share one set of
+delimiter rules: the opening and closing delimiters are lines consisting of
+``---`` alone, ignoring trailing whitespace and carriage returns.
+
+``read_frontmatter_block`` streams a file line by line and stops at the
+closing delimiter, so reading a document's metadata costs the same however
+large its body is. YAML is parsed with libyaml's ``CSafeLoader`` when PyYAML
+was built with it.
+
+``read_frontmatter`` additionally caches parsed headers per process, keyed on
+each file's path, size, modification time, and inode, so index rebuilds, list
+commands, and validators that read the same unchanged file parse it once.
+Files modified in the last two seconds bypass the cache, since a rewrite
+within the same timestamp tick would not change their key.
+"""
+
+import copy
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Final
+
+import yaml
+
+_SafeLoader: Final[type[yaml.SafeLoader]] = getattr(
+    yaml, "CSafeLoader", yaml.SafeLoader
+)
+
+_DELIMITER: Final = b"---"
+
+# Longest first line still considered an opening delimiter, so a document
+# without frontmatter is not read in full just to reject its first line
+_MAX_DELIMITER_LINE: Final = 64
+
+# Cached headers; stale entries for rewritten files age out of the LRU
+_CACHE_SIZE: Final = 4096
+
+_RACY_WINDOW_NS: Final = 2_000_000_000
+
+
+def load_yaml(text: str) -> Any:
+    """Parse YAML with the fastest available safe loader.
+
+    Args:
+        text: YAML document.
+
+    Returns:
+        The parsed document.
+
+    Raises:
+        yaml.YAMLError: If the YAML is malformed.
+    """
+    return yaml.load(text, Loader=_SafeLoader)  # noqa: S506 - safe loader
+
+
+def _is_delimiter(line: bytes | str) -> bool:
+    stripped = line.rstrip()
+    return stripped in {"---", _DELIMITER}
+
+
+def split_frontmatter(content: str) -> tuple[str, str] | None:
+    """Split in-memory markdown content into frontmatter and body.
+
+    Args:
+        content: Markdown document.
+
+    Returns:
+        Tuple of (frontmatter YAML, body with leading newlines removed), or
+        None if the content has no complete frontmatter block.
+    """
+    first_end = content.find("\n")
+    if first_end == -1 or not _is_delimiter(content[:first_end]):
+        return None
+
+    start = first_end + 1
+    pos = start
+    while pos < len(content):
+        line_end = content.find("\n", pos)
+        if line_end == -1:
+            line_end = len(content)
+        if _is_delimiter(content[pos:line_end]):
+            return content[start:pos].strip(), content[line_end + 1 :].lstrip("\n")
+        pos = line_end + 1
+    return None
+
+
+def read_frontmatter_block(path: Path | str) -> tuple[str, int] | None:
+    """Read a markdown file's frontmatter without reading its body.
+
+    Args:
+        path: Markdown file.
+
+    Returns:
+        Tuple of (frontmatter YAML, byte offset of the line after the closing
+        delimiter), or None if the file has no complete frontmatter block.
+
+    Raises:
+        OSError: If the file cannot be read.
+        UnicodeDecodeError: If the frontmatter is not valid UTF-8.
+    """
+    with Path(path).open("rb") as f:
+        first = f.readline(_MAX_DELIMITER_LINE)
+        if not first.endswith(b"\n") or not _is_delimiter(first):
+            return None
+        lines: list[bytes] = []
+        while line := f.readline():
+            if _is_delimiter(line):
+                return b"".join(lines).decode("utf-8").strip(), f.tell()
+            lines.append(line)
+    return None
+
+
+def read_body(path: Path | str, offset: int) -> str:
+    """Read a markdown body starting at a byte offset.
+
+    Args:
+        path: Markdown file.
+        offset: Offset returned by ``read_frontmatter_block``.
+
+    Returns:
+        The body with leading newlines removed.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    with Path(path).open("rb") as f:
+        _ = f.seek(offset)
+        return f.read().decode("utf-8").lstrip("\n")
+
+
+def _parse_frontmatter_file(path: Path | str) -> tuple[bool, Any]:
+    block = read_frontmatter_block(path)
+    if block is None:
+        return False, None
+    return True, load_yaml(block[0])
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _load_frontmatter(
+    path: str, _size: int, _mtime_ns: int, _inode: int
+) -> tuple[bool, Any]:
+    return _parse_frontmatter_file(path)
+
+
+def read_frontmatter(path: Path | str) -> tuple[bool, Any]:
+    """Read and parse a markdown file's frontmatter, using the header cache.
+
+    Args:
+        path: Markdown file.
+
+    Returns:
+        Tuple of (whether the file has a frontmatter block, parsed YAML). The
+        YAML is None for an empty block and may be any YAML value; callers
+        validate its shape. Each call returns a fresh copy that is safe to
+        mutate.
+
+    Raises:
+        OSError: If the file cannot be read.
+        UnicodeDecodeError: If the frontmatter is not valid UTF-8.
+        yaml.YAMLError: If the frontmatter is malformed.
+    """
+    file_path = Path(path)
+    st = file_path.stat()
+    if st.st_mtime_ns >= time.time_ns() - _RACY_WINDOW_NS:
+        return _parse_frontmatter_file(file_path)
+    found, data = _load_frontmatter(
+        str(file_path.absolute()), st.st_size, st.st_mtime_ns, st.st_ino
+    )
+    return found, copy.deepcopy(data)
+
+
+def clear_frontmatter_cache() -> None:
+    """Drop all cached frontmatter headers."""
+    _load_frontmatter.cache_clear()
@@ -0,0 +1,232 @@
+"""Persistent high-water-mark counters for sequential IDs.
+
+Artifacts, specifications, requirements, and tests get sequential IDs such as
+``RV-0004`` or ``0012``. Deriving the next number from the items that exist
+means parsing every ID of the type on each creation, and two processes
+creating items at the same time can both pick the same number. IDCounters
+keeps the highest number handed out per scope and prefix in a small SQLite
+database, so allocating an ID is one indexed update inside a write
+transaction, which serializes concurrent allocations across processes.
+
+Counters are high-water marks: a number is never handed out twice, even after
+the item holding it is deleted. Reserving a number and creating the item
+happen together in ``reserve``; if creating the item fails, the number is
+given back unless another allocation has already moved past it.
+
+The database is a derived cache, kept in the git-ignored cache directory of
+the data directory so it is never committed, and is reconciled with the
+items on disk:
+
+- A counter without a row (a new scope, or a deleted database) is seeded
+  from a scan of the existing IDs.
+- If the next number is already taken, e.g. because items were added by
+  ``git checkout`` or by an older version, the counter is moved past the
+  highest existing number before allocating.
+
+Example:
+    >>> from oaps.utils._id_counters import IDCounters
+    >>> counters = IDCounters(Path(".cache/counters.db"))
+    >>> with counters.reserve(
+    ...     "0001", "FR", exists=lambda n: n in taken, scan=lambda: max(taken)
+    ... ) as number:
+    ...     create_requirement(f"FR-{number:04d}")
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, cast
+
+from oaps.utils.database import ensure_cache_schema, open_cache
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Callable, Iterator
+
+# Default database file name, placed in the cache directory of the directory
+# whose items it numbers
+ID_COUNTERS_NAME: Final = "counters.db"
+
+_SCHEMA_VERSION: Final = 1
+
+_SCHEMA: Final = """
+CREATE TABLE IF NOT EXISTS id_counters (
+    scope TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    PRIMARY KEY (scope, prefix)
+) WITHOUT ROWID
+"""
+
+_SQL_UPSERT: Final = """
+INSERT INTO id_counters (scope, prefix, value) VALUES (?, ?, ?)
+ON CONFLICT (scope, prefix) DO UPDATE SET value = excluded.value
+"""
+
+# Moves a counter back only if nothing was allocated after the number
+_SQL_RELEASE: Final = """
+UPDATE id_counters SET value = value - 1
+WHERE scope = ? AND prefix = ? AND value = ?
+"""
+
+
+class IDCounters:
+    """High-water marks of sequential ID numbers, per scope and prefix.
+
+    Every call opens its own connection, so counters can be shared between
+    processes.
+
+    Attributes:
+        _db_path: Path to the SQLite database.
+        _root: Directory that path scopes are recorded relative to.
+        _ready: Whether the schema has been checked by this instance.
+    """
+
+    __slots__ = ("_db_path", "_ready", "_root")
+
+    def __init__(self, db_path: Path | str, *, root: Path | str | None = None) -> None:
+        """Initialize the counters. The database is created on first use.
+
+        Args:
+            db_path: Path to the SQLite database.
+            root: Directory that path scopes, such as the base directory of
+                an artifact store, are recorded relative to (defaults to the
+                database's directory).
+        """
+        self._db_path = Path(db_path)
+        self._root = Path(root) if root is not None else self._db_path.parent
+        self._ready = False
+
+    @property
+    def db_path(self) -> Path:
+        """Path to the SQLite database."""
+        return self._db_path
+
+    @property
+    def root(self) -> Path:
+        """Directory that path scopes are recorded relative to."""
+        return self._root
+
+    # --- Connections ---
+
+    @contextmanager
+    def _open(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, creating the schema if needed."""
+        self._ensure_schema()
+        with open_cache(self._db_path) as conn:
+            yield conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in a write transaction, rolling back on error."""
+        self._ensure_schema()
+        with open_cache(self._db_path, write=True) as conn:
+            yield conn
+
+    def _ensure_schema(self) -> None:
+        """Create the schema, discarding counters written by another version.
+
+        A lost or corrupt database only costs a rescan: counters are reseeded
+        from the existing IDs.
+        """
+        if not self._ready:
+            ensure_cache_schema(
+                self._db_path, _SCHEMA_VERSION, [_SCHEMA], drop=["id_counters"]
+            )
+            self._ready = True
+
+    # --- Allocation ---
+
+    def peek(self, scope: str, prefix: str) -> int | None:
+        """Get the highest number handed out for a prefix.
+
+        Args:
+            scope: Container the numbers are unique in (e.g., a spec ID).
+            prefix: ID prefix (e.g., "FR").
+
+        Returns:
+            The high-water mark, or None if nothing was allocated yet.
+        """
+        with self._open() as conn:
+            row = conn.execute(
+                "SELECT value FROM id_counters WHERE scope = ? AND prefix = ?",
+                (scope, prefix),
+            ).fetchone()
+        return None if row is None else cast("int", row[0])
+
+    def allocate(
+        self,
+        scope: str,
+        prefix: str,
+        *,
+        exists: Callable[[int], bool],
+        scan: Callable[[], int],
+    ) -> int:
+        """Hand out the next number for a prefix.
+
+        Args:
+            scope: Container the numbers are unique in.
+            prefix: ID prefix.
+            exists: Whether an item with a number already exists.
+            scan: Highest number of the existing items, 0 if there are none.
+                Only called to seed or reconcile the counter.
+
+        Returns:
+            The allocated number.
+        """
+        with self._write() as conn:
+            row = conn.execute(
+                "SELECT value FROM id_counters WHERE scope = ? AND prefix = ?",
+                (scope, prefix),
+            ).fetchone()
+            value = scan() if row is None else cast("int", row[0])
+            if exists(value + 1):
+                # Items were added without going through the counter
+                value = max(value, scan())
+            number = value + 1
+            _ = conn.execute(_SQL_UPSERT, (scope, prefix, number))
+        return number
+
+    def release(self, scope: str, prefix: str, number: int) -> bool:
+        """Give back a number whose item was not created.
+
+        Args:
+            scope: Container the number was allocated in.
+            prefix: ID prefix.
+            number: Number returned by ``allocate``.
+
+        Returns:
+            True if the counter was moved back, False if another number was
+            allocated after it, which leaves a gap.
+        """
+        with self._write() as conn:
+            cursor = conn.execute(_SQL_RELEASE, (scope, prefix, number))
+        return cursor.rowcount > 0
+
+    @contextmanager
+    def reserve(
+        self,
+        scope: str,
+        prefix: str,
+        *,
+        exists: Callable[[int], bool],
+        scan: Callable[[], int],
+    ) -> Iterator[int]:
+        """Allocate a number for an item created in the ``with`` block.
+
+        If the block raises, the number is released.
+
+        Args:
+            scope: Container the numbers are unique in.
+            prefix: ID prefix.
+            exists: Whether an item with a number already exists.
+            scan: Highest number of the existing items, 0 if there are none.
+
+        Yields:
+            The allocated number.
+        """
+        number = self.allocate(scope, prefix, exists=exists, scan=scan)
+        try:
+            yield number
+        except BaseException:
+            _ = self.release(scope, prefix, number)
+            raise
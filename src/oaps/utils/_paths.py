@@ -1,12 +1,18 @@
 from importlib.resources import files
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from dulwich.repo import Repo
 
 if TYPE_CHECKING:
     from uuid import UUID
 
+# Directory of derived, machine-local files inside an OAPS data directory
+CACHE_DIR_NAME: Final = ".cache"
+
+# Contents of the .gitignore that keeps a cache directory out of commits
+_CACHE_GITIGNORE: Final = "# Created by OAPS; derived files, never committed\n*\n"
+
 
 def get_worktree_root() -> Path:
     """Get the root directory of the current Git worktree."""
@@ -145,3 +151,41 @@ def get_oaps_cli_log_file() -> Path:
         Path to the CLI log file (.oaps/logs/cli.log).
     """
     return get_oaps_log_dir() / "cli.log"
+
+
+def get_cache_dir(directory: Path | str) -> Path:
+    """Get the cache directory of an OAPS data directory.
+
+    Indexes, counters, and other files derived from the tracked files of a
+    data directory (such as ``.oaps/docs/specs/``) are kept in its
+    ``.cache/`` directory, which is git-ignored so checkpoints never commit
+    them.
+
+    Args:
+        directory: The data directory.
+
+    Returns:
+        Path to the cache directory (may not exist yet).
+    """
+    return Path(directory) / CACHE_DIR_NAME
+
+
+def ensure_parent_dir(path: Path | str) -> Path:
+    """Create the parent directory of a file if needed.
+
+    A parent named ``.cache`` is given a ``.gitignore`` that ignores all of
+    its contents, including itself.
+
+    Args:
+        path: Path to the file about to be written.
+
+    Returns:
+        The parent directory.
+    """
+    parent = Path(path).parent
+    parent.mkdir(parents=True, exist_ok=True)
+    if parent.name == CACHE_DIR_NAME:
+        gitignore = parent / ".gitignore"
+        if not gitignore.exists():
+            _ = gitignore.write_text(_CACHE_GITIGNORE)
+    return parent
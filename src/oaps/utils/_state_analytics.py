@@ -0,0 +1,409 @@
+# pyright: reportAny=false, reportMissingTypeStubs=false
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+# pyright: reportUnknownArgumentType=false, reportUnknownParameterType=false
+"""Cross-session analytics over the unified state database.
+
+This module loads the ``state_store`` table into DuckDB as a columnar
+snapshot so that questions spanning many sessions (average tools per
+session, sessions with the most subagent spawns, activity over time) run as
+vectorized SQL instead of Python loops over individual state stores.
+
+The snapshot is streamed from SQLite in batches through Apache Arrow, or read
+back from a Parquet file previously written by ``write_state_snapshot``.
+Two views are available to queries:
+
+- ``state``: one row per state entry with typed value and timestamp columns.
+- ``sessions``: one row per session with the built-in ``oaps.*`` counters
+  pivoted into columns.
+"""
+
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import UTC
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Literal, Self, cast
+
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import datetime
+
+type TimeBucket = Literal["hour", "day", "week", "month"]
+type SessionMetric = Literal[
+    "tools", "prompts", "subagents", "compactions", "permissions", "notifications"
+]
+
+# Rows fetched from SQLite per Arrow record batch
+_BATCH_SIZE: Final = 10_000
+
+_SNAPSHOT_SCHEMA: Final = pa.schema(
+    [
+        ("session_id", pa.string()),
+        ("key", pa.string()),
+        ("value_type", pa.string()),
+        ("num_value", pa.float64()),
+        ("text_value", pa.string()),
+        ("created_at", pa.string()),
+        ("created_by", pa.string()),
+        ("updated_at", pa.string()),
+        ("updated_by", pa.string()),
+    ]
+)
+
+# Numeric and text values come from the typed columns so the snapshot has
+# stable column types; BLOB values are only represented by their type tag.
+_SQL_SNAPSHOT = """
+SELECT
+    session_id,
+    key,
+    typeof(value) AS value_type,
+    COALESCE(int_value, real_value) AS num_value,
+    text_value,
+    created_at,
+    created_by,
+    updated_at,
+    updated_by
+FROM state_store
+WHERE session_id != ''
+"""
+
+_SQL_SNAPSHOT_SINCE = _SQL_SNAPSHOT + "AND updated_at >= ?\n"
+
+_DUCKDB_VIEWS = """
+CREATE VIEW state AS
+SELECT
+    session_id,
+    key,
+    value_type,
+    num_value,
+    text_value,
+    CAST(created_at AS TIMESTAMPTZ) AS created_at,
+    created_by,
+    CAST(updated_at AS TIMESTAMPTZ) AS updated_at,
+    updated_by
+FROM state_raw;
+
+CREATE VIEW sessions AS
+SELECT
+    session_id,
+    MIN(created_at) AS first_seen,
+    MAX(updated_at) AS last_seen,
+    COUNT(*) AS key_count,
+    CAST(COALESCE(MAX(num_value) FILTER (
+        WHERE key = 'oaps.tools.total_count'), 0) AS BIGINT) AS tools,
+    CAST(COALESCE(MAX(num_value) FILTER (
+        WHERE key = 'oaps.prompts.count'), 0) AS BIGINT) AS prompts,
+    CAST(COALESCE(MAX(num_value) FILTER (
+        WHERE key = 'oaps.subagents.spawn_count'), 0) AS BIGINT) AS subagents,
+    CAST(COALESCE(MAX(num_value) FILTER (
+        WHERE key = 'oaps.session.compaction_count'), 0) AS BIGINT) AS compactions,
+    CAST(COALESCE(MAX(num_value) FILTER (
+        WHERE key = 'oaps.permissions.request_count'), 0) AS BIGINT) AS permissions,
+    CAST(COALESCE(MAX(num_value) FILTER (
+        WHERE key = 'oaps.notifications.count'), 0) AS BIGINT) AS notifications
+FROM state
+GROUP BY session_id;
+"""
+
+_SQL_SUMMARY = """
+SELECT
+    COUNT(*) AS sessions,
+    COALESCE(SUM(tools), 0) AS total_tools,
+    ROUND(COALESCE(AVG(tools), 0), 2) AS avg_tools,
+    ROUND(COALESCE(AVG(prompts), 0), 2) AS avg_prompts,
+    ROUND(COALESCE(AVG(subagents), 0), 2) AS avg_subagents,
+    ROUND(COALESCE(AVG(compactions), 0), 2) AS avg_compactions,
+    MIN(first_seen) AS first_seen,
+    MAX(last_seen) AS last_seen
+FROM sessions
+"""
+
+_SQL_TOOLS = """
+SELECT
+    regexp_extract(key, '^oaps\\.tools\\.([^.]+)\\.count$', 1) AS tool,
+    CAST(SUM(num_value) AS BIGINT) AS invocations,
+    COUNT(DISTINCT session_id) AS sessions
+FROM state
+WHERE regexp_matches(key, '^oaps\\.tools\\.[^.]+\\.count$')
+GROUP BY tool
+ORDER BY invocations DESC, tool
+LIMIT ?
+"""
+
+_SQL_TIMELINE = """
+SELECT
+    time_bucket(CAST(? AS INTERVAL), last_seen) AS bucket,
+    COUNT(*) AS sessions,
+    SUM(tools) AS tools,
+    SUM(prompts) AS prompts,
+    SUM(subagents) AS subagents,
+    ROUND(AVG(tools), 2) AS avg_tools
+FROM sessions
+GROUP BY bucket
+ORDER BY bucket
+"""
+
+_BUCKET_INTERVALS: Final[dict[str, str]] = {
+    "hour": "1 hour",
+    "day": "1 day",
+    "week": "7 days",
+    "month": "1 month",
+}
+
+_METRIC_COLUMNS: Final[dict[str, str]] = {
+    "tools": "tools",
+    "prompts": "prompts",
+    "subagents": "subagents",
+    "compactions": "compactions",
+    "permissions": "permissions",
+    "notifications": "notifications",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class QueryResult:
+    """Tabular result of an analytics query.
+
+    Attributes:
+        columns: Column names in result order.
+        rows: Result rows as tuples aligned with ``columns``.
+    """
+
+    columns: list[str]
+    rows: list[tuple[object, ...]]
+
+    def to_dicts(self) -> list[dict[str, object]]:
+        """Convert the result rows to a list of column-keyed dictionaries.
+
+        Returns:
+            One dictionary per row.
+        """
+        return [dict(zip(self.columns, row, strict=True)) for row in self.rows]
+
+
+def _format_since(since: datetime) -> str:
+    """Format a cutoff to compare against stored ISO 8601 timestamps."""
+    return since.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def iter_state_batches(
+    db_path: str | Path,
+    *,
+    since: datetime | None = None,
+    batch_size: int = _BATCH_SIZE,
+) -> Iterator[pa.RecordBatch]:
+    """Stream session-scoped state entries from SQLite as Arrow record batches.
+
+    Memory use is bounded by ``batch_size`` regardless of database size.
+
+    Args:
+        db_path: Path to the unified state database.
+        since: Only include entries updated at or after this time.
+        batch_size: Number of rows per record batch.
+
+    Yields:
+        Record batches matching the snapshot schema.
+    """
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    with closing(sqlite3.connect(uri, uri=True)) as conn:
+        if since is None:
+            cursor = conn.execute(_SQL_SNAPSHOT)
+        else:
+            cursor = conn.execute(_SQL_SNAPSHOT_SINCE, (_format_since(since),))
+        while rows := cursor.fetchmany(batch_size):
+            columns = list(zip(*rows, strict=True))
+            yield pa.RecordBatch.from_arrays(
+                [
+                    pa.array(column, type=field.type)
+                    for column, field in zip(columns, _SNAPSHOT_SCHEMA, strict=True)
+                ],
+                schema=_SNAPSHOT_SCHEMA,
+            )
+
+
+def write_state_snapshot(
+    db_path: str | Path,
+    output_path: str | Path,
+    *,
+    since: datetime | None = None,
+) -> int:
+    """Write a Parquet snapshot of session-scoped state entries.
+
+    Args:
+        db_path: Path to the unified state database.
+        output_path: Destination Parquet file.
+        since: Only include entries updated at or after this time.
+
+    Returns:
+        Number of rows written.
+    """
+    count = 0
+    with pq.ParquetWriter(str(output_path), _SNAPSHOT_SCHEMA) as writer:
+        for batch in iter_state_batches(db_path, since=since):
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
+
+
+class StateAnalytics:
+    """DuckDB-backed analytics over a snapshot of the state database.
+
+    Use as a context manager so the DuckDB connection is closed on exit.
+
+    Examples:
+        >>> with StateAnalytics.from_database(".oaps/state.db") as analytics:
+        ...     analytics.summary().to_dicts()
+    """
+
+    _conn: duckdb.DuckDBPyConnection
+
+    def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Wrap a DuckDB connection that already holds a ``state_raw`` table.
+
+        Prefer the ``from_database`` and ``from_parquet`` constructors.
+
+        Args:
+            conn: DuckDB connection with the raw snapshot loaded.
+        """
+        self._conn = conn
+        _ = self._conn.execute("SET TimeZone = 'UTC'")
+        _ = self._conn.execute(_DUCKDB_VIEWS)
+
+    @classmethod
+    def from_database(
+        cls, db_path: str | Path, *, since: datetime | None = None
+    ) -> StateAnalytics:
+        """Load a snapshot directly from the SQLite state database.
+
+        Args:
+            db_path: Path to the unified state database.
+            since: Only include entries updated at or after this time.
+
+        Returns:
+            A StateAnalytics instance over the loaded snapshot.
+        """
+        reader = pa.RecordBatchReader.from_batches(
+            _SNAPSHOT_SCHEMA, iter_state_batches(db_path, since=since)
+        )
+        conn = duckdb.connect(":memory:")
+        _ = conn.register("state_batches", reader)
+        _ = conn.execute("CREATE TABLE state_raw AS SELECT * FROM state_batches")
+        _ = conn.unregister("state_batches")
+        return cls(conn)
+
+    @classmethod
+    def from_parquet(cls, parquet_path: str | Path) -> StateAnalytics:
+        """Load a snapshot previously written by ``write_state_snapshot``.
+
+        Args:
+            parquet_path: Path to the Parquet snapshot.
+
+        Returns:
+            A StateAnalytics instance over the loaded snapshot.
+        """
+        conn = duckdb.connect(":memory:")
+        _ = conn.execute(
+            "CREATE TABLE state_raw AS SELECT * FROM read_parquet(?)",
+            [str(parquet_path)],
+        )
+        return cls(conn)
+
+    def __enter__(self) -> Self:
+        """Enter the context manager."""
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        """Close the DuckDB connection."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the DuckDB connection."""
+        self._conn.close()
+
+    def query(self, sql: str, params: list[object] | None = None) -> QueryResult:
+        """Run an ad-hoc SQL query against the ``state`` and ``sessions`` views.
+
+        Args:
+            sql: DuckDB SQL query.
+            params: Optional positional query parameters.
+
+        Returns:
+            The query result.
+
+        Raises:
+            duckdb.Error: If the query is invalid.
+        """
+        relation = self._conn.execute(sql, params or [])
+        description = relation.description or []
+        columns = [str(column[0]) for column in description]
+        rows = cast("list[tuple[object, ...]]", relation.fetchall())
+        return QueryResult(columns=columns, rows=rows)
+
+    def summary(self) -> QueryResult:
+        """Aggregate counters across all sessions in the snapshot.
+
+        Returns:
+            A single-row result with session count and per-session averages.
+        """
+        return self.query(_SQL_SUMMARY)
+
+    def top_sessions(
+        self, metric: SessionMetric = "tools", *, limit: int = 10
+    ) -> QueryResult:
+        """Rank sessions by one of the built-in counters.
+
+        Args:
+            metric: Counter to rank by.
+            limit: Maximum number of sessions to return.
+
+        Returns:
+            Sessions ordered by the metric, highest first.
+
+        Raises:
+            ValueError: If the metric is unknown.
+        """
+        column = _METRIC_COLUMNS.get(metric)
+        if column is None:
+            msg = f"Unknown session metric: {metric!r}"
+            raise ValueError(msg)
+        # S608 is safe: column comes from the fixed _METRIC_COLUMNS mapping
+        sql = f"""
+            SELECT session_id, {column}, first_seen, last_seen
+            FROM sessions
+            ORDER BY {column} DESC, last_seen DESC
+            LIMIT ?
+        """  # noqa: S608
+        return self.query(sql, [limit])
+
+    def tool_usage(self, *, limit: int = 20) -> QueryResult:
+        """Total tool invocations across sessions, by tool name.
+
+        Args:
+            limit: Maximum number of tools to return.
+
+        Returns:
+            Tools ordered by invocation count, highest first.
+        """
+        return self.query(_SQL_TOOLS, [limit])
+
+    def timeline(self, bucket: TimeBucket = "day") -> QueryResult:
+        """Bucket sessions by their last activity time.
+
+        Args:
+            bucket: Width of each time bucket.
+
+        Returns:
+            One row per bucket with session and counter totals.
+
+        Raises:
+            ValueError: If the bucket is unknown.
+        """
+        interval = _BUCKET_INTERVALS.get(bucket)
+        if interval is None:
+            msg = f"Unknown time bucket: {bucket!r}"
+            raise ValueError(msg)
+        return self.query(_SQL_TIMELINE, [interval])
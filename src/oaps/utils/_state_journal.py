@@ -0,0 +1,197 @@
+"""Append-only journal for state store writes deferred under lock contention.
+
+When many short-lived hook processes write to the unified state database at
+once, a writer that cannot obtain the write lock within its retry budget can
+append its operation to a journal instead of stalling. A single writer later
+merges all journal segments into the database in one transaction (see
+``oaps.utils._state_store.merge_state_journal``).
+
+Each append writes a complete segment file named after its creation time and
+process ID. Segments are written to a temporary name and atomically renamed,
+so a merger never observes a partially written segment.
+"""
+
+import base64
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel
+
+type JournalOp = Literal["set", "increment", "delete", "clear"]
+
+_SEGMENT_SUFFIX = ".jsonl"
+_TEMP_SUFFIX = ".tmp"
+
+
+class JournalEntry(BaseModel):
+    """A single deferred state store operation.
+
+    Attributes:
+        op: The operation to apply.
+        session_id: Effective session ID (empty string for project scope).
+        key: The state key (empty for ``clear``).
+        value: Value for ``set`` operations, excluding bytes.
+        blob: Base64-encoded value for ``set`` operations storing bytes.
+        amount: Amount for ``increment`` operations.
+        at: When the operation was requested (ISO 8601 string).
+        author: Who requested the operation.
+        seq: Nanosecond timestamp used to order entries across segments.
+    """
+
+    op: JournalOp
+    session_id: str
+    key: str = ""
+    value: str | int | float | None = None
+    blob: str | None = None
+    amount: int = 0
+    at: str
+    author: str | None = None
+    seq: int
+
+    @classmethod
+    def for_set(
+        cls,
+        session_id: str,
+        key: str,
+        value: str | float | bytes | None,
+        *,
+        at: str,
+        author: str | None,
+    ) -> JournalEntry:
+        """Create an entry for a deferred ``set`` operation.
+
+        Args:
+            session_id: Effective session ID.
+            key: The state key.
+            value: The value to store.
+            at: When the operation was requested.
+            author: Who requested the operation.
+
+        Returns:
+            The journal entry.
+        """
+        if isinstance(value, bytes):
+            return cls(
+                op="set",
+                session_id=session_id,
+                key=key,
+                blob=base64.b64encode(value).decode("ascii"),
+                at=at,
+                author=author,
+                seq=time.time_ns(),
+            )
+        return cls(
+            op="set",
+            session_id=session_id,
+            key=key,
+            value=value,
+            at=at,
+            author=author,
+            seq=time.time_ns(),
+        )
+
+    @property
+    def decoded_value(self) -> str | int | float | bytes | None:
+        """Return the stored value, decoding bytes from base64."""
+        if self.blob is not None:
+            return base64.b64decode(self.blob)
+        return self.value
+
+
+def get_state_journal_dir(db_path: str | Path) -> Path:
+    """Get the journal directory for a state database.
+
+    Args:
+        db_path: Path to the state database.
+
+    Returns:
+        Sibling directory with a ``.journal`` suffix (e.g. ``state.journal``).
+    """
+    return Path(db_path).with_suffix(".journal")
+
+
+class StateJournal:
+    """Writer for a process's deferred state store operations.
+
+    Entries appended through an instance are also remembered in memory so the
+    owning store can account for them (for example when estimating the result
+    of a deferred increment).
+    """
+
+    _directory: Path
+    _pending: list[JournalEntry]
+
+    def __init__(self, directory: str | Path) -> None:
+        """Initialize a journal writer.
+
+        Args:
+            directory: Directory holding journal segments. Created on first append.
+        """
+        self._directory = Path(directory)
+        self._pending = []
+
+    @property
+    def directory(self) -> Path:
+        """Get the journal segment directory."""
+        return self._directory
+
+    @property
+    def pending(self) -> list[JournalEntry]:
+        """Get entries appended by this writer, oldest first."""
+        return list(self._pending)
+
+    def append(self, entry: JournalEntry) -> Path:
+        """Durably append an entry as a new journal segment.
+
+        Args:
+            entry: The entry to append.
+
+        Returns:
+            Path to the written segment.
+        """
+        self._directory.mkdir(parents=True, exist_ok=True)
+        name = f"{entry.seq:020d}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        segment = self._directory / f"{name}{_SEGMENT_SUFFIX}"
+        temp = self._directory / f"{name}{_TEMP_SUFFIX}"
+        with temp.open("w", encoding="utf-8") as f:
+            _ = f.write(entry.model_dump_json() + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        _ = temp.replace(segment)
+        self._pending.append(entry)
+        return segment
+
+
+def list_journal_segments(directory: str | Path) -> list[Path]:
+    """List complete journal segments, oldest first.
+
+    Args:
+        directory: Journal directory.
+
+    Returns:
+        Segment paths sorted by name (creation time). Empty if the directory
+        does not exist.
+    """
+    path = Path(directory)
+    if not path.is_dir():
+        return []
+    return sorted(path.glob(f"*{_SEGMENT_SUFFIX}"))
+
+
+def read_journal_segment(segment: Path) -> list[JournalEntry]:
+    """Read all entries from a journal segment.
+
+    Args:
+        segment: Path to the segment file.
+
+    Returns:
+        Entries in file order.
+
+    Raises:
+        pydantic.ValidationError: If a line is not a valid journal entry.
+    """
+    with segment.open(encoding="utf-8") as f:
+        return [JournalEntry.model_validate_json(line) for line in f if line.strip()]
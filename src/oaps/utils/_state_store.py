@@ -4,22 +4,32 @@ This module provides an abstract state store protocol and concrete implementatio
 for storing key-value data with metadata. Used for session state, project state, etc.
 """
 
+import sqlite3
+import time
 from typing import TYPE_CHECKING, Protocol, cast, runtime_checkable
 
 import pendulum
-from pydantic import BaseModel
-
+from pydantic import BaseModel, ValidationError
+
+from oaps.utils._state_journal import (
+    JournalEntry,
+    StateJournal,
+    get_state_journal_dir,
+    list_journal_segments,
+    read_journal_segment,
+)
 from oaps.utils.database import (
+    BusyRetryPolicy,
     connect,
     fetch_all,
     fetch_one,
+    is_busy_error,
+    retry_on_busy,
     safe_identifier,
-    upsert,
 )
 
 if TYPE_CHECKING:
-    import sqlite3
-    from collections.abc import Iterator
+    from collections.abc import Callable, Iterator
     from pathlib import Path
 
     from structlog.typing import FilteringBoundLogger
@@ -193,6 +203,8 @@ class MockStateStore:
         session_id: str | None = None,
         *,
         logger: "FilteringBoundLogger | None" = None,  # noqa: UP037
+        retry_policy: BusyRetryPolicy | None = None,
+        journal: StateJournal | None = None,
     ) -> None:
         """Initialize an empty in-memory store.
 
@@ -201,9 +213,11 @@ class MockStateStore:
             session_id: The session ID for scoping (None for project scope).
             logger: Optional logger for debug-level operation logging.
                 If None, no logging is performed.
+            retry_policy: Ignored. Accepted for compatibility with SQLiteStateStore.
+            journal: Ignored. Accepted for compatibility with SQLiteStateStore.
         """
-        # db_path is ignored - in-memory store doesn't persist
-        _ = db_path
+        # db_path, retry_policy, and journal are ignored - writes never contend
+        _ = db_path, retry_policy, journal
         self._entries = {}
         self._session_id = session_id
         # Use sentinel value for NULL - SQLite ON CONFLICT doesn't work with NULL
@@ -446,52 +460,210 @@ class MockStateStore:
         return new_value
 
 
-_SQLITE_SCHEMA = """
+# Schema version recorded in PRAGMA user_version. Version 1 (user_version 0)
+# stored every value in a single BLOB column; version 2 stores each value in
+# the column matching its type, so increments and range scans work on a plain
+# INTEGER column. ``value`` is a virtual column returning whichever typed
+# column is set, so readers see the same rows as before.
+_SCHEMA_VERSION = 2
+
+_SQLITE_SCHEMA_STATEMENTS = (
+    """
 CREATE TABLE IF NOT EXISTS state_store (
     session_id TEXT,
     key TEXT NOT NULL,
-    value BLOB,
+    int_value INTEGER,
+    real_value REAL,
+    text_value TEXT,
+    blob_value BLOB,
     created_at TEXT NOT NULL,
     created_by TEXT,
     updated_at TEXT NOT NULL,
     updated_by TEXT,
+    value GENERATED ALWAYS AS (
+        COALESCE(int_value, real_value, text_value, blob_value)
+    ) VIRTUAL,
     PRIMARY KEY (session_id, key)
-);
-
+)
+""",
+    """
 CREATE INDEX IF NOT EXISTS idx_state_store_session_updated
-ON state_store (session_id, updated_at);
-"""
+ON state_store (session_id, updated_at)
+""",
+    """
+CREATE INDEX IF NOT EXISTS idx_state_store_session_int
+ON state_store (session_id, int_value) WHERE int_value IS NOT NULL
+""",
+)
 
-# Pre-computed SQL queries using safe identifiers
-# S608 is safe: safe_identifier validates all table/column names
-_SQL_SELECT_BY_KEY = (
-    f"SELECT * FROM {_TABLE} WHERE {_SESSION_ID_COL} = ? AND {_KEY_COL} = ?"  # noqa: S608
+# Version 1 -> 2: copy rows into the typed layout and swap the tables. Runs
+# in one transaction; WAL readers keep seeing the old table until commit.
+_SQL_MIGRATE_V1 = (
+    "DROP INDEX IF EXISTS idx_state_store_session_updated",
+    "ALTER TABLE state_store RENAME TO state_store_v1",
+    *_SQLITE_SCHEMA_STATEMENTS,
+    """
+INSERT INTO state_store
+    (session_id, key, int_value, real_value, text_value, blob_value,
+     created_at, created_by, updated_at, updated_by)
+SELECT
+    session_id,
+    key,
+    CASE typeof(value) WHEN 'integer' THEN value END,
+    CASE typeof(value) WHEN 'real' THEN value END,
+    CASE typeof(value) WHEN 'text' THEN value END,
+    CASE typeof(value) WHEN 'blob' THEN value END,
+    created_at,
+    created_by,
+    updated_at,
+    updated_by
+FROM state_store_v1
+""",
+    "DROP TABLE state_store_v1",
+)
+
+_SQL_TABLE_EXISTS = (
+    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'state_store'"
 )
-_SQL_SELECT_ALL = (
-    f"SELECT * FROM {_TABLE} WHERE {_SESSION_ID_COL} = ? ORDER BY {_KEY_COL}"  # noqa: S608
+
+# Columns read into StateEntry
+_ENTRY_COLUMNS = (
+    f'{_SESSION_ID_COL}, {_KEY_COL}, "value", '
+    '"created_at", "created_by", "updated_at", "updated_by"'
 )
+
+# Pre-computed SQL queries using safe identifiers
+# S608 is safe: safe_identifier validates all table/column names
+_SQL_SELECT_BY_KEY = f"SELECT {_ENTRY_COLUMNS} FROM {_TABLE} WHERE {_SESSION_ID_COL} = ? AND {_KEY_COL} = ?"  # noqa: E501, S608
+_SQL_SELECT_ALL = f"SELECT {_ENTRY_COLUMNS} FROM {_TABLE} WHERE {_SESSION_ID_COL} = ? ORDER BY {_KEY_COL}"  # noqa: E501, S608
 _SQL_COUNT = f"SELECT COUNT(*) FROM {_TABLE} WHERE {_SESSION_ID_COL} = ?"  # noqa: S608
 _SQL_EXISTS = f"SELECT 1 FROM {_TABLE} WHERE {_SESSION_ID_COL} = ? AND {_KEY_COL} = ?"  # noqa: S608
 _SQL_DELETE_ALL = f"DELETE FROM {_TABLE} WHERE {_SESSION_ID_COL} = ?"  # noqa: S608
+_SQL_DELETE_BY_KEY = (
+    f"DELETE FROM {_TABLE} WHERE {_SESSION_ID_COL} = ? AND {_KEY_COL} = ?"  # noqa: S608
+)
+# Single-statement upsert so no read happens inside the write transaction.
+# A None value or author on update keeps the stored one, matching upsert()'s
+# exclude_none semantics. RETURNING created_at tells inserts from updates.
+# Parameters are built by _upsert_params.
+_SQL_UPSERT = f"""
+INSERT INTO {_TABLE}
+    ({_SESSION_ID_COL}, {_KEY_COL},
+     "int_value", "real_value", "text_value", "blob_value",
+     "created_at", "created_by", "updated_at", "updated_by")
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT ({_SESSION_ID_COL}, {_KEY_COL}) DO UPDATE SET
+    "int_value" = CASE WHEN excluded."value" IS NULL
+        THEN {_TABLE}."int_value" ELSE excluded."int_value" END,
+    "real_value" = CASE WHEN excluded."value" IS NULL
+        THEN {_TABLE}."real_value" ELSE excluded."real_value" END,
+    "text_value" = CASE WHEN excluded."value" IS NULL
+        THEN {_TABLE}."text_value" ELSE excluded."text_value" END,
+    "blob_value" = CASE WHEN excluded."value" IS NULL
+        THEN {_TABLE}."blob_value" ELSE excluded."blob_value" END,
+    "updated_at" = excluded."updated_at",
+    "updated_by" = COALESCE(excluded."updated_by", {_TABLE}."updated_by")
+RETURNING "created_at"
+"""  # noqa: S608
+# Integer arithmetic directly on int_value. A REAL value is truncated and any
+# other value counts as 0; the result is always stored as an integer.
 _SQL_ATOMIC_INCREMENT = f"""
 INSERT INTO {_TABLE}
-    ({_SESSION_ID_COL}, {_KEY_COL}, "value",
+    ({_SESSION_ID_COL}, {_KEY_COL}, "int_value",
      "created_at", "created_by", "updated_at", "updated_by")
 VALUES (?, ?, ?, ?, ?, ?, ?)
 ON CONFLICT ({_SESSION_ID_COL}, {_KEY_COL}) DO UPDATE SET
-    "value" = COALESCE(
-        CASE
-            WHEN typeof({_TABLE}."value") IN ('integer', 'real')
-            THEN CAST({_TABLE}."value" AS INTEGER)
-            ELSE 0
-        END, 0
-    ) + excluded."value",
+    "int_value" = COALESCE(
+        {_TABLE}."int_value", CAST({_TABLE}."real_value" AS INTEGER), 0
+    ) + excluded."int_value",
+    "real_value" = NULL,
+    "text_value" = NULL,
+    "blob_value" = NULL,
     "updated_at" = excluded."updated_at",
     "updated_by" = excluded."updated_by"
-RETURNING "value"
+RETURNING "int_value"
 """  # noqa: S608
 
 
+type _TypedValue = tuple[int | None, float | None, str | None, bytes | None]
+
+
+def _typed_value(value: StateStoreValue) -> _TypedValue:
+    """Split a value into the (int, real, text, blob) columns of schema v2."""
+    match value:
+        case None:
+            return (None, None, None, None)
+        case int():
+            return (value, None, None, None)
+        case float():
+            return (None, value, None, None)
+        case str():
+            return (None, None, value, None)
+        case bytes():
+            return (None, None, None, value)
+
+
+def _upsert_params(
+    session_id: str,
+    key: StateStoreKey,
+    value: StateStoreValue,
+    at: str,
+    author: str | None,
+) -> tuple[object, ...]:
+    """Build the parameters for ``_SQL_UPSERT``.
+
+    Args:
+        session_id: The effective session ID (sentinel for project scope).
+        key: The key to set.
+        value: The value to store.
+        at: Timestamp used for created_at (kept on conflict) and updated_at.
+        author: Used for created_by (kept on conflict) and updated_by.
+
+    Returns:
+        The statement parameters.
+    """
+    return (session_id, key, *_typed_value(value), at, author, at, author)
+
+
+def _ensure_state_schema(db_path: str, *, busy_timeout: int = 10000) -> int:
+    """Create or upgrade the state store schema.
+
+    Reads ``PRAGMA user_version`` first, so on an up-to-date database this is
+    a single cheap read. Otherwise the schema is created, or a version 1
+    database is migrated in place, in one ``BEGIN IMMEDIATE`` transaction.
+    Other processes keep reading during the migration and writers wait on the
+    lock as for any other write.
+
+    Args:
+        db_path: Path to the state database.
+        busy_timeout: Milliseconds to wait for the write lock.
+
+    Returns:
+        The schema version found before the call (0 for a new database).
+    """
+    with connect(db_path, autocommit=True, busy_timeout=busy_timeout) as conn:
+        found = cast("int", conn.execute("PRAGMA user_version").fetchone()[0])
+        if found >= _SCHEMA_VERSION:
+            return found
+
+        _ = conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have upgraded while we waited for the lock
+            found = cast("int", conn.execute("PRAGMA user_version").fetchone()[0])
+            if found < _SCHEMA_VERSION:
+                exists = conn.execute(_SQL_TABLE_EXISTS).fetchone() is not None
+                statements = _SQL_MIGRATE_V1 if exists else _SQLITE_SCHEMA_STATEMENTS
+                for statement in statements:
+                    _ = conn.execute(statement)
+                _ = conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+                found = 1 if exists else 0
+            _ = conn.execute("COMMIT")
+        except BaseException:
+            _ = conn.execute("ROLLBACK")
+            raise
+        return found
+
+
 # Sentinel value for project scope - SQLite ON CONFLICT doesn't work with NULL
 _PROJECT_SCOPE_SENTINEL = ""
 
@@ -501,12 +673,21 @@ class SQLiteStateStore:
 
     Persists state data to a SQLite database file. Thread-safe for
     single-process access.
+
+    Each write is a single short transaction; reads and logging happen outside
+    of it. For many concurrent writers (e.g. parallel hook processes), pass a
+    ``retry_policy`` to bound how long a write waits for the lock, and
+    optionally a ``journal`` so writes that still cannot get the lock are
+    deferred instead of failing. Deferred writes are applied later by
+    ``merge_state_journal``.
     """
 
     _db_path: str
     _session_id: str | None
     _effective_session_id: str  # Actual value used in SQL (sentinel for None)
     _logger: "FilteringBoundLogger | None"  # noqa: UP037
+    _retry_policy: BusyRetryPolicy | None
+    _journal: StateJournal | None
 
     def __init__(
         self,
@@ -514,6 +695,8 @@ class SQLiteStateStore:
         session_id: str | None = None,
         *,
         logger: "FilteringBoundLogger | None" = None,  # noqa: UP037
+        retry_policy: BusyRetryPolicy | None = None,
+        journal: StateJournal | None = None,
     ) -> None:
         """Initialize a SQLite state store.
 
@@ -524,6 +707,10 @@ class SQLiteStateStore:
             session_id: The session ID for scoping (None for project scope).
             logger: Optional logger for debug-level operation logging.
                 If None, no logging is performed.
+            retry_policy: Optional bounded retry policy for writes. If None,
+                writes rely on SQLite's default busy timeout.
+            journal: Optional journal for writes that exhaust the retry policy.
+                Only used together with a retry policy.
         """
         self._db_path = str(db_path)
         self._session_id = session_id
@@ -532,6 +719,8 @@ class SQLiteStateStore:
             session_id if session_id is not None else _PROJECT_SCOPE_SENTINEL
         )
         self._logger = logger
+        self._retry_policy = retry_policy
+        self._journal = journal
         self._ensure_schema()
 
     @property
@@ -540,9 +729,56 @@ class SQLiteStateStore:
         return self._session_id
 
     def _ensure_schema(self) -> None:
-        """Create the database schema if it doesn't exist."""
-        with connect(self._db_path) as conn:
-            _ = conn.executescript(_SQLITE_SCHEMA)
+        """Create the database schema, or upgrade it, if needed."""
+        _ = _ensure_state_schema(self._db_path)
+
+    def _write[T](self, operation: Callable[[sqlite3.Connection], T]) -> T:
+        """Run a write operation in its own short transaction.
+
+        Args:
+            operation: Callable issuing the write statements on a connection.
+
+        Returns:
+            The operation's return value.
+
+        Raises:
+            sqlite3.OperationalError: If the database stays locked past the
+                retry policy, or on any other database error.
+        """
+        policy = self._retry_policy
+        if policy is None:
+            with connect(self._db_path) as conn:
+                return operation(conn)
+
+        def attempt() -> T:
+            with connect(self._db_path, busy_timeout=policy.busy_timeout) as conn:
+                return operation(conn)
+
+        return retry_on_busy(attempt, policy, on_retry=self._log_retry)
+
+    def _log_retry(self, attempt: int, delay: float) -> None:
+        """Log a write retry caused by lock contention."""
+        if self._logger:
+            self._logger.debug("store_write_retry", attempt=attempt, delay=delay)
+
+    def _defer(self, error: sqlite3.OperationalError, entry: JournalEntry) -> None:
+        """Append a write that could not get the lock to the journal.
+
+        Args:
+            error: The error raised by the failed write.
+            entry: The journal entry describing the write.
+
+        Raises:
+            sqlite3.OperationalError: The original error, if it was not caused
+                by lock contention or no journal is configured.
+        """
+        if self._journal is None or not is_busy_error(error):
+            raise error
+        segment = self._journal.append(entry)
+        if self._logger:
+            self._logger.debug(
+                "store_write_deferred", op=entry.op, key=entry.key, segment=str(segment)
+            )
 
     def __getitem__(self, key: StateStoreKey) -> StateStoreValue:
         """Get the value for a key.
@@ -663,50 +899,31 @@ class SQLiteStateStore:
             author: Who is making this change.
         """
         now_str = pendulum.now("UTC").to_iso8601_string()
+        params = _upsert_params(self._effective_session_id, key, value, now_str, author)
 
-        with connect(self._db_path) as conn:
-            # Check if key exists to preserve created_at/created_by
-            existing = fetch_one(
-                conn, StateEntry, _SQL_SELECT_BY_KEY, (self._effective_session_id, key)
-            )
-            is_update = existing is not None
-
-            if existing is not None:
-                model = StateEntry(
-                    session_id=self._effective_session_id,
-                    key=key,
-                    value=value,
-                    created_at=existing.created_at,
-                    created_by=existing.created_by,
-                    updated_at=now_str,
-                    updated_by=author,
-                )
-            else:
-                model = StateEntry(
-                    session_id=self._effective_session_id,
-                    key=key,
-                    value=value,
-                    created_at=now_str,
-                    created_by=author,
-                    updated_at=now_str,
-                    updated_by=author,
-                )
+        def write(conn: sqlite3.Connection) -> bool:
+            row = cast("sqlite3.Row", conn.execute(_SQL_UPSERT, params).fetchone())
+            return row[0] != now_str  # pyright: ignore[reportAny]
 
-            _ = upsert(
-                conn,
-                "state_store",
-                model,
-                conflict_columns=["session_id", "key"],
+        try:
+            is_update: bool | None = self._write(write)
+        except sqlite3.OperationalError as e:
+            self._defer(
+                e,
+                JournalEntry.for_set(
+                    self._effective_session_id, key, value, at=now_str, author=author
+                ),
             )
+            is_update = None
 
-            if self._logger:
-                self._logger.debug(
-                    "store_set",
-                    key=key,
-                    value=value,
-                    author=author,
-                    is_update=is_update,
-                )
+        if self._logger:
+            self._logger.debug(
+                "store_set",
+                key=key,
+                value=value,
+                author=author,
+                is_update=is_update,
+            )
 
     def delete(self, key: StateStoreKey) -> bool:
         """Delete a key from the store.
@@ -717,29 +934,48 @@ class SQLiteStateStore:
         Returns:
             True if the key was deleted, False if it didn't exist.
         """
-        with connect(self._db_path) as conn:
-            # Use raw SQL for composite key delete
-            cursor = conn.execute(
-                f"DELETE FROM {_TABLE} WHERE {_SESSION_ID_COL} = ? AND {_KEY_COL} = ?",  # noqa: S608
-                (self._effective_session_id, key),
+        params = (self._effective_session_id, key)
+        try:
+            deleted = self._write(
+                lambda conn: conn.execute(_SQL_DELETE_BY_KEY, params).rowcount > 0
             )
-            deleted = cursor.rowcount > 0
-            if self._logger:
-                self._logger.debug("store_delete", key=key, deleted=deleted)
-            return deleted
+        except sqlite3.OperationalError as e:
+            # A deferred delete reports whether the key currently exists
+            deleted = key in self
+            self._defer(
+                e,
+                JournalEntry(
+                    op="delete",
+                    session_id=self._effective_session_id,
+                    key=key,
+                    at=pendulum.now("UTC").to_iso8601_string(),
+                    seq=time.time_ns(),
+                ),
+            )
+        if self._logger:
+            self._logger.debug("store_delete", key=key, deleted=deleted)
+        return deleted
 
     def clear(self) -> None:
         """Remove all entries from the store."""
-        with connect(self._db_path) as conn:
-            # Get count before clearing for logging
-            count = 0
-            if self._logger:
-                cursor = conn.execute(_SQL_COUNT, (self._effective_session_id,))
-                row = cast("sqlite3.Row | None", cursor.fetchone())
-                count = int(row[0]) if row else 0  # pyright: ignore[reportAny]
-            _ = conn.execute(_SQL_DELETE_ALL, (self._effective_session_id,))
-            if self._logger:
-                self._logger.debug("store_clear", cleared_count=count)
+        params = (self._effective_session_id,)
+        try:
+            count = self._write(
+                lambda conn: conn.execute(_SQL_DELETE_ALL, params).rowcount
+            )
+        except sqlite3.OperationalError as e:
+            count = len(self)
+            self._defer(
+                e,
+                JournalEntry(
+                    op="clear",
+                    session_id=self._effective_session_id,
+                    at=pendulum.now("UTC").to_iso8601_string(),
+                    seq=time.time_ns(),
+                ),
+            )
+        if self._logger:
+            self._logger.debug("store_clear", cleared_count=count)
 
     def atomic_increment(
         self,
@@ -753,6 +989,9 @@ class SQLiteStateStore:
         Uses a single SQL statement with INSERT...ON CONFLICT for atomicity.
         If the existing value is not numeric, treats it as 0.
 
+        If the write is deferred to the journal, the returned value is an
+        estimate: the committed value plus this store's pending increments.
+
         Args:
             key: The key to increment.
             amount: Amount to add (can be negative for decrement).
@@ -762,33 +1001,218 @@ class SQLiteStateStore:
             The new value after incrementing.
         """
         now_str = pendulum.now("UTC").to_iso8601_string()
+        params = (
+            self._effective_session_id,
+            key,
+            amount,  # Initial value if inserting
+            now_str,  # created_at
+            author,  # created_by
+            now_str,  # updated_at
+            author,  # updated_by
+        )
 
-        with connect(self._db_path) as conn:
-            cursor = conn.execute(
-                _SQL_ATOMIC_INCREMENT,
-                (
-                    self._effective_session_id,
-                    key,
-                    amount,  # Initial value if inserting
-                    now_str,  # created_at
-                    author,  # created_by
-                    now_str,  # updated_at
-                    author,  # updated_by
-                ),
+        def write(conn: sqlite3.Connection) -> int:
+            row = cast(
+                "sqlite3.Row | None",
+                conn.execute(_SQL_ATOMIC_INCREMENT, params).fetchone(),
             )
-            row = cast("sqlite3.Row | None", cursor.fetchone())
             # Row indexing returns Any; RETURNING value is always an integer
-            new_value = int(row[0]) if row else amount  # pyright: ignore[reportAny]
+            return int(row[0]) if row else amount  # pyright: ignore[reportAny]
 
-            if self._logger:
-                self._logger.debug(
-                    "store_atomic_increment",
+        try:
+            new_value = self._write(write)
+        except sqlite3.OperationalError as e:
+            new_value = self._estimate_increment(key, amount)
+            self._defer(
+                e,
+                JournalEntry(
+                    op="increment",
+                    session_id=self._effective_session_id,
                     key=key,
                     amount=amount,
-                    new_value=new_value,
+                    at=now_str,
                     author=author,
-                )
-            return new_value
+                    seq=time.time_ns(),
+                ),
+            )
+
+        if self._logger:
+            self._logger.debug(
+                "store_atomic_increment",
+                key=key,
+                amount=amount,
+                new_value=new_value,
+                author=author,
+            )
+        return new_value
+
+    def _estimate_increment(self, key: StateStoreKey, amount: int) -> int:
+        """Estimate an increment's result without taking the write lock.
+
+        Args:
+            key: The key being incremented.
+            amount: Amount being added.
+
+        Returns:
+            The committed value plus pending journaled increments and amount.
+        """
+        with connect(self._db_path) as conn:
+            entry = fetch_one(
+                conn, StateEntry, _SQL_SELECT_BY_KEY, (self._effective_session_id, key)
+            )
+        current = entry.value if entry is not None else 0
+        base = int(current) if isinstance(current, int | float) else 0
+        if self._journal is not None:
+            base += sum(
+                pending.amount
+                for pending in self._journal.pending
+                if pending.op == "increment"
+                and pending.session_id == self._effective_session_id
+                and pending.key == key
+            )
+        return base + amount
+
+
+_JOURNAL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state_journal_applied (
+    segment TEXT PRIMARY KEY
+);
+"""
+
+_SQL_SELECT_APPLIED = "SELECT segment FROM state_journal_applied"
+_SQL_INSERT_APPLIED = "INSERT INTO state_journal_applied (segment) VALUES (?)"
+_SQL_DELETE_APPLIED = "DELETE FROM state_journal_applied WHERE segment = ?"
+
+
+def _apply_journal_entry(conn: sqlite3.Connection, entry: JournalEntry) -> None:
+    """Apply a single journal entry inside the merge transaction."""
+    match entry.op:
+        case "set":
+            params = _upsert_params(
+                entry.session_id, entry.key, entry.decoded_value, entry.at, entry.author
+            )
+            _ = conn.execute(_SQL_UPSERT, params).fetchall()
+        case "increment":
+            params = (
+                entry.session_id,
+                entry.key,
+                entry.amount,
+                entry.at,
+                entry.author,
+                entry.at,
+                entry.author,
+            )
+            _ = conn.execute(_SQL_ATOMIC_INCREMENT, params).fetchall()
+        case "delete":
+            _ = conn.execute(_SQL_DELETE_BY_KEY, (entry.session_id, entry.key))
+        case "clear":
+            _ = conn.execute(_SQL_DELETE_ALL, (entry.session_id,))
+
+
+def _read_journal_segments(
+    directory: str | Path,
+    logger: "FilteringBoundLogger | None",  # noqa: UP037
+) -> dict[Path, list[JournalEntry]]:
+    """Read the pending journal segments, moving unreadable ones aside.
+
+    Segments removed while they are read were applied by another merger and
+    are skipped.
+    """
+    readable: dict[Path, list[JournalEntry]] = {}
+    for segment in list_journal_segments(directory):
+        try:
+            readable[segment] = read_journal_segment(segment)
+        except FileNotFoundError:
+            continue
+        except (OSError, ValidationError):
+            if logger:
+                logger.warning("state_journal_segment_invalid", segment=str(segment))
+            _ = segment.replace(segment.with_name(f"{segment.name}.bad"))
+    return readable
+
+
+def merge_state_journal(
+    db_path: str | Path,
+    *,
+    journal_dir: str | Path | None = None,
+    busy_timeout: int = 10000,
+    logger: "FilteringBoundLogger | None" = None,  # noqa: UP037
+) -> int:
+    """Apply deferred state store writes from the journal to the database.
+
+    All pending segments are applied in a single transaction, in the order
+    their operations were requested. Applied segment names are recorded in the
+    same transaction, so a crash before the segments are removed never applies
+    them twice. Segments that cannot be parsed are renamed with a ``.bad``
+    suffix and skipped.
+
+    Safe to call from any process. The segments and the applied names are
+    read after ``BEGIN IMMEDIATE``, so concurrent mergers serialize on the
+    database write lock and each segment is applied once. A name is only
+    forgotten once its segment has been removed.
+
+    Args:
+        db_path: Path to the state database.
+        journal_dir: Journal directory. Defaults to ``get_state_journal_dir``.
+        busy_timeout: Milliseconds to wait for the write lock.
+        logger: Optional logger for debug-level operation logging.
+
+    Returns:
+        Number of journal entries applied.
+
+    Raises:
+        sqlite3.OperationalError: If the write lock is not obtained within
+            ``busy_timeout``; the journal is left untouched.
+    """
+    directory = (
+        journal_dir if journal_dir is not None else get_state_journal_dir(db_path)
+    )
+    if not list_journal_segments(directory):
+        return 0
+
+    _ = _ensure_state_schema(str(db_path), busy_timeout=busy_timeout)
+    with connect(str(db_path), autocommit=True, busy_timeout=busy_timeout) as conn:
+        _ = conn.executescript(_JOURNAL_SCHEMA)
+        _ = conn.execute("BEGIN IMMEDIATE")
+        try:
+            applied = {
+                cast("str", row[0])
+                for row in conn.execute(_SQL_SELECT_APPLIED).fetchall()
+            }
+            readable = _read_journal_segments(directory, logger)
+            fresh = [segment for segment in readable if segment.name not in applied]
+            to_apply = sorted(
+                (entry for segment in fresh for entry in readable[segment]),
+                key=lambda entry: entry.seq,
+            )
+            for entry in to_apply:
+                _apply_journal_entry(conn, entry)
+            _ = conn.executemany(_SQL_INSERT_APPLIED, [(seg.name,) for seg in fresh])
+            _ = conn.execute("COMMIT")
+        except BaseException:
+            _ = conn.execute("ROLLBACK")
+            raise
+
+    # Segments are recorded as applied; remove them, then forget the names of
+    # those that are gone
+    removed: list[Path] = []
+    for segment in readable:
+        try:
+            segment.unlink(missing_ok=True)
+        except OSError:
+            continue
+        removed.append(segment)
+    if removed:
+        with connect(str(db_path), busy_timeout=busy_timeout) as conn:
+            _ = conn.executemany(
+                _SQL_DELETE_APPLIED, [(segment.name,) for segment in removed]
+            )
+
+    if logger:
+        logger.debug(
+            "state_journal_merged", segments=len(readable), entries=len(to_apply)
+        )
+    return len(to_apply)
 
 
 def create_state_store(
@@ -0,0 +1,352 @@
+# pyright: reportAny=false, reportMissingTypeStubs=false
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false
+# pyright: reportUnknownArgumentType=false
+"""Bulk export and import of state stores as JSONL or Parquet.
+
+Exports stream rows from a SQLite cursor in fixed-size batches, so memory use
+does not grow with the size of the store. Imports stream the file back in
+batches and load them with ``executemany`` inside a single transaction: either
+every row is written or none are.
+
+Values keep their exact SQLite storage class. Parquet files use one typed
+column per storage class; JSONL files store the storage class next to the
+value and encode BLOBs as base64. Timestamps and ``created_by`` /
+``updated_by`` are copied verbatim in both directions.
+
+Exported files do not record which scope they came from, so a session's
+state can be imported into another session or into the project store.
+"""
+
+import base64
+import binascii
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Literal, cast
+
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from oaps.utils._state_store import SQLiteStateStore, StateStoreValue, _typed_value
+from oaps.utils.database import connect
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+type TransferFormat = Literal["jsonl", "parquet"]
+type _Row = tuple[object, ...]
+
+# Rows per cursor fetch, Arrow record batch, and executemany call
+_BATCH_SIZE: Final = 5_000
+
+_VALUE_TYPES: Final = frozenset({"null", "integer", "real", "text", "blob"})
+
+# Parquet value columns in the order of the state_store typed columns
+_TYPED_COLUMNS: Final = ("int_value", "real_value", "text_value", "blob_value")
+
+_TRANSFER_SCHEMA: Final = pa.schema(
+    [
+        ("key", pa.string()),
+        ("value_type", pa.string()),
+        ("int_value", pa.int64()),
+        ("real_value", pa.float64()),
+        ("text_value", pa.string()),
+        ("blob_value", pa.binary()),
+        ("created_at", pa.string()),
+        ("created_by", pa.string()),
+        ("updated_at", pa.string()),
+        ("updated_by", pa.string()),
+    ]
+)
+
+_SQL_EXPORT = """
+SELECT key, typeof(value), value, created_at, created_by, updated_at, updated_by
+FROM state_store
+WHERE session_id = ?
+ORDER BY key
+"""
+
+_SQL_DELETE_SCOPE = "DELETE FROM state_store WHERE session_id = ?"
+
+# Imported rows replace existing ones wholesale so metadata round-trips exactly
+_SQL_IMPORT = """
+INSERT INTO state_store
+    (session_id, key, int_value, real_value, text_value, blob_value,
+     created_at, created_by, updated_at, updated_by)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (session_id, key) DO UPDATE SET
+    int_value = excluded.int_value,
+    real_value = excluded.real_value,
+    text_value = excluded.text_value,
+    blob_value = excluded.blob_value,
+    created_at = excluded.created_at,
+    created_by = excluded.created_by,
+    updated_at = excluded.updated_at,
+    updated_by = excluded.updated_by
+"""
+
+
+def infer_transfer_format(path: str | Path) -> TransferFormat:
+    """Infer the transfer format from a file extension.
+
+    Args:
+        path: Export or import file path.
+
+    Returns:
+        ``"parquet"`` for ``.parquet``/``.pq`` files, ``"jsonl"`` otherwise.
+    """
+    suffix = Path(path).suffix.lower()
+    return "parquet" if suffix in {".parquet", ".pq"} else "jsonl"
+
+
+def _scope(session_id: str | None) -> str:
+    """Map a store session ID to the value stored in the session_id column."""
+    return session_id if session_id is not None else ""
+
+
+def _iter_rows(
+    db_path: str | Path, session_id: str | None, batch_size: int
+) -> Iterator[list[_Row]]:
+    """Stream a store's rows in batches through a read-only connection."""
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    with closing(sqlite3.connect(uri, uri=True)) as conn:
+        cursor = conn.execute(_SQL_EXPORT, (_scope(session_id),))
+        while rows := cursor.fetchmany(batch_size):
+            yield cast("list[_Row]", rows)
+
+
+def _rows_to_batch(rows: list[_Row]) -> pa.RecordBatch:
+    """Convert SQLite rows to a record batch with one column per storage class."""
+    columns: dict[str, list[object]] = {name: [] for name in _TRANSFER_SCHEMA.names}
+    for key, value_type, value, created_at, created_by, updated_at, updated_by in rows:
+        columns["key"].append(key)
+        columns["value_type"].append(value_type)
+        columns["int_value"].append(value if value_type == "integer" else None)
+        columns["real_value"].append(value if value_type == "real" else None)
+        columns["text_value"].append(value if value_type == "text" else None)
+        columns["blob_value"].append(value if value_type == "blob" else None)
+        columns["created_at"].append(created_at)
+        columns["created_by"].append(created_by)
+        columns["updated_at"].append(updated_at)
+        columns["updated_by"].append(updated_by)
+    return pa.RecordBatch.from_arrays(
+        [pa.array(columns[field.name], type=field.type) for field in _TRANSFER_SCHEMA],
+        schema=_TRANSFER_SCHEMA,
+    )
+
+
+def _row_to_json(row: _Row) -> bytes:
+    """Encode a SQLite row as a JSONL line."""
+    key, value_type, value, created_at, created_by, updated_at, updated_by = row
+    if value_type == "blob":
+        value = base64.b64encode(cast("bytes", value)).decode("ascii")
+    return orjson.dumps(
+        {
+            "key": key,
+            "value_type": value_type,
+            "value": value,
+            "created_at": created_at,
+            "created_by": created_by,
+            "updated_at": updated_at,
+            "updated_by": updated_by,
+        },
+        option=orjson.OPT_APPEND_NEWLINE,
+    )
+
+
+def export_state(
+    db_path: str | Path,
+    output_path: str | Path,
+    *,
+    session_id: str | None = None,
+    format: TransferFormat | None = None,  # noqa: A002
+    batch_size: int = _BATCH_SIZE,
+) -> int:
+    """Export one state store to a JSONL or Parquet file.
+
+    Args:
+        db_path: Path to the state database.
+        output_path: Destination file. Overwritten if it exists.
+        session_id: Session to export, or None for the project store.
+        format: Output format. Inferred from ``output_path`` if None.
+        batch_size: Rows fetched and written per batch.
+
+    Returns:
+        Number of entries exported.
+    """
+    resolved = format or infer_transfer_format(output_path)
+    count = 0
+    if resolved == "parquet":
+        with pq.ParquetWriter(str(output_path), _TRANSFER_SCHEMA) as writer:
+            for rows in _iter_rows(db_path, session_id, batch_size):
+                writer.write_batch(_rows_to_batch(rows))
+                count += len(rows)
+        return count
+
+    with Path(output_path).open("wb") as f:
+        for rows in _iter_rows(db_path, session_id, batch_size):
+            f.writelines(_row_to_json(row) for row in rows)
+            count += len(rows)
+    return count
+
+
+def _decode_value(value_type: object, value: object, where: str) -> StateStoreValue:
+    """Validate a value against its storage class and decode BLOBs."""
+    match value_type:
+        case "null" if value is None:
+            return None
+        case "integer" if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        case "real" if isinstance(value, int | float) and not isinstance(value, bool):
+            return float(value)
+        case "text" if isinstance(value, str):
+            return value
+        case "blob" if isinstance(value, str):
+            try:
+                return base64.b64decode(value, validate=True)
+            except binascii.Error:
+                msg = f"{where}: blob value is not valid base64"
+                raise ValueError(msg) from None
+        case _:
+            msg = f"{where}: value does not match value_type {value_type!r}"
+            raise ValueError(msg)
+
+
+def _iter_jsonl_params(path: Path, scope: str, batch_size: int) -> Iterator[list[_Row]]:
+    """Stream executemany parameter batches from a JSONL export."""
+    batch: list[_Row] = []
+    with path.open("rb") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            where = f"{path}:{line_no}"
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                msg = f"{where}: invalid JSON: {e}"
+                raise ValueError(msg) from None
+            if not isinstance(record, dict):
+                msg = f"{where}: expected a JSON object"
+                raise ValueError(msg)  # noqa: TRY004 - malformed file, not a caller bug
+            entry = cast("dict[str, object]", record)
+            key = entry.get("key")
+            created_at = entry.get("created_at")
+            updated_at = entry.get("updated_at")
+            if not isinstance(key, str):
+                msg = f"{where}: missing or invalid 'key'"
+                raise ValueError(msg)  # noqa: TRY004
+            if not isinstance(created_at, str) or not isinstance(updated_at, str):
+                msg = f"{where}: missing 'created_at' or 'updated_at'"
+                raise ValueError(msg)  # noqa: TRY004
+            value = _decode_value(entry.get("value_type"), entry.get("value"), where)
+            batch.append(
+                (
+                    scope,
+                    key,
+                    *_typed_value(value),
+                    created_at,
+                    entry.get("created_by"),
+                    updated_at,
+                    entry.get("updated_by"),
+                )
+            )
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _iter_parquet_params(
+    path: Path, scope: str, batch_size: int
+) -> Iterator[list[_Row]]:
+    """Stream executemany parameter batches from a Parquet export."""
+    parquet = pq.ParquetFile(str(path))
+    missing = set(_TRANSFER_SCHEMA.names) - set(parquet.schema_arrow.names)
+    if missing:
+        msg = f"{path}: missing columns: {', '.join(sorted(missing))}"
+        raise ValueError(msg)
+
+    value_columns: dict[str, str | None] = {
+        "null": None,
+        "integer": "int_value",
+        "real": "real_value",
+        "text": "text_value",
+        "blob": "blob_value",
+    }
+    for record_batch in parquet.iter_batches(
+        batch_size=batch_size, columns=_TRANSFER_SCHEMA.names
+    ):
+        data = record_batch.to_pydict()
+        params: list[_Row] = []
+        for i, value_type in enumerate(data["value_type"]):
+            if value_type not in _VALUE_TYPES:
+                msg = f"{path}: unknown value_type {value_type!r}"
+                raise ValueError(msg)
+            column = value_columns[value_type]
+            params.append(
+                (
+                    scope,
+                    data["key"][i],
+                    *(
+                        data[name][i] if name == column else None
+                        for name in _TYPED_COLUMNS
+                    ),
+                    data["created_at"][i],
+                    data["created_by"][i],
+                    data["updated_at"][i],
+                    data["updated_by"][i],
+                )
+            )
+        yield params
+
+
+def import_state(  # noqa: PLR0913
+    db_path: str | Path,
+    input_path: str | Path,
+    *,
+    session_id: str | None = None,
+    format: TransferFormat | None = None,  # noqa: A002
+    replace: bool = False,
+    batch_size: int = _BATCH_SIZE,
+) -> int:
+    """Import a JSONL or Parquet export into one state store.
+
+    All rows are loaded in a single transaction. Existing entries with the
+    same key are overwritten, including their timestamps and authors.
+
+    Args:
+        db_path: Path to the state database. Created if it does not exist.
+        input_path: File written by ``export_state``.
+        session_id: Session to import into, or None for the project store.
+        format: Input format. Inferred from ``input_path`` if None.
+        replace: Delete all existing entries in the store before importing.
+        batch_size: Rows read and inserted per batch.
+
+    Returns:
+        Number of entries imported.
+
+    Raises:
+        ValueError: If the file is malformed. Nothing is written.
+    """
+    path = Path(input_path)
+    scope = _scope(session_id)
+    resolved = format or infer_transfer_format(path)
+    batches = (
+        _iter_parquet_params(path, scope, batch_size)
+        if resolved == "parquet"
+        else _iter_jsonl_params(path, scope, batch_size)
+    )
+
+    # Ensures the schema exists before the import transaction starts
+    _ = SQLiteStateStore(db_path, session_id=session_id)
+
+    count = 0
+    with connect(str(db_path)) as conn:
+        if replace:
+            _ = conn.execute(_SQL_DELETE_SCOPE, (scope,))
+        for params in batches:
+            _ = conn.executemany(_SQL_IMPORT, params)
+            count += len(params)
+    return count
@@ -0,0 +1,314 @@
+# pyright: reportAny=false, reportExplicitAny=false
+"""Content-hash-keyed cache of validation results.
+
+Validating a store re-reads and re-checks every file on each run, although
+few of them change between runs. A ValidationCache records the results of
+each validated subject (an artifact file, a spec directory) together with a
+digest of everything those results depend on: the content of the files
+checked, the validator version, and any other configuration such as the
+artifact type registry. A later run computes the digest again and reuses the
+stored results when it matches, so only changed subjects are re-validated.
+
+Checks that depend on other subjects, such as whether a referenced artifact
+exists, should not be cached; callers re-run them against current state, so
+cached results never go stale when a referenced target is added or removed.
+
+The database is a derived cache, kept in the git-ignored cache directory of
+the data directory being validated so it is never committed. Results are
+grouped by kind, so one database can serve several validators, and deleting
+it is always safe.
+
+Example:
+    >>> from oaps.utils._validation_cache import (
+    ...     ValidationCache,
+    ...     cache_digest,
+    ...     file_digest,
+    ... )
+    >>> cache = ValidationCache(Path(".cache/validation.db"))
+    >>> digest = cache_digest(1, file_digest(Path("spec/index.json")))
+    >>> cache.lookup("spec", {"0001-auth": digest})
+    {}
+    >>> cache.store("spec", {"0001-auth": (digest, {"errors": []})})
+"""
+
+import hashlib
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final, cast
+
+from oaps.utils.database import ensure_cache_schema, open_cache
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Iterable, Iterator, Mapping
+
+# Default database file name, placed in the cache directory of the directory
+# being validated
+VALIDATION_CACHE_NAME: Final = "validation.db"
+
+_SCHEMA_VERSION: Final = 1
+
+# Subjects looked up per query, below SQLite's bound parameter limit
+_LOOKUP_BATCH: Final = 500
+
+_SCHEMA: Final = """
+CREATE TABLE IF NOT EXISTS validation_results (
+    kind TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    results TEXT NOT NULL,
+    PRIMARY KEY (kind, subject)
+) WITHOUT ROWID
+"""
+
+_SQL_UPSERT: Final = """
+INSERT INTO validation_results (kind, subject, digest, results) VALUES (?, ?, ?, ?)
+ON CONFLICT (kind, subject) DO UPDATE
+SET digest = excluded.digest, results = excluded.results
+"""
+
+_SQL_LOOKUP: Final = (
+    "SELECT subject, digest, results FROM validation_results WHERE kind = ?"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationCacheStats:
+    """Cache effectiveness over the lookups made through one cache.
+
+    Attributes:
+        hits: Subjects whose stored results were reused.
+        misses: Subjects that were validated, because they had no stored
+            results, their digest changed, or the cache was bypassed.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def checked(self) -> int:
+        """Number of subjects looked up."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of subjects served from the cache."""
+        return self.hits / self.checked if self.checked else 0.0
+
+
+def cache_digest(*parts: object) -> str:
+    """Combine the inputs a subject's results depend on into one digest.
+
+    Args:
+        *parts: Inputs such as a validator version and file content digests,
+            in a fixed order. None stands for a missing file.
+
+    Returns:
+        Hex SHA-256 digest of the parts.
+    """
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(repr(part).encode())
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def file_digest(path: Path | str) -> str | None:
+    """Compute the SHA-256 digest of a file's content.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        Hex digest, or None if the file does not exist.
+
+    Raises:
+        OSError: If the file exists but cannot be read.
+    """
+    try:
+        with Path(path).open("rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class ValidationCache:
+    """Validation results keyed by subject and content digest.
+
+    Every call opens its own connection, so a cache can be shared between
+    processes. Lookup statistics are kept per instance.
+
+    Attributes:
+        _db_path: Path to the SQLite database.
+        _root: Directory that file subjects are recorded relative to.
+        _ready: Whether the schema has been checked by this instance.
+        _hits: Subjects served from the cache so far.
+        _misses: Subjects validated so far.
+    """
+
+    __slots__ = ("_db_path", "_hits", "_misses", "_ready", "_root")
+
+    def __init__(self, db_path: Path | str, *, root: Path | str | None = None) -> None:
+        """Initialize the cache. The database is created on first use.
+
+        Args:
+            db_path: Path to the SQLite database.
+            root: Directory that file subjects are recorded relative to
+                (defaults to the database's directory).
+        """
+        self._db_path = Path(db_path)
+        self._root = Path(root) if root is not None else self._db_path.parent
+        self._ready = False
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def db_path(self) -> Path:
+        """Path to the SQLite database."""
+        return self._db_path
+
+    @property
+    def root(self) -> Path:
+        """Directory that file subjects are recorded relative to."""
+        return self._root
+
+    @property
+    def stats(self) -> ValidationCacheStats:
+        """Hits and misses of this instance's lookups."""
+        return ValidationCacheStats(hits=self._hits, misses=self._misses)
+
+    def reset_stats(self) -> None:
+        """Zero the hit and miss counters."""
+        self._hits = 0
+        self._misses = 0
+
+    def record_misses(self, count: int) -> None:
+        """Count subjects validated without a lookup, e.g. with the cache off.
+
+        Args:
+            count: Number of subjects validated.
+        """
+        self._misses += count
+
+    # --- Connections ---
+
+    @contextmanager
+    def _open(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, creating the schema if needed."""
+        self._ensure_schema()
+        with open_cache(self._db_path) as conn:
+            yield conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection in a write transaction, rolling back on error."""
+        self._ensure_schema()
+        with open_cache(self._db_path, write=True) as conn:
+            yield conn
+
+    def _ensure_schema(self) -> None:
+        """Create the schema, discarding a cache written by another version."""
+        if not self._ready:
+            ensure_cache_schema(
+                self._db_path,
+                _SCHEMA_VERSION,
+                [_SCHEMA],
+                drop=["validation_results"],
+            )
+            self._ready = True
+
+    # --- Reads and writes ---
+
+    def lookup(self, kind: str, digests: Mapping[str, str]) -> dict[str, Any]:
+        """Get the stored results of subjects whose digest is unchanged.
+
+        Every subject counts as a hit or a miss in ``stats``.
+
+        Args:
+            kind: Validator the results belong to (e.g., "artifact").
+            digests: Dict mapping subjects to their current digest.
+
+        Returns:
+            Dict mapping each subject with matching stored results to those
+            results. Subjects that must be validated again are absent.
+        """
+        found: dict[str, Any] = {}
+        subjects = list(digests)
+        if not subjects:
+            return found
+        with self._open() as conn:
+            for start in range(0, len(subjects), _LOOKUP_BATCH):
+                batch = subjects[start : start + _LOOKUP_BATCH]
+                placeholders = ", ".join("?" * len(batch))
+                sql = f"{_SQL_LOOKUP} AND subject IN ({placeholders})"
+                rows = conn.execute(sql, (kind, *batch)).fetchall()
+                for subject, digest, results in rows:
+                    if digests[subject] == digest:
+                        found[cast("str", subject)] = json.loads(results)
+        self._hits += len(found)
+        self._misses += len(subjects) - len(found)
+        return found
+
+    def store(self, kind: str, entries: Mapping[str, tuple[str, Any]]) -> None:
+        """Record freshly computed results.
+
+        Args:
+            kind: Validator the results belong to.
+            entries: Dict mapping subjects to (digest, results), where
+                results is any JSON-serializable value.
+        """
+        if not entries:
+            return
+        rows = [
+            (kind, subject, digest, json.dumps(results, separators=(",", ":")))
+            for subject, (digest, results) in entries.items()
+        ]
+        with self._write() as conn:
+            _ = conn.executemany(_SQL_UPSERT, rows)
+
+    def retain(
+        self, kind: str, subjects: Iterable[str], *, within: str | None = None
+    ) -> int:
+        """Drop the stored results of subjects that no longer exist.
+
+        Args:
+            kind: Validator the results belong to.
+            subjects: Every subject that still exists.
+            within: Only drop subjects under this path prefix, for caches
+                shared by several stores.
+
+        Returns:
+            Number of subjects whose results were dropped.
+        """
+        if not self._db_path.exists():
+            return 0
+        keep = set(subjects)
+        prefix = within.rstrip("/") + "/" if within else ""
+        with self._write() as conn:
+            stale = [
+                (kind, subject)
+                for (subject,) in conn.execute(
+                    "SELECT subject FROM validation_results WHERE kind = ?", (kind,)
+                )
+                if subject not in keep and subject.startswith(prefix)
+            ]
+            _ = conn.executemany(
+                "DELETE FROM validation_results WHERE kind = ? AND subject = ?", stale
+            )
+        return len(stale)
+
+    def clear(self, kind: str | None = None) -> None:
+        """Drop stored results.
+
+        Args:
+            kind: Only drop results of this validator; None drops all.
+        """
+        with self._write() as conn:
+            if kind is None:
+                _ = conn.execute("DELETE FROM validation_results")
+            else:
+                _ = conn.execute(
+                    "DELETE FROM validation_results WHERE kind = ?", (kind,)
+                )
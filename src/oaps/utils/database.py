@@ -12,18 +12,26 @@ Note:
     Return values of 0 from ``insert`` and ``upsert`` indicate "no meaningful row
     id" (e.g., INSERT OR IGNORE that didn't insert, or tables without ROWID),
     not "row id is zero."
+
+``open_cache`` and ``ensure_cache_schema`` open and version the derived cache
+databases kept by stores (search indexes, validation results, ID counters).
 """
 
+import random
 import re
 import sqlite3
-from contextlib import contextmanager, suppress
+import time
+from contextlib import closing, contextmanager, suppress
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, cast
+from typing import TYPE_CHECKING, Final, Literal, cast
 
 from pydantic import BaseModel
 
+from oaps.utils._paths import ensure_parent_dir
+
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Sequence
 
 # Valid SQL identifier pattern (alphanumeric and underscores, not starting with digit)
 _IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
@@ -34,6 +42,10 @@ type SQLValue = str | int | float | bytes | None
 # SQLite transaction isolation levels
 type IsolationLevel = Literal["DEFERRED", "EXCLUSIVE", "IMMEDIATE"] | None
 
+# Seconds a cache connection waits for another writer before raising
+# OperationalError
+_CACHE_BUSY_TIMEOUT: Final = 10.0
+
 
 @contextmanager
 def connect(  # noqa: PLR0913
@@ -48,6 +60,7 @@ def connect(  # noqa: PLR0913
     uri: bool = False,
     autocommit: bool = False,
     wal_mode: bool = True,
+    busy_timeout: int = 10000,
 ) -> Iterator[sqlite3.Connection]:
     """Context manager for SQLite connections with automatic transaction handling.
 
@@ -66,6 +79,8 @@ def connect(  # noqa: PLR0913
         uri: If True, interpret path as a URI.
         autocommit: If True, disable implicit transaction management.
         wal_mode: If True, enable WAL journal mode for better concurrency.
+        busy_timeout: Milliseconds SQLite waits on a locked database before
+            raising ``sqlite3.OperationalError`` (only applied with ``wal_mode``).
 
     Yields:
         SQLite connection with row_factory set to sqlite3.Row.
@@ -105,7 +120,7 @@ def connect(  # noqa: PLR0913
         with suppress(sqlite3.OperationalError):
             _ = conn.execute("PRAGMA journal_mode=WAL")
         # Set busy timeout for handling concurrent access
-        _ = conn.execute("PRAGMA busy_timeout=10000")
+        _ = conn.execute(f"PRAGMA busy_timeout={int(busy_timeout)}")
 
     try:
         yield conn
@@ -118,6 +133,186 @@ def connect(  # noqa: PLR0913
         conn.close()
 
 
+@dataclass(frozen=True, slots=True)
+class BusyRetryPolicy:
+    """Bounded retry policy for writes against a contended database.
+
+    Instead of letting SQLite's busy handler block for a long ``busy_timeout``,
+    each attempt waits at most ``busy_timeout`` milliseconds for the write lock
+    and failed attempts back off with full jitter, so bursts of concurrent
+    writers spread out instead of retrying in lockstep.
+
+    The delay before retry ``n`` (0-indexed) is drawn uniformly from
+    ``[0, min(max_delay, base_delay * 2**n)]``.
+
+    Attributes:
+        attempts: Maximum number of attempts, including the first.
+        busy_timeout: Milliseconds SQLite waits for the lock on each attempt.
+        base_delay: Backoff ceiling in seconds for the first retry.
+        max_delay: Maximum backoff ceiling in seconds.
+    """
+
+    attempts: int = 10
+    busy_timeout: int = 200
+    base_delay: float = 0.005
+    max_delay: float = 0.25
+
+    def delay(self, attempt: int) -> float:
+        """Calculate the jittered delay before a retry.
+
+        Args:
+            attempt: The retry number (0-indexed, where 0 is the first retry).
+
+        Returns:
+            The delay in seconds.
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2**attempt))
+        return random.uniform(0.0, ceiling)  # noqa: S311
+
+
+def is_busy_error(error: BaseException) -> bool:
+    """Check whether an exception signals a locked or busy database.
+
+    Args:
+        error: The exception to inspect.
+
+    Returns:
+        True if the error is a ``sqlite3.OperationalError`` caused by lock
+        contention, False otherwise.
+    """
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+def retry_on_busy[T](
+    operation: Callable[[], T],
+    policy: BusyRetryPolicy,
+    *,
+    on_retry: Callable[[int, float], None] | None = None,
+) -> T:
+    """Run an operation, retrying with jittered backoff while the database is busy.
+
+    The operation should open its own connection (for example with
+    ``connect(path, busy_timeout=policy.busy_timeout)``) so that no lock is
+    held while sleeping between attempts.
+
+    Args:
+        operation: Callable performing one complete write transaction.
+        policy: Retry policy bounding attempts and delays.
+        on_retry: Optional callback invoked with the retry number and delay
+            before each sleep.
+
+    Returns:
+        The operation's return value.
+
+    Raises:
+        sqlite3.OperationalError: If the database is still busy after the last
+            attempt, or on any non-contention error.
+    """
+    for attempt in range(policy.attempts - 1):
+        try:
+            return operation()
+        except sqlite3.OperationalError as e:
+            if not is_busy_error(e):
+                raise
+            delay = policy.delay(attempt)
+            if on_retry is not None:
+                on_retry(attempt, delay)
+            time.sleep(delay)
+    return operation()
+
+
+@contextmanager
+def open_cache(path: Path, *, write: bool = False) -> Iterator[sqlite3.Connection]:
+    """Open a connection to a derived cache database.
+
+    Cache databases (search indexes, validation results, ID counters) are
+    used from several processes at once, so connections are in autocommit
+    mode and writes take the write lock up front. WAL mode is persistent and
+    set by ``ensure_cache_schema``, so opening a connection costs no pragmas.
+
+    Args:
+        path: Path to the database file.
+        write: If True, the block runs in a ``BEGIN IMMEDIATE`` transaction
+            that is committed on success and rolled back on any exception.
+
+    Yields:
+        SQLite connection with the default row factory.
+
+    Raises:
+        sqlite3.OperationalError: If the database cannot be opened, or stays
+            locked by another writer for longer than the busy timeout.
+    """
+    with closing(
+        sqlite3.connect(path, autocommit=True, timeout=_CACHE_BUSY_TIMEOUT)
+    ) as conn:
+        if not write:
+            yield conn
+            return
+        _ = conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            _ = conn.execute("ROLLBACK")
+            raise
+        _ = conn.execute("COMMIT")
+
+
+def ensure_cache_schema(
+    path: Path,
+    version: int,
+    statements: Iterable[str],
+    *,
+    drop: Iterable[str] = (),
+) -> None:
+    """Create the schema of a derived cache database if it is out of date.
+
+    The schema version is kept in ``PRAGMA user_version``. A database with
+    another version is rebuilt empty: the ``drop`` tables are dropped and the
+    ``statements`` run, under the write lock and only if no other process
+    did so in the meantime. A file that is not a database, e.g. one
+    truncated by a crash, is deleted, since the cache can always be rebuilt.
+
+    The parent directory is created if needed (see ``ensure_parent_dir``).
+
+    Args:
+        path: Path to the database file.
+        version: Current schema version; must not be 0.
+        statements: DDL statements creating the schema.
+        drop: Tables of older schema versions to drop first.
+
+    Raises:
+        sqlite3.OperationalError: If the database cannot be created.
+    """
+    _ = ensure_parent_dir(path)
+    try:
+        with open_cache(path) as conn:
+            (current,) = conn.execute("PRAGMA user_version").fetchone()
+    except sqlite3.DatabaseError:
+        path.unlink(missing_ok=True)
+        current = 0
+    if current == version:
+        return
+    with open_cache(path) as conn:
+        with suppress(sqlite3.OperationalError):
+            _ = conn.execute("PRAGMA journal_mode=WAL")
+        _ = conn.execute("BEGIN IMMEDIATE")
+        try:
+            (current,) = conn.execute("PRAGMA user_version").fetchone()
+            if current != version:
+                for table in drop:
+                    _ = conn.execute(f"DROP TABLE IF EXISTS {safe_identifier(table)}")
+                for statement in statements:
+                    _ = conn.execute(statement)
+                _ = conn.execute(f"PRAGMA user_version = {int(version)}")
+        except BaseException:
+            _ = conn.execute("ROLLBACK")
+            raise
+        _ = conn.execute("COMMIT")
+
+
 def create_database(path: str | Path, schema: str | None = None) -> None:
     """Create an empty SQLite database, optionally with a schema.
 
@@ -0,0 +1,160 @@
+"""Benchmark the JSON and SQLite artifact index backends.
+
+``ArtifactIndex`` answers queries by scanning every summary in memory;
+``SQLiteArtifactIndex`` answers them with indexed queries against its cache
+database. Each backend is opened on the same artifacts.json snapshot of
+``size`` artifacts, spread over ``PREFIXES`` types, ``AUTHORS`` authors,
+``TAGS`` tags, and one creation date per artifact.
+
+Queries, each run ``QUERIES`` times with varying arguments:
+1. Status: ``filter(status_filter=..., author_filter=...)``
+2. Tag: ``filter(tag_filter=...)``
+3. Date range: ``filter(created_after=..., created_before=...)`` for one day
+4. Page: ``get_by_type(prefix, sort_by="created", limit=20, offset=...)``
+5. Next number: ``get_next_number(prefix)``
+6. References: ``get_references_to(id)``
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from oaps.artifacts._index import ArtifactIndex, write_index_snapshot
+from oaps.artifacts._sqlite_index import SQLiteArtifactIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+SIZES = [1_000, 10_000, 100_000]
+PREFIXES = ("DC", "RV", "AN", "EX", "DG")
+AUTHORS = 50
+TAGS = 200
+QUERIES = 50
+STATUSES = ("draft", "complete", "superseded", "retracted")
+EPOCH = datetime(2020, 1, 1, tzinfo=UTC)
+
+type Index = ArtifactIndex | SQLiteArtifactIndex
+
+
+def _summary(n: int) -> dict[str, object]:
+    prefix = PREFIXES[n % len(PREFIXES)]
+    artifact_id = f"{prefix}-{n // len(PREFIXES) + 1:06d}"
+    return {
+        "id": artifact_id,
+        "type": prefix.lower(),
+        "title": f"Artifact {n}",
+        "status": STATUSES[n % len(STATUSES)],
+        "created": (EPOCH + timedelta(hours=n)).isoformat(),
+        "author": f"author-{n % AUTHORS}",
+        "file_path": f"artifacts/{artifact_id}.md",
+        "tags": [f"tag-{n % TAGS}", f"tag-{(n * 7) % TAGS}"],
+        "references": [f"{PREFIXES[0]}-{n % 100 + 1:06d}"],
+    }
+
+
+@pytest.fixture(scope="module", params=SIZES)
+def snapshot(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Path, int]:
+    size: int = request.param
+    index_path = tmp_path_factory.mktemp(f"index-{size}") / "artifacts.json"
+    write_index_snapshot(index_path, [_summary(n) for n in range(size)])
+    # Build the SQLite cache outside the timed section
+    _ = SQLiteArtifactIndex(index_path)
+    return index_path, size
+
+
+def _status(index: Index, _size: int) -> None:
+    for i in range(QUERIES):
+        _ = index.filter(
+            status_filter=STATUSES[i % len(STATUSES)],
+            author_filter=f"author-{i % AUTHORS}",
+        )
+
+
+def _tag(index: Index, _size: int) -> None:
+    for i in range(QUERIES):
+        _ = index.filter(tag_filter=f"tag-{i % TAGS}")
+
+
+def _date_range(index: Index, size: int) -> None:
+    for i in range(QUERIES):
+        start = EPOCH + timedelta(hours=(i * 997) % size)
+        _ = index.filter(created_after=start, created_before=start + timedelta(days=1))
+
+
+def _page(index: Index, size: int) -> None:
+    per_type = size // len(PREFIXES)
+    for i in range(QUERIES):
+        _ = index.get_by_type(
+            PREFIXES[i % len(PREFIXES)],
+            sort_by="created",
+            limit=20,
+            offset=(i * 20) % per_type,
+        )
+
+
+def _next_number(index: Index, _size: int) -> None:
+    for i in range(QUERIES):
+        _ = index.get_next_number(PREFIXES[i % len(PREFIXES)])
+
+
+def _references(index: Index, _size: int) -> None:
+    for i in range(QUERIES):
+        _ = index.get_references_to(f"{PREFIXES[0]}-{i % 100 + 1:06d}")
+
+
+QUERY_FUNCTIONS: dict[str, Callable[[Index, int], None]] = {
+    "status": _status,
+    "tag": _tag,
+    "date_range": _date_range,
+    "page": _page,
+    "next_number": _next_number,
+    "references": _references,
+}
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+@pytest.mark.parametrize("query", list(QUERY_FUNCTIONS))
+def test_index_query(
+    benchmark: BenchmarkFixture, snapshot: tuple[Path, int], query: str, backend: str
+) -> None:
+    """``QUERIES`` runs of one query against one backend."""
+    index_path, size = snapshot
+    index: Index = (
+        SQLiteArtifactIndex(index_path)
+        if backend == "sqlite"
+        else ArtifactIndex(index_path)
+    )
+    run = QUERY_FUNCTIONS[query]
+
+    benchmark.pedantic(run, args=(index, size), rounds=3, iterations=1)
+
+    benchmark.extra_info["backend"] = backend
+    benchmark.extra_info["size"] = size
+    benchmark.extra_info["queries"] = QUERIES
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_index_open(
+    benchmark: BenchmarkFixture, snapshot: tuple[Path, int], backend: str
+) -> None:
+    """Open an index whose SQLite cache is already up to date."""
+    index_path, size = snapshot
+
+    def run() -> None:
+        if backend == "sqlite":
+            _ = SQLiteArtifactIndex(index_path)
+        else:
+            _ = ArtifactIndex(index_path)
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+
+    benchmark.extra_info["backend"] = backend
+    benchmark.extra_info["size"] = size
@@ -0,0 +1,91 @@
+"""Benchmark incremental artifact index updates.
+
+Before the index journal, every add, update, or delete rewrote the whole
+artifacts.json snapshot, so n changes to an index of n artifacts cost O(n^2).
+``ArtifactIndex.put`` now appends one journal line per change and compacts the
+journal into a snapshot once it reaches the snapshot's size.
+
+Scenarios, each starting from a snapshot of ``size`` artifacts:
+1. Journal: ``size`` puts through ``ArtifactIndex.put`` (amortized O(1) each)
+2. Rewrite: ``REWRITES`` puts that each rewrite the full snapshot, the old
+   ``ArtifactStore`` behavior, for comparison
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from oaps.artifacts._index import (
+    ArtifactIndex,
+    get_index_journal_path,
+    write_index_snapshot,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+SIZES = [1_000, 10_000]
+REWRITES = 100
+
+
+def _summary(number: int) -> dict[str, object]:
+    return {
+        "id": f"DC-{number:06d}",
+        "type": "decision",
+        "title": f"Decision {number}",
+        "status": "draft",
+        "created": "2025-01-01T00:00:00+00:00",
+        "author": "bench",
+        "file_path": f"decisions/DC-{number:06d}.md",
+        "tags": ["bench"],
+        "references": [f"DC-{number - 1:06d}"] if number else [],
+    }
+
+
+def _snapshot(tmp_path: Path, size: int) -> Path:
+    index_path = tmp_path / "artifacts.json"
+    write_index_snapshot(index_path, [_summary(n) for n in range(size)])
+    get_index_journal_path(index_path).unlink(missing_ok=True)
+    return index_path
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_journaled_puts(benchmark: BenchmarkFixture, tmp_path: Path, size: int) -> None:
+    """``size`` journaled puts into an index of ``size`` artifacts."""
+    index_path = _snapshot(tmp_path, size)
+
+    def setup() -> tuple[tuple[ArtifactIndex], dict[str, object]]:
+        _ = _snapshot(tmp_path, size)
+        return (ArtifactIndex(index_path),), {}
+
+    def run(index: ArtifactIndex) -> None:
+        for n in range(size, 2 * size):
+            index.put(_summary(n))
+
+    benchmark.pedantic(run, setup=setup, rounds=3, iterations=1)
+
+    benchmark.extra_info["size"] = size
+    benchmark.extra_info["changes"] = size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_snapshot_rewrites(
+    benchmark: BenchmarkFixture, tmp_path: Path, size: int
+) -> None:
+    """``REWRITES`` puts that each rewrite the full snapshot."""
+    index_path = _snapshot(tmp_path, size)
+    artifacts = [_summary(n) for n in range(size)]
+
+    def run() -> None:
+        for n in range(size, size + REWRITES):
+            artifacts.append(_summary(n))
+            write_index_snapshot(index_path, artifacts)
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+
+    benchmark.extra_info["size"] = size
+    benchmark.extra_info["changes"] = REWRITES
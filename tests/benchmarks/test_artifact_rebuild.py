@@ -0,0 +1,111 @@
+"""Benchmark incremental and parallel artifact index rebuilds.
+
+``ArtifactStore.rebuild_index`` used to read and parse every artifact file on
+every call. It now keeps a manifest of each file's stat fingerprint and hash
+and only parses files whose content changed, spreading large batches of
+parses over a process pool.
+
+Scenarios, each against a store of ``size`` markdown artifacts:
+1. Cold: no manifest, parsed in-process (``workers=1``) or in a pool
+2. Warm: nothing changed since the last rebuild
+3. One changed: a single artifact edited since the last rebuild
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from oaps.artifacts._rebuild import get_index_manifest_path
+from oaps.artifacts._store import ArtifactStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+SIZES = [1_000, 5_000]
+
+_BODY = "Context paragraph for the decision.\n" * 40
+_OLD_MTIME_NS = 1_000_000_000_000_000_000
+
+
+def _populate(tmp_path: Path, size: int) -> ArtifactStore:
+    store = ArtifactStore(tmp_path, auto_index=False)
+    store.initialize()
+    for n in range(1, size + 1):
+        path = store.artifacts_path / f"20250101000000-DC-{n:04d}-decision-{n}.md"
+        _ = path.write_text(
+            f"---\nid: DC-{n:04d}\ntype: decision\ntitle: Decision {n}\n"
+            "status: draft\ncreated: 2025-01-01T00:00:00+00:00\nauthor: bench\n"
+            f"tags: [bench]\nreferences: [DC-{max(n - 1, 1):04d}]\n---\n\n{_BODY}"
+        )
+        os.utime(path, ns=(_OLD_MTIME_NS, _OLD_MTIME_NS))
+    return store
+
+
+@pytest.mark.parametrize("workers", [1, None])
+@pytest.mark.parametrize("size", SIZES)
+def test_cold_rebuild(
+    benchmark: BenchmarkFixture, tmp_path: Path, size: int, workers: int | None
+) -> None:
+    """Full rebuild without a manifest."""
+    store = _populate(tmp_path, size)
+    manifest_path = get_index_manifest_path(store.index_path)
+
+    def setup() -> tuple[tuple[()], dict[str, object]]:
+        manifest_path.unlink(missing_ok=True)
+        store.index_path.unlink(missing_ok=True)
+        return (), {}
+
+    def run() -> None:
+        stats = store.rebuild_index(workers=workers)
+        assert stats.parsed == size
+
+    benchmark.pedantic(run, setup=setup, rounds=3, iterations=1)
+
+    benchmark.extra_info["size"] = size
+    benchmark.extra_info["workers"] = workers or os.process_cpu_count()
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_warm_rebuild(benchmark: BenchmarkFixture, tmp_path: Path, size: int) -> None:
+    """Rebuild with nothing changed since the last one."""
+    store = _populate(tmp_path, size)
+    _ = store.rebuild_index()
+
+    def run() -> None:
+        stats = store.rebuild_index()
+        assert stats.parsed == 0
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+
+    benchmark.extra_info["size"] = size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_one_changed_rebuild(
+    benchmark: BenchmarkFixture, tmp_path: Path, size: int
+) -> None:
+    """Rebuild after one artifact's title was edited."""
+    store = _populate(tmp_path, size)
+    _ = store.rebuild_index()
+    path = next(store.artifacts_path.glob("*-DC-0001-*.md"))
+    original = path.read_text()
+    edits = iter(range(1, 1_000_000))
+
+    def setup() -> tuple[tuple[()], dict[str, object]]:
+        edit = next(edits)
+        _ = path.write_text(original.replace("Decision 1\n", f"Edit {edit}\n"))
+        os.utime(path, ns=(_OLD_MTIME_NS + edit, _OLD_MTIME_NS + edit))
+        return (), {}
+
+    def run() -> None:
+        stats = store.rebuild_index()
+        assert stats.parsed == 1
+
+    benchmark.pedantic(run, setup=setup, rounds=5, iterations=1)
+
+    benchmark.extra_info["size"] = size
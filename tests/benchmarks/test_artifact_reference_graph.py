@@ -0,0 +1,96 @@
+"""Benchmark transitive reference queries over the artifact index.
+
+``ArtifactIndex.get_references_to`` only answers "who references X"
+directly, so finding everything affected by a change meant one call per
+artifact reached. ``ArtifactIndex.reference_graph`` answers it with one
+rustworkx traversal.
+
+Scenarios, each against ``size`` artifacts where every artifact references
+the one before it and one in ten also references a missing artifact:
+1. Lookups: transitive dependents of the first artifact via repeated
+   ``get_references_to`` calls, the old approach
+2. Graph: the same query through the cached reference graph
+3. Build: build the graph from loaded summaries
+4. Integrity: dangling references and cycles in one pass each
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from oaps.artifacts._graph import ArtifactGraph
+from oaps.artifacts._index import ArtifactIndex
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+SIZES = [1_000, 10_000]
+
+
+def _summary(number: int) -> dict[str, object]:
+    references = [f"DC-{number - 1:06d}"] if number else []
+    if number % 10 == 0:
+        references.append(f"XX-{number:06d}")
+    return {"id": f"DC-{number:06d}", "type": "decision", "references": references}
+
+
+def _index(size: int) -> ArtifactIndex:
+    return ArtifactIndex.from_artifacts([_summary(n) for n in range(size)])
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_lookups(benchmark: BenchmarkFixture, size: int) -> None:
+    """Transitive dependents by walking ``get_references_to``."""
+    index = _index(size)
+
+    def run() -> None:
+        seen: set[str] = set()
+        pending = ["DC-000000"]
+        while pending:
+            for ref in index.get_references_to(pending.pop()):
+                if ref not in seen:
+                    seen.add(ref)
+                    pending.append(ref)
+        assert len(seen) == size - 1
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    benchmark.extra_info["size"] = size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_graph(benchmark: BenchmarkFixture, size: int) -> None:
+    """Transitive dependents through the cached graph."""
+    graph = _index(size).reference_graph()
+
+    def run() -> None:
+        assert len(graph.dependents("DC-000000")) == size - 1
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    benchmark.extra_info["size"] = size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_build(benchmark: BenchmarkFixture, size: int) -> None:
+    """Build the graph from summaries held in memory."""
+    summaries = [_summary(n) for n in range(size)]
+
+    def run() -> None:
+        assert ArtifactGraph(summaries).count == size
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["size"] = size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_integrity(benchmark: BenchmarkFixture, size: int) -> None:
+    """Dangling references and cycles across the whole index."""
+    graph = _index(size).reference_graph()
+
+    def run() -> None:
+        assert len(graph.dangling_references()) == size // 10
+        assert graph.cycles() == []
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    benchmark.extra_info["size"] = size
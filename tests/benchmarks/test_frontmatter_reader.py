@@ -0,0 +1,110 @@
+"""Benchmark frontmatter reading for documents with large bodies.
+
+Artifact, idea, and spec readers used to read each markdown file in full,
+split it on ``---``, and parse the header with the pure-Python
+``yaml.safe_load``. The shared reader in ``oaps.utils._frontmatter`` streams
+only up to the closing delimiter, parses with libyaml's ``CSafeLoader`` when
+available, and caches parsed headers of unchanged files.
+
+Readers, each reading ``FILES`` documents whose bodies are ``body_size`` bytes:
+1. Full: read the whole file, split, ``yaml.safe_load`` (old behavior)
+2. Streamed: ``read_frontmatter_block`` plus ``load_yaml``, no cache
+3. Cached: ``read_frontmatter`` on files already in the header cache
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+import yaml
+
+from oaps.utils._frontmatter import (
+    clear_frontmatter_cache,
+    load_yaml,
+    read_frontmatter,
+    read_frontmatter_block,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+FILES = 20
+BODY_SIZES = [10_000, 1_000_000, 8_000_000]
+
+_HEADER = """---
+id: DC-0001
+type: decision
+title: Adopt a shared frontmatter reader
+status: complete
+created: 2025-01-01T00:00:00+00:00
+author: bench
+tags: [performance, io, yaml]
+references: [DC-0000, RV-0003]
+summary: Read only the header block of markdown artifacts.
+---
+"""
+_OLD_MTIME_NS = 1_000_000_000_000_000_000
+
+
+def _full(path: Path) -> object:
+    content = path.read_text(encoding="utf-8")
+    end = content.find("---", 3)
+    return yaml.safe_load(content[3:end])
+
+
+def _streamed(path: Path) -> object:
+    block = read_frontmatter_block(path)
+    assert block is not None
+    return load_yaml(block[0])
+
+
+def _cached(path: Path) -> object:
+    return read_frontmatter(path)[1]
+
+
+READERS: dict[str, Callable[[Path], object]] = {
+    "full": _full,
+    "streamed": _streamed,
+    "cached": _cached,
+}
+
+
+def _documents(tmp_path: Path, body_size: int) -> list[Path]:
+    line = "Body text for a large artifact document.\n"
+    body = line * (body_size // len(line))
+    paths: list[Path] = []
+    for n in range(FILES):
+        path = tmp_path / f"doc-{n}.md"
+        _ = path.write_text(_HEADER + body, encoding="utf-8")
+        os.utime(path, ns=(_OLD_MTIME_NS, _OLD_MTIME_NS))
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("body_size", BODY_SIZES)
+@pytest.mark.parametrize("reader", list(READERS))
+def test_read_frontmatter(
+    benchmark: BenchmarkFixture, tmp_path: Path, reader: str, body_size: int
+) -> None:
+    """Read the frontmatter of ``FILES`` documents."""
+    paths = _documents(tmp_path, body_size)
+    read = READERS[reader]
+    clear_frontmatter_cache()
+    for path in paths:
+        _ = _cached(path)
+
+    def run() -> None:
+        for path in paths:
+            data = read(path)
+            assert isinstance(data, dict)
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+
+    benchmark.extra_info["files"] = FILES
+    benchmark.extra_info["body_size"] = body_size
+    benchmark.extra_info["libyaml"] = yaml.__with_libyaml__
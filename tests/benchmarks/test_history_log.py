@@ -0,0 +1,77 @@
+"""Benchmark history queries against long spec histories.
+
+``HistoryManager.get`` reads the history log newest-first through
+``HistoryLog`` and stops once ``limit`` entries matched, so the latest
+entries cost the same regardless of how long the history is. Histories of
+``size`` entries are written through ``HistoryLog.append``, so older
+entries are sealed into segments.
+
+Scenarios, each against ``size`` entries:
+1. Latest: the 50 newest entries
+2. Until: the 50 newest entries before the middle of the history
+3. Full scan: every entry, for comparison
+"""
+
+from __future__ import annotations
+
+import itertools
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from oaps.spec._history_log import HistoryLog
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+SIZES = [10_000, 200_000]
+BATCH = 1_000
+EPOCH = datetime(2020, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture(params=SIZES)
+def log(request: pytest.FixtureRequest, tmp_path: Path) -> HistoryLog:
+    size: int = request.param
+    log = HistoryLog(tmp_path / "history.jsonl")
+    for start in range(0, size, BATCH):
+        log.append(
+            {
+                "timestamp": (EPOCH + timedelta(seconds=n)).isoformat(),
+                "event": "requirement_updated",
+                "actor": "benchmark",
+                "id": f"FR-{n % 1000:04d}",
+                "from_value": "proposed",
+                "to_value": "implemented",
+            }
+            for n in range(start, start + BATCH)
+        )
+    return log
+
+
+def test_latest(benchmark: BenchmarkFixture, log: HistoryLog) -> None:
+    """The 50 newest entries."""
+
+    def run() -> None:
+        assert len(list(itertools.islice(log.newest_first(), 50))) == 50
+
+    benchmark.pedantic(run, rounds=20, iterations=1)
+    benchmark.extra_info["segments"] = len(log.segments())
+
+
+def test_until(benchmark: BenchmarkFixture, log: HistoryLog) -> None:
+    """The 50 newest entries before the middle of the history."""
+    entries = sum(1 for _ in log.newest_first())
+    until = EPOCH + timedelta(seconds=entries // 2)
+
+    def run() -> None:
+        assert len(list(itertools.islice(log.newest_first(until=until), 50))) == 50
+
+    benchmark.pedantic(run, rounds=20, iterations=1)
+
+
+def test_full_scan(benchmark: BenchmarkFixture, log: HistoryLog) -> None:
+    """Every entry, oldest first."""
+    benchmark.pedantic(log.entries, rounds=3, iterations=1)
@@ -0,0 +1,132 @@
+"""Benchmark full-text search against scanning every document.
+
+``IdeaManager.search`` used to read every idea body from disk whenever the
+query did not match an idea's title or tags. Searches now go through a SQLite
+FTS5 index that is synced by file size and modification time before each
+query.
+
+Scenarios, each against ``size`` markdown documents of ~2 KB:
+1. Scan: read every file and substring-match its text (the old path)
+2. Build: index every document into an empty database
+3. Search: sync an unchanged tree, then run a ranked query
+4. Query: run a ranked query against an up-to-date index
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from oaps.search import SearchDocument, SearchIndex
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+SIZES = [1_000, 5_000]
+
+QUERY = "replication"
+
+_WORDS = [
+    "cache",
+    "queue",
+    "index",
+    "latency",
+    "throughput",
+    "schema",
+    "storage",
+    "shard",
+    "replica",
+    "session",
+    "token",
+    "budget",
+    "planner",
+]
+_OLD_MTIME_NS = 1_000_000_000_000_000_000
+
+
+def _populate(tmp_path: Path, size: int) -> list[Path]:
+    docs_dir = tmp_path / "ideas"
+    docs_dir.mkdir()
+    paths: list[Path] = []
+    for n in range(size):
+        words = " ".join(_WORDS[(n + i) % len(_WORDS)] for i in range(300))
+        # One document in fifty mentions the query term
+        extra = " replication lag" if n % 50 == 0 else ""
+        path = docs_dir / f"idea-{n:05d}.md"
+        _ = path.write_text(
+            f"---\nid: idea-{n:05d}\ntitle: Idea {n}\ntags: [bench]\n---\n\n"
+            f"{words}{extra}\n",
+            encoding="utf-8",
+        )
+        os.utime(path, ns=(_OLD_MTIME_NS, _OLD_MTIME_NS))
+        paths.append(path)
+    return paths
+
+
+def _extract(path: Path) -> list[SearchDocument]:
+    _, header, body = path.read_text(encoding="utf-8").split("---\n", 2)
+    title = header.split("title: ", 1)[1].split("\n", 1)[0]
+    return [SearchDocument("idea", path.stem, title, body, tags=("bench",))]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_scan(benchmark: BenchmarkFixture, tmp_path: Path, size: int) -> None:
+    """Substring match against every file's text."""
+    paths = _populate(tmp_path, size)
+
+    def run() -> None:
+        matches = [p for p in paths if QUERY in p.read_text(encoding="utf-8").lower()]
+        assert len(matches) == size // 50
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    benchmark.extra_info["size"] = size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_build(benchmark: BenchmarkFixture, tmp_path: Path, size: int) -> None:
+    """Index every document into an empty database."""
+    paths = _populate(tmp_path, size)
+    index = SearchIndex(tmp_path / "search.db")
+
+    def setup() -> tuple[tuple[()], dict[str, object]]:
+        index.clear()
+        return (), {}
+
+    def run() -> None:
+        assert index.sync(paths, _extract) == size
+
+    benchmark.pedantic(run, setup=setup, rounds=3, iterations=1)
+    benchmark.extra_info["size"] = size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_search(benchmark: BenchmarkFixture, tmp_path: Path, size: int) -> None:
+    """Sync an unchanged tree, then query it, as IdeaManager.search does."""
+    paths = _populate(tmp_path, size)
+    index = SearchIndex(tmp_path / "search.db")
+    _ = index.sync(paths, _extract)
+
+    def run() -> None:
+        assert index.sync(paths, _extract) == 0
+        assert len(index.search(QUERY, limit=None)) == size // 50
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    benchmark.extra_info["size"] = size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_query(benchmark: BenchmarkFixture, tmp_path: Path, size: int) -> None:
+    """Ranked query against an up-to-date index."""
+    paths = _populate(tmp_path, size)
+    index = SearchIndex(tmp_path / "search.db")
+    _ = index.sync(paths, _extract)
+
+    def run() -> None:
+        assert len(index.search(QUERY, limit=20)) == 20
+
+    benchmark.pedantic(run, rounds=20, iterations=1)
+    benchmark.extra_info["size"] = size
@@ -0,0 +1,163 @@
+"""Benchmark graph queries over a synthetic specification corpus.
+
+``QueryManager`` answers graph queries from a rustworkx ``SpecGraph`` that
+is built once per spec manager revision. The corpus has ``size`` specs in
+layers of ``LAYER`` specs; each spec depends on ``FAN_OUT`` specs of the
+layer before it.
+
+Scenarios, each against ``size`` specs:
+1. Build: build the dependency graph from spec summaries
+2. Dependency graph: ``QueryManager.dependency_graph()`` with a cached graph
+3. Paths: shortest dependency path across every layer, and the strongly
+   connected components
+4. Critical path: longest chain by requirement count
+5. Impact: transitive dependents of a spec in the first layer
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from oaps.spec import (
+    QueryManager,
+    Relationships,
+    RelationshipType,
+    SpecGraph,
+    SpecStatus,
+    SpecSummary,
+    SpecType,
+)
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+SIZES = [5_000]
+LAYER = 100
+FAN_OUT = 3
+EPOCH = datetime(2020, 1, 1, tzinfo=UTC)
+
+
+def _spec_id(number: int) -> str:
+    return f"{number:04d}"
+
+
+def _summary(number: int) -> SpecSummary:
+    layer_start = (number // LAYER - 1) * LAYER
+    depends_on = (
+        tuple(_spec_id(layer_start + (number + k) % LAYER) for k in range(FAN_OUT))
+        if layer_start >= 0
+        else ()
+    )
+    return SpecSummary(
+        id=_spec_id(number),
+        slug=f"spec-{number}",
+        title=f"Spec {number}",
+        spec_type=SpecType.FEATURE,
+        status=SpecStatus.DRAFT,
+        created=EPOCH,
+        updated=EPOCH,
+        depends_on=depends_on,
+    )
+
+
+def _query_manager(size: int) -> QueryManager:
+    specs = [_summary(n) for n in range(size)]
+    relationships = {
+        spec.id: Relationships(
+            depends_on=spec.depends_on, extends=None, supersedes=None, integrates=()
+        )
+        for spec in specs
+    }
+    spec_manager = MagicMock()
+    spec_manager.revision = 1
+    spec_manager.list_specs.return_value = specs
+    spec_manager.get_spec.side_effect = lambda spec_id: MagicMock(
+        relationships=relationships[spec_id]
+    )
+    requirement_manager = MagicMock()
+    requirement_manager.list_requirements.side_effect = lambda spec_id: (
+        [None] * (int(spec_id) % 7)
+    )
+    return QueryManager(spec_manager, requirement_manager, MagicMock())
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_build(benchmark: BenchmarkFixture, size: int) -> None:
+    """Build the dependency graph from summaries held in memory."""
+    specs = [_summary(n) for n in range(size)]
+
+    def run() -> None:
+        graph = SpecGraph(
+            (spec.id for spec in specs),
+            (
+                (spec.id, dep_id, RelationshipType.DEPENDS_ON)
+                for spec in specs
+                for dep_id in spec.depends_on
+            ),
+        )
+        assert graph.count == size
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    benchmark.extra_info["size"] = size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_dependency_graph(benchmark: BenchmarkFixture, size: int) -> None:
+    """Full dependency graph report from the cached graph."""
+    query_manager = _query_manager(size)
+    _ = query_manager.dependency_graph()
+
+    def run() -> None:
+        result = query_manager.dependency_graph()
+        assert len(result.topological_order) == size
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    benchmark.extra_info["size"] = size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_paths(benchmark: BenchmarkFixture, size: int) -> None:
+    """Shortest path through every layer and strongly connected components."""
+    query_manager = _query_manager(size)
+    last = _spec_id(size - 1)
+
+    def run() -> None:
+        path = query_manager.dependency_path(last, _spec_id(0))
+        assert len(path) == size // LAYER
+        assert query_manager.dependency_cycles() == ()
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    benchmark.extra_info["size"] = size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_critical_path(benchmark: BenchmarkFixture, size: int) -> None:
+    """Longest dependency chain by requirement count."""
+    query_manager = _query_manager(size)
+
+    def run() -> None:
+        result = query_manager.critical_path()
+        assert len(result.spec_ids) == size // LAYER
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["size"] = size
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_impact(benchmark: BenchmarkFixture, size: int) -> None:
+    """Transitive dependents of a spec in the first layer."""
+    query_manager = _query_manager(size)
+    _ = query_manager.impact(_spec_id(0))
+
+    def run() -> None:
+        impacted = query_manager.impact(
+            _spec_id(0), relationship_types=(RelationshipType.DEPENDS_ON,)
+        )
+        assert len(impacted) > LAYER
+
+    benchmark.pedantic(run, rounds=5, iterations=1)
+    benchmark.extra_info["size"] = size
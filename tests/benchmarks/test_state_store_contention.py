@@ -0,0 +1,140 @@
+"""Benchmark state store writes under multi-process lock contention.
+
+Simulates a burst of hook processes all writing counters to the unified state
+database at once, and reports the distribution of per-write latency (which is
+dominated by time spent waiting for the SQLite write lock).
+
+Scenarios:
+1. Default store: SQLite's busy handler with the standard 10s busy timeout
+2. Bounded retry: short per-attempt busy timeout with jittered backoff
+3. Bounded retry + journal: writes that exhaust the retry budget are journaled
+   and merged afterwards
+
+Each scenario stores p50/p95/p99/max latency and the number of journaled and
+failed writes in ``benchmark.extra_info``, and checks that every increment
+that did not fail reached the database.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import sqlite3
+import statistics
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from oaps.utils import StateJournal, get_state_journal_dir, merge_state_journal
+from oaps.utils._state_store import SQLiteStateStore
+from oaps.utils.database import BusyRetryPolicy
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+PROCESSES = 8
+WRITES_PER_PROCESS = 100
+KEYS = ("oaps.tools.total_count", "oaps.tools.Bash.count", "oaps.prompts.count")
+
+# Scenario name -> (retry policy, use journal). The journal scenario uses a
+# tight retry budget so writes are actually deferred under load.
+SCENARIOS: dict[str, tuple[BusyRetryPolicy | None, bool]] = {
+    "default": (None, False),
+    "retry": (BusyRetryPolicy(), False),
+    "journal": (BusyRetryPolicy(attempts=3, busy_timeout=5), True),
+}
+
+
+def _worker(
+    db_path: str,
+    scenario: str,
+    start: float,
+    results: Queue[tuple[list[float], int, int]],
+) -> None:
+    """Write counters as fast as possible and report per-write latencies."""
+    policy, use_journal = SCENARIOS[scenario]
+    journal = StateJournal(get_state_journal_dir(db_path))
+    store = SQLiteStateStore(
+        db_path,
+        session_id="bench",
+        retry_policy=policy,
+        journal=journal if use_journal else None,
+    )
+    # Start all workers together to maximize contention
+    time.sleep(max(0.0, start - time.time()))
+
+    latencies: list[float] = []
+    failed = 0
+    for i in range(WRITES_PER_PROCESS):
+        began = time.perf_counter()
+        try:
+            _ = store.atomic_increment(KEYS[i % len(KEYS)], author="bench")
+        except sqlite3.OperationalError:
+            # Retry budget exhausted without a journal: the write is lost
+            failed += 1
+        latencies.append(time.perf_counter() - began)
+    results.put((latencies, len(journal.pending), failed))
+
+
+def _percentile(values: list[float], pct: int) -> float:
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def _run_burst(db_path: Path, scenario: str) -> dict[str, float]:
+    ctx = multiprocessing.get_context("fork")
+    results: Queue[tuple[list[float], int, int]] = ctx.Queue()
+    start = time.time() + 0.5
+    processes = [
+        ctx.Process(target=_worker, args=(str(db_path), scenario, start, results))
+        for _ in range(PROCESSES)
+    ]
+    for process in processes:
+        process.start()
+    outcomes = [results.get(timeout=60) for _ in processes]
+    for process in processes:
+        process.join()
+
+    merged = merge_state_journal(db_path)
+    latencies = [latency for batch, _, _ in outcomes for latency in batch]
+    journaled = sum(count for _, count, _ in outcomes)
+    failed = sum(count for _, _, count in outcomes)
+    assert merged == journaled
+
+    store = SQLiteStateStore(db_path, session_id="bench")
+    total = sum(int(store[key]) for key in KEYS)  # pyright: ignore[reportArgumentType]
+    assert total == PROCESSES * WRITES_PER_PROCESS - failed
+
+    ms = 1000.0
+    return {
+        "p50_ms": _percentile(latencies, 50) * ms,
+        "p95_ms": _percentile(latencies, 95) * ms,
+        "p99_ms": _percentile(latencies, 99) * ms,
+        "max_ms": max(latencies) * ms,
+        "journaled_writes": journaled,
+        "failed_writes": failed,
+    }
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires fork start method")
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_concurrent_hook_writes(
+    benchmark: BenchmarkFixture, tmp_path: Path, scenario: str
+) -> None:
+    """Lock-wait distribution for a burst of concurrent hook writers."""
+    rounds: list[dict[str, float]] = []
+
+    def run() -> None:
+        db_path = tmp_path / f"state-{len(rounds)}.db"
+        _ = SQLiteStateStore(db_path)
+        rounds.append(_run_burst(db_path, scenario))
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+
+    for metric in rounds[0]:
+        benchmark.extra_info[metric] = statistics.median(r[metric] for r in rounds)
+    benchmark.extra_info["processes"] = PROCESSES
+    benchmark.extra_info["writes_per_process"] = WRITES_PER_PROCESS
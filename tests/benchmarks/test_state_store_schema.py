@@ -0,0 +1,170 @@
+"""Benchmark the version 1 and version 2 state store schemas.
+
+Version 1 stores every value in a single BLOB column, so increments go
+through ``CASE typeof(value)`` and value filters cannot use an index. Version
+2 stores each value in a typed column, with a partial index on
+``(session_id, int_value)``.
+
+Operations, each run against a database populated with ``SESSIONS`` sessions
+of ``KEYS_PER_SESSION`` mixed-type entries:
+1. Increment: ``INCREMENTS`` counter increments, one transaction each
+2. Scan: read all entries of each session
+3. Range: count each session's integer values above a threshold
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from typing import TYPE_CHECKING
+
+import pytest
+
+from oaps.utils._state_store import (
+    _SQL_ATOMIC_INCREMENT,
+    _SQL_SELECT_ALL,
+    _SQLITE_SCHEMA_STATEMENTS,
+    _typed_value,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+SESSIONS = 50
+KEYS_PER_SESSION = 400
+INCREMENTS = 2_000
+THRESHOLD = 100
+
+_V1_SCHEMA = (
+    """
+CREATE TABLE state_store (
+    session_id TEXT,
+    key TEXT NOT NULL,
+    value BLOB,
+    created_at TEXT NOT NULL,
+    created_by TEXT,
+    updated_at TEXT NOT NULL,
+    updated_by TEXT,
+    PRIMARY KEY (session_id, key)
+)
+""",
+    (
+        "CREATE INDEX idx_state_store_session_updated "
+        "ON state_store (session_id, updated_at)"
+    ),
+)
+
+_V1_INSERT = "INSERT INTO state_store VALUES (?, ?, ?, 't', NULL, 't', NULL)"
+_V2_INSERT = (
+    "INSERT INTO state_store (session_id, key, int_value, real_value, text_value, "
+    "blob_value, created_at, created_by, updated_at, updated_by) "
+    "VALUES (?, ?, ?, ?, ?, ?, 't', NULL, 't', NULL)"
+)
+
+_V1_INCREMENT = """
+INSERT INTO state_store
+    (session_id, key, value, created_at, created_by, updated_at, updated_by)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (session_id, key) DO UPDATE SET
+    value = COALESCE(
+        CASE
+            WHEN typeof(state_store.value) IN ('integer', 'real')
+            THEN CAST(state_store.value AS INTEGER)
+            ELSE 0
+        END, 0
+    ) + excluded.value,
+    updated_at = excluded.updated_at,
+    updated_by = excluded.updated_by
+RETURNING value
+"""
+_V1_SELECT_ALL = (
+    "SELECT session_id, key, value, created_at, created_by, updated_at, "
+    "updated_by FROM state_store WHERE session_id = ? ORDER BY key"
+)
+_V1_RANGE = (
+    "SELECT COUNT(*) FROM state_store "
+    "WHERE session_id = ? AND typeof(value) = 'integer' AND value > ?"
+)
+_V2_RANGE = "SELECT COUNT(*) FROM state_store WHERE session_id = ? AND int_value > ?"
+
+
+def _value(i: int) -> str | int | float | bytes:
+    match i % 4:
+        case 0:
+            return i
+        case 1:
+            return i + 0.5
+        case 2:
+            return f"text-{i}"
+        case _:
+            return i.to_bytes(4, "big")
+
+
+def _populate(db_path: Path, version: int) -> None:
+    rows = [
+        (f"session-{s}", f"key-{k:04d}", _value(k))
+        for s in range(SESSIONS)
+        for k in range(KEYS_PER_SESSION)
+    ]
+    with closing(sqlite3.connect(db_path)) as conn:
+        _ = conn.execute("PRAGMA journal_mode=WAL")
+        if version == 1:
+            for statement in _V1_SCHEMA:
+                _ = conn.execute(statement)
+            _ = conn.executemany(_V1_INSERT, rows)
+        else:
+            for statement in _SQLITE_SCHEMA_STATEMENTS:
+                _ = conn.execute(statement)
+            _ = conn.executemany(
+                _V2_INSERT, [(s, k, *_typed_value(v)) for s, k, v in rows]
+            )
+        conn.commit()
+
+
+def _increments(conn: sqlite3.Connection, version: int) -> None:
+    sql = _V1_INCREMENT if version == 1 else _SQL_ATOMIC_INCREMENT
+    for i in range(INCREMENTS):
+        # Cycle over existing keys of every type plus one fresh counter
+        key = f"key-{i % 8:04d}" if i % 9 else "counter"
+        _ = conn.execute(sql, ("session-0", key, 1, "t", None, "t", None)).fetchall()
+        conn.commit()
+
+
+def _scan(conn: sqlite3.Connection, version: int) -> None:
+    sql = _V1_SELECT_ALL if version == 1 else _SQL_SELECT_ALL
+    for s in range(SESSIONS):
+        rows = conn.execute(sql, (f"session-{s}",)).fetchall()
+        assert len(rows) == KEYS_PER_SESSION
+
+
+def _range(conn: sqlite3.Connection, version: int) -> None:
+    sql = _V1_RANGE if version == 1 else _V2_RANGE
+    for s in range(SESSIONS):
+        _ = conn.execute(sql, (f"session-{s}", THRESHOLD)).fetchone()
+
+
+OPERATIONS: dict[str, Callable[[sqlite3.Connection, int], None]] = {
+    "increment": _increments,
+    "scan": _scan,
+    "range": _range,
+}
+
+
+@pytest.mark.parametrize("version", [1, 2])
+@pytest.mark.parametrize("operation", list(OPERATIONS))
+def test_schema_throughput(
+    benchmark: BenchmarkFixture, tmp_path: Path, operation: str, version: int
+) -> None:
+    """Throughput of one operation against one schema version."""
+    db_path = tmp_path / f"state-v{version}.db"
+    _populate(db_path, version)
+    run = OPERATIONS[operation]
+
+    with closing(sqlite3.connect(db_path)) as conn:
+        benchmark.pedantic(run, args=(conn, version), rounds=5, iterations=1)
+
+    benchmark.extra_info["schema_version"] = version
+    benchmark.extra_info["rows"] = SESSIONS * KEYS_PER_SESSION
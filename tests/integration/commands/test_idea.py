@@ -335,6 +335,46 @@ class TestIdeaSearch:
         captured = capsys.readouterr()
         assert "Searchable Test Idea" in captured.out
 
+    def test_search_ranks_title_matches_first(
+        self,
+        oaps_project: OapsProject,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli: Callable[..., None],
+    ) -> None:
+        ideas_dir = oaps_project.oaps_dir / "docs" / "ideas"
+        ideas_dir.mkdir(parents=True)
+
+        for idea_id, title, body in (
+            ("body-match", "Onboarding Notes", "Mentions caching in passing"),
+            ("title-match", "Caching Strategy", "# Plan"),
+            ("no-match", "Unrelated", "# Nothing here"),
+        ):
+            fm = IdeaFrontmatter(
+                id=idea_id,
+                title=title,
+                status=IdeaStatus.SEED,
+                type=IdeaType.TECHNICAL,
+                created="2024-12-18T12:00:00Z",
+                updated="2024-12-18T12:00:00Z",
+            )
+            save_idea(ideas_dir / f"{idea_id}.md", fm, body)
+
+        with (
+            patch(
+                "oaps.cli._commands._idea._storage.get_ideas_dir",
+                return_value=ideas_dir,
+            ),
+            patch("oaps.cli._commands._idea.get_ideas_dir", return_value=ideas_dir),
+        ):
+            oaps_cli("idea", "search", "cach")
+
+        captured = capsys.readouterr()
+        assert "Found 2 idea(s)" in captured.out
+        assert captured.out.index("Caching Strategy") < captured.out.index(
+            "Onboarding Notes"
+        )
+        assert "Unrelated" not in captured.out
+
     def test_search_no_results(
         self,
         oaps_project: OapsProject,
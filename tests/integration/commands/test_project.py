@@ -487,3 +487,42 @@ class TestProjectState:
         assert "value: value1" in captured.out
         assert "created_by: author1" in captured.out
         assert "---" in captured.out  # Separator between entries
+
+
+class TestProjectTransfer:
+    def test_export_then_import_replace(
+        self,
+        project_env: Path,
+        project_store: SQLiteStateStore,
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        project_store.set("kept", 1, author="alice")
+        export_path = project_env / "project.parquet"
+        assert oaps_cli_with_exit_code("project", "export", str(export_path)) == 0
+        project_store.set("added-later", "x")
+
+        exit_code = oaps_cli_with_exit_code(
+            "project", "import", str(export_path), "--replace"
+        )
+
+        assert exit_code == ExitCode.SUCCESS
+        assert list(project_store) == ["kept"]
+        entry = project_store.get_entry("kept")
+        assert entry is not None
+        assert entry.created_by == "alice"
+
+    def test_export_without_database_exits_not_found(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        monkeypatch.setattr(
+            "oaps.utils.get_oaps_state_file", lambda: tmp_path / "missing.db"
+        )
+
+        exit_code = oaps_cli_with_exit_code(
+            "project", "export", str(tmp_path / "out.jsonl")
+        )
+
+        assert exit_code == ExitCode.NOT_FOUND
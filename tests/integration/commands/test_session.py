@@ -538,3 +538,162 @@ class TestSessionNoSessionId:
         assert exit_code == 0
         captured = capsys.readouterr()
         assert "explicit-value" in captured.out
+
+
+class TestSessionAnalyze:
+    @pytest.fixture
+    def analyze_env(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        db_path = tmp_path / ".oaps" / "state.db"
+        db_path.parent.mkdir(parents=True)
+        monkeypatch.setattr("oaps.utils.get_oaps_state_file", lambda: db_path)
+        for session_id, tools in [("alpha", 2), ("beta", 7)]:
+            store = SQLiteStateStore(db_path, session_id=session_id)
+            store.atomic_increment("oaps.tools.total_count", tools)
+            store.atomic_increment("oaps.subagents.spawn_count", tools)
+        return db_path
+
+    def test_summary_json(
+        self,
+        analyze_env: Path,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        import orjson
+
+        exit_code = oaps_cli_with_exit_code("session", "analyze", "--format", "json")
+
+        assert exit_code == 0
+        data = orjson.loads(capsys.readouterr().out)
+        assert data[0]["sessions"] == 2
+        assert data[0]["avg_tools"] == 4.5
+
+    def test_top_by_subagents(
+        self,
+        analyze_env: Path,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        import orjson
+
+        exit_code = oaps_cli_with_exit_code(
+            "session", "analyze", "top", "--by", "subagents", "-f", "json"
+        )
+
+        assert exit_code == 0
+        data = orjson.loads(capsys.readouterr().out)
+        assert [row["session_id"] for row in data] == ["beta", "alpha"]
+
+    def test_sql_mode(
+        self,
+        analyze_env: Path,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        exit_code = oaps_cli_with_exit_code(
+            "session", "analyze", "--sql", "SELECT COUNT(*) AS n FROM sessions"
+        )
+
+        assert exit_code == 0
+        assert "2" in capsys.readouterr().out
+
+    def test_invalid_sql_exits_with_validation_error(
+        self,
+        analyze_env: Path,
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        exit_code = oaps_cli_with_exit_code(
+            "session", "analyze", "--sql", "SELECT * FROM missing_table"
+        )
+
+        assert exit_code == 2
+
+    def test_write_snapshot_then_analyze(
+        self,
+        analyze_env: Path,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        import orjson
+
+        snapshot = tmp_path / "snapshot.parquet"
+
+        assert (
+            oaps_cli_with_exit_code(
+                "session", "analyze", "--write-snapshot", str(snapshot)
+            )
+            == 0
+        )
+        capsys.readouterr()
+        exit_code = oaps_cli_with_exit_code(
+            "session", "analyze", "--snapshot", str(snapshot), "-f", "json"
+        )
+
+        assert exit_code == 0
+        assert orjson.loads(capsys.readouterr().out)[0]["total_tools"] == 9
+
+    def test_missing_database(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        monkeypatch.setattr(
+            "oaps.utils.get_oaps_state_file", lambda: tmp_path / "missing.db"
+        )
+
+        exit_code = oaps_cli_with_exit_code("session", "analyze")
+
+        assert exit_code == 3
+
+
+class TestSessionTransfer:
+    @pytest.mark.parametrize("suffix", ["jsonl", "parquet"])
+    def test_export_then_import_into_other_session(
+        self,
+        session_env: str,
+        session_store: SQLiteStateStore,
+        tmp_path: Path,
+        oaps_cli_with_exit_code: Callable[..., int],
+        suffix: str,
+    ) -> None:
+        session_store.set("key", "value", author="alice")
+        session_store.set("blob", b"\x00\x01")
+        export_path = tmp_path / f"session.{suffix}"
+
+        assert oaps_cli_with_exit_code("session", "export", str(export_path)) == 0
+        exit_code = oaps_cli_with_exit_code(
+            "session", "import", str(export_path), "--session-id", "other"
+        )
+
+        assert exit_code == 0
+        other = SQLiteStateStore(tmp_path / ".oaps" / "state.db", session_id="other")
+        assert other["blob"] == b"\x00\x01"
+        assert other.get_entry("key") == session_store.get_entry("key").model_copy(  # pyright: ignore[reportOptionalMemberAccess]
+            update={"session_id": "other"}
+        )
+
+    def test_import_missing_file_exits_not_found(
+        self,
+        session_env: str,
+        tmp_path: Path,
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        exit_code = oaps_cli_with_exit_code(
+            "session", "import", str(tmp_path / "missing.jsonl")
+        )
+
+        assert exit_code == 3
+
+    def test_import_malformed_file_exits_validation_error(
+        self,
+        session_env: str,
+        tmp_path: Path,
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        bad = tmp_path / "bad.jsonl"
+        bad.write_text("not json\n")
+
+        exit_code = oaps_cli_with_exit_code("session", "import", str(bad))
+
+        assert exit_code == 2
@@ -5,6 +5,7 @@
 # pyright: reportCallIssue=false, reportArgumentType=false
 """Integration tests for the spec command."""
 
+import json
 from collections.abc import Callable, Generator
 from pathlib import Path
 
@@ -790,6 +791,242 @@ class TestSpecList:
         assert exit_code == ExitCode.SUCCESS
 
 
+class TestSpecSearch:
+    def test_search_ranks_matching_documents(
+        self,
+        oaps_project: OapsProject,
+        get_spec_manager: SpecManager,
+        get_requirement_manager: SpecRequirementManager,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        spec = get_spec_manager.create_spec(
+            "search-spec",
+            "Caching Layer",
+            SpecType.FEATURE,
+            summary="Read-through cache",
+            actor="test",
+        )
+        get_requirement_manager.add_requirement(
+            spec.id,
+            RequirementType.FUNCTIONAL,
+            "Evict entries",
+            "Evict cached entries on write",
+            actor="test",
+        )
+
+        exit_code = oaps_cli_with_exit_code("spec", "search", "cach")
+
+        assert exit_code == ExitCode.SUCCESS
+        captured = capsys.readouterr()
+        assert captured.out.index("Caching Layer") < captured.out.index("Evict entries")
+
+    def test_search_filters_by_kind(
+        self,
+        oaps_project: OapsProject,
+        get_spec_manager: SpecManager,
+        get_requirement_manager: SpecRequirementManager,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        spec = get_spec_manager.create_spec(
+            "kind-spec", "Caching Layer", SpecType.FEATURE, actor="test"
+        )
+        requirement = get_requirement_manager.add_requirement(
+            spec.id,
+            RequirementType.FUNCTIONAL,
+            "Cache reads",
+            "Serve reads from the cache",
+            actor="test",
+        )
+
+        exit_code = oaps_cli_with_exit_code(
+            "spec", "search", "cache", "--kind", "requirement", "--format", "plain"
+        )
+
+        assert exit_code == ExitCode.SUCCESS
+        captured = capsys.readouterr()
+        assert captured.out.split() == [requirement.id]
+
+    def test_search_no_results(
+        self,
+        oaps_project: OapsProject,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        exit_code = oaps_cli_with_exit_code("spec", "search", "nothing")
+
+        assert exit_code == ExitCode.SUCCESS
+        captured = capsys.readouterr()
+        assert "No results" in captured.out
+
+
+class TestSpecQuery:
+    def test_query_untested_requirements(
+        self,
+        oaps_project: OapsProject,
+        get_spec_manager: SpecManager,
+        get_requirement_manager: SpecRequirementManager,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        spec = get_spec_manager.create_spec(
+            "query-spec", "Query Spec", SpecType.FEATURE, actor="test"
+        )
+        requirement = get_requirement_manager.add_requirement(
+            spec.id,
+            RequirementType.SECURITY,
+            "Encrypt secrets",
+            "Encrypt secrets at rest",
+            actor="test",
+        )
+        _ = get_requirement_manager.add_requirement(
+            spec.id,
+            RequirementType.FUNCTIONAL,
+            "Export data",
+            "Export data as CSV",
+            actor="test",
+        )
+
+        exit_code = oaps_cli_with_exit_code(
+            "spec", "query", "--type", "security", "--untested", "--format", "json"
+        )
+
+        assert exit_code == ExitCode.SUCCESS
+        data = json.loads(capsys.readouterr().out)
+        assert [row["id"] for row in data["results"]] == [requirement.id]
+        assert data["results"][0]["spec_id"] == spec.id
+
+    def test_query_sql(
+        self,
+        oaps_project: OapsProject,
+        create_spec: CreateSpecFunc,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        _ = create_spec("sql-spec", "SQL Spec")
+
+        exit_code = oaps_cli_with_exit_code(
+            "spec", "query", "--sql", "SELECT slug FROM specs", "--no-mirror"
+        )
+
+        assert exit_code == ExitCode.SUCCESS
+        assert "sql-spec" in capsys.readouterr().out
+
+    def test_query_invalid_sql(
+        self,
+        oaps_project: OapsProject,
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        exit_code = oaps_cli_with_exit_code("spec", "query", "--sql", "SELECT nope")
+
+        assert exit_code == ExitCode.VALIDATION_ERROR
+
+
+class TestSpecProgressCoverage:
+    def test_progress(
+        self,
+        oaps_project: OapsProject,
+        create_test_entry: CreateTestEntryFunc,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        spec_id, _ = create_test_entry("progress-spec")
+
+        exit_code = oaps_cli_with_exit_code(
+            "spec", "progress", spec_id, "--format", "json"
+        )
+
+        assert exit_code == ExitCode.SUCCESS
+        data = json.loads(capsys.readouterr().out)
+        assert data["total_requirements"] == 1
+        assert data["by_type"][0]["req_type"] == "functional"
+
+    def test_coverage_table(
+        self,
+        oaps_project: OapsProject,
+        create_test_entry: CreateTestEntryFunc,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        spec_id, _ = create_test_entry("coverage-spec")
+
+        exit_code = oaps_cli_with_exit_code("spec", "coverage", spec_id)
+
+        assert exit_code == ExitCode.SUCCESS
+        output = capsys.readouterr().out
+        assert f"Coverage of {spec_id}:" in output
+        assert "unit" in output
+
+    def test_recompute_repairs_stale_counters(
+        self,
+        oaps_project: OapsProject,
+        get_spec_manager: SpecManager,
+        create_test_entry: CreateTestEntryFunc,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        spec_id, _ = create_test_entry("stale-spec")
+        [index_path] = get_spec_manager.base_path.glob(f"{spec_id}-*/index.json")
+        data = json.loads(index_path.read_text())
+        data["aggregates"]["requirements"]["total"] = 5
+        _ = index_path.write_text(json.dumps(data))
+
+        exit_code = oaps_cli_with_exit_code(
+            "spec", "progress", spec_id, "--recompute", "--format", "json"
+        )
+
+        assert exit_code == ExitCode.VALIDATION_ERROR
+        captured = capsys.readouterr()
+        assert json.loads(captured.out)["total_requirements"] == 1
+        assert "requirements.total" in captured.err
+        assert (
+            oaps_cli_with_exit_code("spec", "progress", spec_id, "--recompute")
+            == ExitCode.SUCCESS
+        )
+
+    def test_unknown_spec(
+        self,
+        oaps_project: OapsProject,
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        exit_code = oaps_cli_with_exit_code("spec", "coverage", "9999")
+
+        assert exit_code == ExitCode.NOT_FOUND
+
+
+class TestSpecExport:
+    def test_export_parquet(
+        self,
+        oaps_project: OapsProject,
+        create_test_entry: CreateTestEntryFunc,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        import pyarrow.parquet as pq
+
+        spec_id, _ = create_test_entry("export-spec")
+        output = tmp_path / "export"
+
+        exit_code = oaps_cli_with_exit_code("spec", "export", str(output))
+
+        assert exit_code == ExitCode.SUCCESS
+        assert "Exported 1 specs" in capsys.readouterr().out
+        table = pq.read_table(output / "tests" / f"{spec_id}.parquet")
+        assert table.column("spec_id").to_pylist() == [spec_id]
+
+        exit_code = oaps_cli_with_exit_code("spec", "export", str(output))
+
+        assert exit_code == ExitCode.SUCCESS
+        assert "Exported 0 specs" in capsys.readouterr().out
+        assert (
+            oaps_cli_with_exit_code("spec", "export", str(output), "--full")
+            == ExitCode.SUCCESS
+        )
+        assert "Exported 1 specs" in capsys.readouterr().out
+
+
 class TestSpecSave:
     def test_save_nothing_to_save(
         self,
@@ -1352,6 +1589,46 @@ class TestReqDelete:
         assert exit_code == ExitCode.NOT_FOUND
 
 
+class TestReqImport:
+    def test_import_csv(
+        self,
+        oaps_project: OapsProject,
+        create_spec: CreateSpecFunc,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        spec_id = create_spec("req-import", "Requirement Import")
+        path = tmp_path / "requirements.csv"
+        _ = path.write_text(
+            "req_type,title,tags\nsecurity,Encrypt,crypto;storage\nfunctional,Export,\n"
+        )
+
+        exit_code = oaps_cli_with_exit_code(
+            "spec", "req", "import", spec_id, str(path), "--format", "json"
+        )
+
+        assert exit_code == ExitCode.SUCCESS
+        data = json.loads(capsys.readouterr().out)
+        assert [r["title"] for r in data["requirements"]] == ["Encrypt", "Export"]
+        assert data["requirements"][0]["tags"] == ["crypto", "storage"]
+
+    def test_import_invalid_record(
+        self,
+        oaps_project: OapsProject,
+        create_spec: CreateSpecFunc,
+        tmp_path: Path,
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        spec_id = create_spec("req-import-bad", "Requirement Import Bad")
+        path = tmp_path / "requirements.jsonl"
+        _ = path.write_text('{"req_type": "functional"}\n')
+
+        exit_code = oaps_cli_with_exit_code("spec", "req", "import", spec_id, str(path))
+
+        assert exit_code == ExitCode.VALIDATION_ERROR
+
+
 # ---------------------------------------------------------------------------
 # Test Command Tests
 # ---------------------------------------------------------------------------
@@ -1502,6 +1779,35 @@ class TestTestAdd:
         assert exit_code == ExitCode.SUCCESS
 
 
+class TestTestImport:
+    def test_import_jsonl(
+        self,
+        oaps_project: OapsProject,
+        create_requirement: CreateRequirementFunc,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        spec_id, req_id = create_requirement("test-import")
+        path = tmp_path / "tests.jsonl"
+        _ = path.write_text(
+            "".join(
+                json.dumps(
+                    {"method": "unit", "title": f"T{i}", "tests_requirements": [req_id]}
+                )
+                + "\n"
+                for i in range(2)
+            )
+        )
+
+        exit_code = oaps_cli_with_exit_code(
+            "spec", "test", "import", spec_id, str(path), "--format", "plain"
+        )
+
+        assert exit_code == ExitCode.SUCCESS
+        assert capsys.readouterr().out.split() == ["UT-0001", "UT-0002"]
+
+
 class TestTestUpdate:
     def test_update_test_success(
         self,
@@ -2350,6 +2656,69 @@ class TestArtifactRebuild:
         assert exit_code == ExitCode.SUCCESS
 
 
+class TestArtifactValidate:
+    def test_validate_success(
+        self,
+        oaps_project: OapsProject,
+        create_artifact: CreateArtifactFunc,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        spec_id, _artifact_id = create_artifact("artifact-validate")
+
+        exit_code = oaps_cli_with_exit_code("spec", "artifact", "validate", spec_id)
+
+        assert exit_code == ExitCode.SUCCESS
+
+    def test_validate_spec_not_found(
+        self,
+        oaps_project: OapsProject,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        exit_code = oaps_cli_with_exit_code("spec", "artifact", "validate", "9999")
+
+        assert exit_code == ExitCode.NOT_FOUND
+
+    def test_stats_report_cache_hits(
+        self,
+        oaps_project: OapsProject,
+        create_artifact: CreateArtifactFunc,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        spec_id, _artifact_id = create_artifact("artifact-validate-stats")
+        args = ("spec", "artifact", "validate", spec_id, "--stats", "-f", "json")
+
+        assert oaps_cli_with_exit_code(*args) == ExitCode.SUCCESS
+        first = json.loads(capsys.readouterr().out)
+        assert oaps_cli_with_exit_code(*args) == ExitCode.SUCCESS
+        second = json.loads(capsys.readouterr().out)
+        assert oaps_cli_with_exit_code(*args, "--no-cache") == ExitCode.SUCCESS
+        uncached = json.loads(capsys.readouterr().out)
+
+        assert first["cache"]["misses"] == 1
+        assert second["cache"] == {"hits": 1, "misses": 0, "hit_rate": 1.0}
+        assert uncached["cache"]["hits"] == 0
+
+    def test_writes_report(
+        self,
+        oaps_project: OapsProject,
+        create_artifact: CreateArtifactFunc,
+        capsys: pytest.CaptureFixture[str],
+        oaps_cli_with_exit_code: Callable[..., int],
+    ) -> None:
+        spec_id, _artifact_id = create_artifact("artifact-validate-report")
+        report = oaps_project.root / "validation.jsonl"
+
+        exit_code = oaps_cli_with_exit_code(
+            "spec", "artifact", "validate", spec_id, "--report", str(report), "-j", "1"
+        )
+
+        assert exit_code == ExitCode.SUCCESS
+        assert report.exists()
+
+
 class TestArtifactList:
     def test_list_artifacts_success(
         self,
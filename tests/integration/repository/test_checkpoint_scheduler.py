@@ -0,0 +1,91 @@
+"""Integration tests for coalesced checkpoint commits in a real repository."""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from oaps.repository import CHECKPOINT_QUEUE_NAME, CheckpointScheduler, OapsRepository
+
+
+def _run_git(cwd: Path, *args: str) -> str:
+    """Run a git command in the given directory and return its output."""
+    result = subprocess.run(  # noqa: S603 - Safe: running git with controlled args
+        ["git", *args],
+        cwd=str(cwd),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+@pytest.fixture
+def oaps_git_repo(tmp_path: Path) -> Path:
+    """Create a real .oaps git repository for testing."""
+    oaps_dir = tmp_path / ".oaps"
+    oaps_dir.mkdir()
+    _ = _run_git(oaps_dir, "init")
+    _ = _run_git(oaps_dir, "config", "user.name", "Test User")
+    _ = _run_git(oaps_dir, "config", "user.email", "test@example.com")
+    _ = _run_git(oaps_dir, "config", "commit.gpgsign", "false")
+    _ = (oaps_dir / "README.md").write_text("# OAPS Test Repository\n")
+    _ = _run_git(oaps_dir, "add", "README.md")
+    _ = _run_git(oaps_dir, "commit", "-m", "Initial commit")
+    return tmp_path
+
+
+def test_coalesces_checkpoints_into_one_commit(oaps_git_repo: Path) -> None:
+    with OapsRepository(working_dir=oaps_git_repo) as repo:
+        scheduler = CheckpointScheduler(repo, interval=3600)
+        for number in range(1, 4):
+            _ = (repo.root / f"FR-{number:04d}.md").write_text(f"# FR-{number}\n")
+            _ = scheduler.checkpoint(
+                "spec", f"add requirement FR-{number:04d}", session_id="s1"
+            )
+
+        results = scheduler.flush()
+
+        assert len(results) == 1
+        assert not repo.has_changes()
+        assert (repo.git_dir / CHECKPOINT_QUEUE_NAME).exists()
+
+    log = _run_git(oaps_git_repo / ".oaps", "log", "--format=%B%x00")
+    messages = [m.strip() for m in log.split("\0") if m.strip()]
+    assert len(messages) == 3
+    assert messages[0].splitlines()[:5] == [
+        "oaps(spec): add requirement FR-0002 (+1 more)",
+        "",
+        "- add requirement FR-0002",
+        "- add requirement FR-0003",
+        "",
+    ]
+    assert messages[0].endswith("OAPS-Session: s1")
+    assert messages[1].startswith("oaps(spec): add requirement FR-0001")
+    files = _run_git(oaps_git_repo / ".oaps", "show", "--name-only", "--format=")
+    assert CHECKPOINT_QUEUE_NAME not in files
+
+
+def test_interleaved_workflows_keep_queued_actions(oaps_git_repo: Path) -> None:
+    with OapsRepository(working_dir=oaps_git_repo) as repo:
+        scheduler = CheckpointScheduler(repo, interval=3600)
+        _ = (repo.root / "FR-0001.md").write_text("# FR-0001\n")
+        _ = scheduler.checkpoint("spec", "add requirement FR-0001")
+        _ = (repo.root / "FR-0002.md").write_text("# FR-0002\n")
+        _ = scheduler.checkpoint("spec", "add requirement FR-0002")
+        _ = (repo.root / "notes.md").write_text("# Notes\n")
+
+        _ = scheduler.checkpoint("dev", "update notes")
+
+        assert scheduler.flush() == []
+        assert not repo.has_changes()
+
+    log = _run_git(oaps_git_repo / ".oaps", "log", "-1", "--format=%B")
+    assert log.splitlines()[:4] == [
+        "oaps(dev): update notes (+1 more)",
+        "",
+        "- update notes",
+        "- spec: add requirement FR-0002",
+    ]
+    files = _run_git(oaps_git_repo / ".oaps", "show", "--name-only", "--format=")
+    assert set(files.split()) == {"FR-0002.md", "notes.md"}
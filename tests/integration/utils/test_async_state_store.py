@@ -0,0 +1,157 @@
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import anyio
+import pytest
+
+from oaps.utils._async_state_store import AsyncStateDatabase, AsyncStateStore
+from oaps.utils._state_store import SQLiteStateStore
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "state.db"
+
+
+def run(db_path: Path, test: Callable[[AsyncStateDatabase], Awaitable[None]]) -> None:
+    """Run an async test body against an open database."""
+
+    async def main() -> None:
+        async with AsyncStateDatabase(db_path, readers=2) as db:
+            await test(db)
+
+    anyio.run(main)
+
+
+class TestAsyncStateStore:
+    def test_set_and_get(self, db_path: Path) -> None:
+        async def test(db: AsyncStateDatabase) -> None:
+            store = db.store("s1")
+            await store.set("text", "hello", author="alice")
+            await store.set("blob", b"\x00\xff")
+
+            assert await store.get("text") == "hello"
+            assert await store.get("blob") == b"\x00\xff"
+            entry = await store.get_entry("text")
+            assert entry is not None
+            assert entry.created_by == "alice"
+            assert await store.keys() == ["blob", "text"]
+            assert await store.count() == 2
+            assert await store.contains("text")
+
+        run(db_path, test)
+
+    def test_get_missing_raises_key_error(self, db_path: Path) -> None:
+        async def test(db: AsyncStateDatabase) -> None:
+            with pytest.raises(KeyError):
+                _ = await db.store().get("missing")
+            assert await db.store().get_entry("missing") is None
+
+        run(db_path, test)
+
+    def test_delete_and_clear(self, db_path: Path) -> None:
+        async def test(db: AsyncStateDatabase) -> None:
+            store = db.store("s1")
+            await store.set("a", 1)
+            await store.set("b", 2)
+
+            assert await store.delete("a")
+            assert not await store.delete("a")
+            await store.clear()
+            assert await store.count() == 0
+
+        run(db_path, test)
+
+    def test_scopes_are_isolated(self, db_path: Path) -> None:
+        async def test(db: AsyncStateDatabase) -> None:
+            await db.store().set("k", "project")
+            await db.store("s1").set("k", "session")
+
+            assert await db.store().get("k") == "project"
+            assert await db.store("s1").get("k") == "session"
+
+        run(db_path, test)
+
+    def test_shares_database_with_sync_store(self, db_path: Path) -> None:
+        async def test(db: AsyncStateDatabase) -> None:
+            await db.store("s1").set("k", 42)
+
+        run(db_path, test)
+
+        assert SQLiteStateStore(db_path, session_id="s1")["k"] == 42
+
+
+class TestBatchedWrites:
+    def test_concurrent_increments_are_not_lost(self, db_path: Path) -> None:
+        async def test(db: AsyncStateDatabase) -> None:
+            store = db.store("s1")
+            results: list[int] = []
+
+            async def increment() -> None:
+                results.append(await store.atomic_increment("count"))
+
+            async with anyio.create_task_group() as tg:
+                for _ in range(200):
+                    tg.start_soon(increment)
+
+            assert sorted(results) == list(range(1, 201))
+            assert await store.get("count") == 200
+
+        run(db_path, test)
+
+    def test_failed_write_does_not_affect_batch(self, db_path: Path) -> None:
+        async def test(db: AsyncStateDatabase) -> None:
+            store = db.store("s1")
+
+            async def fail() -> None:
+                def operation(conn: object) -> None:
+                    _ = conn
+                    msg = "boom"
+                    raise ValueError(msg)
+
+                with pytest.raises(ValueError, match="boom"):
+                    await db.write(operation)
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(store.set, "before", 1)
+                tg.start_soon(fail)
+                tg.start_soon(store.set, "after", 2)
+
+            assert await store.keys() == ["after", "before"]
+
+        run(db_path, test)
+
+    def test_close_flushes_pending_writes(self, db_path: Path) -> None:
+        async def main() -> None:
+            db = AsyncStateDatabase(db_path)
+            await db.open()
+            store = db.store("s1")
+            async with anyio.create_task_group() as tg:
+                for i in range(50):
+                    tg.start_soon(store.set, f"k{i:02d}", i)
+            await db.aclose()
+
+        anyio.run(main)
+
+        assert len(SQLiteStateStore(db_path, session_id="s1")) == 50
+
+
+class TestAsyncStateDatabase:
+    def test_list_sessions(self, db_path: Path) -> None:
+        async def test(db: AsyncStateDatabase) -> None:
+            await db.store().set("project", 1)
+            await db.store("s1").set("a", 1)
+            await db.store("s2").set("a", 1)
+            await db.store("s2").set("b", 1)
+
+            summaries = await db.list_sessions()
+
+            assert {s.session_id: s.key_count for s in summaries} == {"s1": 1, "s2": 2}
+
+        run(db_path, test)
+
+    def test_requires_open(self, db_path: Path) -> None:
+        store = AsyncStateStore(AsyncStateDatabase(db_path), "s1")
+
+        with pytest.raises(RuntimeError, match="not open"):
+            anyio.run(store.count)
@@ -15,18 +15,24 @@ from pydantic_extra_types.pendulum_dt import (
 )
 
 from oaps.utils.database import (
+    BusyRetryPolicy,
     connect,
     delete,
+    ensure_cache_schema,
     fetch_all,
     fetch_one,
     insert,
     insert_all,
+    is_busy_error,
+    open_cache,
+    retry_on_busy,
     update,
     upsert,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from pathlib import Path
 
 
 class Record(BaseModel):
@@ -1026,3 +1032,156 @@ class TestPendulumDurationSerialization:
         assert result is not None
         assert isinstance(result.delta, pendulum.Duration)
         assert result.delta.in_days() == 30
+
+
+class TestBusyRetryPolicy:
+    def test_delay_is_bounded_by_exponential_ceiling(self) -> None:
+        policy = BusyRetryPolicy(base_delay=0.01, max_delay=1.0)
+
+        for attempt in range(4):
+            assert 0.0 <= policy.delay(attempt) <= 0.01 * 2**attempt
+
+    def test_delay_is_capped_at_max_delay(self) -> None:
+        policy = BusyRetryPolicy(base_delay=0.01, max_delay=0.05)
+
+        assert all(policy.delay(20) <= 0.05 for _ in range(50))
+
+
+class TestIsBusyError:
+    @pytest.mark.parametrize(
+        "message", ["database is locked", "database table is locked", "busy"]
+    )
+    def test_detects_lock_errors(self, message: str) -> None:
+        assert is_busy_error(sqlite3.OperationalError(message))
+
+    def test_ignores_other_operational_errors(self) -> None:
+        assert not is_busy_error(sqlite3.OperationalError("no such table: t"))
+
+    def test_ignores_other_exceptions(self) -> None:
+        assert not is_busy_error(ValueError("database is locked"))
+
+
+class TestRetryOnBusy:
+    @pytest.fixture
+    def policy(self) -> BusyRetryPolicy:
+        return BusyRetryPolicy(attempts=3, base_delay=0.0, max_delay=0.0)
+
+    def test_returns_result_without_retry(self, policy: BusyRetryPolicy) -> None:
+        assert retry_on_busy(lambda: 42, policy) == 42
+
+    def test_retries_until_success(self, policy: BusyRetryPolicy) -> None:
+        calls: list[int] = []
+        retries: list[int] = []
+
+        def operation() -> str:
+            calls.append(1)
+            if len(calls) < 3:
+                msg = "database is locked"
+                raise sqlite3.OperationalError(msg)
+            return "ok"
+
+        result = retry_on_busy(
+            operation, policy, on_retry=lambda attempt, _: retries.append(attempt)
+        )
+
+        assert result == "ok"
+        assert len(calls) == 3
+        assert retries == [0, 1]
+
+    def test_raises_after_last_attempt(self, policy: BusyRetryPolicy) -> None:
+        calls: list[int] = []
+
+        def operation() -> None:
+            calls.append(1)
+            msg = "database is locked"
+            raise sqlite3.OperationalError(msg)
+
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            retry_on_busy(operation, policy)
+        assert len(calls) == 3
+
+    def test_does_not_retry_other_errors(self, policy: BusyRetryPolicy) -> None:
+        calls: list[int] = []
+
+        def operation() -> None:
+            calls.append(1)
+            msg = "no such table: t"
+            raise sqlite3.OperationalError(msg)
+
+        with pytest.raises(sqlite3.OperationalError, match="no such table"):
+            retry_on_busy(operation, policy)
+        assert len(calls) == 1
+
+    def test_retries_real_lock_contention(self, tmp_path: Path) -> None:
+        db_path = str(tmp_path / "locked.db")
+        with connect(db_path) as conn:
+            _ = conn.execute("CREATE TABLE t (x INTEGER)")
+
+        holder = sqlite3.connect(db_path, isolation_level=None)
+        _ = holder.execute("BEGIN IMMEDIATE")
+        policy = BusyRetryPolicy(attempts=2, busy_timeout=0, base_delay=0.0)
+
+        def write() -> None:
+            with connect(db_path, busy_timeout=policy.busy_timeout) as conn:
+                _ = conn.execute("INSERT INTO t VALUES (1)")
+
+        try:
+            with pytest.raises(sqlite3.OperationalError) as exc_info:
+                retry_on_busy(write, policy)
+            assert is_busy_error(exc_info.value)
+        finally:
+            _ = holder.execute("ROLLBACK")
+            holder.close()
+
+        retry_on_busy(write, policy)
+        with connect(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+
+
+CACHE_SCHEMA = ("CREATE TABLE t (x INTEGER)",)
+
+
+class TestCacheDatabase:
+    def test_creates_schema_in_ignored_cache_dir(self, tmp_path: Path) -> None:
+        db_path = tmp_path / ".cache" / "cache.db"
+
+        ensure_cache_schema(db_path, 1, CACHE_SCHEMA)
+
+        with open_cache(db_path) as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert (tmp_path / ".cache" / ".gitignore").exists()
+
+    def test_new_version_drops_old_tables(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "cache.db"
+        ensure_cache_schema(db_path, 1, CACHE_SCHEMA)
+        with open_cache(db_path, write=True) as conn:
+            _ = conn.execute("INSERT INTO t VALUES (1)")
+
+        ensure_cache_schema(db_path, 1, CACHE_SCHEMA, drop=["t"])
+        with open_cache(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+        ensure_cache_schema(db_path, 2, CACHE_SCHEMA, drop=["t"])
+
+        with open_cache(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_replaces_file_that_is_not_a_database(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "cache.db"
+        _ = db_path.write_bytes(b"not a database" * 100)
+
+        ensure_cache_schema(db_path, 1, CACHE_SCHEMA)
+
+        with open_cache(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_write_rolls_back_on_error(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "cache.db"
+        ensure_cache_schema(db_path, 1, CACHE_SCHEMA)
+
+        with pytest.raises(_TestError), open_cache(db_path, write=True) as conn:
+            _ = conn.execute("INSERT INTO t VALUES (1)")
+            raise _TestError
+
+        with open_cache(db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
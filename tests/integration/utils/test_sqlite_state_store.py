@@ -1,3 +1,4 @@
+import sqlite3
 import time
 from pathlib import Path
 
@@ -6,6 +7,7 @@ import pytest
 from oaps.utils._state_store import (
     SQLiteStateStore,
     StateStore,
+    _ensure_state_schema,
 )
 
 
@@ -285,3 +287,111 @@ class TestSQLiteStateStoreTimestamps:
         assert updated_entry is not None
 
         assert updated_entry.updated_at > original_entry.updated_at
+
+
+class TestSQLiteStateStoreAtomicIncrement:
+    def test_initializes_missing_key(self, store: SQLiteStateStore) -> None:
+        assert store.atomic_increment("count", 5) == 5
+
+    def test_truncates_float_values(self, store: SQLiteStateStore) -> None:
+        store.set("count", 2.9)
+
+        assert store.atomic_increment("count") == 3
+        assert store["count"] == 3
+
+    def test_treats_non_numeric_values_as_zero(self, store: SQLiteStateStore) -> None:
+        store.set("text", "abc")
+        store.set("blob", b"\x01")
+
+        assert store.atomic_increment("text") == 1
+        assert store.atomic_increment("blob", -2) == -2
+
+    def test_set_replaces_counter_with_other_type(
+        self, store: SQLiteStateStore
+    ) -> None:
+        _ = store.atomic_increment("key", 3)
+
+        store.set("key", "text")
+
+        assert store["key"] == "text"
+
+
+_V1_SCHEMA = """
+CREATE TABLE state_store (
+    session_id TEXT,
+    key TEXT NOT NULL,
+    value BLOB,
+    created_at TEXT NOT NULL,
+    created_by TEXT,
+    updated_at TEXT NOT NULL,
+    updated_by TEXT,
+    PRIMARY KEY (session_id, key)
+);
+CREATE INDEX idx_state_store_session_updated ON state_store (session_id, updated_at);
+"""
+
+
+class TestSQLiteStateStoreSchemaMigration:
+    @pytest.fixture
+    def v1_db(self, db_path: Path) -> Path:
+        with sqlite3.connect(db_path) as conn:
+            _ = conn.executescript(_V1_SCHEMA)
+            _ = conn.executemany(
+                "INSERT INTO state_store VALUES (?, ?, ?, 't0', 'me', 't1', NULL)",
+                [
+                    ("s1", "int", 7),
+                    ("s1", "real", 1.5),
+                    ("s1", "text", "hello"),
+                    ("s1", "blob", b"\x00\xff"),
+                    ("s1", "null", None),
+                    ("", "project", 1),
+                ],
+            )
+        conn.close()
+        return db_path
+
+    def test_new_database_is_current_version(self, db_path: Path) -> None:
+        assert _ensure_state_schema(str(db_path)) == 0
+        assert _ensure_state_schema(str(db_path)) == 2
+
+    def test_migrates_v1_values_and_metadata(self, v1_db: Path) -> None:
+        store = SQLiteStateStore(v1_db, session_id="s1")
+
+        assert _ensure_state_schema(str(v1_db)) == 2
+        assert store["int"] == 7
+        assert store["real"] == 1.5
+        assert store["text"] == "hello"
+        assert store["blob"] == b"\x00\xff"
+        assert store["null"] is None
+        assert SQLiteStateStore(v1_db)["project"] == 1
+        entry = store.get_entry("int")
+        assert entry is not None
+        assert (entry.created_at, entry.created_by, entry.updated_at) == (
+            "t0",
+            "me",
+            "t1",
+        )
+
+    def test_stores_values_in_typed_columns(self, v1_db: Path) -> None:
+        _ = SQLiteStateStore(v1_db)
+
+        with sqlite3.connect(v1_db) as conn:
+            rows = conn.execute(
+                "SELECT key, typeof(int_value), typeof(real_value), "
+                "typeof(text_value), typeof(blob_value) FROM state_store "
+                "WHERE session_id = 's1' ORDER BY key"
+            ).fetchall()
+        conn.close()
+
+        assert rows == [
+            ("blob", "null", "null", "null", "blob"),
+            ("int", "integer", "null", "null", "null"),
+            ("null", "null", "null", "null", "null"),
+            ("real", "null", "real", "null", "null"),
+            ("text", "null", "null", "text", "null"),
+        ]
+
+    def test_migrated_counters_increment(self, v1_db: Path) -> None:
+        store = SQLiteStateStore(v1_db, session_id="s1")
+
+        assert store.atomic_increment("int", 3) == 10
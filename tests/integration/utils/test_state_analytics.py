@@ -0,0 +1,122 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from oaps.utils._state_analytics import (
+    StateAnalytics,
+    iter_state_batches,
+    write_state_snapshot,
+)
+from oaps.utils._state_store import SQLiteStateStore
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    path = tmp_path / "state.db"
+    for session_id, tools, subagents in [("s1", 3, 1), ("s2", 5, 4), ("s3", 1, 0)]:
+        store = SQLiteStateStore(path, session_id=session_id)
+        store.atomic_increment("oaps.tools.total_count", tools)
+        store.atomic_increment("oaps.tools.Read.count", tools)
+        store.atomic_increment("oaps.prompts.count", 2)
+        if subagents:
+            store.atomic_increment("oaps.subagents.spawn_count", subagents)
+        store.set("blob", b"\x00\x01")
+    SQLiteStateStore(path).set("project-only", 99)
+    return path
+
+
+class TestIterStateBatches:
+    def test_excludes_project_scope(self, db_path: Path) -> None:
+        batches = list(iter_state_batches(db_path))
+
+        session_ids = {
+            sid for batch in batches for sid in batch["session_id"].to_pylist()
+        }
+        assert session_ids == {"s1", "s2", "s3"}
+
+    def test_respects_batch_size(self, db_path: Path) -> None:
+        batches = list(iter_state_batches(db_path, batch_size=4))
+
+        assert all(batch.num_rows <= 4 for batch in batches)
+        assert sum(batch.num_rows for batch in batches) == 14
+
+    def test_splits_numeric_and_blob_values(self, db_path: Path) -> None:
+        rows = [
+            row for batch in iter_state_batches(db_path) for row in batch.to_pylist()
+        ]
+
+        blob = next(row for row in rows if row["key"] == "blob")
+        assert blob["value_type"] == "blob"
+        assert blob["num_value"] is None
+        count = next(row for row in rows if row["key"] == "oaps.prompts.count")
+        assert count["num_value"] == 2
+
+    def test_since_filter_in_future_returns_nothing(self, db_path: Path) -> None:
+        since = datetime.now(UTC) + timedelta(days=1)
+
+        assert list(iter_state_batches(db_path, since=since)) == []
+
+
+class TestStateAnalytics:
+    def test_summary(self, db_path: Path) -> None:
+        with StateAnalytics.from_database(db_path) as analytics:
+            row = analytics.summary().to_dicts()[0]
+
+        assert row["sessions"] == 3
+        assert row["total_tools"] == 9
+        assert row["avg_tools"] == 3.0
+        assert row["avg_prompts"] == 2.0
+
+    def test_top_sessions_by_subagents(self, db_path: Path) -> None:
+        with StateAnalytics.from_database(db_path) as analytics:
+            result = analytics.top_sessions("subagents", limit=2)
+
+        assert [row[0] for row in result.rows] == ["s2", "s1"]
+        assert result.columns[1] == "subagents"
+
+    def test_top_sessions_rejects_unknown_metric(self, db_path: Path) -> None:
+        with (
+            StateAnalytics.from_database(db_path) as analytics,
+            pytest.raises(ValueError, match="Unknown session metric"),
+        ):
+            analytics.top_sessions("bogus")  # pyright: ignore[reportArgumentType]
+
+    def test_tool_usage_excludes_total_count(self, db_path: Path) -> None:
+        with StateAnalytics.from_database(db_path) as analytics:
+            result = analytics.tool_usage()
+
+        assert result.to_dicts() == [{"tool": "Read", "invocations": 9, "sessions": 3}]
+
+    def test_timeline_buckets_sessions(self, db_path: Path) -> None:
+        with StateAnalytics.from_database(db_path) as analytics:
+            result = analytics.timeline("day")
+
+        assert len(result.rows) == 1
+        assert result.to_dicts()[0]["sessions"] == 3
+
+    def test_ad_hoc_query(self, db_path: Path) -> None:
+        with StateAnalytics.from_database(db_path) as analytics:
+            result = analytics.query(
+                "SELECT session_id FROM sessions WHERE tools > ? ORDER BY 1", [2]
+            )
+
+        assert result.rows == [("s1",), ("s2",)]
+
+    def test_empty_database(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.db"
+        SQLiteStateStore(path)
+
+        with StateAnalytics.from_database(path) as analytics:
+            row = analytics.summary().to_dicts()[0]
+
+        assert row["sessions"] == 0
+
+    def test_parquet_snapshot_roundtrip(self, db_path: Path, tmp_path: Path) -> None:
+        snapshot = tmp_path / "state.parquet"
+
+        count = write_state_snapshot(db_path, snapshot)
+
+        assert count == 14
+        with StateAnalytics.from_parquet(snapshot) as analytics:
+            assert analytics.summary().to_dicts()[0]["total_tools"] == 9
@@ -0,0 +1,218 @@
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from oaps.utils import StateJournal, get_state_journal_dir, merge_state_journal
+from oaps.utils._state_journal import (
+    JournalEntry,
+    list_journal_segments,
+    read_journal_segment,
+)
+from oaps.utils._state_store import SQLiteStateStore
+from oaps.utils.database import BusyRetryPolicy
+
+# Fail fast: one attempt that does not wait for the lock
+_NO_WAIT = BusyRetryPolicy(attempts=1, busy_timeout=0)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "state.db"
+
+
+@pytest.fixture
+def journal(db_path: Path) -> StateJournal:
+    return StateJournal(get_state_journal_dir(db_path))
+
+
+@pytest.fixture
+def store(db_path: Path, journal: StateJournal) -> SQLiteStateStore:
+    return SQLiteStateStore(
+        db_path, session_id="s1", retry_policy=_NO_WAIT, journal=journal
+    )
+
+
+@pytest.fixture
+def locked(db_path: Path, store: SQLiteStateStore) -> Iterator[None]:
+    """Hold the database write lock from another connection."""
+    _ = store
+    holder = sqlite3.connect(db_path, isolation_level=None)
+    _ = holder.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    finally:
+        _ = holder.execute("ROLLBACK")
+        holder.close()
+
+
+class TestStateJournal:
+    def test_journal_dir_is_sibling_of_database(self, db_path: Path) -> None:
+        assert get_state_journal_dir(db_path) == db_path.parent / "state.journal"
+
+    def test_append_writes_one_segment_per_entry(self, journal: StateJournal) -> None:
+        first = JournalEntry.for_set("s1", "a", 1, at="t", author=None)
+        second = JournalEntry.for_set("s1", "b", "x", at="t", author="me")
+
+        _ = journal.append(first)
+        _ = journal.append(second)
+
+        segments = list_journal_segments(journal.directory)
+        assert len(segments) == 2
+        assert [read_journal_segment(s)[0] for s in segments] == [first, second]
+        assert journal.pending == [first, second]
+
+    def test_bytes_round_trip(self) -> None:
+        entry = JournalEntry.for_set("s1", "k", b"\x00\xff", at="t", author=None)
+
+        restored = JournalEntry.model_validate_json(entry.model_dump_json())
+
+        assert restored.decoded_value == b"\x00\xff"
+
+    def test_missing_directory_has_no_segments(self, tmp_path: Path) -> None:
+        assert list_journal_segments(tmp_path / "missing") == []
+
+
+@pytest.mark.usefixtures("locked")
+class TestDeferredWrites:
+    def test_set_is_journaled_when_locked(
+        self, store: SQLiteStateStore, journal: StateJournal
+    ) -> None:
+        store.set("key", "value", author="hook")
+
+        assert len(list_journal_segments(journal.directory)) == 1
+        assert journal.pending[0].op == "set"
+
+    def test_increment_estimates_pending_total(
+        self, store: SQLiteStateStore, journal: StateJournal
+    ) -> None:
+        assert store.atomic_increment("count") == 1
+        assert store.atomic_increment("count", 2) == 3
+        assert len(journal.pending) == 2
+
+    def test_delete_and_clear_are_journaled(
+        self, store: SQLiteStateStore, journal: StateJournal
+    ) -> None:
+        _ = store.delete("key")
+        store.clear()
+
+        assert [entry.op for entry in journal.pending] == ["delete", "clear"]
+
+    def test_raises_without_journal(self, db_path: Path) -> None:
+        store = SQLiteStateStore(db_path, session_id="s1", retry_policy=_NO_WAIT)
+
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            store.set("key", "value")
+
+
+class TestMergeStateJournal:
+    def test_no_journal_is_noop(self, db_path: Path) -> None:
+        assert merge_state_journal(db_path) == 0
+
+    def test_applies_deferred_writes_in_order(
+        self, db_path: Path, store: SQLiteStateStore, journal: StateJournal
+    ) -> None:
+        store.set("existing", "old")
+        holder = sqlite3.connect(db_path, isolation_level=None)
+        _ = holder.execute("BEGIN IMMEDIATE")
+        try:
+            store.set("existing", "new", author="hook")
+            store.set("blob", b"\x01\x02")
+            _ = store.atomic_increment("count", 5)
+            _ = store.atomic_increment("count", 2)
+            _ = store.delete("gone")
+        finally:
+            _ = holder.execute("ROLLBACK")
+            holder.close()
+
+        applied = merge_state_journal(db_path)
+
+        assert applied == 5
+        assert store["existing"] == "new"
+        assert store.get_entry("existing").updated_by == "hook"  # pyright: ignore[reportOptionalMemberAccess]
+        assert store["blob"] == b"\x01\x02"
+        assert store["count"] == 7
+        assert list_journal_segments(journal.directory) == []
+
+    def test_skips_segments_already_applied(
+        self, db_path: Path, store: SQLiteStateStore, journal: StateJournal
+    ) -> None:
+        segment = journal.append(
+            JournalEntry(
+                op="increment", session_id="s1", key="n", amount=1, at="t", seq=1
+            )
+        )
+        # Simulate a crash after commit but before the segment was removed
+        with sqlite3.connect(db_path) as conn:
+            _ = conn.execute(
+                "CREATE TABLE IF NOT EXISTS state_journal_applied "
+                "(segment TEXT PRIMARY KEY)"
+            )
+            _ = conn.execute(
+                "INSERT INTO state_journal_applied VALUES (?)", (segment.name,)
+            )
+        conn.close()
+
+        assert merge_state_journal(db_path) == 0
+        assert "n" not in store
+        assert not segment.exists()
+
+    def test_moves_corrupt_segments_aside(
+        self, db_path: Path, journal: StateJournal
+    ) -> None:
+        journal.directory.mkdir(parents=True)
+        bad = journal.directory / "00000000000000000001-1-deadbeef.jsonl"
+        _ = bad.write_text("not json\n")
+
+        assert merge_state_journal(db_path) == 0
+        assert not bad.exists()
+        assert (journal.directory / f"{bad.name}.bad").exists()
+
+    def test_leaves_journal_when_locked(
+        self, db_path: Path, store: SQLiteStateStore, journal: StateJournal
+    ) -> None:
+        _ = store
+        _ = journal.append(JournalEntry.for_set("s1", "k", 1, at="t", author=None))
+        holder = sqlite3.connect(db_path, isolation_level=None)
+        _ = holder.execute("BEGIN IMMEDIATE")
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                _ = merge_state_journal(db_path, busy_timeout=0)
+        finally:
+            _ = holder.execute("ROLLBACK")
+            holder.close()
+
+        assert len(list_journal_segments(journal.directory)) == 1
+
+    def test_concurrent_mergers_apply_each_segment_once(
+        self, db_path: Path, store: SQLiteStateStore, journal: StateJournal
+    ) -> None:
+        store.set("n", 0)
+        for seq in range(1, 51):
+            _ = journal.append(
+                JournalEntry(
+                    op="increment", session_id="s1", key="n", amount=1, at="t", seq=seq
+                )
+            )
+        barrier = threading.Barrier(4)
+        applied: list[int] = []
+
+        def merge() -> None:
+            _ = barrier.wait()
+            applied.append(merge_state_journal(db_path))
+
+        threads = [threading.Thread(target=merge) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(applied) == 50
+        assert store["n"] == 50
+        assert list_journal_segments(journal.directory) == []
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute("SELECT count(*) FROM state_journal_applied").fetchone()
+        conn.close()
+        assert rows == (0,)
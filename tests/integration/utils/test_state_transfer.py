@@ -0,0 +1,140 @@
+import sqlite3
+from pathlib import Path
+
+import orjson
+import pytest
+
+from oaps.utils._state_store import SQLiteStateStore
+from oaps.utils._state_transfer import (
+    TransferFormat,
+    export_state,
+    import_state,
+    infer_transfer_format,
+)
+
+_ROW_SQL = (
+    "SELECT key, value, typeof(value), created_at, created_by, updated_at, "
+    "updated_by FROM state_store WHERE session_id = ? ORDER BY key"
+)
+
+
+def _rows(db_path: Path, scope: str) -> list[tuple[object, ...]]:
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(_ROW_SQL, (scope,)).fetchall()
+    conn.close()
+    return rows
+
+
+@pytest.fixture
+def source_db(tmp_path: Path) -> Path:
+    db_path = tmp_path / "source.db"
+    store = SQLiteStateStore(db_path, session_id="s1")
+    store.set("text", "hello", author="alice")
+    store.set("int", 2**62, author="bob")
+    store.set("real", 0.1 + 0.2)
+    store.set("blob", b"\x00\xff\x10binary")
+    store.set("null", None)
+    store.set("text", "updated", author="carol")
+    SQLiteStateStore(db_path).set("project-only", 1)
+    return db_path
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "parquet"])
+class TestRoundTrip:
+    def test_preserves_values_and_metadata(
+        self, source_db: Path, tmp_path: Path, fmt: TransferFormat
+    ) -> None:
+        export_path = tmp_path / f"export.{fmt}"
+        target_db = tmp_path / "target.db"
+
+        exported = export_state(source_db, export_path, session_id="s1")
+        imported = import_state(target_db, export_path, session_id="s1")
+
+        assert exported == imported == 5
+        assert _rows(target_db, "s1") == _rows(source_db, "s1")
+
+    def test_imports_into_another_scope(
+        self, source_db: Path, tmp_path: Path, fmt: TransferFormat
+    ) -> None:
+        export_path = tmp_path / f"export.{fmt}"
+        _ = export_state(source_db, export_path, session_id=None)
+
+        _ = import_state(source_db, export_path, session_id="s2")
+
+        store = SQLiteStateStore(source_db, session_id="s2")
+        assert list(store) == ["project-only"]
+
+    def test_small_batches(
+        self, source_db: Path, tmp_path: Path, fmt: TransferFormat
+    ) -> None:
+        export_path = tmp_path / f"export.{fmt}"
+        target_db = tmp_path / "target.db"
+
+        _ = export_state(source_db, export_path, session_id="s1", batch_size=2)
+        _ = import_state(target_db, export_path, session_id="s1", batch_size=2)
+
+        assert _rows(target_db, "s1") == _rows(source_db, "s1")
+
+
+class TestImport:
+    def test_overwrites_existing_keys(self, source_db: Path, tmp_path: Path) -> None:
+        export_path = tmp_path / "export.jsonl"
+        _ = export_state(source_db, export_path, session_id="s1")
+        store = SQLiteStateStore(source_db, session_id="s1")
+        store.set("text", "local change", author="dave")
+
+        _ = import_state(source_db, export_path, session_id="s1")
+
+        entry = store.get_entry("text")
+        assert entry is not None
+        assert entry.value == "updated"
+        assert entry.updated_by == "carol"
+
+    def test_replace_removes_other_keys(self, source_db: Path, tmp_path: Path) -> None:
+        export_path = tmp_path / "export.jsonl"
+        _ = export_state(source_db, export_path, session_id=None)
+
+        _ = import_state(source_db, export_path, session_id="s1", replace=True)
+
+        assert list(SQLiteStateStore(source_db, session_id="s1")) == ["project-only"]
+
+    def test_malformed_file_writes_nothing(
+        self, source_db: Path, tmp_path: Path
+    ) -> None:
+        export_path = tmp_path / "export.jsonl"
+        _ = export_state(source_db, export_path, session_id="s1")
+        with export_path.open("ab") as f:
+            _ = f.write(orjson.dumps({"key": "bad", "value_type": "integer"}) + b"\n")
+
+        with pytest.raises(ValueError, match=r"export\.jsonl:6"):
+            _ = import_state(tmp_path / "target.db", export_path, session_id="s1")
+
+        assert _rows(tmp_path / "target.db", "s1") == []
+
+    def test_rejects_invalid_base64(self, tmp_path: Path) -> None:
+        export_path = tmp_path / "export.jsonl"
+        record = {
+            "key": "k",
+            "value_type": "blob",
+            "value": "not base64!",
+            "created_at": "t",
+            "updated_at": "t",
+        }
+        _ = export_path.write_bytes(orjson.dumps(record))
+
+        with pytest.raises(ValueError, match="base64"):
+            _ = import_state(tmp_path / "target.db", export_path)
+
+
+class TestInferTransferFormat:
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("state.parquet", "parquet"),
+            ("state.PQ", "parquet"),
+            ("state.jsonl", "jsonl"),
+            ("state.ndjson", "jsonl"),
+        ],
+    )
+    def test_from_extension(self, name: str, expected: str) -> None:
+        assert infer_transfer_format(name) == expected
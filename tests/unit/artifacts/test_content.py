@@ -0,0 +1,85 @@
+"""Tests for streaming artifact content access."""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from oaps.artifacts._content import (
+    hash_content,
+    iter_content,
+    map_content,
+    resolve_range,
+)
+
+DATA = bytes(range(256)) * 40
+
+
+@pytest.fixture
+def content_file(tmp_path: Path) -> Path:
+    path = tmp_path / "data.bin"
+    _ = path.write_bytes(DATA)
+    return path
+
+
+class TestResolveRange:
+    def test_clips_to_size(self) -> None:
+        assert resolve_range(100, 90, 200) == (90, 100)
+        assert resolve_range(100, 150) == (100, 100)
+
+    def test_defaults_to_whole_file(self) -> None:
+        assert resolve_range(100) == (0, 100)
+
+    @pytest.mark.parametrize(("start", "end"), [(-1, None), (10, 5)])
+    def test_rejects_invalid_range(self, start: int, end: int | None) -> None:
+        with pytest.raises(ValueError, match="must not be"):
+            _ = resolve_range(100, start, end)
+
+
+class TestIterContent:
+    def test_streams_whole_file_in_chunks(self, content_file: Path) -> None:
+        chunks = list(iter_content(content_file, chunk_size=4096))
+
+        assert [len(chunk) for chunk in chunks] == [4096, 4096, 2048]
+        assert b"".join(chunks) == DATA
+
+    def test_streams_range(self, content_file: Path) -> None:
+        chunks = list(iter_content(content_file, start=100, end=300, chunk_size=64))
+
+        assert b"".join(chunks) == DATA[100:300]
+        assert max(len(chunk) for chunk in chunks) == 64
+
+    def test_range_past_end_is_empty(self, content_file: Path) -> None:
+        assert list(iter_content(content_file, start=len(DATA) + 1)) == []
+
+    def test_rejects_non_positive_chunk_size(self, content_file: Path) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            _ = next(iter_content(content_file, chunk_size=0))
+
+
+class TestMapContent:
+    def test_maps_file(self, content_file: Path) -> None:
+        with map_content(content_file) as view:
+            assert view.readonly
+            assert bytes(view[10:20]) == DATA[10:20]
+            assert len(view) == len(DATA)
+
+    def test_maps_empty_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "empty.bin"
+        _ = path.write_bytes(b"")
+
+        with map_content(path) as view:
+            assert len(view) == 0
+
+
+class TestHashContent:
+    def test_matches_hashlib(self, content_file: Path) -> None:
+        assert hash_content(content_file) == hashlib.sha256(DATA).hexdigest()
+        assert (
+            hash_content(content_file, algorithm="blake2b")
+            == hashlib.blake2b(DATA).hexdigest()
+        )
+
+    def test_rejects_unknown_algorithm(self, content_file: Path) -> None:
+        with pytest.raises(ValueError, match="unsupported"):
+            _ = hash_content(content_file, algorithm="nope")
@@ -0,0 +1,116 @@
+"""Tests for the artifact reference graph."""
+
+import pytest
+
+from oaps.artifacts._graph import ArtifactGraph
+
+
+@pytest.fixture
+def graph() -> ArtifactGraph:
+    """Build a graph with a reference chain, a cycle, and a supersession chain.
+
+    RV-0001 -> DC-0001 -> FR-0001 (missing)
+    AN-0001 -> RV-0001
+    AN-0002 <-> AN-0003
+    DC-0002 supersedes DC-0001, DC-0003 supersedes DC-0002
+    """
+    return ArtifactGraph(
+        [
+            {"id": "RV-0001", "references": ["DC-0001"]},
+            {"id": "DC-0001", "references": ["FR-0001"], "superseded_by": "DC-0002"},
+            {"id": "AN-0001", "references": ["RV-0001"]},
+            {"id": "AN-0002", "references": ["AN-0003"]},
+            {"id": "AN-0003", "references": ["AN-0002"]},
+            {"id": "DC-0002", "supersedes": "DC-0001"},
+            {"id": "DC-0003", "supersedes": "DC-0002"},
+        ]
+    )
+
+
+class TestTraversal:
+    def test_transitive_dependents(self, graph: ArtifactGraph) -> None:
+        assert graph.dependents("DC-0001") == ["AN-0001", "RV-0001"]
+
+    def test_direct_dependents(self, graph: ArtifactGraph) -> None:
+        assert graph.dependents("DC-0001", transitive=False) == ["RV-0001"]
+
+    def test_dependencies_include_dangling(self, graph: ArtifactGraph) -> None:
+        assert graph.dependencies("AN-0001") == ["DC-0001", "FR-0001", "RV-0001"]
+        assert graph.dependencies("AN-0001", transitive=False) == ["RV-0001"]
+
+    def test_cycle_members_exclude_themselves(self, graph: ArtifactGraph) -> None:
+        assert graph.dependents("AN-0002") == ["AN-0003"]
+
+    def test_unknown_ids(self, graph: ArtifactGraph) -> None:
+        assert graph.dependents("XX-0001") == []
+        assert graph.dependencies("FR-0001") == []
+
+
+class TestSupersession:
+    def test_chain_from_any_member(self, graph: ArtifactGraph) -> None:
+        expected = ["DC-0001", "DC-0002", "DC-0003"]
+
+        assert graph.supersession_chain("DC-0001") == expected
+        assert graph.supersession_chain("DC-0002") == expected
+        assert graph.supersession_chain("DC-0003") == expected
+
+    def test_head(self, graph: ArtifactGraph) -> None:
+        assert graph.supersession_head("DC-0001") == "DC-0003"
+        assert graph.supersession_head("RV-0001") == "RV-0001"
+
+    def test_cyclic_chain_terminates(self) -> None:
+        graph = ArtifactGraph(
+            [
+                {"id": "DC-0001", "supersedes": "DC-0002"},
+                {"id": "DC-0002", "supersedes": "DC-0001"},
+            ]
+        )
+
+        assert sorted(graph.supersession_chain("DC-0001")) == ["DC-0001", "DC-0002"]
+
+
+class TestIntegrity:
+    def test_dangling_references(self, graph: ArtifactGraph) -> None:
+        assert graph.dangling_references() == {"DC-0001": ["FR-0001"]}
+
+    def test_cycles(self, graph: ArtifactGraph) -> None:
+        graph.put({"id": "RV-0002", "references": ["RV-0002"]})
+
+        assert graph.cycles() == [["AN-0002", "AN-0003"], ["RV-0002"]]
+
+
+class TestUpdates:
+    def test_put_replaces_links(self, graph: ArtifactGraph) -> None:
+        graph.put({"id": "RV-0001", "references": ["AN-0002"]})
+
+        assert graph.dependents("DC-0001") == []
+        assert graph.dependents("AN-0003") == ["AN-0001", "AN-0002", "RV-0001"]
+
+    def test_adding_target_resolves_dangling_reference(
+        self, graph: ArtifactGraph
+    ) -> None:
+        graph.put({"id": "FR-0001"})
+
+        assert graph.dangling_references() == {}
+        assert graph.dependents("FR-0001", transitive=False) == ["DC-0001"]
+
+    def test_remove_makes_references_dangling(self, graph: ArtifactGraph) -> None:
+        assert graph.remove("RV-0001")
+        assert not graph.remove("RV-0001")
+
+        assert graph.dangling_references() == {
+            "AN-0001": ["RV-0001"],
+            "DC-0001": ["FR-0001"],
+        }
+        assert not graph.contains("RV-0001")
+
+    def test_remove_drops_outgoing_references(self, graph: ArtifactGraph) -> None:
+        _ = graph.remove("DC-0001")
+
+        assert graph.dependencies("RV-0001") == ["DC-0001"]
+        assert graph.dangling_references() == {"RV-0001": ["DC-0001"]}
+        assert graph.count == 6
+
+    def test_rejects_summary_without_id(self, graph: ArtifactGraph) -> None:
+        with pytest.raises(ValueError, match="id"):
+            graph.put({"references": ["RV-0001"]})
@@ -6,7 +6,8 @@ from pathlib import Path
 
 import pytest
 
-from oaps.artifacts._index import ArtifactIndex
+from oaps.artifacts import _index
+from oaps.artifacts._index import ArtifactIndex, get_index_journal_path
 
 
 @pytest.fixture
@@ -212,6 +213,64 @@ class TestFilter:
         assert results == []
 
 
+class TestFilterSortingAndPagination:
+    def test_sorts_by_created(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+
+        results = index.filter(sort_by="created", descending=True)
+
+        assert [a["id"] for a in results] == ["DC-0001", "RV-0002", "RV-0001"]
+
+    def test_sorts_by_title(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+
+        results = index.filter(sort_by="title")
+
+        assert [a["id"] for a in results] == ["DC-0001", "RV-0002", "RV-0001"]
+
+    def test_missing_sort_values_sort_first(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+        index.put({"id": "RV-0003", "type": "review"})
+
+        ascending = index.filter(sort_by="status")
+        descending = index.filter(sort_by="status", descending=True)
+
+        assert [a["id"] for a in ascending] == [
+            "RV-0003",
+            "RV-0001",
+            "DC-0001",
+            "RV-0002",
+        ]
+        assert descending == ascending[::-1]
+
+    def test_descending_without_sort_key_reverses(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+
+        results = index.filter(descending=True)
+
+        assert [a["id"] for a in results] == ["DC-0001", "RV-0002", "RV-0001"]
+
+    def test_paginates(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+
+        page = index.filter(sort_by="id", limit=2, offset=1)
+
+        assert [a["id"] for a in page] == ["RV-0001", "RV-0002"]
+
+    def test_paginates_by_type(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+
+        page = index.get_by_type("RV", sort_by="id", descending=True, limit=1)
+
+        assert [a["id"] for a in page] == ["RV-0002"]
+
+    def test_rejects_negative_limit(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+
+        with pytest.raises(ValueError, match="limit"):
+            _ = index.filter(limit=-1)
+
+
 class TestGetByType:
     def test_returns_artifacts_of_type(self, index_file: Path) -> None:
         index = ArtifactIndex(index_file)
@@ -312,6 +371,145 @@ class TestFromArtifacts:
         assert index._index_path == tmp_path / "custom.json"
 
 
+class TestPut:
+    def test_adds_new_artifact(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+
+        index.put({"id": "RV-0003", "type": "review", "references": ["DC-0001"]})
+
+        assert index.count == 4
+        assert index.get_next_number("RV") == 4
+        assert index.get_references_to("DC-0001") == ["RV-0003"]
+
+    def test_replaces_in_place(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+
+        index.put({"id": "RV-0001", "type": "review", "status": "draft"})
+
+        assert index.all_ids() == ["DC-0001", "RV-0001", "RV-0002"]
+        assert index.to_dict()["artifacts"][0]["id"] == "RV-0001"
+        assert index.get("RV-0001") == {
+            "id": "RV-0001",
+            "type": "review",
+            "status": "draft",
+        }
+        assert index.get_references_to("FR-0001") == []
+        assert len(index.get_by_type("RV")) == 2
+
+    def test_rejects_summary_without_id(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+
+        with pytest.raises(ValueError, match="id"):
+            index.put({"type": "review"})
+
+
+class TestRemove:
+    def test_removes_artifact(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+
+        assert index.remove("RV-0001")
+
+        assert not index.contains("RV-0001")
+        assert [a["id"] for a in index.get_by_type("RV")] == ["RV-0002"]
+        assert index.get_references_to("FR-0001") == []
+
+    def test_returns_false_for_nonexistent(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+
+        assert not index.remove("XX-9999")
+        assert not get_index_journal_path(index_file).exists()
+
+
+class TestReferenceGraph:
+    def test_builds_from_index(self, index_file: Path) -> None:
+        graph = ArtifactIndex(index_file).reference_graph()
+
+        assert graph.dependents("FR-0001") == ["DC-0001", "RV-0001"]
+        assert graph.dangling_references() == {"RV-0001": ["FR-0001"]}
+
+    def test_follows_put_and_remove(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+        graph = index.reference_graph()
+
+        index.put({"id": "RV-0003", "type": "review", "references": ["DC-0001"]})
+        _ = index.remove("RV-0001")
+
+        assert index.reference_graph() is graph
+        assert graph.dependents("DC-0001") == ["RV-0003"]
+        assert graph.dangling_references() == {"DC-0001": ["RV-0001"]}
+
+
+class TestJournal:
+    def test_changes_are_journaled_not_rewritten(self, index_file: Path) -> None:
+        snapshot = index_file.read_bytes()
+        index = ArtifactIndex(index_file)
+
+        index.put({"id": "RV-0003", "type": "review"})
+        _ = index.remove("DC-0001")
+
+        assert index_file.read_bytes() == snapshot
+        assert index.journal_entries == 2
+        lines = get_index_journal_path(index_file).read_text().splitlines()
+        assert [json.loads(line)["op"] for line in lines] == ["put", "remove"]
+
+    def test_journal_is_replayed_on_load(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+        index.put({"id": "RV-0003", "type": "review"})
+        index.put({"id": "RV-0001", "type": "review", "status": "draft"})
+        _ = index.remove("DC-0001")
+
+        reloaded = ArtifactIndex(index_file)
+
+        assert reloaded.to_dict()["artifacts"] == index.to_dict()["artifacts"]
+        assert reloaded.journal_entries == 3
+
+    def test_skips_partial_journal_line(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+        index.put({"id": "RV-0003", "type": "review"})
+        with get_index_journal_path(index_file).open("ab") as f:
+            _ = f.write(b'{"op": "put", "artif')
+
+        reloaded = ArtifactIndex(index_file)
+
+        assert reloaded.count == 4
+
+    def test_compact_writes_snapshot_and_clears_journal(self, index_file: Path) -> None:
+        index = ArtifactIndex(index_file)
+        index.put({"id": "RV-0003", "type": "review"})
+
+        index.compact()
+
+        assert not get_index_journal_path(index_file).exists()
+        data = json.loads(index_file.read_text())
+        assert [a["id"] for a in data["artifacts"]] == [
+            "RV-0001",
+            "RV-0002",
+            "DC-0001",
+            "RV-0003",
+        ]
+
+    def test_compacts_automatically(
+        self, index_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_index, "_COMPACT_MIN_ENTRIES", 4)
+        index = ArtifactIndex(index_file)
+
+        for number in range(3, 7):
+            index.put({"id": f"RV-{number:04d}", "type": "review"})
+
+        assert index.journal_entries == 0
+        assert not get_index_journal_path(index_file).exists()
+        assert ArtifactIndex(index_file).count == 7
+
+    def test_from_artifacts_is_not_journaled(self, tmp_path: Path) -> None:
+        index = ArtifactIndex.from_artifacts([], index_path=tmp_path / "a.json")
+
+        index.put({"id": "RV-0001"})
+
+        assert index.count == 1
+        assert not get_index_journal_path(tmp_path / "a.json").exists()
+
+
 class TestFilterEdgeCases:
     def test_skips_artifact_with_missing_created(self, tmp_path: Path) -> None:
         index_path = tmp_path / "index.json"
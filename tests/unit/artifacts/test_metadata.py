@@ -15,6 +15,7 @@ from oaps.artifacts._metadata import (
     parse_filename,
     parse_frontmatter,
     parse_sidecar,
+    read_frontmatter_metadata,
     serialize_frontmatter,
     serialize_sidecar,
 )
@@ -324,6 +325,34 @@ Content
             parse_frontmatter(content)
 
 
+class TestReadFrontmatterMetadata:
+    def test_reads_metadata(self, tmp_path: Path) -> None:
+        path = tmp_path / "review.md"
+        path.write_text(
+            "---\nid: RV-0001\ntype: review\ntitle: Review\nstatus: draft\n"
+            "created: 2025-01-15T10:30:00Z\nauthor: reviewer\n---\n" + "Body\n" * 1000
+        )
+
+        metadata = read_frontmatter_metadata(path)
+
+        assert metadata.id == "RV-0001"
+        assert metadata.title == "Review"
+
+    def test_raises_for_missing_frontmatter(self, tmp_path: Path) -> None:
+        path = tmp_path / "review.md"
+        path.write_text("# No frontmatter\n")
+
+        with pytest.raises(ValueError, match="Frontmatter not found"):
+            read_frontmatter_metadata(path)
+
+    def test_raises_for_invalid_yaml(self, tmp_path: Path) -> None:
+        path = tmp_path / "review.md"
+        path.write_text("---\nid: [unclosed\n---\n")
+
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            read_frontmatter_metadata(path)
+
+
 class TestParseSidecar:
     def test_parses_sidecar_file(self, tmp_path: Path) -> None:
         sidecar = tmp_path / "test.metadata.yaml"
@@ -0,0 +1,178 @@
+"""Tests for incremental artifact index rebuilds."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from oaps.artifacts import _rebuild
+from oaps.artifacts._rebuild import get_index_manifest_path
+from oaps.artifacts._store import ArtifactStore
+
+# Far enough in the past that rebuilds trust the stat fingerprint
+_OLD_MTIME_NS = 1_000_000_000_000_000_000
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ArtifactStore:
+    """Create a store with three settled artifacts and a warm manifest."""
+    store = ArtifactStore(tmp_path)
+    store.initialize()
+    for i in range(3):
+        store.add_artifact(type_prefix="DC", title=f"Decision {i}", author="dev")
+    _settle(store)
+    _ = store.rebuild_index()
+    return store
+
+
+def _settle(store: ArtifactStore) -> None:
+    """Move artifact mtimes out of the racy window."""
+    for path in store.artifacts_path.iterdir():
+        os.utime(path, ns=(_OLD_MTIME_NS, _OLD_MTIME_NS))
+
+
+def _artifact_path(store: ArtifactStore, artifact_id: str) -> Path:
+    artifact = store.get_artifact_or_raise(artifact_id)
+    return artifact.file_path
+
+
+class TestIncrementalRebuild:
+    def test_unchanged_files_are_not_parsed(self, store: ArtifactStore) -> None:
+        stats = store.rebuild_index()
+
+        assert stats.files == 3
+        assert stats.indexed == 3
+        assert stats.parsed == 0
+        assert stats.unchanged == 3
+        assert not stats.written
+
+    def test_touched_file_is_matched_by_hash(self, store: ArtifactStore) -> None:
+        path = _artifact_path(store, "DC-0001")
+        os.utime(path, ns=(_OLD_MTIME_NS + 1, _OLD_MTIME_NS + 1))
+
+        stats = store.rebuild_index()
+
+        assert stats.parsed == 0
+        assert not stats.written
+
+    def test_modified_file_is_parsed(self, store: ArtifactStore) -> None:
+        path = _artifact_path(store, "DC-0002")
+        path.write_text(path.read_text().replace("Decision 1", "Renamed"))
+
+        stats = store.rebuild_index()
+
+        assert stats.parsed == 1
+        assert stats.written
+        reloaded = ArtifactStore(store.base_path)
+        assert reloaded.get_artifact_or_raise("DC-0002").title == "Renamed"
+
+    def test_body_edit_is_not_parsed(self, store: ArtifactStore) -> None:
+        path = _artifact_path(store, "DC-0002")
+        _ = path.write_text(path.read_text() + "\nMore body text.\n")
+
+        stats = store.rebuild_index()
+
+        assert stats.parsed == 0
+        assert not stats.written
+
+    def test_removed_file_drops_out(self, store: ArtifactStore) -> None:
+        _artifact_path(store, "DC-0003").unlink()
+
+        stats = store.rebuild_index()
+
+        assert stats.removed == 1
+        assert stats.written
+        assert ArtifactStore(store.base_path).get_index().all_ids() == [
+            "DC-0001",
+            "DC-0002",
+        ]
+
+    def test_recent_file_is_rehashed(self, store: ArtifactStore) -> None:
+        _ = store.add_artifact(type_prefix="DC", title="Fresh", author="dev")
+        _ = store.rebuild_index()
+        manifest = json.loads(get_index_manifest_path(store.index_path).read_text())
+        racy = [name for name, r in manifest["files"].items() if r["racy"]]
+
+        assert len(racy) == 1
+
+    def test_unchanged_rebuild_does_not_rewrite_index(
+        self, store: ArtifactStore
+    ) -> None:
+        mtime = store.index_path.stat().st_mtime_ns
+
+        _ = store.rebuild_index()
+
+        assert store.index_path.stat().st_mtime_ns == mtime
+
+    def test_rebuild_folds_pending_journal(self, store: ArtifactStore) -> None:
+        store.get_index().put({"id": "DC-0099", "type": "decision"})
+
+        stats = store.rebuild_index()
+
+        assert stats.written
+        assert "DC-0099" not in ArtifactStore(store.base_path).get_index().all_ids()
+
+
+class TestManifest:
+    def test_corrupt_manifest_rebuilds_cold(self, store: ArtifactStore) -> None:
+        get_index_manifest_path(store.index_path).write_text("{not json")
+
+        stats = store.rebuild_index()
+
+        assert stats.parsed == 3
+        assert not stats.written
+
+    def test_missing_manifest_rebuilds_cold(self, store: ArtifactStore) -> None:
+        get_index_manifest_path(store.index_path).unlink()
+
+        stats = store.rebuild_index()
+
+        assert stats.parsed == 3
+        assert get_index_manifest_path(store.index_path).exists()
+
+    def test_manifest_is_kept_in_ignored_cache_dir(self, store: ArtifactStore) -> None:
+        shutil.rmtree(get_index_manifest_path(store.index_path).parent)
+
+        _ = store.rebuild_index()
+
+        manifest_path = get_index_manifest_path(store.index_path)
+        assert manifest_path.parent == store.index_path.parent / ".cache"
+        assert manifest_path.exists()
+        assert (manifest_path.parent / ".gitignore").exists()
+
+    def test_invalid_file_is_not_reparsed(self, store: ArtifactStore) -> None:
+        bad = store.artifacts_path / "20240101000000-DC-0042-broken.md"
+        bad.write_text("---\nnot: [valid\n---\n")
+        _settle(store)
+        _ = store.rebuild_index()
+
+        stats = store.rebuild_index()
+
+        assert stats.parsed == 0
+        assert (stats.files, stats.indexed) == (4, 3)
+        assert "DC-0042" not in store.get_index().all_ids()
+
+
+class TestParallelRebuild:
+    def test_matches_serial_rebuild(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_rebuild, "_PARALLEL_MIN_FILES", 2)
+        serial = ArtifactStore(tmp_path / "serial")
+        serial.initialize()
+        for i in range(6):
+            _ = serial.add_artifact(type_prefix="DC", title=f"D{i}", author="dev")
+        _ = serial.rebuild_index(workers=1)
+        parallel = ArtifactStore(tmp_path / "parallel")
+        parallel.initialize()
+        for path in serial.artifacts_path.iterdir():
+            _ = (parallel.artifacts_path / path.name).write_bytes(path.read_bytes())
+
+        stats = parallel.rebuild_index(workers=2)
+
+        assert stats.parsed == 6
+        serial_data = json.loads(serial.index_path.read_text())["artifacts"]
+        parallel_data = json.loads(parallel.index_path.read_text())["artifacts"]
+        assert parallel_data == serial_data
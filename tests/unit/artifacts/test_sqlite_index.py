@@ -0,0 +1,263 @@
+"""Tests for the SQLite-backed artifact index."""
+
+import json
+import sqlite3
+from contextlib import closing
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from oaps.artifacts._index import ArtifactIndex, get_index_journal_path
+from oaps.artifacts._sqlite_index import SQLiteArtifactIndex, get_index_db_path
+
+
+@pytest.fixture
+def index_file(tmp_path: Path) -> Path:
+    """Create index file with sample data."""
+    index_path = tmp_path / "artifacts.json"
+    index_path.write_text(
+        json.dumps(
+            {
+                "updated": "2025-01-15T10:30:00+00:00",
+                "artifacts": [
+                    {
+                        "id": "RV-0001",
+                        "type": "review",
+                        "title": "Security Review",
+                        "status": "complete",
+                        "created": "2025-01-10T10:00:00+00:00",
+                        "author": "alice",
+                        "tags": ["security", "critical"],
+                        "references": ["FR-0001"],
+                    },
+                    {
+                        "id": "RV-0002",
+                        "type": "review",
+                        "title": "Code Review",
+                        "status": "draft",
+                        "created": "2025-01-12T14:00:00+00:00",
+                        "author": "bob",
+                        "tags": ["code"],
+                    },
+                    {
+                        "id": "DC-0001",
+                        "type": "decision",
+                        "title": "Architecture Decision",
+                        "status": "complete",
+                        "created": "2025-01-15T09:00:00+00:00",
+                        "author": "alice",
+                        "references": ["RV-0001", "FR-0001"],
+                    },
+                    {
+                        "id": "DC-0002",
+                        "type": "decision",
+                        "title": "Undated Decision",
+                    },
+                ],
+            }
+        )
+    )
+    return index_path
+
+
+@pytest.fixture
+def index(index_file: Path) -> SQLiteArtifactIndex:
+    return SQLiteArtifactIndex(index_file)
+
+
+def _ids(summaries: list[dict[str, object]]) -> list[object]:
+    return [s["id"] for s in summaries]
+
+
+class TestMatchesArtifactIndex:
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"type_filter": "RV"},
+            {"type_filter": "decision"},
+            {"status_filter": "complete"},
+            {"author_filter": "alice"},
+            {"tag_filter": "code"},
+            {"created_after": datetime(2025, 1, 11, tzinfo=UTC)},
+            {"created_before": datetime(2025, 1, 12, 14, tzinfo=UTC)},
+            {"type_filter": "RV", "author_filter": "alice", "tag_filter": "security"},
+            {"sort_by": "created"},
+            {"sort_by": "created", "descending": True},
+            {"sort_by": "title", "limit": 2},
+            {"sort_by": "status", "descending": True, "offset": 1},
+            {"sort_by": "id", "limit": 0},
+            {"descending": True, "limit": 3, "offset": 1},
+        ],
+    )
+    def test_filter(
+        self, index_file: Path, index: SQLiteArtifactIndex, kwargs: dict[str, object]
+    ) -> None:
+        expected = ArtifactIndex(index_file).filter(**kwargs)  # pyright: ignore[reportArgumentType]
+
+        assert index.filter(**kwargs) == expected  # pyright: ignore[reportArgumentType]
+
+    def test_lookups(self, index_file: Path, index: SQLiteArtifactIndex) -> None:
+        expected = ArtifactIndex(index_file)
+
+        assert index.count == expected.count
+        assert index.get("RV-0002") == expected.get("RV-0002")
+        assert index.get("XX-0001") is None
+        assert index.contains("DC-0001")
+        assert not index.contains("XX-0001")
+        assert index.all_ids() == expected.all_ids()
+        assert index.get_by_type("DC") == expected.get_by_type("DC")
+        assert index.get_next_number("RV") == 3
+        assert index.get_next_number("AN") == 1
+        assert index.get_references_to("FR-0001") == ["RV-0001", "DC-0001"]
+        assert index.to_dict() == expected.to_dict()
+
+
+class TestWrites:
+    def test_put_and_remove(self, index: SQLiteArtifactIndex) -> None:
+        index.put({"id": "RV-0007", "type": "review", "tags": ["code"]})
+        index.put({"id": "RV-0001", "type": "review", "references": ["DC-0001"]})
+        assert index.remove("DC-0001")
+        assert not index.remove("DC-0001")
+
+        assert _ids(index.filter()) == ["RV-0001", "RV-0002", "DC-0002", "RV-0007"]
+        assert _ids(index.filter(tag_filter="code")) == ["RV-0002", "RV-0007"]
+        assert index.get_next_number("RV") == 8
+        assert index.get_references_to("FR-0001") == []
+        assert index.get_references_to("DC-0001") == ["RV-0001"]
+
+    def test_changes_are_journaled(
+        self, index_file: Path, index: SQLiteArtifactIndex
+    ) -> None:
+        index.put({"id": "RV-0003", "type": "review"})
+        _ = index.remove("DC-0002")
+
+        assert index.journal_entries == 2
+        assert (
+            ArtifactIndex(index_file).to_dict()["artifacts"]
+            == index.to_dict()["artifacts"]
+        )
+
+    def test_rejects_summary_without_id(self, index: SQLiteArtifactIndex) -> None:
+        with pytest.raises(ValueError, match="id"):
+            index.put({"type": "review"})
+
+    def test_compact(self, index_file: Path, index: SQLiteArtifactIndex) -> None:
+        index.put({"id": "RV-0003", "type": "review"})
+
+        index.compact()
+
+        assert index.journal_entries == 0
+        assert not get_index_journal_path(index_file).exists()
+        assert len(json.loads(index_file.read_text())["artifacts"]) == 5
+
+    def test_compacts_automatically(
+        self, index: SQLiteArtifactIndex, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("oaps.artifacts._sqlite_index._COMPACT_MIN_ENTRIES", 4)
+
+        for number in range(3, 7):
+            index.put({"id": f"RV-{number:04d}", "type": "review"})
+
+        assert index.journal_entries == 0
+        assert index.count == 8
+
+
+class TestReferenceGraph:
+    def test_matches_artifact_index(
+        self, index_file: Path, index: SQLiteArtifactIndex
+    ) -> None:
+        expected = ArtifactIndex(index_file).reference_graph()
+        graph = index.reference_graph()
+
+        assert graph.dangling_references() == expected.dangling_references()
+        assert graph.dependents("FR-0001") == ["DC-0001", "RV-0001"]
+
+    def test_follows_writes(self, index: SQLiteArtifactIndex) -> None:
+        graph = index.reference_graph()
+
+        index.put({"id": "RV-0003", "type": "review", "references": ["DC-0001"]})
+        _ = index.remove("RV-0001")
+
+        assert index.reference_graph() is graph
+        assert graph.dependents("DC-0001") == ["RV-0003"]
+
+    def test_rebuilds_after_other_instance_writes(
+        self, index_file: Path, index: SQLiteArtifactIndex
+    ) -> None:
+        graph = index.reference_graph()
+
+        SQLiteArtifactIndex(index_file).put(
+            {"id": "RV-0003", "references": ["DC-0002"]}
+        )
+
+        assert index.reference_graph() is not graph
+        assert index.reference_graph().dependents("DC-0002") == ["RV-0003"]
+
+
+class TestCache:
+    def test_creates_database_in_ignored_cache_dir(
+        self, index_file: Path, index: SQLiteArtifactIndex
+    ) -> None:
+        assert index.db_path == get_index_db_path(index_file)
+        assert index.db_path == index_file.parent / ".cache" / "artifacts.db"
+        assert index.db_path.exists()
+        assert (index.db_path.parent / ".gitignore").read_text().endswith("*\n")
+
+    def test_sees_changes_from_other_instances(
+        self, index_file: Path, index: SQLiteArtifactIndex
+    ) -> None:
+        other = SQLiteArtifactIndex(index_file)
+
+        other.put({"id": "RV-0003", "type": "review"})
+
+        assert index.contains("RV-0003")
+
+    def test_resyncs_after_external_change(
+        self, index_file: Path, index: SQLiteArtifactIndex
+    ) -> None:
+        json_index = ArtifactIndex(index_file)
+        json_index.put({"id": "RV-0003", "type": "review"})
+
+        assert index.contains("RV-0003") is False
+        reopened = SQLiteArtifactIndex(index_file)
+
+        assert reopened.contains("RV-0003")
+        assert reopened.journal_entries == 1
+
+    def test_resyncs_after_change_during_load(
+        self,
+        index_file: Path,
+        index: SQLiteArtifactIndex,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        ArtifactIndex(index_file).put({"id": "RV-0003", "type": "review"})
+
+        def load_then_write(path: Path) -> ArtifactIndex:
+            source = ArtifactIndex(path)
+            ArtifactIndex(path).put({"id": "RV-0004", "type": "review"})
+            return source
+
+        with monkeypatch.context() as patch:
+            patch.setattr("oaps.artifacts._sqlite_index.ArtifactIndex", load_then_write)
+            stale = SQLiteArtifactIndex(index_file)
+        assert stale.contains("RV-0004") is False
+
+        assert SQLiteArtifactIndex(index_file).contains("RV-0004")
+
+    def test_rebuilds_cache_from_other_schema_version(
+        self, index_file: Path, index: SQLiteArtifactIndex
+    ) -> None:
+        with closing(sqlite3.connect(get_index_db_path(index_file))) as conn:
+            _ = conn.execute("PRAGMA user_version = 99")
+
+        reopened = SQLiteArtifactIndex(index_file)
+
+        assert reopened.count == 4
+
+    def test_missing_snapshot_gives_empty_index(self, tmp_path: Path) -> None:
+        index = SQLiteArtifactIndex(tmp_path / "artifacts.json")
+
+        assert index.count == 0
+        assert index.get_next_number("RV") == 1
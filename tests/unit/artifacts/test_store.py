@@ -1,11 +1,16 @@
 """Tests for artifact store CRUD operations."""
 
+import hashlib
 import json
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 
 import pytest
 
+from oaps.artifacts._index import ArtifactIndex
 from oaps.artifacts._registry import ArtifactRegistry
+from oaps.artifacts._sqlite_index import SQLiteArtifactIndex
 from oaps.artifacts._store import ArtifactStore
 from oaps.artifacts._types import TypeDefinition
 from oaps.exceptions import (
@@ -13,6 +18,8 @@ from oaps.exceptions import (
     ArtifactValidationError,
     TypeNotRegisteredError,
 )
+from oaps.search import SearchIndex
+from oaps.utils._id_counters import IDCounters
 
 
 @pytest.fixture
@@ -104,6 +111,62 @@ class TestAddArtifact:
 
         assert artifact2.id == "DC-0002"
 
+    def test_does_not_reuse_deleted_number(self, store: ArtifactStore) -> None:
+        store.add_artifact(type_prefix="DC", title="Decision 1", author="dev")
+        store.add_artifact(type_prefix="DC", title="Decision 2", author="dev")
+        store.delete_artifact("DC-0002")
+
+        artifact = store.add_artifact(
+            type_prefix="DC", title="Decision 3", author="dev"
+        )
+
+        assert artifact.id == "DC-0003"
+
+    def test_numbers_past_artifacts_added_outside_counters(
+        self, tmp_path: Path
+    ) -> None:
+        store = ArtifactStore(tmp_path)
+        store.initialize()
+        store.add_artifact(type_prefix="DC", title="Decision 1", author="dev")
+        other = ArtifactStore(tmp_path, id_counters=IDCounters(tmp_path / "other.db"))
+        other.add_artifact(type_prefix="DC", title="Decision 2", author="dev")
+        store.rebuild_index()
+
+        artifact = store.add_artifact(
+            type_prefix="DC", title="Decision 3", author="dev"
+        )
+
+        assert artifact.id == "DC-0003"
+
+    def test_keeps_counters_in_ignored_cache_dir(self, store: ArtifactStore) -> None:
+        store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+
+        counters = store.get_id_counters()
+        assert counters.db_path.parent == store.base_path / ".cache"
+        assert counters.peek(".", "DC") == 1
+
+    def test_scopes_shared_counters_by_path_from_root(self, tmp_path: Path) -> None:
+        counters = IDCounters(tmp_path / ".cache" / "counters.db", root=tmp_path)
+        store = ArtifactStore(tmp_path / "0001-auth", id_counters=counters)
+        store.initialize()
+
+        store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+
+        assert counters.peek("0001-auth", "DC") == 1
+
+    def test_releases_number_when_validation_fails(self, store: ArtifactStore) -> None:
+        with pytest.raises(ArtifactValidationError):
+            store.add_artifact(type_prefix="IM", title="No alt text", author="dev")
+
+        artifact = store.add_artifact(
+            type_prefix="IM",
+            title="Screenshot",
+            author="dev",
+            type_fields={"alt_text": "Error screenshot"},
+        )
+
+        assert artifact.id == "IM-0001"
+
     def test_uses_separate_sequences_per_type(self, store: ArtifactStore) -> None:
         store.add_artifact(
             type_prefix="DC",
@@ -244,6 +307,44 @@ class TestGetArtifactContent:
         assert content is None
 
 
+class TestStreamingContent:
+    @pytest.fixture
+    def image(self, store: ArtifactStore) -> bytes:
+        data = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 100
+        store.add_artifact(
+            type_prefix="IM",
+            title="Image",
+            author="dev",
+            content=data,
+            type_fields={"alt_text": "Test image"},
+        )
+        return data
+
+    def test_iterates_range(self, store: ArtifactStore, image: bytes) -> None:
+        chunks = store.iter_artifact_content(
+            "IM-0001", start=8, end=1000, chunk_size=256
+        )
+
+        assert b"".join(chunks) == image[8:1000]
+
+    def test_opens_file(self, store: ArtifactStore, image: bytes) -> None:
+        with store.open_artifact_content("IM-0001") as f:
+            assert f.read(8) == image[:8]
+
+    def test_maps_file(self, store: ArtifactStore, image: bytes) -> None:
+        with store.map_artifact_content("IM-0001") as view:
+            assert bytes(view[-4:]) == image[-4:]
+
+    def test_hashes_file(self, store: ArtifactStore, image: bytes) -> None:
+        assert (
+            store.hash_artifact_content("IM-0001") == hashlib.sha256(image).hexdigest()
+        )
+
+    def test_raises_for_nonexistent(self, store: ArtifactStore) -> None:
+        with pytest.raises(ArtifactNotFoundError):
+            _ = store.iter_artifact_content("IM-9999")
+
+
 class TestArtifactExists:
     def test_returns_true_for_existing(self, store: ArtifactStore) -> None:
         store.add_artifact(
@@ -513,6 +614,90 @@ class TestRebuildIndex:
         assert index.count == 0
 
 
+class TestIndexJournal:
+    def test_add_does_not_rewrite_snapshot(self, store: ArtifactStore) -> None:
+        snapshot = store.index_path.read_bytes()
+
+        store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+
+        assert store.index_path.read_bytes() == snapshot
+        assert ArtifactStore(store.base_path).artifact_exists("DC-0001")
+
+    def test_changes_survive_reload(self, store: ArtifactStore) -> None:
+        store.add_artifact(type_prefix="DC", title="Decision 1", author="dev")
+        store.add_artifact(type_prefix="DC", title="Decision 2", author="dev")
+        store.update_artifact("DC-0001", status="complete")
+        store.delete_artifact("DC-0002")
+
+        reloaded = ArtifactStore(store.base_path)
+
+        assert [a.id for a in reloaded.list_artifacts()] == ["DC-0001"]
+        assert reloaded.get_artifact_or_raise("DC-0001").status == "complete"
+
+    def test_compact_index(self, store: ArtifactStore) -> None:
+        store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+
+        store.compact_index()
+
+        data = json.loads(store.index_path.read_text())
+        assert [a["id"] for a in data["artifacts"]] == ["DC-0001"]
+        assert store.get_index().journal_entries == 0
+
+    def test_rebuild_discards_journal(self, store: ArtifactStore) -> None:
+        store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+        store.get_index().put({"id": "DC-0099", "type": "decision"})
+
+        store.rebuild_index()
+
+        assert ArtifactStore(store.base_path).get_index().all_ids() == ["DC-0001"]
+
+
+class TestSQLiteIndexBackend:
+    @pytest.fixture
+    def sqlite_store(self, tmp_path: Path) -> ArtifactStore:
+        store = ArtifactStore(tmp_path, index_backend="sqlite")
+        store.initialize()
+        return store
+
+    def test_uses_sqlite_index(self, sqlite_store: ArtifactStore) -> None:
+        assert isinstance(sqlite_store.get_index(), SQLiteArtifactIndex)
+        assert isinstance(
+            ArtifactStore(sqlite_store.base_path).get_index(), ArtifactIndex
+        )
+
+    def test_crud_round_trip(self, sqlite_store: ArtifactStore) -> None:
+        sqlite_store.add_artifact(type_prefix="DC", title="First", author="dev")
+        sqlite_store.add_artifact(
+            type_prefix="DC", title="Second", author="dev", references=["DC-0001"]
+        )
+        sqlite_store.update_artifact("DC-0001", status="complete")
+
+        with pytest.raises(ValueError, match="referenced by DC-0002"):
+            sqlite_store.delete_artifact("DC-0001")
+        sqlite_store.delete_artifact("DC-0002")
+
+        assert [a.id for a in sqlite_store.list_artifacts()] == ["DC-0001"]
+        assert [
+            a.id for a in ArtifactStore(sqlite_store.base_path).list_artifacts()
+        ] == ["DC-0001"]
+
+    def test_list_artifacts_paginates(self, sqlite_store: ArtifactStore) -> None:
+        for title in ("Charlie", "Alpha", "Bravo"):
+            sqlite_store.add_artifact(type_prefix="DC", title=title, author="dev")
+
+        page = sqlite_store.list_artifacts(sort_by="title", limit=2)
+
+        assert [a.title for a in page] == ["Alpha", "Bravo"]
+
+    def test_rebuild_index(self, sqlite_store: ArtifactStore) -> None:
+        sqlite_store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+        sqlite_store.get_index().put({"id": "DC-0099", "type": "decision"})
+
+        sqlite_store.rebuild_index()
+
+        assert sqlite_store.get_index().all_ids() == ["DC-0001"]
+
+
 class TestValidate:
     def test_validates_all_artifacts(self, store: ArtifactStore) -> None:
         store.add_artifact(type_prefix="DC", title="Decision", author="dev")
@@ -538,6 +723,138 @@ class TestValidate:
         gap_warnings = [e for e in errors if "gap" in e.message.lower()]
         assert len(gap_warnings) >= 1
 
+    def test_warns_about_missing_references(self, store: ArtifactStore) -> None:
+        store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+        store.add_artifact(
+            type_prefix="AN",
+            title="Analysis",
+            author="dev",
+            references=["DC-0001", "DC-0002"],
+        )
+
+        errors = store.validate()
+
+        assert [e.message for e in errors if e.field == "references"] == [
+            "Reference to non-existent artifact: 'DC-0002'"
+        ]
+
+
+class TestValidationCache:
+    def test_reuses_results_of_unchanged_artifacts(self, store: ArtifactStore) -> None:
+        store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+        store.add_artifact(type_prefix="AN", title="Analysis", author="dev")
+        cache = store.get_validation_cache()
+
+        first = store.validate()
+        assert cache.stats.misses == 2
+
+        cache.reset_stats()
+        assert store.validate() == first
+        assert (cache.stats.hits, cache.stats.misses) == (2, 0)
+
+    def test_keeps_relative_results_in_ignored_cache_dir(
+        self, store: ArtifactStore
+    ) -> None:
+        artifact = store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+
+        _ = store.validate()
+
+        cache = store.get_validation_cache()
+        assert cache.db_path.parent == store.base_path / ".cache"
+        with closing(sqlite3.connect(cache.db_path)) as conn:
+            subjects = [
+                row[0] for row in conn.execute("SELECT subject FROM validation_results")
+            ]
+        assert subjects == [artifact.file_path.relative_to(store.base_path).as_posix()]
+
+    def test_revalidates_changed_artifact(self, store: ArtifactStore) -> None:
+        artifact = store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+        store.add_artifact(type_prefix="AN", title="Analysis", author="dev")
+        assert store.validate() == []
+        cache = store.get_validation_cache()
+        cache.reset_stats()
+
+        text = artifact.file_path.read_text(encoding="utf-8")
+        artifact.file_path.write_text(
+            text.replace("status: draft", "status: bogus"), encoding="utf-8"
+        )
+
+        errors = store.validate()
+        assert [e.field for e in errors] == ["status"]
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_reference_checks_follow_targets(self, store: ArtifactStore) -> None:
+        store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+        store.add_artifact(
+            type_prefix="AN", title="Analysis", author="dev", references=["DC-0002"]
+        )
+        assert [e.field for e in store.validate()] == ["references"]
+
+        store.add_artifact(type_prefix="DC", title="Second", author="dev")
+
+        assert store.validate() == []
+
+    def test_no_cache_validates_everything(self, store: ArtifactStore) -> None:
+        store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+        _ = store.validate()
+        cache = store.get_validation_cache()
+        cache.reset_stats()
+
+        _ = store.validate(use_cache=False)
+
+        assert (cache.stats.hits, cache.stats.misses) == (0, 1)
+
+    def test_registry_change_invalidates_results(self, tmp_path: Path) -> None:
+        registry = ArtifactRegistry()
+        registry._load_base_types()  # pyright: ignore[reportPrivateUsage]
+        store = ArtifactStore(tmp_path, registry=registry)
+        store.initialize()
+        store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+        _ = store.validate()
+        cache = store.get_validation_cache()
+        cache.reset_stats()
+
+        registry.register_type(
+            TypeDefinition(
+                prefix="TR",
+                name="training",
+                description="Training materials",
+                category="text",
+            )
+        )
+        _ = store.validate()
+
+        assert cache.stats.misses == 1
+
+
+class TestReferenceGraph:
+    def test_follows_store_changes(self, store: ArtifactStore) -> None:
+        store.add_artifact(type_prefix="DC", title="Decision", author="dev")
+        store.add_artifact(
+            type_prefix="AN", title="Analysis", author="dev", references=["DC-0001"]
+        )
+        graph = store.get_reference_graph()
+
+        store.add_artifact(
+            type_prefix="AN", title="Follow-up", author="dev", references=["AN-0001"]
+        )
+        assert graph.dependents("DC-0001") == ["AN-0001", "AN-0002"]
+
+        store.delete_artifact("AN-0001", force=True)
+        assert graph.dependents("DC-0001") == []
+        assert graph.dangling_references() == {"AN-0002": ["AN-0001"]}
+
+    def test_supersession_chain(self, store: ArtifactStore) -> None:
+        for title in ("One", "Two", "Three"):
+            store.add_artifact(type_prefix="DC", title=title, author="dev")
+        store.supersede_artifact("DC-0001", "DC-0002")
+        store.supersede_artifact("DC-0002", "DC-0003")
+
+        graph = store.get_reference_graph()
+
+        assert graph.supersession_head("DC-0001") == "DC-0003"
+        assert graph.supersession_chain("DC-0003") == ["DC-0001", "DC-0002", "DC-0003"]
+
 
 class TestValidateArtifact:
     def test_validates_specific_artifact(self, store: ArtifactStore) -> None:
@@ -820,3 +1137,56 @@ class TestCustomRegistry:
         )
 
         assert artifact.type == "training"
+
+
+class TestSearch:
+    def test_finds_text_artifact_body(self, store: ArtifactStore) -> None:
+        artifact = store.add_artifact(
+            type_prefix="DC",
+            title="Architecture Decision",
+            author="developer",
+            content="# Decision\n\nWe chose PostgreSQL.",
+        )
+
+        hits = store.search("postgres")
+
+        assert [hit.doc_id for hit in hits] == [artifact.id]
+        assert hits[0].doc_type == "decision"
+
+    def test_finds_binary_artifact_summary(self, store: ArtifactStore) -> None:
+        artifact = store.add_artifact(
+            type_prefix="IM",
+            title="Screenshot",
+            author="developer",
+            content=b"\x89PNG\r\n\x1a\n",
+            summary="Login error dialog",
+            type_fields={"alt_text": "Error screenshot"},
+        )
+
+        assert [hit.doc_id for hit in store.search("dialog")] == [artifact.id]
+
+    def test_filters_by_type_prefix(self, store: ArtifactStore) -> None:
+        store.add_artifact(type_prefix="DC", title="Cache decision", author="dev")
+        analysis = store.add_artifact(
+            type_prefix="AN", title="Cache analysis", author="dev"
+        )
+
+        hits = store.search("cache", type_filter="AN")
+
+        assert [hit.doc_id for hit in hits] == [analysis.id]
+
+    def test_mutations_update_shared_index(self, tmp_path: Path) -> None:
+        index = SearchIndex(tmp_path / "search.db")
+        store = ArtifactStore(
+            tmp_path / "spec", search_index=index, search_scope="0001"
+        )
+        store.initialize()
+
+        artifact = store.add_artifact(type_prefix="DC", title="Cache", author="dev")
+        assert [hit.scope for hit in index.search("cache")] == ["0001"]
+
+        store.update_artifact(artifact.id, title="Queue")
+        assert [hit.title for hit in index.search("queue")] == ["Queue"]
+
+        store.delete_artifact(artifact.id)
+        assert index.count() == 0
@@ -0,0 +1,163 @@
+"""Tests for store-wide artifact validation and validation reports."""
+
+import json
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from oaps.artifacts import _validation
+from oaps.artifacts._registry import ArtifactRegistry
+from oaps.artifacts._store import ArtifactStore
+from oaps.artifacts._types import ValidationError
+from oaps.artifacts._validation import iter_check_results, write_validation_report
+from oaps.artifacts._validator import build_type_lookup
+
+
+def _fill_store(store: ArtifactStore, count: int) -> None:
+    for i in range(count):
+        _ = store.add_artifact(
+            type_prefix="AN",
+            title=f"Analysis {i}",
+            author="dev",
+            references=["DC-9999"] if i % 3 == 0 else None,
+        )
+
+
+class TestBuildTypeLookup:
+    def test_resolves_prefix_and_name(self) -> None:
+        lookup = build_type_lookup(ArtifactRegistry.get_instance().list_types())
+
+        assert lookup["RV"] is lookup["review"]
+        assert lookup["RV"].prefix == "RV"
+
+
+class TestIterCheckResults:
+    def test_reports_unreadable_files(self, tmp_path: Path) -> None:
+        types = ArtifactRegistry.get_instance().list_types()
+        jobs = [("DC-0001", str(tmp_path / "missing.md"), False)]
+
+        [(position, result)] = list(iter_check_results(jobs, types))
+
+        assert position == 0
+        assert result["errors"][0]["artifact_id"] == "DC-0001"
+        assert result["errors"][0]["message"].startswith("Failed to read metadata")
+
+    def test_parallel_matches_serial(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_validation, "_PARALLEL_MIN_FILES", 2)
+        store = ArtifactStore(tmp_path)
+        store.initialize()
+        _fill_store(store, 9)
+        types = ArtifactRegistry.get_instance().list_types()
+        jobs = [
+            (artifact.id, str(artifact.file_path), False)
+            for artifact in store.list_artifacts()
+        ]
+
+        serial = dict(iter_check_results(jobs, types, workers=1))
+        parallel = dict(iter_check_results(jobs, types, workers=2))
+
+        assert list(serial) == list(range(9))
+        assert parallel == serial
+
+
+class TestStoreValidation:
+    def test_parallel_validate_matches_serial(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_validation, "_PARALLEL_MIN_FILES", 2)
+        store = ArtifactStore(tmp_path)
+        store.initialize()
+        _fill_store(store, 9)
+
+        serial = store.validate(use_cache=False, workers=1)
+        parallel = store.validate(use_cache=False, workers=2)
+
+        assert len(serial) == 3
+        assert sorted(map(repr, parallel)) == sorted(map(repr, serial))
+
+    def test_iter_validate_stores_results_when_stopped_early(
+        self, tmp_path: Path
+    ) -> None:
+        store = ArtifactStore(tmp_path)
+        store.initialize()
+        _fill_store(store, 4)
+
+        errors = store.iter_validate(workers=1)
+        _ = next(errors)
+        errors.close()
+        cache = store.get_validation_cache()
+        cache.reset_stats()
+        _ = store.validate()
+
+        assert cache.stats.hits == 1
+
+
+class TestWriteValidationReport:
+    @pytest.fixture
+    def errors(self) -> list[ValidationError]:
+        return [
+            ValidationError(
+                level="warning",
+                message="Reference to non-existent artifact: 'DC-9999'",
+                artifact_id=None,
+                field="references",
+            ),
+            ValidationError(
+                level="error",
+                message="Missing required field: title",
+                artifact_id="DC-0002",
+                field="title",
+            ),
+            ValidationError(
+                level="error",
+                message="Invalid status: 'open'",
+                artifact_id="DC-0001",
+                field="status",
+            ),
+        ]
+
+    def test_writes_sorted_jsonl(
+        self, tmp_path: Path, errors: list[ValidationError]
+    ) -> None:
+        path = tmp_path / "reports" / "validation.jsonl"
+
+        assert write_validation_report(errors, path) == 3
+
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [row["artifact_id"] for row in rows] == [None, "DC-0001", "DC-0002"]
+        assert rows[1] == {
+            "artifact_id": "DC-0001",
+            "level": "error",
+            "field": "status",
+            "message": "Invalid status: 'open'",
+        }
+
+    def test_report_does_not_depend_on_error_order(
+        self, tmp_path: Path, errors: list[ValidationError]
+    ) -> None:
+        first, second = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+
+        _ = write_validation_report(errors, first)
+        _ = write_validation_report(reversed(errors), second)
+
+        assert first.read_bytes() == second.read_bytes()
+
+    def test_writes_parquet(
+        self, tmp_path: Path, errors: list[ValidationError]
+    ) -> None:
+        path = tmp_path / "validation.parquet"
+
+        _ = write_validation_report(errors, path)
+
+        frame = pl.read_parquet(path)
+        assert frame.columns == ["artifact_id", "level", "field", "message"]
+        assert frame["artifact_id"].to_list() == [None, "DC-0001", "DC-0002"]
+
+    def test_writes_empty_parquet(self, tmp_path: Path) -> None:
+        path = tmp_path / "validation.parquet"
+
+        assert write_validation_report([], path) == 0
+        assert pl.read_parquet(path).height == 0
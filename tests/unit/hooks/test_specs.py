@@ -0,0 +1,267 @@
+# pyright: reportAny=false
+"""Tests for the spec pre-commit validation and test sync hooks."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from oaps.hooks.specs import (
+    SPEC_VALIDATE_ALL_ENV,
+    sync_coverage,
+    sync_test_results,
+    validate_specs_precommit,
+)
+from oaps.spec import (
+    RequirementManager,
+    RequirementType,
+    SpecManager,
+    SpecType,
+    TestManager as SpecTestManager,
+)
+from oaps.spec._models import TestMethod as SpecTestMethod
+
+from .fixtures import (
+    HookContextFactory,
+    PostToolUseInputBuilder,
+    PreToolUseInputBuilder,
+    create_git_context,
+)
+
+SPECS = ".oaps/docs/specs"
+
+
+def write_spec(
+    specs_dir: Path, name: str, *, relationships: dict[str, list[str]] | None = None
+) -> None:
+    spec_dir = specs_dir / name
+    spec_dir.mkdir(parents=True)
+    index = {
+        "id": name[:4],
+        "slug": name[5:],
+        "title": name,
+        "spec_type": "feature",
+        "status": "draft",
+        "version": "0.1.0",
+        "created": "2025-01-01T00:00:00+00:00",
+        "updated": "2025-01-01T00:00:00+00:00",
+        "relationships": relationships or {},
+    }
+    _ = (spec_dir / "index.json").write_text(json.dumps(index))
+    _ = (spec_dir / "index.md").write_text(f"# {name}\n")
+    _ = (spec_dir / "requirements.json").write_text('{"requirements": []}')
+    _ = (spec_dir / "tests.json").write_text('{"tests": []}')
+    _ = (spec_dir / "history.jsonl").write_text("")
+
+
+def write_root_index(specs_dir: Path, specs: list[dict[str, Any]]) -> None:
+    _ = (specs_dir / "index.json").write_text(json.dumps({"specs": specs}))
+
+
+@pytest.fixture
+def specs_dir(ctx_factory: HookContextFactory) -> Path:
+    specs_dir = ctx_factory.oaps_dir.parent / SPECS
+    write_spec(specs_dir, "0001-auth")
+    write_spec(specs_dir, "0002-login", relationships={"depends_on": ["0001"]})
+    write_spec(specs_dir, "0003-billing")
+    write_root_index(
+        specs_dir,
+        [
+            {"id": "0001", "dependents": ["0002"]},
+            {"id": "0002"},
+            {"id": "0003"},
+        ],
+    )
+    return specs_dir
+
+
+def run(
+    ctx_factory: HookContextFactory,
+    staged: set[str] | None,
+    command: str = "git commit -m 'Update specs'",
+) -> dict[str, Any]:
+    git = None
+    if staged is not None:
+        git = create_git_context(
+            ctx_factory.oaps_dir.parent,
+            staged_files=frozenset(f"{SPECS}/{path}" for path in staged),
+            modified_files=frozenset({f"{SPECS}/0003-billing/index.md"}),
+        )
+    builder = PreToolUseInputBuilder().with_bash_command(command)
+    return validate_specs_precommit(ctx_factory.pre_tool_use(builder, git=git))
+
+
+class TestValidateSpecsPrecommit:
+    def test_validates_only_staged_specs(
+        self, ctx_factory: HookContextFactory, specs_dir: Path
+    ) -> None:
+        _ = (specs_dir / "0003-billing" / "tests.json").write_text("{")
+
+        result = run(ctx_factory, {"0002-login/index.md"})
+
+        assert result["status"] == "passed"
+        assert result["timing"]["scope"] == "staged"
+        assert result["timing"]["specs"] == 1
+
+    def test_includes_specs_related_to_changed_specs(
+        self, ctx_factory: HookContextFactory, specs_dir: Path
+    ) -> None:
+        _ = (specs_dir / "0002-login" / "tests.json").write_text("{")
+
+        result = run(ctx_factory, {"0001-auth/requirements.json"})
+
+        assert result["status"] == "failed"
+        assert result["timing"]["specs"] == 2
+        assert any(err.startswith("0002-login:") for err in result["errors"])
+
+    def test_commit_all_includes_modified_files(
+        self, ctx_factory: HookContextFactory, specs_dir: Path
+    ) -> None:
+        _ = (specs_dir / "0003-billing" / "tests.json").write_text("{")
+
+        result = run(ctx_factory, set(), command="git commit -am 'Update specs'")
+
+        assert result["status"] == "failed"
+        assert result["timing"]["specs"] == 1
+
+    def test_root_index_checked_only_when_affected(
+        self, ctx_factory: HookContextFactory, specs_dir: Path
+    ) -> None:
+        write_root_index(specs_dir, [{"id": "0001"}, {"id": "0002"}])
+
+        assert run(ctx_factory, {"0003-billing/index.md"})["status"] == "passed"
+        result = run(ctx_factory, {"index.json"})
+        assert result["errors"] == ["Spec 0003 exists but missing from root index"]
+
+    def test_warns_about_relationships_to_missing_specs(
+        self, ctx_factory: HookContextFactory, specs_dir: Path
+    ) -> None:
+        write_spec(specs_dir, "0004-export", relationships={"extends": ["0009"]})
+        write_root_index(
+            specs_dir, [{"id": spec_id} for spec_id in ("0001", "0002", "0003", "0004")]
+        )
+
+        result = run(ctx_factory, {"0004-export/index.json"})
+
+        assert result["warnings"] == [
+            "0004-export: extends references non-existent spec: 0009"
+        ]
+
+    def test_validates_all_specs_without_git_context(
+        self, ctx_factory: HookContextFactory, specs_dir: Path
+    ) -> None:
+        result = run(ctx_factory, None)
+
+        assert result["timing"]["scope"] == "all"
+        assert result["timing"]["specs"] == 3
+
+    def test_ignores_cache_dir(
+        self, ctx_factory: HookContextFactory, specs_dir: Path
+    ) -> None:
+        _ = SpecManager(specs_dir).search("auth")
+
+        result = run(ctx_factory, None)
+
+        assert result["status"] == "passed"
+        assert result["timing"]["specs"] == 3
+
+    def test_validate_all_flag(
+        self,
+        ctx_factory: HookContextFactory,
+        specs_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setenv(SPEC_VALIDATE_ALL_ENV, "1")
+        _ = (specs_dir / "0003-billing" / "tests.json").write_text("{")
+
+        result = run(ctx_factory, {"0001-auth/index.md"})
+
+        assert result["status"] == "failed"
+        assert result["timing"]["scope"] == "all"
+
+    def test_reuses_cached_results(
+        self, ctx_factory: HookContextFactory, specs_dir: Path
+    ) -> None:
+        _ = run(ctx_factory, None)
+
+        result = run(ctx_factory, None)
+
+        assert result["cache"] == {"hits": 3, "misses": 0}
+        assert result["timing"]["validated"] == 0
+
+
+JUNIT_XML = """\
+<testsuites><testsuite>
+  <testcase classname="tests.test_auth.TestLogin" name="test_valid" time="0.2">
+    <failure message="assert False"/>
+  </testcase>
+  <testcase classname="tests.test_other" name="test_other" time="0.1"/>
+</testsuite></testsuites>
+"""
+
+
+def run_post(ctx_factory: HookContextFactory, command: str) -> dict[str, Any]:
+    builder = (
+        PostToolUseInputBuilder()
+        .with_bash_result(command, "no parseable output")
+        .with_cwd(str(ctx_factory.oaps_dir.parent))
+    )
+    context = ctx_factory.post_tool_use(builder)
+    if "--cov" in command:
+        return sync_coverage(context)
+    return sync_test_results(context)
+
+
+class TestSyncReports:
+    def test_ingests_junit_report(self, ctx_factory: HookContextFactory) -> None:
+        project_root = ctx_factory.oaps_dir.parent
+        spec_manager = SpecManager(project_root / SPECS)
+        requirements = RequirementManager(spec_manager)
+        tests = SpecTestManager(spec_manager, requirements)
+        spec_id = spec_manager.create_spec(
+            slug="auth", title="Auth", spec_type=SpecType.FEATURE, actor="test"
+        ).id
+        req = requirements.add_requirement(
+            spec_id, RequirementType.FUNCTIONAL, "Login", "Log in", actor="test"
+        )
+        _ = tests.add_test(
+            spec_id,
+            SpecTestMethod.UNIT,
+            "Login works",
+            [req.id],
+            file="tests/test_auth.py",
+            function="test_valid",
+            actor="test",
+        )
+        _ = (project_root / "junit.xml").write_text(JUNIT_XML)
+
+        result = run_post(ctx_factory, "pytest --junitxml junit.xml")
+
+        assert result["passed"] == 1
+        assert result["failed"] == 1
+        assert result["updated_specs"] == [spec_id]
+        [test] = SpecTestManager(
+            SpecManager(project_root / SPECS), requirements
+        ).list_tests(spec_id)
+        assert test.status.value == "failing"
+
+    def test_missing_report_falls_back_to_output(
+        self, ctx_factory: HookContextFactory
+    ) -> None:
+        result = run_post(ctx_factory, "pytest --junitxml=missing.xml")
+
+        assert result["status"] == "synced"
+        assert result["passed"] == 0
+
+    def test_reads_coverage_json_report(self, ctx_factory: HookContextFactory) -> None:
+        report = {
+            "files": {},
+            "totals": {"num_statements": 4, "missing_lines": 1},
+        }
+        project_root = ctx_factory.oaps_dir.parent
+        _ = (project_root / "cov.json").write_text(json.dumps(report))
+
+        result = run_post(ctx_factory, "pytest --cov=src --cov-report=json:cov.json")
+
+        assert result["inject_content"] == "Coverage: 75% lines"
@@ -0,0 +1,195 @@
+"""Unit tests for CheckpointScheduler."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from oaps.exceptions import OapsRepositoryConflictError
+from oaps.repository import (
+    CHECKPOINT_QUEUE_NAME,
+    CheckpointProtocol,
+    CheckpointScheduler,
+    CommitResult,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> MagicMock:
+    mock = MagicMock()
+    mock.git_dir = tmp_path
+    mock.checkpoint.return_value = CommitResult(
+        sha="abc123", files=frozenset({tmp_path / "spec.json"}), no_changes=False
+    )
+    return mock
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(repo: MagicMock, clock: FakeClock) -> CheckpointScheduler:
+    return CheckpointScheduler(repo, interval=30, clock=clock)
+
+
+class TestCheckpoint:
+    def test_satisfies_checkpoint_protocol(
+        self, scheduler: CheckpointScheduler
+    ) -> None:
+        assert isinstance(scheduler, CheckpointProtocol)
+
+    def test_first_checkpoint_commits_immediately(
+        self, scheduler: CheckpointScheduler, repo: MagicMock
+    ) -> None:
+        result = scheduler.checkpoint("spec", "create 0001", session_id="s1")
+
+        assert result.sha == "abc123"
+        repo.checkpoint.assert_called_once_with(
+            "spec", "create 0001", session_id="s1", details=()
+        )
+        assert scheduler.pending() == []
+
+    def test_checkpoints_within_interval_are_queued(
+        self, scheduler: CheckpointScheduler, repo: MagicMock, clock: FakeClock
+    ) -> None:
+        _ = scheduler.checkpoint("spec", "create 0001")
+        clock.now += 5
+
+        result = scheduler.checkpoint("spec", "add requirement 0001:FR-0001")
+
+        assert result.no_changes is True
+        assert repo.checkpoint.call_count == 1
+        [pending] = scheduler.pending("spec")
+        assert pending.action == "add requirement 0001:FR-0001"
+        assert pending.queued_at == clock.now
+
+    def test_due_checkpoint_aggregates_queued_actions(
+        self, scheduler: CheckpointScheduler, repo: MagicMock, clock: FakeClock
+    ) -> None:
+        _ = scheduler.checkpoint("spec", "create 0001")
+        for action, session_id in [("add FR-0001", "s1"), ("add FR-0002", None)]:
+            clock.now += 10
+            _ = scheduler.checkpoint("spec", action, session_id=session_id)
+        clock.now += 10
+
+        result = scheduler.checkpoint("spec", "add UT-0001", session_id="s2")
+
+        assert result.sha == "abc123"
+        assert repo.checkpoint.call_args == call(
+            "spec",
+            "add FR-0001 (+2 more)",
+            session_id="s2",
+            details=("add FR-0001", "add FR-0002", "add UT-0001"),
+        )
+        assert scheduler.pending() == []
+
+    def test_repeated_actions_are_listed_once(
+        self, scheduler: CheckpointScheduler, repo: MagicMock, clock: FakeClock
+    ) -> None:
+        _ = scheduler.checkpoint("idea", "update IDEA-1")
+        for _ in range(3):
+            clock.now += 1
+            _ = scheduler.checkpoint("idea", "update IDEA-1")
+
+        _ = scheduler.flush()
+
+        assert repo.checkpoint.call_args == call(
+            "idea", "update IDEA-1", session_id=None, details=()
+        )
+
+    def test_interval_is_per_workflow(
+        self, scheduler: CheckpointScheduler, repo: MagicMock, clock: FakeClock
+    ) -> None:
+        _ = scheduler.checkpoint("spec", "create 0001")
+        clock.now += 1
+
+        _ = scheduler.checkpoint("idea", "create IDEA-1")
+
+        assert [c.args[0] for c in repo.checkpoint.call_args_list] == ["spec", "idea"]
+
+    def test_commit_folds_other_workflows_queued_actions(
+        self, scheduler: CheckpointScheduler, repo: MagicMock, clock: FakeClock
+    ) -> None:
+        _ = scheduler.checkpoint("spec", "create 0001")
+        clock.now += 1
+        _ = scheduler.checkpoint("spec", "add FR-0001", session_id="s1")
+
+        _ = scheduler.checkpoint("dev", "update notes")
+
+        assert repo.checkpoint.call_args == call(
+            "dev",
+            "update notes (+1 more)",
+            session_id="s1",
+            details=("update notes", "spec: add FR-0001"),
+        )
+        assert scheduler.pending() == []
+        assert scheduler.flush() == []
+
+    def test_failed_commit_keeps_actions_queued(
+        self, scheduler: CheckpointScheduler, repo: MagicMock
+    ) -> None:
+        repo.checkpoint.side_effect = OapsRepositoryConflictError("conflict")
+
+        with pytest.raises(OapsRepositoryConflictError):
+            _ = scheduler.checkpoint("spec", "create 0001")
+
+        assert [p.action for p in scheduler.pending()] == ["create 0001"]
+
+    def test_zero_interval_commits_without_queue(
+        self, repo: MagicMock, tmp_path: Path
+    ) -> None:
+        scheduler = CheckpointScheduler(repo)
+
+        _ = scheduler.checkpoint("spec", "create 0001")
+
+        repo.checkpoint.assert_called_once_with("spec", "create 0001", session_id=None)
+        assert not (tmp_path / CHECKPOINT_QUEUE_NAME).exists()
+
+
+class TestFlush:
+    def test_commits_all_workflows_in_one_commit(
+        self, scheduler: CheckpointScheduler, repo: MagicMock, clock: FakeClock
+    ) -> None:
+        _ = scheduler.checkpoint("spec", "create 0001")
+        _ = scheduler.checkpoint("idea", "create IDEA-1")
+        clock.now += 1
+        _ = scheduler.checkpoint("spec", "add FR-0001")
+        _ = scheduler.checkpoint("idea", "update IDEA-1")
+        repo.checkpoint.reset_mock()
+
+        results = scheduler.flush()
+
+        assert len(results) == 1
+        repo.checkpoint.assert_called_once_with(
+            "idea",
+            "update IDEA-1 (+1 more)",
+            session_id=None,
+            details=("update IDEA-1", "spec: add FR-0001"),
+        )
+        assert scheduler.pending() == []
+
+    def test_queue_is_shared_between_schedulers(
+        self, scheduler: CheckpointScheduler, repo: MagicMock, clock: FakeClock
+    ) -> None:
+        _ = scheduler.checkpoint("spec", "create 0001")
+        clock.now += 1
+        _ = scheduler.checkpoint("spec", "add FR-0001")
+
+        other = CheckpointScheduler(repo, interval=30, clock=clock)
+
+        assert [p.action for p in other.pending()] == ["add FR-0001"]
+        assert len(other.flush("spec")) == 1
+
+    def test_nothing_queued(self, repo: MagicMock) -> None:
+        assert CheckpointScheduler(repo, interval=30).flush() == []
+        repo.checkpoint.assert_not_called()
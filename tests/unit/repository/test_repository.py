@@ -580,6 +580,23 @@ class TestBuildCommitMessage:
         )
         assert result == expected
 
+    def test_builds_message_with_details(
+        self, tmp_path: Path, oaps_dir: Path, mock_repo: MagicMock
+    ) -> None:
+        repo = OapsRepository(working_dir=tmp_path)
+
+        result = repo._build_commit_message(
+            "Test commit", session_id=None, details=["add FR-0001", "add FR-0002"]
+        )
+
+        expected = (
+            b"Test commit\n\n"
+            b"- add FR-0001\n"
+            b"- add FR-0002\n\n"
+            b"Co-authored-by: OAPS <oaps@localhost>"
+        )
+        assert result == expected
+
 
 class TestFormatCheckpointSubject:
     def test_formats_checkpoint_subject(
@@ -0,0 +1,222 @@
+"""Tests for the FTS5 search index."""
+
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+import pytest
+
+from oaps.search import SearchDocument, SearchIndex, build_match_query
+
+_OLD_MTIME_NS = 1_000_000_000_000_000_000
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _ = path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(_OLD_MTIME_NS, _OLD_MTIME_NS))
+    return path
+
+
+def _extract(path: Path) -> Iterable[SearchDocument]:
+    """Index each file as one note: first line is the title, rest the body."""
+    title, _, body = path.read_text(encoding="utf-8").partition("\n")
+    return [SearchDocument("note", path.stem, title, body, tags=("notes",))]
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> SearchIndex:
+    return SearchIndex(tmp_path / "search.db")
+
+
+class TestBuildMatchQuery:
+    def test_quotes_terms_as_prefixes(self) -> None:
+        assert build_match_query("cache layer") == '"cache"* AND "layer"*'
+
+    def test_escapes_fts_syntax(self) -> None:
+        assert build_match_query('a"b OR') == '"a""b"* AND "OR"*'
+
+    def test_drops_punctuation_only_terms(self) -> None:
+        assert build_match_query("- * ::") is None
+
+    def test_restricts_to_fields(self) -> None:
+        assert build_match_query("x", ["title", "tags"]) == '{title tags} : ("x"*)'
+
+    def test_all_fields_need_no_filter(self) -> None:
+        assert build_match_query("x", ["body", "tags", "title"]) == '"x"*'
+
+    def test_rejects_unknown_field(self) -> None:
+        with pytest.raises(ValueError, match="Invalid search fields: author"):
+            _ = build_match_query("x", ["author"])  # pyright: ignore[reportArgumentType]
+
+
+class TestSearch:
+    def test_matches_word_prefixes(self, index: SearchIndex, tmp_path: Path) -> None:
+        source = _write(tmp_path / "a.md", "x")
+        index.update(source, [SearchDocument("note", "a", "Authentication flow")])
+
+        assert [hit.doc_id for hit in index.search("auth")] == ["a"]
+        assert index.search("flows") == []
+
+    def test_requires_every_term(self, index: SearchIndex, tmp_path: Path) -> None:
+        source = _write(tmp_path / "a.md", "x")
+        index.update(source, [SearchDocument("note", "a", "Cache layer")])
+
+        assert index.search("cache layer")
+        assert index.search("cache queue") == []
+
+    def test_ranks_title_above_body(self, index: SearchIndex, tmp_path: Path) -> None:
+        source = _write(tmp_path / "a.md", "x")
+        index.update(
+            source,
+            [
+                SearchDocument("note", "body", "Other", body="about caching things"),
+                SearchDocument("note", "title", "Caching", body="unrelated text"),
+            ],
+        )
+
+        assert [hit.doc_id for hit in index.search("caching")] == ["title", "body"]
+
+    def test_field_filter(self, index: SearchIndex, tmp_path: Path) -> None:
+        source = _write(tmp_path / "a.md", "x")
+        index.update(
+            source,
+            [
+                SearchDocument("note", "t", "Perf", body="x"),
+                SearchDocument("note", "g", "Other", tags=("perf",)),
+            ],
+        )
+
+        assert [hit.doc_id for hit in index.search("perf", fields=["tags"])] == ["g"]
+
+    def test_metadata_filters(self, index: SearchIndex, tmp_path: Path) -> None:
+        source = _write(tmp_path / "a.md", "x")
+        index.update(
+            source,
+            [
+                SearchDocument("spec", "1", "Cache", scope="0001", status="draft"),
+                SearchDocument("test", "2", "Cache", scope="0001", doc_type="unit"),
+                SearchDocument("spec", "3", "Cache", scope="0002", status="draft"),
+            ],
+        )
+
+        assert {hit.doc_id for hit in index.search("cache", kinds=["spec"])} == {
+            "1",
+            "3",
+        }
+        assert [hit.doc_id for hit in index.search("cache", scope="0002")] == ["3"]
+        assert [hit.doc_id for hit in index.search("cache", doc_type="unit")] == ["2"]
+        assert len(index.search("cache", status="draft", limit=1)) == 1
+
+    def test_snippet_highlights_matches(
+        self, index: SearchIndex, tmp_path: Path
+    ) -> None:
+        source = _write(tmp_path / "a.md", "x")
+        index.update(
+            source, [SearchDocument("note", "a", "Title", body="use an LRU cache")]
+        )
+
+        (hit,) = index.search("lru", highlight=("<", ">"))
+
+        assert hit.snippet == "use an <LRU> cache"
+        assert hit.source == "a.md"
+
+    def test_empty_query_returns_nothing(self, index: SearchIndex) -> None:
+        assert index.search("  ") == []
+
+    def test_rejects_negative_limit(self, index: SearchIndex) -> None:
+        with pytest.raises(ValueError, match="limit"):
+            _ = index.search("x", limit=-1)
+
+
+class TestUpdates:
+    def test_update_replaces_source_documents(
+        self, index: SearchIndex, tmp_path: Path
+    ) -> None:
+        source = _write(tmp_path / "a.md", "x")
+        index.update(source, [SearchDocument("note", "a", "Old title")])
+        index.update(source, [SearchDocument("note", "a", "New title")])
+
+        assert index.search("old") == []
+        assert index.count() == 1
+
+    def test_remove(self, index: SearchIndex, tmp_path: Path) -> None:
+        source = _write(tmp_path / "a.md", "x")
+        index.update(source, [SearchDocument("note", "a", "Title")])
+
+        index.remove(source)
+
+        assert index.count() == 0
+
+    def test_remove_tree(self, index: SearchIndex, tmp_path: Path) -> None:
+        inside = _write(tmp_path / "0001-a" / "index.json", "x")
+        sibling = _write(tmp_path / "0001-ab" / "index.json", "x")
+        index.update(inside, [SearchDocument("spec", "1", "Title")])
+        index.update(sibling, [SearchDocument("spec", "2", "Title")])
+
+        index.remove_tree(tmp_path / "0001-a")
+
+        assert [hit.doc_id for hit in index.search("title")] == ["2"]
+
+
+class TestSync:
+    def test_indexes_new_files(self, index: SearchIndex, tmp_path: Path) -> None:
+        paths = [_write(tmp_path / f"{n}.md", f"Note {n}\nbody") for n in "ab"]
+
+        assert index.sync(paths, _extract) == 2
+        assert index.count(kind="note") == 2
+
+    def test_skips_unchanged_files(self, index: SearchIndex, tmp_path: Path) -> None:
+        paths = [_write(tmp_path / "a.md", "Note\nbody")]
+        _ = index.sync(paths, _extract)
+
+        def fail(path: Path) -> list[SearchDocument]:
+            raise AssertionError(path)
+
+        assert index.sync(paths, fail) == 0
+
+    def test_reindexes_changed_files(self, index: SearchIndex, tmp_path: Path) -> None:
+        path = _write(tmp_path / "a.md", "Before\nbody")
+        _ = index.sync([path], _extract)
+        _ = path.write_text("After\nlonger body", encoding="utf-8")
+
+        assert index.sync([path], _extract) == 1
+        assert [hit.title for hit in index.search("after")] == ["After"]
+
+    def test_removes_deleted_files(self, index: SearchIndex, tmp_path: Path) -> None:
+        paths = [_write(tmp_path / f"{n}.md", f"Note {n}\nbody") for n in "ab"]
+        _ = index.sync(paths, _extract)
+
+        assert index.sync(paths[:1], _extract) == 1
+        assert index.count() == 1
+
+    def test_within_limits_removals(self, index: SearchIndex, tmp_path: Path) -> None:
+        kept = _write(tmp_path / "other" / "a.md", "Kept\nbody")
+        index.update(kept, [SearchDocument("note", "a", "Kept")])
+        path = _write(tmp_path / "notes" / "b.md", "Note\nbody")
+
+        _ = index.sync([path], _extract, within=tmp_path / "notes")
+
+        assert index.count() == 2
+
+    def test_recently_written_files_are_rechecked(
+        self, index: SearchIndex, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "a.md"
+        _ = path.write_text("Before\nbody", encoding="utf-8")
+        index.update(path, [SearchDocument("note", "a", "Before")])
+
+        # Same size and, within one timestamp tick, possibly the same mtime
+        _ = path.write_text("Latter\nbody", encoding="utf-8")
+
+        assert index.sync([path], _extract) == 1
+        assert [hit.title for hit in index.search("latter")] == ["Latter"]
+
+    def test_recovers_from_corrupt_database(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "search.db"
+        _ = db_path.write_bytes(b"not a database" * 100)
+        path = _write(tmp_path / "a.md", "Note\nbody")
+
+        index = SearchIndex(db_path)
+
+        assert index.sync([path], _extract) == 1
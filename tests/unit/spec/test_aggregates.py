@@ -0,0 +1,154 @@
+# pyright: reportAny=false
+"""Tests for the progress and coverage counters kept in spec indexes."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from oaps.exceptions import SpecNotFoundError
+from oaps.spec import (
+    QueryManager,
+    RequirementManager,
+    RequirementStatus,
+    RequirementType,
+    SpecManager,
+    SpecType,
+    TestManager as SpecTestManager,
+)
+from oaps.spec._aggregates import AGGREGATES_VERSION, diff_aggregates
+from oaps.spec._models import (
+    TestMethod as SpecTestMethod,
+    TestResult as SpecTestResult,
+)
+
+
+class Managers:
+    def __init__(self, tmp_path: Path) -> None:
+        self.reload(tmp_path)
+        self.spec_id = self.specs.create_spec(
+            slug="login",
+            title="Login",
+            spec_type=SpecType.FEATURE,
+            actor="test",
+        ).id
+
+    def reload(self, base_path: Path) -> None:
+        self.specs = SpecManager(base_path)
+        self.requirements = RequirementManager(self.specs)
+        self.tests = SpecTestManager(self.specs, self.requirements)
+        self.queries = QueryManager(self.specs, self.requirements, self.tests)
+
+    def edit_index(self, key: str, value: object) -> None:
+        """Overwrite a counter in the stored aggregates, or drop them if None."""
+        path = self.index_path()
+        data = json.loads(path.read_text())
+        if value is None:
+            del data["aggregates"]
+        else:
+            *parents, name = key.split(".")
+            target = data["aggregates"]
+            for parent in parents:
+                target = target[parent]
+            target[name] = value
+        _ = path.write_text(json.dumps(data))
+        self.reload(self.specs.base_path)
+
+    def index_path(self) -> Path:
+        [path] = self.specs.base_path.glob(f"{self.spec_id}-*/index.json")
+        return path
+
+
+@pytest.fixture
+def managers(tmp_path: Path) -> Managers:
+    m = Managers(tmp_path)
+    fr1 = m.requirements.add_requirement(
+        m.spec_id, RequirementType.FUNCTIONAL, "Log in", "Users log in", actor="test"
+    )
+    fr2 = m.requirements.add_requirement(
+        m.spec_id, RequirementType.FUNCTIONAL, "Log out", "Users log out", actor="test"
+    )
+    _ = m.requirements.add_requirement(
+        m.spec_id, RequirementType.SECURITY, "Lockout", "Lock accounts", actor="test"
+    )
+    _ = m.requirements.update_requirement(
+        m.spec_id, fr1.id, status=RequirementStatus.IMPLEMENTED, actor="test"
+    )
+    ut1 = m.tests.add_test(
+        m.spec_id, SpecTestMethod.UNIT, "Login works", [fr1.id], actor="test"
+    )
+    _ = m.tests.add_test(
+        m.spec_id, SpecTestMethod.INTEGRATION, "Logout works", [fr2.id], actor="test"
+    )
+    _ = m.tests.record_run(m.spec_id, ut1.id, SpecTestResult.PASS, actor="test")
+    return m
+
+
+class TestStoredAggregates:
+    def test_writes_store_aggregates_in_spec_index(self, managers: Managers) -> None:
+        aggregates = managers.specs.get_aggregates(managers.spec_id)
+
+        assert aggregates is not None
+        assert aggregates["version"] == AGGREGATES_VERSION
+        assert aggregates["requirements"]["total"] == 3
+        assert aggregates["requirements"]["implemented"] == 1
+        assert aggregates["requirements"]["covered"] == 1
+        assert aggregates["tests"]["by_status"] == {"passing": 1, "pending": 1}
+        assert aggregates["requirement_to_tests"] == {"FR-0001": ["UT-0001"]}
+        assert aggregates["tested"] == ["FR-0001", "FR-0002"]
+        assert aggregates["untested"] == ["SR-0001"]
+
+    def test_stored_reports_match_full_scan(self, managers: Managers) -> None:
+        queries, spec_id = managers.queries, managers.spec_id
+
+        assert queries.progress(spec_id) == queries.progress(spec_id, recompute=True)
+        assert queries.coverage(spec_id) == queries.coverage(spec_id, recompute=True)
+
+    def test_spec_update_keeps_aggregates(self, managers: Managers) -> None:
+        before = managers.specs.get_aggregates(managers.spec_id)
+
+        _ = managers.specs.update_spec(managers.spec_id, title="Sign in", actor="test")
+
+        assert managers.specs.get_aggregates(managers.spec_id) == before
+
+    def test_reports_read_stored_counters(self, managers: Managers) -> None:
+        managers.edit_index("requirements.implemented", 3)
+
+        report = managers.queries.progress(managers.spec_id)
+
+        assert report.implemented_requirements == 3
+        assert (
+            managers.queries.progress(
+                managers.spec_id, recompute=True
+            ).implemented_requirements
+            == 1
+        )
+
+    def test_missing_aggregates_fall_back_to_full_scan(
+        self, managers: Managers
+    ) -> None:
+        managers.edit_index("aggregates", None)
+
+        assert managers.specs.get_aggregates(managers.spec_id) is None
+        assert managers.queries.coverage(managers.spec_id).covered_requirements == 1
+
+    def test_unknown_spec_raises(self, managers: Managers) -> None:
+        with pytest.raises(SpecNotFoundError):
+            _ = managers.specs.get_aggregates("9999")
+
+
+class TestVerifyAggregates:
+    def test_correct_counters(self, managers: Managers) -> None:
+        assert managers.specs.verify_aggregates(managers.spec_id) == []
+
+    def test_repairs_wrong_counters(self, managers: Managers) -> None:
+        managers.edit_index("requirements.total", 7)
+        managers.edit_index("untested", [])
+
+        differences = managers.specs.verify_aggregates(managers.spec_id)
+
+        assert differences == ["requirements.total", "untested"]
+        assert managers.specs.verify_aggregates(managers.spec_id) == []
+
+    def test_reports_missing_aggregates(self) -> None:
+        assert diff_aggregates(None, {"version": AGGREGATES_VERSION}) == ["aggregates"]
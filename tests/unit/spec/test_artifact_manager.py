@@ -1,6 +1,7 @@
 # pyright: reportAny=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
 """Tests for ArtifactManager operations."""
 
+import hashlib
 from pathlib import Path
 
 import pytest
@@ -372,6 +373,39 @@ class TestGetArtifactContent:
             manager.get_artifact_content(spec_id, "DC-9999")
 
 
+class TestStreamArtifactContent:
+    def test_streams_binary_artifact(self, tmp_path: Path) -> None:
+        spec_manager, spec_id = setup_spec_manager(tmp_path / "specs")
+        manager = ArtifactManager(spec_manager)
+        data = bytes(range(256)) * 10
+        source = tmp_path / "diagram.png"
+        source.write_bytes(data)
+        artifact = manager.add_artifact(
+            spec_id,
+            artifact_type=ArtifactType.IMAGE,
+            title="Diagram",
+            source_path=source,
+            type_fields={"alt_text": "Diagram"},
+            actor="test-user",
+        )
+
+        chunks = manager.iter_artifact_content(spec_id, artifact.id, start=16)
+
+        assert b"".join(chunks) == data[16:]
+        assert manager.get_artifact_file_path(spec_id, artifact.id).suffix == ".png"
+        assert (
+            manager.hash_artifact_content(spec_id, artifact.id, algorithm="md5")
+            == hashlib.md5(data).hexdigest()  # noqa: S324
+        )
+
+    def test_raises_for_nonexistent_artifact(self, tmp_path: Path) -> None:
+        spec_manager, spec_id = setup_spec_manager(tmp_path)
+        manager = ArtifactManager(spec_manager)
+
+        with pytest.raises(SpecArtifactNotFoundError):
+            _ = manager.iter_artifact_content(spec_id, "IM-9999")
+
+
 class TestUpdateArtifact:
     def test_updates_title(self, tmp_path: Path) -> None:
         spec_manager, spec_id = setup_spec_manager(tmp_path)
@@ -0,0 +1,154 @@
+# pyright: reportAny=false, reportUnknownMemberType=false
+"""Tests for batched requirement, test, and artifact changes."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from oaps.exceptions import SpecNotFoundError
+from oaps.spec import (
+    RequirementManager,
+    RequirementType,
+    SpecManager,
+    SpecType,
+    TestManager as SpecTestManager,
+    read_jsonl,
+)
+from oaps.spec._models import TestMethod as SpecTestMethod
+
+
+@pytest.fixture
+def oaps_repo() -> MagicMock:
+    repo = MagicMock()
+    repo.checkpoint.return_value = MagicMock(no_changes=False)
+    return repo
+
+
+@pytest.fixture
+def spec_manager(tmp_path: Path, oaps_repo: MagicMock) -> SpecManager:
+    manager = SpecManager(tmp_path, oaps_repo=oaps_repo)
+    _ = manager.create_spec("batch", "Batch", SpecType.FEATURE, actor="dev")
+    oaps_repo.reset_mock()
+    return manager
+
+
+@pytest.fixture
+def req_manager(spec_manager: SpecManager) -> RequirementManager:
+    return RequirementManager(spec_manager)
+
+
+@pytest.fixture
+def test_manager(
+    spec_manager: SpecManager, req_manager: RequirementManager
+) -> SpecTestManager:
+    return SpecTestManager(spec_manager, req_manager)
+
+
+def _spec_dir(spec_manager: SpecManager) -> Path:
+    return spec_manager.base_path / "0001-batch"
+
+
+def _add(req_manager: RequirementManager, title: str) -> str:
+    return req_manager.add_requirement(
+        "0001", RequirementType.FUNCTIONAL, title, title, actor="dev"
+    ).id
+
+
+class TestSpecBatch:
+    def test_writes_once_and_commits_once(
+        self,
+        spec_manager: SpecManager,
+        req_manager: RequirementManager,
+        test_manager: SpecTestManager,
+        oaps_repo: MagicMock,
+    ) -> None:
+        requirements_path = _spec_dir(spec_manager) / "requirements.json"
+
+        with spec_manager.batch("0001") as batch:
+            first = _add(req_manager, "First")
+            second = _add(req_manager, "Second")
+            _ = test_manager.add_test(
+                "0001", SpecTestMethod.UNIT, "Covers both", [first, second], actor="dev"
+            )
+            assert not requirements_path.exists()
+            assert batch.pending_writes == 2
+
+        assert [r.id for r in req_manager.list_requirements("0001")] == [first, second]
+        assert req_manager.get_requirement("0001", first).verified_by == ("UT-0001",)
+        oaps_repo.checkpoint.assert_called_once_with(
+            workflow="spec", action="batch 0001: 3 changes", session_id=None
+        )
+        history = read_jsonl(_spec_dir(spec_manager) / "history.jsonl")
+        assert [entry["event"] for entry in history] == [
+            "requirement_created",
+            "requirement_created",
+            "test_created",
+        ]
+
+    def test_reads_see_staged_changes(
+        self, spec_manager: SpecManager, req_manager: RequirementManager
+    ) -> None:
+        with spec_manager.batch("0001"):
+            parent = _add(req_manager, "Parent")
+            child = req_manager.add_requirement(
+                "0001",
+                RequirementType.FUNCTIONAL,
+                "Child",
+                "Child",
+                parent=parent,
+                actor="dev",
+            )
+
+            assert req_manager.get_children("0001", parent) == [child]
+
+    def test_single_change_keeps_its_action(
+        self,
+        spec_manager: SpecManager,
+        req_manager: RequirementManager,
+        oaps_repo: MagicMock,
+    ) -> None:
+        with spec_manager.batch("0001", session_id="s1"):
+            req_id = _add(req_manager, "Only")
+
+        oaps_repo.checkpoint.assert_called_once_with(
+            workflow="spec", action=f"add requirement 0001:{req_id}", session_id="s1"
+        )
+
+    def test_error_discards_staged_changes(
+        self,
+        spec_manager: SpecManager,
+        req_manager: RequirementManager,
+        oaps_repo: MagicMock,
+    ) -> None:
+        error = RuntimeError("import failed")
+
+        with (
+            pytest.raises(RuntimeError, match="import failed"),
+            spec_manager.batch("0001"),
+        ):
+            _ = _add(req_manager, "Dropped")
+            raise error
+
+        assert spec_manager.active_batch is None
+        assert req_manager.list_requirements("0001") == []
+        assert not (_spec_dir(spec_manager) / "history.jsonl").exists()
+        oaps_repo.checkpoint.assert_not_called()
+
+    def test_nested_batch_joins_open_batch(
+        self,
+        spec_manager: SpecManager,
+        req_manager: RequirementManager,
+        oaps_repo: MagicMock,
+    ) -> None:
+        with spec_manager.batch("0001") as outer:
+            with spec_manager.batch("0001") as inner:
+                _ = _add(req_manager, "Inner")
+            assert inner is outer
+            _ = _add(req_manager, "Outer")
+
+        oaps_repo.checkpoint.assert_called_once()
+
+    def test_unknown_spec_raises(self, spec_manager: SpecManager) -> None:
+        with pytest.raises(SpecNotFoundError), spec_manager.batch("9999"):
+            pass
@@ -0,0 +1,116 @@
+# pyright: reportAny=false
+"""Tests for the Parquet export of the spec corpus."""
+
+from pathlib import Path
+
+import duckdb
+import polars as pl
+import pytest
+
+from oaps.spec import (
+    RequirementManager,
+    RequirementType,
+    SpecManager,
+    SpecType,
+    TestManager as SpecTestManager,
+)
+from oaps.spec._export import EXPORT_TABLES, export_specs
+from oaps.spec._models import TestMethod as SpecTestMethod
+
+
+@pytest.fixture
+def spec_tree(tmp_path: Path) -> Path:
+    """Create two specs with a requirement and test each, one depending on the other."""
+    base_path = tmp_path / "specs"
+    spec_manager = SpecManager(base_path)
+    requirements = RequirementManager(spec_manager)
+    tests = SpecTestManager(spec_manager, requirements)
+    auth_id = spec_manager.create_spec(
+        slug="auth", title="Auth", spec_type=SpecType.FEATURE, actor="test"
+    ).id
+    login_id = spec_manager.create_spec(
+        slug="login",
+        title="Login",
+        spec_type=SpecType.FEATURE,
+        actor="test",
+        depends_on=[auth_id],
+    ).id
+    for spec_id in (auth_id, login_id):
+        req = requirements.add_requirement(
+            spec_id, RequirementType.FUNCTIONAL, "Req", "A req", actor="test"
+        )
+        _ = tests.add_test(
+            spec_id, SpecTestMethod.UNIT, "Works", [req.id], actor="test"
+        )
+    return base_path
+
+
+class TestExportSpecs:
+    def test_writes_queryable_tables(self, spec_tree: Path, tmp_path: Path) -> None:
+        output = tmp_path / "export"
+
+        result = export_specs(spec_tree, output)
+
+        assert len(result.exported) == 2
+        for table in EXPORT_TABLES:
+            for spec_id in result.exported:
+                assert (output / table / f"{spec_id}.parquet").exists()
+        counts = duckdb.sql(
+            f"SELECT spec_id, count(*) FROM '{output}/requirements/*.parquet' "  # noqa: S608
+            "GROUP BY 1 ORDER BY 1"
+        ).fetchall()
+        assert counts == [(spec_id, 1) for spec_id in result.exported]
+        relationships = pl.read_parquet(output / "relationships" / "*.parquet")
+        assert relationships.rows() == [
+            (result.exported[1], "depends_on", result.exported[0])
+        ]
+        history = pl.scan_parquet(output / "history" / "*.parquet").collect()
+        created = history.filter(pl.col("event") == "created")
+        assert sorted(created["spec_id"].to_list()) == list(result.exported)
+
+    def test_skips_unchanged_specs(self, spec_tree: Path, tmp_path: Path) -> None:
+        output = tmp_path / "export"
+        first = export_specs(spec_tree, output)
+
+        second = export_specs(spec_tree, output)
+
+        assert second.exported == ()
+        assert second.unchanged == first.exported
+        assert export_specs(spec_tree, output, full=True).exported == first.exported
+
+    def test_ignores_cache_files(self, spec_tree: Path, tmp_path: Path) -> None:
+        output = tmp_path / "export"
+        first = export_specs(spec_tree, output)
+        cache_dir = (
+            next(spec_tree.glob(f"{first.exported[0]}-*")) / "artifacts" / ".cache"
+        )
+        cache_dir.mkdir(parents=True)
+        _ = (cache_dir / "artifacts.manifest.json").write_text("{}")
+
+        assert export_specs(spec_tree, output).exported == ()
+
+    def test_reexports_changed_specs(self, spec_tree: Path, tmp_path: Path) -> None:
+        output = tmp_path / "export"
+        auth_id, login_id = export_specs(spec_tree, output).exported
+        spec_manager = SpecManager(spec_tree)
+        _ = RequirementManager(spec_manager).add_requirement(
+            login_id, RequirementType.SECURITY, "Lock", "Lock out", actor="test"
+        )
+
+        result = export_specs(spec_tree, output)
+
+        assert result.exported == (login_id,)
+        assert result.unchanged == (auth_id,)
+        table = pl.read_parquet(output / "requirements" / f"{login_id}.parquet")
+        assert table.height == 2
+
+    def test_removes_deleted_specs(self, spec_tree: Path, tmp_path: Path) -> None:
+        output = tmp_path / "export"
+        auth_id, login_id = export_specs(spec_tree, output).exported
+        SpecManager(spec_tree).delete_spec(login_id, actor="test")
+
+        result = export_specs(spec_tree, output)
+
+        assert result.removed == (login_id,)
+        assert result.unchanged == (auth_id,)
+        assert not any(output.glob(f"*/{login_id}.parquet"))
@@ -0,0 +1,113 @@
+# pyright: reportAny=false
+"""Tests for segmented history logs."""
+
+import itertools
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from oaps.exceptions import SpecParseError
+from oaps.spec._history_log import HISTORY_INDEX_NAME, HistoryLog, append_history
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def make_entries(count: int, offset: int = 0) -> list[dict[str, Any]]:
+    return [
+        {
+            "timestamp": (START + timedelta(minutes=offset + i)).isoformat(),
+            "event": f"event_{offset + i}",
+            "actor": "test",
+        }
+        for i in range(count)
+    ]
+
+
+def events(entries: list[dict[str, Any]]) -> list[str]:
+    return [entry["event"] for entry in entries]
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "history.jsonl"
+
+
+class TestNewestFirst:
+    def test_missing_log_is_empty(self, path: Path) -> None:
+        assert list(HistoryLog(path).newest_first()) == []
+
+    def test_reads_entries_newest_first(self, path: Path) -> None:
+        log = HistoryLog(path)
+        log.append(make_entries(3))
+
+        assert events(list(log.newest_first())) == ["event_2", "event_1", "event_0"]
+
+    def test_stops_reading_early(self, path: Path) -> None:
+        _ = path.write_text("not json\n")
+        log = HistoryLog(path)
+        log.append(make_entries(5_000))
+
+        latest = list(itertools.islice(log.newest_first(), 3))
+
+        assert events(latest) == ["event_4999", "event_4998", "event_4997"]
+        with pytest.raises(SpecParseError):
+            _ = log.entries()
+
+    def test_until_bisects_active_file(self, path: Path) -> None:
+        log = HistoryLog(path)
+        log.append(make_entries(5_000))
+        until = START + timedelta(minutes=1_234)
+
+        latest = list(itertools.islice(log.newest_first(until=until), 2))
+
+        assert events(latest) == ["event_1234", "event_1233"]
+
+    def test_skips_blank_lines(self, path: Path) -> None:
+        append_history(path, make_entries(2))
+        with path.open("a") as f:
+            _ = f.write("\n\n")
+
+        assert events(list(HistoryLog(path).newest_first())) == ["event_1", "event_0"]
+
+
+class TestSegments:
+    @pytest.fixture
+    def log(self, path: Path) -> HistoryLog:
+        log = HistoryLog(path, segment_bytes=2_000)
+        for offset in range(0, 300, 10):
+            log.append(make_entries(10, offset))
+        return log
+
+    def test_seals_full_active_file(self, log: HistoryLog, path: Path) -> None:
+        segments = log.segments()
+
+        assert segments
+        assert segments[0].name == "history.000001.jsonl"
+        assert path.stat().st_size < 2_000 + 1_000
+        assert events(log.entries()) == [f"event_{i}" for i in range(300)]
+
+    def test_indexes_sealed_segments(self, log: HistoryLog) -> None:
+        index = json.loads(log.index_path.read_text())
+
+        assert [entry["name"] for entry in index["segments"]] == [
+            segment.name for segment in log.segments()
+        ]
+        first = index["segments"][0]
+        assert first["first"] == START.isoformat()
+        assert first["offsets"][0] == [START.isoformat(), 0]
+
+    def test_until_skips_newer_segments(self, log: HistoryLog) -> None:
+        until = START + timedelta(minutes=42)
+
+        latest = list(itertools.islice(log.newest_first(until=until), 3))
+
+        assert events(latest) == ["event_42", "event_41", "event_40"]
+
+    def test_rebuilds_missing_index(self, log: HistoryLog, path: Path) -> None:
+        log.index_path.unlink()
+
+        assert events(log.entries()) == [f"event_{i}" for i in range(300)]
+        assert (path.parent / HISTORY_INDEX_NAME).exists()
@@ -0,0 +1,163 @@
+# pyright: reportAny=false
+"""Tests for importing requirements and tests from records."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from oaps.exceptions import SpecIOError, SpecValidationError
+from oaps.spec import (
+    RequirementManager,
+    RequirementType,
+    SpecManager,
+    SpecType,
+    TestManager as SpecTestManager,
+    import_requirement_arguments,
+    import_test_arguments,
+    read_import_records,
+)
+from oaps.spec._models import TestMethod as SpecTestMethod
+
+
+class TestReadImportRecords:
+    def test_reads_jsonl(self, tmp_path: Path) -> None:
+        path = tmp_path / "requirements.jsonl"
+        _ = path.write_text(
+            '{"req_type": "functional", "title": "A"}\n\n{"title": "B"}\n'
+        )
+
+        assert read_import_records(path) == [
+            {"req_type": "functional", "title": "A"},
+            {"title": "B"},
+        ]
+
+    def test_reads_csv_without_empty_cells(self, tmp_path: Path) -> None:
+        path = tmp_path / "requirements.csv"
+        _ = path.write_text(
+            "req_type,title,tags\nsecurity,Encrypt,crypto;storage\nfunctional,Export,\n"
+        )
+
+        assert read_import_records(path) == [
+            {"req_type": "security", "title": "Encrypt", "tags": "crypto;storage"},
+            {"req_type": "functional", "title": "Export"},
+        ]
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(SpecIOError, match="not found"):
+            _ = read_import_records(tmp_path / "missing.jsonl")
+
+
+class TestImportArguments:
+    def test_converts_requirement_fields(self) -> None:
+        arguments = import_requirement_arguments(
+            {"req_type": "quality", "title": "Fast", "tags": "perf; api", "goal": "50"},
+            spec_id="0001",
+            number=1,
+        )
+
+        assert arguments == {
+            "req_type": RequirementType.QUALITY,
+            "title": "Fast",
+            "description": "Fast",
+            "tags": ["perf", "api"],
+            "goal": 50.0,
+        }
+
+    def test_converts_test_fields(self) -> None:
+        arguments = import_test_arguments(
+            {"method": "unit", "title": "T", "tests_requirements": ["FR-0001"]},
+            spec_id="0001",
+            number=1,
+        )
+
+        assert arguments["method"] == SpecTestMethod.UNIT
+        assert arguments["tests_requirements"] == ["FR-0001"]
+
+    @pytest.mark.parametrize(
+        ("record", "message"),
+        [
+            ({"title": "No type"}, "Record 3: missing required field 'req_type'"),
+            ({"req_type": "bogus", "title": "T"}, "'req_type' must be one of"),
+            ({"req_type": "functional", "title": "T", "status": "x"}, "unknown field"),
+            ({"req_type": "functional", "title": "T", "goal": "high"}, "number"),
+            ({"req_type": "functional", "title": 5}, "'title' must be a string"),
+        ],
+    )
+    def test_rejects_invalid_records(
+        self, record: dict[str, object], message: str
+    ) -> None:
+        with pytest.raises(SpecValidationError, match=message):
+            _ = import_requirement_arguments(record, spec_id="0001", number=3)
+
+
+class TestImportManagers:
+    @pytest.fixture
+    def oaps_repo(self) -> MagicMock:
+        repo = MagicMock()
+        repo.checkpoint.return_value = MagicMock(no_changes=False)
+        return repo
+
+    @pytest.fixture
+    def req_manager(self, tmp_path: Path, oaps_repo: MagicMock) -> RequirementManager:
+        spec_manager = SpecManager(tmp_path, oaps_repo=oaps_repo)
+        _ = spec_manager.create_spec("imp", "Import", SpecType.FEATURE, actor="dev")
+        oaps_repo.reset_mock()
+        return RequirementManager(spec_manager)
+
+    def test_imports_requirements_in_one_commit(
+        self, req_manager: RequirementManager, oaps_repo: MagicMock
+    ) -> None:
+        records = [
+            {"req_type": "functional", "title": f"Requirement {i}"} for i in range(20)
+        ]
+        records.append(
+            {"req_type": "functional", "title": "Child", "parent": "FR-0001"}
+        )
+
+        created = req_manager.import_requirements("0001", records, actor="dev")
+
+        assert len(created) == 21
+        assert created[-1].parent == "FR-0001"
+        assert len(req_manager.list_requirements("0001")) == 21
+        oaps_repo.checkpoint.assert_called_once_with(
+            workflow="spec", action="import 21 requirements 0001", session_id=None
+        )
+
+    def test_invalid_record_creates_nothing(
+        self, req_manager: RequirementManager, oaps_repo: MagicMock
+    ) -> None:
+        records = [
+            {"req_type": "functional", "title": "Valid"},
+            {"req_type": "functional"},
+        ]
+
+        with pytest.raises(SpecValidationError, match="Record 2"):
+            _ = req_manager.import_requirements("0001", records, actor="dev")
+
+        assert req_manager.list_requirements("0001") == []
+        oaps_repo.checkpoint.assert_not_called()
+
+    def test_imports_tests(self, req_manager: RequirementManager) -> None:
+        requirement = req_manager.import_requirements(
+            "0001", [{"req_type": "functional", "title": "R"}], actor="dev"
+        )[0]
+        spec_manager = req_manager._spec_manager
+        test_manager = SpecTestManager(spec_manager, req_manager)
+
+        tests = test_manager.import_tests(
+            "0001",
+            [
+                {
+                    "method": "unit",
+                    "title": f"T{i}",
+                    "tests_requirements": [requirement.id],
+                }
+                for i in range(3)
+            ],
+            actor="dev",
+        )
+
+        assert [t.id for t in tests] == ["UT-0001", "UT-0002", "UT-0003"]
+        verified_by = req_manager.get_requirement("0001", requirement.id).verified_by
+        assert verified_by == ("UT-0001", "UT-0002", "UT-0003")
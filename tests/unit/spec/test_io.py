@@ -11,6 +11,7 @@ from oaps.spec._io import (
     read_json,
     read_jsonl,
     read_markdown_frontmatter,
+    read_markdown_header,
     write_json_atomic,
     write_markdown_with_frontmatter,
 )
@@ -411,6 +412,40 @@ Body content."""
         assert body == "Body"
 
 
+class TestReadMarkdownHeader:
+    def test_reads_frontmatter_only(self, fs: FakeFilesystem) -> None:
+        path = Path("/test/doc.md")
+        fs.create_file(path, contents="---\ntitle: Header\n---\n\n" + "x" * 10_000)
+
+        assert read_markdown_header(path) == {"title": "Header"}
+
+    def test_returns_empty_dict_for_no_frontmatter(self, fs: FakeFilesystem) -> None:
+        path = Path("/test/plain.md")
+        fs.create_file(path, contents="# Just a Header\n")
+
+        assert read_markdown_header(path) == {}
+
+    def test_raises_spec_parse_error_for_malformed_yaml(
+        self, fs: FakeFilesystem
+    ) -> None:
+        path = Path("/test/malformed.md")
+        fs.create_file(path, contents="---\ntitle: [malformed\n---\n")
+
+        with pytest.raises(SpecParseError) as exc_info:
+            read_markdown_header(path)
+
+        assert exc_info.value.path == path
+        assert exc_info.value.content_type == "frontmatter"
+
+    def test_raises_spec_io_error_for_missing_file(self, fs: FakeFilesystem) -> None:
+        path = Path("/test/missing.md")
+
+        with pytest.raises(SpecIOError) as exc_info:
+            read_markdown_header(path)
+
+        assert exc_info.value.operation == "read"
+
+
 class TestWriteMarkdownWithFrontmatter:
     def test_writes_file_with_frontmatter(self, fs: FakeFilesystem) -> None:
         path = Path("/test/output.md")
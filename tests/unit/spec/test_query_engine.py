@@ -0,0 +1,165 @@
+# pyright: reportAny=false
+"""Tests for DuckDB queries across specifications."""
+
+import os
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from oaps.spec import (
+    RequirementManager,
+    RequirementType,
+    SpecManager,
+    SpecType,
+    TestManager as SpecTestManager,
+)
+from oaps.spec._models import TestMethod as SpecTestMethod
+from oaps.spec._query_engine import (
+    SPEC_QUERY_MIRROR_NAME,
+    SpecQueryEngine,
+    refresh_query_mirror,
+)
+from oaps.utils._state_analytics import QueryResult
+
+
+@pytest.fixture
+def spec_tree(tmp_path: Path) -> Path:
+    """Create two specs with requirements, one of them tested."""
+    spec_manager = SpecManager(tmp_path)
+    req_manager = RequirementManager(spec_manager)
+    test_manager = SpecTestManager(spec_manager, req_manager)
+    for slug in ("auth", "billing"):
+        spec = spec_manager.create_spec(
+            slug=slug, title=slug.title(), spec_type=SpecType.FEATURE, actor="dev"
+        )
+        security = req_manager.add_requirement(
+            spec.id,
+            RequirementType.SECURITY,
+            "Encrypt secrets",
+            "Encrypt secrets at rest",
+            tags=["crypto", "storage"],
+            actor="dev",
+        )
+        _ = req_manager.add_requirement(
+            spec.id,
+            RequirementType.FUNCTIONAL,
+            "Export data",
+            "Export data as CSV",
+            tags=["storage"],
+            actor="dev",
+        )
+        if slug == "auth":
+            _ = test_manager.add_test(
+                spec.id,
+                SpecTestMethod.UNIT,
+                "Secrets are encrypted",
+                [security.id],
+                actor="dev",
+            )
+    return tmp_path
+
+
+def _ids(result: QueryResult) -> list[tuple[object, object]]:
+    return [(row["spec_id"], row["id"]) for row in result.to_dicts()]
+
+
+class TestFindRequirements:
+    def test_filters_by_type(self, spec_tree: Path) -> None:
+        with SpecQueryEngine.from_files(spec_tree) as engine:
+            result = engine.find_requirements(req_types=["security"])
+
+        assert _ids(result) == [("0001", "SR-0001"), ("0002", "SR-0001")]
+        assert result.columns[:2] == ["spec_id", "id"]
+
+    def test_untested(self, spec_tree: Path) -> None:
+        with SpecQueryEngine.from_files(spec_tree) as engine:
+            result = engine.find_requirements(req_types=["security"], untested=True)
+
+        assert _ids(result) == [("0002", "SR-0001")]
+
+    def test_tags_must_all_match(self, spec_tree: Path) -> None:
+        with SpecQueryEngine.from_files(spec_tree) as engine:
+            both = engine.find_requirements(tags=["crypto", "storage"])
+            one = engine.find_requirements(tags=["storage"], limit=3)
+
+        assert len(both.rows) == 2
+        assert len(one.rows) == 3
+
+    def test_filters_by_spec(self, spec_tree: Path) -> None:
+        with SpecQueryEngine.from_files(spec_tree) as engine:
+            result = engine.find_requirements(spec_ids=["0002"])
+
+        assert {spec_id for spec_id, _ in _ids(result)} == {"0002"}
+
+
+class TestFindTests:
+    def test_filters_by_requirement(self, spec_tree: Path) -> None:
+        with SpecQueryEngine.from_files(spec_tree) as engine:
+            result = engine.find_tests(requirement="SR-0001", methods=["unit"])
+
+        [row] = result.to_dicts()
+        assert row["spec_id"] == "0001"
+        assert row["tests_requirements"] == ["SR-0001"]
+
+
+class TestQuery:
+    def test_runs_sql_across_specs(self, spec_tree: Path) -> None:
+        with SpecQueryEngine.from_files(spec_tree) as engine:
+            result = engine.query(
+                "SELECT req_type, count(*) AS n FROM requirements "
+                "GROUP BY req_type ORDER BY req_type"
+            )
+
+        assert result.rows == [("functional", 2), ("security", 2)]
+
+    def test_invalid_sql_raises(self, spec_tree: Path) -> None:
+        with (
+            SpecQueryEngine.from_files(spec_tree) as engine,
+            pytest.raises(duckdb.Error),
+        ):
+            _ = engine.query("SELECT * FROM nope")
+
+    def test_empty_tree(self, tmp_path: Path) -> None:
+        with SpecQueryEngine.from_mirror(tmp_path) as engine:
+            assert engine.find_requirements(untested=True).rows == []
+            assert engine.query("SELECT count(*) FROM specs").rows == [(0,)]
+
+
+class TestMirror:
+    def test_matches_files(self, spec_tree: Path) -> None:
+        sql = "SELECT * FROM requirements ORDER BY spec_id, id"
+        with SpecQueryEngine.from_files(spec_tree) as engine:
+            expected = engine.query(sql)
+        with SpecQueryEngine.from_mirror(spec_tree) as engine:
+            actual = engine.query(sql)
+
+        assert actual == expected
+        mirror = spec_tree / ".cache" / SPEC_QUERY_MIRROR_NAME
+        assert (mirror / "manifest.json").exists()
+        assert (mirror.parent / ".gitignore").exists()
+
+    def test_refreshes_only_when_sources_change(self, spec_tree: Path) -> None:
+        assert refresh_query_mirror(spec_tree) is True
+        assert refresh_query_mirror(spec_tree) is False
+
+        path = next(spec_tree.glob("*/requirements.json"))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert refresh_query_mirror(spec_tree) is True
+
+    def test_sees_new_requirements(self, spec_tree: Path) -> None:
+        with SpecQueryEngine.from_mirror(spec_tree) as engine:
+            assert len(engine.find_requirements().rows) == 4
+        spec_manager = SpecManager(spec_tree)
+        _ = RequirementManager(spec_manager).add_requirement(
+            "0002",
+            RequirementType.FUNCTIONAL,
+            "Import data",
+            "Import data from CSV",
+            actor="dev",
+        )
+
+        with SpecQueryEngine.from_mirror(spec_tree) as engine:
+            assert len(engine.find_requirements().rows) == 5
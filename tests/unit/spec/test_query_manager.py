@@ -10,6 +10,7 @@ import pytest
 from oaps.exceptions import SpecNotFoundError
 from oaps.spec import (
     CoverageReport,
+    CriticalPath,
     DependencyGraph,
     OrphanReport,
     ProgressReport,
@@ -971,3 +972,110 @@ class TestDataclassImmutability:
 
         with pytest.raises(AttributeError):
             result.nodes = ()  # type: ignore[misc]
+
+
+class TestGraphQueries:
+    @pytest.fixture
+    def specs(self, mock_spec_manager: Mock) -> list[SpecSummary]:
+        # SPEC-0003 -> SPEC-0002 -> SPEC-0001, SPEC-0004 -> SPEC-0001
+        specs = [
+            create_spec_summary("SPEC-0001"),
+            create_spec_summary("SPEC-0002", depends_on=("SPEC-0001",)),
+            create_spec_summary("SPEC-0003", depends_on=("SPEC-0002",)),
+            create_spec_summary("SPEC-0004", depends_on=("SPEC-0001",)),
+        ]
+        mock_spec_manager.list_specs.return_value = specs
+        mock_spec_manager.revision = 1
+        return specs
+
+    def test_caches_graph_until_revision_changes(
+        self,
+        query_manager: QueryManager,
+        mock_spec_manager: Mock,
+        specs: list[SpecSummary],
+    ) -> None:
+        _ = query_manager.dependency_graph()
+        _ = query_manager.dependency_graph()
+        assert mock_spec_manager.list_specs.call_count == 1
+
+        mock_spec_manager.list_specs.return_value = specs[:1]
+        mock_spec_manager.revision = 2
+
+        assert len(query_manager.dependency_graph().nodes) == 1
+
+    def test_depths_count_longest_chain(
+        self, query_manager: QueryManager, specs: list[SpecSummary]
+    ) -> None:
+        result = query_manager.dependency_graph()
+
+        depths = {node.spec_id: node.depth for node in result.nodes}
+        assert depths == {
+            "SPEC-0001": 2,
+            "SPEC-0002": 1,
+            "SPEC-0003": 0,
+            "SPEC-0004": 0,
+        }
+
+    def test_dependency_path(
+        self, query_manager: QueryManager, specs: list[SpecSummary]
+    ) -> None:
+        assert query_manager.dependency_path("SPEC-0003", "SPEC-0001") == (
+            "SPEC-0003",
+            "SPEC-0002",
+            "SPEC-0001",
+        )
+        assert query_manager.dependency_path("SPEC-0001", "SPEC-0003") == ()
+
+    def test_dependency_cycles(
+        self, query_manager: QueryManager, mock_spec_manager: Mock
+    ) -> None:
+        mock_spec_manager.list_specs.return_value = [
+            create_spec_summary("SPEC-0001", depends_on=("SPEC-0002",)),
+            create_spec_summary("SPEC-0002", depends_on=("SPEC-0001",)),
+            create_spec_summary("SPEC-0003"),
+        ]
+
+        assert query_manager.dependency_cycles() == (("SPEC-0001", "SPEC-0002"),)
+
+    def test_critical_path_by_requirement_count(
+        self,
+        query_manager: QueryManager,
+        mock_requirement_manager: Mock,
+        specs: list[SpecSummary],
+    ) -> None:
+        counts = {"SPEC-0001": 1, "SPEC-0002": 1, "SPEC-0003": 1, "SPEC-0004": 5}
+        mock_requirement_manager.list_requirements.side_effect = lambda spec_id: [
+            create_requirement(f"FR-{n:04d}") for n in range(counts[spec_id])
+        ]
+
+        result = query_manager.critical_path()
+
+        assert result == CriticalPath(
+            spec_ids=("SPEC-0004", "SPEC-0001"), requirement_count=6
+        )
+
+    def test_impact_follows_relationships(
+        self,
+        query_manager: QueryManager,
+        mock_spec_manager: Mock,
+        specs: list[SpecSummary],
+    ) -> None:
+        relationships = {
+            "SPEC-0002": Relationships(
+                depends_on=("SPEC-0001",), extends=None, supersedes=None, integrates=()
+            ),
+            "SPEC-0003": Relationships(
+                depends_on=(), extends="SPEC-0002", supersedes=None, integrates=()
+            ),
+            "SPEC-0004": Relationships(
+                depends_on=(), extends=None, supersedes="SPEC-0001", integrates=()
+            ),
+        }
+        mock_spec_manager.get_spec.side_effect = lambda spec_id: create_spec_metadata(
+            spec_id, relationships=relationships.get(spec_id)
+        )
+
+        assert query_manager.impact("SPEC-0001") == ("SPEC-0002", "SPEC-0003")
+        assert query_manager.impact(
+            "SPEC-0001", relationship_types=(RelationshipType.SUPERSEDES,)
+        ) == ("SPEC-0004",)
@@ -92,6 +92,28 @@ class TestAddRequirement:
 
         assert req1.id < req2.id
 
+    def test_does_not_reuse_deleted_id(self, tmp_path: Path) -> None:
+        spec_manager, spec_id = setup_spec_manager(tmp_path)
+        manager = RequirementManager(spec_manager)
+        req = manager.add_requirement(
+            spec_id,
+            RequirementType.FUNCTIONAL,
+            "First",
+            "First requirement",
+            actor="test-user",
+        )
+        manager.delete_requirement(spec_id, req.id, actor="test-user")
+
+        result = manager.add_requirement(
+            spec_id,
+            RequirementType.FUNCTIONAL,
+            "Second",
+            "Second requirement",
+            actor="test-user",
+        )
+
+        assert result.id > req.id
+
     def test_raises_for_nonexistent_spec(self, tmp_path: Path) -> None:
         spec_manager, _ = setup_spec_manager(tmp_path)
         manager = RequirementManager(spec_manager)
@@ -533,3 +555,25 @@ class TestStatusTransitions:
             spec_id, req.id, status=RequirementStatus.VERIFIED, actor="test-user"
         )
         assert result.status == RequirementStatus.VERIFIED
+
+
+class TestSearchIndex:
+    def test_requirement_writes_update_search_index(self, tmp_path: Path) -> None:
+        spec_manager, spec_id = setup_spec_manager(tmp_path)
+        manager = RequirementManager(spec_manager)
+        req = manager.add_requirement(
+            spec_id,
+            RequirementType.FUNCTIONAL,
+            "User authentication",
+            "System must authenticate users",
+            acceptance_criteria=["Passwords are hashed"],
+            actor="test-user",
+        )
+
+        hits = spec_manager.search("hashed", kinds=["requirement"])
+
+        assert [(hit.doc_id, hit.scope) for hit in hits] == [(req.id, spec_id)]
+
+        manager.delete_requirement(spec_id, req.id, actor="test-user")
+
+        assert spec_manager.search("hashed") == []
@@ -0,0 +1,162 @@
+# pyright: reportAny=false
+"""Tests for reading test result and coverage reports."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from oaps.exceptions import SpecParseError
+from oaps.spec import (
+    PytestTest,
+    RequirementManager,
+    RequirementType,
+    SpecManager,
+    SpecType,
+    TestManager as SpecTestManager,
+    iter_junit_results,
+    read_coverage_json,
+    read_test_results,
+)
+from oaps.spec._models import (
+    TestMethod as SpecTestMethod,
+    TestStatus as SpecTestStatus,
+)
+
+JUNIT_XML = """\
+<?xml version="1.0" encoding="utf-8"?>
+<testsuites>
+  <testsuite name="pytest" tests="4">
+    <testcase classname="tests.test_auth.TestLogin" name="test_valid" time="0.5"/>
+    <testcase classname="tests.test_auth" name="test_logout[admin]" time="0.1">
+      <failure message="assert False">Traceback</failure>
+    </testcase>
+    <testcase classname="tests.test_auth" name="test_lockout" time="0">
+      <skipped message="not ready"/>
+    </testcase>
+    <testcase classname="tests.unit.test_root.TestRoot" name="test_setup"
+      file="tests/unit/test_root.py">
+      <error message="fixture failed"/>
+    </testcase>
+  </testsuite>
+</testsuites>
+"""
+
+
+class TestJunitResults:
+    def test_reads_test_cases(self, tmp_path: Path) -> None:
+        path = tmp_path / "junit.xml"
+        _ = path.write_text(JUNIT_XML)
+
+        results = list(iter_junit_results(path))
+
+        assert results == [
+            PytestTest("tests/test_auth.py::TestLogin::test_valid", "passed", 0.5),
+            PytestTest(
+                "tests/test_auth.py::test_logout[admin]", "failed", 0.1, "assert False"
+            ),
+            PytestTest("tests/test_auth.py::test_lockout", "skipped", 0.0, "not ready"),
+            PytestTest(
+                "tests/unit/test_root.py::TestRoot::test_setup",
+                "error",
+                0.0,
+                "fixture failed",
+            ),
+        ]
+
+    def test_invalid_xml_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "junit.xml"
+        _ = path.write_text("<testsuites><testcase")
+
+        with pytest.raises(SpecParseError):
+            _ = list(iter_junit_results(path))
+
+    def test_reads_pytest_json_report(self, tmp_path: Path) -> None:
+        path = tmp_path / "report.json"
+        report = {
+            "tests": [
+                {"nodeid": "tests/test_a.py::test_a", "outcome": "passed"},
+                {
+                    "nodeid": "tests/test_a.py::test_b",
+                    "outcome": "failed",
+                    "duration": 2,
+                    "call": {"longrepr": "boom"},
+                },
+            ]
+        }
+        _ = path.write_text(json.dumps(report))
+
+        assert list(read_test_results(path)) == [
+            PytestTest("tests/test_a.py::test_a", "passed", 0.0),
+            PytestTest("tests/test_a.py::test_b", "failed", 2.0, "boom"),
+        ]
+
+
+class TestCoverageJson:
+    def test_reads_file_and_total_percentages(self, tmp_path: Path) -> None:
+        path = tmp_path / "coverage.json"
+        summary = {
+            "num_statements": 200,
+            "missing_lines": 50,
+            "num_branches": 40,
+            "missing_branches": 4,
+        }
+        _ = path.write_text(
+            json.dumps(
+                {
+                    "files": {"src/auth.py": {"summary": summary}},
+                    "totals": {"num_statements": 10, "missing_lines": 0},
+                }
+            )
+        )
+
+        coverage = read_coverage_json(path)
+
+        assert coverage["src/auth.py"]["line"] == 75
+        assert coverage["src/auth.py"]["branch"] == 90
+        assert coverage["total"] == {"line": 100, "statements": 10, "missing": 0}
+
+
+class TestIngest:
+    @pytest.fixture
+    def managers(self, tmp_path: Path) -> tuple[SpecManager, SpecTestManager]:
+        spec_manager = SpecManager(tmp_path)
+        requirements = RequirementManager(spec_manager)
+        tests = SpecTestManager(spec_manager, requirements)
+        for slug in ("auth", "billing"):
+            spec_id = spec_manager.create_spec(
+                slug=slug, title=slug, spec_type=SpecType.FEATURE, actor="test"
+            ).id
+            req = requirements.add_requirement(
+                spec_id, RequirementType.FUNCTIONAL, "Req", "A req", actor="test"
+            )
+            _ = tests.add_test(
+                spec_id,
+                SpecTestMethod.UNIT,
+                f"{slug} works",
+                [req.id],
+                file=f"tests/test_{slug}.py",
+                function="test_works",
+                actor="test",
+            )
+        return spec_manager, tests
+
+    def test_syncs_matching_specs(
+        self, managers: tuple[SpecManager, SpecTestManager]
+    ) -> None:
+        spec_manager, tests = managers
+        results = [
+            PytestTest("tests/test_auth.py::TestAuth::test_works[1]", "failed", 0.1),
+            PytestTest("tests/test_other.py::test_works", "passed", 0.1),
+        ]
+
+        synced = tests.ingest(iter(results), actor="test")
+
+        [auth_id] = synced
+        assert synced[auth_id].updated == 1
+        statuses = {
+            spec.id: tests.list_tests(spec.id)[0].status
+            for spec in spec_manager.list_specs()
+        }
+        assert statuses[auth_id] == SpecTestStatus.FAILING
+        assert SpecTestStatus.PENDING in statuses.values()
@@ -0,0 +1,104 @@
+"""Tests for the specification relationship graph."""
+
+import pytest
+
+from oaps.spec import RelationshipType, SpecGraph
+
+DEPENDS_ON = RelationshipType.DEPENDS_ON
+
+
+@pytest.fixture
+def graph() -> SpecGraph:
+    """Build a graph with a dependency chain, a diamond, and a cycle.
+
+    0002 -> 0001, 0003 -> 0002, 0004 -> 0002, 0004 -> 0001
+    0005 <-> 0006
+    """
+    return SpecGraph(
+        ["0001", "0002", "0003", "0004", "0005", "0006"],
+        [
+            ("0002", "0001", DEPENDS_ON),
+            ("0003", "0002", DEPENDS_ON),
+            ("0004", "0002", DEPENDS_ON),
+            ("0004", "0001", DEPENDS_ON),
+            ("0005", "0006", DEPENDS_ON),
+            ("0006", "0005", DEPENDS_ON),
+            ("0001", "9999", DEPENDS_ON),
+        ],
+    )
+
+
+@pytest.fixture
+def dag() -> SpecGraph:
+    return SpecGraph(
+        ["0001", "0002", "0003", "0004"],
+        [
+            ("0002", "0001", DEPENDS_ON),
+            ("0003", "0002", DEPENDS_ON),
+            ("0004", "0001", DEPENDS_ON),
+        ],
+    )
+
+
+class TestStructure:
+    def test_skips_edges_to_unknown_specs(self, graph: SpecGraph) -> None:
+        assert graph.count == 6
+        assert "9999" not in graph
+        assert len(graph.edges()) == 6
+
+    def test_roots_and_leaves(self, graph: SpecGraph) -> None:
+        assert graph.roots() == ("0003", "0004")
+        assert graph.leaves() == ("0001",)
+
+    def test_connected(self, graph: SpecGraph) -> None:
+        assert graph.connected("0002") == ("0001", "0002", "0003", "0004")
+
+    def test_dependents(self, graph: SpecGraph) -> None:
+        assert graph.dependents("0001") == ("0002", "0003", "0004")
+        assert graph.dependents("0005") == ("0006",)
+
+
+class TestOrdering:
+    def test_topological_order(self, dag: SpecGraph) -> None:
+        order = dag.topological_order()
+
+        assert order.index("0003") < order.index("0002") < order.index("0001")
+
+    def test_topological_order_empty_with_cycles(self, graph: SpecGraph) -> None:
+        assert graph.topological_order() == ()
+
+    def test_find_cycle(self, graph: SpecGraph, dag: SpecGraph) -> None:
+        cycle = graph.find_cycle()
+
+        assert set(cycle) == {"0005", "0006"}
+        assert cycle[0] == cycle[-1]
+        assert dag.find_cycle() == ()
+
+    def test_depths_use_longest_path(self, graph: SpecGraph) -> None:
+        depths = graph.depths()
+
+        assert depths["0004"] == 0
+        assert depths["0002"] == 1
+        assert depths["0001"] == 2
+        assert depths["0005"] == depths["0006"] == 0
+
+
+class TestPaths:
+    def test_shortest_path(self, graph: SpecGraph) -> None:
+        assert graph.shortest_path("0004", "0001") == ("0004", "0001")
+        assert graph.shortest_path("0003", "0001") == ("0003", "0002", "0001")
+
+    def test_shortest_path_unreachable(self, graph: SpecGraph) -> None:
+        assert graph.shortest_path("0001", "0003") == ()
+
+    def test_strongly_connected_components(self, graph: SpecGraph) -> None:
+        assert graph.strongly_connected_components() == (("0005", "0006"),)
+
+    def test_longest_path_by_weight(self, dag: SpecGraph) -> None:
+        path, weight = dag.longest_path({"0001": 1, "0002": 2, "0003": 3, "0004": 10})
+
+        assert path == ("0004", "0001")
+        assert weight == 11
+
+    def test_longest_path_empty_with_cycles(self, graph: SpecGraph) -> None:
+        assert graph.longest_path({"0001": 1}) == ((), 0)
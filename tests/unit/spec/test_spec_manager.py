@@ -2,6 +2,7 @@
 """Tests for SpecManager operations."""
 
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -11,7 +12,13 @@ from oaps.exceptions import (
     SpecNotFoundError,
     SpecValidationError,
 )
-from oaps.spec import SpecManager, SpecStatus, SpecType
+from oaps.spec import (
+    SpecManager,
+    SpecStatus,
+    SpecType,
+    read_json,
+    write_json_atomic,
+)
 
 
 class TestSpecManagerInit:
@@ -170,6 +177,44 @@ class TestCreateSpec:
                 actor="test-user",
             )
 
+    def test_does_not_reuse_deleted_spec_id(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        manager.create_spec(
+            slug="first", title="First", spec_type=SpecType.FEATURE, actor="test-user"
+        )
+        second = manager.create_spec(
+            slug="second", title="Second", spec_type=SpecType.FEATURE, actor="test-user"
+        )
+        manager.delete_spec(second.id, actor="test-user")
+
+        third = manager.create_spec(
+            slug="third", title="Third", spec_type=SpecType.FEATURE, actor="test-user"
+        )
+
+        assert third.id > second.id
+
+    def test_reseeds_counters_from_existing_specs(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        first = manager.create_spec(
+            slug="first", title="First", spec_type=SpecType.FEATURE, actor="test-user"
+        )
+        manager.id_counters.db_path.unlink()
+
+        second = SpecManager(tmp_path).create_spec(
+            slug="second", title="Second", spec_type=SpecType.FEATURE, actor="test-user"
+        )
+
+        assert second.id > first.id
+
+    def test_keeps_counters_in_ignored_cache_dir(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        _ = manager.create_spec(
+            slug="first", title="First", spec_type=SpecType.FEATURE, actor="test-user"
+        )
+
+        assert manager.id_counters.db_path == tmp_path / ".cache" / "counters.db"
+        assert manager.id_counters.db_path.exists()
+
 
 class TestCreateSpecWithDependencies:
     def test_creates_spec_with_valid_dependencies(self, tmp_path: Path) -> None:
@@ -806,6 +851,107 @@ class TestCaching:
         assert manager._root_index_cache is None
 
 
+class TestInverseRelationships:
+    def _create(
+        self, manager: SpecManager, slug: str, depends_on: list[str] | None = None
+    ) -> str:
+        return manager.create_spec(
+            slug=slug,
+            title=slug.title(),
+            spec_type=SpecType.FEATURE,
+            depends_on=depends_on,
+            actor="test-user",
+        ).id
+
+    def _entries(self, manager: SpecManager) -> dict[str, dict[str, Any]]:
+        return {spec["id"]: spec for spec in read_json(manager.index_path)["specs"]}
+
+    def test_stores_inverses_in_root_index(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        base = self._create(manager, "base")
+        first = self._create(manager, "first", [base])
+        second = self._create(manager, "second", [base])
+
+        root_index = read_json(manager.index_path)
+
+        assert root_index["version"] == 2
+        assert self._entries(manager)[base]["dependents"] == [first, second]
+
+    def test_update_moves_inverses(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        old = self._create(manager, "old")
+        new = self._create(manager, "new")
+        spec = self._create(manager, "spec", [old])
+
+        _ = manager.update_spec(spec, depends_on=[new], actor="test-user")
+
+        entries = self._entries(manager)
+        assert "dependents" not in entries[old]
+        assert entries[new]["dependents"] == [spec]
+        assert manager.get_spec(new).relationships.dependents == (spec,)
+
+    def test_update_keeps_own_inverses(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        base = self._create(manager, "base")
+        dependent = self._create(manager, "dependent", [base])
+
+        _ = manager.update_spec(base, title="Renamed", actor="test-user")
+
+        assert self._entries(manager)[base]["dependents"] == [dependent]
+
+    def test_delete_removes_inverses(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        base = self._create(manager, "base")
+        dependent = self._create(manager, "dependent", [base])
+
+        manager.delete_spec(dependent, actor="test-user")
+
+        assert manager.get_spec(base).relationships.dependents == ()
+
+    def test_rebuilds_inverses_of_version_1_index(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        base = self._create(manager, "base")
+        dependent = self._create(manager, "dependent", [base])
+        root_index = read_json(manager.index_path)
+        for spec in root_index["specs"]:
+            _ = spec.pop("dependents", None)
+        root_index["version"] = 1
+        write_json_atomic(manager.index_path, root_index)
+
+        reloaded = SpecManager(tmp_path)
+
+        assert reloaded.get_spec(base).relationships.dependents == (dependent,)
+
+    def test_get_spec_loads_only_its_own_index(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        base = self._create(manager, "base")
+        dependent = self._create(manager, "dependent", [base])
+        reloaded = SpecManager(tmp_path)
+
+        spec = reloaded.get_spec(base)
+
+        assert spec.relationships.dependents == (dependent,)
+        assert list(reloaded._spec_cache) == [base]
+
+    def test_detects_indirect_cycle(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        first = self._create(manager, "first")
+        second = self._create(manager, "second", [first])
+        third = self._create(manager, "third", [second])
+
+        with pytest.raises(CircularDependencyError) as exc_info:
+            _ = manager.update_spec(first, depends_on=[third], actor="test-user")
+
+        assert exc_info.value.cycle == [first, third, second, first]
+
+    def test_rejects_self_dependency(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        spec = self._create(manager, "spec")
+
+        with pytest.raises(CircularDependencyError):
+            _ = manager.update_spec(spec, depends_on=[spec], actor="test-user")
+
+
 class TestSlugValidation:
     def test_accepts_lowercase_letters(self, tmp_path: Path) -> None:
         manager = SpecManager(tmp_path)
@@ -891,3 +1037,75 @@ class TestSlugValidation:
                 spec_type=SpecType.FEATURE,
                 actor="test-user",
             )
+
+
+class TestSearch:
+    def test_finds_spec_by_summary(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        spec = manager.create_spec(
+            slug="cache",
+            title="Cache",
+            spec_type=SpecType.FEATURE,
+            summary="Least recently used eviction",
+            actor="test-user",
+        )
+
+        hits = manager.search("eviction")
+
+        assert [(hit.kind, hit.doc_id, hit.scope) for hit in hits] == [
+            ("spec", spec.id, spec.id)
+        ]
+
+    def test_reflects_updates(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        spec = manager.create_spec(
+            slug="cache", title="Cache", spec_type=SpecType.FEATURE, actor="test-user"
+        )
+
+        _ = manager.update_spec(spec.id, title="Queue", actor="test-user")
+
+        assert manager.search("cache") == []
+        assert [hit.doc_id for hit in manager.search("queue")] == [spec.id]
+
+    def test_delete_removes_documents(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        spec = manager.create_spec(
+            slug="cache", title="Cache", spec_type=SpecType.FEATURE, actor="test-user"
+        )
+
+        manager.delete_spec(spec.id, actor="test-user")
+
+        assert manager.search("cache") == []
+        assert manager.search_index.count() == 0
+
+    def test_keeps_index_in_ignored_cache_dir(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        spec = manager.create_spec(
+            slug="cache", title="Cache", spec_type=SpecType.FEATURE, actor="test-user"
+        )
+
+        hits = manager.search("cache")
+
+        assert [hit.source for hit in hits] == [f"{spec.id}-cache/index.json"]
+        assert manager.search_index.db_path == tmp_path / ".cache" / "search.db"
+        assert (tmp_path / ".cache" / ".gitignore").exists()
+
+    def test_indexes_markdown_edited_outside_manager(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+        spec = manager.create_spec(
+            slug="cache", title="Cache", spec_type=SpecType.FEATURE, actor="test-user"
+        )
+        spec_dir = tmp_path / f"{spec.id}-cache"
+        _ = (spec_dir / "spec.md").write_text(
+            "# Overview\n\nWrite-behind buffering.\n", encoding="utf-8"
+        )
+
+        hits = manager.search("buffering")
+
+        assert [(hit.kind, hit.title) for hit in hits] == [("document", "Overview")]
+
+    def test_rejects_unknown_kind(self, tmp_path: Path) -> None:
+        manager = SpecManager(tmp_path)
+
+        with pytest.raises(ValueError, match="Invalid search kinds: idea"):
+            _ = manager.search("x", kinds=["idea"])
@@ -0,0 +1,149 @@
+"""Tests for the shared header-only frontmatter reader."""
+
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from oaps.utils import _frontmatter
+from oaps.utils._frontmatter import (
+    clear_frontmatter_cache,
+    read_body,
+    read_frontmatter,
+    read_frontmatter_block,
+    split_frontmatter,
+)
+
+_OLD_MTIME_NS = 1_000_000_000_000_000_000
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    clear_frontmatter_cache()
+
+
+def _write(path: Path, content: str, *, settle: bool = True) -> Path:
+    _ = path.write_text(content, encoding="utf-8")
+    if settle:
+        os.utime(path, ns=(_OLD_MTIME_NS, _OLD_MTIME_NS))
+    return path
+
+
+class TestSplitFrontmatter:
+    def test_splits_header_and_body(self) -> None:
+        assert split_frontmatter("---\ntitle: A\n---\n\n# Body\n") == (
+            "title: A",
+            "# Body\n",
+        )
+
+    def test_closing_delimiter_must_be_own_line(self) -> None:
+        content = "---\ntitle: a---b\n---\nBody"
+
+        assert split_frontmatter(content) == ("title: a---b", "Body")
+
+    def test_accepts_crlf(self) -> None:
+        assert split_frontmatter("---\r\ntitle: A\r\n---\r\nBody") == (
+            "title: A",
+            "Body",
+        )
+
+    def test_returns_none_without_opening(self) -> None:
+        assert split_frontmatter("title: A\n---\nBody") is None
+
+    def test_returns_none_when_unclosed(self) -> None:
+        assert split_frontmatter("---\ntitle: A\nBody") is None
+
+
+class TestReadFrontmatterBlock:
+    def test_stops_at_closing_delimiter(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "doc.md", "---\ntitle: A\n---\n\nBody\n")
+
+        block = read_frontmatter_block(path)
+
+        assert block is not None
+        header, offset = block
+        assert header == "title: A"
+        assert read_body(path, offset) == "Body\n"
+
+    def test_offset_is_in_bytes(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "doc.md", "---\ntitle: Ünïcode\n---\nBody ✓")
+
+        block = read_frontmatter_block(path)
+
+        assert block is not None
+        assert read_body(path, block[1]) == "Body ✓"
+
+    def test_returns_none_without_frontmatter(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "doc.md", "# Title\n" + "x" * 10_000)
+
+        assert read_frontmatter_block(path) is None
+
+    def test_returns_none_when_unclosed(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "doc.md", "---\ntitle: A\n")
+
+        assert read_frontmatter_block(path) is None
+
+
+class TestReadFrontmatter:
+    def test_parses_header(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "doc.md", "---\ntitle: A\ntags: [x]\n---\nBody")
+
+        assert read_frontmatter(path) == (True, {"title": "A", "tags": ["x"]})
+
+    def test_reports_missing_block(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "doc.md", "Body")
+
+        assert read_frontmatter(path) == (False, None)
+
+    def test_raises_for_invalid_yaml(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "doc.md", "---\ntitle: [unclosed\n---\n")
+
+        with pytest.raises(yaml.YAMLError):
+            _ = read_frontmatter(path)
+
+    def test_caches_unchanged_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = _write(tmp_path / "doc.md", "---\ntitle: A\n---\n")
+        calls: list[str] = []
+        load_yaml = _frontmatter.load_yaml
+
+        def counting_load_yaml(text: str) -> object:
+            calls.append(text)
+            return load_yaml(text)
+
+        monkeypatch.setattr(_frontmatter, "load_yaml", counting_load_yaml)
+
+        _ = read_frontmatter(path)
+        _ = read_frontmatter(path)
+
+        assert len(calls) == 1
+
+    def test_returns_independent_copies(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "doc.md", "---\ntags: [x]\n---\n")
+
+        _, first = read_frontmatter(path)
+        first["tags"].append("y")
+
+        assert read_frontmatter(path) == (True, {"tags": ["x"]})
+
+    def test_rewritten_file_is_reparsed(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "doc.md", "---\ntitle: A\n---\n")
+        _ = read_frontmatter(path)
+
+        _ = _write(path, "---\ntitle: B\n---\n", settle=False)
+        os.utime(path, ns=(_OLD_MTIME_NS + 1, _OLD_MTIME_NS + 1))
+
+        assert read_frontmatter(path) == (True, {"title": "B"})
+
+    def test_recent_file_bypasses_cache(self, tmp_path: Path) -> None:
+        path = _write(tmp_path / "doc.md", "---\ntitle: A\n---\n", settle=False)
+        _ = read_frontmatter(path)
+
+        # Same size and mtime, as for a rewrite within one timestamp tick
+        stat = path.stat()
+        _ = path.write_text("---\ntitle: B\n---\n", encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert read_frontmatter(path) == (True, {"title": "B"})
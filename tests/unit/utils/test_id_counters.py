@@ -0,0 +1,113 @@
+"""Tests for the persistent high-water-mark ID counters."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from oaps.utils._id_counters import IDCounters
+
+
+@pytest.fixture
+def counters(tmp_path: Path) -> IDCounters:
+    return IDCounters(tmp_path / "counters.db")
+
+
+def _never(_: int) -> bool:
+    return False
+
+
+def _allocate(counters: IDCounters, taken: set[int]) -> int:
+    return counters.allocate(
+        "0001",
+        "FR",
+        exists=taken.__contains__,
+        scan=lambda: max(taken, default=0),
+    )
+
+
+class TestAllocate:
+    def test_starts_at_one(self, counters: IDCounters) -> None:
+        assert counters.peek("0001", "FR") is None
+        assert _allocate(counters, set()) == 1
+        assert counters.peek("0001", "FR") == 1
+
+    def test_seeds_from_existing_items(self, counters: IDCounters) -> None:
+        assert _allocate(counters, {1, 2, 7}) == 8
+
+    def test_does_not_rescan_after_seeding(self, counters: IDCounters) -> None:
+        scans: list[int] = []
+
+        def scan() -> int:
+            scans.append(1)
+            return 3
+
+        for _ in range(5):
+            _ = counters.allocate("0001", "FR", exists=_never, scan=scan)
+
+        assert len(scans) == 1
+        assert counters.peek("0001", "FR") == 8
+
+    def test_never_reuses_numbers(self, counters: IDCounters) -> None:
+        taken = {1, 2, 3}
+        assert _allocate(counters, taken) == 4
+
+        taken.discard(3)
+
+        assert _allocate(counters, taken) == 5
+
+    def test_reconciles_when_next_number_is_taken(self, counters: IDCounters) -> None:
+        assert _allocate(counters, set()) == 1
+
+        # Items 2-5 were added without the counter, e.g. by a checkout
+        assert _allocate(counters, {1, 2, 3, 4, 5}) == 6
+
+    def test_scopes_and_prefixes_are_separate(self, counters: IDCounters) -> None:
+        assert _allocate(counters, {1, 2}) == 3
+        assert counters.allocate("0002", "FR", exists=_never, scan=int) == 1
+        assert counters.allocate("0001", "QR", exists=_never, scan=int) == 1
+
+    def test_corrupt_database_is_reseeded(self, tmp_path: Path) -> None:
+        path = tmp_path / "counters.db"
+        path.write_bytes(b"not a database")
+
+        assert _allocate(IDCounters(path), {1, 2}) == 3
+
+    def test_concurrent_allocations_are_unique(self, tmp_path: Path) -> None:
+        path = tmp_path / "counters.db"
+
+        def allocate(_: int) -> int:
+            return IDCounters(path).allocate("", "spec", exists=_never, scan=int)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            numbers = list(pool.map(allocate, range(40)))
+
+        assert sorted(numbers) == list(range(1, 41))
+
+
+class TestReserve:
+    def test_keeps_number_on_success(self, counters: IDCounters) -> None:
+        with counters.reserve("0001", "FR", exists=_never, scan=int) as number:
+            assert number == 1
+
+        assert counters.peek("0001", "FR") == 1
+
+    def test_releases_number_on_failure(self, counters: IDCounters) -> None:
+        error = OSError("disk full")
+        with (
+            pytest.raises(OSError, match="disk full"),
+            counters.reserve("0001", "FR", exists=_never, scan=int),
+        ):
+            raise error
+
+        assert counters.peek("0001", "FR") == 0
+        assert _allocate(counters, set()) == 1
+
+    def test_release_after_later_allocation_leaves_gap(
+        self, counters: IDCounters
+    ) -> None:
+        first = _allocate(counters, set())
+        _ = _allocate(counters, set())
+
+        assert counters.release("0001", "FR", first) is False
+        assert counters.peek("0001", "FR") == 2
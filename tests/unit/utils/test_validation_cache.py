@@ -0,0 +1,109 @@
+"""Tests for the content-hash-keyed validation result cache."""
+
+from pathlib import Path
+
+import pytest
+
+from oaps.utils._validation_cache import (
+    ValidationCache,
+    ValidationCacheStats,
+    cache_digest,
+    file_digest,
+)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ValidationCache:
+    return ValidationCache(tmp_path / "validation.db")
+
+
+class TestDigests:
+    def test_file_digest_tracks_content(self, tmp_path: Path) -> None:
+        path = tmp_path / "index.json"
+        path.write_text("{}")
+        before = file_digest(path)
+
+        path.write_text('{"id": "0001"}')
+
+        assert file_digest(path) != before
+        assert file_digest(tmp_path / "missing.json") is None
+
+    def test_cache_digest_depends_on_order_and_missing_files(self) -> None:
+        assert cache_digest(1, "a", None) == cache_digest(1, "a", None)
+        assert cache_digest(1, "a", None) != cache_digest(1, None, "a")
+        assert cache_digest(1, "a") != cache_digest(2, "a")
+
+
+class TestLookup:
+    def test_hit_when_digest_matches(self, cache: ValidationCache) -> None:
+        cache.store("spec", {"0001-a": ("d1", {"errors": ["Missing index.md"]})})
+
+        assert cache.lookup("spec", {"0001-a": "d1"}) == {
+            "0001-a": {"errors": ["Missing index.md"]}
+        }
+        assert cache.stats == ValidationCacheStats(hits=1, misses=0)
+
+    def test_miss_when_digest_changed_or_unknown(self, cache: ValidationCache) -> None:
+        cache.store("spec", {"0001-a": ("d1", [])})
+
+        assert cache.lookup("spec", {"0001-a": "d2", "0002-b": "d1"}) == {}
+        assert cache.stats.misses == 2
+        assert cache.stats.hit_rate == 0.0
+
+    def test_kinds_are_separate(self, cache: ValidationCache) -> None:
+        cache.store("spec", {"x": ("d1", [])})
+
+        assert cache.lookup("artifact", {"x": "d1"}) == {}
+
+    def test_store_replaces_results(self, cache: ValidationCache) -> None:
+        cache.store("spec", {"x": ("d1", ["old"])})
+        cache.store("spec", {"x": ("d2", ["new"])})
+
+        assert cache.lookup("spec", {"x": "d2"}) == {"x": ["new"]}
+
+    def test_many_subjects(self, cache: ValidationCache) -> None:
+        entries = {f"s{n}": (f"d{n}", n) for n in range(1200)}
+        cache.store("artifact", entries)
+
+        found = cache.lookup("artifact", {s: d for s, (d, _) in entries.items()})
+
+        assert len(found) == 1200
+        assert cache.stats.hit_rate == 1.0
+
+
+class TestMaintenance:
+    def test_retain_drops_missing_subjects(self, cache: ValidationCache) -> None:
+        cache.store("spec", {"a": ("d", []), "b": ("d", [])})
+
+        assert cache.retain("spec", ["a"]) == 1
+        assert cache.lookup("spec", {"a": "d", "b": "d"}) == {"a": []}
+
+    def test_retain_within_prefix(self, cache: ValidationCache) -> None:
+        cache.store(
+            "artifact",
+            {"0001-a/artifacts/x.md": ("d", []), "0002-b/artifacts/y.md": ("d", [])},
+        )
+
+        assert cache.retain("artifact", [], within="0001-a/artifacts") == 1
+        assert cache.lookup("artifact", {"0002-b/artifacts/y.md": "d"})
+
+    def test_retain_without_database(self, cache: ValidationCache) -> None:
+        assert cache.retain("spec", []) == 0
+        assert not cache.db_path.exists()
+
+    def test_clear(self, cache: ValidationCache) -> None:
+        cache.store("spec", {"a": ("d", [])})
+        cache.store("artifact", {"a": ("d", [])})
+
+        cache.clear("spec")
+        assert cache.lookup("spec", {"a": "d"}) == {}
+        assert cache.lookup("artifact", {"a": "d"}) == {"a": []}
+
+    def test_corrupt_database_is_recreated(self, tmp_path: Path) -> None:
+        path = tmp_path / "validation.db"
+        path.write_bytes(b"not a database")
+        cache = ValidationCache(path)
+
+        cache.store("spec", {"a": ("d", [])})
+
+        assert cache.lookup("spec", {"a": "d"}) == {"a": []}